@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+화재 감지 이력 재생/백테스트 실행 스크립트
+
+사용법:
+    python fire_replay.py --db logs/sensor_data.db [--from 2025-01-01 --to 2025-02-01]
+                          [--thresholds new.json] [--incidents fires.json] [--workers 8]
+    python fire_replay.py --logs logs/data
+
+자세한 옵션은 src/tcp_monitor/fire/replay.py 참고
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.fire.replay import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+헤드리스 수집 코어 실행 스크립트
+
+TCP 수신/저장/임계값·화재 판정/경보 상태를 화면 없이 실행합니다.
+화면은 별도 프로세스로 접속합니다: python main.py --attach
+
+사용법:
+    python ingest_core.py [--config config.conf] [--socket SOCKET_PATH]
+
+자세한 내용은 src/tcp_monitor/core/ingest.py 참고
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.core.ingest import main
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,8 @@ TCP Monitor v1.9.8.4 - 메인 진입점
 Ubuntu Linux 전용 (Windows 지원 안 함)
 
 사용법:
-    python main.py [--config CONFIG_FILE]
+    python main.py [--config CONFIG_FILE] [--profile-startup]
+    python main.py --attach [SOCKET]   # 헤드리스 수집 코어(ingest_core.py)에 화면으로 접속
 
 의존성:
     - tkinter (Python 내장)
@@ -91,14 +92,59 @@ sys.path.insert(0, BASE_DIR)
 # 작업 디렉토리를 실행 파일 디렉토리로 변경
 os.chdir(EXECUTABLE_DIR)
 
+# 시작 프로파일 모드: 패키지 import 전에 측정기를 설치해야 모듈별 import 시간이 잡힘
+PROFILE_STARTUP = "--profile-startup" in sys.argv
+if PROFILE_STARTUP:
+    from src.tcp_monitor.utils.startup_profiler import enable_startup_profiler
+    enable_startup_profiler()
 
-from src.tcp_monitor import ConfigManager, App, TcpServer
+# 패키지는 지연 로드 구조이므로 여기서는 설정/네트워크 모듈만 로드됨
+# (App은 TCP 서버 기동 이후에 import)
+from src.tcp_monitor import ConfigManager, TcpServer, LogManager
+from src.tcp_monitor.utils.startup_profiler import get_startup_profiler, mark_startup
+from src.tcp_monitor.utils.metrics import configure_metrics, TkLoopLagMonitor
+from src.tcp_monitor.utils.health import get_health_reporter
+
+
+def _preload_ai_models(cfg):
+    """AI 모델 사전 로드 (백그라운드 스레드에서 import부터 수행)
+
+    safety_detector/ppe 모듈 import 자체가 torch/ultralytics/insightface를 로드하므로
+    메인 스레드에서 import하지 않습니다. 성능 모드에 따라 필요한 모델만 로드합니다
+    (1: 얼굴만, 2: 얼굴+PPE, 3: 전체).
+    """
+    try:
+        from src.tcp_monitor.sensor.safety_detector import preload_models_async, set_performance_mode
+        performance_mode = int(cfg.env.get("performance_mode", 2))
+        performance_mode = max(1, min(3, performance_mode))  # 1~3 범위 제한
+
+        # 중요: 성능 모드를 먼저 설정 (싱글톤 모델 로딩 전에 반드시 필요)
+        set_performance_mode(performance_mode)
+        print(f"[AI] 성능 모드 {performance_mode} 설정 완료")
+
+        # PPEDetector 성능 모드도 설정 (싱글톤 인스턴스 생성 전에 호출)
+        try:
+            from src.tcp_monitor.ppe.detector import PPEDetector
+            PPEDetector.set_performance_mode(performance_mode)
+        except Exception:
+            pass
+
+        mark_startup("ai_modules_imported")
+        preload_models_async(performance_mode).join()
+        mark_startup("ai_models_ready")
+    except Exception as e:
+        print(f"[경고] AI 모델 사전 로드 실패: {e}")
 
 
 def main():
     """메인 함수"""
     ap = argparse.ArgumentParser(description="TCP Monitor - Real-time sensor data monitoring")
     ap.add_argument("--config", type=str, default="config.conf", help="설정 파일 경로")
+    ap.add_argument("--profile-startup", action="store_true",
+                    help="모듈별 import 시간, 첫 화면/TCP 수신 대기까지의 시간 보고")
+    ap.add_argument("--attach", nargs="?", const="", default=None, metavar="SOCKET",
+                    help="TCP 서버/저장/판정을 직접 실행하지 않고 수집 코어(ingest_core.py)에 접속 "
+                         "(소켓 경로 생략 시 기본 경로)")
     args = ap.parse_args()
 
     # 스플래시 화면 표시
@@ -125,35 +171,78 @@ def main():
     # 설정 로드
     cfg = ConfigManager(config_path)
 
-    # 스플래시 업데이트: AI 모델 로드
-    if splash:
-        splash.update_status("AI 모델 초기화 중...", 30)
+    mark_startup("config_loaded")
 
-    # AI 모델 사전 로드 (백그라운드에서 미리 로드하여 카메라 시작 속도 향상)
-    # 성능 모드에 따라 필요한 모델만 로드 (1: 얼굴만, 2: 얼굴+PPE, 3: 전체)
-    try:
-        from src.tcp_monitor.sensor.safety_detector import preload_models_async, set_performance_mode
-        performance_mode = int(cfg.env.get("performance_mode", 2))
-        performance_mode = max(1, min(3, performance_mode))  # 1~3 범위 제한
+    # 성능 계측 (metrics_enabled=false이면 계측 호출은 플래그 확인만 수행)
+    metrics = configure_metrics(cfg)
+    pump_tick = metrics.histogram("pump_tick_seconds", "pump() 1회 실행 시간 (메인 스레드)")
+    pump_items = metrics.counter("pump_items_total", "pump()가 처리한 큐 항목 수")
+    pump_backlog = metrics.gauge("pump_queue_depth", "pump() 시작 시점 수신 큐 길이")
 
-        # 중요: 성능 모드를 먼저 동기적으로 설정 (싱글톤 모델 로딩 전에 반드시 필요)
-        # preload_models_async가 백그라운드에서 실행되므로, 모드 설정이 누락될 수 있음
-        set_performance_mode(performance_mode)
-        print(f"[AI] 성능 모드 {performance_mode} 설정 완료")
+    # 와치독 상태 보고 (이벤트 루프 지연, 수신 처리율, AI 스레드 진행) - 와치독이 없으면 전송만 실패
+    health = get_health_reporter()
+    health.start()
 
-        # PPEDetector 성능 모드도 설정 (싱글톤 인스턴스 생성 전에 호출)
-        try:
-            from src.tcp_monitor.ppe.detector import PPEDetector
-            PPEDetector.set_performance_mode(performance_mode)
-        except Exception:
-            pass
+    def validate(sid, pw):
+        """인증 검증"""
+        if not cfg.auth_enabled():
+            return True
+        return cfg.auth_map().get(sid, "") == (pw or "")
 
-        if splash:
-            splash.update_status("AI 모델 로드 중...", 50)
+    q = queue.Queue()
+    server = None
+    core_client = None
+    if args.attach is not None:
+        # 코어 접속 모드: 수신/저장/판정은 코어 프로세스가 담당, 이벤트를 같은 큐로 받아 pump가 처리
+        from src.tcp_monitor.core import CoreClient, RemoteLogManager, default_socket_path
+        event_tags = {"data": "__data__", "water_alert": "__water_alert__", "fire": "__fire__"}
+
+        def _on_core_event(kind, payload):
+            tag = event_tags.get(kind)
+            if tag:
+                q.put((tag, payload))
+
+        def _on_core_connect():
+            # 접속/재접속 시 코어의 현재 상태로 패널 초기화
+            try:
+                info = core_client.call("hello")
+                logs.db_path = info.get("db_path", "")
+                states = core_client.call("snapshot")
+                for st in states:
+                    if st.get("fire"):
+                        q.put(("__fire__", {"sid": st["sid"], "peer": st["peer"], "result": st["fire"]}))
+                    q.put(("__data__", {"sid": st["sid"], "peer": st["peer"],
+                                        "data": st.get("data") or {}, "version": st.get("version")}))
+                print(f"[코어] 접속 완료 (pid={info.get('pid')}, 센서 {len(states)}개)")
+            except Exception as e:
+                print(f"[코어] 초기 상태 조회 실패: {e}")
+
+        core_client = CoreClient(args.attach or default_socket_path(), _on_core_event, _on_core_connect)
+        logs = RemoteLogManager(core_client)
+        core_client.start()
+    else:
+        # TCP 서버를 UI/AI 모델보다 먼저 시작 (수신 데이터는 큐에 쌓였다가 pump가 처리)
+        logs = LogManager(
+            base_dir=os.getcwd(),
+            server_host=cfg.listen["host"],
+            server_port=cfg.listen["port"],
+            config=cfg
+        )
+        server = TcpServer(cfg.listen["host"], cfg.listen["port"], q, validate, logger=logs)
+        server.start()
+    profiler = get_startup_profiler()
+    if profiler is not None and server is not None:
+        def _wait_listening():
+            if server.listening.wait(timeout=30.0):
+                profiler.mark("tcp_listening")
+        threading.Thread(target=_wait_listening, daemon=True).start()
 
-        preload_models_async(performance_mode)
-    except Exception as e:
-        print(f"[경고] AI 모델 사전 로드 실패: {e}")
+    # 스플래시 업데이트: AI 모델 로드
+    if splash:
+        splash.update_status("AI 모델 로드 중...", 30)
+
+    # AI 모델 사전 로드 (백그라운드에서 미리 로드하여 카메라 시작 속도 향상)
+    threading.Thread(target=_preload_ai_models, args=(cfg,), daemon=True).start()
 
     # 스플래시 업데이트: 애플리케이션 생성
     if splash:
@@ -161,8 +250,12 @@ def main():
 
     # 애플리케이션 생성
     print("[DEBUG] App 생성 시작...")
-    app = App(cfg)
+    from src.tcp_monitor import App
+    app = App(cfg, logs=logs)
+    if core_client is not None:
+        app.core_fire_results = {}
     print("[DEBUG] App 생성 완료")
+    mark_startup("app_created")
 
     # 스플래시 업데이트: 완료
     if splash:
@@ -172,24 +265,42 @@ def main():
         time.sleep(0.5)
         splash.close()
 
-    # 데이터 큐 생성
-    q = queue.Queue()
-
-    def validate(sid, pw):
-        """인증 검증"""
-        if not cfg.auth_enabled():
-            return True
-        return cfg.auth_map().get(sid, "") == (pw or "")
-
-    # TCP 서버 시작
-    server = TcpServer(cfg.listen["host"], cfg.listen["port"], q, validate, logger=app.logs)
-    server.start()
+    if profiler is not None:
+        def _first_frame():
+            profiler.mark("first_frame")
+            _report_when_ready()
+
+        def _report_when_ready(waited_ms=0):
+            # TCP 수신 대기와 첫 화면이 모두 측정되면 보고, AI 모델 로드 완료는 이후 추가 출력
+            if not profiler.reported:
+                if profiler.has("tcp_listening"):
+                    profiler.report()
+                app.after(200, lambda: _report_when_ready(waited_ms + 200))
+            elif profiler.has("ai_models_ready"):
+                print(f"[시작 프로파일] ai_models_ready {profiler.milestones['ai_models_ready'] * 1000:.1f} ms")
+                profiler.uninstall()
+            elif waited_ms < 300000:
+                app.after(500, lambda: _report_when_ready(waited_ms + 500))
+
+        app.after_idle(lambda: app.after(0, _first_frame))
+
+    if metrics.enabled:
+        TkLoopLagMonitor(app, metrics).start()
+    health.attach_tk(app)
 
     def pump():
         """데이터 펌프 (메인 스레드에서 실행)"""
+        with pump_tick.time():
+            if metrics.enabled:
+                pump_backlog.set(q.qsize())
+            _drain_queue()
+        app.after(16, pump)  # 약 60fps로 큐 폴링 (센서 응답 속도 향상)
+
+    def _drain_queue():
         try:
             while True:
                 item = q.get_nowait()
+                pump_items.inc()
                 if isinstance(item, tuple) and len(item) == 2:
                     if item[0] == "__data__":
                         payload = item[1] or {}
@@ -198,6 +309,7 @@ def main():
                         data = payload.get("data", {})
                         version = payload.get("version", None)
                         if sid:
+                            health.count("ingest")
                             if version:
                                 try:
                                     app.update_sensor_version(sid, peer, version)
@@ -214,15 +326,19 @@ def main():
                         alert_level = payload.get("alert_level", "info")
                         if sid:
                             app.on_water_alert(sid, peer, data, alert_type, message, alert_level)
+                    elif item[0] == "__fire__":
+                        payload = item[1] or {}
+                        if payload.get("sid"):
+                            app.on_core_fire(payload["sid"], payload.get("peer", ""), payload.get("result"))
                 else:
                     try:
                         sid, data = item
+                        health.count("ingest")
                         app.on_data(sid, "", data)
                     except Exception:
                         pass
         except queue.Empty:
             pass
-        app.after(16, pump)  # 약 60fps로 큐 폴링 (센서 응답 속도 향상)
 
     # 데이터 펌프 시작 (즉시 시작)
     app.after(10, pump)
@@ -238,9 +354,18 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
-        # 서버 정리
+        # 서버(또는 코어 접속) 정리
         try:
-            server.stop()
+            if server is not None:
+                server.stop()
+            if core_client is not None:
+                core_client.stop()
+            metrics.stop_http_server()
+            health.stop()
+            # 카메라 서비스를 사용한 경우에만 장치 해제 (cv2 import 방지)
+            camera_service = sys.modules.get("src.tcp_monitor.camera.service")
+            if camera_service is not None:
+                camera_service.get_camera_service().shutdown()
         except:
             pass
 
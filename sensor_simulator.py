@@ -8,6 +8,7 @@ GARAMe Manager v2.0용 센서 테스트 클라이언트
 - 9개 센서 값 (CO2, CO, O2, H2S, CH4, 온도, 습도, 연기, 누수) 전송
 - 화재/질식/누수 등 각종 경고 레벨 시나리오 테스트
 - 랜덤 데이터 생성
+- 재접속 백필 (sensor_batch) 전송
 - GUI 컨트롤 패널
 """
 
@@ -56,6 +57,7 @@ class SensorClient:
         self.thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
         self.sequence = 0
+        self.boot_id = uuid.uuid4().hex[:12]  # 부팅(프로세스 시작)마다 새로 생성, seq는 0부터 다시 시작
         self.send_interval = 1.0  # 전송 주기 (초)
         self.current_scenario = "정상"
         self.log_callback = None
@@ -111,7 +113,7 @@ class SensorClient:
             "protocol_version": "2.0",
             "device_type": "sensor",
             "firmware_version": "SIMULATOR-1.0",
-            "capabilities": ["sensor_update", "heartbeat"],
+            "capabilities": ["sensor_update", "sensor_batch", "heartbeat"],
             "supported_sensors": ["co2", "co", "o2", "h2s", "ch4", "temperature", "humidity", "smoke", "water", "ext_input"]
         }
         self._send_message(hello_msg)
@@ -147,6 +149,39 @@ class SensorClient:
                 self._log(f"[센서 {self.sensor_id}] 전송 오류: {e}")
                 break
 
+    def send_backfill(self, count: int = 300, period: float = 1.0, batch_size: int = 100):
+        """
+        네트워크 단절 동안 버퍼링된 측정값을 sensor_batch로 전송 (재접속 백필 시뮬레이션)
+
+        count개의 과거 측정값(period초 간격, 현재 시나리오)을 batch_size씩 나누어 보냅니다.
+        """
+        now = time.time()
+        readings = []
+        for i in range(count):
+            readings.append({
+                "seq": self.sequence,
+                "ts": now - (count - i) * period,
+                "data": self._generate_sensor_data(self.current_scenario).to_dict()
+            })
+            self.sequence += 1
+
+        for start in range(0, len(readings), batch_size):
+            chunk = readings[start:start + batch_size]
+            self._send_message({
+                "type": "sensor_batch",
+                "id": self.sensor_id,
+                "msg_id": str(uuid.uuid4()),
+                "timestamp": time.time(),
+                "protocol_version": "2.0",
+                "password": self.password,
+                "version": "SIMULATOR-1.0",
+                "boot_id": self.boot_id,
+                "readings": chunk
+            })
+        if readings:
+            self._log(f"[센서 {self.sensor_id}] 백필 전송: {count}개 "
+                      f"(seq {readings[0]['seq']}~{readings[-1]['seq']})")
+
     def _send_message(self, msg: dict):
         """메시지 전송"""
         try:
@@ -498,6 +533,13 @@ class SensorSimulatorGUI:
                              width=10)
         start_btn.pack(side="left", padx=5, pady=5)
 
+        backfill_btn = tk.Button(button_frame, text="백필 전송",
+                                 command=lambda: self._send_backfill(sensor_id),
+                                 bg="#8E44AD", fg="#FFFFFF",
+                                 font=("Arial", 10, "bold"),
+                                 width=10)
+        backfill_btn.pack(side="left", padx=5, pady=5)
+
         # 패널 정보 저장
         return {
             "frame": panel_frame,
@@ -505,7 +547,8 @@ class SensorSimulatorGUI:
             "scenario_combo": scenario_combo,
             "connect_btn": connect_btn,
             "disconnect_btn": disconnect_btn,
-            "start_btn": start_btn
+            "start_btn": start_btn,
+            "backfill_btn": backfill_btn
         }
 
     def _connect_sensor(self, sensor_id: str):
@@ -560,6 +603,16 @@ class SensorSimulatorGUI:
         client.start_sending()
         self._log(f"[센서 {sensor_id}] 시나리오: {scenario}")
 
+    def _send_backfill(self, sensor_id: str):
+        """과거 측정값 일괄 전송 (재접속 백필)"""
+        if sensor_id not in self.clients:
+            self._log(f"[센서 {sensor_id}] 먼저 연결하세요")
+            return
+
+        client = self.clients[sensor_id]
+        client.current_scenario = self.sensor_panels[sensor_id]["scenario_combo"].get()
+        threading.Thread(target=client.send_backfill, daemon=True).start()
+
     def _clear_log(self):
         """로그 지우기"""
         self.log_text.delete(1.0, tk.END)
@@ -33,11 +33,8 @@ __version__ = _load_version()
 __author__ = "TCP Monitor Team"
 __description__ = "Real-time sensor data monitoring application"
 
-from .config import ConfigManager
-from .logging import LogManager
-from .network import TcpServer
-from .sensor import SensorHistory, AlertManager
-from .ui import App, SensorPanel
+import importlib
+
 from .utils import (
     now_local, fmt_ts, ensure_dir, ideal_fg, find_asset,
     get_base_dir, get_data_dir,
@@ -46,6 +43,33 @@ from .utils import (
     heat_index_c, discomfort_index
 )
 
+# 지연 로드 대상 (이름 -> 하위 모듈)
+# UI(App/SensorPanel)는 torch/ultralytics/insightface/matplotlib 등 무거운 의존성을
+# 끌어오므로 실제로 접근할 때 import하여 TCP 서버가 먼저 기동할 수 있게 합니다.
+_LAZY_EXPORTS = {
+    'ConfigManager': '.config',
+    'LogManager': '.logging',
+    'TcpServer': '.network',
+    'SensorHistory': '.sensor',
+    'AlertManager': '.sensor',
+    'App': '.ui',
+    'SensorPanel': '.ui',
+}
+
+
+def __getattr__(name):
+    """PEP 562 지연 import"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 __all__ = [
     'ConfigManager',
     'LogManager',
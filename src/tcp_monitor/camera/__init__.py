@@ -0,0 +1,23 @@
+"""
+TCP Monitor 카메라 모듈
+
+여러 화면(거울보기, 안전교육, 서명, 얼굴 등록)이 공유하는 카메라 캡처 서비스와
+장치를 열지 않는 카메라 목록(핫플러그 감지), IP 카메라 저지연 RTSP 수신 도구를 제공합니다.
+"""
+
+from .registry import CameraDevice, CameraRegistry, get_camera_registry, scan_devices
+from .rtsp import ffmpeg_options, grab_snapshot, substream_url
+from .service import CameraService, CameraSubscription, get_camera_service
+
+__all__ = [
+    'CameraDevice',
+    'CameraRegistry',
+    'get_camera_registry',
+    'scan_devices',
+    'CameraService',
+    'CameraSubscription',
+    'get_camera_service',
+    'ffmpeg_options',
+    'grab_snapshot',
+    'substream_url',
+]
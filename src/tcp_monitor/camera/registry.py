@@ -0,0 +1,317 @@
+"""
+카메라 장치 목록 (V4L2, 캐시 + 핫플러그 감지)
+
+cv2.VideoCapture(i)로 인덱스를 하나씩 열어보는 대신 /dev/video*와 sysfs 정보로 장치를 나열합니다.
+- 이름/드라이버/버스: /sys/class/video4linux/videoN
+- 기능/지원 포맷: VIDIOC_QUERYCAP / VIDIOC_ENUM_FMT ioctl (스트림을 시작하지 않음, 장치 점유 없음)
+- 결과는 캐시하고 /dev 변경(inotify, 불가 시 폴링)을 감지했을 때만 다시 나열
+
+사용 예:
+    from ..camera import get_camera_registry
+    registry = get_camera_registry()
+    for dev in registry.capture_devices():
+        print(dev.index, dev.label, dev.formats)
+    registry.add_listener(self._on_cameras_changed)   # 별도 스레드에서 호출됨
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import fcntl
+import os
+import re
+import struct
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+SYSFS_V4L = "/sys/class/video4linux"
+DEV_DIR = "/dev"
+
+# ioctl 번호 (linux/videodev2.h)
+_VIDIOC_QUERYCAP = 0x80685600      # _IOR('V', 0, struct v4l2_capability) - 104 bytes
+_VIDIOC_ENUM_FMT = 0xC0405602      # _IOWR('V', 2, struct v4l2_fmtdesc) - 64 bytes
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+_V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+
+# inotify
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_ATTRIB = 0x00000004
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+_VIDEO_NODE = re.compile(r"^video(\d+)$")
+
+
+@dataclass
+class CameraDevice:
+    """V4L2 장치 1개 (/dev/videoN)"""
+    index: int
+    path: str
+    name: str = ""
+    driver: str = ""
+    bus_info: str = ""
+    is_capture: bool = True          # 영상 캡처 노드 여부 (메타데이터 노드는 False)
+    formats: List[str] = field(default_factory=list)   # 지원 픽셀 포맷 FourCC (예: MJPG, YUYV)
+
+    @property
+    def label(self) -> str:
+        """화면 표시용 이름 (기존 형식: "장치명 (N)")"""
+        return f"{self.name} ({self.index})" if self.name else f"카메라 {self.index}"
+
+
+def _read_sysfs(index: int, name: str) -> str:
+    try:
+        with open(os.path.join(SYSFS_V4L, f"video{index}", name), "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def _query_device(dev: CameraDevice):
+    """QUERYCAP/ENUM_FMT ioctl로 기능과 포맷 확인 (권한 없으면 sysfs 정보만 사용)"""
+    try:
+        fd = os.open(dev.path, os.O_RDWR | os.O_NONBLOCK)
+    except OSError:
+        return
+    try:
+        buf = bytearray(104)
+        fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+        driver, card, bus_info, _version, caps, device_caps = struct.unpack_from("16s32s32sIII", buf)
+        dev.driver = driver.split(b"\0", 1)[0].decode("utf-8", "replace")
+        dev.bus_info = bus_info.split(b"\0", 1)[0].decode("utf-8", "replace")
+        if not dev.name:
+            dev.name = card.split(b"\0", 1)[0].decode("utf-8", "replace")
+        effective = device_caps if caps & _V4L2_CAP_DEVICE_CAPS else caps
+        dev.is_capture = bool(effective & _V4L2_CAP_VIDEO_CAPTURE)
+
+        if dev.is_capture:
+            for i in range(32):
+                desc = bytearray(64)
+                struct.pack_into("II", desc, 0, i, _V4L2_BUF_TYPE_VIDEO_CAPTURE)
+                try:
+                    fcntl.ioctl(fd, _VIDIOC_ENUM_FMT, desc)
+                except OSError:
+                    break
+                pixfmt = struct.unpack_from("I", desc, 44)[0]
+                dev.formats.append(struct.pack("<I", pixfmt).decode("ascii", "replace").strip())
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def scan_devices(query: bool = True) -> List[CameraDevice]:
+    """
+    /dev/video* 장치 나열 (스트림을 열지 않음)
+
+    Args:
+        query: True면 ioctl로 기능/포맷까지 확인, False면 sysfs만 사용
+    """
+    try:
+        names = os.listdir(DEV_DIR)
+    except OSError:
+        return []
+
+    devices = []
+    for entry in names:
+        m = _VIDEO_NODE.match(entry)
+        if not m:
+            continue
+        index = int(m.group(1))
+        dev = CameraDevice(index=index, path=os.path.join(DEV_DIR, entry), name=_read_sysfs(index, "name"))
+        # sysfs index != 0 이면 같은 장치의 메타데이터 노드 (ioctl 결과가 있으면 그쪽 우선)
+        sysfs_index = _read_sysfs(index, "index")
+        if sysfs_index and sysfs_index != "0":
+            dev.is_capture = False
+        if query:
+            _query_device(dev)
+        devices.append(dev)
+    devices.sort(key=lambda d: d.index)
+    return devices
+
+
+class _DevWatcher:
+    """/dev 변경 감시 (inotify, 사용 불가 시 /dev 목록 폴링)"""
+
+    POLL_INTERVAL = 2.0
+
+    def __init__(self, on_change: Callable[[], None]):
+        self.on_change = on_change
+        self._stop_evt = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="camera-hotplug", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop_evt.set()
+
+    def _run(self):
+        fd = self._inotify_fd()
+        if fd is None:
+            self._poll()
+            return
+        import select
+        try:
+            while not self._stop_evt.is_set():
+                ready, _, _ = select.select([fd], [], [], 1.0)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(fd, 4096)
+                except OSError as e:
+                    if e.errno == errno.EAGAIN:
+                        continue
+                    break
+                if self._has_video_event(data):
+                    # udev가 권한/심볼릭 링크를 정리할 시간을 준 뒤 다시 나열 (이벤트 묶음 처리)
+                    self._stop_evt.wait(0.5)
+                    self._drain(fd)
+                    self.on_change()
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _inotify_fd() -> Optional[int]:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return None
+            if libc.inotify_add_watch(fd, DEV_DIR.encode(), _IN_CREATE | _IN_DELETE | _IN_ATTRIB) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def _has_video_event(data: bytes) -> bool:
+        offset = 0
+        while offset + 16 <= len(data):
+            _wd, _mask, _cookie, length = struct.unpack_from("iIII", data, offset)
+            name = data[offset + 16:offset + 16 + length].split(b"\0", 1)[0]
+            if name.startswith(b"video"):
+                return True
+            offset += 16 + length
+        return False
+
+    @staticmethod
+    def _drain(fd: int):
+        try:
+            while os.read(fd, 4096):
+                pass
+        except OSError:
+            pass
+
+    def _poll(self):
+        def snapshot():
+            try:
+                return sorted(n for n in os.listdir(DEV_DIR) if n.startswith("video"))
+            except OSError:
+                return []
+        last = snapshot()
+        while not self._stop_evt.wait(self.POLL_INTERVAL):
+            current = snapshot()
+            if current != last:
+                last = current
+                self.on_change()
+
+
+class CameraRegistry:
+    """V4L2 장치 목록 캐시 + 변경 알림"""
+
+    def __init__(self, watch: bool = True):
+        self._lock = threading.Lock()
+        self._devices: Optional[List[CameraDevice]] = None
+        self._listeners: List[weakref.ref] = []
+        self._watcher: Optional[_DevWatcher] = None
+        self._watch = watch
+        self.scanned_at = 0.0
+
+    def devices(self) -> List[CameraDevice]:
+        """모든 /dev/video 노드 (캐시)"""
+        with self._lock:
+            if self._devices is None:
+                self._devices = scan_devices()
+                self.scanned_at = time.time()
+                if self._watch and self._watcher is None:
+                    self._watcher = _DevWatcher(self._on_dev_change)
+                    self._watcher.start()
+            return list(self._devices)
+
+    def capture_devices(self) -> List[CameraDevice]:
+        """영상 캡처 장치만 (메타데이터 노드 제외)"""
+        return [d for d in self.devices() if d.is_capture]
+
+    def get(self, index: int) -> Optional[CameraDevice]:
+        for dev in self.devices():
+            if dev.index == index:
+                return dev
+        return None
+
+    def refresh(self) -> List[CameraDevice]:
+        """강제로 다시 나열"""
+        with self._lock:
+            self._devices = scan_devices()
+            self.scanned_at = time.time()
+        return self.devices()
+
+    def add_listener(self, callback: Callable[[List[CameraDevice]], None]):
+        """
+        장치 목록 변경 콜백 등록 (감시 스레드에서 호출되므로 Tk 위젯은 after()로 갱신)
+
+        바운드 메서드는 약한 참조로 보관하므로 패널/다이얼로그가 닫히면 자동 해제됩니다.
+        """
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda cb=callback: cb)
+        with self._lock:
+            self._listeners.append(ref)
+        self.devices()  # 감시 시작
+
+    def remove_listener(self, callback):
+        with self._lock:
+            self._listeners = [r for r in self._listeners if r() is not None and r() != callback]
+
+    def _on_dev_change(self):
+        with self._lock:
+            before = [(d.index, d.name, d.is_capture) for d in (self._devices or [])]
+            self._devices = scan_devices()
+            self.scanned_at = time.time()
+            after = [(d.index, d.name, d.is_capture) for d in self._devices]
+            devices = list(self._devices)
+            self._listeners = [r for r in self._listeners if r() is not None]
+            callbacks = [r() for r in self._listeners]
+        if before == after:
+            return
+        print(f"[CameraRegistry] 장치 변경: {[d.label for d in devices if d.is_capture]}")
+        for cb in callbacks:
+            if cb is None:
+                continue
+            try:
+                cb(devices)
+            except Exception as e:
+                print(f"[CameraRegistry] 변경 알림 오류: {e}")
+
+    def stop(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+
+_registry: Optional[CameraRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_camera_registry() -> CameraRegistry:
+    """전역 카메라 장치 목록"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = CameraRegistry()
+    return _registry
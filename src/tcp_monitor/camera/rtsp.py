@@ -0,0 +1,156 @@
+"""
+IP 카메라(RTSP) 저지연 수신 도구
+
+- 저지연 FFMPEG 옵션 (수신/디코더 버퍼링 최소화, config.conf [CAMERA]로 변경 가능)
+- 서브스트림 선택: 화면/AI는 저해상도 서브스트림, 메인스트림은 스냅샷 때만 잠깐 열기
+- 지연 측정: 프레임 PTS와 수신 시각으로 스트림 누적 지연(버퍼링) 추정
+
+전용 디코딩 스레드, 최신 프레임 1장 유지, 재연결 백오프는 공용 카메라 서비스(service.py)의
+URL 소스가 담당하며 이 모듈의 옵션/측정 도구를 사용합니다.
+
+사용 예:
+    from ..camera import get_camera_service
+    service = get_camera_service()
+    service.set_rtsp_options(ffmpeg_options(cfg.camera))
+    cam = service.subscribe_rtsp("rtsp://user:pw@192.168.0.10:554/stream1", name="mirror")
+    ret, frame = cam.read()          # 서브스트림(/stream2) 프레임
+    cam.mark_displayed()             # 화면 표시 직후 호출 → 유리→화면 지연 기록
+    full = cam.snapshot()            # 메인스트림(/stream1) 1장
+"""
+
+import os
+import re
+import time
+from typing import Optional
+
+try:
+    import cv2
+    CV2_OK = True
+except ImportError:
+    CV2_OK = False
+
+# 저지연 옵션: TCP 전송(패킷 손실로 인한 H.264 깨짐 방지) + 수신/디코더 버퍼 없음 + 짧은 스트림 분석
+LOW_LATENCY_OPTIONS = "fflags;nobuffer|flags;low_delay|max_delay;0|reorder_queue_size;0|analyzeduration;1000000|probesize;500000"
+# 기존(안정성 우선) 옵션: 시작 시 스트림 분석을 길게 함
+BUFFERED_OPTIONS = "analyzeduration;10000000|probesize;10000000"
+
+# 메인스트림 → 서브스트림 경로 규칙 (제조사별)
+_SUBSTREAM_RULES = (
+    (re.compile(r"/stream1(?=$|[/?])"), "/stream2"),                          # Tapo / TP-Link
+    (re.compile(r"(/Streaming/Channels/\d*?)01(?=$|[/?])", re.I), r"\g<1>02"),  # Hikvision (101 → 102)
+    (re.compile(r"([?&]subtype=)0(?=$|&)"), r"\g<1>1"),                        # Dahua / Amcrest
+    (re.compile(r"(Preview_\d+_)main(?=$|[/?])"), r"\g<1>sub"),                # Reolink
+    (re.compile(r"/(?:av0_0|ch0_0\.h264)(?=$|[/?])"), lambda m: m.group(0).replace("0_0", "0_1")),
+)
+
+_CREDENTIALS = re.compile(r"(?<=://)[^/@]+@")
+
+
+def ffmpeg_options(camera_cfg: Optional[dict] = None) -> str:
+    """
+    OPENCV_FFMPEG_CAPTURE_OPTIONS 문자열 생성
+
+    Args:
+        camera_cfg: cfg.camera (rtsp_ffmpeg_options / rtsp_transport / rtsp_low_latency)
+    """
+    camera_cfg = camera_cfg or {}
+    custom = str(camera_cfg.get("rtsp_ffmpeg_options", "") or "").strip()
+    if custom:
+        return custom
+    transport = str(camera_cfg.get("rtsp_transport", "tcp") or "tcp").strip().lower()
+    low_latency = str(camera_cfg.get("rtsp_low_latency", True)).lower() in ("1", "true", "yes", "on")
+    return f"rtsp_transport;{transport}|" + (LOW_LATENCY_OPTIONS if low_latency else BUFFERED_OPTIONS)
+
+
+def substream_url(url: str) -> Optional[str]:
+    """
+    메인스트림 URL에 대응하는 서브스트림 URL (규칙에 맞지 않으면 None)
+
+    이미 서브스트림 URL(/stream2 등)이면 None을 반환하므로 입력 URL을 그대로 사용하면 됩니다.
+    """
+    if not url:
+        return None
+    for pattern, repl in _SUBSTREAM_RULES:
+        sub, count = pattern.subn(repl, url, count=1)
+        if count and sub != url:
+            return sub
+    return None
+
+
+def redact_url(url) -> str:
+    """로그/메트릭 라벨용 URL (계정 정보 제거)"""
+    if not isinstance(url, str):
+        return str(url)
+    return _CREDENTIALS.sub("***@", url)
+
+
+def open_rtsp(url: str, options: str, timeout_ms: int = 10000):
+    """RTSP VideoCapture 열기 (실패 시 None)"""
+    if not CV2_OK:
+        return None
+    # OpenCV는 열기 시점에만 환경변수를 읽음
+    os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = options
+    try:
+        cap = cv2.VideoCapture(url, cv2.CAP_FFMPEG, [cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, timeout_ms,
+                                                     cv2.CAP_PROP_READ_TIMEOUT_MSEC, timeout_ms])
+    except Exception:
+        cap = cv2.VideoCapture(url, cv2.CAP_FFMPEG)
+    if cap.isOpened():
+        return cap
+    cap.release()
+    return None
+
+
+def grab_snapshot(url: str, options: str, timeout: float = 5.0):
+    """
+    스트림을 잠깐 열어 프레임 1장 수신 후 닫기 (메인스트림 고해상도 스냅샷용)
+
+    첫 키프레임 전의 디코딩 실패 프레임은 건너뜁니다. 실패 시 None.
+    """
+    cap = open_rtsp(url, options, timeout_ms=int(timeout * 1000))
+    if cap is None:
+        print(f"[RTSP] 스냅샷 열기 실패: {redact_url(url)}")
+        return None
+    try:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            ok, frame = cap.read()
+            if ok and frame is not None:
+                return frame
+        print(f"[RTSP] 스냅샷 수신 시간 초과: {redact_url(url)}")
+        return None
+    finally:
+        cap.release()
+
+
+class StreamLagEstimator:
+    """
+    스트림 누적 지연 추정
+
+    (수신 시각 - 프레임 PTS)의 최소값을 기준(카메라 인코딩 + 네트워크 고정 지연)으로 두고,
+    현재 값이 기준보다 큰 만큼을 버퍼링으로 쌓인 지연으로 봅니다.
+    카메라와 PC 시계 차이로 기준이 조금씩 어긋나므로 기준은 천천히(DRIFT 초/초) 따라 올라갑니다.
+    """
+
+    DRIFT = 0.001
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._base: Optional[float] = None
+        self._last_update = 0.0
+        self.lag = 0.0
+
+    def update(self, pts_ms: float, now: float) -> float:
+        """PTS(ms, CAP_PROP_POS_MSEC)와 수신 시각(monotonic)으로 지연(초) 갱신"""
+        if not pts_ms or pts_ms <= 0:
+            return self.lag
+        offset = now - pts_ms / 1000.0
+        if self._base is None or offset < self._base:
+            self._base = offset
+        else:
+            self._base = min(offset, self._base + self.DRIFT * max(0.0, now - self._last_update))
+        self._last_update = now
+        self.lag = offset - self._base
+        return self.lag
@@ -0,0 +1,617 @@
+"""
+프로세스 공용 카메라 서비스
+
+USB 카메라(인덱스) / IP 카메라(RTSP URL)를 장치당 한 번만 열고 전용 스레드에서 계속 읽어
+최신 프레임 1장만 보관합니다. 화면들은 참조 카운트 구독(CameraSubscription)으로 프레임을 받습니다.
+
+- 거울보기 ↔ 안전교육 ↔ 얼굴 등록 화면 전환 시 장치를 다시 열지 않음 (마지막 구독 해제 후
+  linger 초 동안 열린 상태 유지)
+- 두 화면이 같은 장치를 동시에 사용 가능
+- 구독자별 출력 해상도/FPS 지정 (장치는 구독자 요청 중 가장 큰 해상도/FPS로 캡처)
+
+CameraSubscription은 cv2.VideoCapture와 같은 메서드(read/grab/isOpened/get/set/release)를 제공하므로
+기존 코드의 카메라 객체 자리에 그대로 넣을 수 있습니다.
+
+IP 카메라는 subscribe_rtsp()로 구독하면 저지연 FFMPEG 옵션과 서브스트림을 사용합니다 (rtsp.py 참고).
+
+사용 예:
+    from ..camera import get_camera_service
+    cam = get_camera_service().subscribe(0, width=640, height=480, fps=15, name="education")
+    if cam.isOpened():
+        ret, frame = cam.read()
+    cam.release()
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import cv2
+    CV2_OK = True
+except ImportError:
+    CV2_OK = False
+
+from ..utils.metrics import get_metrics
+from .registry import get_camera_registry
+from .rtsp import StreamLagEstimator, ffmpeg_options, grab_snapshot, open_rtsp, redact_url, substream_url
+
+_DECODE_FPS = get_metrics().gauge("camera_decode_fps", "카메라 소스별 디코딩 FPS", ("source",))
+_STREAM_LAG = get_metrics().gauge("camera_stream_lag_seconds", "RTSP 스트림 누적 지연 (PTS 기준)", ("source",))
+_DISPLAY_LATENCY = get_metrics().histogram(
+    "camera_glass_to_display_seconds", "프레임 수신(PTS 기준 보정)부터 화면 표시까지 지연", ("subscriber",))
+
+SourceKey = Union[int, str]
+
+
+class _CameraSource:
+    """장치(또는 스트림) 1개: VideoCapture 소유 + 읽기 스레드"""
+
+    OPEN_FRAME_TIMEOUT = 3.0   # 열기 후 첫 프레임 대기 (초)
+    MAX_READ_FAILURES = 30     # 연속 읽기 실패 시 재연결
+
+    def __init__(self, service: "CameraService", key: SourceKey, backends=None):
+        self.service = service
+        self.key = key
+        self.backends = backends
+        self.cap = None
+        self.refcount = 0
+        self.idle_since: Optional[float] = None
+        self.closed = False
+
+        self.frame = None
+        self.seq = 0
+        self.frame_ts = 0.0
+        self.cond = threading.Condition()
+
+        self.capture_size: Tuple[int, int] = (0, 0)   # 요청한 캡처 해상도 (0 = 장치 기본값)
+        self.capture_fps = 0.0
+        self._controls: Dict[int, float] = {}          # 읽기 스레드에서 적용할 set() 요청
+        self._controls_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.reconnects = 0
+
+        self.label = redact_url(key)
+        self.decode_fps = 0.0
+        self._fps_count = 0
+        self._fps_since = 0.0
+        self.lag = StreamLagEstimator() if self.is_url else None
+
+    @property
+    def is_url(self) -> bool:
+        return isinstance(self.key, str)
+
+    # ------------------------------------------------------------------
+    # 열기/읽기
+    # ------------------------------------------------------------------
+
+    def _open_capture(self):
+        """VideoCapture 열기 (백엔드 순서대로 시도, 실패 시 None)"""
+        if self.is_url:
+            return open_rtsp(self.key, self.service.rtsp_options)
+
+        for backend in self.backends or (None,):
+            try:
+                cap = cv2.VideoCapture(self.key) if backend is None else cv2.VideoCapture(self.key, backend)
+            except Exception:
+                continue
+            if cap.isOpened():
+                return cap
+            cap.release()
+        return None
+
+    def _configure(self, cap):
+        """캡처 해상도/FPS 및 대기 중인 장치 제어값 적용"""
+        width, height = self.capture_size
+        if width and height:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if self.capture_fps:
+            cap.set(cv2.CAP_PROP_FPS, self.capture_fps)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        with self._controls_lock:
+            controls, self._controls = self._controls, {}
+        for prop, value in controls.items():
+            try:
+                cap.set(prop, value)
+            except Exception:
+                pass
+
+    def open(self) -> bool:
+        """장치를 열고 첫 프레임 수신까지 대기"""
+        cap = self._open_capture()
+        if cap is None:
+            return False
+        self._configure(cap)
+        self.cap = cap
+        self._thread = threading.Thread(target=self._reader, name=f"camera-{self.key}", daemon=True)
+        self._thread.start()
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > 0 or self.closed, timeout=self.OPEN_FRAME_TIMEOUT)
+            ok = self.seq > 0
+        if not ok:
+            print(f"[CameraService] {self.label}: 열렸으나 프레임 수신 실패")
+        return ok
+
+    def request(self, width: int, height: int, fps: float):
+        """구독자 요청 반영 (더 큰 해상도/FPS만 올림, 실행 중 축소하지 않음)"""
+        cur_w, cur_h = self.capture_size
+        if width and height and width * height > cur_w * cur_h:
+            self.capture_size = (width, height)
+            self.set_control(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.set_control(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        if fps and fps > self.capture_fps:
+            self.capture_fps = fps
+            self.set_control(cv2.CAP_PROP_FPS, fps)
+
+    def set_control(self, prop: int, value: float):
+        """장치 제어값 설정 요청 (읽기 스레드에서 적용)"""
+        with self._controls_lock:
+            self._controls[prop] = value
+
+    def _reader(self):
+        failures = 0
+        backoff = 0.5
+        while not self.closed:
+            cap = self.cap
+            if self._controls:
+                with self._controls_lock:
+                    controls, self._controls = self._controls, {}
+                for prop, value in controls.items():
+                    try:
+                        cap.set(prop, value)
+                    except Exception:
+                        pass
+
+            try:
+                ok, frame = cap.read()
+            except Exception:
+                ok, frame = False, None
+
+            if ok and frame is not None:
+                failures = 0
+                backoff = 0.5
+                now = time.monotonic()
+                if self.lag is not None:
+                    try:
+                        self.lag.update(cap.get(cv2.CAP_PROP_POS_MSEC), now)
+                    except Exception:
+                        pass
+                with self.cond:
+                    self.frame = frame
+                    self.seq += 1
+                    self.frame_ts = now
+                    self.cond.notify_all()
+                self._count_frame(now)
+            else:
+                failures += 1
+                if failures >= self.MAX_READ_FAILURES:
+                    # 장치 분리/스트림 끊김: 다시 열기 (백오프)
+                    print(f"[CameraService] {self.label}: 읽기 실패 {failures}회 - 재연결")
+                    try:
+                        cap.release()
+                    except Exception:
+                        pass
+                    while not self.closed:
+                        time.sleep(backoff)
+                        backoff = min(backoff * 2, 10.0)
+                        new_cap = self._open_capture()
+                        if new_cap is not None:
+                            self._configure(new_cap)
+                            self.cap = new_cap
+                            self.reconnects += 1
+                            if self.lag is not None:
+                                self.lag.reset()  # 새 세션은 PTS가 0부터 다시 시작
+                            break
+                    failures = 0
+                else:
+                    time.sleep(0.01)
+
+            if self.refcount == 0 and self.service._expire(self):
+                break
+
+        try:
+            if self.cap is not None:
+                self.cap.release()
+        except Exception:
+            pass
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+        self.service._forget(self)
+
+    def _count_frame(self, now: float):
+        """디코딩 FPS (1초 구간)"""
+        self._fps_count += 1
+        elapsed = now - self._fps_since
+        if elapsed >= 1.0:
+            self.decode_fps = self._fps_count / elapsed if self._fps_since else 0.0
+            self._fps_count = 0
+            self._fps_since = now
+            _DECODE_FPS.labels(self.label).set(self.decode_fps)
+            if self.lag is not None:
+                _STREAM_LAG.labels(self.label).set(self.lag.lag)
+
+    @property
+    def stream_lag(self) -> float:
+        """스트림 누적 지연 (초, USB 카메라는 0)"""
+        return self.lag.lag if self.lag is not None else 0.0
+
+    def close(self):
+        self.closed = True
+        with self.cond:
+            self.cond.notify_all()
+
+
+class CameraSubscription:
+    """
+    카메라 구독 (cv2.VideoCapture 호환)
+
+    read()는 이전에 받은 프레임보다 새 프레임이 올 때까지(그리고 구독 FPS 간격이 지날 때까지) 대기합니다.
+    출력 해상도(width x height)는 상한이며, 비율을 유지하여 줄이기만 합니다.
+    장치 버퍼는 서비스가 항상 비우므로 grab()은 아무것도 하지 않습니다.
+    """
+
+    def __init__(self, service: "CameraService", source: Optional[_CameraSource],
+                 width: int = 0, height: int = 0, fps: float = 0.0, name: str = ""):
+        self.service = service
+        self.source = source
+        self.width = int(width or 0)
+        self.height = int(height or 0)
+        self.fps = float(fps or 0.0)
+        self.name = name
+        self._last_seq = 0
+        self._last_delivered = 0.0
+        self._released = source is None
+
+        self.snapshot_url: Optional[str] = None    # 서브스트림 구독일 때 메인스트림 URL
+        self._frame_ts = 0.0                        # 마지막으로 반환한 프레임의 수신 시각
+        self._frame_lag = 0.0                       # 그 시점의 스트림 누적 지연
+        self.display_latency = 0.0                  # 최근 유리→화면 지연 (초, 이동 평균)
+
+    @property
+    def key(self) -> Optional[SourceKey]:
+        return self.source.key if self.source is not None else None
+
+    def isOpened(self) -> bool:
+        return not self._released and self.source is not None and not self.source.closed
+
+    def grab(self) -> bool:
+        return self.isOpened()
+
+    def latest(self):
+        """대기 없이 최신 프레임 반환 (seq, frame) - 공유 배열이므로 수정 금지"""
+        if not self.isOpened():
+            return 0, None
+        with self.source.cond:
+            return self.source.seq, self.source.frame
+
+    def read(self, timeout: float = 1.0):
+        """
+        새 프레임 반환 (ret, frame) - 구독 해상도로 변환된 복사본
+
+        timeout <= 0이면 대기하지 않음: 구독 FPS 간격 전이거나 새 프레임이 없으면 바로 (False, None)
+        (Tk after() 루프처럼 UI 스레드에서 호출할 때 - 재연결 중에도 화면이 멈추지 않음)
+        """
+        if not self.isOpened():
+            return False, None
+        src = self.source
+        if self.fps > 0:
+            wait = self._last_delivered + 1.0 / self.fps - time.monotonic()
+            if wait > 0:
+                if timeout <= 0:
+                    return False, None
+                time.sleep(min(wait, timeout))
+        with src.cond:
+            if not src.cond.wait_for(lambda: src.seq != self._last_seq or src.closed, timeout=timeout):
+                return False, None
+            if src.closed or src.frame is None:
+                return False, None
+            frame, self._last_seq = src.frame, src.seq
+            self._frame_ts = src.frame_ts
+        self._frame_lag = src.stream_lag
+        self._last_delivered = time.monotonic()
+        return True, self._convert(frame)
+
+    @property
+    def decode_fps(self) -> float:
+        return self.source.decode_fps if self.source is not None else 0.0
+
+    def mark_displayed(self) -> float:
+        """
+        read()로 받은 프레임을 화면에 표시한 직후 호출 → 유리→화면 지연(초) 기록
+
+        수신→표시 시간에 스트림 누적 지연(버퍼링)을 더한 값입니다.
+        카메라 인코딩/네트워크 고정 지연은 PTS로 알 수 없어 포함되지 않습니다.
+        """
+        if not self._frame_ts:
+            return 0.0
+        latency = time.monotonic() - self._frame_ts + self._frame_lag
+        self._frame_ts = 0.0
+        self.display_latency = latency if not self.display_latency else \
+            0.9 * self.display_latency + 0.1 * latency
+        _DISPLAY_LATENCY.labels(self.name or "default").observe(latency)
+        return latency
+
+    def snapshot(self, timeout: float = 5.0):
+        """
+        고해상도 스냅샷 1장 (서브스트림 구독이면 메인스트림을 잠깐 열어 수신)
+
+        메인스트림이 이미 다른 구독으로 열려 있으면 그 최신 프레임을 사용합니다. 실패 시 None.
+        """
+        if not self.isOpened():
+            return None
+        if self.snapshot_url:
+            frame = self.service.latest_frame(self.snapshot_url)
+            if frame is None:
+                frame = grab_snapshot(self.snapshot_url, self.service.rtsp_options, timeout)
+            if frame is not None:
+                return frame
+        with self.source.cond:
+            frame = self.source.frame
+        return frame.copy() if frame is not None else None
+
+    def _output_size(self, w: int, h: int) -> Tuple[int, int]:
+        """구독 해상도 안에 맞춘 출력 크기 (비율 유지, 확대하지 않음)"""
+        if not (self.width and self.height) or (w <= self.width and h <= self.height):
+            return w, h
+        scale = min(self.width / w, self.height / h)
+        return max(1, int(w * scale)), max(1, int(h * scale))
+
+    def _convert(self, frame):
+        h, w = frame.shape[:2]
+        out_w, out_h = self._output_size(w, h)
+        if (out_w, out_h) != (w, h):
+            return cv2.resize(frame, (out_w, out_h), interpolation=cv2.INTER_AREA)
+        return frame.copy()
+
+    def get(self, prop: int) -> float:
+        if self.source is None:
+            return 0.0
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+            frame = self.source.frame
+            if frame is not None:
+                out_w, out_h = self._output_size(frame.shape[1], frame.shape[0])
+                return float(out_w if prop == cv2.CAP_PROP_FRAME_WIDTH else out_h)
+        if prop == cv2.CAP_PROP_FPS and self.fps:
+            return self.fps
+        cap = self.source.cap
+        try:
+            return cap.get(prop) if cap is not None else 0.0
+        except Exception:
+            return 0.0
+
+    def set(self, prop: int, value) -> bool:
+        """해상도/FPS는 이 구독의 출력 설정, 그 외(줌, 초점, FOURCC 등)는 장치 제어로 전달"""
+        if not self.isOpened():
+            return False
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            self.width = int(value)
+        elif prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            self.height = int(value)
+        elif prop == cv2.CAP_PROP_FPS:
+            self.fps = float(value)
+        elif prop == cv2.CAP_PROP_BUFFERSIZE:
+            return True  # 서비스가 최신 프레임만 유지
+        else:
+            self.source.set_control(prop, value)
+            return True
+        if self.width and self.height:
+            self.source.request(self.width, self.height, self.fps)
+        elif self.fps:
+            self.source.request(0, 0, self.fps)
+        return True
+
+    def release(self):
+        """구독 해제 (마지막 구독이면 linger 후 장치 닫힘)"""
+        if self._released:
+            return
+        self._released = True
+        self.service._unsubscribe(self.source)
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
+
+
+class CameraService:
+    """장치/스트림별 _CameraSource 관리 (참조 카운트)"""
+
+    def __init__(self, linger: float = 5.0):
+        """
+        Args:
+            linger: 마지막 구독 해제 후 장치를 열어둘 시간 (초) - 화면 전환 시 재초기화 방지
+        """
+        self.linger = linger
+        self._sources: Dict[SourceKey, _CameraSource] = {}
+        self._lock = threading.Lock()
+        self._open_locks: Dict[SourceKey, threading.Lock] = {}
+        self.rtsp_options = ffmpeg_options()
+
+    def set_rtsp_options(self, options: str):
+        """이후 열리는 RTSP 스트림의 FFMPEG 옵션 (rtsp.ffmpeg_options(cfg.camera))"""
+        self.rtsp_options = options
+
+    def _backends(self):
+        try:
+            from ..platform import CameraBackend
+            backend = CameraBackend()
+            return (backend.get_backend(), backend.get_fallback_backend(), None)
+        except Exception:
+            return (None,)
+
+    def subscribe(self, source: SourceKey, width: int = 0, height: int = 0,
+                  fps: float = 0.0, name: str = "") -> CameraSubscription:
+        """
+        카메라 구독 (장치가 열려 있지 않으면 열기)
+
+        Args:
+            source: USB 카메라 인덱스(int) 또는 IP 카메라 URL(str)
+            width, height: 출력 해상도 (0이면 장치 해상도)
+            fps: 최대 출력 FPS (0이면 장치 FPS)
+            name: 진단용 구독자 이름
+
+        Returns:
+            CameraSubscription - 열기 실패 시 isOpened()가 False
+        """
+        if not CV2_OK:
+            return CameraSubscription(self, None, name=name)
+        if isinstance(source, str) and source.isdigit():
+            source = int(source)
+
+        with self._lock:
+            open_lock = self._open_locks.setdefault(source, threading.Lock())
+
+        # 같은 장치를 동시에 두 번 열지 않도록 장치별 잠금
+        with open_lock:
+            with self._lock:
+                src = self._sources.get(source)
+                closing = src if src is not None and src.closed else None
+                if src is not None and not src.closed:
+                    src.refcount += 1
+                    src.idle_since = None
+                else:
+                    src = None
+
+            if closing is not None and closing._thread is not None:
+                closing._thread.join(timeout=2.0)  # 이전 캡처가 장치를 놓을 때까지 대기
+
+            if src is None:
+                src = _CameraSource(self, source, backends=None if isinstance(source, str) else self._backends())
+                src.request(int(width or 0), int(height or 0), float(fps or 0.0))
+                if not src.open():
+                    src.close()
+                    return CameraSubscription(self, None, name=name)
+                with self._lock:
+                    src.refcount = 1
+                    self._sources[source] = src
+                print(f"[CameraService] {redact_url(source)} 열기 완료 ({name})")
+            else:
+                src.request(int(width or 0), int(height or 0), float(fps or 0.0))
+
+        return CameraSubscription(self, src, width, height, fps, name)
+
+    def subscribe_rtsp(self, url: str, use_substream: bool = True, width: int = 0, height: int = 0,
+                       fps: float = 0.0, name: str = "") -> CameraSubscription:
+        """
+        IP 카메라 구독 (서브스트림 우선)
+
+        use_substream이면 URL에 대응하는 저해상도 서브스트림을 열고(실패 시 원래 URL),
+        원래(메인스트림) URL은 snapshot()에서만 잠깐 엽니다.
+        """
+        sub_url = substream_url(url) if use_substream else None
+        if sub_url:
+            sub = self.subscribe(sub_url, width, height, fps, name)
+            if sub.isOpened():
+                sub.snapshot_url = url
+                print(f"[CameraService] 서브스트림 사용: {redact_url(sub_url)} (스냅샷: {redact_url(url)})")
+                return sub
+            print(f"[CameraService] 서브스트림 열기 실패 - 메인스트림 사용: {redact_url(url)}")
+        return self.subscribe(url, width, height, fps, name)
+
+    def latest_frame(self, source: SourceKey):
+        """열려 있는 소스의 최신 프레임 복사본 (열려 있지 않으면 None)"""
+        with self._lock:
+            src = self._sources.get(source)
+        if src is None or src.closed:
+            return None
+        with src.cond:
+            return src.frame.copy() if src.frame is not None else None
+
+    def subscribe_first_available(self, preferred: Optional[int] = None, width: int = 0, height: int = 0,
+                                  fps: float = 0.0, name: str = "") -> CameraSubscription:
+        """
+        USB 카메라 구독 (이미 열린 장치 → 설정된 인덱스 → 카메라 목록의 캡처 장치 순서)
+
+        이미 열려 있는(다른 화면이 사용 중이거나 linger 중인) 장치가 있으면 탐색 없이 바로 공유합니다.
+        """
+        candidates = []
+        if preferred is not None and preferred >= 0:
+            candidates.append(preferred)
+        with self._lock:
+            candidates += [k for k, s in self._sources.items()
+                           if isinstance(k, int) and not s.closed and k not in candidates]
+        candidates += [d.index for d in get_camera_registry().capture_devices() if d.index not in candidates]
+        if not candidates:
+            candidates = [0]
+
+        # 열린 장치 우선
+        with self._lock:
+            opened = [k for k in candidates if k in self._sources and not self._sources[k].closed]
+        for key in opened + [k for k in candidates if k not in opened]:
+            sub = self.subscribe(key, width, height, fps, name)
+            if sub.isOpened():
+                return sub
+        return CameraSubscription(self, None, name=name)
+
+    def _unsubscribe(self, src: Optional[_CameraSource]):
+        if src is None:
+            return
+        with self._lock:
+            src.refcount = max(0, src.refcount - 1)
+            if src.refcount == 0:
+                src.idle_since = time.monotonic()
+
+    def _expire(self, src: _CameraSource) -> bool:
+        """읽기 스레드에서 호출: 구독이 없고 linger가 지났으면 목록에서 제거 후 True"""
+        with self._lock:
+            if src.refcount > 0 or src.idle_since is None:
+                return False
+            if time.monotonic() - src.idle_since < self.linger:
+                return False
+            # 목록에서는 장치 해제 후(_forget) 제거 → 그 사이 구독 요청은 해제 완료를 기다렸다가 다시 엶
+            src.closed = True
+        print(f"[CameraService] {src.label} 닫기 (구독 없음)")
+        return True
+
+    def _forget(self, src: _CameraSource):
+        with self._lock:
+            if self._sources.get(src.key) is src:
+                del self._sources[src.key]
+
+    def close(self, source: SourceKey):
+        """장치 강제 닫기 (구독 중인 화면은 isOpened()가 False가 됨)"""
+        with self._lock:
+            src = self._sources.pop(source, None)
+        if src is not None:
+            src.close()
+
+    def shutdown(self):
+        """모든 장치 닫기 (프로그램 종료 시)"""
+        with self._lock:
+            sources = list(self._sources.values())
+            self._sources.clear()
+        for src in sources:
+            src.close()
+        for src in sources:
+            if src._thread is not None:
+                src._thread.join(timeout=2.0)
+
+    def stats(self) -> List[Dict]:
+        """장치별 상태 (진단용)"""
+        with self._lock:
+            return [{
+                "source": key,
+                "refcount": src.refcount,
+                "seq": src.seq,
+                "capture_size": src.capture_size,
+                "reconnects": src.reconnects,
+                "decode_fps": round(src.decode_fps, 1),
+                "stream_lag": round(src.stream_lag, 3),
+            } for key, src in self._sources.items()]
+
+
+_service: Optional[CameraService] = None
+_service_lock = threading.Lock()
+
+
+def get_camera_service() -> CameraService:
+    """전역 카메라 서비스"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CameraService()
+    return _service
@@ -124,7 +124,19 @@ class ConfigManager:
             # 1: N5095 등 저사양 - 얼굴 인식만
             # 2: i7 이상 CPU - 얼굴 + 안전장구 6종
             # 3: i7 + RTX 3060 이상 - 얼굴 + 안전장구 + 사물 인식
-            "performance_mode": 2
+            "performance_mode": 2,
+            # 움직임 게이트: 정적인 화면에서는 AI 추론을 keep-alive 주기(최대 N초)마다만 수행
+            "motion_gate_enabled": True,
+            "motion_gate_max_keepalive": 5.0,
+            # AI 단계별 시간 예산: 측정한 추론 시간에 따라 단계별 실행 주기/입력 해상도 자동 조절
+            "ai_budget_enabled": True,
+            # 성능 계측: 활성화 시 http://127.0.0.1:<metrics_port>/metrics (Prometheus 형식) + 진단 패널
+            "metrics_enabled": False,
+            "metrics_port": 9464,
+            # 센서 이력 보관: 지난 날짜 sensor_data를 센서별 열 압축 청크로 (+ data_YYYYMMDD.log gzip)
+            # 원본 행을 지우므로 명시적으로 켠 경우에만 동작
+            "history_archive_enabled": False,
+            "history_archive_text_logs": True
         }
         self.camera = {
             "device_id": 0,
@@ -138,7 +150,12 @@ class ConfigManager:
             "use_ip_camera": False,  # IP 카메라 사용 여부
             "selected_ip_camera": "",  # 선택된 IP 카메라 이름
             "ip_camera_url": "",  # 선택된 IP 카메라 RTSP URL
-            "ip_camera_name": ""  # 선택된 IP 카메라 표시 이름
+            "ip_camera_name": "",  # 선택된 IP 카메라 표시 이름
+            # RTSP 수신: 화면/AI는 서브스트림(저해상도), 메인스트림은 스냅샷 때만 사용
+            "ip_camera_substream": True,
+            "rtsp_transport": "tcp",
+            "rtsp_low_latency": True,
+            "rtsp_ffmpeg_options": ""  # 지정 시 위 두 설정 대신 그대로 사용 (key;value|key;value)
         }
         self.value_text = "특고압 전기실입니다,관계자외 출입을 금합니다,공기질 측정중입니다"
         self.auth = {"enabled": "false", "users": ""}
@@ -272,6 +289,10 @@ class ConfigManager:
                 self.camera["selected_ip_camera"] = gs("CAMERA", "selected_ip_camera", self.camera["selected_ip_camera"])
                 self.camera["ip_camera_url"] = gs("CAMERA", "ip_camera_url", self.camera["ip_camera_url"])
                 self.camera["ip_camera_name"] = gs("CAMERA", "ip_camera_name", self.camera["ip_camera_name"])
+                self.camera["ip_camera_substream"] = gb("CAMERA", "ip_camera_substream", self.camera["ip_camera_substream"])
+                self.camera["rtsp_transport"] = gs("CAMERA", "rtsp_transport", self.camera["rtsp_transport"])
+                self.camera["rtsp_low_latency"] = gb("CAMERA", "rtsp_low_latency", self.camera["rtsp_low_latency"])
+                self.camera["rtsp_ffmpeg_options"] = gs("CAMERA", "rtsp_ffmpeg_options", self.camera["rtsp_ffmpeg_options"])
 
                 # IP 카메라 목록 로드 (JSON 문자열)
                 ip_cameras_json = gs("CAMERA", "ip_cameras", "[]")
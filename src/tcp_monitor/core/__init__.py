@@ -0,0 +1,30 @@
+"""
+TCP Monitor 수집 코어 모듈
+
+TCP 수신/저장/임계값·화재 판정/경보 상태를 화면과 분리된 헤드리스 프로세스로 실행하고,
+화면 프로세스는 로컬 Unix 소켓 채널로 구독합니다.
+"""
+
+from .channel import CoreChannelServer, CoreClient, CoreRequestError, default_socket_path
+from .remote import RemoteLogManager
+
+
+def __getattr__(name):
+    """IngestCore는 화재 감지 모듈까지 로드하므로 최초 접근 시 import (화면 프로세스는 불필요)"""
+    if name in ('IngestCore', 'panel_key'):
+        from . import ingest
+        value = getattr(ingest, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'IngestCore',
+    'panel_key',
+    'CoreChannelServer',
+    'CoreClient',
+    'CoreRequestError',
+    'RemoteLogManager',
+    'default_socket_path',
+]
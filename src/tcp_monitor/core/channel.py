@@ -0,0 +1,378 @@
+"""
+코어 ↔ UI 로컬 채널 (Unix 도메인 소켓, JSON Lines)
+
+헤드리스 수집 코어(IngestCore)가 서버 쪽, 화면 프로세스가 클라이언트 쪽입니다.
+
+메시지 형식 (한 줄에 JSON 하나):
+- 코어 → UI 이벤트:  {"type": "event", "kind": "data" | "fire" | "alert" | ..., "payload": {...}}
+- UI → 코어 요청:    {"type": "request", "req_id": 1, "method": "get_today_stats", "args": [...]}
+- 코어 → UI 응답:    {"type": "response", "req_id": 1, "ok": true, "result": ...}
+                     {"type": "response", "req_id": 1, "ok": false, "error": "..."}
+
+구독자마다 제한 크기 송신 큐와 송신 스레드를 두어 느린 화면 프로세스가 수집 경로를 막지 않게 하고,
+큐가 넘치면 연결을 끊습니다 (클라이언트는 재접속 후 snapshot으로 상태를 다시 받습니다).
+"""
+
+import json
+import os
+import queue
+import socket
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+def default_socket_path() -> str:
+    """기본 소켓 경로 ($XDG_RUNTIME_DIR 우선, 없으면 임시 디렉토리)"""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, "garame_core.sock")
+
+
+def _encode(msg: Dict) -> bytes:
+    return (json.dumps(msg, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+class _Subscriber:
+    """연결된 화면 프로세스 1개"""
+
+    def __init__(self, conn: socket.socket, max_queue: int):
+        self.conn = conn
+        self.out = queue.Queue(maxsize=max_queue)
+        self.closed = threading.Event()
+        self.dropped = False
+
+    def send(self, payload: bytes, block: bool = False) -> bool:
+        if self.closed.is_set():
+            return False
+        try:
+            self.out.put(payload, block=block, timeout=5.0 if block else None)
+            return True
+        except queue.Full:
+            self.dropped = True
+            self.close()
+            return False
+
+    def close(self):
+        if self.closed.is_set():
+            return
+        self.closed.set()
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+        try:
+            self.out.put_nowait(None)
+        except queue.Full:
+            pass
+
+
+class CoreChannelServer:
+    """코어 쪽 채널: 이벤트 발행 + 요청 처리"""
+
+    def __init__(self, path: str, handlers: Dict[str, Callable[..., Any]],
+                 max_queue: int = 2000, logger=None):
+        """
+        Args:
+            path: Unix 소켓 경로
+            handlers: 요청 메서드명 → 처리 함수 (인자는 args 리스트, 반환값은 JSON 직렬화 가능해야 함)
+            max_queue: 구독자별 최대 대기 메시지 수 (초과 시 연결 종료)
+            logger: write_run()을 가진 로거 (선택)
+        """
+        self.path = path
+        self.handlers = handlers
+        self.max_queue = max_queue
+        self.log = logger
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._stop_evt = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """소켓 생성 및 접속 대기 시작"""
+        if os.path.exists(self.path):
+            # 이전 실행이 남긴 소켓 파일 (살아있는 코어가 있으면 접속됨 → 중복 실행 방지)
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.path)
+                probe.close()
+                raise RuntimeError(f"core already running on {self.path}")
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.unlink(self.path)
+            finally:
+                probe.close()
+
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.bind(self.path)
+        os.chmod(self.path, 0o660)
+        self._sock.listen(8)
+        self._sock.settimeout(1.0)
+        self._thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """채널 종료"""
+        self._stop_evt.set()
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            sub.close()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def publish(self, kind: str, payload: Dict):
+        """모든 구독자에게 이벤트 전송 (블로킹 없음)"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        if not subscribers:
+            return
+        data = _encode({"type": "event", "kind": kind, "payload": payload})
+        for sub in subscribers:
+            if not sub.send(data) and sub.dropped and self.log:
+                self.log.write_run("core channel: subscriber queue full, disconnected")
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _accept_loop(self):
+        while not self._stop_evt.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            sub = _Subscriber(conn, self.max_queue)
+            with self._lock:
+                self._subscribers.append(sub)
+            threading.Thread(target=self._writer, args=(sub,), daemon=True).start()
+            threading.Thread(target=self._reader, args=(sub,), daemon=True).start()
+            if self.log:
+                self.log.write_run(f"core channel: subscriber attached ({self.subscriber_count()})")
+        try:
+            self._sock.close()
+        except Exception:
+            pass
+
+    def _writer(self, sub: _Subscriber):
+        while not sub.closed.is_set():
+            payload = sub.out.get()
+            if payload is None:
+                break
+            # 대기 중인 메시지를 묶어서 전송
+            batch = [payload]
+            while len(batch) < 256:
+                try:
+                    more = sub.out.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    sub.closed.set()
+                    break
+                batch.append(more)
+            try:
+                sub.conn.sendall(b"".join(batch))
+            except Exception:
+                sub.close()
+                break
+
+    def _reader(self, sub: _Subscriber):
+        buf = b""
+        try:
+            while not sub.closed.is_set() and not self._stop_evt.is_set():
+                chunk = sub.conn.recv(65536)
+                if not chunk:
+                    break
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    if line.strip():
+                        self._handle_request(sub, line)
+        except Exception:
+            pass
+        finally:
+            sub.close()
+            with self._lock:
+                if sub in self._subscribers:
+                    self._subscribers.remove(sub)
+            try:
+                sub.conn.close()
+            except Exception:
+                pass
+            if self.log:
+                self.log.write_run(f"core channel: subscriber detached ({self.subscriber_count()})")
+
+    def _handle_request(self, sub: _Subscriber, line: bytes):
+        try:
+            msg = json.loads(line.decode("utf-8", "replace"))
+        except Exception:
+            return
+        if not isinstance(msg, dict) or msg.get("type") != "request":
+            return
+        req_id = msg.get("req_id")
+        handler = self.handlers.get(msg.get("method", ""))
+        if handler is None:
+            reply = {"type": "response", "req_id": req_id, "ok": False,
+                     "error": f"unknown method {msg.get('method')!r}"}
+        else:
+            try:
+                result = handler(*(msg.get("args") or []))
+                reply = {"type": "response", "req_id": req_id, "ok": True, "result": result}
+            except Exception as e:
+                reply = {"type": "response", "req_id": req_id, "ok": False, "error": str(e)}
+        # 응답은 잠시 대기해서라도 전달 (요청자가 기다리고 있음)
+        sub.send(_encode(reply), block=True)
+
+
+class CoreRequestError(Exception):
+    """코어 요청 실패 (연결 없음/타임아웃/코어 쪽 예외)"""
+
+
+class CoreClient:
+    """화면 프로세스 쪽 채널: 이벤트 수신 + 요청 전송 (자동 재접속)"""
+
+    def __init__(self, path: str, on_event: Callable[[str, Dict], None],
+                 on_connect: Optional[Callable[[], None]] = None,
+                 reconnect: bool = True):
+        """
+        Args:
+            path: 코어 Unix 소켓 경로
+            on_event: 이벤트 콜백 (kind, payload) - 수신 스레드에서 호출됨
+            on_connect: 접속(재접속) 직후 콜백 - 별도 스레드에서 호출되므로 call() 사용 가능
+            reconnect: 연결이 끊기면 재접속 시도
+        """
+        self.path = path
+        self.on_event = on_event
+        self.on_connect = on_connect
+        self.reconnect = reconnect
+        self.connected = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._send_lock = threading.Lock()
+        self._pending: Dict[int, list] = {}
+        self._pending_lock = threading.Lock()
+        self._next_id = 0
+        self._stop_evt = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_evt.set()
+        sock = self._sock
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def wait_connected(self, timeout: float = None) -> bool:
+        return self.connected.wait(timeout)
+
+    def call(self, method: str, *args, timeout: float = 10.0):
+        """코어에 요청을 보내고 결과 반환 (실패 시 CoreRequestError)"""
+        sock = self._sock
+        if sock is None or not self.connected.is_set():
+            raise CoreRequestError("not connected to core")
+
+        slot = [threading.Event(), None]
+        with self._pending_lock:
+            self._next_id += 1
+            req_id = self._next_id
+            self._pending[req_id] = slot
+        try:
+            data = _encode({"type": "request", "req_id": req_id, "method": method, "args": list(args)})
+            with self._send_lock:
+                sock.sendall(data)
+            if not slot[0].wait(timeout):
+                raise CoreRequestError(f"{method}: timeout")
+        except OSError as e:
+            raise CoreRequestError(f"{method}: {e}")
+        finally:
+            with self._pending_lock:
+                self._pending.pop(req_id, None)
+
+        reply = slot[1]
+        if reply is None:
+            raise CoreRequestError(f"{method}: connection lost")
+        if not reply.get("ok"):
+            raise CoreRequestError(f"{method}: {reply.get('error')}")
+        return reply.get("result")
+
+    def _run(self):
+        backoff = 0.5
+        while not self._stop_evt.is_set():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.path)
+            except OSError:
+                sock.close()
+                if not self.reconnect:
+                    return
+                self._stop_evt.wait(backoff)
+                backoff = min(backoff * 2, 5.0)
+                continue
+
+            backoff = 0.5
+            self._sock = sock
+            self.connected.set()
+            if self.on_connect:
+                threading.Thread(target=self.on_connect, daemon=True).start()
+            try:
+                self._read_loop(sock)
+            finally:
+                self.connected.clear()
+                self._sock = None
+                try:
+                    sock.close()
+                except Exception:
+                    pass
+                self._fail_pending()
+            if not self.reconnect:
+                return
+
+    def _read_loop(self, sock: socket.socket):
+        buf = b""
+        while not self._stop_evt.is_set():
+            try:
+                chunk = sock.recv(65536)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buf += chunk
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                if not line.strip():
+                    continue
+                try:
+                    msg = json.loads(line.decode("utf-8", "replace"))
+                except Exception:
+                    continue
+                mtype = msg.get("type")
+                if mtype == "event":
+                    try:
+                        self.on_event(msg.get("kind", ""), msg.get("payload") or {})
+                    except Exception as e:
+                        print(f"[CoreClient] 이벤트 처리 오류: {e}")
+                elif mtype == "response":
+                    with self._pending_lock:
+                        slot = self._pending.get(msg.get("req_id"))
+                    if slot is not None:
+                        slot[1] = msg
+                        slot[0].set()
+
+    def _fail_pending(self):
+        """연결 끊김: 대기 중인 요청을 모두 실패 처리"""
+        with self._pending_lock:
+            slots = list(self._pending.values())
+        for slot in slots:
+            slot[0].set()
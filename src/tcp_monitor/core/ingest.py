@@ -0,0 +1,311 @@
+"""
+헤드리스 수집 코어 (IngestCore)
+
+TCP 서버, SQLite 로깅, 임계값/화재 판정, 경보 상태를 화면(Tk App)과 분리된 프로세스에서 실행합니다.
+- 카메라 AI 추론/렌더링 스레드와 GIL을 공유하지 않으므로 센서 수신 지연이 생기지 않음
+- 화면 프로세스가 죽거나 watchdog이 재시작해도 센서 연결이 끊기지 않음
+- 화면 없는 서버 전용 배치 가능, 여러 화면 프로세스가 동시에 접속 가능
+
+화면 프로세스는 Unix 소켓(core/channel.py)으로 접속하여
+- 이벤트 구독: data / water_alert / gas_alert / fire / alert
+- 요청: snapshot, 통계/이력 조회, 오늘 경보 조회/삭제, 실행 로그 기록, 설정 푸시
+
+사용법:
+    python ingest_core.py [--config config.conf] [--socket /run/user/1000/garame_core.sock]
+    python main.py --attach [소켓 경로]     # 화면 프로세스
+"""
+
+import argparse
+import os
+import queue
+import signal
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..config import ConfigManager
+from ..logging import LogManager
+from ..network import TcpServer
+from ..sensor.alerts import AlertManager
+from ..utils.helpers import SENSOR_KEYS
+from ..utils.metrics import configure_metrics, get_metrics
+from .channel import CoreChannelServer, default_socket_path
+
+try:
+    from ..fire import FireDetector, SensorReading, get_fire_service
+    FIRE_MODULE_AVAILABLE = True
+except ImportError:
+    FIRE_MODULE_AVAILABLE = False
+
+
+def panel_key(cfg, sid: str, peer: str) -> str:
+    """화면의 패널 키와 같은 규칙 (App._panel_key)"""
+    pol = cfg.ui.get("tab_id_policy", "by_ip")
+    ip = peer.split(":")[0] if peer else ""
+    if pol == "by_ip" and ip:
+        return f"{sid}@{ip}"
+    if pol == "by_conn" and peer:
+        return f"{sid}#{peer}"
+    return sid
+
+
+class _SensorState:
+    """센서(패널 키)별 코어 상태"""
+
+    def __init__(self, cfg, sid: str, peer: str):
+        self.sid = sid
+        self.peer = peer
+        self.version = ""
+        self.last_rx: Optional[float] = None
+        self.data: Dict[str, Any] = {}
+        self.alerts = AlertManager(cfg, enable_tts=False)  # 경보 상태 전이 추적용 (음성 없음)
+        self.alarm_keys = set()
+        self.fire_detector = FireDetector() if FIRE_MODULE_AVAILABLE else None
+        self.fire: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "sid": self.sid,
+            "peer": self.peer,
+            "version": self.version,
+            "last_rx": self.last_rx,
+            "data": dict(self.data),
+            "alarm_keys": sorted(self.alarm_keys),
+            "fire": self.fire,
+        }
+
+
+_CORE_ITEM_SECONDS = get_metrics().histogram("core_item_seconds", "코어 pump 항목 1건 처리 시간 (판정+발행)")
+
+
+class IngestCore:
+    """헤드리스 수집 코어"""
+
+    def __init__(self, cfg: ConfigManager, base_dir: str, socket_path: Optional[str] = None):
+        self.cfg = cfg
+        self.socket_path = socket_path or default_socket_path()
+
+        self.logs = LogManager(
+            base_dir=base_dir,
+            server_host=cfg.listen["host"],
+            server_port=cfg.listen["port"],
+            config=cfg
+        )
+        self.q = queue.Queue()
+        self.server = TcpServer(cfg.listen["host"], cfg.listen["port"], self.q,
+                                self._validate, logger=self.logs)
+        self.channel = CoreChannelServer(self.socket_path, self._request_handlers(), logger=self.logs)
+
+        self._states: Dict[str, _SensorState] = {}
+        self._states_lock = threading.Lock()
+        self._stop_evt = threading.Event()
+        self._pump_thread: Optional[threading.Thread] = None
+        self.fire_service = get_fire_service() if FIRE_MODULE_AVAILABLE else None
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """TCP 서버/채널/처리 스레드 시작"""
+        self.server.start()
+        self.channel.start()
+        self._pump_thread = threading.Thread(target=self._pump, name="core-pump", daemon=True)
+        self._pump_thread.start()
+        self.logs.write_run(f"ingest core started (socket={self.socket_path})")
+
+    def stop(self):
+        """종료"""
+        self._stop_evt.set()
+        self.server.stop()
+        self.channel.stop()
+        get_metrics().stop_http_server()
+        if self._pump_thread:
+            self._pump_thread.join(timeout=2.0)
+        self.logs.write_run("ingest core stopped")
+        self.logs.close()
+
+    def serve_forever(self):
+        """SIGTERM/SIGINT까지 실행"""
+        def _on_signal(signum, frame):
+            self._stop_evt.set()
+
+        signal.signal(signal.SIGTERM, _on_signal)
+        signal.signal(signal.SIGINT, _on_signal)
+        self.start()
+        try:
+            while not self._stop_evt.wait(1.0):
+                pass
+        finally:
+            self.stop()
+
+    def _validate(self, sid, pw):
+        """인증 검증 (main.py와 동일)"""
+        if not self.cfg.auth_enabled():
+            return True
+        return self.cfg.auth_map().get(sid, "") == (pw or "")
+
+    # ------------------------------------------------------------------
+    # 수신 처리
+    # ------------------------------------------------------------------
+
+    def _state(self, sid: str, peer: str) -> _SensorState:
+        key = panel_key(self.cfg, sid, peer)
+        with self._states_lock:
+            st = self._states.get(key)
+            if st is None:
+                st = self._states[key] = _SensorState(self.cfg, sid, peer)
+            st.peer = peer
+            return st
+
+    def _pump(self):
+        """TCP 수신 큐 처리 (판정 후 구독자에게 발행)"""
+        while not self._stop_evt.is_set():
+            try:
+                item = self.q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                with _CORE_ITEM_SECONDS.time():
+                    self._handle_item(item)
+            except Exception as e:
+                self.logs.write_run(f"core pump error: {e}")
+
+    def _handle_item(self, item):
+        if not (isinstance(item, tuple) and len(item) == 2):
+            return
+        tag, payload = item
+        payload = payload or {}
+        sid = payload.get("sid")
+        if not sid:
+            return
+        peer = payload.get("peer", "")
+
+        if tag == "__data__":
+            st = self._state(sid, peer)
+            st.last_rx = time.time()
+            if payload.get("version"):
+                st.version = payload["version"]
+            data = payload.get("data") or {}
+            if data:
+                st.data.update(data)
+                self._evaluate_thresholds(st, data)
+                self._evaluate_fire(st)
+            # 화재 결과를 데이터보다 먼저 발행 → 화면이 데이터를 그릴 때 최신 결과 사용
+            self.channel.publish("data", payload)
+        elif tag == "__water_alert__":
+            self.logs.write_run(f"Water alert: {payload.get('alert_type')} from {sid} - {payload.get('message', '')}")
+            self.channel.publish("water_alert", payload)
+        elif tag == "__gas_alert__":
+            self.channel.publish("gas_alert", payload)
+
+    def _evaluate_thresholds(self, st: _SensorState, data: Dict):
+        """5단계 임계값 판정 + 경보 상태 전이 기록 (패널의 주의(3) 이상 규칙과 동일)"""
+        for k, v in data.items():
+            if k not in SENSOR_KEYS or v is None:
+                continue
+            level = st.alerts.get_alert_level(k, v)
+            is_alarm = level >= 3
+            if is_alarm:
+                st.alarm_keys.add(k)
+            else:
+                st.alarm_keys.discard(k)
+            ts = time.time()
+            # 레벨이 바뀔 때만 저장됨 (enter/escalate/deescalate/clear)
+            self.logs.record_alert_level(st.sid, st.peer, k, level, v, ts)
+            if st.alerts.check_alarm_state_change(k, is_alarm):
+                self.channel.publish("alert", {
+                    "sid": st.sid, "peer": st.peer, "key": k,
+                    "level": level, "value": v, "ts": ts
+                })
+
+    def _evaluate_fire(self, st: _SensorState):
+        """화재 판정 (패널과 같은 입력: 누적 데이터, lel → ch4) + 적응형 학습"""
+        if st.fire_detector is None:
+            return
+        d = st.data
+        values = dict(temperature=d.get('temperature'), humidity=d.get('humidity'),
+                      co=d.get('co'), co2=d.get('co2'), o2=d.get('o2'),
+                      smoke=d.get('smoke'), h2s=d.get('h2s'), ch4=d.get('lel'))
+        try:
+            if self.fire_service is not None:
+                self.fire_service.process_sensor_data(sensor_id=st.sid, **values)
+            result = st.fire_detector.detect(SensorReading(sensor_id=st.sid, timestamp=datetime.now(), **values))
+        except Exception as e:
+            self.logs.write_run(f"core fire evaluation error {st.sid}: {e}")
+            return
+
+        level = result.alert_level.value if hasattr(result.alert_level, 'value') else result.alert_level
+        st.fire = {
+            "alert_level": level,
+            "fire_probability": result.fire_probability,
+            "sensor_contributions": dict(result.sensor_contributions or {}),
+        }
+        self.channel.publish("fire", {"sid": st.sid, "peer": st.peer, "result": st.fire})
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+
+    def _request_handlers(self):
+        logs = self.logs
+        return {
+            "hello": lambda: {"db_path": logs.db_path, "pid": os.getpid(),
+                              "listen": [self.cfg.listen["host"], self.cfg.listen["port"]]},
+            "snapshot": self.snapshot,
+            "connected_sensors": self.server.get_connected_sensors,
+            "push_config": self.server.push_config,
+            "write_run": logs.write_run,
+            "get_today_stats": logs.get_today_stats,
+            "get_sensor_data_for_hours": logs.get_sensor_data_for_hours,
+            "get_sensor_history_hours": self._history_hours,
+            "get_sensor_columns": self._sensor_columns,
+            "get_today_alerts_for": logs.get_today_alerts_for,
+            "get_today_alert_counts": logs.get_today_alert_counts,
+            "delete_today_alerts_for": logs.delete_today_alerts_for,
+            "learning_summary": self._learning_summary,
+        }
+
+    def snapshot(self):
+        """현재 센서 상태 전체 (화면 프로세스 접속/재접속 시 초기화용)"""
+        with self._states_lock:
+            return [st.to_dict() for st in self._states.values()]
+
+    def _history_hours(self, sid, peer, hours):
+        """get_sensor_history_hours (datetime → epoch, JSON 전송용)"""
+        rows = self.logs.get_sensor_history_hours(sid, peer, hours)
+        for row in rows:
+            row["timestamp"] = row["timestamp"].timestamp()
+        return rows
+
+    def _sensor_columns(self, sid, peer, hours, keys=None):
+        """get_sensor_columns (ndarray → list, JSON 전송용, NaN → None)"""
+        cols = self.logs.get_sensor_columns(sid, peer, hours, keys)
+        if cols is None:
+            return None
+        return {key: [None if v != v else v for v in arr.tolist()] for key, arr in cols.items()}
+
+    def _learning_summary(self):
+        if self.fire_service is None:
+            return None
+        return self.fire_service.get_learning_summary()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="GARAMe 헤드리스 수집 코어 (TCP 수신/저장/판정)")
+    ap.add_argument("--config", type=str, default="config.conf", help="설정 파일 경로")
+    ap.add_argument("--socket", type=str, default=None,
+                    help=f"화면 프로세스 접속용 Unix 소켓 (기본: {default_socket_path()})")
+    ap.add_argument("--base-dir", type=str, default=os.getcwd(), help="logs/ 상위 디렉토리")
+    args = ap.parse_args(argv)
+
+    cfg = ConfigManager(args.config)
+    configure_metrics(cfg)
+    core = IngestCore(cfg, args.base_dir, args.socket)
+    print(f"[IngestCore] TCP {cfg.listen['host']}:{cfg.listen['port']}, socket {core.socket_path}")
+    core.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
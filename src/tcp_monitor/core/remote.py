@@ -0,0 +1,78 @@
+"""
+화면 프로세스용 원격 LogManager
+
+코어 접속 모드(main.py --attach)에서 App에 LogManager 대신 전달합니다.
+App/패널이 사용하는 LogManager 메서드를 코어 요청으로 바꿉니다.
+- 저장(on_data, record_alert_level, write_alert_event)은 코어가 수신/판정 시점에 이미 수행하므로 여기서는 하지 않음
+- 조회 결과는 LogManager와 같은 형식으로 변환 (튜플, datetime)
+- 코어와 연결이 끊겨 있으면 LogManager의 오류 시 반환값(None, [])과 동일하게 반환
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+from .channel import CoreClient, CoreRequestError
+
+
+class RemoteLogManager:
+    """코어 프로세스의 LogManager를 대신하는 클라이언트"""
+
+    def __init__(self, client: CoreClient, db_path: str = ""):
+        """
+        Args:
+            client: 코어 채널 클라이언트
+            db_path: 코어의 sensor_data.db 경로 (읽기 전용 직접 조회용, hello 응답으로 갱신)
+        """
+        self.client = client
+        self.db_path = db_path
+
+    def _call(self, method, *args, default=None, timeout=10.0):
+        try:
+            return self.client.call(method, *args, timeout=timeout)
+        except CoreRequestError as e:
+            print(f"[RemoteLogManager] {e}")
+            return default
+
+    def write_run(self, text):
+        """실행 로그 작성 (코어 로그 파일에 기록)"""
+        self._call("write_run", f"[ui] {text}", timeout=2.0)
+
+    def on_data(self, sid, peer, data):
+        """코어가 수신 시 이미 저장함"""
+
+    def record_alert_level(self, sid, peer, sensor_key, level, value, ts=None):
+        """코어가 임계값 판정 시 이미 기록함"""
+
+    def write_alert_event(self, sid, peer, sensor_key, level, value, ts=None):
+        """코어가 임계값 판정 시 이미 기록함"""
+
+    def get_today_alerts_for(self, sid, peer):
+        return self._call("get_today_alerts_for", sid, peer, default=[]) or []
+
+    def get_today_alert_counts(self, sid, peer):
+        counts = self._call("get_today_alert_counts", sid, peer, default={}) or {}
+        # JSON 객체 키는 문자열
+        return {level: int(counts.get(str(level), 0)) for level in (3, 4, 5)}
+
+    def delete_today_alerts_for(self, sid, peer):
+        return bool(self._call("delete_today_alerts_for", sid, peer, default=False))
+
+    def get_today_stats(self, sid, peer, sensor_key):
+        return self._call("get_today_stats", sid, peer, sensor_key)
+
+    def get_sensor_data_for_hours(self, sid, peer, sensor_key, hours):
+        rows = self._call("get_sensor_data_for_hours", sid, peer, sensor_key, hours, default=[]) or []
+        return [tuple(r) for r in rows]
+
+    def get_sensor_history_hours(self, sid, peer, hours):
+        rows = self._call("get_sensor_history_hours", sid, peer, hours, default=[]) or []
+        for row in rows:
+            row["timestamp"] = datetime.fromtimestamp(row["timestamp"])
+        return rows
+
+    def get_sensor_columns(self, sid, peer, hours, keys=None):
+        cols = self._call("get_sensor_columns", sid, peer, hours, keys)
+        if cols is None:
+            return None
+        return {key: np.array(values, dtype=np.float64) for key, values in cols.items()}
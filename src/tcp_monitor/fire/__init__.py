@@ -81,6 +81,12 @@ from .fuzzy import (
     FuzzyMembershipConfig
 )
 
+from .vectorized import (
+    VectorizedFireFusion,
+    FusionBatch,
+    EVIDENCE_KEYS
+)
+
 from .detector import (
     FireDetector,
     MultiSensorFireDetector,
@@ -97,6 +103,13 @@ from .adaptive import (
     AdaptiveFireSystem
 )
 
+from .replay import (
+    ReplayOptions,
+    ReplayReport,
+    Incident,
+    run_replay
+)
+
 from .fire_service import (
     FireDetectionService,
     FireServiceConfig,
@@ -133,6 +146,11 @@ __all__ = [
     'FuzzyMembershipFunctions',
     'FuzzyMembershipConfig',
 
+    # Vectorized fusion
+    'VectorizedFireFusion',
+    'FusionBatch',
+    'EVIDENCE_KEYS',
+
     # Detector
     'FireDetector',
     'MultiSensorFireDetector',
@@ -147,6 +165,12 @@ __all__ = [
     'ThresholdManager',
     'AdaptiveFireSystem',
 
+    # Replay / Backtest
+    'ReplayOptions',
+    'ReplayReport',
+    'Incident',
+    'run_replay',
+
     # Service
     'FireDetectionService',
     'FireServiceConfig',
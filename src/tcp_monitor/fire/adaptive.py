@@ -661,8 +661,16 @@ class AdaptiveFireSystem:
         self,
         config: Optional[AIAdaptationConfig] = None,
         db_path: str = "data/fire_adaptive.db",
-        learning_state_path: str = "data/fire_learning_state.json"
+        learning_state_path: Optional[str] = "data/fire_learning_state.json",
+        save_interval: Optional[int] = 100
     ):
+        """
+        Args:
+            config: AI 적응 설정
+            db_path: 임계값 이력 DB 경로
+            learning_state_path: 학습 상태 파일 (None이면 로드/저장 안 함 - 재생/백테스트용)
+            save_interval: 학습 상태 저장 주기 (샘플 수, None이면 자동 저장 안 함)
+        """
         self.config = config or AIAdaptationConfig()
         self.db_path = db_path
         self.learning_state_path = learning_state_path
@@ -681,19 +689,20 @@ class AdaptiveFireSystem:
         self.last_update_time: Optional[datetime] = None
         self.total_samples = 0
         self._last_save_samples = 0  # 마지막 저장 시 샘플 수
-        self._save_interval = 100  # 100 샘플마다 저장
+        self._save_interval = save_interval  # 기본 100 샘플마다 저장
 
         self._lock = threading.Lock()
 
         # 이전 학습 상태 로드
-        self.load_learning_state(self.learning_state_path)
+        if self.learning_state_path:
+            self.load_learning_state(self.learning_state_path)
 
-    def _get_learning_phase(self) -> LearningPhase:
-        """현재 학습 단계 결정"""
+    def _get_learning_phase(self, now: Optional[datetime] = None) -> LearningPhase:
+        """현재 학습 단계 결정 (now: 기준 시각, 재생 시 측정 시각 주입)"""
         if self.first_data_time is None:
             return LearningPhase.COLD_START
 
-        elapsed = datetime.now() - self.first_data_time
+        elapsed = (now or datetime.now()) - self.first_data_time
         days = elapsed.days
 
         if days < 1:
@@ -739,8 +748,8 @@ class AdaptiveFireSystem:
         if self.first_data_time is None:
             self.first_data_time = reading.timestamp
 
-        # 학습 단계 업데이트
-        self.learning_phase = self._get_learning_phase()
+        # 학습 단계 업데이트 (측정 시각 기준)
+        self.learning_phase = self._get_learning_phase(reading.timestamp)
 
         # 화재 이벤트는 학습에서 제외
         if self.anomaly_filter.is_fire_event(fire_probability):
@@ -778,7 +787,8 @@ class AdaptiveFireSystem:
         self.total_samples += 1
 
         # 주기적으로 학습 상태 저장 (100샘플마다)
-        if self.total_samples - self._last_save_samples >= self._save_interval:
+        if (self.learning_state_path and self._save_interval and
+                self.total_samples - self._last_save_samples >= self._save_interval):
             self.save_learning_state(self.learning_state_path)
             self._last_save_samples = self.total_samples
 
@@ -27,6 +27,7 @@ from .dempster_shafer import (
     ImprovedDempsterShafer
 )
 from .fuzzy import FuzzyMembershipFunctions, FuzzyMembershipConfig
+from .vectorized import VectorizedFireFusion
 
 
 logger = logging.getLogger(__name__)
@@ -372,17 +373,7 @@ class FireDetector:
         mass_functions = self._get_sensor_mass_functions(reading)
 
         if not mass_functions:
-            # 센서 데이터 없음
-            return FireDetectionResult(
-                sensor_id=reading.sensor_id,
-                timestamp=reading.timestamp,
-                fire_probability=0.0,
-                alert_level=FireAlertLevel.NORMAL,
-                belief_fire=0.0,
-                belief_normal=0.9,
-                uncertainty=0.1,
-                message="센서 데이터 없음"
-            )
+            return self._no_data_result(reading)
 
         # 2. Dempster-Shafer 융합
         mfs_with_weights = [(mf, w) for mf, w, _ in mass_functions]
@@ -404,6 +395,41 @@ class FireDetector:
         # 4. 기본 화재 확률 (Pignistic)
         fire_probability = self.ds_combiner.get_pignistic_probability(combined)
 
+        return self._build_result(
+            reading,
+            fire_probability,
+            (combined.fire, combined.normal, combined.uncertain),
+            sensor_contributions
+        )
+
+    def _no_data_result(self, reading: SensorReading) -> FireDetectionResult:
+        """센서 데이터가 없을 때의 결과"""
+        return FireDetectionResult(
+            sensor_id=reading.sensor_id,
+            timestamp=reading.timestamp,
+            fire_probability=0.0,
+            alert_level=FireAlertLevel.NORMAL,
+            belief_fire=0.0,
+            belief_normal=0.9,
+            uncertainty=0.1,
+            message="센서 데이터 없음"
+        )
+
+    def _build_result(
+        self,
+        reading: SensorReading,
+        fire_probability: float,
+        belief: Tuple[float, float, float],
+        sensor_contributions: Dict[str, float]
+    ) -> FireDetectionResult:
+        """
+        융합 결과 → 조합 규칙/경보 단계/오경보 필터를 적용한 최종 결과
+
+        Args:
+            fire_probability: Pignistic 화재 확률
+            belief: 조합된 (fire, normal, uncertain)
+            sensor_contributions: 센서별 기여도
+        """
         # 5. 센서 조합 규칙 적용
         temp_rate = self._calculate_temp_rate(
             reading.sensor_id,
@@ -443,9 +469,9 @@ class FireDetector:
             timestamp=reading.timestamp,
             fire_probability=round(fire_probability, 4),
             alert_level=alert_level,
-            belief_fire=round(combined.fire, 4),
-            belief_normal=round(combined.normal, 4),
-            uncertainty=round(combined.uncertain, 4),
+            belief_fire=round(belief[0], 4),
+            belief_normal=round(belief[1], 4),
+            uncertainty=round(belief[2], 4),
             sensor_contributions=sensor_contributions,
             triggered_rules=triggered_rules,
             message=message,
@@ -526,18 +552,29 @@ class MultiSensorFireDetector:
     다중 센서 화재 감지기
 
     여러 센서의 데이터를 관리하고 전체 시스템의 화재 상태를 판단합니다.
+    vectorized=True이면 퍼지 멤버십/D-S 조합/시간 평활화를 VectorizedFireFusion으로
+    모든 센서에 대해 한 번에 계산합니다 (결과는 스칼라 경로와 동일).
     """
 
     def __init__(
         self,
         thresholds: Optional[Dict[str, float]] = None,
-        sensor_weights: Optional[Dict[str, float]] = None
+        sensor_weights: Optional[Dict[str, float]] = None,
+        vectorized: bool = False
     ):
         self.detectors: Dict[str, FireDetector] = {}
         self.thresholds = thresholds or STANDARD_THRESHOLDS.copy()
         self.sensor_weights = sensor_weights or SENSOR_WEIGHTS.copy()
         self._lock = threading.Lock()
 
+        # 벡터화 융합 엔진 (센서별 시간 평활화 상태를 엔진이 관리)
+        self.fusion: Optional[VectorizedFireFusion] = None
+        if vectorized:
+            self.fusion = VectorizedFireFusion(
+                thresholds=self.thresholds,
+                sensor_weights=self.sensor_weights
+            )
+
     def _get_detector(self, sensor_id: str) -> FireDetector:
         """센서별 감지기 가져오기 (없으면 생성)"""
         with self._lock:
@@ -550,9 +587,51 @@ class MultiSensorFireDetector:
 
     def detect(self, reading: SensorReading) -> FireDetectionResult:
         """개별 센서 감지"""
+        if self.fusion is not None:
+            return self._detect_vectorized([reading])[0]
         detector = self._get_detector(reading.sensor_id)
         return detector.detect(reading)
 
+    def _detect_vectorized(self, readings: List[SensorReading]) -> List[FireDetectionResult]:
+        """
+        벡터화 엔진으로 여러 센서 동시 감지
+
+        같은 sensor_id가 여러 번 있으면 순서대로 별도 틱으로 나누어 처리합니다.
+        온도 이력/조합 규칙/오경보 필터는 센서별 FireDetector를 그대로 사용합니다.
+        """
+        results: List[FireDetectionResult] = []
+        start = 0
+        while start < len(readings):
+            # 중복 sensor_id가 나오기 전까지를 한 틱으로
+            seen = set()
+            end = start
+            while end < len(readings) and readings[end].sensor_id not in seen:
+                seen.add(readings[end].sensor_id)
+                end += 1
+            tick = readings[start:end]
+            start = end
+
+            detectors = [self._get_detector(r.sensor_id) for r in tick]
+            temp_rates = [
+                d._calculate_temp_rate(r.sensor_id, r.temperature, r.timestamp)
+                for d, r in zip(detectors, tick)
+            ]
+            values = self.fusion.values_from_readings(tick, temp_rates)
+            batch = self.fusion.fuse([r.sensor_id for r in tick], values)
+
+            for i, (detector, reading) in enumerate(zip(detectors, tick)):
+                if not batch.has_data[i]:
+                    results.append(detector._no_data_result(reading))
+                    continue
+                f, n, u = (float(x) for x in batch.combined[i])
+                results.append(detector._build_result(
+                    reading,
+                    float(batch.fire_probability[i]),
+                    (f, n, u),
+                    self.fusion.contributions(batch, i)
+                ))
+        return results
+
     def detect_all(
         self,
         readings: List[SensorReading]
@@ -563,13 +642,13 @@ class MultiSensorFireDetector:
         Returns:
             (개별 결과 리스트, 전체 최대 경보 수준)
         """
-        results = []
-        max_level = FireAlertLevel.NORMAL
-
-        for reading in readings:
-            result = self.detect(reading)
-            results.append(result)
+        if self.fusion is not None:
+            results = self._detect_vectorized(list(readings))
+        else:
+            results = [self.detect(reading) for reading in readings]
 
+        max_level = FireAlertLevel.NORMAL
+        for result in results:
             if result.alert_level.value > max_level.value:
                 max_level = result.alert_level
 
@@ -578,6 +657,8 @@ class MultiSensorFireDetector:
     def update_thresholds(self, new_thresholds: Dict[str, float]):
         """모든 감지기의 임계값 업데이트"""
         self.thresholds.update(new_thresholds)
+        if self.fusion is not None:
+            self.fusion.update_thresholds(new_thresholds)
 
         with self._lock:
             for detector in self.detectors.values():
@@ -600,3 +681,6 @@ class MultiSensorFireDetector:
             else:
                 for detector in self.detectors.values():
                     detector.reset()
+
+        if self.fusion is not None:
+            self.fusion.reset(sensor_id)
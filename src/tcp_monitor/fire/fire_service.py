@@ -35,6 +35,11 @@ class FireServiceConfig:
     adaptive_learning: bool = True
     alert_threshold: int = 3  # 이 레벨 이상에서 경보 다이얼로그 표시
     update_interval_ms: int = 1000  # UI 업데이트 간격 (ms)
+    # 다중 센서 감지기의 벡터화 융합 엔진 사용 여부.
+    # 센서 데이터는 수신할 때마다 1건씩 감지하므로 틱당 노드가 1개이고, 이때는 스칼라 경로가
+    # 더 빠릅니다 (노드 1개: 약 0.07ms vs 0.7ms, 8개 이상부터 벡터화가 유리 - test_fire_fusion_vectorized.py).
+    # 여러 센서를 detect_all로 한 번에 처리하는 구성에서만 켜십시오.
+    vectorized_fusion: bool = False
 
 
 class FireDetectionService:
@@ -72,7 +77,7 @@ class FireDetectionService:
         """감지기 초기화"""
         try:
             self._detector = FireDetector()
-            self._multi_detector = MultiSensorFireDetector()
+            self._multi_detector = MultiSensorFireDetector(vectorized=self.config.vectorized_fusion)
 
             if self.config.adaptive_learning:
                 self._adaptive_system = AdaptiveFireSystem()
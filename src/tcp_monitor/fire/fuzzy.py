@@ -14,6 +14,92 @@ from .dempster_shafer import MassFunction
 from .models import STANDARD_THRESHOLDS
 
 
+# 센서별 멤버십 정의 (스칼라 경로와 VectorizedFireFusion이 함께 사용):
+#   (방향, 정상 상한, 임계값 기본값(watch, caution, warning, danger), 구간 계수 6개)
+#   방향 -1은 역방향 센서 (O2, 습도: 낮을수록 위험)
+#   구간: 정상 상한 이하 / watch / caution / warning / danger 이하 / 그 이상
+#   구간 계수 (fire_lo, fire_span, normal, normal_minus_fire, uncertain, uncertain_minus_fire):
+#     fire = fire_lo + ratio * fire_span  (ratio: 구간 안에서의 위치 0~1, 처음/마지막 구간은 0)
+#     normal = normal - normal_minus_fire * fire
+#     uncertain = uncertain - uncertain_minus_fire * fire
+LEVEL_SUFFIXES = ('watch', 'caution', 'warning', 'danger')
+_NORMAL_SEGMENT = (0.0, 0.0, 0.9, 0.0, 0.1, 0.0)
+MEMBERSHIP_SPECS = {
+    'smoke': (1, 0.0, (10.0, 25.0, 50.0, 75.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.1, 0.8, 1.0, 0.2, 0.0),
+        (0.1, 0.2, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.6, 0.25, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'co': (1, 9.0, (30.0, 50.0, 100.0, 200.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.15, 0.7, 0.0, 0.3, 1.0),
+        (0.15, 0.25, 0.5, 0.0, 0.5, 1.0),
+        (0.4, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.7, 0.2, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'temperature': (1, 28.0, (35.0, 45.0, 55.0, 65.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.1, 0.7, 0.0, 0.3, 1.0),
+        (0.1, 0.2, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.6, 0.25, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'temp_rate': (1, 1.0, (2.0, 5.0, 8.0, 12.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.15, 0.7, 0.0, 0.3, 1.0),
+        (0.15, 0.25, 0.4, 0.0, 0.6, 1.0),
+        (0.4, 0.3, 0.2, 0.0, 0.8, 1.0),
+        (0.7, 0.2, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'o2': (-1, 20.5, (19.5, 18.5, 17.5, 16.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.1, 0.7, 0.0, 0.3, 1.0),
+        (0.1, 0.2, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.6, 0.25, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'co2': (1, 1000.0, (1500.0, 2500.0, 5000.0, 10000.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.05, 0.75, 0.0, 0.25, 1.0),
+        (0.05, 0.15, 0.55, 0.0, 0.45, 1.0),
+        (0.2, 0.3, 0.35, 0.0, 0.65, 1.0),
+        (0.5, 0.3, 0.15, 0.0, 0.85, 1.0),
+        (0.9, 0.0, 0.0, 0.0, 0.1, 0.0),
+    )),
+    'ch4': (1, 5.0, (10.0, 20.0, 35.0, 50.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.1, 0.7, 0.0, 0.3, 1.0),
+        (0.1, 0.2, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.6, 0.25, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'h2s': (1, 5.0, (10.0, 20.0, 50.0, 100.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.1, 0.7, 0.0, 0.3, 1.0),
+        (0.1, 0.2, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.3, 0.3, 0.0, 0.7, 1.0),
+        (0.6, 0.3, 0.1, 0.0, 0.9, 1.0),
+        (0.95, 0.0, 0.0, 0.0, 0.05, 0.0),
+    )),
+    'humidity': (-1, 40.0, (35.0, 25.0, 20.0, 15.0), (
+        _NORMAL_SEGMENT,
+        (0.0, 0.05, 0.8, 0.0, 0.2, 1.0),
+        (0.05, 0.1, 0.65, 0.0, 0.35, 1.0),
+        (0.15, 0.15, 0.5, 0.0, 0.5, 1.0),
+        (0.3, 0.2, 0.35, 0.0, 0.65, 1.0),
+        (0.6, 0.0, 0.2, 0.0, 0.2, 0.0),
+    )),
+}
+
+
 @dataclass
 class FuzzyMembershipConfig:
     """퍼지 멤버십 함수 설정"""
@@ -95,6 +181,44 @@ class FuzzyMembershipFunctions:
         else:
             return (value - low) / (high - low)
 
+    def _segment_membership(self, name: str, value: float) -> MassFunction:
+        """
+        MEMBERSHIP_SPECS 구간 테이블로 BPA 계산
+
+        Args:
+            name: 센서 이름 (MEMBERSHIP_SPECS 키)
+            value: 측정값
+
+        Returns:
+            Mass Function
+        """
+        if value is None:
+            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
+
+        sign, normal_limit, defaults, segments = MEMBERSHIP_SPECS[name]
+        levels = [self.thresholds.get(f'{name}_{suffix}', default)
+                  for suffix, default in zip(LEVEL_SUFFIXES, defaults)]
+        # 역방향 센서는 값과 경계의 부호를 뒤집어 '값 <= 경계' 비교로 통일
+        bounds = [sign * b for b in [normal_limit] + levels]
+        x = sign * value
+
+        seg = 5
+        for i, bound in enumerate(bounds):
+            if x <= bound:
+                seg = i
+                break
+
+        fire_lo, fire_span, normal, normal_minus_fire, uncertain, uncertain_minus_fire = segments[seg]
+        fire = fire_lo
+        if 1 <= seg <= 4:
+            ratio = (x - bounds[seg - 1]) / (bounds[seg] - bounds[seg - 1])
+            fire = fire_lo + ratio * fire_span
+        return MassFunction(
+            fire=fire,
+            normal=normal - normal_minus_fire * fire,
+            uncertain=uncertain - uncertain_minus_fire * fire
+        )
+
     def smoke_membership(self, value: float) -> MassFunction:
         """
         연기 센서 BPA 계산
@@ -108,38 +232,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function (fire, normal, uncertain)
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('smoke_watch', 10.0)
-        caution = self.thresholds.get('smoke_caution', 25.0)
-        warning = self.thresholds.get('smoke_warning', 50.0)
-        danger = self.thresholds.get('smoke_danger', 75.0)
-
-        if value <= 0:
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            # 약간의 연기 - 대부분 정상
-            fire = value / watch * 0.1
-            return MassFunction(fire=fire, normal=0.8 - fire, uncertain=0.2)
-        elif value <= caution:
-            # 관심 구간
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.1 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value <= warning:
-            # 주의 구간
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.3 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value <= danger:
-            # 경계 구간
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.6 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 구간
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('smoke', value)
 
     def co_membership(self, value: float) -> MassFunction:
         """
@@ -154,40 +247,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('co_watch', 30.0)
-        caution = self.thresholds.get('co_caution', 50.0)
-        warning = self.thresholds.get('co_warning', 100.0)
-        danger = self.thresholds.get('co_danger', 200.0)
-
-        if value <= 9:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            # 약간 상승
-            ratio = (value - 9) / (watch - 9)
-            fire = ratio * 0.15
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif value <= caution:
-            # 관심 구간
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.15 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value <= warning:
-            # 주의 구간
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.4 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value <= danger:
-            # 경계 구간
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.7 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 구간
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('co', value)
 
     def temperature_membership(self, value: float) -> MassFunction:
         """
@@ -202,40 +262,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('temperature_watch', 35.0)
-        caution = self.thresholds.get('temperature_caution', 45.0)
-        warning = self.thresholds.get('temperature_warning', 55.0)
-        danger = self.thresholds.get('temperature_danger', 65.0)
-
-        if value <= 28:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            # 약간 높음 (더운 날씨일 수 있음)
-            ratio = (value - 28) / (watch - 28)
-            fire = ratio * 0.1
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif value <= caution:
-            # 관심 구간
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.1 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value <= warning:
-            # 주의 구간
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.3 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value <= danger:
-            # 경계 구간
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.6 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 구간
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('temperature', value)
 
     def temp_rate_membership(self, rate: float) -> MassFunction:
         """
@@ -250,40 +277,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if rate is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('temp_rate_watch', 2.0)
-        caution = self.thresholds.get('temp_rate_caution', 5.0)
-        warning = self.thresholds.get('temp_rate_warning', 8.0)
-        danger = self.thresholds.get('temp_rate_danger', 12.0)
-
-        if rate <= 1:
-            # 정상 변화율
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif rate <= watch:
-            # 약간 빠른 상승
-            ratio = (rate - 1) / (watch - 1)
-            fire = ratio * 0.15
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif rate <= caution:
-            # 관심 구간 - 빠른 상승
-            ratio = (rate - watch) / (caution - watch)
-            fire = 0.15 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.4, uncertain=0.6 - fire)
-        elif rate <= warning:
-            # 주의 구간 - 매우 빠른 상승
-            ratio = (rate - caution) / (warning - caution)
-            fire = 0.4 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.2, uncertain=0.8 - fire)
-        elif rate <= danger:
-            # 경계 구간
-            ratio = (rate - warning) / (danger - warning)
-            fire = 0.7 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 - 급격한 온도 상승
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('temp_rate', rate)
 
     def o2_membership(self, value: float) -> MassFunction:
         """
@@ -298,41 +292,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('o2_watch', 19.5)
-        caution = self.thresholds.get('o2_caution', 18.5)
-        warning = self.thresholds.get('o2_warning', 17.5)
-        danger = self.thresholds.get('o2_danger', 16.0)
-
-        # O2는 역방향 (낮을수록 위험)
-        if value >= 20.5:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value >= watch:
-            # 약간 낮음
-            ratio = (20.5 - value) / (20.5 - watch)
-            fire = ratio * 0.1
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif value >= caution:
-            # 관심 구간
-            ratio = (watch - value) / (watch - caution)
-            fire = 0.1 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value >= warning:
-            # 주의 구간
-            ratio = (caution - value) / (caution - warning)
-            fire = 0.3 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value >= danger:
-            # 경계 구간
-            ratio = (warning - value) / (warning - danger)
-            fire = 0.6 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 구간 - 심각한 산소 부족
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('o2', value)
 
     def co2_membership(self, value: float) -> MassFunction:
         """
@@ -348,40 +308,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('co2_watch', 1500.0)
-        caution = self.thresholds.get('co2_caution', 2500.0)
-        warning = self.thresholds.get('co2_warning', 5000.0)
-        danger = self.thresholds.get('co2_danger', 10000.0)
-
-        if value <= 1000:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            # 약간 높음 (환기 부족 가능)
-            ratio = (value - 1000) / (watch - 1000)
-            fire = ratio * 0.05
-            return MassFunction(fire=fire, normal=0.75, uncertain=0.25 - fire)
-        elif value <= caution:
-            # 관심 구간
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.05 + ratio * 0.15
-            return MassFunction(fire=fire, normal=0.55, uncertain=0.45 - fire)
-        elif value <= warning:
-            # 주의 구간
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.2 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.35, uncertain=0.65 - fire)
-        elif value <= danger:
-            # 경계 구간
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.5 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.15, uncertain=0.85 - fire)
-        else:
-            # 위험 구간
-            return MassFunction(fire=0.9, normal=0.0, uncertain=0.1)
+        return self._segment_membership('co2', value)
 
     def ch4_membership(self, value: float) -> MassFunction:
         """
@@ -396,40 +323,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('ch4_watch', 10.0)
-        caution = self.thresholds.get('ch4_caution', 20.0)
-        warning = self.thresholds.get('ch4_warning', 35.0)
-        danger = self.thresholds.get('ch4_danger', 50.0)
-
-        if value <= 5:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            # 약간 검출
-            ratio = (value - 5) / (watch - 5)
-            fire = ratio * 0.1
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif value <= caution:
-            # 관심 구간
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.1 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value <= warning:
-            # 주의 구간
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.3 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value <= danger:
-            # 경계 구간
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.6 + ratio * 0.25
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            # 위험 구간 - 폭발 위험
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('ch4', value)
 
     def h2s_membership(self, value: float) -> MassFunction:
         """
@@ -444,35 +338,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('h2s_watch', 10.0)
-        caution = self.thresholds.get('h2s_caution', 20.0)
-        warning = self.thresholds.get('h2s_warning', 50.0)
-        danger = self.thresholds.get('h2s_danger', 100.0)
-
-        if value <= 5:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value <= watch:
-            ratio = (value - 5) / (watch - 5)
-            fire = ratio * 0.1
-            return MassFunction(fire=fire, normal=0.7, uncertain=0.3 - fire)
-        elif value <= caution:
-            ratio = (value - watch) / (caution - watch)
-            fire = 0.1 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value <= warning:
-            ratio = (value - caution) / (warning - caution)
-            fire = 0.3 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.3, uncertain=0.7 - fire)
-        elif value <= danger:
-            ratio = (value - warning) / (danger - warning)
-            fire = 0.6 + ratio * 0.3
-            return MassFunction(fire=fire, normal=0.1, uncertain=0.9 - fire)
-        else:
-            return MassFunction(fire=0.95, normal=0.0, uncertain=0.05)
+        return self._segment_membership('h2s', value)
 
     def humidity_membership(self, value: float) -> MassFunction:
         """
@@ -487,38 +353,7 @@ class FuzzyMembershipFunctions:
         Returns:
             Mass Function
         """
-        if value is None:
-            return MassFunction(fire=0.0, normal=0.0, uncertain=1.0)
-
-        watch = self.thresholds.get('humidity_watch', 35.0)
-        caution = self.thresholds.get('humidity_caution', 25.0)
-        warning = self.thresholds.get('humidity_warning', 20.0)
-        danger = self.thresholds.get('humidity_danger', 15.0)
-
-        # 습도는 역방향 (낮을수록 의심)
-        if value >= 40:
-            # 정상 범위
-            return MassFunction(fire=0.0, normal=0.9, uncertain=0.1)
-        elif value >= watch:
-            # 약간 낮음
-            ratio = (40 - value) / (40 - watch)
-            fire = ratio * 0.05
-            return MassFunction(fire=fire, normal=0.8, uncertain=0.2 - fire)
-        elif value >= caution:
-            ratio = (watch - value) / (watch - caution)
-            fire = 0.05 + ratio * 0.1
-            return MassFunction(fire=fire, normal=0.65, uncertain=0.35 - fire)
-        elif value >= warning:
-            ratio = (caution - value) / (caution - warning)
-            fire = 0.15 + ratio * 0.15
-            return MassFunction(fire=fire, normal=0.5, uncertain=0.5 - fire)
-        elif value >= danger:
-            ratio = (warning - value) / (warning - danger)
-            fire = 0.3 + ratio * 0.2
-            return MassFunction(fire=fire, normal=0.35, uncertain=0.65 - fire)
-        else:
-            # 매우 낮은 습도
-            return MassFunction(fire=0.6, normal=0.2, uncertain=0.2)
+        return self._segment_membership('humidity', value)
 
     def get_membership_function(self, sensor_type: str) -> Callable[[float], MassFunction]:
         """
@@ -0,0 +1,585 @@
+"""
+화재 감지 이력 재생/백테스트 (Replay Harness)
+GARAMe Manager v2.0
+
+LogManager가 저장한 센서 이력(SQLite sensor_data + 보관 청크 또는 logs/data/data_YYYYMMDD.log[.gz])을
+MultiSensorFireDetector / AdaptiveFireSystem / AlertManager에 최대 속도로 흘려보내
+"새 임계값/가중치였다면 지난달에 몇 번 경보가 났을까?"에 답합니다.
+
+- 실시간 대기(sleep) 없음: 측정 시각(timestamp)을 그대로 SensorReading에 주입하므로
+  SensorHistory.get_rate(온도 상승률)와 AI 학습 단계가 기록 당시 시간축으로 동작
+- 센서(sid, peer_ip) 단위로 분할하여 프로세스 풀에서 병렬 처리
+- 결과: 경보 단계별 측정 수, 경보 구간(episode), 실제 화재 구간(incidents) 기준
+  감지 소요 시간(time-to-detect)과 오경보 수, 처리량(rows/s)
+
+사용 예시:
+    python fire_replay.py --db logs/sensor_data.db --from 2025-01-01 --to 2025-02-01
+    python fire_replay.py --logs logs/data --thresholds new_thresholds.json --workers 8
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..logging.archive import archived_counts, iter_range_blocks
+from .models import FireAlertLevel, SensorReading, AIAdaptationConfig
+
+
+# sensor_data 컬럼 순서 (LogManager._save_to_database와 동일)
+DATA_COLUMNS = ('co2', 'h2s', 'co', 'o2', 'temperature', 'humidity', 'lel', 'smoke', 'water')
+
+LEVELS = (1, 2, 3, 4, 5)
+
+
+@dataclass
+class Incident:
+    """실제 화재(또는 화재 시험) 구간 - 감지 소요 시간/오경보 판정 기준"""
+    sid: str
+    start: float                  # epoch 초
+    end: float                    # epoch 초
+    peer_ip: Optional[str] = None  # None이면 모든 peer의 같은 sid
+
+    def matches(self, sid: str, peer_ip: str) -> bool:
+        return self.sid == sid and (self.peer_ip is None or self.peer_ip == peer_ip)
+
+
+@dataclass
+class ReplayOptions:
+    """재생 설정 (프로세스 풀로 전달되므로 직렬화 가능한 값만 사용)"""
+    fire_thresholds: Optional[Dict[str, float]] = None  # None이면 STANDARD_THRESHOLDS
+    sensor_weights: Optional[Dict[str, float]] = None   # None이면 SENSOR_WEIGHTS
+    config_path: Optional[str] = None   # AlertManager용 config.conf (None이면 기본값)
+    alarm_level: int = 3                # 이 단계 이상을 '경보'로 집계 (3: 주의)
+    clear_seconds: float = 60.0         # 경보 해제 후 이 시간 안에 재발하면 같은 구간
+    adaptive: bool = True               # AdaptiveFireSystem 학습 포함
+    adapt_interval_hours: float = 0.0   # > 0이면 이 주기로 적응 임계값을 감지기에 반영
+    vectorized: bool = False            # 벡터화 융합 엔진 (센서 1개씩 재생하므로 기본은 더 빠른 스칼라 경로)
+    start: Optional[float] = None       # 재생 구간 (epoch 초)
+    end: Optional[float] = None
+
+
+@dataclass
+class SensorReplayStats:
+    """센서 하나의 재생 결과"""
+    sid: str
+    peer_ip: str
+    rows: int = 0
+    first_ts: Optional[float] = None
+    last_ts: Optional[float] = None
+    fire_levels: Dict[int, int] = field(default_factory=lambda: {lv: 0 for lv in LEVELS})
+    alert_levels: Dict[int, int] = field(default_factory=lambda: {lv: 0 for lv in LEVELS})
+    # 경보 구간: [시작, 마지막 경보 시각, 최고 단계, 최고 확률 또는 값, 원인]
+    fire_episodes: List[list] = field(default_factory=list)
+    alert_episodes: List[list] = field(default_factory=list)
+    threshold_updates: int = 0
+    elapsed: float = 0.0
+
+
+class _EpisodeTracker:
+    """경보 단계 시계열 → 경보 구간 목록 (clear_seconds 이내 재발은 같은 구간)"""
+
+    def __init__(self, alarm_level: int, clear_seconds: float, out: List[list]):
+        self.alarm_level = alarm_level
+        self.clear_seconds = clear_seconds
+        self.out = out
+        self._current = None
+
+    def update(self, ts: float, level: int, peak_value: float, cause: str):
+        if level < self.alarm_level:
+            return
+        cur = self._current
+        if cur is not None and ts - cur[1] <= self.clear_seconds:
+            cur[1] = ts
+            if level > cur[2] or (level == cur[2] and peak_value > cur[3]):
+                cur[2], cur[3], cur[4] = level, peak_value, cause
+            return
+        self._current = [ts, ts, level, peak_value, cause]
+        self.out.append(self._current)
+
+
+# ============================================================
+# 데이터 소스
+# ============================================================
+
+def list_db_sensors(db_path: str, start: Optional[float] = None,
+                    end: Optional[float] = None) -> List[Tuple[str, str, int]]:
+    """SQLite sensor_data + 보관 청크의 센서 목록 [(sid, peer_ip, 행 수), ...] (행 수 많은 순)"""
+    where, params = _time_filter(start, end)
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+        rows = conn.execute(
+            f"SELECT sid, peer_ip, COUNT(*) FROM sensor_data {where} "
+            f"GROUP BY sid, peer_ip",
+            params
+        ).fetchall()
+        counts = archived_counts(conn, start, end)
+    for sid, peer_ip, count in rows:
+        counts[(sid, peer_ip)] = counts.get((sid, peer_ip), 0) + count
+    return sorted(((sid, peer_ip, count) for (sid, peer_ip), count in counts.items()),
+                  key=lambda r: -r[2])
+
+
+def _time_filter(start, end, prefix="WHERE"):
+    clauses, params = [], []
+    if start is not None:
+        clauses.append("timestamp >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("timestamp < ?")
+        params.append(end)
+    if not clauses:
+        return "", params
+    return f"{prefix} " + " AND ".join(clauses), params
+
+
+def iter_db_rows(db_path: str, sid: str, peer_ip: str, start: Optional[float] = None,
+                 end: Optional[float] = None) -> Iterator[Tuple[float, Dict]]:
+    """센서 하나의 측정값을 시간순으로 [(timestamp, data), ...] (읽기 전용 연결, 보관 청크 포함, 하루씩 읽음)"""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        for ts, vals in iter_range_blocks(conn, sid, peer_ip, start, end, DATA_COLUMNS):
+            columns = vals.tolist()
+            for i, t in enumerate(ts.tolist()):
+                # NaN(값 없음)은 빼서 기존 NULL 제외와 같게
+                yield t, {k: col[i] for k, col in zip(DATA_COLUMNS, columns) if col[i] == col[i]}
+    finally:
+        conn.close()
+
+
+def iter_text_log_rows(paths: Iterable[str]) -> Iterator[Tuple[str, str, float, Dict]]:
+    """
+    텍스트 데이터 로그 파싱 → (sid, peer_ip, timestamp, data)
+
+    형식: "YYYY-mm-dd HH:MM:SS | host:port | peer | sid | {json}" (LogManager.on_data)
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, f) for f in sorted(os.listdir(path))
+                         if f.startswith("data_") and f.endswith((".log", ".log.gz")))
+        elif os.path.isfile(path):
+            files.append(path)
+
+    for file_path in files:
+        opener = gzip.open if file_path.endswith(".gz") else open
+        with opener(file_path, "rt", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                parts = line.rstrip("\n").split(" | ", 4)
+                if len(parts) != 5:
+                    continue
+                ts_str, _, peer, sid, payload = parts
+                try:
+                    ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S").timestamp()
+                    data = json.loads(payload)
+                except (ValueError, json.JSONDecodeError):
+                    continue
+                if isinstance(data, dict):
+                    yield sid, peer.split(":")[0] if peer else "", ts, data
+
+
+def load_text_logs(paths: Iterable[str], start: Optional[float] = None,
+                   end: Optional[float] = None) -> Dict[Tuple[str, str], List[Tuple[float, Dict]]]:
+    """텍스트 로그를 센서별로 묶어 시간순 정렬"""
+    grouped: Dict[Tuple[str, str], List[Tuple[float, Dict]]] = {}
+    for sid, peer_ip, ts, data in iter_text_log_rows(paths):
+        if (start is not None and ts < start) or (end is not None and ts >= end):
+            continue
+        grouped.setdefault((sid, peer_ip), []).append((ts, data))
+    for rows in grouped.values():
+        rows.sort(key=lambda r: r[0])
+    return grouped
+
+
+# ============================================================
+# 재생 (워커 프로세스)
+# ============================================================
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _reading_from_data(sensor_id: str, ts: float, data: Dict) -> SensorReading:
+    """LogManager 데이터 → SensorReading (패널과 동일하게 lel → ch4)"""
+    return SensorReading(
+        sensor_id=sensor_id,
+        timestamp=datetime.fromtimestamp(ts),
+        temperature=_to_float(data.get('temperature')),
+        humidity=_to_float(data.get('humidity')),
+        co=_to_float(data.get('co')),
+        co2=_to_float(data.get('co2')),
+        o2=_to_float(data.get('o2')),
+        smoke=_to_float(data.get('smoke')),
+        h2s=_to_float(data.get('h2s')),
+        ch4=_to_float(data.get('lel', data.get('ch4')))
+    )
+
+
+def replay_sensor(sid: str, peer_ip: str, rows: Iterable[Tuple[float, Dict]],
+                  options: ReplayOptions) -> SensorReplayStats:
+    """
+    센서 하나의 이력을 파이프라인에 통과시킴 (같은 프로세스에서 직접 호출 가능)
+
+    AdaptiveFireSystem 학습은 센서(분할) 단위로 독립적입니다.
+    """
+    from .detector import MultiSensorFireDetector
+    from .adaptive import AdaptiveFireSystem
+    from ..config.manager import ConfigManager
+    from ..sensor.alerts import AlertManager
+
+    # 최대 속도 재생 중 경보 로그(logger.warning) 억제
+    logging.getLogger(__name__.rsplit('.', 1)[0]).setLevel(logging.ERROR)
+
+    stats = SensorReplayStats(sid=sid, peer_ip=peer_ip)
+    detector = MultiSensorFireDetector(
+        thresholds=dict(options.fire_thresholds) if options.fire_thresholds else None,
+        sensor_weights=dict(options.sensor_weights) if options.sensor_weights else None,
+        vectorized=options.vectorized
+    )
+    alert_manager = AlertManager(ConfigManager(options.config_path or os.devnull), enable_tts=False)
+
+    work_dir = tempfile.mkdtemp(prefix="fire_replay_")
+    adaptive = None
+    if options.adaptive:
+        adaptive = AdaptiveFireSystem(
+            AIAdaptationConfig(),
+            db_path=os.path.join(work_dir, "fire_adaptive.db"),
+            learning_state_path=None,
+            save_interval=None
+        )
+
+    fire_episodes = _EpisodeTracker(options.alarm_level, options.clear_seconds, stats.fire_episodes)
+    alert_episodes = _EpisodeTracker(options.alarm_level, options.clear_seconds, stats.alert_episodes)
+    adapt_interval = options.adapt_interval_hours * 3600.0
+    next_adapt = None
+    sensor_id = sid if not peer_ip else f"{sid}@{peer_ip}"
+    get_alert_level = alert_manager.get_alert_level
+
+    started = time.perf_counter()
+    try:
+        for ts, data in rows:
+            stats.rows += 1
+            if stats.first_ts is None:
+                stats.first_ts = ts
+                next_adapt = ts + adapt_interval
+            stats.last_ts = ts
+
+            # 1. 화재 감지 (측정 시각 주입 → 온도 상승률이 기록 시간축으로 계산됨)
+            reading = _reading_from_data(sensor_id, ts, data)
+            result = detector.detect(reading)
+            level = result.alert_level.value
+            stats.fire_levels[level] += 1
+            fire_episodes.update(ts, level, result.fire_probability, result.message)
+
+            # 2. 센서별 임계값 경보 (AlertManager 5단계)
+            worst, worst_key = 1, ""
+            for key in DATA_COLUMNS:
+                value = data.get(key)
+                if value is None:
+                    continue
+                lv = get_alert_level(key, value)
+                if lv > worst:
+                    worst, worst_key = lv, key
+            stats.alert_levels[worst] += 1
+            if worst_key:
+                alert_episodes.update(ts, worst, _to_float(data.get(worst_key)) or 0.0, worst_key)
+
+            # 3. AI 적응형 학습 (+ 주기적 임계값 반영)
+            if adaptive is not None:
+                adaptive.process_reading(reading, result.fire_probability)
+                if adapt_interval > 0 and ts >= next_adapt:
+                    next_adapt = ts + adapt_interval
+                    ok, _ = adaptive.update_thresholds()
+                    if ok:
+                        detector.update_thresholds(adaptive.get_current_thresholds())
+                        stats.threshold_updates += 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def _replay_db_task(args) -> SensorReplayStats:
+    db_path, sid, peer_ip, options = args
+    rows = iter_db_rows(db_path, sid, peer_ip, options.start, options.end)
+    return replay_sensor(sid, peer_ip, rows, options)
+
+
+def _replay_rows_task(args) -> SensorReplayStats:
+    sid, peer_ip, rows, options = args
+    return replay_sensor(sid, peer_ip, rows, options)
+
+
+# ============================================================
+# 집계
+# ============================================================
+
+@dataclass
+class ReplayReport:
+    """전체 재생 결과"""
+    sensors: List[SensorReplayStats]
+    incidents: List[Incident]
+    alarm_level: int
+    wall_time: float = 0.0
+
+    @property
+    def total_rows(self) -> int:
+        return sum(s.rows for s in self.sensors)
+
+    @property
+    def throughput(self) -> float:
+        """처리량 (rows/s, 벽시계 기준)"""
+        return self.total_rows / self.wall_time if self.wall_time > 0 else 0.0
+
+    def level_counts(self, kind: str = 'fire') -> Dict[int, int]:
+        """경보 단계별 측정 수 ('fire' 또는 'alert')"""
+        totals = {lv: 0 for lv in LEVELS}
+        for s in self.sensors:
+            for lv, n in (s.fire_levels if kind == 'fire' else s.alert_levels).items():
+                totals[int(lv)] += n
+        return totals
+
+    def evaluate(self, kind: str = 'fire') -> Dict:
+        """
+        경보 구간을 incidents와 대조
+
+        Returns:
+            {'episodes', 'false_alarms', 'detected', 'missed', 'time_to_detect': [초, ...],
+             'false_alarms_per_day'}
+        """
+        episodes_total = false_alarms = 0
+        matched = [None] * len(self.incidents)
+        days = 0.0
+        for s in self.sensors:
+            episodes = s.fire_episodes if kind == 'fire' else s.alert_episodes
+            if s.first_ts is not None:
+                days += (s.last_ts - s.first_ts) / 86400.0
+            mine = [i for i, inc in enumerate(self.incidents) if inc.matches(s.sid, s.peer_ip)]
+            for start, last, _, _, _ in episodes:
+                episodes_total += 1
+                hit = False
+                for i in mine:
+                    inc = self.incidents[i]
+                    if start <= inc.end and last >= inc.start:
+                        hit = True
+                        detect_at = max(start, inc.start)
+                        if matched[i] is None or detect_at < matched[i]:
+                            matched[i] = detect_at
+                if not hit:
+                    false_alarms += 1
+
+        ttd = [m - inc.start for m, inc in zip(matched, self.incidents) if m is not None]
+        return {
+            'episodes': episodes_total,
+            'false_alarms': false_alarms,
+            'false_alarms_per_day': false_alarms / days if days > 0 else 0.0,
+            'detected': len(ttd),
+            'missed': len(self.incidents) - len(ttd),
+            'time_to_detect': ttd,
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'alarm_level': self.alarm_level,
+            'total_rows': self.total_rows,
+            'wall_time': self.wall_time,
+            'throughput': self.throughput,
+            'fire_levels': self.level_counts('fire'),
+            'alert_levels': self.level_counts('alert'),
+            'fire': self.evaluate('fire'),
+            'alert': self.evaluate('alert'),
+            'sensors': [asdict(s) for s in self.sensors],
+        }
+
+
+def run_replay(
+    db_path: Optional[str] = None,
+    log_paths: Optional[List[str]] = None,
+    options: Optional[ReplayOptions] = None,
+    incidents: Optional[List[Incident]] = None,
+    workers: Optional[int] = None,
+    sensors: Optional[List[str]] = None
+) -> ReplayReport:
+    """
+    이력 재생 실행
+
+    Args:
+        db_path: LogManager SQLite 경로 (logs/sensor_data.db)
+        log_paths: 텍스트 데이터 로그 파일/폴더 (db_path가 없을 때)
+        options: 재생 설정
+        incidents: 실제 화재 구간 (없으면 모든 경보 구간이 오경보)
+        workers: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 처리)
+        sensors: 재생할 sid 목록 (None이면 전체)
+    """
+    options = options or ReplayOptions()
+    incidents = incidents or []
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+
+    if db_path:
+        sensor_list = [(sid, peer) for sid, peer, _ in list_db_sensors(db_path, options.start, options.end)
+                       if sensors is None or sid in sensors]
+        tasks = [(db_path, sid, peer, options) for sid, peer in sensor_list]
+        task_fn = _replay_db_task
+    else:
+        grouped = load_text_logs(log_paths or [], options.start, options.end)
+        # 행 수 많은 센서부터 (프로세스 간 부하 균형)
+        keys = sorted(grouped, key=lambda k: len(grouped[k]), reverse=True)
+        tasks = [(sid, peer, grouped[(sid, peer)], options) for sid, peer in keys
+                 if sensors is None or sid in sensors]
+        task_fn = _replay_rows_task
+
+    if workers <= 1 or len(tasks) <= 1:
+        results = [task_fn(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(task_fn, tasks))
+
+    report = ReplayReport(sensors=results, incidents=incidents, alarm_level=options.alarm_level)
+    report.wall_time = time.perf_counter() - started
+    return report
+
+
+def format_report(report: ReplayReport) -> str:
+    """콘솔 출력용 보고서"""
+    lines = []
+    names = {lv.value: lv.korean_name for lv in FireAlertLevel}
+    lines.append("=" * 64)
+    lines.append(f"재생 센서 {len(report.sensors)}개, {report.total_rows:,}행, "
+                 f"{report.wall_time:.2f}초 ({report.throughput:,.0f} rows/s)")
+    lines.append("=" * 64)
+
+    fire_counts = report.level_counts('fire')
+    alert_counts = report.level_counts('alert')
+    lines.append(f"{'단계':<8}{'화재 감지(측정 수)':>20}{'임계값 경보(측정 수)':>22}")
+    for lv in LEVELS:
+        lines.append(f"{names[lv]:<8}{fire_counts[lv]:>20,}{alert_counts[lv]:>22,}")
+
+    alarm_name = names.get(report.alarm_level, str(report.alarm_level))
+    for kind, title in (('fire', '화재 감지'), ('alert', '임계값 경보')):
+        ev = report.evaluate(kind)
+        lines.append("")
+        lines.append(f"[{title}] {alarm_name} 이상 경보 구간 {ev['episodes']}회, "
+                     f"오경보 {ev['false_alarms']}회 ({ev['false_alarms_per_day']:.2f}회/일)")
+        if report.incidents:
+            ttd = sorted(ev['time_to_detect'])
+            if ttd:
+                median = ttd[len(ttd) // 2]
+                lines.append(f"    화재 구간 {len(report.incidents)}개 중 감지 {ev['detected']}, "
+                             f"미감지 {ev['missed']} / 감지 소요 중앙값 {median:.0f}초, 최대 {ttd[-1]:.0f}초")
+            else:
+                lines.append(f"    화재 구간 {len(report.incidents)}개 모두 미감지")
+
+    lines.append("")
+    lines.append(f"{'센서':<24}{'행':>10}{'화재 경보':>10}{'임계 경보':>10}{'rows/s':>12}")
+    for s in sorted(report.sensors, key=lambda s: (s.sid, s.peer_ip)):
+        label = f"{s.sid}@{s.peer_ip}" if s.peer_ip else s.sid
+        rate = s.rows / s.elapsed if s.elapsed > 0 else 0.0
+        lines.append(f"{label[:23]:<24}{s.rows:>10,}{len(s.fire_episodes):>10}"
+                     f"{len(s.alert_episodes):>10}{rate:>12,.0f}")
+    return "\n".join(lines)
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def _parse_time(text: Optional[str]) -> Optional[float]:
+    """'YYYY-mm-dd' 또는 'YYYY-mm-dd HH:MM:SS' (로컬 시간) → epoch 초"""
+    if not text:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            continue
+    raise ValueError(f"시간 형식 오류: {text}")
+
+
+def load_incidents(path: str) -> List[Incident]:
+    """
+    화재 구간 파일 로드 (JSON 목록)
+
+    [{"sid": "1", "start": "2025-01-03 14:00:00", "end": "2025-01-03 14:30:00", "peer_ip": "..."}]
+    """
+    with open(path, encoding="utf-8") as f:
+        items = json.load(f)
+    incidents = []
+    for item in items:
+        start, end = item['start'], item['end']
+        incidents.append(Incident(
+            sid=str(item['sid']),
+            start=start if isinstance(start, (int, float)) else _parse_time(start),
+            end=end if isinstance(end, (int, float)) else _parse_time(end),
+            peer_ip=item.get('peer_ip')
+        ))
+    return incidents
+
+
+def _load_json(path: Optional[str]) -> Optional[Dict]:
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="화재 감지 이력 재생/백테스트")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="SQLite 센서 DB (logs/sensor_data.db)")
+    source.add_argument("--logs", nargs="+", help="텍스트 데이터 로그 파일 또는 폴더 (logs/data)")
+    parser.add_argument("--from", dest="start", help="시작 (YYYY-mm-dd[ HH:MM:SS])")
+    parser.add_argument("--to", dest="end", help="끝 (미포함)")
+    parser.add_argument("--sensor", action="append", help="재생할 sid (반복 지정 가능)")
+    parser.add_argument("--thresholds", help="화재 감지 임계값 JSON (STANDARD_THRESHOLDS 키)")
+    parser.add_argument("--weights", help="센서 가중치 JSON (SENSOR_WEIGHTS 키)")
+    parser.add_argument("--config", help="AlertManager용 config.conf")
+    parser.add_argument("--incidents", help="실제 화재 구간 JSON")
+    parser.add_argument("--alarm-level", type=int, default=3, help="경보로 집계할 최소 단계 (기본 3: 주의)")
+    parser.add_argument("--clear-seconds", type=float, default=60.0)
+    parser.add_argument("--no-adaptive", action="store_true", help="AI 적응형 학습 제외")
+    parser.add_argument("--adapt-hours", type=float, default=0.0, help="적응 임계값 반영 주기 (시간, 0이면 반영 안 함)")
+    parser.add_argument("--vectorized", action="store_true", help="벡터화 융합 엔진 사용 (결과 동일, 센서 1개 재생에서는 더 느림)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본 CPU 수)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    options = ReplayOptions(
+        fire_thresholds=_load_json(args.thresholds),
+        sensor_weights=_load_json(args.weights),
+        config_path=args.config,
+        alarm_level=args.alarm_level,
+        clear_seconds=args.clear_seconds,
+        adaptive=not args.no_adaptive,
+        adapt_interval_hours=args.adapt_hours,
+        vectorized=args.vectorized,
+        start=_parse_time(args.start),
+        end=_parse_time(args.end),
+    )
+    incidents = load_incidents(args.incidents) if args.incidents else []
+
+    report = run_replay(db_path=args.db, log_paths=args.logs, options=options,
+                        incidents=incidents, workers=args.workers, sensors=args.sensor)
+    print(format_report(report))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+벡터화 Dempster-Shafer 융합 엔진
+GARAMe Manager v2.0
+
+MultiSensorFireDetector는 센서 노드(sensor_id)마다, 측정값마다
+MassFunction 객체를 만들어 퍼지 멤버십 → 가중 할인 → Dempster 조합 → 시간 평활화를
+스칼라로 반복합니다. 이 모듈은 한 틱의 모든 노드를 NumPy 배열로 한 번에 처리합니다.
+
+- 측정값: (노드 수, 증거 수) 배열, 값 없음은 NaN
+- Mass: (노드 수, 증거 수, 3) 배열 [..., 0]=fire, 1=normal, 2=uncertain
+- 퍼지 멤버십: fuzzy.MEMBERSHIP_SPECS 구간 경계/구간 계수 테이블 (스칼라 경로와 같은 테이블)
+- 조합: 증거 축을 순서대로 접으며(fold) 노드 축 전체를 한 번에 계산
+
+스칼라 경로(fuzzy.py / dempster_shafer.py)와 연산 순서·정규화 시점을 그대로 따르므로
+결과가 비트 단위로 동일합니다 (test_fire_fusion_vectorized.py 골든 테스트).
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+import threading
+
+import numpy as np
+
+from .fuzzy import LEVEL_SUFFIXES, MEMBERSHIP_SPECS
+from .models import SENSOR_WEIGHTS, STANDARD_THRESHOLDS
+
+
+# FireDetector._get_sensor_mass_functions의 센서 순서 (조합 순서가 결과에 영향)
+EVIDENCE_KEYS = (
+    'smoke', 'co', 'temperature', 'temp_rate', 'o2',
+    'co2', 'ch4', 'h2s', 'humidity'
+)
+
+
+
+class FusionBatch(NamedTuple):
+    """한 틱의 벡터화 융합 결과 (행 = 입력 노드 순서)"""
+    masses: np.ndarray        # (N, E, 3) 센서별 Mass (값 없음은 (0, 0, 1))
+    present: np.ndarray       # (N, E) 센서 값 존재 여부
+    has_data: np.ndarray      # (N,) 센서 값이 하나라도 있는지
+    combined: np.ndarray      # (N, 3) 최종 조합 결과 (fire, normal, uncertain)
+    fire_probability: np.ndarray  # (N,) Pignistic 확률
+    conflict: np.ndarray      # (N,) 마지막 Dempster 조합의 충돌 계수
+
+
+def _normalize(f, n, u):
+    """MassFunction.__post_init__과 동일한 정규화 (합계 > 0일 때만)"""
+    total = f + n + u
+    pos = total > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (np.where(pos, f / total, f),
+                np.where(pos, n / total, n),
+                np.where(pos, u / total, u))
+
+
+def _combine_two(f1, n1, u1, f2, n2, u2):
+    """DempsterShaferCombiner.combine_two의 벡터화 버전 → (f, n, u, conflict)"""
+    fire_support = f1 * f2 + f1 * u2 + u1 * f2
+    normal_support = n1 * n2 + n1 * u2 + u1 * n2
+    uncertain_support = u1 * u2
+    conflict = f1 * n2 + n1 * f2
+
+    ok = ~(conflict >= 1.0)
+    normalizer = 1.0 - conflict
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = np.where(ok, fire_support / normalizer, 0.0)
+        n = np.where(ok, normal_support / normalizer, 0.0)
+        u = np.where(ok, uncertain_support / normalizer, 1.0)
+    f, n, u = _normalize(f, n, u)
+    return f, n, u, conflict
+
+
+class VectorizedFireFusion:
+    """
+    다중 노드 벡터화 화재 융합 엔진
+
+    ImprovedDempsterShafer(temporal_weight)를 노드마다 하나씩 둔 것과 같은 상태를
+    배열로 관리합니다 (시간 평활화 이전 결과, 마지막 충돌 계수).
+    """
+
+    def __init__(
+        self,
+        thresholds: Optional[Dict[str, float]] = None,
+        sensor_weights: Optional[Dict[str, float]] = None,
+        temporal_weight: float = 0.3,
+        default_weight: float = 0.05
+    ):
+        """
+        Args:
+            thresholds: 퍼지 멤버십 임계값 (없으면 표준값)
+            sensor_weights: 센서별 가중치 (없으면 기본값)
+            temporal_weight: 시간적 평활화 가중치 (0~1)
+            default_weight: 가중치 표에 없는 센서의 가중치 (FireDetector와 동일하게 0.05)
+        """
+        self.thresholds = dict(thresholds or STANDARD_THRESHOLDS)
+        self.sensor_weights = dict(sensor_weights or SENSOR_WEIGHTS)
+        self.temporal_weight = temporal_weight
+        self.default_weight = default_weight
+
+        self._build_tables()
+
+        # 노드별 상태 (행 번호는 최초 등장 순으로 할당)
+        self._lock = threading.Lock()
+        self._rows: Dict[str, int] = {}
+        self._prev = np.zeros((0, 3))
+        self._has_prev = np.zeros(0, dtype=bool)
+        self._conflict = np.zeros(0)
+
+    # ------------------------------------------------------------------
+    # 테이블
+    # ------------------------------------------------------------------
+    def _build_tables(self):
+        """센서별 구간 경계/계수 테이블 생성 (임계값 변경 시 재생성)"""
+        n_ev = len(EVIDENCE_KEYS)
+        self._sign = np.empty(n_ev)
+        self._bounds = np.empty((n_ev, 5))
+        self._segments = np.empty((n_ev, 6, 6))
+        for e, name in enumerate(EVIDENCE_KEYS):
+            sign, normal_limit, defaults, segments = MEMBERSHIP_SPECS[name]
+            levels = [float(self.thresholds.get(f'{name}_{suffix}', default))
+                      for suffix, default in zip(LEVEL_SUFFIXES, defaults)]
+            # 역방향 센서는 값과 경계의 부호를 뒤집어 '값 <= 경계' 비교로 통일
+            self._sign[e] = sign
+            self._bounds[e] = [sign * b for b in [normal_limit] + levels]
+            self._segments[e] = segments
+        self._weights = np.array([
+            self.sensor_weights.get(name, self.default_weight) for name in EVIDENCE_KEYS
+        ], dtype=np.float64)
+
+    def update_thresholds(self, new_thresholds: Dict[str, float]):
+        """임계값 업데이트 (AI 적응형 시스템용)"""
+        self.thresholds.update(new_thresholds)
+        self._build_tables()
+
+    def values_from_readings(self, readings: Sequence, temp_rates: Optional[Sequence] = None) -> np.ndarray:
+        """
+        SensorReading 목록 → (N, E) 측정값 배열 (None은 NaN)
+
+        Args:
+            readings: SensorReading 목록
+            temp_rates: 노드별 온도 상승률 (없으면 reading.temp_rate 사용)
+        """
+        values = np.full((len(readings), len(EVIDENCE_KEYS)), np.nan)
+        for i, reading in enumerate(readings):
+            for e, name in enumerate(EVIDENCE_KEYS):
+                if name == 'temp_rate' and temp_rates is not None:
+                    value = temp_rates[i]
+                else:
+                    value = getattr(reading, name, None)
+                if value is not None:
+                    values[i, e] = value
+        return values
+
+    # ------------------------------------------------------------------
+    # 퍼지 멤버십
+    # ------------------------------------------------------------------
+    def memberships(self, values: np.ndarray):
+        """
+        측정값 → 센서별 Mass (FuzzyMembershipFunctions와 동일)
+
+        Args:
+            values: (N, E) 측정값, 값 없음은 NaN
+
+        Returns:
+            (masses (N, E, 3), present (N, E))
+        """
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        signed = values * self._sign
+
+        # if/elif 분기와 같은 '첫 번째로 만족하는 경계' 구간 번호 (0~5)
+        hit = signed[..., None] <= self._bounds
+        seg = np.where(hit.any(axis=-1), hit.argmax(axis=-1), 5)
+
+        ev = np.arange(len(EVIDENCE_KEYS))
+        coef = self._segments[ev, seg]  # (N, E, 6)
+        linear = (seg >= 1) & (seg <= 4)
+        lo = self._bounds[ev, np.clip(seg - 1, 0, 4)]
+        hi = self._bounds[ev, np.clip(seg, 0, 4)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(linear, (signed - lo) / (hi - lo), 0.0)
+
+        fire = coef[..., 0] + ratio * coef[..., 1]
+        normal = coef[..., 2] - coef[..., 3] * fire
+        uncertain = coef[..., 4] - coef[..., 5] * fire
+        fire, normal, uncertain = _normalize(fire, normal, uncertain)
+
+        masses = np.stack([fire, normal, uncertain], axis=-1)
+        masses[~present] = (0.0, 0.0, 1.0)
+        return masses, present
+
+    # ------------------------------------------------------------------
+    # 조합
+    # ------------------------------------------------------------------
+    def _fold(self, f, n, u, present, conflict):
+        """combine_multiple: 존재하는 증거만 순서대로 조합 (1개면 그대로)"""
+        n_rows = present.shape[0]
+        acc_f = np.zeros(n_rows)
+        acc_n = np.zeros(n_rows)
+        acc_u = np.ones(n_rows)
+        started = np.zeros(n_rows, dtype=bool)
+        for e in range(present.shape[1]):
+            p = present[:, e]
+            if not p.any():
+                continue
+            cf, cn, cu, k = _combine_two(acc_f, acc_n, acc_u, f[:, e], n[:, e], u[:, e])
+            merge = p & started
+            first = p & ~started
+            acc_f = np.where(merge, cf, np.where(first, f[:, e], acc_f))
+            acc_n = np.where(merge, cn, np.where(first, n[:, e], acc_n))
+            acc_u = np.where(merge, cu, np.where(first, u[:, e], acc_u))
+            conflict = np.where(merge, k, conflict)
+            started |= p
+        return acc_f, acc_n, acc_u, conflict
+
+    def combine_weighted(self, masses, present, conflict):
+        """
+        DempsterShaferCombiner.combine_weighted 벡터화
+
+        Returns:
+            (f, n, u, conflict)
+        """
+        w = self._weights
+        total_weight = np.zeros(present.shape[0])
+        for e in range(present.shape[1]):
+            total_weight = np.where(present[:, e], total_weight + w[e], total_weight)
+
+        usable = present & (total_weight != 0)[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            nw = w[None, :] / total_weight[:, None]
+        f, n, u = _normalize(
+            nw * masses[..., 0],
+            nw * masses[..., 1],
+            nw * masses[..., 2] + (1 - nw)
+        )
+        return self._fold(f, n, u, usable, conflict)
+
+    def murphy_combination(self, masses, present, conflict):
+        """ImprovedDempsterShafer.murphy_combination 벡터화 → (f, n, u, conflict)"""
+        count = present.sum(axis=1)
+        sums = np.zeros((present.shape[0], 3))
+        for e in range(present.shape[1]):
+            sums = np.where(present[:, e, None], sums + masses[:, e], sums)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg = sums / count[:, None]
+        af, an, au = _normalize(avg[:, 0], avg[:, 1], avg[:, 2])
+
+        rf, rn, ru = af, an, au
+        for step in range(int(count.max(initial=0)) - 1):
+            cf, cn, cu, k = _combine_two(rf, rn, ru, af, an, au)
+            active = step < count - 1
+            rf = np.where(active, cf, rf)
+            rn = np.where(active, cn, rn)
+            ru = np.where(active, cu, ru)
+            conflict = np.where(active, k, conflict)
+
+        empty = count == 0
+        rf = np.where(empty, 0.0, rf)
+        rn = np.where(empty, 0.0, rn)
+        ru = np.where(empty, 1.0, ru)
+        return rf, rn, ru, conflict
+
+    def _node_rows(self, node_ids: Sequence[str]) -> np.ndarray:
+        """노드 ID → 상태 행 번호 (새 노드는 상태 배열 확장)"""
+        rows = []
+        for node_id in node_ids:
+            row = self._rows.get(node_id)
+            if row is None:
+                row = self._rows[node_id] = len(self._rows)
+            rows.append(row)
+        size = len(self._rows)
+        if size > len(self._has_prev):
+            grow = max(size, 2 * len(self._has_prev)) - len(self._has_prev)
+            self._prev = np.concatenate([self._prev, np.zeros((grow, 3))])
+            self._has_prev = np.concatenate([self._has_prev, np.zeros(grow, dtype=bool)])
+            self._conflict = np.concatenate([self._conflict, np.zeros(grow)])
+        rows = np.array(rows, dtype=np.intp)
+        if len(np.unique(rows)) != len(rows):
+            raise ValueError("한 틱에 같은 노드가 두 번 포함됨")
+        return rows
+
+    def fuse(self, node_ids: Sequence[str], values: np.ndarray, mode: str = 'temporal') -> FusionBatch:
+        """
+        한 틱의 모든 노드 융합
+
+        Args:
+            node_ids: 노드(sensor_id) 목록 (중복 불가)
+            values: (N, E) 측정값 (EVIDENCE_KEYS 순서, 값 없음은 NaN)
+            mode: 'temporal' - combine_with_temporal (FireDetector 경로, 가중 조합 + 시간 평활화)
+                  'adaptive' - adaptive_combine (가중 Dempster, 충돌이 크면 Murphy 혼합)
+
+        Returns:
+            FusionBatch
+        """
+        masses, present = self.memberships(values)
+        has_data = present.any(axis=1)
+
+        with self._lock:
+            rows = self._node_rows(node_ids)
+            conflict = self._conflict[rows]
+            f, n, u, conflict = self.combine_weighted(masses, present, conflict)
+
+            if mode == 'temporal':
+                has_prev = self._has_prev[rows]
+                prev = self._prev[rows]
+                tw = self.temporal_weight
+                sf, sn, su = _normalize(
+                    (1 - tw) * f + tw * prev[:, 0],
+                    (1 - tw) * n + tw * prev[:, 1],
+                    (1 - tw) * u + tw * prev[:, 2]
+                )
+                f = np.where(has_prev, sf, f)
+                n = np.where(has_prev, sn, n)
+                u = np.where(has_prev, su, u)
+                combined = np.stack([f, n, u], axis=-1)
+                self._prev[rows[has_data]] = combined[has_data]
+                self._has_prev[rows[has_data]] = True
+            elif mode == 'adaptive':
+                high = conflict > 0.5
+                if high.any():
+                    mf, mn, mu, conflict = self.murphy_combination(
+                        masses, present & high[:, None], conflict)
+                    blend = np.minimum(1.0, conflict * 2 - 1.0)
+                    bf, bn, bu = _normalize(
+                        (1 - blend) * f + blend * mf,
+                        (1 - blend) * n + blend * mn,
+                        (1 - blend) * u + blend * mu
+                    )
+                    f = np.where(high, bf, f)
+                    n = np.where(high, bn, n)
+                    u = np.where(high, bu, u)
+                combined = np.stack([f, n, u], axis=-1)
+            else:
+                raise ValueError(f"알 수 없는 융합 모드: {mode}")
+
+            combined[~has_data] = (0.0, 0.0, 1.0)
+            self._conflict[rows[has_data]] = conflict[has_data]
+
+        return FusionBatch(
+            masses=masses,
+            present=present,
+            has_data=has_data,
+            combined=combined,
+            fire_probability=combined[:, 0] + combined[:, 2] / 2.0,
+            conflict=self._conflict[rows].copy()
+        )
+
+    def contributions(self, batch: FusionBatch, index: int) -> Dict[str, float]:
+        """노드 하나의 센서별 기여도 (FireDetector.detect의 sensor_contributions와 동일)"""
+        return {
+            name: round(float(batch.masses[index, e, 0]) * float(self._weights[e]), 4)
+            for e, name in enumerate(EVIDENCE_KEYS)
+            if batch.present[index, e]
+        }
+
+    def reset(self, node_id: Optional[str] = None):
+        """시간적 상태 초기화 (node_id 없으면 전체, reset_temporal과 같이 충돌 계수는 유지)"""
+        with self._lock:
+            if node_id is None:
+                self._has_prev[:] = False
+            elif node_id in self._rows:
+                self._has_prev[self._rows[node_id]] = False
+
+    @property
+    def node_ids(self) -> List[str]:
+        return list(self._rows)
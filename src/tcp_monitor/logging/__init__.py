@@ -4,6 +4,9 @@ TCP Monitor 로깅 모듈
 로그 파일 관리 및 데이터 로깅을 담당합니다.
 """
 
+from .alerts import AlertJournal
+from .history import HistoryCache
 from .manager import LogManager
+from .stats import DailyStatsStore, TTLCache
 
-__all__ = ['LogManager']
+__all__ = ['LogManager', 'DailyStatsStore', 'TTLCache', 'HistoryCache', 'AlertJournal']
@@ -0,0 +1,181 @@
+"""
+경보 상태 전이 기록 (alert_transitions)
+
+측정값마다 판정한 5단계 경보 레벨을 (sid, peer_ip, 센서 키)별로 추적하여
+레벨이 바뀔 때만 1행을 기록합니다.
+- enter: 경보 시작 (정상/관심 → 주의 이상)
+- escalate: 경보 중 레벨 상승
+- deescalate: 경보 중 레벨 하강
+- clear: 경보 해제 (주의 이상 → 정상/관심)
+
+각 행에는 경보 시작 시각, 경과 시간(초), 지금까지의 최고 레벨 값(peak)이 함께 기록됩니다.
+행은 모았다가 한 트랜잭션으로 저장합니다 (batch_size개가 모이거나 flush_interval초 후).
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+ALARM_LEVEL = 3   # 주의(3) 이상이면 경보 (패널/코어 판정과 동일)
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS alert_transitions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp REAL NOT NULL,
+        date TEXT NOT NULL,
+        sid TEXT NOT NULL,
+        peer_ip TEXT NOT NULL,
+        sensor_key TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        level INTEGER NOT NULL,
+        prev_level INTEGER NOT NULL,
+        value REAL,
+        peak REAL,
+        started REAL NOT NULL,
+        duration REAL NOT NULL
+    )
+"""
+
+CREATE_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_transitions_date_sid_level
+    ON alert_transitions(date, sid, peer_ip, level)
+"""
+
+INSERT = """
+    INSERT INTO alert_transitions
+    (timestamp, date, sid, peer_ip, sensor_key, kind, level, prev_level, value, peak, started, duration)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _date(ts: float) -> str:
+    return time.strftime("%Y%m%d", time.localtime(ts))
+
+
+class _Episode:
+    """센서 키 1개의 현재 경보 상태"""
+
+    __slots__ = ("level", "started", "peak", "peak_level", "baseline")
+
+    def __init__(self, level: int, started: float, value, baseline):
+        self.level = level
+        self.started = started
+        self.peak = value
+        self.peak_level = level
+        self.baseline = baseline      # 경보 직전(정상) 값: 같은 레벨 안에서 더 벗어난 값을 peak로
+
+    def update_peak(self, level: int, value):
+        if value is None:
+            return
+        if level > self.peak_level:
+            self.peak, self.peak_level = value, level
+        elif level == self.peak_level and self.baseline is not None and self.peak is not None:
+            if abs(value - self.baseline) > abs(self.peak - self.baseline):
+                self.peak = value
+
+
+class AlertJournal:
+    """경보 레벨 관측 → 상태 전이 행 (일괄 저장)"""
+
+    def __init__(self, write_rows: Callable[[List[tuple]], None],
+                 batch_size: int = 32, flush_interval: float = 2.0):
+        """
+        Args:
+            write_rows: INSERT 파라미터 목록을 한 트랜잭션으로 저장하는 함수
+            batch_size: 이만큼 모이면 바로 저장
+            flush_interval: 첫 행이 대기한 뒤 최대 이 시간(초) 안에 저장
+        """
+        self._write_rows = write_rows
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._episodes: Dict[tuple, _Episode] = {}
+        self._normal: Dict[tuple, tuple] = {}    # 경보가 아닐 때 마지막 (레벨, 값)
+        self._pending: List[tuple] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def observe(self, sid: str, peer_ip: str, key: str, level: int, value,
+                ts: Optional[float] = None) -> Optional[str]:
+        """
+        측정값 1건의 판정 레벨 반영
+
+        Returns:
+            기록한 전이 종류 ("enter" / "escalate" / "deescalate" / "clear") 또는 None
+        """
+        ts = time.time() if ts is None else ts
+        try:
+            level = int(level)
+        except (TypeError, ValueError):
+            return None
+        try:
+            value = float(value) if value is not None else None
+        except (TypeError, ValueError):
+            value = None
+
+        state_key = (sid, peer_ip, key)
+        flush_now = False
+        with self._lock:
+            ep = self._episodes.get(state_key)
+            normal_level, normal_value = self._normal.get(state_key, (1, None))
+            prev = ep.level if ep is not None else normal_level
+            if level >= ALARM_LEVEL:
+                if ep is None:
+                    ep = _Episode(level, ts, value, normal_value)
+                    self._episodes[state_key] = ep
+                    kind = "enter"
+                else:
+                    ep.update_peak(level, value)
+                    kind = None if level == prev else ("escalate" if level > prev else "deescalate")
+                    ep.level = level
+            else:
+                self._normal[state_key] = (level, value if value is not None else normal_value)
+                if ep is None:
+                    return None
+                del self._episodes[state_key]
+                kind = "clear"
+            if kind is None:
+                return None
+            self._pending.append((ts, _date(ts), sid, peer_ip, key, kind, level, prev,
+                                  value, ep.peak, ep.started, ts - ep.started))
+            if len(self._pending) >= self.batch_size:
+                flush_now = True
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+        return kind
+
+    def flush(self) -> int:
+        """대기 중인 행 저장 (저장 실패 시 다음 저장 때 다시 시도)"""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not rows:
+                return 0
+            try:
+                self._write_rows(rows)
+            except Exception as e:
+                print(f"[AlertJournal] 저장 실패: {e}")
+                with self._lock:
+                    self._pending[:0] = rows
+                return 0
+            return len(rows)
+
+    def forget(self, sid: str, peer_ip: str):
+        """센서의 진행 중 경보 상태 제거 (오늘 기록 삭제 시: 다음 경보는 enter부터 다시 기록)"""
+        with self._lock:
+            for state_key in [k for k in self._episodes if k[0] == sid and k[1] == peer_ip]:
+                del self._episodes[state_key]
+            self._pending = [r for r in self._pending if not (r[2] == sid and r[3] == peer_ip)]
+
+    def active(self, sid: str, peer_ip: str) -> Dict[str, dict]:
+        """진행 중 경보 {센서 키: {"level", "started", "peak"}}"""
+        with self._lock:
+            return {k[2]: {"level": ep.level, "started": ep.started, "peak": ep.peak}
+                    for k, ep in self._episodes.items() if k[0] == sid and k[1] == peer_ip}
@@ -0,0 +1,555 @@
+"""
+센서 이력 장기 보관 (지난 날짜 → 센서별 열 압축 청크)
+
+sensor_data에 1초마다 쌓이는 행(+ 같은 내용의 data_YYYYMMDD.log)은 SD 카드 공간을 많이 쓰고,
+여러 달 통계/내보내기는 행 단위 페이지를 모두 읽어야 했습니다.
+백그라운드 압축기가 지난 날짜(오늘 이전)를 (sid, peer_ip, 날짜)마다 청크 1개로 바꿉니다.
+
+청크 (sensor_archive.data):
+    헤더 "GSC2" + 행 수(uint32) + 열 수(uint8) + 구간 길이(uint32 x (1 + 열 수)), 이어서 구간들
+    - 구간 0 timestamp: float64 비트 패턴(int64)의 델타-오브-델타 → zigzag → 바이트 평면 분리 → zlib
+      (하루 구간은 지수가 같아 비트 패턴이 시각에 비례 → 마이크로초 정수와 비슷하게 압축되면서 원본 그대로 복원)
+    - 구간 1.. 센서 값(열마다 따로 압축 → 필요한 열만 풀어서 읽음), 첫 바이트가 방식:
+        0 = 전부 NULL
+        1 = XOR-float (이전 값과 비트 XOR, Gorilla 방식) → 바이트 평면 분리 → zlib
+        2 = 10진 고정소수점: 값 x 10^k가 정수로 정확히 되돌아오면 정수 델타 → zigzag → 평면 분리 → zlib
+            (센서 값은 대부분 소수 1~2자리라 XOR보다 훨씬 작음, NULL은 비트맵으로 따로 저장)
+    압축 후 다시 풀어 원본과 같은지 확인한 뒤에만 원본 행을 지웁니다 (같은 트랜잭션).
+    이전 형식 "GSC1"(timestamp를 마이크로초 정수로 보관)도 읽을 수 있고, 다시 압축할 때 GSC2로 바뀝니다.
+
+색인 (sensor_archive 테이블): sid, peer_ip, date, t_min, t_max, rows, columns, raw_bytes, data
+    → 구간 조회는 (sid, peer_ip, t_min) 색인으로 겹치는 청크만 읽습니다.
+
+조회 (read_range): 청크 + 아직 sensor_data에 있는 행(오늘, 압축 후 백필된 과거 행)을 합쳐 시간순으로 반환
+    → 이력 캐시, 통계 대화상자, 화재 재생이 보관 여부와 관계없이 같은 결과를 받습니다.
+압축 후 과거 날짜로 백필된 행은 다음 압축 때 기존 청크와 합쳐집니다.
+
+지운 행의 페이지는 새 행이 다시 사용하므로 DB 파일이 더 커지지 않습니다.
+새 DB는 auto_vacuum=INCREMENTAL로 만들어 압축 후 빈 페이지를 파일에서 돌려줍니다.
+기존 DB를 줄이려면 프로그램 종료 후:
+    python -m src.tcp_monitor.logging.archive logs/sensor_data.db --vacuum
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import struct
+import threading
+import zlib
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils.helpers import now_local
+from ..utils.metrics import get_metrics
+from .history import HISTORY_COLUMNS, _to_arrays
+
+_COMPACT_SECONDS = get_metrics().histogram("archive_compact_seconds", "지난 날짜 센서 이력 압축 1회 소요 시간")
+_ARCHIVED_ROWS = get_metrics().counter("archive_rows_total", "열 압축 청크로 옮긴 sensor_data 행 수")
+
+CREATE_TABLE = """
+    CREATE TABLE IF NOT EXISTS sensor_archive (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sid TEXT NOT NULL,
+        peer_ip TEXT NOT NULL,
+        date TEXT NOT NULL,
+        t_min REAL NOT NULL,
+        t_max REAL NOT NULL,
+        rows INTEGER NOT NULL,
+        columns TEXT NOT NULL,
+        raw_bytes INTEGER NOT NULL,
+        data BLOB NOT NULL
+    )
+"""
+CREATE_INDEXES = (
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_archive_day ON sensor_archive(sid, peer_ip, date)",
+    "CREATE INDEX IF NOT EXISTS idx_archive_range ON sensor_archive(sid, peer_ip, t_min)",
+)
+
+_MAGIC = b"GSC2"
+_MAGIC_V1 = b"GSC1"  # timestamp 마이크로초 정수 (이전 형식, 읽기 전용)
+_HEADER = struct.Struct("<4sIB")
+_NULL, _XOR, _DECIMAL = 0, 1, 2
+_ZLIB_LEVEL = 6
+_MAX_DECIMALS = 4
+_LIVE_SELECT = "SELECT timestamp, " + ", ".join(HISTORY_COLUMNS) + " FROM sensor_data"
+
+
+def ensure_schema(conn):
+    """보관 테이블/색인 생성 (없을 때만)"""
+    conn.execute(CREATE_TABLE)
+    for stmt in CREATE_INDEXES:
+        conn.execute(stmt)
+
+
+# ============================================================
+# 인코딩
+# ============================================================
+
+def _zigzag(x: np.ndarray) -> np.ndarray:
+    return ((x << 1) ^ (x >> 63)).view(np.uint64)
+
+
+def _unzigzag(u: np.ndarray) -> np.ndarray:
+    return ((u >> np.uint64(1)).view(np.int64)) ^ -(u & np.uint64(1)).view(np.int64)
+
+
+def _pack_planes(words: np.ndarray) -> bytes:
+    """64비트 배열 → 바이트 평면(하위 바이트끼리, 상위 바이트끼리)으로 모아 zlib (값이 작을수록 0 평면이 늘어남)"""
+    planes = np.ascontiguousarray(words.view(np.uint8).reshape(-1, 8).T)
+    return zlib.compress(planes.tobytes(), _ZLIB_LEVEL)
+
+
+def _unpack_planes(blob: bytes, n: int) -> np.ndarray:
+    planes = np.frombuffer(zlib.decompress(blob), dtype=np.uint8).reshape(8, n)
+    return np.ascontiguousarray(planes.T).view(np.uint64).reshape(n)
+
+
+def _encode_timestamps(ts: np.ndarray) -> bytes:
+    bits = np.ascontiguousarray(ts, dtype=np.float64).view(np.int64)
+    dod = np.diff(np.diff(bits, prepend=0), prepend=0)
+    return _pack_planes(_zigzag(dod))
+
+
+def _decode_timestamps(blob: bytes, n: int, micros: bool = False) -> np.ndarray:
+    ints = np.cumsum(np.cumsum(_unzigzag(_unpack_planes(blob, n))))
+    if micros:
+        return ints / 1e6
+    return ints.view(np.float64)
+
+
+def _decimal_scale(values: np.ndarray) -> Optional[int]:
+    """값 x 10^k → 정수 → / 10^k 가 원래 값과 정확히 같아지는 가장 작은 k (없으면 None)"""
+    for k in range(_MAX_DECIMALS + 1):
+        scale = 10.0 ** k
+        scaled = np.round(values * scale)
+        if np.abs(scaled).max(initial=0) >= 2 ** 53:
+            return None
+        if np.array_equal(scaled / scale, values):
+            return k
+    return None
+
+
+def _encode_column(values: np.ndarray) -> bytes:
+    present = ~np.isnan(values)
+    if not present.any():
+        return bytes([_NULL])
+    finite = values[present]
+    k = _decimal_scale(finite) if np.isfinite(finite).all() else None
+    if k is None:
+        bits = values.view(np.uint64)
+        xored = np.bitwise_xor(bits, np.concatenate(([np.uint64(0)], bits[:-1])))
+        return bytes([_XOR]) + _pack_planes(xored)
+
+    ints = np.round(finite * 10.0 ** k).astype(np.int64)
+    deltas = np.diff(ints, prepend=0)
+    mask = b"" if present.all() else zlib.compress(np.packbits(present).tobytes(), _ZLIB_LEVEL)
+    return (bytes([_DECIMAL, k]) + struct.pack("<I", len(mask)) + mask
+            + _pack_planes(_zigzag(deltas)))
+
+
+def _decode_column(blob: bytes, n: int) -> np.ndarray:
+    mode = blob[0]
+    if mode == _NULL:
+        return np.full(n, np.nan)
+    if mode == _XOR:
+        bits = np.bitwise_xor.accumulate(_unpack_planes(blob[1:], n))
+        return bits.view(np.float64)
+    if mode != _DECIMAL:
+        raise ValueError(f"알 수 없는 열 인코딩: {mode}")
+
+    k = blob[1]
+    (mask_len,) = struct.unpack_from("<I", blob, 2)
+    pos = 6
+    if mask_len:
+        present = np.unpackbits(np.frombuffer(zlib.decompress(blob[pos:pos + mask_len]), dtype=np.uint8),
+                                count=n).astype(bool)
+        m = int(present.sum())
+    else:
+        present, m = None, n
+    ints = np.cumsum(_unzigzag(_unpack_planes(blob[pos + mask_len:], m)))
+    finite = ints / 10.0 ** k
+    if present is None:
+        return finite
+    out = np.full(n, np.nan)
+    out[present] = finite
+    return out
+
+
+def encode_chunk(ts: np.ndarray, vals: np.ndarray) -> bytes:
+    """
+    (timestamp 배열, 값 배열 [열 x 행]) → 청크 바이트
+
+    ts는 오름차순이어야 합니다.
+    """
+    n = len(ts)
+    segments = [_encode_timestamps(np.asarray(ts, dtype=np.float64))]
+    for row in np.asarray(vals, dtype=np.float64):
+        segments.append(_encode_column(np.ascontiguousarray(row)))
+    header = _HEADER.pack(_MAGIC, n, len(segments) - 1)
+    lengths = struct.pack(f"<{len(segments)}I", *(len(s) for s in segments))
+    return header + lengths + b"".join(segments)
+
+
+def decode_chunk(blob: bytes, indices: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    청크 바이트 → (timestamp 배열, 값 배열 [열 x 행])
+
+    Args:
+        indices: 풀 열 번호 (None이면 전체, 순서대로 반환)
+    """
+    magic, n, ncols = _HEADER.unpack_from(blob, 0)
+    if magic not in (_MAGIC, _MAGIC_V1):
+        raise ValueError("센서 이력 청크 형식이 아닙니다")
+    lengths = struct.unpack_from(f"<{ncols + 1}I", blob, _HEADER.size)
+    offsets = np.concatenate(([0], np.cumsum(lengths))) + _HEADER.size + 4 * (ncols + 1)
+
+    def segment(i):
+        return blob[offsets[i]:offsets[i + 1]]
+
+    ts = _decode_timestamps(segment(0), n, micros=magic == _MAGIC_V1)
+    indices = range(ncols) if indices is None else indices
+    vals = np.empty((len(indices), n))
+    for out_row, col in enumerate(indices):
+        vals[out_row] = _decode_column(segment(col + 1), n)
+    return ts, vals
+
+
+def _same(a: np.ndarray, b: np.ndarray) -> bool:
+    return a.shape == b.shape and bool(np.array_equal(a, b, equal_nan=True))
+
+
+# ============================================================
+# 조회
+# ============================================================
+
+def read_archive(conn, sid: str, peer_ip: str, start: float, end: Optional[float] = None,
+                 keys: Sequence[str] = HISTORY_COLUMNS) -> Tuple[np.ndarray, np.ndarray]:
+    """[start, end) 구간의 보관 청크 (timestamp 배열, 값 배열 [keys x 행])"""
+    end = float("inf") if end is None else end
+    try:
+        rows = conn.execute(
+            "SELECT columns, data FROM sensor_archive"
+            " WHERE sid = ? AND peer_ip = ? AND t_min < ? AND t_max >= ? ORDER BY t_min",
+            (sid, peer_ip, end, start)).fetchall()
+    except sqlite3.OperationalError:
+        rows = []   # 보관 테이블이 없는 이전 DB (읽기 전용 연결)
+    ts_parts, val_parts = [], []
+    for columns, blob in rows:
+        names = columns.split(",")
+        indices = [names.index(k) if k in names else -1 for k in keys]
+        ts, vals = decode_chunk(blob, [i for i in indices if i >= 0])
+        if -1 in indices:
+            full = np.full((len(keys), len(ts)), np.nan)
+            full[[j for j, i in enumerate(indices) if i >= 0]] = vals
+            vals = full
+        lo = int(np.searchsorted(ts, start, side="left"))
+        hi = int(np.searchsorted(ts, end, side="left"))
+        ts_parts.append(ts[lo:hi])
+        val_parts.append(vals[:, lo:hi])
+    if not ts_parts:
+        return np.empty(0), np.empty((len(keys), 0))
+    return np.concatenate(ts_parts), np.concatenate(val_parts, axis=1)
+
+
+def read_range(conn, sid: str, peer_ip: str, start: float, end: Optional[float] = None,
+               keys: Sequence[str] = HISTORY_COLUMNS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    [start, end) 구간의 센서 이력 - 보관 청크 + sensor_data를 합쳐 시간순으로
+
+    Returns:
+        (timestamp 배열, 값 배열 [keys x 행]) (값 없음 = NaN)
+    """
+    keys = tuple(keys)
+    a_ts, a_vals = read_archive(conn, sid, peer_ip, start, end, keys)
+
+    select = _LIVE_SELECT if keys == HISTORY_COLUMNS else \
+        "SELECT timestamp, " + ", ".join(keys) + " FROM sensor_data"
+    if end is None:
+        rows = conn.execute(select + " WHERE sid = ? AND peer_ip = ? AND timestamp >= ? ORDER BY timestamp ASC",
+                            (sid, peer_ip, start)).fetchall()
+    else:
+        rows = conn.execute(select + " WHERE sid = ? AND peer_ip = ? AND timestamp >= ? AND timestamp < ?"
+                            " ORDER BY timestamp ASC", (sid, peer_ip, start, end)).fetchall()
+    if not rows:
+        return a_ts, a_vals
+    l_ts, l_vals = _to_arrays(rows)
+    if not len(a_ts):
+        return l_ts, l_vals
+
+    ts = np.concatenate([a_ts, l_ts])
+    vals = np.concatenate([a_vals, l_vals], axis=1)
+    if len(a_ts) and a_ts[-1] > l_ts[0]:
+        # 보관된 날짜로 백필된 행 (다음 압축 전까지 sensor_data에 남아 있음)
+        order = np.argsort(ts, kind="stable")
+        ts, vals = ts[order], vals[:, order]
+    return ts, vals
+
+
+def iter_range_blocks(conn, sid: str, peer_ip: str, start: Optional[float] = None,
+                      end: Optional[float] = None, keys: Sequence[str] = HISTORY_COLUMNS,
+                      block_seconds: float = 86400.0) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """긴 구간을 block_seconds 단위로 나눠 read_range (메모리에 전체를 올리지 않음)"""
+    bounds = [conn.execute("SELECT MIN(timestamp), MAX(timestamp) FROM sensor_data"
+                           " WHERE sid = ? AND peer_ip = ?", (sid, peer_ip)).fetchone()]
+    try:
+        bounds.append(conn.execute("SELECT MIN(t_min), MAX(t_max) FROM sensor_archive"
+                                   " WHERE sid = ? AND peer_ip = ?", (sid, peer_ip)).fetchone())
+    except sqlite3.OperationalError:
+        pass
+    lows = [b[0] for b in bounds if b and b[0] is not None]
+    highs = [b[1] for b in bounds if b and b[1] is not None]
+    if not lows:
+        return
+    t = max(min(lows), start) if start is not None else min(lows)
+    stop = min(max(highs) + 1e-3, end) if end is not None else max(highs) + 1e-3
+    while t < stop:
+        block_end = min(t + block_seconds, stop)
+        ts, vals = read_range(conn, sid, peer_ip, t, block_end, keys)
+        if len(ts):
+            yield ts, vals
+        t = block_end
+
+
+def archived_counts(conn, start: Optional[float] = None,
+                    end: Optional[float] = None) -> Dict[Tuple[str, str], int]:
+    """(sid, peer_ip)별 보관된 행 수 (구간을 주면 겹치는 청크의 행 수)"""
+    clauses, params = [], []
+    if start is not None:
+        clauses.append("t_max >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("t_min < ?")
+        params.append(end)
+    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+    try:
+        rows = conn.execute(f"SELECT sid, peer_ip, SUM(rows) FROM sensor_archive {where} GROUP BY sid, peer_ip",
+                            params).fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    return {(r[0], r[1]): int(r[2]) for r in rows}
+
+
+# ============================================================
+# 압축기
+# ============================================================
+
+def _today() -> str:
+    return now_local().strftime("%Y%m%d")
+
+
+class SensorArchiver:
+    """지난 날짜 sensor_data → 열 압축 청크 (백그라운드 스레드)"""
+
+    def __init__(self, db_path: str, lock, get_connection: Callable[[], sqlite3.Connection],
+                 on_archived: Optional[Callable[[str, str], None]] = None,
+                 text_log_dir: Optional[str] = None, interval: float = 3600.0,
+                 first_delay: float = 120.0, today: Callable[[], str] = _today):
+        """
+        Args:
+            db_path: sensor_data DB 경로 (원본 행 읽기는 별도 연결)
+            lock: 쓰기 연결 보호 잠금 (LogManager._db_lock)
+            get_connection: 쓰기 연결 (LogManager._get_db_connection, lock 안에서 호출)
+            on_archived: (sid, peer_ip) 청크 저장 후 호출 (이력 캐시 무효화)
+            text_log_dir: 지난 날짜 data_YYYYMMDD.log를 gzip으로 압축할 폴더 (None이면 안 함)
+            interval: 압축 주기 (초)
+            first_delay: 시작 후 첫 압축까지 대기 (초, 시작 직후 부하 분산)
+            today: 오늘 날짜("YYYYMMDD")를 반환하는 함수 (테스트에서 날짜 변경용)
+        """
+        self.db_path = db_path
+        self._lock = lock
+        self._get_connection = get_connection
+        self._on_archived = on_archived
+        self.text_log_dir = text_log_dir
+        self.interval = interval
+        self.first_delay = first_delay
+        self._today = today
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="sensor-archiver", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0):
+        """중지 (진행 중인 청크는 마치고 멈춤, 스레드 종료까지 최대 timeout초 대기)"""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _loop(self):
+        delay = self.first_delay
+        while not self._stop.wait(delay):
+            try:
+                result = self.compact_once(stop=self._stop)
+                if result["chunks"] or result["text_logs"]:
+                    print(f"[Archive] 센서 이력 압축: {result['chunks']}개 청크, {result['rows']}행, "
+                          f"텍스트 로그 {result['text_logs']}개")
+            except Exception as e:
+                print(f"[Archive] 센서 이력 압축 실패: {e}")
+            delay = self.interval
+
+    def pending_days(self, conn) -> List[Tuple[str, str, str]]:
+        """압축할 (date, sid, peer_ip) 목록 (오늘 이전 날짜)"""
+        return conn.execute(
+            "SELECT DISTINCT date, sid, peer_ip FROM sensor_data WHERE date < ? ORDER BY date",
+            (self._today(),)).fetchall()
+
+    def compact_once(self, stop: Optional[threading.Event] = None) -> Dict:
+        """지난 날짜를 모두 압축 (stop이 설정되면 다음 청크 전에 멈춤)"""
+        result = {"chunks": 0, "rows": 0, "bytes": 0, "raw_bytes": 0, "text_logs": 0}
+        with _COMPACT_SECONDS.time():
+            with self._lock:
+                conn = self._get_connection()
+                ensure_schema(conn)
+                conn.commit()
+            reader = sqlite3.connect(self.db_path, check_same_thread=False)
+            try:
+                for date, sid, peer_ip in self.pending_days(reader):
+                    if stop is not None and stop.is_set():
+                        break
+                    stats = self._compact_day(reader, date, sid, peer_ip)
+                    if stats:
+                        result["chunks"] += 1
+                        result["rows"] += stats[0]
+                        result["bytes"] += stats[1]
+                        result["raw_bytes"] += stats[2]
+            finally:
+                reader.close()
+            if result["chunks"]:
+                self._release_pages(stop)
+            if self.text_log_dir:
+                result["text_logs"] = self.compress_text_logs()
+        return result
+
+    def _compact_day(self, reader, date: str, sid: str, peer_ip: str):
+        """(날짜, 센서) 1개 → 청크 (기존 청크가 있으면 합침). Returns: (원본 행 수, 청크 크기, 원래 크기)"""
+        rows = reader.execute(
+            "SELECT id, " + _LIVE_SELECT[len("SELECT "):]
+            + " WHERE date = ? AND sid = ? AND peer_ip = ? ORDER BY timestamp ASC, id ASC",
+            (date, sid, peer_ip)).fetchall()
+        if not rows:
+            return None
+        max_id = max(r[0] for r in rows)
+        ts, vals = _to_arrays([r[1:] for r in rows])
+        source_rows = len(ts)
+
+        existing = reader.execute(
+            "SELECT columns, data, raw_bytes FROM sensor_archive WHERE sid = ? AND peer_ip = ? AND date = ?",
+            (sid, peer_ip, date)).fetchone()
+        raw_bytes = source_rows * 8 * (1 + len(HISTORY_COLUMNS))
+        if existing is not None:
+            # 압축 후 백필된 행 → 기존 청크와 합침
+            columns, blob, old_raw = existing
+            names = columns.split(",")
+            old_ts, old_vals = decode_chunk(blob)
+            merged = np.full((len(HISTORY_COLUMNS), len(old_ts)), np.nan)
+            for j, key in enumerate(HISTORY_COLUMNS):
+                if key in names:
+                    merged[j] = old_vals[names.index(key)]
+            ts = np.concatenate([old_ts, ts])
+            vals = np.concatenate([merged, vals], axis=1)
+            order = np.argsort(ts, kind="stable")
+            ts, vals = ts[order], vals[:, order]
+            raw_bytes += old_raw
+
+        blob = encode_chunk(ts, vals)
+        check_ts, check_vals = decode_chunk(blob)
+        if not (np.array_equal(check_ts, ts) and _same(check_vals, vals)):
+            print(f"[Archive] 청크 검증 실패, 원본 유지: {sid}@{peer_ip} {date}")
+            return None
+
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sensor_archive"
+                    " (sid, peer_ip, date, t_min, t_max, rows, columns, raw_bytes, data)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (sid, peer_ip, date, float(ts[0]), float(ts[-1]), len(ts),
+                     ",".join(HISTORY_COLUMNS), raw_bytes, sqlite3.Binary(blob)))
+                # 읽은 뒤 저장된 백필 행(id > max_id)은 남겨 두고 다음 압축 때 합침
+                conn.execute("DELETE FROM sensor_data WHERE date = ? AND sid = ? AND peer_ip = ? AND id <= ?",
+                             (date, sid, peer_ip, max_id))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        if self._on_archived is not None:
+            self._on_archived(sid, peer_ip)
+        _ARCHIVED_ROWS.inc(source_rows)
+        return source_rows, len(blob), raw_bytes
+
+    def _release_pages(self, stop: Optional[threading.Event] = None, step: int = 2048):
+        """auto_vacuum=INCREMENTAL DB면 빈 페이지를 조금씩 파일에서 돌려줌 (잠금을 짧게)"""
+        with self._lock:
+            conn = self._get_connection()
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return
+        while stop is None or not stop.is_set():
+            with self._lock:
+                conn = self._get_connection()
+                if not conn.execute("PRAGMA freelist_count").fetchone()[0]:
+                    return
+                conn.execute(f"PRAGMA incremental_vacuum({int(step)})").fetchall()
+                conn.commit()
+
+    def compress_text_logs(self) -> int:
+        """지난 날짜 data_YYYYMMDD.log → data_YYYYMMDD.log.gz (오늘 파일은 그대로)"""
+        today = self._today()
+        done = 0
+        try:
+            names = os.listdir(self.text_log_dir)
+        except OSError:
+            return 0
+        for name in sorted(names):
+            if not (name.startswith("data_") and name.endswith(".log")) or name[5:13] >= today:
+                continue
+            path = os.path.join(self.text_log_dir, name)
+            tmp = path + ".gz.tmp"
+            try:
+                with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                os.replace(tmp, path + ".gz")
+                os.remove(path)
+                done += 1
+            except OSError as e:
+                print(f"[Archive] 텍스트 로그 압축 실패: {name} - {e}")
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+        return done
+
+
+def main():
+    """수동 압축 / DB 파일 줄이기 (프로그램 종료 후 실행)"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="지난 날짜 센서 이력을 열 압축 청크로 보관")
+    parser.add_argument("db", help="sensor_data.db 경로")
+    parser.add_argument("--vacuum", action="store_true",
+                        help="압축 후 auto_vacuum=INCREMENTAL로 바꾸고 VACUUM (파일 크기 줄이기, 시간이 걸림)")
+    args = parser.parse_args()
+
+    lock = threading.RLock()
+    conn = sqlite3.connect(args.db, check_same_thread=False)
+    archiver = SensorArchiver(args.db, lock, lambda: conn)
+    before = os.path.getsize(args.db)
+    result = archiver.compact_once()
+    print(f"청크 {result['chunks']}개, {result['rows']}행: "
+          f"{result['raw_bytes'] / 1e6:.1f} MB → {result['bytes'] / 1e6:.2f} MB")
+    if args.vacuum:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        print(f"DB 파일: {before / 1e6:.1f} MB → {os.path.getsize(args.db) / 1e6:.1f} MB")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
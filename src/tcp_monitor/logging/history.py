@@ -0,0 +1,211 @@
+"""
+센서 이력 캐시 (NumPy 열 배열, 증분 갱신)
+
+(sid, peer_ip)별로 sensor_data의 timestamp와 센서 값 열을 NumPy 배열로 보관합니다.
+- 처음 조회할 때만 요청 구간 전체를 읽고, 이후에는 캐시된 마지막 timestamp(high-water mark)보다
+  새 행만 읽어 뒤에 붙임 → 그래프 갱신 비용이 구간 길이가 아니라 새 데이터 양에 비례
+- 더 긴 구간 요청 시 모자란 앞부분만 읽어 앞에 붙임
+- 요청된 가장 긴 구간보다 오래된 행은 버림
+- 전체 메모리가 예산을 넘으면 가장 오래 안 쓴 센서부터 제거 (LRU)
+- 캐시된 구간 안쪽 시각으로 저장되는 행(백필, 시계 역행)이 생기면 해당 센서 캐시를 무효화
+- 구간 읽기는 reader로 바꿀 수 있음 (LogManager는 보관 청크까지 합쳐 읽는 archive.read_range 사용)
+
+반환 배열은 읽기 전용 뷰입니다. 값이 없으면(NULL) NaN입니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+HISTORY_COLUMNS = ("co2", "h2s", "co", "o2", "temperature", "humidity", "lel", "smoke", "water")
+_COLUMN_INDEX = {key: i for i, key in enumerate(HISTORY_COLUMNS)}
+_SELECT = "SELECT timestamp, " + ", ".join(HISTORY_COLUMNS) + " FROM sensor_data"
+
+
+def _to_float(value) -> float:
+    """숫자가 아닌 값(문자열 등)은 NaN"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _read_live(conn, sid: str, peer_ip: str, since: float,
+               until: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """sensor_data에서 [since, until) 구간"""
+    if until is None:
+        rows = conn.execute(
+            _SELECT + " WHERE sid = ? AND peer_ip = ? AND timestamp >= ? ORDER BY timestamp ASC",
+            (sid, peer_ip, since)).fetchall()
+    else:
+        rows = conn.execute(
+            _SELECT + " WHERE sid = ? AND peer_ip = ? AND timestamp >= ? AND timestamp < ?"
+            " ORDER BY timestamp ASC", (sid, peer_ip, since, until)).fetchall()
+    return _to_arrays(rows)
+
+
+def _to_arrays(rows) -> Tuple[np.ndarray, np.ndarray]:
+    """쿼리 결과 → (timestamp 배열, 값 배열 [열 x 행])"""
+    if not rows:
+        return np.empty(0), np.empty((len(HISTORY_COLUMNS), 0))
+    try:
+        data = np.array(rows, dtype=np.float64)  # None → NaN
+    except (TypeError, ValueError):
+        data = np.array([[_to_float(v) for v in row] for row in rows], dtype=np.float64)
+    return data[:, 0].copy(), np.ascontiguousarray(data[:, 1:].T)
+
+
+class _HistoryEntry:
+    """센서 1개의 열 배열 (뒤쪽 여유 공간을 두고 늘려서 붙이기가 분할 상환 O(새 행))"""
+
+    __slots__ = ("ts", "vals", "lo", "hi", "start", "hwm", "span", "used_at")
+
+    def __init__(self, ts: np.ndarray, vals: np.ndarray, start: float, span: float):
+        self.ts = ts
+        self.vals = vals
+        self.lo = 0
+        self.hi = len(ts)
+        self.start = start                                  # 캐시가 빠짐없이 담고 있는 구간 시작
+        self.hwm = float(ts[-1]) if len(ts) else start      # 마지막으로 읽은 timestamp
+        self.span = span                                    # 요청된 가장 긴 구간 (초)
+        self.used_at = time.monotonic()
+
+    @property
+    def nbytes(self) -> int:
+        return self.ts.nbytes + self.vals.nbytes
+
+    def append(self, ts: np.ndarray, vals: np.ndarray):
+        n = len(ts)
+        if not n:
+            return
+        if self.hi + n > len(self.ts):
+            # 새 배열로 옮김 (이미 반환한 뷰는 이전 배열을 계속 참조하므로 안전)
+            live = self.hi - self.lo
+            cap = max(16, (live + n) * 2)
+            new_ts = np.empty(cap)
+            new_vals = np.empty((self.vals.shape[0], cap))
+            new_ts[:live] = self.ts[self.lo:self.hi]
+            new_vals[:, :live] = self.vals[:, self.lo:self.hi]
+            self.ts, self.vals, self.lo, self.hi = new_ts, new_vals, 0, live
+        self.ts[self.hi:self.hi + n] = ts
+        self.vals[:, self.hi:self.hi + n] = vals
+        self.hi += n
+        self.hwm = max(self.hwm, float(ts[-1]))
+
+    def prepend(self, ts: np.ndarray, vals: np.ndarray, start: float):
+        if len(ts):
+            self.ts = np.concatenate([ts, self.ts[self.lo:self.hi]])
+            self.vals = np.concatenate([vals, self.vals[:, self.lo:self.hi]], axis=1)
+            self.lo, self.hi = 0, len(self.ts)
+        self.start = start
+
+    def trim(self, start: float):
+        """start 이전 행 버리기"""
+        if start <= self.start:
+            return
+        self.lo += int(np.searchsorted(self.ts[self.lo:self.hi], start, side="left"))
+        self.start = start
+
+    def view(self, since: float):
+        i = self.lo + int(np.searchsorted(self.ts[self.lo:self.hi], since, side="left"))
+        ts = self.ts[i:self.hi]
+        vals = self.vals[:, i:self.hi]
+        ts.flags.writeable = False
+        vals.flags.writeable = False
+        return ts, vals
+
+
+class HistoryCache:
+    """(sid, peer_ip)별 센서 이력 열 배열 캐시"""
+
+    def __init__(self, budget_bytes: int = 64 * 1024 * 1024, reader: Optional[Callable] = None):
+        """
+        Args:
+            budget_bytes: 전체 캐시 메모리 예산 (초과 시 LRU 제거)
+            reader: 구간 읽기 함수 (conn, sid, peer_ip, since, until) → (timestamp 배열, 값 배열)
+                    (None이면 sensor_data만, 증분 조회는 항상 sensor_data)
+        """
+        self.budget_bytes = budget_bytes
+        self._reader = reader or _read_live
+        self._entries: "OrderedDict[tuple, _HistoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0        # 증분 조회로 처리한 횟수
+        self.misses = 0      # 구간 전체(또는 앞부분)를 읽은 횟수
+
+    def query(self, conn, sid: str, peer_ip: str, since: float,
+              now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        since 이후 이력 (timestamp 배열, 값 배열 [HISTORY_COLUMNS 순서 x 행])
+
+        conn은 호출자가 잠금으로 보호하는 SQLite 연결입니다.
+        """
+        now = time.time() if now is None else now
+        key = (sid, peer_ip)
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            entry = _HistoryEntry(*self._reader(conn, sid, peer_ip, since, None), start=since, span=now - since)
+            self.misses += 1
+        else:
+            if since < entry.start:
+                entry.prepend(*self._reader(conn, sid, peer_ip, since, entry.start), start=since)
+                self.misses += 1
+            else:
+                self.hits += 1
+            rows = conn.execute(
+                _SELECT + " WHERE sid = ? AND peer_ip = ? AND timestamp > ? ORDER BY timestamp ASC",
+                (sid, peer_ip, entry.hwm)).fetchall()
+            entry.append(*_to_arrays(rows))
+            entry.span = max(entry.span, now - since)
+            entry.trim(now - entry.span)
+
+        entry.used_at = time.monotonic()
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict(keep=key)
+        return entry.view(since)
+
+    def _evict(self, keep):
+        total = sum(e.nbytes for e in self._entries.values())
+        while total > self.budget_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries))
+            if oldest == keep:
+                break
+            total -= self._entries.pop(oldest).nbytes
+
+    def note_write(self, sid: str, peer_ip: str, timestamp: float):
+        """저장 시 호출: 캐시가 이미 지나간 시각의 행이면 해당 센서 캐시 무효화"""
+        entry = self._entries.get((sid, peer_ip))
+        if entry is not None and timestamp <= entry.hwm:
+            self.invalidate(sid, peer_ip)
+
+    def invalidate(self, sid: Optional[str] = None, peer_ip: Optional[str] = None):
+        """센서 1개(또는 전체) 캐시 제거"""
+        with self._lock:
+            if sid is None:
+                self._entries.clear()
+            else:
+                self._entries.pop((sid, peer_ip), None)
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(e.nbytes for e in self._entries.values())
+
+    def stats(self) -> Dict:
+        """진단용"""
+        with self._lock:
+            return {"entries": len(self._entries),
+                    "rows": sum(e.hi - e.lo for e in self._entries.values()),
+                    "bytes": sum(e.nbytes for e in self._entries.values()),
+                    "hits": self.hits, "misses": self.misses}
+
+
+def column(vals: np.ndarray, key: str) -> np.ndarray:
+    """값 배열에서 센서 키 열"""
+    return vals[_COLUMN_INDEX[key]]
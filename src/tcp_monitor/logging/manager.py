@@ -4,14 +4,24 @@
 logs/run/run_YYYYMMDD.log (일별 실행 로그)
 logs/data/data_YYYYMMDD.log (일별 데이터 로그)
 logs/warning/warning_YYYYMMDD.log (일별 경고 로그 - 임계값 초과)
+logs/sensor_data.db (오늘 행은 sensor_data, 지난 날짜는 sensor_archive 열 압축 청크 - archive.py)
 """
 
 import os
 import json
 import sqlite3
+import threading
 import time
 from collections import defaultdict
 from ..utils.helpers import now_local, fmt_ts, ensure_dir
+from ..utils.metrics import get_metrics
+from . import alerts as _alerts
+from .archive import SensorArchiver, ensure_schema as _ensure_archive_schema, read_range
+from .history import HISTORY_COLUMNS, HistoryCache, column
+from .stats import DailyStatsStore, TTLCache
+
+_DB_SAVE_SECONDS = get_metrics().histogram("db_save_seconds", "sensor_data 1건 INSERT+COMMIT 시간 (잠금 대기 포함)")
+_DB_SAVE_ERRORS = get_metrics().counter("db_save_errors_total", "sensor_data 저장 실패 횟수")
 
 
 class LogManager:
@@ -21,6 +31,10 @@ class LogManager:
     logs/warning/warning_YYYYMMDD.log (일별 경고 로그, 임계값 초과 시)
     """
 
+    # 일괄 백필 중복 방지 기록 보관 기간 (수신 시각 기준, 재전송은 보통 수 분 안에 옴)
+    BATCH_SEQ_RETENTION = 7 * 86400
+    BATCH_SEQ_PRUNE_INTERVAL = 3600
+
     def __init__(self, base_dir, server_host, server_port, config=None):
         self.base = os.path.join(base_dir, "logs")
         self.run_dir = os.path.join(self.base, "run")
@@ -46,27 +60,53 @@ class LogManager:
         self._data_tag = None
         self._warning_tag = None
 
-        # 통계 캐시 (메모리 캐시)
-        self._stats_cache = {}
-        self._stats_cache_time = {}
-        self._cache_ttl = 2.0  # 2초간 캐시 유지
-
-        # 시간별 데이터 캐시 (더 긴 TTL)
-        self._data_cache = {}
-        self._data_cache_time = {}
-        self._data_cache_ttl = 5.0  # 5초간 캐시 유지
+        # 시간별 데이터 캐시 (5초 유지, 최대 256개 - 오래 안 쓴 항목부터 제거)
+        self._data_cache = TTLCache(maxsize=256, ttl=5.0)
+        # 센서 이력 열 배열 캐시 (증분 갱신, 메모리 예산 초과 시 LRU 제거, 과거 시각 저장 시 무효화)
+        # 구간 읽기는 보관 청크 + sensor_data를 합쳐서
+        self._history = HistoryCache(reader=read_range)
 
         # SQLite 데이터베이스 초기화
         self.db_path = os.path.join(self.base, "sensor_data.db")
         self._init_database()
         self._db_conn = None
         self._db_tag = None
+        # 공유 연결의 트랜잭션 경계 보호 (수신 스레드 여러 개 + UI 스레드)
+        self._db_lock = threading.RLock()
+        self._batch_seq_pruned = 0.0  # 마지막 sensor_batch_seq 정리 시각
+
+        # 경보 상태 전이 기록 (레벨이 바뀔 때만 1행, 일괄 저장)
+        self._alert_journal = _alerts.AlertJournal(self._write_alert_transitions)
+        # 경고 로그 중복 방지: (sid, peer, 센서 키) → [시작 시각, 최소, 최대] (임계값 초과 중인 항목만)
+        self._warning_open = {}
+
+        # 오늘 통계 (메모리): 시작 시 SQLite에서 1회 집계, 이후 저장할 때마다 갱신
+        self._today_stats = DailyStatsStore()
+        try:
+            with self._db_lock:
+                self._today_stats.seed(self._get_db_connection())
+        except Exception as e:
+            print(f"[LogManager] 오늘 통계 초기화 실패: {e}")
+
+        # 지난 날짜 sensor_data → 열 압축 청크 (백그라운드, 1시간마다, [ENV] history_archive_enabled=True일 때만)
+        self._archiver = None
+        env = getattr(config, "env", None) or {}
+        if str(env.get("history_archive_enabled", False)).lower() in ("1", "true", "yes", "on"):
+            compress_text = str(env.get("history_archive_text_logs", True)).lower() in ("1", "true", "yes", "on")
+            self._archiver = SensorArchiver(
+                self.db_path, self._db_lock, self._get_db_connection,
+                on_archived=self._history.invalidate,
+                text_log_dir=self.data_dir if compress_text else None)
+            self._archiver.start()
 
     def _init_database(self):
         """SQLite 데이터베이스 초기화"""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
+        # 새 DB만 적용됨 (테이블 생성 전): 압축 후 지운 행의 빈 페이지를 파일에서 돌려줄 수 있도록
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # 센서 데이터 테이블 생성 (인덱스 최적화)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS sensor_data (
@@ -115,6 +155,12 @@ class LogManager:
             ON sensor_data(date, sid, peer_ip)
         """)
 
+        # 이력 캐시 증분 조회 (timestamp > 마지막 조회 시각)용 인덱스
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sensor_ts
+            ON sensor_data(sid, peer_ip, timestamp)
+        """)
+
         # 경보 이벤트 테이블 (영구 저장)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS alert_events (
@@ -134,6 +180,40 @@ class LogManager:
             ON alert_events(date, sid, peer_ip)
         """)
 
+        # 경보 상태 전이 (enter/escalate/deescalate/clear) + 날짜/센서/레벨 인덱스
+        cursor.execute(_alerts.CREATE_TABLE)
+        cursor.execute(_alerts.CREATE_INDEX)
+
+        # 지난 날짜 센서 이력 (센서별 하루 1개 열 압축 청크) + 구간 색인
+        _ensure_archive_schema(cursor)
+
+        # 일괄 백필(sensor_batch) 중복 방지: (센서 ID, 부팅 ID, 시퀀스)별 측정 시각/수신 시각
+        # 이전 형식((센서 ID, 시퀀스) 키)은 부팅 ID 빈 문자열로 옮김
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(sensor_batch_seq)")]
+        if columns and "boot_id" not in columns:
+            cursor.execute("ALTER TABLE sensor_batch_seq RENAME TO sensor_batch_seq_old")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sensor_batch_seq (
+                sid TEXT NOT NULL,
+                boot_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                timestamp REAL NOT NULL,
+                received REAL NOT NULL,
+                PRIMARY KEY (sid, boot_id, seq)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sensor_batch_seq_received
+            ON sensor_batch_seq(received)
+        """)
+        if columns and "boot_id" not in columns:
+            cursor.execute(
+                "INSERT OR IGNORE INTO sensor_batch_seq (sid, boot_id, seq, timestamp, received) "
+                "SELECT sid, '', seq, timestamp, ? FROM sensor_batch_seq_old",
+                (time.time(),)
+            )
+            cursor.execute("DROP TABLE sensor_batch_seq_old")
+
         conn.commit()
         conn.close()
 
@@ -253,112 +333,281 @@ class LogManager:
         if self.config:
             self._check_and_log_warnings(sid, peer, data)
 
+    def record_alert_level(self, sid, peer, sensor_key, level, value, ts=None):
+        """측정값의 경보 레벨 기록 (레벨이 바뀔 때만 alert_transitions에 저장)
+
+        측정값마다 호출해도 됩니다. 같은 레벨이 이어지는 동안은 저장하지 않습니다.
+
+        Returns:
+            str: 기록한 전이 종류 ("enter" / "escalate" / "deescalate" / "clear") 또는 None
+        """
+        peer_ip = peer.split(":")[0] if peer else ""
+        timestamp = ts if isinstance(ts, (int, float)) else time.time()
+        return self._alert_journal.observe(sid, peer_ip, sensor_key, level, value, timestamp)
+
     def write_alert_event(self, sid, peer, sensor_key, level, value, ts=None):
-        """경보 이벤트를 SQLite alert_events 테이블에 기록"""
-        try:
+        """경보 이벤트 기록 (이전 호환: record_alert_level과 동일)"""
+        self.record_alert_level(sid, peer, sensor_key, level, value, ts)
+
+    def _write_alert_transitions(self, rows):
+        """경보 상태 전이 행 일괄 저장 (한 트랜잭션)"""
+        with self._db_lock:
             conn = self._get_db_connection()
-            cursor = conn.cursor()
+            try:
+                conn.executemany(_alerts.INSERT, rows)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    def flush_alerts(self):
+        """대기 중인 경보 전이 행 즉시 저장 (종료 시 등)"""
+        return self._alert_journal.flush()
+
+    def close(self):
+        """종료: 이력 압축기 중지 → 경보 전이 저장 → 로그 파일/DB 연결 닫기"""
+        if self._archiver is not None:
+            self._archiver.stop()
+            self._archiver = None
+        self.flush_alerts()
+        with self._db_lock:
+            for attr in ("_run_fp", "_data_fp", "_warning_fp"):
+                fp = getattr(self, attr)
+                if fp is not None:
+                    try:
+                        fp.close()
+                    except Exception:
+                        pass
+                    setattr(self, attr, None)
+            if self._db_conn is not None:
+                try:
+                    self._db_conn.close()
+                except Exception:
+                    pass
+                self._db_conn = None
 
-            peer_ip = peer.split(":")[0] if peer else ""
-            timestamp = ts if isinstance(ts, (int, float)) else time.time()
-            date = now_local().strftime("%Y%m%d")
+    def get_today_alerts_for(self, sid, peer):
+        """오늘의 경보 상태 전이 목록 반환 (최신순)
 
-            cursor.execute(
-                """
-                INSERT INTO alert_events (timestamp, date, sid, peer_ip, sensor_key, level, value)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (timestamp, date, sid, peer_ip, sensor_key, int(level), value)
-            )
-            conn.commit()
-        except Exception:
-            pass
+        이전 버전이 오늘 alert_events에 남긴 행도 함께 반환합니다 (전이 필드는 None).
 
-    def get_today_alerts_for(self, sid, peer):
-        """오늘의 경보 이벤트 목록 반환 (최신순)"""
+        Returns:
+            list: [{"ts", "sid", "key", "level", "value", "kind", "prev_level", "peak", "duration"}, ...]
+        """
+        self._alert_journal.flush()
         try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
-
             peer_ip = peer.split(":")[0] if peer else ""
             date = now_local().strftime("%Y%m%d")
 
-            cursor.execute(
-                """
-                SELECT timestamp, sensor_key, level, value
-                FROM alert_events
-                WHERE date = ? AND sid = ? AND peer_ip = ?
-                ORDER BY timestamp DESC
-                """,
-                (date, sid, peer_ip)
-            )
-            rows = cursor.fetchall()
+            with self._db_lock:
+                rows = self._get_db_connection().execute(
+                    """
+                    SELECT timestamp, sensor_key, level, value, kind, prev_level, peak, duration
+                    FROM alert_transitions
+                    WHERE date = ? AND sid = ? AND peer_ip = ?
+                    UNION ALL
+                    SELECT timestamp, sensor_key, level, value, NULL, NULL, NULL, NULL
+                    FROM alert_events
+                    WHERE date = ? AND sid = ? AND peer_ip = ?
+                    ORDER BY timestamp DESC
+                    """,
+                    (date, sid, peer_ip) * 2
+                ).fetchall()
             return [
                 {"ts": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(r[0])),
-                 "sid": sid, "key": r[1], "level": r[2], "value": r[3]} for r in rows
+                 "sid": sid, "key": r[1], "level": r[2], "value": r[3],
+                 "kind": r[4], "prev_level": r[5], "peak": r[6], "duration": r[7]} for r in rows
             ]
         except Exception:
             return []
 
-    def delete_today_alerts_for(self, sid, peer):
-        """해당 패널의 오늘 경보 이벤트를 모두 삭제"""
+    def get_today_alert_counts(self, sid, peer):
+        """오늘 경보 레벨별 건수 {3: int, 4: int, 5: int} (경보 시작/상승 전이 + 이전 버전 alert_events 행)"""
+        counts = {3: 0, 4: 0, 5: 0}
+        self._alert_journal.flush()
         try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
+            peer_ip = peer.split(":")[0] if peer else ""
+            date = now_local().strftime("%Y%m%d")
+            with self._db_lock:
+                rows = self._get_db_connection().execute(
+                    """
+                    SELECT level, COUNT(*)
+                    FROM (
+                        SELECT level FROM alert_transitions
+                        WHERE date = ? AND sid = ? AND peer_ip = ? AND kind IN ('enter', 'escalate')
+                        UNION ALL
+                        SELECT level FROM alert_events
+                        WHERE date = ? AND sid = ? AND peer_ip = ?
+                    )
+                    WHERE level >= ?
+                    GROUP BY level
+                    """,
+                    (date, sid, peer_ip) * 2 + (_alerts.ALARM_LEVEL,)
+                ).fetchall()
+            for level, count in rows:
+                if level in counts:
+                    counts[level] = count
+        except Exception:
+            pass
+        return counts
 
+    def delete_today_alerts_for(self, sid, peer):
+        """해당 패널의 오늘 경보 기록을 모두 삭제"""
+        try:
             peer_ip = peer.split(":")[0] if peer else ""
             date = now_local().strftime("%Y%m%d")
 
-            cursor.execute(
-                """
-                DELETE FROM alert_events
-                WHERE date = ? AND sid = ? AND peer_ip = ?
-                """,
-                (date, sid, peer_ip)
-            )
-            conn.commit()
+            self._alert_journal.forget(sid, peer_ip)
+            with self._db_lock:
+                conn = self._get_db_connection()
+                for table in ("alert_transitions", "alert_events"):
+                    conn.execute(
+                        f"""
+                        DELETE FROM {table}
+                        WHERE date = ? AND sid = ? AND peer_ip = ?
+                        """,
+                        (date, sid, peer_ip)
+                    )
+                conn.commit()
             return True
         except Exception:
             return False
 
+    _INSERT_SENSOR_DATA = """
+        INSERT INTO sensor_data
+        (timestamp, date, sid, peer_ip, co2, h2s, co, o2, temperature, humidity, lel, smoke, water)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _sensor_row(timestamp, date, sid, peer_ip, data):
+        """sensor_data INSERT 파라미터"""
+        return (
+            timestamp,
+            date,
+            sid,
+            peer_ip,
+            data.get("co2"),
+            data.get("h2s"),
+            data.get("co"),
+            data.get("o2"),
+            data.get("temperature"),
+            data.get("humidity"),
+            data.get("lel"),
+            data.get("smoke"),
+            data.get("water")
+        )
+
     def _save_to_database(self, sid, peer, data):
         """SQLite 데이터베이스에 센서 데이터 저장"""
         try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
-
             # peer에서 IP만 추출
             peer_ip = peer.split(":")[0] if peer else ""
-            timestamp = time.time()
             date = now_local().strftime("%Y%m%d")
 
-            cursor.execute("""
-                INSERT INTO sensor_data
-                (timestamp, date, sid, peer_ip, co2, h2s, co, o2, temperature, humidity, lel, smoke, water)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp,
-                date,
-                sid,
-                peer_ip,
-                data.get("co2"),
-                data.get("h2s"),
-                data.get("co"),
-                data.get("o2"),
-                data.get("temperature"),
-                data.get("humidity"),
-                data.get("lel"),
-                data.get("smoke"),
-                data.get("water")
-            ))
-
-            conn.commit()
+            with _DB_SAVE_SECONDS.time(), self._db_lock:
+                # 잠금 안에서 시각을 정해야 저장 순서와 timestamp 순서가 같음 (이력 캐시 증분 조회 기준)
+                timestamp = time.time()
+                conn = self._get_db_connection()
+                conn.execute(self._INSERT_SENSOR_DATA,
+                             self._sensor_row(timestamp, date, sid, peer_ip, data))
+                conn.commit()
+                self._history.note_write(sid, peer_ip, timestamp)
+            self._today_stats.add(date, sid, peer_ip, data)
         except Exception as e:
             # SQLite 오류 시 조용히 무시 (텍스트 로그는 이미 저장됨)
-            pass
+            _DB_SAVE_ERRORS.inc()
+
+    def save_batch(self, sid, peer, readings, boot_id=""):
+        """
+        일괄 백필 데이터 저장 (sensor_batch)
+
+        과거 측정값을 원래 타임스탬프로 한 트랜잭션에 저장합니다.
+        (센서 ID, 부팅 ID, 시퀀스)와 측정 시각이 같은 항목이 이미 저장되어 있으면 건너뛰므로
+        재전송해도 중복 저장되지 않습니다. 재부팅 후 seq가 0부터 다시 시작해도 부팅 ID가 다르거나
+        (부팅 ID를 보내지 않는 구버전 센서) 측정 시각이 다르면 새 측정값으로 저장합니다.
+        UI 갱신/경고 로그는 실시간 데이터에만 적용되므로 여기서는 하지 않습니다.
+
+        Args:
+            sid: 센서 ID
+            peer: "ip:port"
+            readings: [(seq, timestamp, data)] (seq 오름차순)
+            boot_id: 센서 부팅 ID (구버전 센서는 빈 문자열)
+
+        Returns:
+            (stored, duplicates): 새로 저장한 seq 목록, 이미 저장되어 있던 seq 목록
+
+        Raises:
+            sqlite3.Error: 저장 실패 (트랜잭션 롤백, 아무것도 확인하지 않아야 함)
+        """
+        if not readings:
+            return [], []
+
+        peer_ip = peer.split(":")[0] if peer else ""
+        first_seq, last_seq = readings[0][0], readings[-1][0]
+
+        now = time.time()
+        with self._db_lock:
+            conn = self._get_db_connection()
+            if now - self._batch_seq_pruned >= self.BATCH_SEQ_PRUNE_INTERVAL:
+                self._prune_batch_seq(conn, now)
+            seen = dict(conn.execute(
+                "SELECT seq, timestamp FROM sensor_batch_seq "
+                "WHERE sid = ? AND boot_id = ? AND seq BETWEEN ? AND ?",
+                (sid, boot_id, first_seq, last_seq)
+            ).fetchall())
+            existing = {seq for seq, ts, _ in readings if seen.get(seq) == ts}
+            new = [r for r in readings if r[0] not in existing]
+            if new:
+                try:
+                    rows = [
+                        self._sensor_row(ts, time.strftime("%Y%m%d", time.localtime(ts)), sid, peer_ip, data)
+                        for _, ts, data in new
+                    ]
+                    conn.executemany(self._INSERT_SENSOR_DATA, rows)
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO sensor_batch_seq (sid, boot_id, seq, timestamp, received) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(sid, boot_id, seq, ts, now) for seq, ts, _ in new]
+                    )
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                self._history.note_write(sid, peer_ip, min(ts for _, ts, _ in new))
+                for row, (_, _, data) in zip(rows, new):
+                    self._today_stats.add(row[1], sid, peer_ip, data)
+
+        # 텍스트 로그 백업 (원래 측정 시각으로 기록)
+        if new:
+            self._rotate_data()
+            lines = []
+            for _, ts, data in new:
+                try:
+                    s = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+                except Exception:
+                    s = str(data)
+                lines.append(f"{fmt_ts(ts)} | {self.srv} | {peer} | {sid} | {s}\n")
+            self._data_fp.write("".join(lines))
+
+        duplicates = [r[0] for r in readings if r[0] in existing]
+        return [r[0] for r in new], duplicates
+
+    def _prune_batch_seq(self, conn, now):
+        """보관 기간이 지난 백필 중복 방지 기록 삭제 (_db_lock 안에서 호출)"""
+        self._batch_seq_pruned = now
+        try:
+            conn.execute("DELETE FROM sensor_batch_seq WHERE received < ?", (now - self.BATCH_SEQ_RETENTION,))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"[LogManager] 백필 기록 정리 실패: {e}")
 
     def _check_and_log_warnings(self, sid, peer, data):
-        """임계값 초과 검사 및 경고 로그 작성"""
+        """임계값 초과 검사 및 경고 로그 작성
+
+        초과가 시작될 때와 정상으로 돌아올 때만 기록합니다 (지속 시간, 초과 중 최소/최대값 포함).
+        """
         from ..utils.helpers import SENSOR_KEYS
 
         for key in SENSOR_KEYS:
@@ -373,10 +622,22 @@ class LogManager:
 
             # 임계값 검사
             ok = self._check_threshold(key, fv)
+            state_key = (sid, peer, key)
+            excursion = self._warning_open.get(state_key)
             if not ok:
-                # 임계값 초과 시 경고 로그 작성
-                threshold_info = self._get_threshold_info(key, fv)
-                self.write_warning(sid, peer, key, fv, threshold_info)
+                if excursion is None:
+                    # 임계값 초과 시작 시 경고 로그 작성
+                    self._warning_open[state_key] = [time.time(), fv, fv]
+                    threshold_info = self._get_threshold_info(key, fv)
+                    self.write_warning(sid, peer, key, fv, f"{threshold_info} | 초과 시작")
+                else:
+                    excursion[1] = min(excursion[1], fv)
+                    excursion[2] = max(excursion[2], fv)
+            elif excursion is not None:
+                del self._warning_open[state_key]
+                started, lo, hi = excursion
+                self.write_warning(sid, peer, key, fv,
+                                   f"정상 복귀 | 지속 {time.time() - started:.0f}초 | 초과 중 범위 {lo:g}~{hi:g}")
 
     def _check_threshold(self, key, value):
         """5단계 경보 시스템 임계값 체크"""
@@ -443,70 +704,44 @@ class LogManager:
         return f"임계값 초과 (현재: {value})"
 
     def get_today_stats(self, sid, peer, sensor_key):
-        """오늘의 센서 데이터 통계 계산 (SQLite에서)
+        """오늘의 센서 데이터 통계 (메모리 집계, SQL 조회 없음)
 
         Returns:
             dict: {"min": float, "max": float, "avg": float, "count": int} 또는 None
         """
-        # 캐시 키 생성
         peer_ip = peer.split(":")[0] if peer else ""
-        cache_key = f"{sid}|{peer_ip}|{sensor_key}"
-
-        # 캐시 확인
-        current_time = time.time()
-        if cache_key in self._stats_cache:
-            cache_time = self._stats_cache_time.get(cache_key, 0)
-            if current_time - cache_time < self._cache_ttl:
-                return self._stats_cache[cache_key]
+        return self._today_stats.get(sid, peer_ip, sensor_key)
 
-        # SQLite에서 통계 계산 (훨씬 빠름)
-        try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
-
-            date = now_local().strftime("%Y%m%d")
+    def get_sensor_columns(self, sid, peer, hours, keys=None):
+        """지정된 시간 동안의 센서 이력 (열 배열) - 이력 캐시에서
 
-            # 유효한 값 필터링 조건
-            if sensor_key == "temperature":
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} BETWEEN -50 AND 50"
-            else:
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} >= 0"
-
-            query = f"""
-                SELECT
-                    MIN({sensor_key}) as min_val,
-                    MAX({sensor_key}) as max_val,
-                    AVG({sensor_key}) as avg_val,
-                    COUNT({sensor_key}) as count_val
-                FROM sensor_data
-                WHERE date = ? AND sid = ? AND peer_ip = ?
-                {filter_condition}
-            """
-
-            cursor.execute(query, (date, sid, peer_ip))
-            row = cursor.fetchone()
-
-            if row and row[3] > 0:  # count > 0
-                result = {
-                    "min": row[0],
-                    "max": row[1],
-                    "avg": row[2],
-                    "count": row[3]
-                }
-            else:
-                result = None
+        처음 조회 후에는 새로 저장된 행만 읽어 붙이므로 주기적인 그래프 갱신에 적합합니다.
 
-        except Exception:
-            result = None
-
-        # 캐시 저장
-        self._stats_cache[cache_key] = result
-        self._stats_cache_time[cache_key] = current_time
+        Args:
+            sid: 센서 ID
+            peer: 피어 주소
+            hours: 최근 몇 시간
+            keys: 반환할 센서 키 목록 (None이면 전체)
 
+        Returns:
+            dict: {"timestamp": ndarray, "co2": ndarray, ...} (읽기 전용, 값 없음 = NaN) 또는 None (조회 실패)
+        """
+        peer_ip = peer.split(":")[0] if peer else ""
+        now = time.time()
+        try:
+            with self._db_lock:
+                ts, vals = self._history.query(self._get_db_connection(), sid, peer_ip,
+                                               now - hours * 3600, now)
+        except Exception as e:
+            print(f"[LogManager] 이력 조회 실패: {e}")
+            return None
+        result = {"timestamp": ts}
+        for key in (keys or HISTORY_COLUMNS):
+            result[key] = column(vals, key)
         return result
 
     def get_sensor_data_for_hours(self, sid, peer, sensor_key, hours):
-        """지정된 시간 동안의 센서 데이터 반환 (timestamp, value) 튜플 리스트 - SQLite에서
+        """지정된 시간 동안의 센서 데이터 반환 (timestamp, value) 튜플 리스트 - 이력 캐시에서
 
         Args:
             sid: 센서 ID
@@ -519,50 +754,33 @@ class LogManager:
         """
         # 캐시 키 생성
         peer_ip = peer.split(":")[0] if peer else ""
-        cache_key = f"{sid}|{peer_ip}|{sensor_key}|{hours}"
+        cache_key = (sid, peer_ip, sensor_key, hours)
 
         # 캐시 확인
-        current_time = time.time()
-        if cache_key in self._data_cache:
-            cache_time = self._data_cache_time.get(cache_key, 0)
-            if current_time - cache_time < self._data_cache_ttl:
-                return self._data_cache[cache_key]
-
-        # SQLite에서 데이터 조회 (훨씬 빠름)
-        try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
+        cached = self._data_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            cutoff_time = current_time - (hours * 3600)
-
-            # 유효한 값 필터링 조건
+        cols = self.get_sensor_columns(sid, peer, hours, keys=[sensor_key]) if sensor_key in HISTORY_COLUMNS else None
+        if cols is None:
+            result = []
+        else:
+            values = cols[sensor_key]
+            # 유효한 값 필터링 (NULL/NaN, -1, 범위 밖 값 제외)
             if sensor_key == "temperature":
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} BETWEEN -50 AND 50"
+                mask = (values >= -50) & (values <= 50)
             else:
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} >= 0"
-
-            query = f"""
-                SELECT timestamp, {sensor_key}
-                FROM sensor_data
-                WHERE sid = ? AND peer_ip = ? AND timestamp >= ?
-                {filter_condition}
-                ORDER BY timestamp ASC
-            """
-
-            cursor.execute(query, (sid, peer_ip, cutoff_time))
-            result = cursor.fetchall()
-
-        except Exception:
-            result = []
+                mask = values >= 0
+            mask &= values != -1
+            result = list(zip(cols["timestamp"][mask].tolist(), values[mask].tolist()))
 
         # 캐시 저장
-        self._data_cache[cache_key] = result
-        self._data_cache_time[cache_key] = current_time
+        self._data_cache.put(cache_key, result)
 
         return result
 
     def get_sensor_history_hours(self, sid, peer, hours):
-        """지정된 시간 동안의 모든 센서 데이터 반환 - SQLite에서
+        """지정된 시간 동안의 모든 센서 데이터 반환 - 이력 캐시에서
 
         Args:
             sid: 센서 ID
@@ -574,38 +792,18 @@ class LogManager:
         """
         from datetime import datetime
 
-        try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
-
-            peer_ip = peer.split(":")[0] if peer else ""
-            current_time = time.time()
-            cutoff_time = current_time - (hours * 3600)
-
-            query = """
-                SELECT timestamp, co2, h2s, co, o2, temperature, humidity
-                FROM sensor_data
-                WHERE sid = ? AND peer_ip = ? AND timestamp >= ?
-                ORDER BY timestamp ASC
-            """
-
-            cursor.execute(query, (sid, peer_ip, cutoff_time))
-            rows = cursor.fetchall()
-
-            result = []
-            for row in rows:
-                entry = {
-                    "timestamp": datetime.fromtimestamp(row[0]),
-                    "co2": row[1],
-                    "h2s": row[2],
-                    "co": row[3],
-                    "o2": row[4],
-                    "temperature": row[5],
-                    "humidity": row[6]
-                }
-                result.append(entry)
-
-            return result
-
-        except Exception:
+        keys = ("co2", "h2s", "co", "o2", "temperature", "humidity")
+        cols = self.get_sensor_columns(sid, peer, hours, keys=keys)
+        if cols is None:
             return []
+        timestamps = cols["timestamp"].tolist()
+        # NaN(값 없음) → None
+        columns = [[None if v != v else v for v in cols[key].tolist()] for key in keys]
+
+        result = []
+        for i, ts in enumerate(timestamps):
+            entry = {"timestamp": datetime.fromtimestamp(ts)}
+            for key, values in zip(keys, columns):
+                entry[key] = values[i]
+            result.append(entry)
+        return result
@@ -0,0 +1,159 @@
+"""
+오늘 센서 통계 (메모리) + 크기 제한 캐시
+
+DailyStatsStore는 (sid, peer_ip, 센서 키)별 최소/최대/합계/개수를 수신 경로(LogManager 저장 시점)에서
+갱신하므로 오늘 통계 조회에 SQL 집계가 필요 없습니다 (O(1)).
+- 시작 시 SQLite에서 오늘 집계를 한 번만 읽어 초기값으로 사용
+- 날짜가 바뀌면(조회 또는 갱신 시점) 비우고 새 날짜로 다시 집계
+- 과거 날짜로 들어온 값(백필)은 오늘 통계에 포함하지 않음
+
+TTLCache는 항목별 만료 시간이 있는 LRU 캐시입니다 (최대 개수 초과 시 가장 오래 안 쓴 항목 제거).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from ..utils.helpers import SENSOR_KEYS, now_local
+
+
+def _today() -> str:
+    return now_local().strftime("%Y%m%d")
+
+
+def valid_stat_value(key: str, value) -> Optional[float]:
+    """통계에 포함할 값이면 float, 아니면 None (-1 = 센서 없음, 범위 밖 값 제외)"""
+    if value is None:
+        return None
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return None
+    if v == -1:
+        return None
+    if key == "temperature":
+        return v if -50 <= v <= 50 else None
+    return v if v >= 0 else None
+
+
+def _valid_sql(key: str) -> str:
+    """valid_stat_value와 같은 조건의 SQL 식"""
+    if key == "temperature":
+        return f"{key} IS NOT NULL AND {key} != -1 AND {key} BETWEEN -50 AND 50"
+    return f"{key} IS NOT NULL AND {key} != -1 AND {key} >= 0"
+
+
+class DailyStatsStore:
+    """오늘 센서 통계 (sid, peer_ip, 센서 키) → [최소, 최대, 합계, 개수]"""
+
+    def __init__(self, today: Callable[[], str] = _today):
+        """
+        Args:
+            today: 오늘 날짜("YYYYMMDD")를 반환하는 함수 (테스트에서 날짜 변경용)
+        """
+        self._today = today
+        self._lock = threading.Lock()
+        self._day: Optional[str] = None
+        self._stats: Dict[tuple, list] = {}
+
+    def _roll(self, today: str):
+        if self._day != today:
+            self._day = today
+            self._stats = {}
+
+    def seed(self, conn):
+        """SQLite에서 오늘 집계를 읽어 초기화 (시작 시 1회, GROUP BY 쿼리 1번)"""
+        today = self._today()
+        columns = []
+        for key in SENSOR_KEYS:
+            cond = _valid_sql(key)
+            columns.append(f"MIN(CASE WHEN {cond} THEN {key} END), MAX(CASE WHEN {cond} THEN {key} END), "
+                           f"SUM(CASE WHEN {cond} THEN {key} END), COUNT(CASE WHEN {cond} THEN 1 END)")
+        query = f"""
+            SELECT sid, peer_ip, {", ".join(columns)}
+            FROM sensor_data
+            WHERE date = ?
+            GROUP BY sid, peer_ip
+        """
+        stats = {}
+        for row in conn.execute(query, (today,)):
+            sid, peer_ip = row[0], row[1]
+            for i, key in enumerate(SENSOR_KEYS):
+                mn, mx, total, count = row[2 + i * 4:6 + i * 4]
+                if count:
+                    stats[(sid, peer_ip, key)] = [mn, mx, total, count]
+        with self._lock:
+            self._day = today
+            self._stats = stats
+        return len(stats)
+
+    def add(self, day: str, sid: str, peer_ip: str, data: dict):
+        """저장된 측정값 1건 반영 (day: 저장한 date 컬럼 값)"""
+        with self._lock:
+            self._roll(self._today())
+            if day != self._day:
+                return
+            for key in SENSOR_KEYS:
+                v = valid_stat_value(key, data.get(key))
+                if v is None:
+                    continue
+                entry = self._stats.get((sid, peer_ip, key))
+                if entry is None:
+                    self._stats[(sid, peer_ip, key)] = [v, v, v, 1]
+                else:
+                    if v < entry[0]:
+                        entry[0] = v
+                    if v > entry[1]:
+                        entry[1] = v
+                    entry[2] += v
+                    entry[3] += 1
+
+    def get(self, sid: str, peer_ip: str, key: str) -> Optional[dict]:
+        """오늘 통계 {"min", "max", "avg", "count"} (값이 없으면 None)"""
+        with self._lock:
+            self._roll(self._today())
+            entry = self._stats.get((sid, peer_ip, key))
+            if entry is None:
+                return None
+            mn, mx, total, count = entry
+        return {"min": mn, "max": mx, "avg": total / count, "count": count}
+
+
+class TTLCache:
+    """크기 제한 LRU 캐시 (항목별 만료 시간)"""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int = 256, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[object, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """만료되지 않은 값 (없으면 default)"""
+        with self._lock:
+            item = self._items.get(key, self._MISSING)
+            if item is self._MISSING:
+                return default
+            stored_at, value = item
+            if time.monotonic() - stored_at >= self.ttl:
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
@@ -7,6 +7,7 @@ v2.0 추가 기능:
 - TLS/SSL 지원
 - HMAC 메시지 서명
 - 세션 관리
+- 일괄 백필 (sensor_batch)
 """
 
 from .server import TcpServer, ClientSession
@@ -20,6 +21,8 @@ from .protocol import (
     SensorData,
     SensorUpdateMessage,
     SensorAckMessage,
+    SensorBatchMessage,
+    SensorBatchAckMessage,
     HeartbeatMessage,
     HeartbeatAckMessage,
     TimeSyncRequest,
@@ -30,7 +33,8 @@ from .protocol import (
     ConfigAck,
     AlertMessage,
     AlertAckMessage,
-    ErrorMessage
+    ErrorMessage,
+    seq_ranges
 )
 
 __all__ = [
@@ -45,6 +49,8 @@ __all__ = [
     'SensorData',
     'SensorUpdateMessage',
     'SensorAckMessage',
+    'SensorBatchMessage',
+    'SensorBatchAckMessage',
     'HeartbeatMessage',
     'HeartbeatAckMessage',
     'TimeSyncRequest',
@@ -55,5 +61,6 @@ __all__ = [
     'ConfigAck',
     'AlertMessage',
     'AlertAckMessage',
-    'ErrorMessage'
+    'ErrorMessage',
+    'seq_ranges'
 ]
@@ -9,6 +9,7 @@ v2.0 새 기능:
 - 시간 동기화
 - 설정 동기화
 - TLS/SSL 지원
+- 일괄 백필 (sensor_batch: 재접속 시 버퍼링된 측정값을 시퀀스 범위로 전송/확인)
 """
 
 import json
@@ -16,7 +17,7 @@ import uuid
 import time
 import hashlib
 import hmac
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List, Iterable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -36,6 +37,8 @@ class MessageType(Enum):
     # 센서 데이터
     SENSOR_UPDATE = "sensor_update"
     SENSOR_ACK = "sensor_ack"
+    SENSOR_BATCH = "sensor_batch"
+    SENSOR_BATCH_ACK = "sensor_batch_ack"
 
     # 하트비트
     HEARTBEAT = "heartbeat"
@@ -183,6 +186,41 @@ class SensorAckMessage(ProtocolMessage):
     alerts: list = field(default_factory=list)  # 경보 목록
 
 
+@dataclass
+class SensorBatchMessage(ProtocolMessage):
+    """
+    센서 데이터 일괄 전송 메시지 (재접속 후 백필)
+
+    readings: [{"seq": int, "ts": float(epoch), "data": {...}}, ...]
+    seq는 센서 부팅마다 0부터 단조 증가하는 번호이고, boot_id는 부팅마다 새로 만드는 식별자입니다.
+    (센서 ID, boot_id, seq)와 측정 시각이 같으면 재전송으로 보고 중복 저장하지 않습니다.
+    한 메시지에 MAX_BATCH_READINGS개를 넘으면 저장하지 않고 BATCH_TOO_LARGE 오류로 응답합니다.
+    """
+    type: str = "sensor_batch"
+    password: Optional[str] = None
+    version: Optional[str] = None
+    boot_id: str = ""  # 구버전 센서는 생략 (빈 문자열)
+    readings: list = field(default_factory=list)
+
+
+@dataclass
+class SensorBatchAckMessage(ProtocolMessage):
+    """
+    일괄 전송 수신 확인 (시퀀스 범위 단위)
+
+    acked: 저장(또는 이미 저장됨) 확인된 [시작, 끝] 범위 목록 → 센서 버퍼에서 삭제
+    rejected: 형식 오류로 저장하지 않은 범위 목록 → 재전송 불필요
+    """
+    type: str = "sensor_batch_ack"
+    status: str = "ok"
+    ref_msg_id: str = ""
+    boot_id: str = ""
+    acked: list = field(default_factory=list)
+    rejected: list = field(default_factory=list)
+    stored: int = 0
+    duplicates: int = 0
+
+
 @dataclass
 class HeartbeatMessage(ProtocolMessage):
     """하트비트 메시지"""
@@ -290,6 +328,11 @@ class ProtocolHandler:
         'water', 'lel', 'smoke'
     ]
 
+    # sensor_batch 한 메시지의 최대 측정값 수 (초과 시 BATCH_TOO_LARGE 오류, 저장 안 함)
+    MAX_BATCH_READINGS = 1000
+    # sensor_batch boot_id 최대 길이
+    MAX_BOOT_ID_LENGTH = 64
+
     def __init__(self, secret_key: Optional[str] = None, require_signature: bool = False):
         self.secret_key = secret_key
         self.require_signature = require_signature
@@ -372,6 +415,75 @@ class ProtocolHandler:
             sequence=self.get_next_sequence(session_id)
         )
 
+    def create_sensor_batch_ack(self, sensor_id: str, ref_msg_id: str,
+                                acked: List[int], rejected: List[int] = None,
+                                stored: int = 0, duplicates: int = 0,
+                                status: str = "ok", boot_id: str = "",
+                                session_id: str = "default") -> SensorBatchAckMessage:
+        """일괄 전송 수신 확인 생성 (시퀀스 목록 → 범위 목록)"""
+        return SensorBatchAckMessage(
+            id=sensor_id,
+            ref_msg_id=ref_msg_id,
+            status=status,
+            boot_id=boot_id,
+            acked=seq_ranges(acked),
+            rejected=seq_ranges(rejected or []),
+            stored=stored,
+            duplicates=duplicates,
+            sequence=self.get_next_sequence(session_id)
+        )
+
+    def parse_boot_id(self, value) -> Optional[str]:
+        """
+        sensor_batch의 boot_id 검증
+
+        Returns:
+            정규화된 boot_id (생략 시 빈 문자열), 형식이 잘못되었으면 None
+        """
+        if value is None:
+            return ""
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            return None
+        value = str(value)
+        if len(value) > self.MAX_BOOT_ID_LENGTH:
+            return None
+        return value
+
+    def parse_batch_readings(self, readings) -> Tuple[List[Tuple[int, float, Dict]], List[int]]:
+        """
+        sensor_batch의 readings 검증/정규화
+
+        항목 수 제한(MAX_BATCH_READINGS)은 호출하는 쪽에서 먼저 확인합니다 (초과 시 전체 거부).
+
+        Returns:
+            (valid, rejected): valid는 seq 오름차순 [(seq, ts, 정규화된 data)] (메시지 내 중복 seq 제거),
+                               rejected는 seq는 있으나 ts/data가 잘못된 항목의 seq 목록
+        """
+        valid: Dict[int, Tuple[int, float, Dict]] = {}
+        rejected = []
+        if not isinstance(readings, list):
+            return [], rejected
+
+        for item in readings:
+            if not isinstance(item, dict):
+                continue
+            seq = item.get("seq")
+            if isinstance(seq, bool) or not isinstance(seq, int) or seq < 0:
+                continue
+            ts = item.get("ts")
+            data = item.get("data")
+            if isinstance(ts, bool) or not isinstance(ts, (int, float)) or ts <= 0 \
+                    or not isinstance(data, dict):
+                rejected.append(seq)
+                continue
+            normalized = self.normalize_sensor_data(data)
+            if not normalized:
+                rejected.append(seq)
+                continue
+            valid[seq] = (seq, float(ts), normalized)
+
+        return [valid[seq] for seq in sorted(valid)], sorted(set(rejected) - set(valid))
+
     def create_heartbeat_ack(self, sensor_id: str, ref_msg_id: str,
                              session_id: str = "default") -> HeartbeatAckMessage:
         """하트비트 응답 생성"""
@@ -475,3 +587,14 @@ class ProtocolHandler:
             normalized['ch4'] = data['lel']
 
         return normalized
+
+
+def seq_ranges(seqs: Iterable[int]) -> List[List[int]]:
+    """시퀀스 번호 목록 → 연속 구간 [[시작, 끝], ...] (예: 1,2,3,5 → [[1,3],[5,5]])"""
+    ranges: List[List[int]] = []
+    for seq in sorted(set(seqs)):
+        if ranges and seq == ranges[-1][1] + 1:
+            ranges[-1][1] = seq
+        else:
+            ranges.append([seq, seq])
+    return ranges
@@ -9,6 +9,8 @@ v2.0 기능:
 - 시간/설정 동기화
 - TLS/SSL 지원 (선택적)
 - v1.x 역호환
+- 세션별 송신 큐 + 송신 스레드 (응답 병합 전송, 느린 클라이언트 차단, TLS는 수신 스레드에서 송신)
+- 일괄 백필 (sensor_batch → 저장소 직접 기록, 시퀀스 범위 확인)
 """
 
 import socket
@@ -18,19 +20,34 @@ import json
 import uuid
 import time
 import os
+from collections import deque
 from typing import Optional, Dict, Any, Callable
 from ..utils.helpers import now_local
+from ..utils.metrics import get_metrics
 from .protocol import (
     ProtocolHandler, MessageType, ProtocolVersion,
     HelloAckMessage, SensorAckMessage, HeartbeatAckMessage,
     TimeSyncResponse, ConfigResponse, AlertAckMessage, ErrorMessage
 )
 
+_TCP_SESSIONS = get_metrics().gauge("tcp_sessions", "현재 TCP 센서 세션 수")
+_TCP_SENT = get_metrics().counter("tcp_sent_messages_total", "센서로 송신한 메시지 수")
+_TCP_SEND_BATCHES = get_metrics().counter("tcp_send_batches_total", "센서 송신 sendall 호출 수")
+_TCP_DROPPED = get_metrics().counter("tcp_dropped_messages_total", "송신 큐가 가득 차 버린 메시지 수")
+
 
 class ClientSession:
-    """클라이언트 세션 정보"""
+    """
+    클라이언트 세션 정보
+
+    송신은 세션별 제한 크기 큐를 거쳐 전용 송신 스레드가 처리합니다.
+    수신 스레드와 push_config 등은 큐에 넣기만 하므로 느린 링크의 sendall에 묶이지 않고,
+    송신 스레드는 쌓인 메시지(ack 등)를 한 번의 send로 묶어 보냅니다.
+    TLS 연결은 SSLSocket의 recv/send를 여러 스레드에서 동시에 호출할 수 없으므로
+    송신 스레드 없이 수신 스레드가 recv 사이사이에 큐를 비웁니다.
+    """
 
-    def __init__(self, peer: str, conn: socket.socket):
+    def __init__(self, peer: str, conn: socket.socket, max_outbound: int = 256):
         self.peer = peer
         self.conn = conn
         self.session_id = str(uuid.uuid4())
@@ -44,6 +61,17 @@ class ClientSession:
         self.sequence = 0
         self.authenticated = False
 
+        # 송신 큐
+        self.max_outbound = max_outbound
+        self._outbound = deque()
+        self._out_cond = threading.Condition()
+        self._held = False  # 수신 청크 처리 중에는 송신 보류 (응답 병합)
+        self.closed = False
+        self.full_since: Optional[float] = None  # 큐가 가득 찬 시점 (비워지면 None)
+        self.dropped = 0          # 큐가 가득 차서 버린 메시지 수
+        self.sent_messages = 0
+        self.sent_batches = 0     # 실제 send 호출 수 (병합 효과 확인용)
+
     def update_rx(self):
         """수신 시간 업데이트"""
         self.last_rx = time.time()
@@ -52,6 +80,74 @@ class ClientSession:
         """송신 시간 업데이트"""
         self.last_tx = time.time()
 
+    def enqueue(self, payload: bytes) -> bool:
+        """
+        송신 큐에 추가 (블로킹 없음)
+
+        Returns:
+            bool: False면 큐가 가득 찼거나 세션이 닫혀 버려짐
+        """
+        with self._out_cond:
+            if self.closed:
+                return False
+            if len(self._outbound) >= self.max_outbound:
+                self.dropped += 1
+                if self.full_since is None:
+                    self.full_since = time.time()
+                return False
+            self._outbound.append(payload)
+            if not self._held:
+                self._out_cond.notify()
+            return True
+
+    def hold(self):
+        """송신 보류 시작 (이후 큐에 들어온 메시지는 release 때 한 번에 전송)"""
+        with self._out_cond:
+            self._held = True
+
+    def release(self):
+        """송신 보류 해제"""
+        with self._out_cond:
+            self._held = False
+            if self._outbound:
+                self._out_cond.notify()
+
+    def take_batch(self, max_bytes: int, timeout: float = 1.0) -> list:
+        """송신 스레드용: 대기 중인 메시지를 max_bytes 이내로 모두 꺼냄 (최소 1개)"""
+        with self._out_cond:
+            if (not self._outbound or self._held) and not self.closed:
+                self._out_cond.wait(timeout)
+            if self._held and not self.closed:
+                return []
+            batch, size = [], 0
+            while self._outbound:
+                if batch and size + len(self._outbound[0]) > max_bytes:
+                    break
+                payload = self._outbound.popleft()
+                batch.append(payload)
+                size += len(payload)
+            if batch:
+                self.full_since = None
+            return batch
+
+    def queued(self) -> int:
+        """송신 대기 메시지 수"""
+        return len(self._outbound)
+
+    def stalled_for(self, now: Optional[float] = None) -> float:
+        """송신 큐가 가득 찬 채로 지난 시간(초)"""
+        full_since = self.full_since
+        if full_since is None:
+            return 0.0
+        return (now or time.time()) - full_since
+
+    def close_outbound(self):
+        """송신 큐 닫기 (송신 스레드 종료)"""
+        with self._out_cond:
+            self.closed = True
+            self._outbound.clear()
+            self._out_cond.notify_all()
+
 
 class TcpServer:
     """TCP 수신 서버 v2.0: 라즈베리에서 오는 JSON Lines 처리"""
@@ -59,14 +155,20 @@ class TcpServer:
     # 프로토콜 버전
     PROTOCOL_VERSION = "2.0"
 
+    # TLS 연결의 recv 대기 간격 (이 간격마다 push_config 등 다른 스레드가 넣은 메시지 송신)
+    TLS_POLL_INTERVAL = 1.0
+
     def __init__(self, host, port, out_q, auth_validator=None, logger=None,
                  config_manager=None, tls_enabled=False, tls_cert=None, tls_key=None,
-                 hmac_secret=None, require_signature=False):
+                 hmac_secret=None, require_signature=False,
+                 send_queue_size=256, slow_consumer_timeout=10.0, max_coalesce_bytes=65536,
+                 send_timeout=30.0):
         self.host = host
         self.port = port
         self.q = out_q
         self.auth = auth_validator
         self._stop_evt = threading.Event()
+        self.listening = threading.Event()  # listen() 완료 시 set (시작 프로파일/대기용)
         self.log = logger
         self.config = config_manager
         self._server_thread = None
@@ -87,6 +189,12 @@ class TcpServer:
         self.sessions: Dict[str, ClientSession] = {}
         self._sessions_lock = threading.Lock()
 
+        # 송신 큐 설정
+        self.send_queue_size = send_queue_size              # 세션별 최대 대기 메시지 수
+        self.slow_consumer_timeout = slow_consumer_timeout  # 큐가 이 시간 이상 가득 차 있으면 연결 종료
+        self.max_coalesce_bytes = max_coalesce_bytes        # send 한 번에 묶는 최대 바이트
+        self.send_timeout = send_timeout                    # send 한 번이 이 시간 이상 막히면 연결 종료
+
         # 첫 센서값 스킵 추적 (peer 기준)
         self._first_sample_skipped = set()
 
@@ -139,6 +247,7 @@ class TcpServer:
             srv.bind((self.host, self.port))
             srv.listen(16)
             srv.settimeout(1.0)
+            self.listening.set()
 
             proto_info = "TLS" if self.tls_enabled else "TCP"
             print(f"[TcpServer v2.0] listening on {self.host}:{self.port} ({proto_info})")
@@ -163,6 +272,7 @@ class TcpServer:
                 t = threading.Thread(target=self._handle, args=(conn, addr), daemon=True)
                 t.start()
         finally:
+            self.listening.clear()
             try:
                 srv and srv.close()
             except:
@@ -176,9 +286,10 @@ class TcpServer:
         buf = b""
 
         # 세션 생성
-        session = ClientSession(peer, conn)
+        session = ClientSession(peer, conn, max_outbound=self.send_queue_size)
         with self._sessions_lock:
             self.sessions[peer] = session
+            _TCP_SESSIONS.set(len(self.sessions))
 
         if self.log:
             self.log.write_run(f"client connected {peer}")
@@ -186,20 +297,39 @@ class TcpServer:
         # TCP Keep-Alive 설정
         self._setup_keepalive(conn, peer)
 
+        # TLS: SSLSocket은 스레드 간 동시 recv/send가 안전하지 않으므로 송신 스레드 없이
+        # 수신 스레드가 짧은 간격으로 recv하며 큐를 직접 비움
+        sync_send = isinstance(conn, ssl.SSLSocket)
+        writer = None
+        if sync_send:
+            conn.settimeout(self.TLS_POLL_INTERVAL)
+        else:
+            # 소켓 타임아웃은 recv/send 공용이므로 송신 제한 시간에 맞춤
+            # (수신 타임아웃은 루프에서 무시되므로 영향 없음)
+            conn.settimeout(min(60.0, self.send_timeout))
+            writer = threading.Thread(target=self._writer, args=(session,), daemon=True)
+            writer.start()
+
         try:
-            conn.settimeout(60.0)
             while not self._stop_evt.is_set():
+                if sync_send and not self._flush(session):
+                    break
                 try:
                     chunk = conn.recv(4096)
                     if not chunk:
                         break
                     buf += chunk
-                    while b"\n" in buf:
-                        line, buf = buf.split(b"\n", 1)
-                        line = line.strip()
-                        if not line:
-                            continue
-                        self._process_message(line, session)
+                    # 한 청크에 담긴 메시지들의 응답은 모아서 한 번에 전송
+                    session.hold()
+                    try:
+                        while b"\n" in buf:
+                            line, buf = buf.split(b"\n", 1)
+                            line = line.strip()
+                            if not line:
+                                continue
+                            self._process_message(line, session)
+                    finally:
+                        session.release()
                 except socket.timeout:
                     continue
                 except Exception as e:
@@ -207,6 +337,9 @@ class TcpServer:
                         self.log.write_run(f"connection error {peer}: {e}")
                     break
         finally:
+            session.close_outbound()
+            if writer is not None:
+                writer.join(timeout=2.0)
             try:
                 conn.close()
             except:
@@ -216,10 +349,76 @@ class TcpServer:
             with self._sessions_lock:
                 if peer in self.sessions:
                     del self.sessions[peer]
+                _TCP_SESSIONS.set(len(self.sessions))
 
             if self.log:
                 self.log.write_run(f"client disconnected {peer}")
 
+    def _writer(self, session: ClientSession):
+        """세션 송신 스레드: 큐에 쌓인 메시지를 묶어서 한 번에 전송"""
+        while not session.closed and not self._stop_evt.is_set():
+            batch = session.take_batch(self.max_coalesce_bytes)
+            if not batch:
+                continue
+            if not self._send_batch(session, batch):
+                return
+
+    def _flush(self, session: ClientSession) -> bool:
+        """
+        수신 스레드에서 송신 큐 비우기 (TLS 연결용, 대기 없음)
+
+        Returns:
+            bool: False면 송신 실패 또는 세션 종료 (연결 정리)
+        """
+        conn = session.conn
+        while not session.closed:
+            batch = session.take_batch(self.max_coalesce_bytes, timeout=0)
+            if not batch:
+                return not session.closed
+            conn.settimeout(self.send_timeout)
+            try:
+                if not self._send_batch(session, batch):
+                    return False
+            finally:
+                try:
+                    conn.settimeout(self.TLS_POLL_INTERVAL)
+                except OSError:
+                    pass
+        return False
+
+    def _send_batch(self, session: ClientSession, batch: list) -> bool:
+        """
+        묶음 전송 (송신 실패 시 세션 종료)
+
+        Returns:
+            bool: 전송 성공 여부
+        """
+        try:
+            session.conn.sendall(b"".join(batch))
+        except Exception as e:
+            if not session.closed:
+                if self.log:
+                    self.log.write_run(f"send error {session.peer}: {e}")
+                self._disconnect(session)
+            return False
+        session.sent_messages += len(batch)
+        session.sent_batches += 1
+        _TCP_SENT.inc(len(batch))
+        _TCP_SEND_BATCHES.inc()
+        session.update_tx()
+        return True
+
+    def _disconnect(self, session: ClientSession):
+        """세션 강제 종료 (수신 스레드가 recv에서 빠져나와 정리)"""
+        session.close_outbound()
+        if isinstance(session.conn, ssl.SSLSocket):
+            # TLS: 다른 스레드에서 shutdown하지 않음 (수신 스레드가 TLS_POLL_INTERVAL 안에 닫힘을 보고 정리)
+            return
+        try:
+            session.conn.shutdown(socket.SHUT_RDWR)
+        except Exception:
+            pass
+
     def _setup_keepalive(self, conn, peer):
         """TCP Keep-Alive 설정"""
         try:
@@ -272,6 +471,11 @@ class TcpServer:
             self._handle_heartbeat(obj, session)
             return
 
+        # v2.x 일괄 백필
+        if msg_type == "sensor_batch":
+            self._handle_sensor_batch(obj, session)
+            return
+
         # 센서 데이터 / 알림
         if msg_type in ["sensor_update", "water_leak_alert", "water_normal_alert",
                         "gas_alert", "ext_input_alert"]:
@@ -448,15 +652,104 @@ class TcpServer:
             )
             self._send_message(session, ack.to_dict())
 
-    def _send_message(self, session: ClientSession, msg: Dict):
-        """메시지 전송"""
+    def _handle_sensor_batch(self, obj: Dict, session: ClientSession):
+        """
+        일괄 백필 처리 (재접속 후 버퍼링된 과거 측정값)
+
+        과거 값은 UI 큐/첫 샘플 스킵/경고 판정을 거치지 않고 저장소에 한 트랜잭션으로 기록하며,
+        저장된(또는 이미 저장되어 있던) 시퀀스를 범위로 묶어 확인합니다.
+        """
+        sid = obj.get("id", session.sensor_id or session.peer.split(":")[0])
+        msg_id = obj.get("msg_id", "")
+        session.sensor_id = sid
+
+        def send_error(code, message):
+            error = self.protocol.create_error(
+                sensor_id=sid,
+                error_code=code,
+                error_message=message,
+                ref_msg_id=msg_id,
+                session_id=session.session_id
+            )
+            self._send_message(session, error.to_dict())
+
+        # 인증 검사
+        if self.auth and not self.auth(sid, obj.get("password")):
+            if self.log:
+                self.log.write_run(f"auth NG {session.peer} id={sid}")
+            send_error("AUTH_FAILED", "Authentication failed")
+            return
+
+        session.authenticated = True
+
+        if not self.log or not hasattr(self.log, "save_batch"):
+            send_error("STORAGE_UNAVAILABLE", "Batch storage not available")
+            return
+
+        # 너무 큰 배치는 일부만 저장/확인하지 않고 전체 거부 (센서가 나누어 재전송)
+        raw_readings = obj.get("readings")
+        limit = self.protocol.MAX_BATCH_READINGS
+        if isinstance(raw_readings, list) and len(raw_readings) > limit:
+            self.log.write_run(f"batch too large {session.peer} id={sid}: {len(raw_readings)} > {limit}")
+            send_error("BATCH_TOO_LARGE", f"Batch has {len(raw_readings)} readings, max {limit}")
+            return
+
+        boot_id = self.protocol.parse_boot_id(obj.get("boot_id"))
+        if boot_id is None:
+            send_error("INVALID_BOOT_ID", f"boot_id must be a string of at most "
+                                          f"{self.protocol.MAX_BOOT_ID_LENGTH} characters")
+            return
+
+        readings, rejected = self.protocol.parse_batch_readings(raw_readings)
         try:
-            data = json.dumps(msg, ensure_ascii=False) + "\n"
-            session.conn.sendall(data.encode("utf-8"))
-            session.update_tx()
+            stored, duplicates = self.log.save_batch(sid, session.peer, readings, boot_id=boot_id)
+        except Exception as e:
+            self.log.write_run(f"batch store error {session.peer} id={sid}: {e}")
+            send_error("STORAGE_ERROR", "Batch could not be stored, retry later")
+            return
+
+        self.log.write_run(
+            f"batch {session.peer} id={sid} boot={boot_id or '-'} stored={len(stored)} "
+            f"duplicates={len(duplicates)} rejected={len(rejected)}"
+        )
+
+        # 연결 상태만 갱신 (과거 값은 화면에 그리지 않음)
+        self.q.put(("__data__", {"sid": sid, "peer": session.peer, "data": {}, "version": None}))
+
+        ack = self.protocol.create_sensor_batch_ack(
+            sensor_id=sid,
+            ref_msg_id=msg_id,
+            acked=stored + duplicates,
+            rejected=rejected,
+            stored=len(stored),
+            duplicates=len(duplicates),
+            boot_id=boot_id,
+            session_id=session.session_id
+        )
+        self._send_message(session, ack.to_dict())
+
+    def _send_message(self, session: ClientSession, msg: Dict) -> bool:
+        """메시지 전송 (송신 큐에 넣기만 함, 블로킹 없음)"""
+        try:
+            data = (json.dumps(msg, ensure_ascii=False) + "\n").encode("utf-8")
         except Exception as e:
             if self.log:
                 self.log.write_run(f"send error {session.peer}: {e}")
+            return False
+
+        if session.enqueue(data):
+            return True
+        _TCP_DROPPED.inc()
+
+        # 느린 클라이언트: 큐가 계속 가득 차 있으면 연결 종료
+        if not session.closed and session.stalled_for() >= self.slow_consumer_timeout:
+            if self.log:
+                self.log.write_run(
+                    f"slow consumer {session.peer} id={session.sensor_id}: "
+                    f"queue full {session.stalled_for():.1f}s, dropped={session.dropped}, disconnecting"
+                )
+            self._disconnect(session)
+        return False
 
     def _get_sensor_config(self, config_type: str = "all") -> Dict:
         """센서 설정 반환"""
@@ -623,25 +916,50 @@ class TcpServer:
 
         return alerts
 
-    def push_config(self, sensor_id: str = None):
+    def broadcast(self, build_message: Callable[[ClientSession], Optional[Dict]],
+                  sensor_id: str = None, v2_only: bool = True) -> int:
+        """
+        여러 세션에 메시지 전송 (송신 큐에 넣기만 함)
+
+        세션 목록은 잠금 안에서 복사만 하고, 메시지 생성/큐 삽입은 잠금 밖에서 수행하므로
+        느린 센서가 있어도 새 연결 등록이나 다른 센서 응답을 막지 않습니다.
+
+        Args:
+            build_message: 세션 → 메시지 dict (None이면 건너뜀)
+            sensor_id: 지정 시 해당 센서 세션에만 전송
+            v2_only: True면 v2.0 세션에만 전송
+
+        Returns:
+            int: 큐에 들어간 메시지 수
+        """
+        with self._sessions_lock:
+            targets = list(self.sessions.values())
+
+        queued = 0
+        for session in targets:
+            if sensor_id and session.sensor_id != sensor_id:
+                continue
+            if v2_only and session.protocol_version != "2.0":
+                continue
+            msg = build_message(session)
+            if msg is not None and self._send_message(session, msg):
+                queued += 1
+        return queued
+
+    def push_config(self, sensor_id: str = None) -> int:
         """설정을 센서에 푸시"""
         config = self._get_sensor_config("all")
         self._config_version = str(int(time.time()))
 
-        with self._sessions_lock:
-            for peer, session in self.sessions.items():
-                if sensor_id and session.sensor_id != sensor_id:
-                    continue
-                if session.protocol_version != "2.0":
-                    continue
-
-                push = self.protocol.create_config_push(
-                    sensor_id=session.sensor_id or "unknown",
-                    config=config,
-                    config_version=self._config_version,
-                    session_id=session.session_id
-                )
-                self._send_message(session, push.to_dict())
+        return self.broadcast(
+            lambda session: self.protocol.create_config_push(
+                sensor_id=session.sensor_id or "unknown",
+                config=config,
+                config_version=self._config_version,
+                session_id=session.session_id
+            ).to_dict(),
+            sensor_id=sensor_id
+        )
 
     def get_connected_sensors(self) -> list:
         """연결된 센서 목록 반환"""
@@ -654,7 +972,11 @@ class TcpServer:
                     "firmware_version": s.firmware_version,
                     "connected_at": s.connected_at,
                     "last_rx": s.last_rx,
-                    "authenticated": s.authenticated
+                    "authenticated": s.authenticated,
+                    "out_queue": s.queued(),
+                    "dropped": s.dropped,
+                    "sent_messages": s.sent_messages,
+                    "sent_batches": s.sent_batches
                 }
                 for s in self.sessions.values()
             ]
@@ -7,7 +7,9 @@
 
 import cv2
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from ..utils.color_lut import HSVColorLUT, center_crop
 
 
 class ColorAnalyzer:
@@ -77,6 +79,8 @@ class ColorAnalyzer:
     def __init__(self, color_ranges: Optional[Dict] = None):
         """색상 분석기 초기화"""
         self.color_ranges = color_ranges or self.DEFAULT_COLOR_RANGES
+        # 색상 범위 → HSV 룩업 테이블 (색상별 inRange 반복 대신 픽셀당 1회 조회)
+        self._lut = HSVColorLUT.from_ranges(self.color_ranges)
 
     def analyze(self, image: np.ndarray) -> Tuple[str, str]:
         """
@@ -88,32 +92,40 @@ class ColorAnalyzer:
         Returns:
             (영문 색상명, 한글 색상명)
         """
-        if image is None or image.size == 0:
-            return 'unknown', self.COLOR_NAMES_KR['unknown']
-
-        # BGR -> HSV 변환
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-
-        # 이미지 중앙 영역만 분석
-        h, w = hsv.shape[:2]
-        margin_h, margin_w = h // 4, w // 4
-        hsv_center = hsv[margin_h:h-margin_h, margin_w:w-margin_w]
-        if hsv_center.size == 0:
-            hsv_center = hsv
-
-        # 각 색상별 픽셀 수 계산
-        color_counts = {}
+        return self.analyze_batch([image])[0]
 
-        for color_name, ranges in self.color_ranges.items():
-            if color_name == 'red':
-                mask1 = cv2.inRange(hsv_center, ranges['lower1'], ranges['upper1'])
-                mask2 = cv2.inRange(hsv_center, ranges['lower2'], ranges['upper2'])
-                mask = cv2.bitwise_or(mask1, mask2)
-            else:
-                mask = cv2.inRange(hsv_center, ranges['lower'], ranges['upper'])
+    def analyze_batch(self, images: List[np.ndarray]) -> List[Tuple[str, str]]:
+        """
+        여러 ROI의 주요 색상을 한 번에 분석 (한 프레임의 헬멧/조끼 등)
 
-            color_counts[color_name] = cv2.countNonZero(mask)
+        Args:
+            images: BGR 이미지(ROI) 목록
 
+        Returns:
+            ROI별 (영문 색상명, 한글 색상명) 목록
+        """
+        unknown = ('unknown', self.COLOR_NAMES_KR['unknown'])
+        results = [unknown] * len(images)
+
+        # BGR -> HSV 변환 (이미지 중앙 영역만 분석)
+        slots, hsv_centers = [], []
+        for i, image in enumerate(images):
+            if image is None or image.size == 0:
+                continue
+            slots.append(i)
+            hsv_centers.append(center_crop(cv2.cvtColor(image, cv2.COLOR_BGR2HSV)))
+        if not slots:
+            return results
+
+        # 각 색상별 픽셀 수 계산 (범위가 겹치면 각 색상에 모두 포함)
+        counts = self._lut.histograms(hsv_centers)
+        for k, i in enumerate(slots):
+            color_counts = dict(zip(self._lut.names, counts[k]))
+            results[i] = self._pick_color(color_counts, hsv_centers[k])
+        return results
+
+    def _pick_color(self, color_counts: Dict[str, float], hsv_center: np.ndarray) -> Tuple[str, str]:
+        """색상별 픽셀 수 → 대표 색상 (최소 비율, 노랑/갈색 구분, 우선순위 적용)"""
         total_pixels = hsv_center.shape[0] * hsv_center.shape[1]
         if total_pixels == 0:
             return 'unknown', self.COLOR_NAMES_KR['unknown']
@@ -126,8 +138,7 @@ class ColorAnalyzer:
 
         # 노란색과 갈색이 둘 다 감지되면 평균 명도/채도로 구분
         if 'yellow' in valid_colors and 'brown' in valid_colors:
-            # 평균 H, S, V 계산
-            h_mean = np.mean(hsv_center[:, :, 0])
+            # 평균 S, V 계산
             s_mean = np.mean(hsv_center[:, :, 1])
             v_mean = np.mean(hsv_center[:, :, 2])
 
@@ -7,6 +7,8 @@ GARAMe Manager 1.9.8.2 통합 버전 (GPU 자동 감지 지원)
 """
 
 import os
+from contextlib import nullcontext
+
 import cv2
 import numpy as np
 from typing import List, Dict, Optional, Tuple
@@ -389,12 +391,15 @@ class PPEDetector:
         """PPE 감지 가능 여부"""
         return self.model is not None
 
-    def detect(self, frame: np.ndarray) -> List[PersonDetection]:
+    def detect(self, frame: np.ndarray, budget=None) -> List[PersonDetection]:
         """
         프레임에서 사람과 PPE 감지
 
         Args:
             frame: BGR 이미지
+            budget: 단계별 시간 예산 (sensor.stage_budget.StageBudget, 있으면 메인/안전화 모델 시간을
+                'ppe_v10'/'boots_v10'으로 측정하고 입력 크기와 안전화 모델 실행 주기를 따름,
+                건너뛴 프레임의 안전화 박스는 그 예산의 budget.results['boots_v10']에서 재사용)
 
         Returns:
             PersonDetection 리스트
@@ -417,15 +422,20 @@ class PPEDetector:
         persons = []
         ppe_items = []
 
+        # 시간 예산 초과 시 입력 크기 축소 (예산이 없으면 모델 기본 입력 크기)
+        size_kw = {'imgsz': budget.input_size('ppe_v10', 640)} if budget is not None else {}
+
         # YOLO 메인 모델 감지 수행
         try:
-            results = self.model(
-                frame,
-                conf=self.confidence_threshold,
-                iou=self.iou_threshold,
-                device=DEVICE,
-                verbose=False
-            )
+            with budget.measure('ppe_v10') if budget is not None else nullcontext():
+                results = self.model(
+                    frame,
+                    conf=self.confidence_threshold,
+                    iou=self.iou_threshold,
+                    device=DEVICE,
+                    verbose=False,
+                    **size_kw
+                )
         except Exception as e:
             print(f"[PPE] 감지 오류: {e}")
             return []
@@ -459,16 +469,21 @@ class PPEDetector:
                 elif normalized_name in ['helmet', 'glasses', 'mask', 'gloves', 'vest']:
                     ppe_items.append((normalized_name, bbox))
 
-        # 안전화 모델로 boots 감지 (별도 모델)
-        if self.boots_model is not None:
+        # 안전화 모델로 boots 감지 (별도 모델, 시간 예산에 따라 N프레임마다 - 건너뛴 프레임은 이전 박스)
+        if self.boots_model is not None and budget is not None and not budget.due('boots_v10'):
+            ppe_items.extend(budget.results.get('boots_v10', []))
+        elif self.boots_model is not None:
             try:
-                boots_results = self.boots_model(
-                    frame,
-                    conf=self.confidence_threshold,
-                    iou=self.iou_threshold,
-                    device=DEVICE,
-                    verbose=False
-                )
+                with budget.measure('boots_v10') if budget is not None else nullcontext():
+                    boots_results = self.boots_model(
+                        frame,
+                        conf=self.confidence_threshold,
+                        iou=self.iou_threshold,
+                        device=DEVICE,
+                        verbose=False,
+                        **size_kw
+                    )
+                boots_items = []
                 for result in boots_results:
                     boxes = result.boxes
                     if boxes is None:
@@ -488,7 +503,10 @@ class PPEDetector:
                                 class_id=cls_id,
                                 class_name=cls_name
                             )
-                            ppe_items.append(('boots', bbox))
+                            boots_items.append(('boots', bbox))
+                if budget is not None:
+                    budget.results['boots_v10'] = boots_items
+                ppe_items.extend(boots_items)
             except Exception as e:
                 print(f"[PPE] 안전화 감지 오류: {e}")
 
@@ -531,6 +549,7 @@ class PPEDetector:
     ) -> PPEStatus:
         """사람 영역에 PPE 매칭"""
         status = PPEStatus()
+        color_rois = []  # (장구, ROI) - 매칭 후 한 번에 색상 분석
 
         # 사람 박스 확장 (장갑은 손에 있어서 박스 밖일 수 있음)
         expanded_person_bbox = BoundingBox(
@@ -554,10 +573,7 @@ class PPEDetector:
             if ppe_type == 'helmet' and not status.helmet:
                 status.helmet = True
                 status.helmet_bbox = ppe_bbox
-                roi = self._extract_roi(frame, ppe_bbox)
-                color, color_kr = self.color_analyzer.analyze(roi)
-                status.helmet_color = color
-                status.helmet_color_kr = color_kr
+                color_rois.append(('helmet', self._extract_roi(frame, ppe_bbox)))
 
             elif ppe_type == 'glasses' and not status.glasses:
                 status.glasses = True
@@ -587,15 +603,18 @@ class PPEDetector:
             elif ppe_type == 'vest' and not status.vest:
                 status.vest = True
                 status.vest_bbox = ppe_bbox
-                roi = self._extract_roi(frame, ppe_bbox)
-                color, color_kr = self.color_analyzer.analyze(roi)
-                status.vest_color = color
-                status.vest_color_kr = color_kr
+                color_rois.append(('vest', self._extract_roi(frame, ppe_bbox)))
 
             elif ppe_type == 'boots' and not status.boots:
                 status.boots = True
                 status.boots_bbox = ppe_bbox
 
+        if color_rois:
+            colors = self.color_analyzer.analyze_batch([roi for _, roi in color_rois])
+            for (ppe_type, _), (color, color_kr) in zip(color_rois, colors):
+                setattr(status, f'{ppe_type}_color', color)
+                setattr(status, f'{ppe_type}_color_kr', color_kr)
+
         return status
 
     def _is_inside(self, x: int, y: int, bbox: BoundingBox) -> bool:
@@ -17,6 +17,7 @@ except ImportError:
     PIL_AVAILABLE = False
 
 from .detector import PersonDetection, PPEStatus, BoundingBox
+from ..utils.text_sprite import get_text_sprite_cache
 
 
 class PPEVisualizer:
@@ -99,7 +100,7 @@ class PPEVisualizer:
         font_size: int = None
     ) -> np.ndarray:
         """
-        OpenCV 프레임에 한글 텍스트 추가
+        OpenCV 프레임에 한글 텍스트 추가 (프레임을 직접 수정)
 
         Args:
             frame: BGR 이미지
@@ -122,12 +123,8 @@ class PPEVisualizer:
                 cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
                 return frame
 
-            img_pil = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-            draw = ImageDraw.Draw(img_pil)
-            # BGR -> RGB
-            color_rgb = (color[2], color[1], color[0])
-            draw.text(position, text, font=font, fill=color_rgb)
-            return cv2.cvtColor(np.array(img_pil), cv2.COLOR_RGB2BGR)
+            # 스프라이트 캐시: 라벨 영역만 알파 블렌딩 (전체 프레임 변환 없음)
+            return get_text_sprite_cache().draw(frame, text, position, font, color)
         except Exception as e:
             cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
             return frame
@@ -6,6 +6,15 @@ TCP Monitor 센서 데이터 처리 모듈
 
 from .history import SensorHistory
 from .alerts import AlertManager
-from .safety_detector import SafetyEquipmentDetector
+
+
+def __getattr__(name):
+    """SafetyEquipmentDetector는 cv2/torch/insightface를 로드하므로 최초 접근 시 import"""
+    if name == 'SafetyEquipmentDetector':
+        from .safety_detector import SafetyEquipmentDetector
+        globals()[name] = SafetyEquipmentDetector
+        return SafetyEquipmentDetector
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ['SensorHistory', 'AlertManager', 'SafetyEquipmentDetector']
@@ -123,11 +123,17 @@ def _play_audio_file(file_path):
 class AlertManager:
     """센서 알림 관리자 - 5단계 경보 시스템"""
 
-    def __init__(self, config):
+    def __init__(self, config, enable_tts=True):
+        """
+        Args:
+            config: ConfigManager (std/env 임계값)
+            enable_tts: False면 음성 엔진/워커를 시작하지 않음 (재생/백테스트 등 헤드리스 용도)
+        """
         self.config = config
         self._last_alarm_state = {k: None for k in ["co2", "o2", "h2s", "co", "lel", "smoke", "temperature", "humidity", "water"]}
-        self._tts_lock = threading.Lock() if TTS_OK else None
-        self._tts_enabled = TTS_OK  # TTS 활성화 여부
+        tts_ok = TTS_OK and enable_tts
+        self._tts_lock = threading.Lock() if tts_ok else None
+        self._tts_enabled = tts_ok  # TTS 활성화 여부
         self._tts_cache_dir = Path(tempfile.gettempdir()) / "garame_tts_cache"
 
         # 음성 알림 큐 (순차적 재생용)
@@ -137,7 +143,7 @@ class AlertManager:
         self._tts_worker_thread = None
 
         # TTS 캐시 디렉토리 생성
-        if TTS_OK:
+        if tts_ok:
             try:
                 self._tts_cache_dir.mkdir(parents=True, exist_ok=True)
                 print(f"[TTS] gTTS 엔진 초기화 완료 (캐시: {self._tts_cache_dir})")
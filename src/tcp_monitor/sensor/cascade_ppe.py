@@ -0,0 +1,259 @@
+"""
+2단계(캐스케이드) PPE 감지 파이프라인 - 고해상도 IP 카메라용
+
+전체 프레임(예: 2304x1296)을 PPE 모델 입력 크기(640/1280)로 줄이면
+멀리 있는 작업자의 헬멧/장갑이 몇 픽셀로 작아져 인식이 어렵습니다.
+
+1단계: 경량 사람 감지 모델을 축소 프레임(640)에서 실행
+       (선택) SAHI 방식 타일 분할로 원거리 소형 인물 보강
+2단계: 원본 해상도에서 사람 영역을 잘라 PPE/보조 모델을 배치(batch)로 실행,
+       얼굴 인식은 머리 영역 crop에서 수행
+
+사람 수가 적을 때(일반적인 출입구 상황) 1280 전체 프레임 추론보다 연산량이 적고,
+crop이 모델 입력 크기로 확대되므로 소형 객체 인식률이 올라갑니다.
+"""
+
+import cv2
+import numpy as np
+
+
+COCO_PERSON_CLASS = 0
+
+
+class CascadePPEPipeline:
+    """사람 감지 → 사람 crop 배치 PPE 추론"""
+
+    def __init__(self, person_model, person_imgsz=640, person_conf=0.25,
+                 crop_imgsz=320, crop_pad=0.15, max_persons=6, min_person_px=24,
+                 tiling=False, tile_size=960, tile_overlap=0.2, merge_iou=0.5):
+        """
+        Args:
+            person_model: 사람 감지용 YOLO 모델 (COCO, class 0 = person)
+            person_imgsz: 1단계 추론 크기
+            person_conf: 1단계 사람 신뢰도 임계값
+            crop_imgsz: 2단계 crop 추론 크기
+            crop_pad: 사람 박스 여백 비율 (헬멧/신발이 잘리지 않도록)
+            max_persons: 2단계에서 처리할 최대 인원 (큰 박스 우선)
+            min_person_px: 이보다 작은 사람 박스는 무시 (원본 픽셀 기준 높이)
+            tiling: True면 1단계를 원본 타일 단위로도 실행 (SAHI 방식)
+            tile_size: 타일 한 변 크기 (원본 픽셀)
+            tile_overlap: 타일 겹침 비율
+            merge_iou: crop/타일 간 중복 박스 병합 NMS IoU
+        """
+        self.person_model = person_model
+        self.person_imgsz = person_imgsz
+        self.person_conf = person_conf
+        self.crop_imgsz = crop_imgsz
+        self.crop_pad = crop_pad
+        self.max_persons = max_persons
+        self.min_person_px = min_person_px
+        self.tiling = tiling
+        self.tile_size = tile_size
+        self.tile_overlap = tile_overlap
+        self.merge_iou = merge_iou
+
+        # 마지막 실행 결과 (얼굴 crop 재사용 및 디버그용)
+        self.last_persons = []
+        self.last_regions = []
+
+    @classmethod
+    def from_settings(cls, person_model, cfg):
+        """성능 모드 설정(PERFORMANCE_MODE_SETTINGS[...]['ppe_cascade'])으로 생성"""
+        cfg = cfg or {}
+        return cls(
+            person_model,
+            person_imgsz=cfg.get('person_imgsz', 640),
+            person_conf=cfg.get('person_conf', 0.25),
+            crop_imgsz=cfg.get('crop_imgsz', 320),
+            crop_pad=cfg.get('crop_pad', 0.15),
+            max_persons=cfg.get('max_persons', 6),
+            min_person_px=cfg.get('min_person_px', 24),
+            tiling=cfg.get('tiling', False),
+            tile_size=cfg.get('tile_size', 960),
+            tile_overlap=cfg.get('tile_overlap', 0.2),
+            merge_iou=cfg.get('merge_iou', 0.5),
+        )
+
+    # ------------------------------------------------------------------
+    # 1단계: 사람 감지
+    # ------------------------------------------------------------------
+    def _tiles(self, h, w):
+        """타일 좌표 목록 (x0, y0, x1, y1)"""
+        size = min(self.tile_size, max(h, w))
+        step = max(1, int(size * (1.0 - self.tile_overlap)))
+        xs = list(range(0, max(1, w - size) + 1, step))
+        ys = list(range(0, max(1, h - size) + 1, step))
+        if xs[-1] + size < w:
+            xs.append(w - size)
+        if ys[-1] + size < h:
+            ys.append(h - size)
+        return [(x, y, min(w, x + size), min(h, y + size)) for y in ys for x in xs]
+
+    @staticmethod
+    def _boxes_from_result(result, scale=1.0, offset=(0, 0), classes=None):
+        """ultralytics Result → [(cls, conf, ndarray xyxy)] (원본 좌표)"""
+        out = []
+        boxes = getattr(result, 'boxes', None)
+        if boxes is None or len(boxes) == 0:
+            return out
+        xyxy = boxes.xyxy.cpu().numpy() * scale
+        xyxy[:, [0, 2]] += offset[0]
+        xyxy[:, [1, 3]] += offset[1]
+        cls_ids = boxes.cls.cpu().numpy().astype(int)
+        confs = boxes.conf.cpu().numpy()
+        for c, conf, box in zip(cls_ids, confs, xyxy):
+            if classes is None or c in classes:
+                out.append((int(c), float(conf), box))
+        return out
+
+    def _nms(self, dets):
+        """클래스별 NMS로 중복 박스 병합"""
+        if len(dets) <= 1:
+            return dets
+        kept = []
+        by_cls = {}
+        for d in dets:
+            by_cls.setdefault(d[0], []).append(d)
+        for group in by_cls.values():
+            rects = [[float(b[0]), float(b[1]), float(b[2] - b[0]), float(b[3] - b[1])] for _, _, b in group]
+            scores = [c for _, c, _ in group]
+            idx = cv2.dnn.NMSBoxes(rects, scores, 0.0, self.merge_iou)
+            for i in np.array(idx).flatten():
+                kept.append(group[int(i)])
+        return kept
+
+    def detect_persons(self, frame):
+        """
+        축소 프레임(+선택적 타일)에서 사람 감지
+
+        Returns:
+            list: [(x1, y1, x2, y2, conf), ...] 원본 좌표, 큰 박스 순
+        """
+        h, w = frame.shape[:2]
+        scale = self.person_imgsz / float(max(h, w))
+        if scale < 1.0:
+            small = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+        else:
+            small, scale = frame, 1.0
+
+        results = self.person_model(small, verbose=False, conf=self.person_conf, iou=0.5,
+                                    imgsz=self.person_imgsz, classes=[COCO_PERSON_CLASS])
+        dets = []
+        for r in results:
+            dets.extend(self._boxes_from_result(r, scale=1.0 / scale))
+
+        # SAHI 방식: 원본 해상도 타일에서 추가 감지 (원거리 소형 인물)
+        if self.tiling and max(h, w) > self.tile_size:
+            tiles = self._tiles(h, w)
+            crops = [frame[y0:y1, x0:x1] for x0, y0, x1, y1 in tiles]
+            tile_results = self.person_model(crops, verbose=False, conf=self.person_conf, iou=0.5,
+                                             imgsz=self.person_imgsz, classes=[COCO_PERSON_CLASS])
+            for (x0, y0, _, _), r in zip(tiles, tile_results):
+                dets.extend(self._boxes_from_result(r, offset=(x0, y0)))
+            dets = self._nms(dets)
+
+        persons = []
+        for _, conf, b in dets:
+            if b[3] - b[1] >= self.min_person_px:
+                persons.append((float(b[0]), float(b[1]), float(b[2]), float(b[3]), conf))
+        persons.sort(key=lambda p: (p[2] - p[0]) * (p[3] - p[1]), reverse=True)
+        return persons[:self.max_persons]
+
+    # ------------------------------------------------------------------
+    # 2단계: 사람 crop 배치 추론
+    # ------------------------------------------------------------------
+    def crop_regions(self, frame_shape, persons):
+        """사람 박스 → 여백을 포함한 crop 영역 (정수 좌표, 프레임 내부로 클리핑)"""
+        h, w = frame_shape[:2]
+        regions = []
+        for x1, y1, x2, y2, _ in persons:
+            bw, bh = x2 - x1, y2 - y1
+            pad_x, pad_y = bw * self.crop_pad, bh * self.crop_pad
+            regions.append((
+                max(0, int(x1 - pad_x)), max(0, int(y1 - pad_y)),
+                min(w, int(x2 + pad_x)), min(h, int(y2 + pad_y)),
+            ))
+        return regions
+
+    def run_on_crops(self, model, frame, regions, conf, iou=0.45):
+        """
+        crop 목록에 모델을 배치 실행하고 박스를 원본 좌표로 복원
+
+        Returns:
+            list: [(cls, conf, ndarray xyxy), ...] (crop 간 중복은 NMS로 병합)
+        """
+        if model is None or not regions:
+            return []
+        crops = [np.ascontiguousarray(frame[y0:y1, x0:x1]) for x0, y0, x1, y1 in regions]
+        results = model(crops, verbose=False, conf=conf, iou=iou, imgsz=self.crop_imgsz, augment=False)
+        dets = []
+        for (x0, y0, _, _), r in zip(regions, results):
+            dets.extend(self._boxes_from_result(r, offset=(x0, y0)))
+        return self._nms(dets)
+
+    def detect(self, frame, ppe_model, aux_model=None, ppe_conf=0.01, aux_conf=0.25):
+        """
+        전체 파이프라인 실행
+
+        Returns:
+            dict: {
+                'persons': [(x1, y1, x2, y2, conf), ...],
+                'ppe_boxes': [(cls, conf, xyxy), ...],   # ppe_model 클래스 ID
+                'aux_boxes': [(cls, conf, xyxy), ...],   # aux_model 클래스 ID
+            }
+        """
+        persons = self.detect_persons(frame)
+        regions = self.crop_regions(frame.shape, persons)
+        self.last_persons = persons
+        self.last_regions = regions
+        return {
+            'persons': persons,
+            'ppe_boxes': self.run_on_crops(ppe_model, frame, regions, ppe_conf),
+            'aux_boxes': self.run_on_crops(aux_model, frame, regions, aux_conf, iou=0.5) if aux_model else [],
+        }
+
+    # ------------------------------------------------------------------
+    # 얼굴: 머리 영역 crop
+    # ------------------------------------------------------------------
+    def head_regions(self, frame_shape, persons, head_ratio=0.45):
+        """사람 박스 상단(head_ratio)을 정사각형에 가깝게 확장한 머리 영역"""
+        h, w = frame_shape[:2]
+        regions = []
+        for x1, y1, x2, y2, _ in persons:
+            bw = x2 - x1
+            hh = max((y2 - y1) * head_ratio, bw * 0.8)
+            cx = (x1 + x2) / 2.0
+            half = max(bw, hh) / 2.0
+            regions.append((
+                max(0, int(cx - half)), max(0, int(y1 - hh * 0.15)),
+                min(w, int(cx + half)), min(h, int(y1 + hh)),
+            ))
+        return regions
+
+    def detect_faces(self, face_app, frame, persons, lock=None):
+        """
+        머리 영역 crop에서 InsightFace 실행 (FaceAnalysis는 단일 이미지 API이므로 crop별 호출)
+
+        Args:
+            frame: 원본 BGR 프레임 (crop 단위로 RGB 변환)
+
+        Returns:
+            list: insightface Face 객체 (bbox/kps는 원본 좌표로 복원됨)
+        """
+        faces = []
+        for x0, y0, x1, y1 in self.head_regions(frame.shape, persons):
+            if x1 - x0 < 16 or y1 - y0 < 16:
+                continue
+            crop = cv2.cvtColor(frame[y0:y1, x0:x1], cv2.COLOR_BGR2RGB)
+            if lock is not None:
+                with lock:
+                    found = face_app.get(crop)
+            else:
+                found = face_app.get(crop)
+            for face in found:
+                face.bbox = face.bbox + np.array([x0, y0, x0, y0], dtype=face.bbox.dtype)
+                kps = getattr(face, 'kps', None)
+                if kps is not None:
+                    face.kps = kps + np.array([x0, y0], dtype=kps.dtype)
+                faces.append(face)
+        return faces
@@ -2,17 +2,121 @@
 얼굴 인식 데이터베이스 관리 모듈
 
 학습된 얼굴 특징을 저장하고 관리합니다.
+연결은 스레드별로 재사용합니다 (utils/db_pool.py, 같은 SQL은 준비된 문장 재사용).
+인식기는 DB 파일별 공유 색인(FaceIndex)을 사용하며, 일괄 등록은 색인에 새 행만 덧붙입니다.
 """
 
-import sqlite3
 import os
 import json
+import threading
+import time
 import numpy as np
 from datetime import datetime
 from typing import List, Tuple, Optional, Dict
 import pickle
 
 from ..utils.helpers import get_data_dir
+from ..utils.db_pool import get_db_pool
+
+# 활성 얼굴의 모든 인코딩 (인식/캐시 공용)
+_SELECT_ACTIVE_ENCODINGS = '''
+    SELECT fe.face_id, fe.encoding, f.name, f.employee_id, f.department
+    FROM face_encodings fe
+    INNER JOIN faces f ON fe.face_id = f.id
+    WHERE f.is_active = 1
+'''
+
+
+class FaceIndex:
+    """인식용 활성 얼굴 색인 (정규화 인코딩 행렬 N x D + 얼굴 정보)
+
+    snapshot()은 매번 새로 만든 dict를 돌려주므로 읽는 쪽은 락 없이 사용합니다.
+
+    generation은 load/extend/invalidate마다 1씩 늘어납니다. DB를 읽기(load) 또는 쓰기(extend) 전에 값을 받아 두고
+    넘기면, 그 사이에 다른 쪽이 색인을 바꾼 경우를 알아챕니다.
+    - extend: 쓰는 동안 다시 읽기가 끝났으면 새 행이 이미 들어 있을 수 있으므로 덧붙이지 않고 무효화
+    - load: 읽는 동안 새 행이 덧붙여졌으면 읽은 결과에 빠졌을 수 있으므로 반영은 하되 다음 조회 때 다시 읽음
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = {'embeddings': None, 'info': []}
+        self.loaded_at = 0.0   # 0이면 다음 조회 때 DB에서 다시 읽음
+        self.generation = 0
+
+    @staticmethod
+    def _build(rows):
+        embeddings = np.asarray([row[1] for row in rows], dtype=np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        info = [{'face_id': row[0], 'name': row[2], 'employee_id': row[3], 'department': row[4]}
+                for row in rows]
+        return embeddings, info
+
+    def snapshot(self) -> Dict:
+        return self._snapshot
+
+    def load(self, rows, generation: Optional[int] = None):
+        """get_active_encodings() 결과로 전체 다시 만들기
+
+        Args:
+            generation: DB를 읽기 전의 self.generation (None이면 확인 안 함)
+        """
+        if rows:
+            embeddings, info = self._build(rows)
+            snapshot = {'embeddings': embeddings, 'info': info}
+        else:
+            snapshot = {'embeddings': None, 'info': []}
+        with self._lock:
+            self._snapshot = snapshot
+            stale = generation is not None and generation != self.generation
+            self.loaded_at = 0.0 if stale else time.time()
+            self.generation += 1
+
+    def extend(self, rows, generation: Optional[int] = None):
+        """새로 등록한 행만 덧붙이기 (아직 읽지 않았거나 차원이 다르면 다음 조회 때 다시 읽음)
+
+        Args:
+            generation: 쓰기 트랜잭션 전의 self.generation (None이면 확인 안 함)
+        """
+        if not rows:
+            return
+        embeddings, info = self._build(rows)
+        with self._lock:
+            self.generation += 1
+            current = self._snapshot['embeddings']
+            if not self.loaded_at:
+                return
+            if generation is not None and generation != self.generation - 1:
+                # 쓰는 동안 다시 읽기(또는 다른 변경)가 있었음 → 중복될 수 있으므로 다시 읽기
+                self.loaded_at = 0.0
+            elif current is None:
+                self._snapshot = {'embeddings': embeddings, 'info': info}
+            elif current.shape[1] == embeddings.shape[1]:
+                self._snapshot = {'embeddings': np.vstack([current, embeddings]),
+                                  'info': self._snapshot['info'] + info}
+            else:
+                self.loaded_at = 0.0
+
+    def invalidate(self):
+        with self._lock:
+            self.loaded_at = 0.0
+            self.generation += 1
+
+
+_indexes: Dict[str, FaceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def _get_face_index(db_path: str) -> FaceIndex:
+    """DB 파일별 공유 인식 색인"""
+    key = os.path.abspath(db_path)
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = _indexes[key] = FaceIndex()
+    return index
 
 
 class FaceDatabase:
@@ -32,13 +136,18 @@ class FaceDatabase:
             db_path = os.path.join(db_dir, 'faces.db')
 
         self.db_path = db_path
+        self._pool = get_db_pool(db_path)
+        self._index = _get_face_index(db_path)
         self._init_database()
     
     def _init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        with self._pool.transaction() as conn:
+            self._create_tables(conn.cursor())
+
+    @staticmethod
+    def _create_tables(cursor):
+        """얼굴 정보/인코딩 테이블 생성"""
         # 얼굴 정보 테이블
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS faces (
@@ -63,9 +172,9 @@ class FaceDatabase:
                 FOREIGN KEY (face_id) REFERENCES faces(id) ON DELETE CASCADE
             )
         ''')
-        
-        conn.commit()
-        conn.close()
+
+        # 이름으로 활성 얼굴 찾기 (등록 시 매번 조회)
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_faces_name ON faces(name, is_active)')
     
     def add_face(self, name: str, encoding: np.ndarray, employee_id: str = None, 
                   department: str = None, photo_path: str = None) -> int:
@@ -82,9 +191,66 @@ class FaceDatabase:
         Returns:
             추가된 얼굴 ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        with self._pool.transaction() as conn:
+            face_id = self._add_face(conn.cursor(), name, encoding, employee_id, department, photo_path)
+        self._index.invalidate()
+        return face_id
+
+    def add_faces(self, entries: List[Dict]) -> List[int]:
+        """
+        여러 얼굴을 트랜잭션 1번으로 추가하고 인식 색인에 한 번에 덧붙이기 (일괄 등록용)
+
+        Args:
+            entries: [{'name', 'encoding', 'employee_id', 'department', 'photo_path'}, ...]
+
+        Returns:
+            entries 순서대로 얼굴 ID
+        """
+        if not entries:
+            return []
+        generation = self._index.generation
+        with self._pool.transaction() as conn:
+            cursor = conn.cursor()
+            # 이미 등록된 이름 한 번에 조회 (name → (id, 사원번호, 부서))
+            known = {}
+            names = sorted({e['name'] for e in entries})
+            for i in range(0, len(names), 500):
+                chunk = names[i:i + 500]
+                cursor.execute(f'SELECT name, id, employee_id, department FROM faces '
+                               f'WHERE is_active = 1 AND name IN ({",".join("?" * len(chunk))})', chunk)
+                known.update({row[0]: row[1:] for row in cursor.fetchall()})
+
+            face_ids, updates = [], {}
+            for e in entries:
+                face = known.get(e['name'])
+                if face is None:
+                    cursor.execute('''
+                        INSERT INTO faces (name, employee_id, department, photo_path)
+                        VALUES (?, ?, ?, ?)
+                    ''', (e['name'], e.get('employee_id'), e.get('department'), e.get('photo_path')))
+                    face = known[e['name']] = (cursor.lastrowid, e.get('employee_id'), e.get('department'))
+                else:
+                    # 기존 얼굴(또는 같은 이름 두 번째 사진부터): add_face와 같이 수정 시각 + 마지막 사진 경로
+                    updates[face[0]] = e.get('photo_path') or updates.get(face[0])
+                face_ids.append(face[0])
+
+            cursor.executemany('''
+                UPDATE faces SET updated_at = CURRENT_TIMESTAMP,
+                                photo_path = COALESCE(?, photo_path)
+                WHERE id = ?
+            ''', [(photo, fid) for fid, photo in updates.items()])
+            cursor.executemany('''
+                INSERT INTO face_encodings (face_id, encoding)
+                VALUES (?, ?)
+            ''', [(fid, pickle.dumps(e['encoding'])) for fid, e in zip(face_ids, entries)])
+
+        info = {face[0]: (name,) + face[1:] for name, face in known.items()}
+        self._index.extend([(fid, e['encoding']) + info[fid] for fid, e in zip(face_ids, entries)], generation)
+        return face_ids
+
+    @staticmethod
+    def _add_face(cursor, name, encoding, employee_id, department, photo_path) -> int:
+        """add_face 본문 (호출자 트랜잭션 안에서)"""
         # 기존 얼굴이 있는지 확인 (이름으로)
         cursor.execute('SELECT id FROM faces WHERE name = ? AND is_active = 1', (name,))
         existing = cursor.fetchone()
@@ -111,9 +277,6 @@ class FaceDatabase:
             INSERT INTO face_encodings (face_id, encoding)
             VALUES (?, ?)
         ''', (face_id, encoding_bytes))
-        
-        conn.commit()
-        conn.close()
         return face_id
     
     def get_all_faces(self) -> List[Dict]:
@@ -123,19 +286,13 @@ class FaceDatabase:
         Returns:
             얼굴 정보 리스트
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        rows = self._pool.query('''
             SELECT id, name, employee_id, department, created_at, updated_at, photo_path
             FROM faces
             WHERE is_active = 1
             ORDER BY name
         ''')
         
-        rows = cursor.fetchall()
-        conn.close()
-        
         faces = []
         for row in rows:
             faces.append({
@@ -160,25 +317,19 @@ class FaceDatabase:
         Returns:
             얼굴 인코딩 리스트
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         if face_id:
-            cursor.execute('''
+            rows = self._pool.query('''
                 SELECT encoding FROM face_encodings
                 WHERE face_id = ?
             ''', (face_id,))
         else:
             # 모든 활성 얼굴의 인코딩
-            cursor.execute('''
+            rows = self._pool.query('''
                 SELECT fe.encoding FROM face_encodings fe
                 INNER JOIN faces f ON fe.face_id = f.id
                 WHERE f.is_active = 1
             ''')
         
-        rows = cursor.fetchall()
-        conn.close()
-        
         encodings = []
         for row in rows:
             encoding = pickle.loads(row[0])
@@ -196,18 +347,12 @@ class FaceDatabase:
         Returns:
             얼굴 정보 또는 None
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        row = self._pool.query_one('''
             SELECT id, name, employee_id, department, created_at, updated_at, photo_path
             FROM faces
             WHERE id = ? AND is_active = 1
         ''', (face_id,))
         
-        row = cursor.fetchone()
-        conn.close()
-        
         if row:
             return {
                 'id': row[0],
@@ -227,16 +372,12 @@ class FaceDatabase:
         Args:
             face_id: 얼굴 ID
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE faces SET is_active = 0, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (face_id,))
-        
-        conn.commit()
-        conn.close()
+        with self._pool.transaction() as conn:
+            conn.execute('''
+                UPDATE faces SET is_active = 0, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (face_id,))
+        self._index.invalidate()
     
     def recognize_face(self, encoding: np.ndarray, tolerance: float = 0.6) -> Optional[Tuple[int, str, float]]:
         """
@@ -250,18 +391,7 @@ class FaceDatabase:
             (face_id, name, distance) 또는 None
         """
         # 모든 활성 얼굴의 인코딩 가져오기
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT fe.face_id, fe.encoding, f.name
-            FROM face_encodings fe
-            INNER JOIN faces f ON fe.face_id = f.id
-            WHERE f.is_active = 1
-        ''')
-        
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._pool.query(_SELECT_ACTIVE_ENCODINGS)
         
         if not rows:
             return None
@@ -302,18 +432,7 @@ class FaceDatabase:
             (face_id, name, distance) 또는 None
         """
         # 모든 활성 얼굴의 인코딩 가져오기
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT fe.face_id, fe.encoding, f.name
-            FROM face_encodings fe
-            INNER JOIN faces f ON fe.face_id = f.id
-            WHERE f.is_active = 1
-        ''')
-
-        rows = cursor.fetchall()
-        conn.close()
+        rows = self._pool.query(_SELECT_ACTIVE_ENCODINGS)
 
         if not rows:
             return None
@@ -349,14 +468,29 @@ class FaceDatabase:
 
     def get_face_count(self) -> int:
         """활성 얼굴 개수 반환"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return self._pool.query_one('SELECT COUNT(*) FROM faces WHERE is_active = 1')[0]
 
-        cursor.execute('SELECT COUNT(*) FROM faces WHERE is_active = 1')
-        count = cursor.fetchone()[0]
+    def get_active_encodings(self) -> List[Tuple[int, np.ndarray, str, Optional[str], Optional[str]]]:
+        """
+        모든 활성 얼굴의 인코딩 (인식기 캐시용, 쿼리 1번)
 
-        conn.close()
-        return count
+        Returns:
+            [(face_id, 인코딩, 이름, 사원번호, 부서), ...]
+        """
+        return [(row[0], pickle.loads(row[1]), row[2], row[3], row[4])
+                for row in self._pool.query(_SELECT_ACTIVE_ENCODINGS)]
+
+    def get_recognition_index(self, max_age: float = 10.0) -> Dict:
+        """
+        인식용 색인 (같은 DB 파일의 인식기 공유, max_age초가 지났거나 수정/삭제 후면 다시 읽기)
+
+        Returns:
+            {'embeddings': 정규화 행렬 (N x D) 또는 None, 'info': [{'face_id', 'name', 'employee_id', 'department'}]}
+        """
+        if time.time() - self._index.loaded_at > max_age:
+            generation = self._index.generation
+            self._index.load(self.get_active_encodings(), generation)
+        return self._index.snapshot()
 
     def update_face(self, face_id: int, name: str = None, employee_id: str = None,
                     department: str = None, photo_path: str = None) -> bool:
@@ -373,9 +507,6 @@ class FaceDatabase:
         Returns:
             성공 여부
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
         try:
             # 동적 업데이트 쿼리 생성
             updates = []
@@ -401,14 +532,12 @@ class FaceDatabase:
             params.append(face_id)
 
             query = f"UPDATE faces SET {', '.join(updates)} WHERE id = ? AND is_active = 1"
-            cursor.execute(query, params)
-
-            conn.commit()
+            with self._pool.transaction() as conn:
+                cursor = conn.execute(query, params)
+            self._index.invalidate()
             return cursor.rowcount > 0
 
         except Exception as e:
             print(f"[FaceDatabase] 얼굴 정보 수정 오류: {e}")
             return False
-        finally:
-            conn.close()
 
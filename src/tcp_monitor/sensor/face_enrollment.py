@@ -0,0 +1,467 @@
+"""
+CSV 얼굴 일괄 등록 엔진
+
+사진마다 detect_faces_insightface() → add_face() (사진마다 감지 + 커밋) 하던 방식 대신:
+1. 디코딩/축소: 프로세스 풀에서 (JPEG은 축소 디코딩, 감지 입력 크기로 줄여 전달)
+2. 감지는 사진별, 인식(ArcFace)은 정렬한 얼굴 crop을 모아 배치로 한 번에
+3. 중복 검사: 새 인코딩 전체를 행렬곱으로 서로/기존 등록 얼굴과 비교
+   - 다른 이름과 같은 얼굴(인식 기준 이상 유사) → 등록하지 않고 "중복 의심"
+   - 같은 이름의 거의 같은 인코딩 → "이미 등록됨"
+4. 등록: 트랜잭션 1번 (FaceDatabase.add_faces) + 인식 색인에 새 행만 덧붙임
+
+추출 결과는 사진 묶음마다 체크포인트(.npz)에 저장합니다. 중단 후 같은 내용의 CSV로 다시 실행하면
+이미 추출한 사진은 건너뛰고, 등록까지 끝나면 체크포인트를 지웁니다.
+
+사용법 (명령줄):
+    python -m src.tcp_monitor.sensor.face_enrollment faces.csv [--workers 4] [--dry-run]
+"""
+
+import csv
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+# 코사인 유사도 기준 (recognize_face_insightface 기본 허용 오차 0.4 = 유사도 0.6)
+DUPLICATE_THRESHOLD = 0.6
+SAME_FACE_THRESHOLD = 0.95
+
+
+def _read_csv_rows(csv_path: str, encoding: str) -> List[Dict]:
+    records = []
+    csv_dir = os.path.dirname(csv_path)  # CSV 파일이 있는 디렉토리
+    with open(csv_path, 'r', encoding=encoding) as f:
+        for row in csv.DictReader(f):
+            # 필수 필드 확인
+            name = (row.get('이름') or '').strip()
+            photo_path = (row.get('사진경로') or '').strip()
+            if not name or not photo_path:
+                continue
+
+            # 상대 경로인 경우 CSV 파일 기준으로 변환
+            if not os.path.isabs(photo_path):
+                photo_path = os.path.join(csv_dir, photo_path)
+
+            records.append({
+                'name': name,
+                'employee_id': (row.get('사원번호') or '').strip() or None,
+                'department': (row.get('부서') or '').strip() or None,
+                'photo_path': photo_path
+            })
+    return records
+
+
+def load_enrollment_csv(csv_path: str) -> List[Dict]:
+    """
+    일괄 등록 CSV 읽기 (UTF-8, 실패 시 EUC-KR)
+
+    CSV 파일 형식:
+    이름,사원번호,부서,사진경로
+    홍길동,EMP001,개발팀,/path/to/photo1.jpg
+
+    Returns:
+        [{'name', 'employee_id', 'department', 'photo_path'}, ...]
+    """
+    try:
+        return _read_csv_rows(csv_path, 'utf-8-sig')
+    except UnicodeDecodeError:
+        return _read_csv_rows(csv_path, 'euc-kr')
+
+
+def _decode_image(task: Tuple[int, str, int]) -> Tuple[int, Optional[np.ndarray], Optional[str]]:
+    """
+    사진 1장 디코딩 + 축소 (프로세스 풀 작업)
+
+    긴 변이 max_side보다 크면 줄입니다 (감지기도 입력 크기로 줄이므로 결과 차이 없음).
+    JPEG은 libjpeg 축소 디코딩(1/2, 1/4, 1/8)으로 원본 크기 디코딩을 피합니다.
+
+    Returns:
+        (레코드 번호, RGB 이미지 또는 None, 실패 사유)
+    """
+    index, path, max_side = task
+    if not os.path.exists(path):
+        return index, None, "파일 없음"
+    try:
+        flag = cv2.IMREAD_COLOR
+        try:
+            from PIL import Image
+            with Image.open(path) as im:
+                long_side = max(im.size)
+            for factor, reduced in ((8, cv2.IMREAD_REDUCED_COLOR_8), (4, cv2.IMREAD_REDUCED_COLOR_4),
+                                    (2, cv2.IMREAD_REDUCED_COLOR_2)):
+                if long_side // factor >= max_side:
+                    flag = reduced
+                    break
+        except Exception:
+            pass
+        img = cv2.imread(path, flag)
+        if img is None:
+            return index, None, "읽기 실패"
+        h, w = img.shape[:2]
+        scale = max_side / max(h, w)
+        if scale < 1.0:
+            img = cv2.resize(img, (max(1, int(w * scale)), max(1, int(h * scale))),
+                             interpolation=cv2.INTER_AREA)
+        # 얼굴 등록 화면과 같은 입력 (BGR → RGB)
+        return index, cv2.cvtColor(img, cv2.COLOR_BGR2RGB), None
+    except Exception as e:
+        return index, None, f"읽기 실패: {e}"
+
+
+class InsightFaceBatchExtractor:
+    """InsightFace 감지(사진별) + 인식(정렬 crop 배치) 추출기"""
+
+    def __init__(self, face_app, lock=None, batch_size: int = 32):
+        """
+        Args:
+            face_app: insightface FaceAnalysis (prepare 완료)
+            lock: 추론 락 (실시간 인식과 공유 인스턴스를 같이 쓰는 경우)
+            batch_size: 인식 모델 1회 입력 crop 수
+        """
+        self.face_app = face_app
+        self.lock = lock or threading.Lock()
+        self.batch_size = batch_size
+        models = getattr(face_app, 'models', {}) or {}
+        self.det_model = getattr(face_app, 'det_model', None)
+        self.rec_model = models.get('recognition')
+        try:
+            from insightface.utils import face_align
+            self._norm_crop = face_align.norm_crop
+        except ImportError:
+            self._norm_crop = None
+
+    def __call__(self, images: Sequence[np.ndarray]) -> List[List[Tuple[Tuple[int, int, int, int], np.ndarray]]]:
+        """
+        Returns:
+            사진별 [((top, right, bottom, left), 임베딩), ...]
+        """
+        if self.det_model is None or self.rec_model is None or self._norm_crop is None:
+            return [self._single(img) for img in images]
+
+        results = [[] for _ in images]
+        crops, owners = [], []
+        for i, img in enumerate(images):
+            with self.lock:
+                bboxes, kpss = self.det_model.detect(img, max_num=0, metric='default')
+            if kpss is None:
+                results[i] = self._single(img)
+                continue
+            for bbox, kps in zip(bboxes, kpss):
+                x1, y1, x2, y2 = bbox[:4].astype(int)
+                crops.append(self._norm_crop(img, landmark=kps, image_size=self.rec_model.input_size[0]))
+                owners.append((i, (y1, x2, y2, x1)))
+
+        for start in range(0, len(crops), self.batch_size):
+            with self.lock:
+                feats = self.rec_model.get_feat(crops[start:start + self.batch_size])
+            for (i, location), feat in zip(owners[start:start + self.batch_size], feats):
+                results[i].append((location, np.asarray(feat, dtype=np.float32).ravel()))
+        return results
+
+    def _single(self, img):
+        """FaceAnalysis.get() 1장 (감지 모델이 랜드마크를 주지 않는 경우)"""
+        with self.lock:
+            faces = self.face_app.get(img)
+        out = []
+        for face in faces:
+            x1, y1, x2, y2 = face.bbox.astype(int)
+            out.append(((y1, x2, y2, x1), np.asarray(face.embedding, dtype=np.float32)))
+        return out
+
+
+def default_extractor(batch_size: int = 32) -> Optional[InsightFaceBatchExtractor]:
+    """실시간 인식과 공유하는 InsightFace 인스턴스로 추출기 생성 (로드 실패 시 None)"""
+    try:
+        from .safety_detector import get_shared_insightface_app, _shared_insightface_inference_lock
+    except ImportError:
+        return None
+    face_app = get_shared_insightface_app()
+    if face_app is None:
+        return None
+    return InsightFaceBatchExtractor(face_app, _shared_insightface_inference_lock, batch_size)
+
+
+def find_duplicates(embeddings: np.ndarray, names: Sequence[str],
+                    known: Optional[np.ndarray] = None, known_names: Sequence[str] = (),
+                    threshold: float = DUPLICATE_THRESHOLD, same_threshold: float = SAME_FACE_THRESHOLD,
+                    block: int = 1024) -> List[Optional[str]]:
+    """
+    새 인코딩의 중복 판정 (행 블록별 행렬곱, 블록 1개 = 새 인코딩 block개 x 전체)
+
+    Args:
+        embeddings: 새 인코딩 (M x D)
+        names: 새 인코딩별 이름
+        known / known_names: 이미 등록된 정규화 인코딩 (N x D)과 이름
+
+    Returns:
+        인코딩별 사유 (None = 등록 가능)
+    """
+    m = len(embeddings)
+    if m == 0:
+        return []
+    emb = np.asarray(embeddings, dtype=np.float32)
+    emb = emb / np.linalg.norm(emb, axis=1, keepdims=True)
+    names = np.asarray(names, dtype=object)
+    use_known = known is not None and len(known) > 0 and known.shape[1] == emb.shape[1]
+    if use_known:
+        known_names = np.asarray(known_names, dtype=object)
+
+    reasons: List[Optional[str]] = [None] * m
+    for start in range(0, m, block):
+        rows = slice(start, min(m, start + block))
+        block_names = names[rows, None]
+        idx = np.arange(rows.start, rows.stop)
+
+        # 다른 이름의 같은 얼굴: 새 인코딩끼리 / 기존 등록과
+        sim = emb[rows] @ emb.T
+        sim[idx - start, idx] = -1.0
+        other = block_names != names[None, :]
+        conflict = np.where(other, sim, -1.0)
+        # 같은 이름의 거의 같은 인코딩: 앞쪽 행만 (첫 행은 등록)
+        earlier = (~other) & (idx[:, None] > np.arange(m)[None, :])
+        repeat = np.where(earlier, sim, -1.0).max(axis=1) >= same_threshold
+
+        if use_known:
+            sim_known = emb[rows] @ known.T
+            other_known = block_names != known_names[None, :]
+            conflict_known = np.where(other_known, sim_known, -1.0)
+            registered = np.where(~other_known, sim_known, -1.0).max(axis=1) >= same_threshold
+        else:
+            conflict_known = np.full((rows.stop - rows.start, 1), -1.0)
+            registered = np.zeros(rows.stop - rows.start, dtype=bool)
+
+        best_new, best_known = conflict.max(axis=1), conflict_known.max(axis=1)
+        for k, i in enumerate(idx):
+            if best_known[k] >= threshold and best_known[k] >= best_new[k]:
+                reasons[i] = f"중복 의심: 등록된 '{known_names[conflict_known[k].argmax()]}'와 같은 얼굴"
+            elif best_new[k] >= threshold:
+                reasons[i] = f"중복 의심: CSV의 '{names[conflict[k].argmax()]}'와 같은 얼굴"
+            elif registered[k]:
+                reasons[i] = "이미 등록됨"
+            elif repeat[k]:
+                reasons[i] = "같은 사진 중복"
+    return reasons
+
+
+class BulkEnrollment:
+    """CSV 레코드 일괄 얼굴 등록 (디코딩 프로세스 풀 + 배치 추출 + 트랜잭션 1번, 체크포인트로 이어서 처리)"""
+
+    def __init__(self, face_db, records: List[Dict], extractor: Optional[Callable] = None,
+                 workers: Optional[int] = None, chunk_size: int = 32, max_side: int = 640,
+                 checkpoint_dir: Optional[str] = None,
+                 duplicate_threshold: float = DUPLICATE_THRESHOLD,
+                 on_progress: Optional[Callable[[str, int, int], None]] = None):
+        """
+        Args:
+            face_db: FaceDatabase
+            records: load_enrollment_csv() 결과
+            extractor: 이미지 목록 → 사진별 [(위치, 임베딩)] (None이면 공유 InsightFace)
+            workers: 디코딩 프로세스 수 (1이면 현재 스레드에서)
+            chunk_size: 한 번에 디코딩/추출하는 사진 수 (체크포인트 저장 단위)
+            max_side: 디코딩 후 긴 변 최대 크기 (감지 입력 크기)
+            checkpoint_dir: 체크포인트 위치 (기본: 얼굴 DB 디렉토리)
+            on_progress: (메시지, 처리한 사진 수, 전체) 콜백 (작업 스레드에서 호출)
+        """
+        self.face_db = face_db
+        self.records = records
+        self.extractor = extractor
+        self.workers = workers if workers is not None else max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.chunk_size = chunk_size
+        self.max_side = max_side
+        self.duplicate_threshold = duplicate_threshold
+        self.on_progress = on_progress
+
+        digest = hashlib.sha1(json.dumps([records, max_side], ensure_ascii=False, sort_keys=True)
+                              .encode('utf-8')).hexdigest()
+        self.checkpoint_path = os.path.join(checkpoint_dir or os.path.dirname(face_db.db_path),
+                                            f"enroll_{digest[:16]}.npz")
+
+        # 레코드별 추출 상태 ('ok' 또는 실패 사유) / 추출한 인코딩과 소속 레코드
+        self.status: Dict[int, str] = {}
+        self._embeddings: List[np.ndarray] = []
+        self._owners: List[int] = []
+        self._load_checkpoint()
+
+    # ------------------------------------------------------------------ 체크포인트
+
+    def _load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return
+        try:
+            with np.load(self.checkpoint_path, allow_pickle=False) as data:
+                self.status = {int(k): v for k, v in json.loads(str(data['status'])).items()}
+                self._embeddings = list(data['embeddings'])
+                self._owners = [int(r) for r in data['owners']]
+        except Exception as e:
+            print(f"[얼굴 일괄 등록] 체크포인트 읽기 실패, 처음부터 진행: {e}")
+            self.status, self._embeddings, self._owners = {}, [], []
+
+    def _save_checkpoint(self):
+        tmp = self.checkpoint_path + ".tmp"
+        embeddings = (np.vstack(self._embeddings).astype(np.float32) if self._embeddings
+                      else np.zeros((0, 0), dtype=np.float32))
+        with open(tmp, 'wb') as f:
+            np.savez(f, status=np.array(json.dumps({str(k): v for k, v in self.status.items()},
+                                                   ensure_ascii=False)),
+                     embeddings=embeddings, owners=np.asarray(self._owners, dtype=np.int64))
+        os.replace(tmp, self.checkpoint_path)
+
+    @property
+    def extracted(self) -> int:
+        """추출을 마친 사진 수 (이어서 처리 시 건너뜀)"""
+        return len(self.status)
+
+    # ------------------------------------------------------------------ 실행
+
+    def _progress(self, message: str):
+        if self.on_progress is not None:
+            self.on_progress(message, self.extracted, len(self.records))
+
+    def _extract_chunk(self, decoded):
+        """디코딩 결과 1묶음 → 추출 → 상태/인코딩 기록"""
+        images, indices = [], []
+        for index, img, reason in decoded:
+            if img is None:
+                self.status[index] = reason
+                self._progress(f"{self.records[index]['name']}: {reason}")
+            else:
+                images.append(img)
+                indices.append(index)
+        faces = self.extractor(images) if images else []
+        for index, found in zip(indices, faces):
+            valid = [emb for _, emb in found if np.isfinite(emb).all()]
+            if not found:
+                self.status[index] = "얼굴 미검출"
+            elif not valid:
+                self.status[index] = "인코딩 실패"
+            else:
+                self.status[index] = "ok"
+                self._embeddings.extend(valid)
+                self._owners.extend([index] * len(valid))
+            if self.status[index] != "ok":
+                self._progress(f"{self.records[index]['name']}: {self.status[index]}")
+
+    def run(self, cancel: Optional[threading.Event] = None, dry_run: bool = False) -> Dict:
+        """
+        추출 → 중복 검사 → 등록
+
+        Args:
+            cancel: 설정되면 현재 묶음까지 체크포인트에 저장하고 중단
+            dry_run: 등록하지 않고 결과만 (체크포인트 유지)
+
+        Returns:
+            {'registered': 등록한 사람 수, 'faces': 등록한 인코딩 수, 'failed': {레코드 번호: 사유},
+             'cancelled', 'seconds'}
+        """
+        started = time.perf_counter()
+        if self.extractor is None:
+            self.extractor = default_extractor()
+            if self.extractor is None:
+                raise RuntimeError("InsightFace를 불러올 수 없습니다")
+
+        pending = [i for i in range(len(self.records)) if i not in self.status]
+        if self.status:
+            self._progress(f"이전 진행 이어서 처리: {self.extracted}/{len(self.records)}장 추출됨")
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        tasks = [[(i, self.records[i]['photo_path'], self.max_side) for i in chunk] for chunk in chunks]
+        cancelled = False
+
+        if self.workers <= 1 or len(pending) <= 1:
+            for chunk_tasks in tasks:
+                if cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                self._extract_chunk([_decode_image(t) for t in chunk_tasks])
+                self._save_checkpoint()
+                self._progress(f"추출 {self.extracted}/{len(self.records)}")
+        else:
+            # 실행 중인 카메라/추론 스레드를 fork하지 않도록 forkserver
+            context = multiprocessing.get_context("forkserver")
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context) as pool:
+                # 다음 묶음 디코딩을 미리 제출 (추출과 겹치게, 메모리는 2묶음까지)
+                ahead = pool.map(_decode_image, tasks[0]) if tasks else None
+                for n in range(len(tasks)):
+                    current = ahead
+                    if cancel is not None and cancel.is_set():
+                        cancelled = True
+                        break
+                    decoded = list(current)
+                    ahead = pool.map(_decode_image, tasks[n + 1]) if n + 1 < len(tasks) else None
+                    self._extract_chunk(decoded)
+                    self._save_checkpoint()
+                    self._progress(f"추출 {self.extracted}/{len(self.records)}")
+
+        result = {'registered': 0, 'faces': 0, 'cancelled': cancelled,
+                  'failed': {i: s for i, s in self.status.items() if s != "ok"}}
+        if cancelled:
+            self._progress("중단됨 (다시 실행하면 이어서 처리)")
+            result['seconds'] = time.perf_counter() - started
+            return result
+
+        # 중복 검사 (행렬곱)
+        names = [self.records[i]['name'] for i in self._owners]
+        index = self.face_db.get_recognition_index()
+        known_info = index['info']
+        reasons = find_duplicates(np.asarray(self._embeddings, dtype=np.float32), names,
+                                  index['embeddings'], [f['name'] for f in known_info],
+                                  threshold=self.duplicate_threshold) if self._embeddings else []
+
+        entries, registered_rows = [], set()
+        for emb, owner, reason in zip(self._embeddings, self._owners, reasons):
+            if reason is not None:
+                continue
+            rec = self.records[owner]
+            entries.append({'name': rec['name'], 'encoding': emb, 'employee_id': rec['employee_id'],
+                            'department': rec['department'], 'photo_path': rec['photo_path']})
+            registered_rows.add(owner)
+        for emb_reason, owner in zip(reasons, self._owners):
+            if owner not in registered_rows and emb_reason is not None:
+                result['failed'].setdefault(owner, emb_reason)
+
+        if dry_run:
+            self._progress(f"등록 예정: 사진 {len(registered_rows)}장 / 얼굴 {len(entries)}개 (등록 안 함)")
+        elif entries:
+            self._progress(f"등록 중: 사진 {len(registered_rows)}장 / 얼굴 {len(entries)}개")
+            self.face_db.add_faces(entries)
+        if not dry_run:
+            try:
+                os.remove(self.checkpoint_path)
+            except OSError:
+                pass
+
+        result.update(registered=len({self.records[i]['name'] for i in registered_rows}), faces=len(entries),
+                      seconds=time.perf_counter() - started)
+        return result
+
+
+def main():
+    """명령줄 일괄 등록"""
+    import argparse
+    from .face_database import FaceDatabase
+
+    parser = argparse.ArgumentParser(description="CSV 얼굴 일괄 등록")
+    parser.add_argument("csv_path", help="이름,사원번호,부서,사진경로 CSV")
+    parser.add_argument("--db", default=None, help="얼굴 DB 경로 (기본: face_db/faces.db)")
+    parser.add_argument("--workers", type=int, default=None, help="디코딩 프로세스 수")
+    parser.add_argument("--dry-run", action="store_true", help="등록하지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    records = load_enrollment_csv(args.csv_path)
+    job = BulkEnrollment(FaceDatabase(args.db), records, workers=args.workers,
+                         on_progress=lambda msg, done, total: print(f"[{done}/{total}] {msg}"))
+    result = job.run(dry_run=args.dry_run)
+    for index, reason in sorted(result['failed'].items()):
+        print(f"  실패: {records[index]['name']} ({os.path.basename(records[index]['photo_path'])}) - {reason}")
+    print(f"등록 {result['registered']}명 / 얼굴 {result['faces']}개, 실패 {len(result['failed'])}명, "
+          f"{result['seconds']:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
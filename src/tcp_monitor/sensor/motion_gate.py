@@ -0,0 +1,159 @@
+"""
+움직임/장면 변화 게이트 (Motion Gate)
+
+AI 추론 전에 저해상도 흑백 썸네일로 움직임을 판정하여
+정적인 화면(빈 복도 등)에서는 PPE/얼굴/사물 인식을 건너뜁니다.
+
+- 배경 차분: 썸네일을 누적 평균 배경과 비교하여 변화 픽셀 비율(motion_score) 계산
+- 장면 변화: 평균 밝기가 급변하면(조명 on/off, 카메라 전환) 배경 재설정 후 즉시 추론
+- 적응형 주기: 움직임 직후에는 매 프레임 추론, 정적 상태가 지속되면
+  keep-alive 주기를 min_keepalive → max_keepalive까지 2배씩 늘림
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """저비용 움직임 감지 기반 추론 게이트"""
+
+    def __init__(self, thumb_width=64, pixel_threshold=25, motion_threshold=0.01,
+                 scene_change_threshold=40.0, hold_seconds=2.0,
+                 min_keepalive=0.5, max_keepalive=5.0, enabled=True):
+        """
+        Args:
+            thumb_width: 썸네일 가로 크기 (세로는 비율 유지)
+            pixel_threshold: 배경 대비 변화 픽셀로 판정할 밝기 차이 (0~255)
+            motion_threshold: 움직임으로 판정할 변화 픽셀 비율 (0~1)
+            scene_change_threshold: 장면 변화로 판정할 평균 밝기 차이
+            hold_seconds: 마지막 움직임 후 매 프레임 추론을 유지할 시간(초)
+            min_keepalive: 정적 상태에서의 최소 강제 추론 주기(초)
+            max_keepalive: 정적 상태에서의 최대 강제 추론 주기(초)
+            enabled: False면 항상 추론 (게이트 비활성화)
+        """
+        self.thumb_width = int(thumb_width)
+        self.pixel_threshold = pixel_threshold
+        self.motion_threshold = motion_threshold
+        self.scene_change_threshold = scene_change_threshold
+        self.hold_seconds = hold_seconds
+        self.min_keepalive = min_keepalive
+        self.max_keepalive = max(min_keepalive, max_keepalive)
+        self.enabled = enabled
+
+        self._background = None  # float32 누적 평균 배경
+        self._last_mean = None
+        self._last_motion_time = 0.0
+        self._last_run_time = 0.0
+        self._keepalive = min_keepalive
+
+        # 통계 (UI 표시용)
+        self.motion_score = 0.0  # 최근 프레임의 변화 픽셀 비율 (0~1)
+        self.skip_ratio = 0.0  # 건너뛴 프레임 비율 (지수 이동 평균, 0~1)
+        self.frames_total = 0
+        self.frames_skipped = 0
+
+    def reset(self):
+        """배경 모델 초기화 (카메라 전환 시 호출)"""
+        self._background = None
+        self._last_mean = None
+        self._last_motion_time = 0.0
+        self._last_run_time = 0.0
+        self._keepalive = self.min_keepalive
+        self.motion_score = 0.0
+
+    @property
+    def keepalive_interval(self):
+        """현재 keep-alive 주기(초)"""
+        return self._keepalive
+
+    def _thumbnail(self, frame):
+        """프레임 → 흑백 썸네일 (float32)"""
+        h, w = frame.shape[:2]
+        tw = max(8, min(self.thumb_width, w))
+        th = max(8, int(round(h * tw / float(w))))
+        small = cv2.resize(frame, (tw, th), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            code = cv2.COLOR_BGRA2GRAY if small.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+            small = cv2.cvtColor(small, code)
+        small = cv2.GaussianBlur(small, (3, 3), 0)
+        return small.astype(np.float32)
+
+    def should_run(self, frame, now=None):
+        """
+        이번 프레임에서 AI 추론을 실행할지 판정
+
+        Args:
+            frame: BGR 프레임
+            now: 현재 시각 (테스트/재생용, 기본 time.monotonic())
+
+        Returns:
+            bool: True면 추론 실행, False면 이전 결과 재사용
+        """
+        if now is None:
+            now = time.monotonic()
+        run = self._decide(frame, now)
+
+        self.frames_total += 1
+        if run:
+            self._last_run_time = now
+        else:
+            self.frames_skipped += 1
+        self.skip_ratio = 0.95 * self.skip_ratio + 0.05 * (0.0 if run else 1.0)
+        return run
+
+    def _decide(self, frame, now):
+        if not self.enabled or frame is None or not hasattr(frame, 'shape') or len(frame.shape) < 2:
+            return True
+
+        try:
+            thumb = self._thumbnail(frame)
+        except Exception:
+            return True
+
+        mean = float(thumb.mean())
+        if (self._background is None or self._background.shape != thumb.shape or
+                (self._last_mean is not None and abs(mean - self._last_mean) > self.scene_change_threshold)):
+            # 첫 프레임 또는 장면 변화: 배경 재설정 후 추론
+            self._background = thumb
+            self._last_mean = mean
+            self.motion_score = 1.0
+            self._on_motion(now)
+            return True
+        self._last_mean = mean
+
+        diff = cv2.absdiff(thumb, self._background)
+        self.motion_score = float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+
+        moving = self.motion_score >= self.motion_threshold
+        # 정적일 때는 배경을 빠르게, 움직일 때는 천천히 갱신 (정지한 사람이 곧바로 배경화되지 않도록)
+        cv2.accumulateWeighted(thumb, self._background, 0.01 if moving else 0.1)
+
+        if moving:
+            self._on_motion(now)
+            return True
+
+        # 움직임 직후 유지 구간: 매 프레임 추론
+        if now - self._last_motion_time < self.hold_seconds:
+            return True
+
+        # 정적 구간: keep-alive 주기마다만 추론하고, 주기를 점차 늘림
+        if now - self._last_run_time >= self._keepalive:
+            self._keepalive = min(self._keepalive * 2.0, self.max_keepalive)
+            return True
+        return False
+
+    def _on_motion(self, now):
+        self._last_motion_time = now
+        self._keepalive = self.min_keepalive
+
+    def get_stats(self):
+        """UI 표시용 통계"""
+        return {
+            'motion_score': self.motion_score,
+            'skip_ratio': self.skip_ratio,
+            'keepalive': self._keepalive,
+            'frames_total': self.frames_total,
+            'frames_skipped': self.frames_skipped,
+        }
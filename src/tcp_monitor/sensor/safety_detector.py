@@ -23,9 +23,14 @@ from datetime import datetime
 import json
 import os
 import platform
+import time
 from pathlib import Path
 
 from ..utils.helpers import get_base_dir, get_performance_settings
+from ..utils.text_sprite import get_text_sprite_cache, has_korean
+from ..utils.color_lut import get_color_lut, center_crop, to_hsv, PPE_COLOR_NAMES_KR
+from .cascade_ppe import CascadePPEPipeline
+from .stage_budget import StageBudget, active_stage_budget
 
 # PIL import (한글 텍스트 표시용)
 try:
@@ -172,6 +177,8 @@ def preload_models_async(performance_mode: int = 2):
         if performance_mode >= 2:
             get_shared_yolo_model()
             print(f"[PreLoad] 안전장구 인식 모델 로드 완료")
+            if settings.get('ppe_cascade', {}).get('enabled', False):
+                get_shared_yolo_cascade_person_model()
 
         # 모드 3: 사물 인식 (YOLO COCO 80 클래스)
         if performance_mode >= 3:
@@ -421,6 +428,67 @@ def get_shared_yolo_person_model():
     return _shared_yolo_person_model
 
 
+_shared_yolo_cascade_person_model = None  # 캐스케이드 1단계 사람 감지 모델
+_shared_yolo_cascade_person_initialized = False
+_shared_yolo_cascade_person_lock = threading.Lock()
+
+
+def get_shared_yolo_cascade_person_model():
+    """캐스케이드 PPE 1단계용 사람 감지 모델 반환 (싱글톤)
+
+    모드 3에서 COCO 모델이 이미 로드되어 있으면 재사용하고,
+    그 외에는 ppe_cascade.person_model(기본 yolo11n.pt)을 로드.
+    """
+    global _shared_yolo_cascade_person_model, _shared_yolo_cascade_person_initialized
+
+    if _shared_yolo_cascade_person_initialized:
+        return _shared_yolo_cascade_person_model
+
+    with _shared_yolo_cascade_person_lock:
+        if _shared_yolo_cascade_person_initialized:
+            return _shared_yolo_cascade_person_model
+
+        _shared_yolo_cascade_person_initialized = True
+
+        if not YOLO_OK:
+            return None
+
+        cascade_cfg = get_performance_settings(_current_performance_mode).get('ppe_cascade', {})
+        if not cascade_cfg.get('enabled', False):
+            return None
+
+        coco_model = get_shared_yolo_person_model()
+        if coco_model is not None:
+            _shared_yolo_cascade_person_model = coco_model
+            print("[YOLO-Cascade] COCO 모델을 사람 감지에 재사용")
+            return _shared_yolo_cascade_person_model
+
+        original_load = None
+        try:
+            try:
+                original_load = torch.load
+                torch.load = lambda *args, **kwargs: original_load(*args, **{**kwargs, 'weights_only': False})
+            except Exception:
+                pass
+
+            model_name = cascade_cfg.get('person_model', 'yolo11n.pt')
+            local_path = os.path.join(get_base_dir(), 'models', model_name)
+            _shared_yolo_cascade_person_model = YOLO(local_path if os.path.exists(local_path) else model_name)
+            print(f"[YOLO-Cascade] 사람 감지 모델 로드 성공: {model_name}")
+
+        except Exception as e:
+            print(f"[YOLO-Cascade] 모델 로드 실패: {e}")
+            _shared_yolo_cascade_person_model = None
+        finally:
+            try:
+                if original_load:
+                    torch.load = original_load
+            except Exception:
+                pass
+
+    return _shared_yolo_cascade_person_model
+
+
 def get_shared_yolo_model():
     """공유 YOLO PPE 모델 반환 (싱글톤) - 성능 모드에 따라 최적화"""
     global _shared_yolo_model, _shared_yolo_initialized, _current_performance_mode
@@ -596,11 +664,21 @@ class SafetyEquipmentDetectorV2:
         self._ppe_history_size = 3  # 최근 3프레임 기준 (빠른 반응)
         self._ppe_stable_threshold = 2  # 3프레임 중 2번 이상 감지되어야 착용으로 판정
 
-        # 프레임 스킵 설정 (성능 최적화) - 매 프레임 감지로 변경
-        self._frame_count = 0
-        self._detection_interval = 1  # 매 프레임 감지 (실시간 반응)
+        # 단계별 시간 예산: 측정한 추론 시간으로 PPE/보조 모델/얼굴/Legacy 단계의 실행 주기와 입력 해상도 결정
+        # (감지기 자체 예산, 패널 AI 스레드 프레임 안에서 호출되면 그 패널의 예산을 사용 → self.budget)
+        # 건너뛴 단계의 이전 결과는 예산별 budget.results에 보관 (다른 화면의 결과를 재사용하지 않음)
+        self._budget = StageBudget(name="안전장구 감지기")
+        self._budget.configure(**get_performance_settings(_current_performance_mode).get('budget', {}))
         self._last_stable_results = None  # 마지막 안정화된 결과
 
+        # 캐스케이드 PPE: 고해상도 프레임은 사람 감지 → 사람 crop 배치 PPE 추론
+        self.ppe_cascade_cfg = get_performance_settings(_current_performance_mode).get('ppe_cascade', {})
+        self.use_ppe_cascade = self.use_yolo and self.ppe_cascade_cfg.get('enabled', False)
+        self.ppe_cascade = None  # 첫 고해상도 프레임에서 생성
+        self._cascade_persons = None  # 마지막 1단계 사람 박스 (원본 좌표, 얼굴 crop 재사용)
+        self._cascade_persons_shape = None
+        self._cascade_persons_time = 0.0
+
         # === 객체 추적 (IOU 기반) - 실시간 반응 ===
         self._last_face_bbox = None  # 마지막 얼굴 위치
         self._last_face_name = None  # 마지막 인식된 이름
@@ -626,15 +704,12 @@ class SafetyEquipmentDetectorV2:
                 self.face_recognition_enabled = False
 
         # === 얼굴 인식 성능 최적화 (v1.9.7) ===
-        # 스킵 프레임: 매 프레임 대신 N프레임마다 인식 수행
-        self._face_recognition_interval = 3  # 3프레임마다 인식 (약 10fps에서 0.3초 간격)
-        self._face_recognition_frame_count = 0
+        # 실행 주기는 self.budget.due('face')가 결정, 건너뛴 프레임은 아래 캐시 재사용
         self._cached_face_results = []  # 캐시된 얼굴 감지 결과
         self._cached_recognized_faces = []  # 캐시된 인식 결과
 
         # DB 임베딩 캐싱 (매번 DB 조회 방지)
         self._cached_db_embeddings = None
-        self._db_cache_time = 0
         self._db_cache_ttl = 10.0  # 10초마다 DB 캐시 갱신
 
         # 한글 폰트
@@ -687,6 +762,11 @@ class SafetyEquipmentDetectorV2:
             print(f"[PPE] person 클래스 ID: {self.person_class_id}")
             print(f"[PPE] 모델 전체 클래스: {self.yolo_model.names}")
 
+    @property
+    def budget(self):
+        """이 스레드에서 진행 중인 호출 측 프레임의 예산, 없으면 감지기 자체 예산"""
+        return active_stage_budget() or self._budget
+
     def set_camera(self, camera):
         """카메라 설정"""
         self.camera = camera
@@ -764,7 +844,7 @@ class SafetyEquipmentDetectorV2:
 
     def _put_korean_text(self, frame, text, position, color=(0, 255, 0), font_size=24):
         """
-        한글 텍스트를 프레임에 그리기 (PIL 사용, 성능 최적화)
+        한글 텍스트를 프레임에 그리기 (PIL 스프라이트 캐시, 프레임을 직접 수정)
 
         Args:
             frame: OpenCV BGR 이미지
@@ -777,17 +857,11 @@ class SafetyEquipmentDetectorV2:
             텍스트가 그려진 프레임
         """
         # 한글이 없으면 빠른 cv2.putText 사용
-        has_korean = any('\uac00' <= c <= '\ud7a3' or '\u3131' <= c <= '\u3163' for c in text)
-        if not has_korean or not PIL_AVAILABLE:
+        if not has_korean(text) or not PIL_AVAILABLE:
             cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
             return frame
 
         try:
-            # BGR -> RGB 변환
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(frame_rgb)
-            draw = ImageDraw.Draw(pil_img)
-
             # 폰트 캐시 사용 (성능 최적화)
             if not hasattr(self, '_font_cache'):
                 self._font_cache = {}
@@ -811,22 +885,8 @@ class SafetyEquipmentDetectorV2:
             if font is None:
                 font = ImageFont.load_default()
 
-            # BGR -> RGB 색상 변환
-            rgb_color = (color[2], color[1], color[0])
-
-            # 텍스트 그리기 (테두리 효과)
-            x, y = position
-            # 검은색 테두리
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), text, font=font, fill=(0, 0, 0))
-            # 메인 텍스트
-            draw.text((x, y), text, font=font, fill=rgb_color)
-
-            # RGB -> BGR 변환
-            frame = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-            return frame
+            # 텍스트 스프라이트 캐시: 라벨 영역만 알파 블렌딩 (검은색 테두리 포함)
+            return get_text_sprite_cache().draw(frame, text, position, font, color, outline=True)
 
         except Exception as e:
             # 오류 시 cv2.putText 폴백
@@ -888,62 +948,59 @@ class SafetyEquipmentDetectorV2:
         Returns:
             dict: {'name': '색상명', 'name_kr': '한글색상명', 'rgb': (R, G, B), 'hsv': (H, S, V)}
         """
-        try:
-            x1, y1, x2, y2 = [int(x) for x in bbox]
-            h, w = frame.shape[:2]
-
-            # 경계 체크
-            x1 = max(0, x1)
-            y1 = max(0, y1)
-            x2 = min(w, x2)
-            y2 = min(h, y2)
-
-            if x2 <= x1 or y2 <= y1:
-                return None
-
-            # ROI 추출
-            roi = frame[y1:y2, x1:x2]
-            if roi.size == 0:
-                return None
-
-            # 중앙 50% 영역만 사용 (배경 노이즈 제거)
-            roi_h, roi_w = roi.shape[:2]
-            margin_x = roi_w // 4
-            margin_y = roi_h // 4
-            center_roi = roi[margin_y:roi_h-margin_y, margin_x:roi_w-margin_x]
-
-            if center_roi.size == 0:
-                center_roi = roi
+        return self._detect_colors(frame, [bbox])[0]
 
-            # HSV 변환
-            hsv_roi = cv2.cvtColor(center_roi, cv2.COLOR_BGR2HSV)
-
-            # 평균 색상 계산
-            avg_h = np.mean(hsv_roi[:, :, 0])
-            avg_s = np.mean(hsv_roi[:, :, 1])
-            avg_v = np.mean(hsv_roi[:, :, 2])
-
-            # 평균 BGR
-            avg_b = np.mean(center_roi[:, :, 0])
-            avg_g = np.mean(center_roi[:, :, 1])
-            avg_r = np.mean(center_roi[:, :, 2])
+    def _detect_colors(self, frame, bboxes):
+        """
+        여러 바운딩 박스의 주요 색상을 한 번에 감지 (HSV 룩업 테이블 + bincount)
 
-            # 색상 분류 (HSV 기반)
-            color_name, color_name_kr = self._classify_color(avg_h, avg_s, avg_v)
-
-            return {
-                'name': color_name,
-                'name_kr': color_name_kr,
-                'rgb': (int(avg_r), int(avg_g), int(avg_b)),
-                'hsv': (int(avg_h), int(avg_s), int(avg_v))
-            }
+        픽셀마다 색상을 분류한 뒤 가장 많은 색상을 선택하므로
+        평균 Hue 방식의 빨강 경계(0/179) 오분류가 없습니다.
+        rgb/hsv는 선택된 색상에 속한 픽셀들의 평균입니다.
 
+        Returns:
+            list: bbox별 색상 정보 dict (영역이 유효하지 않으면 None)
+        """
+        results = [None] * len(bboxes)
+        try:
+            h, w = frame.shape[:2]
+            slots, bgr_rois, hsv_rois = [], [], []
+            for i, bbox in enumerate(bboxes):
+                x1, y1, x2, y2 = [int(x) for x in bbox]
+                x1, y1, x2, y2 = max(0, x1), max(0, y1), min(w, x2), min(h, y2)
+                if x2 <= x1 or y2 <= y1:
+                    continue
+                # 중앙 50% 영역만 사용 (배경 노이즈 제거)
+                roi = center_crop(frame[y1:y2, x1:x2, :3])
+                slots.append(i)
+                bgr_rois.append(roi)
+                hsv_rois.append(to_hsv(roi))
+            if not slots:
+                return results
+
+            lut = get_color_lut('ppe')
+            counts, bgr_sums = lut.class_stats(bgr_rois, hsv_rois)
+            for k, i in enumerate(slots):
+                cid = int(np.argmax(counts[k]))
+                if counts[k, cid] == 0:
+                    continue
+                avg_b, avg_g, avg_r = bgr_sums[k, cid] / counts[k, cid]
+                pixel = np.array([[[avg_b, avg_g, avg_r]]], dtype=np.uint8)
+                avg_h, avg_s, avg_v = cv2.cvtColor(pixel, cv2.COLOR_BGR2HSV)[0, 0]
+                name = lut.names[cid]
+                results[i] = {
+                    'name': name,
+                    'name_kr': PPE_COLOR_NAMES_KR[name],
+                    'rgb': (int(avg_r), int(avg_g), int(avg_b)),
+                    'hsv': (int(avg_h), int(avg_s), int(avg_v))
+                }
         except Exception as e:
-            return None
+            pass
+        return results
 
     def _classify_color(self, h, s, v):
         """
-        HSV 값으로 색상 분류
+        HSV 값으로 색상 분류 (색상 룩업 테이블의 PPE 규칙 사용)
 
         Args:
             h: Hue (0-180)
@@ -953,50 +1010,8 @@ class SafetyEquipmentDetectorV2:
         Returns:
             tuple: (영문 색상명, 한글 색상명)
         """
-        # 무채색 판정 (검정, 회색, 흰색)
-        # 1. 매우 어두운 색 → 검정
-        if v < 50:
-            return ('black', '검정')
-
-        # 2. 채도가 낮으면 무채색
-        # - 밝기가 낮을수록 채도 임계값을 높임 (어두운 회색 오탐 방지)
-        # - v=50~100: s<50이면 무채색, v=100~150: s<40이면 무채색, v>150: s<30이면 무채색
-        saturation_threshold = 50 if v < 100 else (40 if v < 150 else 30)
-        if s < saturation_threshold:
-            if v > 200:
-                return ('white', '흰색')
-            elif v > 100:
-                return ('gray', '회색')
-            else:
-                return ('dark_gray', '진회색')
-
-        # 3. 채도가 있어도 밝기가 낮고 채도가 낮은 편이면 진회색
-        # RGB=(63,63,60) 같은 경우: 어두운 색인데 미세한 색조 차이로 유채색 판정되는 것 방지
-        if v < 100 and s < 60:
-            return ('dark_gray', '진회색')
-
-        # 유채색 분류 (Hue 기반)
-        # OpenCV HSV: H는 0-180 범위
-        if h < 10 or h >= 170:
-            return ('red', '빨강')
-        elif h < 22:
-            return ('orange', '주황')
-        elif h < 35:
-            return ('yellow', '노랑')
-        elif h < 45:
-            return ('lime', '연두')
-        elif h < 75:
-            return ('green', '초록')
-        elif h < 95:
-            return ('cyan', '청록')
-        elif h < 125:
-            return ('blue', '파랑')
-        elif h < 145:
-            return ('purple', '보라')
-        elif h < 170:
-            return ('pink', '분홍')
-        else:
-            return ('red', '빨강')
+        name = get_color_lut('ppe').class_of(h, s, v) or 'red'
+        return (name, PPE_COLOR_NAMES_KR[name])
 
     def detect_ppe_with_yolo(self, frame):
         """
@@ -1033,6 +1048,10 @@ class SafetyEquipmentDetectorV2:
             if not frame.flags['C_CONTIGUOUS']:
                 frame = np.ascontiguousarray(frame)
 
+            # 캐스케이드 crop은 원본 해상도에서 잘라냄 (리사이즈 전 프레임 보관)
+            orig_frame = frame
+            self._cascade_persons = None
+
             # 고해상도 프레임 크기 제한 (4K → 1080p로 리사이즈)
             max_dim = 1920
             if max(h, w) > max_dim:
@@ -1048,23 +1067,60 @@ class SafetyEquipmentDetectorV2:
                 inference_size = 1280
             else:
                 inference_size = 640
+            # 시간 예산 초과 시 축소 (0.75 → 0.5배, 32 배수)
+            inference_size = self.budget.input_size('ppe', inference_size)
 
-            # 비율 유지하며 리사이즈
-            scale = inference_size / max(h, w)
-            new_w = int(w * scale)
-            new_h = int(h * scale)
-            resized_frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-
-            # YOLOv11 추론
-            # conf=0.01로 매우 낮춰서 더 많은 객체 감지 (나중에 필터링) - 1.9.7 최적값
-            results = self.yolo_model(
-                resized_frame,
-                verbose=False,
-                conf=0.01,  # 신뢰도 임계값 매우 낮춤 (1%) - 후처리에서 필터링
-                iou=0.45,   # NMS IoU 임계값 (중복 제거)
-                imgsz=inference_size,
-                augment=False
-            )
+            # 좌표 복원을 위한 역스케일 계산
+            inv_scale = max(h, w) / inference_size
+
+            # 캐스케이드 모드: 사람 crop에서 PPE/보조 모델 실행 (전체 프레임 추론 생략)
+            cascade = None
+            if self.use_ppe_cascade and max(orig_frame.shape[:2]) >= self.ppe_cascade_cfg.get('min_frame_dim', 1500):
+                cascade = self._get_ppe_cascade()
+
+            resized_frame = None
+            cascade_persons = []
+            # 보조 모델(마스크/보안경/장갑/안전화)은 시간 예산에 따라 N프레임마다, 건너뛴 프레임은 이전 박스 재사용
+            run_aux = self.has_mask_model and self.yolo_mask_model is not None and self.budget.due('boots')
+            if cascade is not None:
+                cascade_out = cascade.detect(orig_frame, self.yolo_model, None, ppe_conf=0.01)
+                if run_aux:
+                    # 보조 모델은 같은 사람 crop에서 따로 실행 (단계 시간을 나눠 측정)
+                    with self.budget.measure('boots'):
+                        cascade_out['aux_boxes'] = cascade.run_on_crops(self.yolo_mask_model, orig_frame,
+                                                                        cascade.last_regions, 0.25, iou=0.5)
+                # 원본 좌표 → 1920 제한 프레임 좌표
+                to_frame = w / float(orig_frame.shape[1])
+                main_dets = [(c, conf, xyxy * to_frame) for c, conf, xyxy in cascade_out['ppe_boxes']]
+                aux_dets = [(c, conf, xyxy * to_frame) for c, conf, xyxy in cascade_out['aux_boxes']]
+                if run_aux:
+                    self.budget.results['boots'] = (aux_dets, w)
+                else:
+                    aux_dets = self._cached_aux_dets(w)
+                cascade_persons = [[x1 * to_frame, y1 * to_frame, x2 * to_frame, y2 * to_frame]
+                                   for x1, y1, x2, y2, _ in cascade_out['persons']]
+                self._cascade_persons = cascade_out['persons']
+                self._cascade_persons_shape = orig_frame.shape[:2]
+                self._cascade_persons_time = time.monotonic()
+            else:
+                # 비율 유지하며 리사이즈
+                scale = inference_size / max(h, w)
+                new_w = int(w * scale)
+                new_h = int(h * scale)
+                resized_frame = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+                # YOLOv11 추론
+                # conf=0.01로 매우 낮춰서 더 많은 객체 감지 (나중에 필터링) - 1.9.7 최적값
+                results = self.yolo_model(
+                    resized_frame,
+                    verbose=False,
+                    conf=0.01,  # 신뢰도 임계값 매우 낮춤 (1%) - 후처리에서 필터링
+                    iou=0.45,   # NMS IoU 임계값 (중복 제거)
+                    imgsz=inference_size,
+                    augment=False
+                )
+                main_dets = self._collect_yolo_boxes(results, inv_scale)
+                aux_dets = None
 
             ppe_detections = {
                 'helmet': False,
@@ -1085,9 +1141,6 @@ class SafetyEquipmentDetectorV2:
                 'no_mask': False
             }
 
-            # 좌표 복원을 위한 역스케일 계산
-            inv_scale = max(h, w) / inference_size
-
             # 디버그용: 모든 감지 (낮은 신뢰도 포함) 카운트
             low_conf_count = 0
             very_low_conf_count = 0
@@ -1102,83 +1155,83 @@ class SafetyEquipmentDetectorV2:
             vest_conf = 0.0
             no_vest_conf = 0.0
 
-            for result in results:
-                boxes = result.boxes
-                for box in boxes:
-                    cls = int(box.cls[0])
-                    conf = float(box.conf[0])
-                    xyxy = box.xyxy[0].cpu().numpy()
-
-                    # 좌표를 원본 이미지 크기로 복원
-                    if inv_scale != 1.0:
-                        xyxy = xyxy * inv_scale
-
-                    # 클래스 이름 확인 (디버그용)
-                    cls_name = self.ppe_class_names.get(cls, f"unknown_{cls}")
-
-                    # 신뢰도 5% 이상인 모든 객체 저장
-                    if conf >= MIN_CONF_THRESHOLD:
-                        ppe_detections['boxes'].append({
-                            'class': cls,
-                            'class_name': cls_name,
-                            'confidence': conf,
-                            'bbox': xyxy.tolist()
-                        })
-
-                        # 미착용 클래스 감지 (사람이 있다는 증거)
-                        # 미착용 클래스가 감지되면 person 영역도 추정
-                        if cls == self.ppe_no_classes.get('helmet', -1):
-                            ppe_detections['no_helmet'] = True
-                            no_helmet_conf = max(no_helmet_conf, conf)  # 최고 신뢰도 추적
-                            if ppe_detections['person'] is None:
-                                ppe_detections['person'] = xyxy.tolist()
-                        elif cls == self.ppe_no_classes.get('vest', -1):
-                            no_vest_conf = max(no_vest_conf, conf)  # 최고 신뢰도 추적
-                        elif cls == self.ppe_no_classes.get('gloves', -1):
-                            ppe_detections['no_gloves'] = True
-                        elif cls == self.ppe_no_classes.get('glasses', -1):
-                            ppe_detections['no_glasses'] = True
-                        elif cls == self.ppe_no_classes.get('boots', -1):
-                            ppe_detections['no_boots'] = True
-                        elif cls == self.ppe_no_classes.get('mask', -1):
-                            ppe_detections['no_mask'] = True
+            # 색상 분석 대상 박스 (루프 후 한 번에 분류)
+            helmet_color_boxes = []
+            vest_color_boxes = []
+
+            for cls, conf, xyxy in main_dets:
+                # 클래스 이름 확인 (디버그용)
+                cls_name = self.ppe_class_names.get(cls, f"unknown_{cls}")
+
+                # 신뢰도 5% 이상인 모든 객체 저장
+                if conf >= MIN_CONF_THRESHOLD:
+                    ppe_detections['boxes'].append({
+                        'class': cls,
+                        'class_name': cls_name,
+                        'confidence': conf,
+                        'bbox': xyxy.tolist()
+                    })
 
-                        # 착용 여부 업데이트 (더 높은 신뢰도 요구)
-                        if conf >= WEARING_CONF_THRESHOLD:
-                            if cls == self.ppe_classes.get('helmet', -1):
-                                helmet_conf = max(helmet_conf, conf)  # 최고 신뢰도 추적
-                                # 헬멧 색상 감지 (bbox의 상단 60%만 사용하여 조끼 색상 혼입 방지)
-                                helmet_bbox = xyxy.copy()
-                                helmet_height = helmet_bbox[3] - helmet_bbox[1]
-                                helmet_bbox[3] = helmet_bbox[1] + helmet_height * 0.6  # 상단 60%만
-                                color_info = self._detect_color(frame, helmet_bbox)
-                                if color_info:
-                                    ppe_detections['helmet_color'] = color_info
-                                    # 헬멧 bbox 저장 (디버깅용)
-                                    ppe_detections['helmet_bbox'] = xyxy.tolist()
-                            elif cls == self.ppe_classes.get('vest', -1):
-                                vest_conf = max(vest_conf, conf)  # 최고 신뢰도 추적
-                                ppe_detections['vest'] = True
-                                # 조끼 색상 감지
-                                color_info = self._detect_color(frame, xyxy)
-                                if color_info:
-                                    ppe_detections['vest_color'] = color_info
-                            elif cls == self.ppe_classes.get('gloves', -1):
-                                ppe_detections['gloves'] = True
-                            elif cls == self.ppe_classes.get('boots', -1):
-                                ppe_detections['boots'] = True
-                            elif cls == self.ppe_classes.get('glasses', -1):
-                                ppe_detections['glasses'] = True
-                            elif cls == self.ppe_classes.get('mask', -1):
-                                ppe_detections['mask'] = True
-
-                        # person 클래스 감지 (신뢰도 무관하게 저장)
-                        if cls == self.person_class_id and ppe_detections['person'] is None:
+                    # 미착용 클래스 감지 (사람이 있다는 증거)
+                    # 미착용 클래스가 감지되면 person 영역도 추정
+                    if cls == self.ppe_no_classes.get('helmet', -1):
+                        ppe_detections['no_helmet'] = True
+                        no_helmet_conf = max(no_helmet_conf, conf)  # 최고 신뢰도 추적
+                        if ppe_detections['person'] is None:
                             ppe_detections['person'] = xyxy.tolist()
-                    elif conf > 0.02:
-                        low_conf_count += 1
-                    else:
-                        very_low_conf_count += 1
+                    elif cls == self.ppe_no_classes.get('vest', -1):
+                        no_vest_conf = max(no_vest_conf, conf)  # 최고 신뢰도 추적
+                    elif cls == self.ppe_no_classes.get('gloves', -1):
+                        ppe_detections['no_gloves'] = True
+                    elif cls == self.ppe_no_classes.get('glasses', -1):
+                        ppe_detections['no_glasses'] = True
+                    elif cls == self.ppe_no_classes.get('boots', -1):
+                        ppe_detections['no_boots'] = True
+                    elif cls == self.ppe_no_classes.get('mask', -1):
+                        ppe_detections['no_mask'] = True
+
+                    # 착용 여부 업데이트 (더 높은 신뢰도 요구)
+                    if conf >= WEARING_CONF_THRESHOLD:
+                        if cls == self.ppe_classes.get('helmet', -1):
+                            helmet_conf = max(helmet_conf, conf)  # 최고 신뢰도 추적
+                            # 헬멧 색상 감지 (bbox의 상단 60%만 사용하여 조끼 색상 혼입 방지)
+                            helmet_bbox = xyxy.copy()
+                            helmet_height = helmet_bbox[3] - helmet_bbox[1]
+                            helmet_bbox[3] = helmet_bbox[1] + helmet_height * 0.6  # 상단 60%만
+                            helmet_color_boxes.append((helmet_bbox, xyxy))
+                        elif cls == self.ppe_classes.get('vest', -1):
+                            vest_conf = max(vest_conf, conf)  # 최고 신뢰도 추적
+                            ppe_detections['vest'] = True
+                            # 조끼 색상 감지 (루프 후 일괄 처리)
+                            vest_color_boxes.append(xyxy)
+                        elif cls == self.ppe_classes.get('gloves', -1):
+                            ppe_detections['gloves'] = True
+                        elif cls == self.ppe_classes.get('boots', -1):
+                            ppe_detections['boots'] = True
+                        elif cls == self.ppe_classes.get('glasses', -1):
+                            ppe_detections['glasses'] = True
+                        elif cls == self.ppe_classes.get('mask', -1):
+                            ppe_detections['mask'] = True
+
+                    # person 클래스 감지 (신뢰도 무관하게 저장)
+                    if cls == self.person_class_id and ppe_detections['person'] is None:
+                        ppe_detections['person'] = xyxy.tolist()
+                elif conf > 0.02:
+                    low_conf_count += 1
+                else:
+                    very_low_conf_count += 1
+
+            # 헬멧/조끼 색상: 프레임의 모든 후보 박스를 한 번에 분류 (뒤쪽 유효 결과 우선)
+            if helmet_color_boxes or vest_color_boxes:
+                color_infos = self._detect_colors(frame, [b for b, _ in helmet_color_boxes] + vest_color_boxes)
+                for (_, box), color_info in zip(helmet_color_boxes, color_infos):
+                    if color_info:
+                        ppe_detections['helmet_color'] = color_info
+                        # 헬멧 bbox 저장 (디버깅용)
+                        ppe_detections['helmet_bbox'] = box.tolist()
+                for color_info in color_infos[len(helmet_color_boxes):]:
+                    if color_info:
+                        ppe_detections['vest_color'] = color_info
 
             # 디버그 카운터 초기화 (충돌 해결 로직에서도 사용)
             if not hasattr(self, '_yolo_debug_count'):
@@ -1237,18 +1290,18 @@ class SafetyEquipmentDetectorV2:
 
             if self._yolo_debug_count % 30 == 1:  # 약 1초마다
                 orig_h, orig_w = frame.shape[:2] if frame is not None else (0, 0)
-                resized_h, resized_w = resized_frame.shape[:2]
-                print(f"[YOLO 디버그] 원본: {orig_w}x{orig_h}, 추론: {resized_w}x{resized_h}, imgsz={inference_size}")
+                if cascade is not None:
+                    print(f"[YOLO 디버그] 원본: {orig_w}x{orig_h}, 캐스케이드: 사람 {len(cascade_persons)}명, crop imgsz={cascade.crop_imgsz}")
+                else:
+                    resized_h, resized_w = resized_frame.shape[:2]
+                    print(f"[YOLO 디버그] 원본: {orig_w}x{orig_h}, 추론: {resized_w}x{resized_h}, imgsz={inference_size}")
 
                 # 모든 감지 결과 출력 (신뢰도 1% 이상)
                 all_detections = []
-                for result in results:
-                    for box in result.boxes:
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        if conf >= 0.01:  # 1% 이상 모두 출력
-                            cls_name = self.ppe_class_names.get(cls, f"cls_{cls}")
-                            all_detections.append((cls_name, f"{conf:.2f}"))
+                for cls, conf, _ in main_dets:
+                    if conf >= 0.01:  # 1% 이상 모두 출력
+                        cls_name = self.ppe_class_names.get(cls, f"cls_{cls}")
+                        all_detections.append((cls_name, f"{conf:.2f}"))
 
                 if all_detections:
                     print(f"[YOLO 디버그] 전체 감지 (conf>=1%): {all_detections}")
@@ -1271,21 +1324,27 @@ class SafetyEquipmentDetectorV2:
                         print(f"[YOLO 디버그] 조끼 색상: {vc['name_kr']} ({vc['name']}) RGB={vc['rgb']}")
                 else:
                     # Raw 결과도 출력
-                    total_boxes = sum(len(r.boxes) for r in results)
+                    total_boxes = len(main_dets)
                     print(f"[YOLO 디버그] 유효 감지 없음, 총 boxes: {total_boxes}, 낮은 신뢰도: {low_conf_count}")
 
             # 보조 모델로 마스크/보안경/장갑 감지 (메인 모델에 해당 클래스가 없는 경우)
             # 보조 모델 클래스: {0: 'glove', 1: 'goggles', 2: 'helmet', 3: 'mask', 4: 'no_glove', 5: 'no_goggles', 6: 'no_helmet', 7: 'no_mask', 8: 'no_shoes', 9: 'shoes'}
             if self.has_mask_model and self.yolo_mask_model:
                 try:
-                    aux_results = self.yolo_mask_model(
-                        resized_frame,
-                        verbose=False,
-                        conf=0.25,  # 보조 모델 신뢰도 (1.9.7 값)
-                        iou=0.5,
-                        imgsz=inference_size,
-                        augment=False
-                    )
+                    if aux_dets is None and not run_aux:
+                        aux_dets = self._cached_aux_dets(w)
+                    elif aux_dets is None:
+                        with self.budget.measure('boots'):
+                            aux_results = self.yolo_mask_model(
+                                resized_frame,
+                                verbose=False,
+                                conf=0.25,  # 보조 모델 신뢰도 (1.9.7 값)
+                                iou=0.5,
+                                imgsz=inference_size,
+                                augment=False
+                            )
+                            aux_dets = self._collect_yolo_boxes(aux_results, inv_scale)
+                        self.budget.results['boots'] = (aux_dets, w)
 
                     # 보조 모델 클래스 ID 찾기
                     aux_classes = {
@@ -1303,43 +1362,40 @@ class SafetyEquipmentDetectorV2:
                     # 보조 모델 감지 결과 처리
                     aux_detections = []
                     aux_all_detections = []  # 디버그용 전체 감지
-                    for result in aux_results:
-                        for box in result.boxes:
-                            cls = int(box.cls[0])
-                            conf = float(box.conf[0])
-                            cls_name = self.yolo_mask_model.names.get(cls, f"cls_{cls}") if hasattr(self.yolo_mask_model, 'names') else f"cls_{cls}"
-
-                            # 디버그: 15% 이상인 모든 감지 기록
-                            if conf >= 0.15:
-                                aux_all_detections.append((cls_name, f"{conf:.2f}"))
-
-                            # 마스크
-                            if cls == aux_classes['mask'] and conf >= 0.30 and not ppe_detections['mask']:
-                                ppe_detections['mask'] = True
-                                aux_detections.append(('mask', conf))
-                            elif cls == aux_classes['no_mask'] and conf >= 0.30:
-                                ppe_detections['no_mask'] = True
-
-                            # 보안경 (goggles → glasses로 매핑)
-                            if cls == aux_classes['goggles'] and conf >= 0.30 and not ppe_detections['glasses']:
-                                ppe_detections['glasses'] = True
-                                aux_detections.append(('goggles', conf))
-                            elif cls == aux_classes['no_goggles'] and conf >= 0.30:
-                                ppe_detections['no_glasses'] = True
-
-                            # 장갑
-                            if cls == aux_classes['glove'] and conf >= 0.30 and not ppe_detections['gloves']:
-                                ppe_detections['gloves'] = True
-                                aux_detections.append(('glove', conf))
-                            elif cls == aux_classes['no_glove'] and conf >= 0.30:
-                                ppe_detections['no_gloves'] = True
-
-                            # 안전화 (shoes → boots로 매핑)
-                            if cls == aux_classes['shoes'] and conf >= 0.30 and not ppe_detections['boots']:
-                                ppe_detections['boots'] = True
-                                aux_detections.append(('shoes', conf))
-                            elif cls == aux_classes['no_shoes'] and conf >= 0.30:
-                                ppe_detections['no_boots'] = True
+                    for cls, conf, _ in aux_dets:
+                        cls_name = self.yolo_mask_model.names.get(cls, f"cls_{cls}") if hasattr(self.yolo_mask_model, 'names') else f"cls_{cls}"
+
+                        # 디버그: 15% 이상인 모든 감지 기록
+                        if conf >= 0.15:
+                            aux_all_detections.append((cls_name, f"{conf:.2f}"))
+
+                        # 마스크
+                        if cls == aux_classes['mask'] and conf >= 0.30 and not ppe_detections['mask']:
+                            ppe_detections['mask'] = True
+                            aux_detections.append(('mask', conf))
+                        elif cls == aux_classes['no_mask'] and conf >= 0.30:
+                            ppe_detections['no_mask'] = True
+
+                        # 보안경 (goggles → glasses로 매핑)
+                        if cls == aux_classes['goggles'] and conf >= 0.30 and not ppe_detections['glasses']:
+                            ppe_detections['glasses'] = True
+                            aux_detections.append(('goggles', conf))
+                        elif cls == aux_classes['no_goggles'] and conf >= 0.30:
+                            ppe_detections['no_glasses'] = True
+
+                        # 장갑
+                        if cls == aux_classes['glove'] and conf >= 0.30 and not ppe_detections['gloves']:
+                            ppe_detections['gloves'] = True
+                            aux_detections.append(('glove', conf))
+                        elif cls == aux_classes['no_glove'] and conf >= 0.30:
+                            ppe_detections['no_gloves'] = True
+
+                        # 안전화 (shoes → boots로 매핑)
+                        if cls == aux_classes['shoes'] and conf >= 0.30 and not ppe_detections['boots']:
+                            ppe_detections['boots'] = True
+                            aux_detections.append(('shoes', conf))
+                        elif cls == aux_classes['no_shoes'] and conf >= 0.30:
+                            ppe_detections['no_boots'] = True
 
                     # 디버그 출력 (30프레임마다)
                     if self._yolo_debug_count % 30 == 1:
@@ -1348,7 +1404,7 @@ class SafetyEquipmentDetectorV2:
                         if aux_detections:
                             print(f"[YOLO-Aux] 보조모델 유효 감지 (conf>=30%): {aux_detections}")
                         else:
-                            total_aux_boxes = sum(len(r.boxes) for r in aux_results)
+                            total_aux_boxes = len(aux_dets)
                             print(f"[YOLO-Aux] 보조모델 유효 감지 없음, 총 boxes: {total_aux_boxes}")
 
                 except Exception as aux_e:
@@ -1357,7 +1413,11 @@ class SafetyEquipmentDetectorV2:
 
             # 사람 감지 보조 모델: PPE 모델이 person을 감지하지 못한 경우 기본 YOLO로 사람 전체 감지
             # PPE 모델은 헬멧/조끼 영역만 감지하므로 person_box가 작거나 없음
-            if self.yolo_person_model and (ppe_detections['person'] is None or self._is_small_person_box(ppe_detections['person'], h, w)):
+            # 캐스케이드 모드에서는 1단계 사람 박스(면적 내림차순)를 그대로 사용
+            if cascade is not None:
+                if cascade_persons and (ppe_detections['person'] is None or self._is_small_person_box(ppe_detections['person'], h, w)):
+                    ppe_detections['person'] = cascade_persons[0]
+            elif self.yolo_person_model and (ppe_detections['person'] is None or self._is_small_person_box(ppe_detections['person'], h, w)):
                 try:
                     # IP카메라(고해상도)는 낮은 신뢰도로 더 많은 사람 감지
                     person_conf = 0.15 if inference_size >= 1280 else 0.3
@@ -1416,6 +1476,40 @@ class SafetyEquipmentDetectorV2:
             print(f"YOLOv11 PPE 감지 오류: {e}")
             return None
 
+    @staticmethod
+    def _collect_yolo_boxes(results, inv_scale=1.0):
+        """YOLO 결과 → [(cls, conf, xyxy)] 목록 (좌표는 inv_scale로 복원)"""
+        dets = []
+        for result in results:
+            for box in result.boxes:
+                xyxy = box.xyxy[0].cpu().numpy()
+                if inv_scale != 1.0:
+                    xyxy = xyxy * inv_scale
+                dets.append((int(box.cls[0]), float(box.conf[0]), xyxy))
+        return dets
+
+    def _cached_aux_dets(self, frame_width):
+        """보조 모델을 건너뛴 프레임: 마지막 보조 박스 (프레임 폭이 바뀌었으면 좌표 비율 조정)"""
+        cached = self.budget.results.get('boots')
+        if cached is None:
+            return []
+        dets, cached_width = cached
+        if cached_width == frame_width:
+            return dets
+        ratio = frame_width / float(cached_width)
+        return [(c, conf, xyxy * ratio) for c, conf, xyxy in dets]
+
+    def _get_ppe_cascade(self):
+        """캐스케이드 파이프라인 반환 (사람 감지 모델이 없으면 None → 전체 프레임 추론)"""
+        if self.ppe_cascade is None:
+            person_model = get_shared_yolo_cascade_person_model()
+            if person_model is None:
+                self.use_ppe_cascade = False
+                return None
+            self.ppe_cascade = CascadePPEPipeline.from_settings(person_model, self.ppe_cascade_cfg)
+            print(f"[PPE] 캐스케이드 감지 활성화 (crop imgsz={self.ppe_cascade.crop_imgsz}, 타일={self.ppe_cascade.tiling})")
+        return self.ppe_cascade
+
     def _calculate_iou(self, box1, box2):
         """
         두 박스의 IOU (Intersection over Union) 계산
@@ -1592,7 +1686,7 @@ class SafetyEquipmentDetectorV2:
 
         Args:
             frame: 입력 프레임 (BGR)
-            force_detect: True면 스킵 프레임 무시하고 즉시 감지
+            force_detect: 호환용 (실행 주기는 _face_stage에서 시간 예산으로 결정)
 
         Returns:
             list: 얼굴 정보 리스트
@@ -1609,6 +1703,22 @@ class SafetyEquipmentDetectorV2:
         try:
             h, w = frame.shape[:2]
 
+            # === 캐스케이드: 같은 프레임의 사람 박스가 있으면 원본 해상도 머리 crop에서 감지 ===
+            if (self.ppe_cascade is not None and self._cascade_persons and
+                    self._cascade_persons_shape == (h, w) and
+                    time.monotonic() - self._cascade_persons_time < 0.5):
+                faces = self.ppe_cascade.detect_faces(self.face_app, frame, self._cascade_persons,
+                                                      lock=_shared_insightface_inference_lock)
+                face_results = [{
+                    'bbox': face.bbox.astype(int).tolist(),
+                    'embedding': face.embedding,
+                    'age': getattr(face, 'age', None),
+                    'gender': getattr(face, 'gender', None),
+                    'score': face.det_score
+                } for face in faces]
+                self._cached_face_results = face_results
+                return face_results
+
             # === 해상도에 따른 적응형 다운스케일 ===
             # IP 카메라(고해상도)는 640px, 일반 웹캠은 480px 사용
             # 너무 작은 크기는 임베딩 품질 저하 유발
@@ -1621,6 +1731,8 @@ class SafetyEquipmentDetectorV2:
             else:
                 # 일반 웹캠 (720p 이하)
                 max_size = 480
+            # 시간 예산 초과 시 축소 (최소 320px)
+            max_size = self.budget.input_size('face', max_size)
 
             scale = max_size / max(h, w)
             # 스케일이 1 이상이면 리사이즈 불필요
@@ -1662,57 +1774,29 @@ class SafetyEquipmentDetectorV2:
         except Exception as e:
             return self._cached_face_results if self._cached_face_results else []
 
-    def _get_cached_db_embeddings(self):
-        """DB 임베딩 캐시 반환 (numpy 배열로 최적화)"""
-        import time
-        current_time = time.time()
-
-        # 캐시가 없거나 만료됐으면 갱신
-        if self._cached_db_embeddings is None or (current_time - self._db_cache_time) > self._db_cache_ttl:
-            try:
-                import sqlite3
-                import pickle
-
-                conn = sqlite3.connect(self.face_db.db_path)
-                cursor = conn.cursor()
-
-                cursor.execute('''
-                    SELECT fe.face_id, fe.encoding, f.name, f.employee_id, f.department
-                    FROM face_encodings fe
-                    INNER JOIN faces f ON fe.face_id = f.id
-                    WHERE f.is_active = 1
-                ''')
-
-                rows = cursor.fetchall()
-                conn.close()
-
-                if rows:
-                    # numpy 배열로 변환 (배치 연산용)
-                    embeddings_list = []
-                    info_list = []
-                    for row in rows:
-                        emb = pickle.loads(row[1])
-                        emb_norm = emb / np.linalg.norm(emb)
-                        embeddings_list.append(emb_norm)
-                        info_list.append({
-                            'face_id': row[0],
-                            'name': row[2],
-                            'employee_id': row[3],
-                            'department': row[4]
-                        })
-
-                    # 2D numpy 배열로 저장 (N x 512)
-                    self._cached_db_embeddings = {
-                        'embeddings': np.array(embeddings_list, dtype=np.float32),
-                        'info': info_list
-                    }
-                else:
-                    self._cached_db_embeddings = {'embeddings': None, 'info': []}
+    def _face_stage(self, frame):
+        """
+        얼굴 감지 + 인식 단계 (시간 예산에 따라 N프레임마다, 건너뛴 프레임은 마지막 결과 재사용)
 
-                self._db_cache_time = current_time
+        Returns:
+            tuple: (face_results, recognized_faces)
+        """
+        cached = self.budget.results.get('face')
+        if not self.budget.due('face') and cached is not None:
+            return cached
+        with self.budget.measure('face'):
+            face_results = self.detect_faces_with_insightface(frame)
+            recognized_faces = self.recognize_faces_insightface(face_results)
+        self.budget.results['face'] = (face_results, recognized_faces)
+        return face_results, recognized_faces
 
-            except Exception as e:
-                print(f"DB 캐시 로드 오류: {e}")
+    def _get_cached_db_embeddings(self):
+        """DB 임베딩 캐시 반환 (DB 파일별 공유 색인, 일괄 등록 시 새 행만 덧붙여짐)"""
+        try:
+            self._cached_db_embeddings = self.face_db.get_recognition_index(self._db_cache_ttl)
+        except Exception as e:
+            print(f"DB 캐시 로드 오류: {e}")
+            if self._cached_db_embeddings is None:
                 self._cached_db_embeddings = {'embeddings': None, 'info': []}
 
         return self._cached_db_embeddings
@@ -1813,11 +1897,9 @@ class SafetyEquipmentDetectorV2:
             return {'faces': [], 'recognized_faces': []}
 
         try:
-            # InsightFace로 얼굴 감지 + 임베딩
-            face_results = self.detect_faces_with_insightface(frame)
-
-            # DB와 비교하여 인식
-            recognized_faces = self.recognize_faces_insightface(face_results)
+            # InsightFace로 얼굴 감지 + 임베딩 → DB와 비교하여 인식 (시간 예산에 따라 N프레임마다)
+            with self.budget.frame():
+                face_results, recognized_faces = self._face_stage(frame)
 
             # bbox 형식 변환
             faces_list = []
@@ -1985,11 +2067,14 @@ class SafetyEquipmentDetectorV2:
                 imgsz = 1280
             else:
                 imgsz = 640
+            # 시간 예산 초과 시 축소 (실행 주기는 호출 측 AI 스레드가 budget.due('coco')로 결정)
+            imgsz = self.budget.input_size('coco', imgsz)
 
             # 원본 프레임 사용 (YOLO 내부에서 최적화된 리사이즈 수행)
             use_frame = frame
 
-            results = coco_model(use_frame, verbose=False, conf=confidence_threshold, imgsz=imgsz)
+            with self.budget.measure('coco'):
+                results = coco_model(use_frame, verbose=False, conf=confidence_threshold, imgsz=imgsz)
 
             detected_objects = []
             all_detections = []  # 디버그용
@@ -2103,6 +2188,8 @@ class SafetyEquipmentDetectorV2:
         """
         전체 안전장구 감지 수행 (v2.0)
 
+        움직임 게이트는 호출 측(거울보기 AI 스레드)이 설정값으로 만든 게이트를 적용합니다.
+
         Args:
             frame: 입력 프레임 (BGR)
 
@@ -2113,26 +2200,26 @@ class SafetyEquipmentDetectorV2:
         if frame is None or not hasattr(frame, 'shape') or len(frame.shape) < 2:
             return None
 
-        # === 프레임 스킵 최적화 (성능 향상) ===
-        self._frame_count += 1
-
-        # N프레임마다만 전체 감지 수행, 나머지는 캐시된 결과 반환
-        if self._frame_count % self._detection_interval != 0:
-            if self._last_stable_results is not None:
-                # 캐시된 결과에 현재 프레임 정보만 업데이트
-                return self.last_results
-            # 캐시가 없으면 감지 수행
+        # === 단계별 시간 예산 (단계마다 실행 주기/입력 해상도 결정, 건너뛴 단계는 이전 결과 재사용) ===
+        with self.budget.frame():
+            return self._run_detection_stages(frame)
 
+    def _run_detection_stages(self, frame):
+        """detect_all 본체: PPE → 얼굴 → Legacy 보완 → 추적/안정화 → 결과 통합"""
         try:
             # YOLOv11로 PPE 감지
             ppe_results = None
             if self.use_yolo:
-                ppe_results = self.detect_ppe_with_yolo(frame)
+                if self.budget.due('ppe') or 'ppe' not in self.budget.results:
+                    with self.budget.measure('ppe'):
+                        ppe_results = self.detect_ppe_with_yolo(frame)
+                    self.budget.results['ppe'] = dict(ppe_results) if ppe_results else None
+                elif self.budget.results['ppe']:
+                    ppe_results = dict(self.budget.results['ppe'])
 
             # InsightFace로 얼굴 감지 (먼저 실행하여 face_bbox 확보)
             if self.use_insightface:
-                face_results = self.detect_faces_with_insightface(frame)
-                recognized_faces = self.recognize_faces_insightface(face_results)
+                face_results, recognized_faces = self._face_stage(frame)
             else:
                 face_results = []
                 recognized_faces = []
@@ -2165,7 +2252,7 @@ class SafetyEquipmentDetectorV2:
             # PPE 전용 모델이 아니면 Legacy 방식으로 안전장구 감지 (항상 실행)
             # YOLO 기본 모델은 person만 감지하므로 헬멧/조끼는 Legacy로 감지
             if not self.has_ppe_model:
-                legacy_ppe = self._detect_ppe_legacy(frame, face_bbox)
+                legacy_ppe = self._legacy_stage(frame, face_bbox)
                 if ppe_results:
                     # YOLO person + Legacy PPE 결합
                     ppe_results['helmet'] = legacy_ppe.get('helmet', False)
@@ -2194,7 +2281,7 @@ class SafetyEquipmentDetectorV2:
                         need_legacy = True
 
                 if need_legacy and ppe_results:
-                    legacy_ppe = self._detect_ppe_legacy(frame, face_bbox)
+                    legacy_ppe = self._legacy_stage(frame, face_bbox)
                     # vest 색상이 없으면 Legacy에서 가져오기
                     if not ppe_results.get('vest_color'):
                         ppe_results['vest_color'] = legacy_ppe.get('vest_color')
@@ -2205,7 +2292,7 @@ class SafetyEquipmentDetectorV2:
 
             # 기존 방식 백업 (YOLO 실패 시)
             if not ppe_results:
-                ppe_results = self._detect_ppe_legacy(frame, face_bbox)
+                ppe_results = self._legacy_stage(frame, face_bbox)
 
             # === PPE 추적 적용 (감지 안 되어도 일정 프레임 유지) ===
             ppe_results = self._track_ppe(ppe_results)
@@ -2260,6 +2347,16 @@ class SafetyEquipmentDetectorV2:
             print(f"안전장구 감지 오류: {e}")
             return None
 
+    def _legacy_stage(self, frame, face_bbox=None):
+        """Legacy 색상 단계 (시간 예산에 따라 N프레임마다, 건너뛴 프레임은 마지막 결과 사본)"""
+        cached = self.budget.results.get('legacy')
+        if not self.budget.due('legacy') and cached is not None:
+            return dict(cached)
+        with self.budget.measure('legacy'):
+            result = self._detect_ppe_legacy(frame, face_bbox)
+        self.budget.results['legacy'] = result
+        return dict(result)
+
     def _detect_ppe_legacy(self, frame, face_bbox=None):
         """
         기존 OpenCV 방식으로 PPE 감지 (백업)
@@ -2304,6 +2401,7 @@ class SafetyEquipmentDetectorV2:
 
             # 얼굴 박스가 전달되면 그 기준으로 헬멧/조끼 감지
             if face_bbox is not None:
+                color_regions = {}
                 fx1, fy1, fx2, fy2 = [int(x) for x in face_bbox]
                 face_w = fx2 - fx1
                 face_h = fy2 - fy1
@@ -2350,10 +2448,8 @@ class SafetyEquipmentDetectorV2:
 
                         if is_helmet:
                             result['helmet'] = True
-                            # 헬멧 색상 분석
-                            helmet_color = self._get_dominant_color(head_region_color)
-                            if helmet_color:
-                                result['helmet_color'] = color_info_map.get(helmet_color, color_info_map['white'])
+                            # 헬멧 색상 분석 (상의 영역과 함께 일괄 처리)
+                            color_regions['helmet_color'] = head_region_color
 
                 # 상의(조끼) 색상 감지 (얼굴 아래 영역)
                 body_y1 = fy2  # 얼굴 끝
@@ -2364,9 +2460,15 @@ class SafetyEquipmentDetectorV2:
                 if body_y2 > body_y1 and body_x2 > body_x1:
                     body_region = frame[body_y1:body_y2, body_x1:body_x2]
                     if body_region.size > 0:
-                        body_color = self._get_dominant_color(body_region)
-                        if body_color:
-                            result['vest_color'] = color_info_map.get(body_color, color_info_map['gray'])
+                        color_regions['vest_color'] = body_region
+
+                # 헬멧/상의 색상을 한 번에 분류
+                if color_regions:
+                    defaults = {'helmet_color': 'white', 'vest_color': 'gray'}
+                    keys = list(color_regions)
+                    for key, color in zip(keys, self._get_dominant_colors([color_regions[k] for k in keys])):
+                        if color:
+                            result[key] = color_info_map.get(color, color_info_map[defaults[key]])
 
             else:
                 # 얼굴 박스가 없으면 기존 방식 (상체 감지)
@@ -2416,48 +2518,30 @@ class SafetyEquipmentDetectorV2:
         Returns:
             str: 색상 이름 (orange, yellow, lime, green, blue, white, gray, black, red, purple, pink, brown)
         """
-        if region is None or region.size == 0:
-            return None
+        return self._get_dominant_colors([region])[0]
 
-        try:
-            hsv = cv2.cvtColor(region, cv2.COLOR_BGR2HSV)
-            total_pixels = region.size // 3  # BGR 3채널
-
-            # 색상별 마스크 생성 (회색/흰색 구분 강화)
-            # HSV: H(0-180), S(0-255), V(0-255)
-            # 무채색: S가 낮음 (< 50), V로 밝기 구분
-            # 유채색: S가 높음 (>= 50)
-            masks = {
-                'red': cv2.bitwise_or(
-                    cv2.inRange(hsv, (0, 80, 80), (10, 255, 255)),
-                    cv2.inRange(hsv, (170, 80, 80), (180, 255, 255))
-                ),
-                'orange': cv2.inRange(hsv, (10, 80, 80), (22, 255, 255)),
-                'yellow': cv2.inRange(hsv, (22, 80, 80), (35, 255, 255)),
-                'lime': cv2.inRange(hsv, (35, 80, 80), (55, 255, 255)),
-                'green': cv2.inRange(hsv, (55, 80, 80), (85, 255, 255)),
-                'blue': cv2.inRange(hsv, (85, 80, 80), (130, 255, 255)),
-                'purple': cv2.inRange(hsv, (130, 80, 80), (150, 255, 255)),
-                'pink': cv2.inRange(hsv, (150, 50, 80), (170, 255, 255)),
-                'brown': cv2.inRange(hsv, (10, 80, 50), (22, 255, 150)),
-                # 무채색: S < 50으로 구분, V로 밝기 결정
-                'white': cv2.inRange(hsv, (0, 0, 220), (180, 50, 255)),   # 매우 밝음 (V >= 220)
-                'gray': cv2.inRange(hsv, (0, 0, 70), (180, 50, 220)),     # 중간 밝기 (70 <= V < 220)
-                'black': cv2.inRange(hsv, (0, 0, 0), (180, 50, 70))       # 어두움 (V < 70)
-            }
-
-            # 각 색상 비율 계산
-            color_ratios = {}
-            for color_name, mask in masks.items():
-                ratio = np.sum(mask > 0) / total_pixels
-                color_ratios[color_name] = ratio
+    def _get_dominant_colors(self, regions):
+        """
+        여러 영역의 주요 색상을 한 번에 계산
 
-            # 가장 많은 색상 반환
-            max_color = max(color_ratios, key=color_ratios.get)
-            return max_color
+        색상별 HSV 범위(겹침 허용)에 속한 픽셀 수를 룩업 테이블 + bincount 한 번으로 세고,
+        가장 많은 색상을 선택합니다 (기존 색상별 cv2.inRange 마스크 방식과 동일한 결과).
 
+        Returns:
+            list: 영역별 색상 이름 (빈 영역은 None)
+        """
+        results = [None] * len(regions)
+        try:
+            slots = [i for i, r in enumerate(regions) if r is not None and r.size > 0]
+            if not slots:
+                return results
+            lut = get_color_lut('dominant')
+            counts = lut.histograms([to_hsv(regions[i]) for i in slots])
+            for k, i in enumerate(slots):
+                results[i] = lut.names[int(np.argmax(counts[k]))]
         except Exception as e:
-            return None
+            pass
+        return results
 
     def _detect_faces_legacy(self, frame):
         """기존 OpenCV Haar Cascade 방식으로 얼굴 감지 (백업)"""
@@ -26,6 +26,7 @@ import platform
 from pathlib import Path
 
 from ..utils.helpers import get_base_dir
+from ..utils.text_sprite import get_text_sprite_cache, has_korean
 
 # PIL import (한글 텍스트 표시용)
 try:
@@ -579,7 +580,7 @@ class SafetyEquipmentDetectorV2:
 
     def _put_korean_text(self, frame, text, position, color=(0, 255, 0), font_size=24):
         """
-        한글 텍스트를 프레임에 그리기 (PIL 사용, 성능 최적화)
+        한글 텍스트를 프레임에 그리기 (PIL 스프라이트 캐시, 프레임을 직접 수정)
 
         Args:
             frame: OpenCV BGR 이미지
@@ -592,17 +593,11 @@ class SafetyEquipmentDetectorV2:
             텍스트가 그려진 프레임
         """
         # 한글이 없으면 빠른 cv2.putText 사용
-        has_korean = any('\uac00' <= c <= '\ud7a3' or '\u3131' <= c <= '\u3163' for c in text)
-        if not has_korean or not PIL_AVAILABLE:
+        if not has_korean(text) or not PIL_AVAILABLE:
             cv2.putText(frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
             return frame
 
         try:
-            # BGR -> RGB 변환
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(frame_rgb)
-            draw = ImageDraw.Draw(pil_img)
-
             # 폰트 캐시 사용 (성능 최적화)
             if not hasattr(self, '_font_cache'):
                 self._font_cache = {}
@@ -626,22 +621,8 @@ class SafetyEquipmentDetectorV2:
             if font is None:
                 font = ImageFont.load_default()
 
-            # BGR -> RGB 색상 변환
-            rgb_color = (color[2], color[1], color[0])
-
-            # 텍스트 그리기 (테두리 효과)
-            x, y = position
-            # 검은색 테두리
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    if dx != 0 or dy != 0:
-                        draw.text((x + dx, y + dy), text, font=font, fill=(0, 0, 0))
-            # 메인 텍스트
-            draw.text((x, y), text, font=font, fill=rgb_color)
-
-            # RGB -> BGR 변환
-            frame = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-            return frame
+            # 텍스트 스프라이트 캐시: 라벨 영역만 알파 블렌딩 (검은색 테두리 포함)
+            return get_text_sprite_cache().draw(frame, text, position, font, color, outline=True)
 
         except Exception as e:
             # 오류 시 cv2.putText 폴백
@@ -0,0 +1,447 @@
+"""
+AI 추론 단계별 시간 예산 컨트롤러 (Stage Budget)
+
+단계별 추론 시간을 지수 이동 평균(EWMA)으로 측정하여, 목표 FPS와 목표 지연 시간을
+지키도록 단계별 실행 주기(N프레임마다 1번)와 입력 해상도 배율을 정합니다.
+단계: YOLO PPE, 보조 모델(마스크/보안경/장갑/안전화), YOLOv10 PPE + 안전화 모델(거울보기),
+      InsightFace 얼굴, COCO 사물, Legacy 색상
+
+- 측정 시간(StageCosts)은 프로세스 공용 (같은 모델은 어느 화면에서 실행해도 같은 비용, 원래 해상도 기준)
+- 실행 계획(StageBudget)은 사용하는 쪽마다 따로 (패널 AI 스레드, 서명 화면 감지기 등)
+  → 한 쪽에서 단계를 실행해도 다른 쪽의 주기/프레임 공급/이전 결과에 영향 없음
+
+- 처리량: 프레임당 평균 비용 Σ(단계 시간 / 주기) ≤ 1 / target_fps
+  → 넘치면 "우선순위 대비 절약 시간"이 가장 큰 단계부터 주기를 1씩 늘림 (단계별 최대 주기까지)
+  → 여유가 relax_ratio 아래로 내려가야 주기를 줄임 (경계에서 주기가 오락가락하지 않도록)
+- 지연: 한 프레임에서 실행하는 단계 시간 합 ≤ target_latency
+  → 이번 프레임에 이미 쓴 시간 + 단계 예상 시간이 넘치면 다음 프레임으로 미룸 (단계가 한 프레임에 몰리지 않게)
+  → 단계 1개가 혼자 넘치거나, 주기를 최대로 늘려도 처리량이 모자라면 입력 해상도를 한 단계 낮춤
+  → 여유가 생기면 해상도를 한 단계씩 되돌림
+- 프레임 공급: accept_frame()은 목표 FPS와 실제 처리 속도 중 느린 쪽 간격으로만 True
+  → 처리하지 못할 프레임을 복사/대기열에 쌓지 않음
+
+사용:
+    budget = StageBudget()
+    budget.begin_frame()
+    if budget.due('ppe'):
+        with budget.measure('ppe'):
+            budget.results['ppe'] = ...
+    ppe = budget.results.get('ppe')
+    budget.end_frame()
+
+measure()는 중첩할 수 있으며 바깥 단계 시간에서 안쪽 단계 시간을 뺀 값을 기록합니다.
+(예: YOLO PPE 안에서 보조 모델을 실행해도 두 단계 시간이 따로 잡힘)
+begin_frame() ~ end_frame() 사이에는 active_stage_budget()이 그 예산을 돌려주므로,
+같은 스레드에서 호출한 감지기 메서드도 호출 측 프레임/계획에 포함됩니다.
+"""
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+
+STAGES = ('ppe', 'boots', 'ppe_v10', 'boots_v10', 'face', 'coco', 'legacy')
+
+STAGE_LABELS = {
+    'ppe': 'YOLO 안전장구',
+    'boots': '보조 모델 (안전화 등)',
+    'ppe_v10': 'YOLOv10 안전장구 (거울보기)',
+    'boots_v10': '안전화 모델 (거울보기)',
+    'face': 'InsightFace 얼굴',
+    'coco': 'COCO 사물',
+    'legacy': 'Legacy 색상',
+}
+
+# 주기를 늘릴 때 우선순위 (높을수록 늦게 늘림)
+DEFAULT_PRIORITY = {'ppe': 1.0, 'ppe_v10': 1.0, 'face': 1.0, 'boots': 0.5, 'boots_v10': 0.5,
+                    'legacy': 0.4, 'coco': 0.25}
+
+# 단계별 최대 주기 (프레임)
+DEFAULT_MAX_INTERVAL = {'ppe': 3, 'ppe_v10': 3, 'face': 4, 'boots': 6, 'boots_v10': 6, 'legacy': 6, 'coco': 10}
+
+# 해상도 배율 단계 (ppe/ppe_v10/face/coco만 조절, 안전화 단계는 PPE와 같은 축소 프레임을 사용)
+SCALE_STEPS = (1.0, 0.75, 0.5)
+SCALABLE_STAGES = ('ppe', 'ppe_v10', 'face', 'coco')
+_LINKED_STAGES = {'ppe': ('boots',), 'ppe_v10': ('boots_v10',)}
+_SCALE_PARENT = {linked: parent for parent, stages in _LINKED_STAGES.items() for linked in stages}
+
+
+class StageCosts:
+    """단계별 실행 시간 EWMA (원래 해상도 기준, 사용하는 쪽 모두 공유)
+
+    시간은 입력 픽셀 수에 비례한다고 보고 배율² 로 나눠 저장하므로,
+    서로 다른 해상도로 실행하는 예산들이 같은 값을 함께 갱신할 수 있습니다.
+    """
+
+    def __init__(self, alpha=0.2):
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._ewma = {}  # 단계 → 실행 시간 EWMA (초, 배율 1.0 기준)
+
+    def record(self, stage, seconds, scale=1.0):
+        full = seconds / (scale * scale)
+        with self._lock:
+            old = self._ewma.get(stage)
+            self._ewma[stage] = full if old is None else old + self.alpha * (full - old)
+
+    def expected(self, stage, scale=1.0):
+        """배율 scale로 실행할 때 예상 시간 (초, 측정 전이면 None)"""
+        full = self._ewma.get(stage)
+        return None if full is None else full * scale * scale
+
+    def __contains__(self, stage):
+        return stage in self._ewma
+
+
+_stage_costs = None
+_stage_costs_lock = threading.Lock()
+
+
+def get_stage_costs():
+    """프로세스 공용 단계별 시간 측정값"""
+    global _stage_costs
+    if _stage_costs is None:
+        with _stage_costs_lock:
+            if _stage_costs is None:
+                _stage_costs = StageCosts()
+    return _stage_costs
+
+
+_budgets = weakref.WeakSet()  # 살아 있는 예산 (성능 설정 화면 표시/일괄 설정용)
+_budgets_lock = threading.Lock()
+_default_enabled = True  # configure_stage_budgets(enabled=...) 이후 새로 만드는 예산의 기본값
+_active = threading.local()  # 스레드별 진행 중인 프레임의 예산
+
+
+class StageBudget:
+    """단계별 실행 주기/해상도 결정 (사용하는 쪽마다 하나, 시간 측정값은 StageCosts 공유)"""
+
+    def __init__(self, target_fps=6.0, target_latency=0.4, alpha=0.2, update_every=10,
+                 relax_ratio=0.6, priorities=None, max_intervals=None, enabled=None,
+                 costs=None, name=""):
+        """
+        Args:
+            target_fps: 목표 AI 처리 FPS (프레임당 평균 비용 상한 = 1 / target_fps)
+            target_latency: 목표 지연 시간(초, 한 프레임에서 실행하는 단계 시간 합의 상한)
+            alpha: 프레임 처리 시간/간격 EWMA 가중치 (새 측정값 비율)
+            update_every: N프레임마다 계획 재계산
+            relax_ratio: 비용이 예산의 이 비율 이하일 때만 주기/해상도를 되돌림
+            priorities: 단계별 우선순위 (기본 DEFAULT_PRIORITY)
+            max_intervals: 단계별 최대 주기 (기본 DEFAULT_MAX_INTERVAL)
+            enabled: False면 모든 단계를 매 프레임 원래 해상도로 실행 (측정만 수행),
+                     None이면 configure_stage_budgets()로 정한 기본값
+            costs: 단계별 시간 측정값 (기본 get_stage_costs() 공용)
+            name: 성능 설정 화면에 표시할 이름
+        """
+        self.target_fps = float(target_fps)
+        self.target_latency = float(target_latency)
+        self.alpha = alpha
+        self.update_every = max(1, int(update_every))
+        self.relax_ratio = relax_ratio
+        self.priorities = dict(DEFAULT_PRIORITY, **(priorities or {}))
+        self.max_intervals = dict(DEFAULT_MAX_INTERVAL, **(max_intervals or {}))
+        self.enabled = _default_enabled if enabled is None else bool(enabled)
+        self.costs = costs if costs is not None else get_stage_costs()
+        self.name = name
+
+        self._lock = threading.Lock()
+        self._local = threading.local()  # 스레드별 현재 프레임/측정 중첩 상태
+
+        self.results = {}  # 단계 → 마지막 실행 결과 (due()가 False인 프레임에 재사용)
+        self._cost = {}  # 계획 중 단계 → 예상 시간 (초, 이 예산의 현재 해상도 기준)
+        self._interval = {s: 1 for s in STAGES}
+        self._level = {s: 0 for s in STAGES}  # SCALE_STEPS 인덱스
+        self._since = {s: 0 for s in STAGES}  # 마지막 실행 후 지난 프레임 수
+        self._asked = {s: -1 for s in STAGES}  # 마지막으로 due()를 물어본 프레임 (사용 중인 단계 판별)
+        self._runs = {s: 0 for s in STAGES}
+
+        self.frames = 0
+        self.frame_seconds = None  # 프레임 처리 시간 EWMA (초)
+        self.frame_period = None  # 프레임 시작 간격 EWMA (초, 실제 처리 FPS 역수)
+        self._last_begin = None
+        self._last_accept = 0.0
+
+        with _budgets_lock:
+            _budgets.add(self)
+
+    # ------------------------------------------------------------------ 설정
+
+    def configure(self, target_fps=None, target_latency=None, enabled=None):
+        """목표 변경 (성능 모드 전환 시), 바뀐 값이 있으면 다음 프레임에서 바로 재계산"""
+        with self._lock:
+            changed = False
+            if target_fps is not None and float(target_fps) != self.target_fps:
+                self.target_fps = float(target_fps)
+                changed = True
+            if target_latency is not None and float(target_latency) != self.target_latency:
+                self.target_latency = float(target_latency)
+                changed = True
+            if enabled is not None and bool(enabled) != self.enabled:
+                self.enabled = bool(enabled)
+                changed = True
+                if not self.enabled:
+                    self._reset_plan()
+            if changed and self.enabled:
+                self._replan()
+
+    def _reset_plan(self):
+        for s in STAGES:
+            self._interval[s] = 1
+            self._level[s] = 0
+
+    @property
+    def frame_budget(self):
+        """프레임당 평균 비용 상한 (초)"""
+        return 1.0 / max(0.1, self.target_fps)
+
+    # ------------------------------------------------------------------ 프레임
+
+    def _state(self):
+        local = self._local
+        if not hasattr(local, 'start'):
+            local.start = None
+            local.spent = 0.0
+            local.stack = []
+        return local
+
+    def begin_frame(self):
+        """새 프레임 시작 (끝나지 않은 이전 프레임은 기록하지 않고 버림)"""
+        now = time.perf_counter()
+        local = self._state()
+        local.start = now
+        local.spent = 0.0
+        local.stack = []
+        _active.budget = self
+        with self._lock:
+            self.frames += 1
+            for s in STAGES:
+                self._since[s] += 1
+            if self._last_begin is not None:
+                self.frame_period = self._smooth(self.frame_period, now - self._last_begin)
+            self._last_begin = now
+
+    def end_frame(self):
+        """프레임 종료: 처리 시간 기록, update_every 프레임마다 계획 재계산"""
+        local = self._state()
+        if local.start is None:
+            return
+        elapsed = time.perf_counter() - local.start
+        local.start = None
+        if getattr(_active, 'budget', None) is self:
+            _active.budget = None
+        with self._lock:
+            self.frame_seconds = self._smooth(self.frame_seconds, elapsed)
+            if self.enabled and self.frames % self.update_every == 0:
+                self._replan()
+
+    @contextmanager
+    def frame(self):
+        """begin_frame/end_frame 묶음 (이 스레드에서 이미 프레임이 진행 중이면 그 프레임에 포함)"""
+        if self._state().start is not None:
+            yield
+            return
+        self.begin_frame()
+        try:
+            yield
+        finally:
+            self.end_frame()
+
+    def accept_frame(self):
+        """프레임 공급 측: 지금 AI 대기열에 프레임을 넣을지 (목표 FPS와 실제 처리 속도 중 느린 쪽)"""
+        now = time.perf_counter()
+        period = self.frame_budget
+        if self.frame_seconds is not None:
+            period = max(period, self.frame_seconds)
+        if now - self._last_accept < period:
+            return False
+        self._last_accept = now
+        return True
+
+    # ------------------------------------------------------------------ 단계
+
+    def due(self, stage):
+        """이번 프레임에 단계를 실행할지 (False면 호출 측은 이전 결과 재사용)"""
+        with self._lock:
+            self._asked[stage] = self.frames
+            expected = self.costs.expected(stage, self.scale(stage))
+            if not self.enabled or expected is None:
+                return True
+            interval = self._interval[stage]
+            since = self._since[stage]
+            if since < interval:
+                return False
+            # 지연 예산: 이번 프레임에 이미 다른 단계가 실행됐고 넘칠 것 같으면 다음 프레임으로
+            # (주기만큼 미뤄졌으면 예산과 관계없이 실행)
+            local = self._state()
+            if (local.spent > 0 and local.spent + expected > self.target_latency
+                    and since < 2 * interval):
+                return False
+            return True
+
+    def record(self, stage, seconds):
+        """단계 실행 시간 기록 (초, 현재 배율로 실행한 시간)"""
+        local = self._state()
+        local.spent += seconds
+        self.costs.record(stage, seconds, self.scale(stage))
+        with self._lock:
+            self._since[stage] = 0
+            self._runs[stage] += 1
+
+    @contextmanager
+    def measure(self, stage):
+        """with 블록 시간을 단계 시간으로 기록 (안쪽 measure 시간은 제외)"""
+        local = self._state()
+        local.stack.append(0.0)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            nested = local.stack.pop()
+            if local.stack:
+                local.stack[-1] += elapsed
+            self.record(stage, max(0.0, elapsed - nested))
+
+    def scale(self, stage):
+        """단계 입력 해상도 배율 (1.0, 0.75, 0.5)"""
+        if not self.enabled:
+            return 1.0
+        stage = _SCALE_PARENT.get(stage, stage)
+        return SCALE_STEPS[self._level.get(stage, 0)]
+
+    def input_size(self, stage, base, minimum=320, multiple=32):
+        """기본 입력 크기(imgsz, 긴 변 픽셀)에 배율 적용 (multiple 배수, minimum 이상, base 이하)"""
+        size = int(round(base * self.scale(stage) / multiple)) * multiple
+        return int(min(base, max(minimum, size)))
+
+    def interval(self, stage):
+        return self._interval.get(stage, 1) if self.enabled else 1
+
+    # ------------------------------------------------------------------ 계획
+
+    def _smooth(self, old, value):
+        return value if old is None else old + self.alpha * (value - old)
+
+    def _active(self):
+        """최근 2 * update_every 프레임 안에 due()로 물어본 + 측정값이 있는 단계"""
+        horizon = 2 * self.update_every
+        return [s for s in STAGES if s in self.costs and self.frames - self._asked[s] <= horizon]
+
+    def _expected(self, active):
+        """단계 → 현재 해상도 기준 예상 시간 (공용 측정값 × 배율²)"""
+        return {s: self.costs.expected(s, self.scale(s)) for s in active}
+
+    def _plan_intervals(self, active, budget):
+        """budget(초/프레임) 안에 들도록 주기 결정 (1부터 탐욕적으로 증가)"""
+        intervals = {s: 1 for s in active}
+
+        def cost():
+            return sum(self._cost[s] / intervals[s] for s in active)
+
+        while cost() > budget:
+            candidates = [s for s in active if intervals[s] < self.max_intervals.get(s, 1)]
+            if not candidates:
+                break
+
+            def gain(s):
+                iv = intervals[s]
+                return (self._cost[s] / iv - self._cost[s] / (iv + 1)) / self.priorities.get(s, 1.0)
+
+            intervals[max(candidates, key=gain)] += 1
+        return intervals, cost()
+
+    def _set_level(self, stage, level):
+        """해상도 단계 변경 + 계획 중인 예상 시간을 새 해상도 기준으로 갱신 (시간 ∝ 픽셀 수)"""
+        self._level[stage] = level
+        for s in (stage,) + _LINKED_STAGES.get(stage, ()):
+            if s in self._cost:
+                self._cost[s] = self.costs.expected(s, self.scale(s))
+
+    def _replan(self):
+        active = self._active()
+        if not active:
+            return
+        self._cost = self._expected(active)
+        budget = self.frame_budget
+
+        # 지연: 단계 하나만으로 목표 지연을 넘으면 그 단계 해상도 낮춤
+        for s in active:
+            if s in SCALABLE_STAGES and self._cost[s] > self.target_latency and self._level[s] < len(SCALE_STEPS) - 1:
+                self._set_level(s, self._level[s] + 1)
+
+        # 처리량: 예산 기준 주기(new)와 여유 기준 주기(strict) 사이에서는 현재 주기 유지
+        new, cost = self._plan_intervals(active, budget)
+        strict, _ = self._plan_intervals(active, budget * self.relax_ratio)
+        for s in active:
+            self._interval[s] = min(max(self._interval[s], new[s]), strict[s])
+        current = sum(self._cost[s] / self._interval[s] for s in active)
+
+        if cost > budget:
+            # 주기를 최대로 늘려도 모자람 → 평균 비용이 가장 큰 단계 해상도 한 단계 낮춤
+            scalable = [s for s in active if s in SCALABLE_STAGES and self._level[s] < len(SCALE_STEPS) - 1]
+            if scalable:
+                worst = max(scalable, key=lambda s: self._cost[s] / self._interval[s])
+                self._set_level(worst, self._level[worst] + 1)
+        elif current < budget * self.relax_ratio:
+            # 여유 → 낮춘 해상도 중 우선순위가 가장 높은 단계 한 단계 되돌림 (되돌려도 여유가 남을 때만)
+            lowered = [s for s in active if self._level[s] > 0]
+            if lowered:
+                s = max(lowered, key=lambda k: self.priorities.get(k, 1.0))
+                ratio = (SCALE_STEPS[self._level[s] - 1] / SCALE_STEPS[self._level[s]]) ** 2
+                extra = sum(self._cost[k] * (ratio - 1) / self._interval[k]
+                            for k in (s,) + _LINKED_STAGES.get(s, ()) if k in active)
+                if (current + extra < budget * self.relax_ratio
+                        and self._cost[s] * ratio <= self.target_latency * self.relax_ratio):
+                    self._set_level(s, self._level[s] - 1)
+
+    # ------------------------------------------------------------------ 표시
+
+    def snapshot(self):
+        """현재 계획 (성능 설정 화면 표시용, ms는 이 예산의 현재 해상도 기준 예상 시간)"""
+        with self._lock:
+            active = set(self._active())
+            stages = []
+            for s in STAGES:
+                ms = self.costs.expected(s, self.scale(s))
+                stages.append({
+                    'stage': s,
+                    'label': STAGE_LABELS[s],
+                    'active': s in active,
+                    'ms': ms * 1000 if ms is not None else None,
+                    'interval': self._interval[s] if self.enabled else 1,
+                    'scale': self.scale(s),
+                    'runs': self._runs[s],
+                })
+            return {
+                'name': self.name,
+                'enabled': self.enabled,
+                'target_fps': self.target_fps,
+                'target_latency_ms': self.target_latency * 1000,
+                'frame_ms': self.frame_seconds * 1000 if self.frame_seconds is not None else None,
+                'fps': 1.0 / self.frame_period if self.frame_period else None,
+                'frames': self.frames,
+                'stages': stages,
+            }
+
+
+def active_stage_budget():
+    """이 스레드에서 진행 중인 프레임의 예산 (begin_frame ~ end_frame 사이가 아니면 None)"""
+    return getattr(_active, 'budget', None)
+
+
+def get_stage_budgets():
+    """살아 있는 예산 목록 (이름 순)"""
+    with _budgets_lock:
+        budgets = list(_budgets)
+    return sorted(budgets, key=lambda b: b.name)
+
+
+def configure_stage_budgets(enabled=None):
+    """모든 예산의 자동 조절 사용 여부 변경 (이후 새로 만드는 예산의 기본값도 변경)"""
+    global _default_enabled
+    if enabled is None:
+        return
+    _default_enabled = bool(enabled)
+    for budget in get_stage_budgets():
+        budget.configure(enabled=enabled)
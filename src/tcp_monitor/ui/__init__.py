@@ -2,13 +2,34 @@
 TCP Monitor UI 모듈
 
 사용자 인터페이스 관련 클래스들을 제공합니다.
+모든 클래스는 최초 접근 시 로드됩니다 (시작 시간 단축).
 """
 
-from .app import App
-from .panel import SensorPanel
-from .fire_alert_panel import FireAlertPanel
-from .fire_alert_dialog import FireAlertDialog, FireAlertManager
-from .panel_dynamic_tiles import DynamicTileGrid
+import importlib
+
+_LAZY_EXPORTS = {
+    'App': '.app',
+    'SensorPanel': '.panel',
+    'FireAlertPanel': '.fire_alert_panel',
+    'FireAlertDialog': '.fire_alert_dialog',
+    'FireAlertManager': '.fire_alert_dialog',
+    'DynamicTileGrid': '.panel_dynamic_tiles',
+}
+
+
+def __getattr__(name):
+    """PEP 562 지연 import"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     'App',
@@ -22,10 +22,14 @@ if platform.system() != "Linux":
 
 from ..utils.helpers import SENSOR_KEYS, COLOR_BG, get_base_dir
 from ..logging.manager import LogManager
+from ..utils.metrics import get_metrics
+from ..utils.health import get_health_reporter
 from .panel import SensorPanel
 from .about_dialog import AboutDialog
 from .. import __version__
 
+_ON_DATA_SECONDS = get_metrics().histogram("app_on_data_seconds", "App.on_data 처리 시간 (패널 갱신 포함)")
+
 
 class SimpleVirtualKeyboard:
     """간단한 가상 키보드 (Text 및 Entry 위젯용)"""
@@ -533,7 +537,11 @@ class SimpleVirtualKeyboard:
 class App(tk.Tk):
     """메인 애플리케이션 클래스"""
 
-    def __init__(self, cfg):
+    # 수집 코어 접속 모드(main.py --attach)에서만 dict: 패널 키 → 코어의 최신 화재 판정 결과
+    # (None이면 패널이 직접 화재 판정/학습 수행)
+    core_fire_results = None
+
+    def __init__(self, cfg, logs=None):
         super().__init__()
 
         # 빌드 번호 포함한 타이틀 설정
@@ -690,7 +698,8 @@ class App(tk.Tk):
         self.panels = {}
         self.states = {}
         self.tab_alert_states = {}  # 탭별 알림 상태 저장
-        self.logs = LogManager(
+        # main.py가 TCP 서버를 먼저 기동한 경우 같은 LogManager를 공유
+        self.logs = logs if logs is not None else LogManager(
             base_dir=os.getcwd(),
             server_host=self.cfg.listen["host"],
             server_port=self.cfg.listen["port"],
@@ -971,6 +980,7 @@ class App(tk.Tk):
             self.menu_cfg.add_separator()
             self.menu_cfg.add_command(label="⚙️ 환경설정", command=self.open_environment_settings)
             self.menu_cfg.add_command(label="🎯 성능 설정", command=self.open_performance_settings)
+            self.menu_cfg.add_command(label="📈 성능 진단", command=self.open_diagnostics_panel)
             self.menu_cfg.add_separator()
             self.menu_cfg.add_command(label="🔐 관리자 비밀번호 변경", command=self.change_admin_password)
             self.menu_cfg.add_separator()
@@ -2034,6 +2044,11 @@ class App(tk.Tk):
                 os.remove(hb_path)
         except Exception:
             pass
+        # 와치독에 종료 사유 즉시 전달 (재시작 요청 후라면 그 사유가 유지됨)
+        try:
+            get_health_reporter().goodbye("normal")
+        except Exception:
+            pass
         # 정상 종료 신호 파일 생성 (watchdog가 재시작하지 않도록)
         try:
             # get_base_dir()는 PyInstaller와 일반 모드 모두 올바른 경로를 반환
@@ -2059,6 +2074,8 @@ class App(tk.Tk):
         # run.log에 종료 기록
         try:
             self.logs.write_run("app closed")
+            if hasattr(self.logs, 'close'):
+                self.logs.close()  # 이력 압축기 중지 + 경보 전이 저장
         except Exception:
             pass
         try:
@@ -2204,6 +2221,7 @@ class App(tk.Tk):
 
         return p
 
+    @_ON_DATA_SECONDS.timed
     def on_data(self, sid, peer, data):
         """센서 데이터 수신 처리"""
         key = self._panel_key(sid, peer)
@@ -2326,8 +2344,16 @@ class App(tk.Tk):
             self._update_tab_title(key, p)
             # 개요 제거됨
 
+    def record_alert_level(self, sid, peer, sensor_key, level, value):
+        """측정값의 경보 레벨 기록 (레벨 전이만 SQLite alert_transitions에 저장)"""
+        try:
+            if hasattr(self, 'logs') and hasattr(self.logs, 'record_alert_level'):
+                self.logs.record_alert_level(sid, peer, sensor_key, level, value)
+        except Exception:
+            pass
+
     def record_alert(self, panel_key, sid, peer, sensor_key, level, value):
-        """오늘 경고 목록에 패널별로 기록 + SQLite 영구 저장"""
+        """오늘 경고 목록에 패널별로 기록 (DB 기록은 record_alert_level이 상태 전이로 저장)"""
         try:
             ts_epoch = time.time()
             ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_epoch))
@@ -2338,9 +2364,6 @@ class App(tk.Tk):
                 "level": level,
                 "value": value,
             })
-            # DB에도 기록
-            if hasattr(self, 'logs') and hasattr(self.logs, 'write_alert_event'):
-                self.logs.write_alert_event(sid, peer, sensor_key, level, value, ts_epoch)
         except Exception:
             pass
 
@@ -2393,6 +2416,16 @@ class App(tk.Tk):
     def get_today_alert_level_counts_for(self, panel_key):
         """지정 패널의 오늘 경고 레벨별 집계 반환 {3:int,4:int,5:int}"""
         counts = {3: 0, 4: 0, 5: 0}
+        # DB 경보 전이 기준 (경보 시작/상승 건수, 인덱스 집계 쿼리)
+        try:
+            if hasattr(self, 'logs') and hasattr(self.logs, 'get_today_alert_counts'):
+                state = self.states.get(panel_key, {})
+                base_sid = panel_key.split('@')[0].split('#')[0]
+                db_counts = self.logs.get_today_alert_counts(base_sid, state.get('peer', ''))
+                if any(db_counts.values()):
+                    return db_counts
+        except Exception:
+            pass
         try:
             alerts = self.get_today_alerts_for(panel_key)
             for a in alerts:
@@ -2403,6 +2436,11 @@ class App(tk.Tk):
             pass
         return counts
 
+    def on_core_fire(self, sid, peer, result):
+        """수집 코어의 화재 판정 결과 수신 (다음 데이터 갱신 시 패널이 표시)"""
+        if self.core_fire_results is not None and result:
+            self.core_fire_results[self._panel_key(sid, peer)] = result
+
     def on_water_alert(self, sid, peer, data, alert_type, message, alert_level):
         """누수 알림 처리"""
         key = self._panel_key(sid, peer)
@@ -3339,6 +3377,20 @@ class App(tk.Tk):
             from tkinter import messagebox
             messagebox.showerror("오류", f"성능 설정 열기 중 오류가 발생했습니다:\n{str(e)}")
 
+    def open_diagnostics_panel(self):
+        """성능 진단 패널 열기 (계측 값 실시간 표시)"""
+        if not self.cfg.admin_mode:
+            from tkinter import messagebox
+            messagebox.showerror("접근 거부", "관리자 모드에서만 접근할 수 있습니다.")
+            return
+
+        try:
+            from .diagnostics_panel import DiagnosticsPanel
+            DiagnosticsPanel(self).show()
+        except Exception as e:
+            from tkinter import messagebox
+            messagebox.showerror("오류", f"성능 진단 열기 중 오류가 발생했습니다:\n{str(e)}")
+
     def change_admin_password(self):
         """관리자 비밀번호 변경"""
         if not self.cfg.admin_mode:
@@ -3401,6 +3453,11 @@ class App(tk.Tk):
             messagebox.showerror("오류", f"재시작 신호 파일 생성 중 오류가 발생했습니다:\n{str(e)}")
             return
         
+        try:
+            get_health_reporter().goodbye("restart")
+        except Exception:
+            pass
+
         # 로그 기록
         try:
             self.logs.write_run("program restart requested by admin")
@@ -10,11 +10,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import queue
 
 
 class CameraSettingsDialog:
     """카메라 설정 다이얼로그"""
 
+    HOTPLUG_POLL_MS = 500  # 카메라 연결/분리 이벤트 확인 주기 (Tk 스레드)
+
     def __init__(self, parent, config):
         """
         Args:
@@ -45,6 +48,9 @@ class CameraSettingsDialog:
         # IP 카메라 목록 (설정에서 로드)
         self.ip_cameras = self._load_ip_cameras()
 
+        # 카메라 연결/분리 이벤트 (감시 스레드 → Tk 스레드, after()는 Tk 스레드에서만 호출)
+        self._hotplug_events = queue.Queue()
+
         # UI 생성
         self._create_ui()
 
@@ -368,8 +374,6 @@ class CameraSettingsDialog:
     def _reset_cameras(self):
         """모든 카메라 리셋 (환경설정에서 이동됨)"""
         try:
-            import cv2
-
             confirm = messagebox.askyesno(
                 "카메라 리셋",
                 "모든 카메라를 리셋하시겠습니까?\n\n"
@@ -403,15 +407,12 @@ class CameraSettingsDialog:
                 except Exception as e:
                     print(f"카메라 리셋 오류: {e}")
 
-            # 시스템 카메라 해제
-            for i in range(10):
-                try:
-                    cam = cv2.VideoCapture(i)
-                    if cam.isOpened():
-                        cam.release()
-                        reset_count += 1
-                except Exception:
-                    pass
+            # 공용 카메라 서비스가 열어둔 장치 해제 + 카메라 목록 다시 읽기
+            from ..camera import get_camera_registry, get_camera_service
+            camera_service = get_camera_service()
+            reset_count += len(camera_service.stats())
+            camera_service.shutdown()
+            get_camera_registry().refresh()
 
             # 2초 후 카메라 가용성 재확인
             self.parent.after(2000, lambda: self._check_camera_availability_after_reset(mirror_panels))
@@ -430,48 +431,65 @@ class CameraSettingsDialog:
             print(f"카메라 가용성 재확인 오류: {e}")
 
     def _get_usb_cameras(self):
-        """USB 카메라 목록 검색 (V4L2 sysfs 기반 - 빠른 검색)"""
-        cameras = []
+        """USB 카메라 목록 (카메라 목록 캐시 - 장치를 열지 않음, 연결/분리 시 자동 갱신)"""
+        try:
+            from ..camera import get_camera_registry
+            registry = get_camera_registry()
+            if not getattr(self, '_hotplug_registered', False):
+                registry.add_listener(self._on_camera_hotplug)
+                self._hotplug_registered = True
+                self.dialog.after(self.HOTPLUG_POLL_MS, self._poll_camera_hotplug)
+            return [(d.index, d.label) for d in registry.capture_devices()]
+        except Exception as e:
+            print(f"[카메라 설정] 카메라 목록 조회 오류: {e}")
+            return []
 
-        # Linux: /dev/video* 장치 검색 (sysfs index로 메타데이터 장치 필터링)
-        for i in range(10):
-            device_path = f"/dev/video{i}"
-            if not os.path.exists(device_path):
-                continue
+    def _on_camera_hotplug(self, devices):
+        """카메라 연결/분리 감지 (감시 스레드에서 호출) → 큐에만 넣고 Tk 스레드에서 갱신"""
+        self._hotplug_events.put(devices)
 
-            try:
-                # V4L2 index 파일로 메타데이터 장치 필터링
-                index_path = f"/sys/class/video4linux/video{i}/index"
-                if os.path.exists(index_path):
-                    with open(index_path, 'r') as f:
-                        idx_val = f.read().strip()
-                        if idx_val != '0':
-                            # 메타데이터 장치는 스킵 (index != 0)
-                            continue
-
-                # 장치 이름 읽기
-                name = f"카메라 {i}"
-                name_path = f"/sys/class/video4linux/video{i}/name"
-                if os.path.exists(name_path):
-                    with open(name_path, 'r') as f:
-                        device_name = f.read().strip()
-                        if device_name:
-                            name = f"{device_name} ({i})"
-
-                cameras.append((i, name))
-            except Exception:
-                continue
+    def _poll_camera_hotplug(self):
+        """쌓인 연결/분리 이벤트를 한 번에 반영 (다이얼로그가 닫히면 리스너 해제 후 중단)"""
+        try:
+            alive = bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            alive = False
+        if not alive:
+            self._unregister_hotplug()
+            return
+        changed = False
+        try:
+            while True:
+                self._hotplug_events.get_nowait()
+                changed = True
+        except queue.Empty:
+            pass
+        if changed:
+            self._refresh_usb_cameras()
+        self.dialog.after(self.HOTPLUG_POLL_MS, self._poll_camera_hotplug)
 
-        return cameras
+    def _unregister_hotplug(self):
+        """카메라 변경 리스너 해제"""
+        if not getattr(self, '_hotplug_registered', False):
+            return
+        try:
+            from ..camera import get_camera_registry
+            get_camera_registry().remove_listener(self._on_camera_hotplug)
+        except Exception as e:
+            print(f"[카메라 설정] 카메라 변경 리스너 해제 오류: {e}")
+        self._hotplug_registered = False
 
     def _refresh_usb_cameras(self):
-        """USB 카메라 목록 새로고침"""
+        """USB 카메라 목록 새로고침 (선택된 카메라가 남아 있으면 유지)"""
+        selected = self.usb_combo.get()
         self.usb_cameras = self._get_usb_cameras()
         usb_names = [name for idx, name in self.usb_cameras]
         if not usb_names:
             usb_names = ["USB 카메라 없음"]
         self.usb_combo['values'] = usb_names
-        if self.usb_cameras:
+        if selected in usb_names:
+            self.usb_combo.set(selected)
+        elif self.usb_cameras:
             self.usb_combo.current(0)
 
     def _update_ip_listbox(self):
@@ -697,6 +715,7 @@ class CameraSettingsDialog:
 
     def _close(self):
         """다이얼로그 닫기 (확인 없이 바로 닫기)"""
+        self._unregister_hotplug()
         self.dialog.destroy()
 
 
@@ -0,0 +1,113 @@
+"""
+성능 진단 패널
+
+utils/metrics 레지스트리의 현재 값을 1초마다 표로 보여줍니다.
+(pump 틱, Tk 이벤트 루프 지연, App.on_data, DB 저장, 모델별 AI 추론, 거울보기 FPS, TCP 세션)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from ..utils.metrics import get_metrics
+
+
+class DiagnosticsPanel:
+    """성능 진단 패널 (비모달)"""
+
+    REFRESH_MS = 1000
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.registry = get_metrics()
+        self.dialog = None
+        self.tree = None
+        self._after_id = None
+
+    def show(self):
+        """패널 표시 (닫힐 때까지 1초마다 갱신)"""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("성능 진단")
+        self.dialog.configure(bg="#F5F5F5")
+        self.dialog.transient(self.parent)
+
+        w, h = 860, 520
+        self.dialog.update_idletasks()
+        x = (self.dialog.winfo_screenwidth() // 2) - (w // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (h // 2)
+        self.dialog.geometry(f"{w}x{h}+{x}+{y}")
+        self.dialog.bind("<Escape>", lambda e: self._close())
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close)
+
+        self._create_widgets()
+        self._refresh()
+
+    def _create_widgets(self):
+        tk.Label(self.dialog, text="성능 진단 (실시간 계측)", font=("Pretendard", 14, "bold"),
+                 bg="#F5F5F5", fg="#2C3E50").pack(pady=(8, 4))
+
+        if not self.registry.enabled:
+            text = "계측이 비활성화되어 있습니다. config.conf [ENV] metrics_enabled = true 후 재시작하세요."
+            fg = "#C0392B"
+        elif self.registry._http is not None:
+            host, port = self.registry._http.server_address[:2]
+            text = f"Prometheus: http://{host}:{port}/metrics"
+            fg = "#555555"
+        else:
+            text = "HTTP 엔드포인트 미사용 (metrics_port = 0)"
+            fg = "#555555"
+        tk.Label(self.dialog, text=text, font=("Pretendard", 9), bg="#F5F5F5", fg=fg).pack(pady=(0, 6))
+
+        frame = tk.Frame(self.dialog, bg="#F5F5F5")
+        frame.pack(fill="both", expand=True, padx=10, pady=(0, 6))
+
+        columns = ("label", "count", "value", "avg", "p50", "p99", "max")
+        self.tree = ttk.Treeview(frame, columns=columns, show="tree headings")
+        self.tree.heading("#0", text="메트릭")
+        self.tree.column("#0", width=220)
+        for col, text, width in (("label", "라벨", 130), ("count", "횟수", 70), ("value", "값", 80),
+                                 ("avg", "평균(ms)", 75), ("p50", "p50(ms)", 75),
+                                 ("p99", "p99(ms)", 75), ("max", "최대(ms)", 75)):
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=width, anchor="e" if col != "label" else "w")
+        scroll = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scroll.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scroll.pack(side="right", fill="y")
+
+        tk.Button(self.dialog, text="닫기", font=("Pretendard", 10), width=10,
+                  command=self._close).pack(pady=(0, 8))
+
+    def _refresh(self):
+        if self.dialog is None:
+            return
+        rows = self.registry.snapshot()
+        existing = set(self.tree.get_children())
+        for name, label, kind, summary in rows:
+            iid = f"{name}|{label}"
+            if kind == "histogram":
+                values = (label, summary["count"], "",
+                          f"{summary['avg'] * 1000:.2f}", f"{summary['p50'] * 1000:.2f}",
+                          f"{summary['p99'] * 1000:.2f}", f"{summary['max'] * 1000:.2f}")
+            else:
+                value = summary["value"]
+                values = (label, "", f"{value:.1f}" if value != int(value) else f"{int(value)}",
+                          "", "", "", "")
+            if iid in existing:
+                self.tree.item(iid, values=values)
+                existing.discard(iid)
+            else:
+                self.tree.insert("", "end", iid=iid, text=name, values=values)
+        for iid in existing:
+            self.tree.delete(iid)
+        self._after_id = self.dialog.after(self.REFRESH_MS, self._refresh)
+
+    def _close(self):
+        if self.dialog is None:
+            return
+        if self._after_id:
+            try:
+                self.dialog.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self.dialog.destroy()
+        self.dialog = None
@@ -249,10 +249,6 @@ class EnvironmentSettingsDialog:
     def _reset_cameras(self):
         """모든 카메라 리셋"""
         try:
-            import cv2
-            import subprocess
-            import platform
-
             confirm = messagebox.askyesno(
                 "카메라 리셋",
                 "모든 카메라를 리셋하시겠습니까?\n\n"
@@ -286,15 +282,12 @@ class EnvironmentSettingsDialog:
                 except Exception as e:
                     print(f"카메라 리셋 오류: {e}")
 
-            # 시스템 카메라 해제
-            for i in range(10):
-                try:
-                    cam = cv2.VideoCapture(i)
-                    if cam.isOpened():
-                        cam.release()
-                        reset_count += 1
-                except Exception:
-                    pass
+            # 공용 카메라 서비스가 열어둔 장치 해제 + 카메라 목록 다시 읽기
+            from ..camera import get_camera_registry, get_camera_service
+            camera_service = get_camera_service()
+            reset_count += len(camera_service.stats())
+            camera_service.shutdown()
+            get_camera_registry().refresh()
 
             self.parent.after(2000, lambda: self._check_camera_availability_after_reset(mirror_panels))
             messagebox.showinfo("완료", f"카메라 리셋 완료 ({reset_count}개 해제)", parent=self.dialog)
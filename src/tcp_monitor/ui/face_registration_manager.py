@@ -91,9 +91,6 @@ def detect_faces_insightface(image_path_or_array):
         return [], []
 
 
-# 플랫폼별 카메라 백엔드 import
-from ..platform import CameraBackend
-
 from ..sensor.face_database import FaceDatabase
 
 
@@ -595,56 +592,9 @@ class FaceRegistrationManager:
             if not csv_path:
                 return
 
-            # CSV 파일 파싱
-            import csv
-            records = []
-            csv_dir = os.path.dirname(csv_path)  # CSV 파일이 있는 디렉토리
-
-            try:
-                with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # 필수 필드 확인
-                        name = row.get('이름', '').strip()
-                        if not name:
-                            continue
-
-                        photo_path = row.get('사진경로', '').strip()
-                        if not photo_path:
-                            continue
-
-                        # 상대 경로인 경우 CSV 파일 기준으로 변환
-                        if not os.path.isabs(photo_path):
-                            photo_path = os.path.join(csv_dir, photo_path)
-
-                        records.append({
-                            'name': name,
-                            'employee_id': row.get('사원번호', '').strip() or None,
-                            'department': row.get('부서', '').strip() or None,
-                            'photo_path': photo_path
-                        })
-            except UnicodeDecodeError:
-                # EUC-KR로 재시도
-                with open(csv_path, 'r', encoding='euc-kr') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        name = row.get('이름', '').strip()
-                        if not name:
-                            continue
-
-                        photo_path = row.get('사진경로', '').strip()
-                        if not photo_path:
-                            continue
-
-                        if not os.path.isabs(photo_path):
-                            photo_path = os.path.join(csv_dir, photo_path)
-
-                        records.append({
-                            'name': name,
-                            'employee_id': row.get('사원번호', '').strip() or None,
-                            'department': row.get('부서', '').strip() or None,
-                            'photo_path': photo_path
-                        })
+            # CSV 파일 파싱 (상대 경로는 CSV 파일 기준)
+            from ..sensor.face_enrollment import BulkEnrollment, load_enrollment_csv
+            records = load_enrollment_csv(csv_path)
 
             if not records:
                 messagebox.showwarning(
@@ -705,87 +655,70 @@ class FaceRegistrationManager:
                 progress_text.insert(tk.END, f"\n   사진: {os.path.basename(rec['photo_path'])}\n")
             if len(records) > 10:
                 progress_text.insert(tk.END, f"\n... 외 {len(records) - 10}명\n")
+            # 사진 디코딩은 프로세스 풀, 얼굴 인식은 배치, 등록은 트랜잭션 1번 (sensor/face_enrollment.py)
+            import queue
+            import threading
+            events = queue.Queue()
+            cancel_event = threading.Event()
+            job = BulkEnrollment(self.face_db, records,
+                                 on_progress=lambda msg, done, total: events.put(("progress", msg, done)))
+            if job.extracted:
+                progress_text.insert(tk.END, f"\n이전 진행: {job.extracted}/{len(records)}장 추출됨 → 이어서 처리합니다.\n")
             progress_text.insert(tk.END, "\n[처리 시작] 버튼을 클릭하여 등록을 시작하세요.\n")
 
-            def process_csv_batch():
-                process_btn.config(state="disabled")
-                progress_text.delete("1.0", tk.END)
-
-                total = len(records)
-                success_count = 0
-                fail_count = 0
-
-                progress_text.insert(tk.END, f"총 {total}명의 얼굴을 등록합니다...\n\n")
-                batch_dialog.update()
-
-                for i, rec in enumerate(records, 1):
-                    try:
-                        name = rec['name']
-                        photo_path = rec['photo_path']
-
-                        progress_text.insert(tk.END, f"[{i}/{total}] {name}: {os.path.basename(photo_path)}...\n")
-                        batch_dialog.update()
-
-                        # 파일 존재 확인
-                        if not os.path.exists(photo_path):
-                            progress_text.insert(tk.END, f"  → 파일 없음\n")
-                            fail_count += 1
-                            continue
-
-                        # 이미지 처리 (InsightFace 사용)
-                        face_locations, face_encodings = detect_faces_insightface(photo_path)
-
-                        if not face_locations:
-                            progress_text.insert(tk.END, f"  → 얼굴 미검출\n")
-                            fail_count += 1
-                            continue
-                        if not face_encodings:
-                            progress_text.insert(tk.END, f"  → 인코딩 실패\n")
-                            fail_count += 1
-                            continue
-
-                        # DB에 등록
-                        registered = 0
-                        for encoding in face_encodings:
-                            if np.isnan(encoding).any() or np.isinf(encoding).any():
-                                continue
-                            try:
-                                self.face_db.add_face(
-                                    name=name,
-                                    encoding=encoding,
-                                    employee_id=rec['employee_id'],
-                                    department=rec['department'],
-                                    photo_path=photo_path
-                                )
-                                registered += 1
-                            except Exception as e:
-                                progress_text.insert(tk.END, f"  → 등록 오류: {e}\n")
-
-                        if registered > 0:
-                            progress_text.insert(tk.END, f"  → 성공 ({registered}개 얼굴)\n")
-                            success_count += 1
-                        else:
-                            progress_text.insert(tk.END, f"  → 실패\n")
-                            fail_count += 1
+            progress_bar = ttk.Progressbar(batch_dialog, maximum=len(records), value=job.extracted)
+            progress_bar.pack(fill="x", padx=10)
 
-                        progress_text.see(tk.END)
-                        batch_dialog.update()
+            def run_job():
+                try:
+                    events.put(("done", job.run(cancel_event)))
+                except Exception as e:
+                    import traceback
+                    print(f"[CSV 일괄 등록] 오류:\n{traceback.format_exc()}")
+                    events.put(("error", str(e)))
 
-                    except Exception as e:
-                        progress_text.insert(tk.END, f"  → 오류: {str(e)}\n")
-                        fail_count += 1
-                        import traceback
-                        print(f"[CSV 일괄 등록] {rec['name']} 오류:\n{traceback.format_exc()}")
+            def poll_events():
+                try:
+                    while True:
+                        event = events.get_nowait()
+                        if event[0] == "progress":
+                            progress_text.insert(tk.END, f"{event[1]}\n")
+                            progress_bar.config(value=event[2])
+                            progress_text.see(tk.END)
+                        else:
+                            finish(event)
+                            return
+                except queue.Empty:
+                    pass
+                except tk.TclError:
+                    return   # 대화상자 닫힘 (작업은 현재 묶음까지 저장 후 중단)
+                batch_dialog.after(100, poll_events)
+
+            def finish(event):
+                process_btn.config(text="처리 시작", command=process_csv_batch, state="normal")
+                if event[0] == "error":
+                    progress_text.insert(tk.END, f"\n오류: {event[1]}\n")
+                    messagebox.showerror("오류", f"CSV 일괄 등록 오류: {event[1]}", parent=batch_dialog)
+                    return
+                result = event[1]
+                if result['cancelled']:
+                    process_btn.config(text="이어서 처리")
+                    progress_text.insert(tk.END, f"\n중단됨: {job.extracted}/{len(records)}장 추출 (다시 실행하면 이어서 처리)\n")
+                    progress_text.see(tk.END)
+                    return
 
+                success_count = result['registered']
+                fail_count = len(result['failed'])
                 progress_text.insert(tk.END, f"\n{'='*40}\n")
-                progress_text.insert(tk.END, f"=== 등록 완료 ===\n")
-                progress_text.insert(tk.END, f"성공: {success_count}명\n")
+                progress_text.insert(tk.END, f"=== 등록 완료 ({result['seconds']:.1f}초) ===\n")
+                progress_text.insert(tk.END, f"성공: {success_count}명 (얼굴 {result['faces']}개)\n")
                 progress_text.insert(tk.END, f"실패: {fail_count}명\n")
+                for index, reason in sorted(result['failed'].items()):
+                    rec = records[index]
+                    progress_text.insert(tk.END, f"  {rec['name']} ({os.path.basename(rec['photo_path'])}): {reason}\n")
                 progress_text.insert(tk.END, f"{'='*40}\n")
                 progress_text.see(tk.END)
-
-                # 닫기 버튼 활성화
-                close_btn.config(state="normal")
+                process_btn.config(state="disabled")
 
                 # 목록 새로고침
                 self._load_face_list()
@@ -798,6 +731,18 @@ class FaceRegistrationManager:
                     parent=batch_dialog
                 )
 
+            def process_csv_batch():
+                cancel_event.clear()
+                process_btn.config(text="중지", command=cancel_event.set)
+                progress_text.delete("1.0", tk.END)
+                progress_text.insert(tk.END, f"총 {len(records)}명의 얼굴을 등록합니다...\n\n")
+                threading.Thread(target=run_job, name="face-enrollment", daemon=True).start()
+                poll_events()
+
+            def close_batch_dialog():
+                cancel_event.set()
+                batch_dialog.destroy()
+
             # 버튼 프레임
             batch_button_frame = ttk.Frame(batch_dialog)
             batch_button_frame.pack(fill="x", padx=10, pady=10)
@@ -816,13 +761,14 @@ class FaceRegistrationManager:
             close_btn = tk.Button(
                 batch_button_frame,
                 text="닫기",
-                command=batch_dialog.destroy,
+                command=close_batch_dialog,
                 bg="#95A5A6",
                 fg="#FFFFFF",
                 font=("Pretendard", 11, "bold"),
                 width=15
             )
             close_btn.pack(side="right", padx=5)
+            batch_dialog.protocol("WM_DELETE_WINDOW", close_batch_dialog)
 
         except Exception as e:
             import traceback
@@ -848,37 +794,13 @@ class FaceRegistrationManager:
             return
         
         try:
-            # 플랫폼별 카메라 백엔드 사용
-            camera_backend = CameraBackend()
-            
-            # 카메라 인덱스 찾기
-            camera_index = None
-            for i in range(5):  # 0~4까지 카메라 인덱스 확인
-                try:
-                    backend = camera_backend.get_backend()
-                    test_cap = cv2.VideoCapture(i, backend)
-                    
-                    if test_cap.isOpened():
-                        ret, frame = test_cap.read()
-                        if ret and frame is not None:
-                            camera_index = i
-                            test_cap.release()
-                            break
-                        test_cap.release()
-                except:
-                    continue
-            
-            if camera_index is None:
+            # 공용 카메라 서비스에서 구독 (거울보기 등 다른 화면이 연 장치는 재초기화 없이 공유)
+            from ..camera import get_camera_service
+            camera = get_camera_service().subscribe_first_available(name="face_registration")
+            if not camera.isOpened():
                 messagebox.showerror("오류", "카메라를 찾을 수 없습니다.\n카메라가 연결되어 있는지 확인하세요.", parent=self.dialog)
                 return
-            
-            # 플랫폼별 백엔드로 카메라 열기
-            backend = camera_backend.get_backend()
-            self.camera = cv2.VideoCapture(camera_index, backend)
-            
-            if not self.camera.isOpened():
-                messagebox.showerror("오류", "카메라를 열 수 없습니다.", parent=self.dialog)
-                return
+            self.camera = camera
             
             self.camera_active = True
             self.captured_frame = None
@@ -8,58 +8,119 @@ import tkinter as tk
 from tkinter import ttk
 import time
 import threading
+import queue
+from types import SimpleNamespace
 
 from ..utils.helpers import SENSOR_KEYS
 from ..sensor.alerts import AlertManager
+from ..utils.metrics import get_metrics
+from ..utils.health import get_health_reporter
 from .panel_header import PanelHeader
 from .panel_tiles import PanelTiles
 
+# 무거운 하위 시스템(PPE/PTZ/화재)은 최초 사용 시 로드합니다.
+# 패키지 import 시점에 torch/ultralytics/cv2/PIL을 끌어오지 않아 첫 화면과
+# TCP 서버 기동이 빨라집니다. 아래 _load_*_module() 호출 후에 전역 변수가 채워집니다.
+
 # 새로운 PPE 감지 모듈 (YOLOv10 기반)
 PPE_DETECTOR_AVAILABLE = False
-try:
-    from ..ppe import PPEDetector, PPEVisualizer, PPEStatus
-    PPE_DETECTOR_AVAILABLE = True
-except ImportError:
-    PPEDetector = None
-    PPEVisualizer = None
-    PPEStatus = None
+PPEDetector = None
+PPEVisualizer = None
+PPEStatus = None
+_ppe_module_loaded = False
 
 # Tapo PTZ 제어 모듈
 TAPO_PTZ_AVAILABLE = False
-try:
-    from ..sensor.tapo_ptz import TapoPTZController, PYTAPO_AVAILABLE
-    TAPO_PTZ_AVAILABLE = PYTAPO_AVAILABLE
-except ImportError:
-    TapoPTZController = None
-    TAPO_PTZ_AVAILABLE = False
+TapoPTZController = None
+_tapo_module_loaded = False
 
 # 화재 감지 모듈
 FIRE_MODULE_AVAILABLE = False
-try:
-    from ..fire import FireDetector, FireAlertLevel, SensorReading
-    from ..fire import get_fire_service
-    from .fire_alert_panel import FireAlertPanel
-    from .fire_alert_dialog import FireAlertManager
-    FIRE_MODULE_AVAILABLE = True
-    print("[화재 모듈] 로드 성공")
-except ImportError as e:
-    print(f"[화재 모듈] 로드 실패: {e}")
-    FireDetector = None
-    FireAlertLevel = None
-    SensorReading = None
-    FireAlertPanel = None
-    FireAlertManager = None
-    get_fire_service = None
-except Exception as e:
-    print(f"[화재 모듈] 예외 발생: {e}")
-    import traceback
-    traceback.print_exc()
-    FireDetector = None
-    FireAlertLevel = None
-    SensorReading = None
-    FireAlertPanel = None
-    FireAlertManager = None
-    get_fire_service = None
+FireDetector = None
+FireAlertLevel = None
+SensorReading = None
+FireAlertPanel = None
+FireAlertManager = None
+get_fire_service = None
+_fire_module_loaded = False
+
+_lazy_import_lock = threading.Lock()
+
+# 성능 계측 (metrics_enabled=false이면 플래그 확인만 수행)
+_AI_INFERENCE_SECONDS = get_metrics().histogram("ai_inference_seconds", "AI 추론 스레드 모델별 추론 시간", ("model",))
+_AI_PPE = _AI_INFERENCE_SECONDS.labels("ppe")
+_AI_FACE = _AI_INFERENCE_SECONDS.labels("face")
+_AI_SAFETY_ALL = _AI_INFERENCE_SECONDS.labels("safety_all")
+_AI_COCO = _AI_INFERENCE_SECONDS.labels("coco")
+_MIRROR_FPS = get_metrics().gauge("mirror_view_fps", "거울보기 카메라 프레임 수신 FPS", ("panel",))
+
+
+def _load_ppe_module():
+    """PPE 감지 모듈 지연 로드 (최초 1회), 사용 가능 여부 반환"""
+    global PPE_DETECTOR_AVAILABLE, PPEDetector, PPEVisualizer, PPEStatus, _ppe_module_loaded
+    if _ppe_module_loaded:
+        return PPE_DETECTOR_AVAILABLE
+    with _lazy_import_lock:
+        if not _ppe_module_loaded:
+            try:
+                from ..ppe import PPEDetector, PPEVisualizer, PPEStatus
+                PPE_DETECTOR_AVAILABLE = True
+            except ImportError:
+                PPE_DETECTOR_AVAILABLE = False
+            _ppe_module_loaded = True
+    return PPE_DETECTOR_AVAILABLE
+
+
+def _load_tapo_module():
+    """Tapo PTZ 모듈 지연 로드 (최초 1회), 사용 가능 여부 반환"""
+    global TAPO_PTZ_AVAILABLE, TapoPTZController, _tapo_module_loaded
+    if _tapo_module_loaded:
+        return TAPO_PTZ_AVAILABLE
+    with _lazy_import_lock:
+        if not _tapo_module_loaded:
+            try:
+                from ..sensor.tapo_ptz import TapoPTZController, PYTAPO_AVAILABLE
+                TAPO_PTZ_AVAILABLE = PYTAPO_AVAILABLE
+            except ImportError:
+                TapoPTZController = None
+                TAPO_PTZ_AVAILABLE = False
+            _tapo_module_loaded = True
+    return TAPO_PTZ_AVAILABLE
+
+
+def _load_fire_module():
+    """화재 감지 모듈 지연 로드 (최초 1회), 사용 가능 여부 반환"""
+    global FIRE_MODULE_AVAILABLE, FireDetector, FireAlertLevel, SensorReading
+    global FireAlertPanel, FireAlertManager, get_fire_service, _fire_module_loaded
+    if _fire_module_loaded:
+        return FIRE_MODULE_AVAILABLE
+    with _lazy_import_lock:
+        if _fire_module_loaded:
+            return FIRE_MODULE_AVAILABLE
+        try:
+            from ..fire import FireDetector, FireAlertLevel, SensorReading
+            from ..fire import get_fire_service
+            from .fire_alert_panel import FireAlertPanel
+            from .fire_alert_dialog import FireAlertManager
+            FIRE_MODULE_AVAILABLE = True
+            print("[화재 모듈] 로드 성공")
+        except ImportError as e:
+            print(f"[화재 모듈] 로드 실패: {e}")
+            FIRE_MODULE_AVAILABLE = False
+        except Exception as e:
+            print(f"[화재 모듈] 예외 발생: {e}")
+            import traceback
+            traceback.print_exc()
+            FIRE_MODULE_AVAILABLE = False
+        if not FIRE_MODULE_AVAILABLE:
+            FireDetector = None
+            FireAlertLevel = None
+            SensorReading = None
+            FireAlertPanel = None
+            FireAlertManager = None
+            get_fire_service = None
+        _fire_module_loaded = True
+    return FIRE_MODULE_AVAILABLE
 
 
 class SensorPanel(ttk.Frame):
@@ -170,6 +231,11 @@ class SensorPanel(ttk.Frame):
         self._ai_thread_running = False
         self._ai_frame_queue = None  # 프레임 큐
         self._ai_result_lock = threading.Lock()  # 결과 동기화용 락
+        self._motion_gate = None  # 움직임 게이트 (AI 스레드 시작 시 생성)
+        self._motion_skip_count = 0
+        self._ai_budget = None  # 단계별 시간 예산 (AI 스레드 시작 시 설정)
+        self._ai_budget_mode = None  # 예산 목표를 적용한 성능 모드
+        self._ai_last_detections = None  # PPE 단계를 건너뛴 프레임에서 재사용
 
         # PTZ (Pan-Tilt-Zoom) 제어 관련
         self._ptz_controller = None  # TapoPTZController 인스턴스
@@ -180,7 +246,8 @@ class SensorPanel(ttk.Frame):
         self.fire_detector = None
         self.fire_alert_panel = None
         self.fire_alert_manager = None
-        self._init_fire_detection()
+        # 화재 모듈 로드는 첫 화면 표시 이후로 지연 (시작 시간 단축)
+        self.after_idle(self._init_fire_detection)
 
         # 초기 접속대기 상태 표시
         self._show_waiting_status()
@@ -560,6 +627,8 @@ class SensorPanel(ttk.Frame):
                 if v is not None:
                     alert_level = self.alert_manager.get_alert_level(k, v)
                     is_alarm = (alert_level >= 3)  # 주의(3) 이상이면 알림
+                    # 레벨 전이 기록 (enter/escalate/deescalate/clear만 DB 저장)
+                    self.app.record_alert_level(self.sid, self.peer, k, alert_level, v)
                     if self.alert_manager.check_alarm_state_change(k, is_alarm):
                         # 헤더의 음성 경보 상태 확인
                         voice_enabled = getattr(self.header, 'voice_alert_enabled', True)
@@ -583,7 +652,7 @@ class SensorPanel(ttk.Frame):
 
     def _init_fire_detection(self):
         """화재 감지 시스템 초기화"""
-        if not FIRE_MODULE_AVAILABLE:
+        if not _load_fire_module():
             print("[Fire] 화재 감지 모듈을 사용할 수 없습니다")
             return
 
@@ -650,13 +719,40 @@ class SensorPanel(ttk.Frame):
             return
 
         try:
-            # fire_service를 통해 데이터 처리 (AI 학습 데이터 수집 포함)
-            if get_fire_service is not None:
-                fire_service = get_fire_service()
+            core_fire = getattr(self.app, 'core_fire_results', None)
+            fire_service = None
+            if core_fire is not None:
+                # 수집 코어 접속 모드: 화재 판정/학습은 코어가 수행하고 결과만 표시
+                cached = core_fire.get(self.sid_key)
+                if cached is None:
+                    return
+                result = SimpleNamespace(**cached)
+            else:
+                # fire_service를 통해 데이터 처리 (AI 학습 데이터 수집 포함)
+                if get_fire_service is not None:
+                    fire_service = get_fire_service()
+
+                    # 센서 데이터 처리 (AI 학습 데이터 수집)
+                    fire_service.process_sensor_data(
+                        sensor_id=self.sid,
+                        temperature=self.data.get('temperature'),
+                        humidity=self.data.get('humidity'),
+                        co=self.data.get('co'),
+                        co2=self.data.get('co2'),
+                        o2=self.data.get('o2'),
+                        smoke=self.data.get('smoke'),
+                        h2s=self.data.get('h2s'),
+                        ch4=self.data.get('lel')  # lel은 ch4로 매핑
+                    )
 
-                # 센서 데이터 처리 (AI 학습 데이터 수집)
-                fire_service.process_sensor_data(
+                # 로컬 화재 감지기로 UI 업데이트 (기존 로직 유지)
+                if self.fire_detector is None:
+                    return
+
+                from datetime import datetime
+                reading = SensorReading(
                     sensor_id=self.sid,
+                    timestamp=datetime.now(),
                     temperature=self.data.get('temperature'),
                     humidity=self.data.get('humidity'),
                     co=self.data.get('co'),
@@ -664,29 +760,11 @@ class SensorPanel(ttk.Frame):
                     o2=self.data.get('o2'),
                     smoke=self.data.get('smoke'),
                     h2s=self.data.get('h2s'),
-                    ch4=self.data.get('lel')  # lel은 ch4로 매핑
+                    ch4=self.data.get('lel')
                 )
 
-            # 로컬 화재 감지기로 UI 업데이트 (기존 로직 유지)
-            if self.fire_detector is None:
-                return
-
-            from datetime import datetime
-            reading = SensorReading(
-                sensor_id=self.sid,
-                timestamp=datetime.now(),
-                temperature=self.data.get('temperature'),
-                humidity=self.data.get('humidity'),
-                co=self.data.get('co'),
-                co2=self.data.get('co2'),
-                o2=self.data.get('o2'),
-                smoke=self.data.get('smoke'),
-                h2s=self.data.get('h2s'),
-                ch4=self.data.get('lel')
-            )
-
-            # 화재 감지 수행
-            result = self.fire_detector.detect(reading)
+                # 화재 감지 수행
+                result = self.fire_detector.detect(reading)
 
             # 화재 패널 업데이트
             if self.fire_alert_panel is not None:
@@ -703,7 +781,7 @@ class SensorPanel(ttk.Frame):
                 )
 
                 # AI 학습 통계 업데이트
-                if get_fire_service is not None:
+                if fire_service is not None:
                     try:
                         learning_summary = fire_service.get_learning_summary()
                         if learning_summary:
@@ -980,11 +1058,7 @@ class SensorPanel(ttk.Frame):
         """거울보기용 카메라 시작 (빠른 초기화)"""
         try:
             import cv2
-            import platform
-            CV2_OK = True
-            IS_WINDOWS = platform.system().lower() == 'windows'
         except ImportError:
-            CV2_OK = False
             if self.mirror_camera_label:
                 self.mirror_camera_label.configure(text="OpenCV가 설치되지 않았습니다.\n카메라 기능을 사용할 수 없습니다.",
                                                   fg="#FF6B6B")
@@ -1023,192 +1097,43 @@ class SensorPanel(ttk.Frame):
             # USB 카메라 사용 시 IP 카메라 URL 초기화 (중요!)
             self._ip_camera_url = None
 
-            cached_index = getattr(self, '_cached_camera_index', None)
-            cached_backend = getattr(self, '_cached_camera_backend', None)
-
-            camera_index = None
-            backend_used = None
-
-            # 설정에서 선택된 카메라가 있으면 먼저 테스트
-            if selected_idx is not None and selected_idx >= 0:
-                import os
-                device_path = f"/dev/video{selected_idx}"
-                if os.path.exists(device_path):
-                    try:
-                        test_camera = cv2.VideoCapture(selected_idx, cv2.CAP_V4L2)
-                        if test_camera.isOpened():
-                            test_camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                camera_index = selected_idx
-                                backend_used = cv2.CAP_V4L2
-                                test_camera.release()
-                                print(f"거울보기: 설정된 카메라 {selected_idx} 사용")
-                            else:
-                                test_camera.release()
-                                print(f"거울보기: 설정된 카메라 {selected_idx} 프레임 읽기 실패")
-                        else:
-                            print(f"거울보기: 설정된 카메라 {selected_idx} 열기 실패")
-                    except Exception as e:
-                        print(f"거울보기: 설정된 카메라 {selected_idx} 테스트 오류: {e}")
-                else:
-                    print(f"거울보기: 설정된 카메라 {selected_idx} 장치 없음")
-
-            # 설정된 카메라가 실패하면 캐시된 카메라 시도
-            if camera_index is None and cached_index is not None:
-                try:
-                    if cached_backend is not None:
-                        test_camera = cv2.VideoCapture(cached_index, cached_backend)
-                    else:
-                        test_camera = cv2.VideoCapture(cached_index)
-
-                    if test_camera.isOpened():
-                        ret, frame = test_camera.read()
-                        if ret and frame is not None:
-                            camera_index = cached_index
-                            backend_used = cached_backend
-                            test_camera.release()
-                            print(f"거울보기: 캐시된 카메라 {cached_index} 사용")
-                        else:
-                            test_camera.release()
-                except Exception:
-                    pass
-
-            # 캐시된 카메라가 없거나 실패하면 빠르게 검색 (인덱스 0만 우선 시도)
-            if camera_index is None:
-                # Linux: V4L2 백엔드로 카메라 0번만 빠르게 시도
-                if not IS_WINDOWS:
-                    try:
-                        test_camera = cv2.VideoCapture(0, cv2.CAP_V4L2)
-                        if test_camera.isOpened():
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                camera_index = 0
-                                backend_used = cv2.CAP_V4L2
-                                test_camera.release()
-                                print(f"거울보기: 카메라 0을 V4L2 백엔드로 찾았습니다.")
-                            else:
-                                test_camera.release()
-                    except Exception:
-                        pass
-
-                # 기본 백엔드로 카메라 0번 시도
-                if camera_index is None:
-                    try:
-                        test_camera = cv2.VideoCapture(0)
-                        if test_camera.isOpened():
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                camera_index = 0
-                                backend_used = None
-                                test_camera.release()
-                                print(f"거울보기: 카메라 0을 기본 백엔드로 찾았습니다.")
-                            else:
-                                test_camera.release()
-                    except Exception:
-                        pass
+            # 공용 카메라 서비스에서 구독 (다른 화면이 이미 연 장치는 탐색/재초기화 없이 공유)
+            # 우선순위: 설정된 카메라 → 최근 사용 카메라 → 이미 열린 장치 → /dev/video 캡처 노드
+            from ..camera import get_camera_service
+            preferred = selected_idx if selected_idx is not None and selected_idx >= 0 else None
+            if preferred is None:
+                preferred = getattr(self, '_cached_camera_index', None)
+            # 1920x1080 Full HD로 더 넓은 화각
+            self.mirror_camera = get_camera_service().subscribe_first_available(
+                preferred, width=1920, height=1080, fps=30, name=f"mirror:{self.sid_key}")
 
-                # 여전히 없으면 다른 인덱스도 시도 (V4L2 sysfs 기반 검색)
-                if camera_index is None:
-                    import os
-                    for i in range(10):
-                        device_path = f"/dev/video{i}"
-                        if not os.path.exists(device_path):
-                            continue
-                        # 메타데이터 장치 필터링 (index != 0)
-                        index_path = f"/sys/class/video4linux/video{i}/index"
-                        if os.path.exists(index_path):
-                            try:
-                                with open(index_path, 'r') as f:
-                                    if f.read().strip() != '0':
-                                        continue
-                            except:
-                                continue
-                        try:
-                            test_camera = cv2.VideoCapture(i, cv2.CAP_V4L2)
-                            if test_camera.isOpened():
-                                ret, frame = test_camera.read()
-                                if ret and frame is not None:
-                                    camera_index = i
-                                    backend_used = cv2.CAP_V4L2
-                                    test_camera.release()
-                                    print(f"거울보기: 카메라 {i}을 찾았습니다.")
-                                    break
-                                test_camera.release()
-                        except Exception:
-                            continue
-
-            if camera_index is None:
+            if not self.mirror_camera.isOpened():
+                self.mirror_camera = None
                 if self.mirror_camera_label:
                     self.mirror_camera_label.configure(
                         text="카메라 사용 불가\n\n카메라가 연결되지 않았거나\n다른 프로그램에서 사용 중입니다.",
                         fg="#FF6B6B")
                 return
 
-            # 성공한 카메라 설정 캐시
-            self._cached_camera_index = camera_index
-            self._cached_camera_backend = backend_used
+            # 성공한 카메라 캐시
+            self._cached_camera_index = self.mirror_camera.key
+            print(f"거울보기: 카메라 {self.mirror_camera.key} 사용")
 
-            # 카메라 열기 (사용한 백엔드로)
-            if backend_used is not None:
-                self.mirror_camera = cv2.VideoCapture(camera_index, backend_used)
-            else:
-                self.mirror_camera = cv2.VideoCapture(camera_index)
-            
-            if not self.mirror_camera.isOpened():
-                if self.mirror_camera_label:
-                    self.mirror_camera_label.configure(
-                        text="카메라를 열 수 없습니다.\n카메라를 확인해주세요.",
-                        fg="#FF6B6B")
-                return
-            
-            # 카메라 설정 - 최대 화각(FOV)으로 설정
+            # 화각(FOV) 최대화 설정 (장치 제어는 서비스 읽기 스레드에서 적용)
             try:
-                # 해상도 설정 (1920x1080 Full HD로 더 넓은 화각)
-                self.mirror_camera.set(cv2.CAP_PROP_FRAME_WIDTH, 1920)
-                self.mirror_camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 1080)
-                self.mirror_camera.set(cv2.CAP_PROP_FPS, 30)
-                self.mirror_camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-
-                # 화각(FOV) 최대화 설정
-                try:
-                    # 줌을 최소값(0)으로 설정하면 화각이 최대로 넓어짐
-                    self.mirror_camera.set(cv2.CAP_PROP_ZOOM, 0)
-                    print("거울보기: 줌 최소값 설정 (화각 최대)")
-                except:
-                    pass
-
-                try:
-                    # FOV(Field of View) 직접 설정 시도 (지원하는 카메라만)
-                    # CAP_PROP_XI_LENS_APERTURE_VALUE = 511 (일부 카메라)
-                    # 일반적으로 줌=0이 가장 넓은 화각
-                    pass
-                except:
-                    pass
-
+                # 줌을 최소값(0)으로 설정하면 화각이 최대로 넓어짐
+                self.mirror_camera.set(cv2.CAP_PROP_ZOOM, 0)
                 # Auto-focus 끄기 (일부 카메라에서 문제 발생 방지)
-                try:
-                    self.mirror_camera.set(cv2.CAP_PROP_AUTOFOCUS, 0)
-                except:
-                    pass
+                self.mirror_camera.set(cv2.CAP_PROP_AUTOFOCUS, 0)
 
-                # 실제 적용된 해상도 확인
                 actual_w = int(self.mirror_camera.get(cv2.CAP_PROP_FRAME_WIDTH))
                 actual_h = int(self.mirror_camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                actual_zoom = self.mirror_camera.get(cv2.CAP_PROP_ZOOM)
-                print(f"거울보기: 카메라 설정 완료 - 해상도: {actual_w}x{actual_h}, 줌: {actual_zoom}")
+                print(f"거울보기: 카메라 설정 완료 - 해상도: {actual_w}x{actual_h}")
             except Exception as e:
                 print(f"거울보기: 카메라 설정 오류 (무시): {e}")
             
-            # 초기 프레임 몇 개 버리기 (카메라 초기화 대기)
-            for _ in range(5):
-                try:
-                    self.mirror_camera.read()
-                except:
-                    pass
-            
             # 새로운 PPE 감지기 초기화 (YOLOv10 기반) - 우선
-            if PPE_DETECTOR_AVAILABLE:
+            if _load_ppe_module():
                 try:
                     self.ppe_detector = PPEDetector()
                     self.ppe_visualizer = PPEVisualizer(font_size=20)
@@ -1280,16 +1205,12 @@ class SensorPanel(ttk.Frame):
             import cv2
             from PIL import Image, ImageTk
 
-            # 버퍼 비우기: 오래된 프레임 제거 (버퍼링 방지)
-            # grab()은 프레임을 버퍼에서 제거만 하고 디코딩하지 않아 빠름
-            for _ in range(2):
-                self.mirror_camera.grab()
-
-            # 최신 프레임 읽기
+            # 최신 프레임 읽기 (카메라 서비스가 최신 프레임만 유지하므로 버퍼 비우기 불필요)
+            # Tk 스레드이므로 대기하지 않음: 새 프레임이 없으면(재연결 중 포함) 이번 틱은 건너뜀
             ret = False
             frame = None
             try:
-                ret, frame = self.mirror_camera.read()
+                ret, frame = self.mirror_camera.read(timeout=0)
             except Exception as e:
                 print(f"거울보기 프레임 읽기 실패: {e}")
                 # 카메라 재초기화 시도
@@ -1310,6 +1231,7 @@ class SensorPanel(ttk.Frame):
                 elapsed = current_time - self._fps_last_time
                 if elapsed >= 1.0:  # 1초마다 FPS 업데이트
                     self._current_fps = self._fps_frame_count / elapsed
+                    _MIRROR_FPS.labels(self.sid_key).set(self._current_fps)
                     self._fps_frame_count = 0
                     self._fps_last_time = current_time
 
@@ -1333,8 +1255,10 @@ class SensorPanel(ttk.Frame):
                     if not self._ai_thread_running:
                         self._start_ai_thread()
 
-                    # 5프레임마다 AI 추론용 프레임 전달 (약 6fps, 실시간 반응)
-                    if self.mirror_frame_count % 5 == 1:
+                    # AI 추론용 프레임 전달: 목표 FPS와 실제 처리 속도 중 느린 쪽 간격으로
+                    # (AI 스레드가 처리하지 못할 프레임은 복사하지 않음, 예산이 없으면 5프레임마다)
+                    budget = self._ai_budget
+                    if budget.accept_frame() if budget is not None else self.mirror_frame_count % 5 == 1:
                         if self._ai_frame_queue is not None:
                             try:
                                 # 큐가 비어있으면 프레임 추가 (이전 프레임 버리고 최신만 유지)
@@ -1692,6 +1616,8 @@ class SensorPanel(ttk.Frame):
                                 if self.mirror_camera_label.winfo_exists():
                                     self.mirror_camera_label.configure(image=photo, text="")
                                     self.mirror_camera_label.image = photo  # 참조 유지
+                                    if hasattr(self.mirror_camera, 'mark_displayed'):
+                                        self.mirror_camera.mark_displayed()
                             except Exception:
                                 pass
                 except Exception as e:
@@ -1717,8 +1643,8 @@ class SensorPanel(ttk.Frame):
                 # 다음 프레임 업데이트 (약 33ms마다, 30fps)
                 self.after(33, self._update_mirror_frame)
             else:
-                # 프레임 읽기 실패 시 재시도
-                self.after(100, self._update_mirror_frame)
+                # 새 프레임 없음: 짧게 다시 확인 (디코딩은 카메라 서비스 스레드에서 계속)
+                self.after(15, self._update_mirror_frame)
         except Exception as e:
             print(f"거울보기 프레임 업데이트 오류: {e}")
             # 오류 발생 시 약간 늦춰서 재시도
@@ -2654,6 +2580,11 @@ class SensorPanel(ttk.Frame):
             return
 
         self._ai_frame_queue = queue.Queue(maxsize=2)
+        self._motion_gate = self._create_motion_gate()
+        self._motion_skip_count = 0
+        self._ai_budget = self._create_stage_budget()
+        self._ai_budget_mode = None
+        self._ai_last_detections = None
         self._ai_thread_running = True
         self._ai_thread = threading.Thread(target=self._ai_inference_worker, daemon=True)
         self._ai_thread.start()
@@ -2671,9 +2602,43 @@ class SensorPanel(ttk.Frame):
         self._ai_frame_queue = None
         print("[AI Thread] 백그라운드 AI 추론 스레드 중지")
 
+    def _create_motion_gate(self):
+        """설정([ENV] motion_gate_enabled, motion_gate_max_keepalive)에 따라 움직임 게이트 생성"""
+        try:
+            from ..sensor.motion_gate import MotionGate
+        except Exception as e:
+            print(f"[AI Thread] 움직임 게이트 사용 불가: {e}")
+            return None
+        env = self.app.cfg.env if hasattr(self.app, 'cfg') else {}
+        enabled = str(env.get('motion_gate_enabled', True)).lower() in ("1", "true", "yes", "on")
+        try:
+            max_keepalive = float(env.get('motion_gate_max_keepalive', 5.0))
+        except (TypeError, ValueError):
+            max_keepalive = 5.0
+        return MotionGate(max_keepalive=max_keepalive, enabled=enabled)
+
+    def _create_stage_budget(self):
+        """패널 전용 단계별 시간 예산 생성 (측정 시간만 공용, 사용 여부는 [ENV] ai_budget_enabled)"""
+        from ..sensor.stage_budget import StageBudget, configure_stage_budgets
+        env = self.app.cfg.env if hasattr(self.app, 'cfg') else {}
+        enabled = str(env.get('ai_budget_enabled', True)).lower() in ("1", "true", "yes", "on")
+        configure_stage_budgets(enabled=enabled)
+        return StageBudget(enabled=enabled, name=f"거울보기 {self.sid}")
+
+    def _configure_stage_budget(self, performance_mode):
+        """성능 모드가 바뀌면 모드별 목표 FPS/지연 시간 적용"""
+        if performance_mode == self._ai_budget_mode:
+            return
+        from ..utils.helpers import get_performance_settings
+        self._ai_budget_mode = performance_mode
+        self._ai_budget.configure(**get_performance_settings(performance_mode).get('budget', {}))
+
     def _ai_inference_worker(self):
         """AI 추론 백그라운드 워커 스레드"""
+        # 와치독 보고: 프레임 1건 처리 중인 시간 (추론이 멈추면 계속 증가)
+        progress = get_health_reporter().task("ai")
         while self._ai_thread_running and self.mirror_mode_active:
+            progress.end()
             try:
                 # 프레임 큐에서 대기 (최대 0.1초, 빠른 반응)
                 if self._ai_frame_queue is None:
@@ -2682,9 +2647,23 @@ class SensorPanel(ttk.Frame):
 
                 if frame is None:  # 종료 신호
                     break
+                progress.begin()
+
+                # 움직임 게이트: 정적인 화면이면 PPE/얼굴/사물 인식을 생략하고 이전 결과 유지
+                gate = self._motion_gate
+                if gate is not None and not gate.should_run(frame):
+                    self._motion_skip_count += 1
+                    if self._motion_skip_count % 10 == 0:
+                        try:
+                            self.after(0, lambda: self._update_accuracy_display(None, update_accuracy=False))
+                        except Exception:
+                            pass
+                    continue
 
                 detection_results = None
                 ppe_status = None
+                budget = self._ai_budget
+                budget.begin_frame()
 
                 # 디버그 카운터 초기화
                 if not hasattr(self, '_ai_debug_count'):
@@ -2698,6 +2677,7 @@ class SensorPanel(ttk.Frame):
                     performance_mode = max(1, min(3, performance_mode))
                 except Exception:
                     pass
+                self._configure_stage_budget(performance_mode)
 
                 # PPE 인식 활성화 여부 확인 (성능 모드 2 이상에서만 활성화)
                 ppe_detection_enabled = performance_mode >= 2
@@ -2749,8 +2729,14 @@ class SensorPanel(ttk.Frame):
                             except Exception as e:
                                 print(f"[AI Thread] 디버그 프레임 저장 실패: {e}")
 
-                        # YOLOv10 PPE 감지
-                        detections = self.ppe_detector.detect(frame)
+                        # YOLOv10 PPE 감지 (시간 예산에 따라 N프레임마다, 건너뛴 프레임은 이전 감지 결과)
+                        # safety_detector의 YOLO PPE('ppe')와 다른 모델이므로 단계 'ppe_v10'으로 따로 계획
+                        if budget.due('ppe_v10') or self._ai_last_detections is None:
+                            with _AI_PPE.time():
+                                detections = self.ppe_detector.detect(frame, budget=budget)
+                            self._ai_last_detections = detections
+                        else:
+                            detections = self._ai_last_detections
                         if detections:
                             ppe_status = detections[0].ppe_status  # 첫 번째 사람의 PPE 상태
                             # 캐시에 저장
@@ -2790,7 +2776,8 @@ class SensorPanel(ttk.Frame):
                                 try:
                                     # detect_face_only(): 얼굴만 감지 (~30ms)
                                     # detect_all(): PPE + 얼굴 전체 (~1800ms)
-                                    face_results = self.safety_detector.detect_face_only(frame)
+                                    with _AI_FACE.time():
+                                        face_results = self.safety_detector.detect_face_only(frame)
                                     if face_results and (face_results.get('faces') or face_results.get('recognized_faces')):
                                         # 얼굴 인식 결과 캐시에 저장 (박스 표시용)
                                         self._face_results_cache = face_results
@@ -2840,7 +2827,8 @@ class SensorPanel(ttk.Frame):
                     try:
                         if ppe_detection_enabled:
                             # PPE + 얼굴 전체 감지 (fallback)
-                            detection_results = self.safety_detector.detect_all(frame)
+                            with _AI_SAFETY_ALL.time():
+                                detection_results = self.safety_detector.detect_all(frame)
 
                             # PPE 감지 결과 디버그 (10프레임마다)
                             if detection_results and self._ai_debug_count % 10 == 0:
@@ -2849,7 +2837,8 @@ class SensorPanel(ttk.Frame):
                                 print(f"[AI Thread] Fallback PPE 감지: helmet={helmet}, glasses={glasses}")
                         else:
                             # 얼굴 인식만 수행 (PPE 비활성화)
-                            face_results = self.safety_detector.detect_face_only(frame)
+                            with _AI_FACE.time():
+                                face_results = self.safety_detector.detect_face_only(frame)
                             if face_results:
                                 self._face_results_cache = face_results
                                 detection_results = {
@@ -2880,7 +2869,9 @@ class SensorPanel(ttk.Frame):
                         if yolo_model is not None:
                             print(f"[AI Thread] COCO 모델: {len(yolo_model.names)}개 클래스")
 
-                if object_detection_enabled and self.safety_detector is not None:
+                # 실행 주기는 시간 예산이 결정 (건너뛴 프레임은 이전 사물 결과 유지)
+                coco_active = object_detection_enabled and self.safety_detector is not None
+                if coco_active and budget.due('coco'):
                     try:
                         # 활성화된 카테고리 가져오기
                         enabled_categories = {
@@ -2901,9 +2892,10 @@ class SensorPanel(ttk.Frame):
                         else:
                             # 기본값: IP 카메라 0.25, USB 0.35 (성능 최적화)
                             coco_conf = 0.25 if is_ip_camera else 0.35
-                        detected_objects = self.safety_detector.detect_objects_coco(
-                            frame, enabled_categories, confidence_threshold=coco_conf
-                        )
+                        with _AI_COCO.time():
+                            detected_objects = self.safety_detector.detect_objects_coco(
+                                frame, enabled_categories, confidence_threshold=coco_conf
+                            )
 
                         # 캐시에 저장
                         self._detected_objects_cache = detected_objects
@@ -2928,10 +2920,12 @@ class SensorPanel(ttk.Frame):
                     except Exception as e:
                         if self._ai_debug_count % 30 == 0:
                             print(f"[AI Thread] 사물 감지 오류: {e}")
-                else:
+                elif not coco_active:
                     # 사물 인식 비활성화 시 캐시 초기화
                     self._detected_objects_cache = []
 
+                budget.end_frame()
+
                 # 결과 캐싱 (스레드 안전)
                 with self._ai_result_lock:
                     self._cached_detection_results = detection_results
@@ -2946,11 +2940,21 @@ class SensorPanel(ttk.Frame):
                 # 큐 타임아웃 또는 기타 오류
                 continue
 
+        get_health_reporter().remove_task(progress)
         print("[AI Thread] 워커 스레드 종료")
 
-    def _update_accuracy_display(self, detection_results):
-        """인식률 계산 및 표시 업데이트"""
+    def _update_accuracy_display(self, detection_results, update_accuracy=True):
+        """인식률 계산 및 표시 업데이트
+
+        update_accuracy=False면 (움직임 게이트로 추론을 건너뛴 경우) 인식률은 유지하고
+        움직임 점수/스킵 비율만 갱신합니다.
+        """
         try:
+            if not update_accuracy:
+                if self.mirror_normal_accuracy_label:
+                    self.mirror_normal_accuracy_label.configure(text=self._format_accuracy_text())
+                return
+
             # 인식률 계산
             accuracy = 0.0
             if detection_results:
@@ -2987,81 +2991,58 @@ class SensorPanel(ttk.Frame):
 
             # UI 업데이트
             if self.mirror_normal_accuracy_label:
-                self.mirror_normal_accuracy_label.configure(
-                    text=f"인식률: {self.mirror_normal_accuracy:.1f}%"
-                )
+                self.mirror_normal_accuracy_label.configure(text=self._format_accuracy_text())
 
         except Exception as e:
             if self.mirror_frame_count % 30 == 0:
                 print(f"인식률 계산 오류: {e}")
 
+    def _format_accuracy_text(self):
+        """인식률 + 움직임 게이트 통계 표시 문자열"""
+        text = f"인식률: {self.mirror_normal_accuracy:.1f}%"
+        gate = self._motion_gate
+        if gate is not None and gate.enabled:
+            text += f" | 움직임: {gate.motion_score * 100:.1f}% | 스킵: {gate.skip_ratio * 100:.0f}%"
+        return text
+
     def _check_camera_availability(self):
-        """카메라 사용 가능 여부를 확인 (다른 패널에서 사용 중이면 스킵)"""
-        # 다른 패널에서 카메라를 사용 중인지 확인
+        """카메라 사용 가능 여부를 확인"""
+        # 카메라 목록(캐시)으로 즉시 확인 - 장치를 열지 않으므로 사용 중인 카메라도 확인 가능
         try:
-            for panel_key, panel in self.app.panels.items():
-                if panel_key == self.sid_key:
-                    continue
-                if hasattr(panel, 'mirror_mode_active') and panel.mirror_mode_active:
-                    # 다른 패널에서 거울보기 사용 중 - 카메라 테스트 스킵
-                    print(f"[카메라] 다른 패널에서 카메라 사용 중 - 테스트 스킵")
-                    # 자기 자신만 업데이트 (전파하지 않음)
-                    self.camera_available = True
-                    if hasattr(self, 'header') and hasattr(self.header, 'set_mirror_camera_ready'):
-                        self.header.set_mirror_camera_ready(True)
-                    return
-                # 다른 패널에서 카메라가 이미 사용 가능으로 확인된 경우
-                if hasattr(panel, 'camera_available') and panel.camera_available:
-                    print(f"[카메라] 다른 패널에서 카메라 확인됨 - 테스트 스킵")
-                    # 자기 자신만 업데이트 (전파하지 않음 - 이미 다른 패널에서 전파됨)
-                    self.camera_available = True
-                    if hasattr(self, 'header') and hasattr(self.header, 'set_mirror_camera_ready'):
-                        self.header.set_mirror_camera_ready(True)
-                    return
-        except Exception:
-            pass
-
-        def check_camera():
-            try:
-                import cv2
-                import platform
-                system = platform.system().lower()
-
-                # 플랫폼별 백엔드 설정
-                if system == 'windows':
-                    backend = cv2.CAP_DSHOW
-                elif system == 'linux':
-                    backend = cv2.CAP_V4L2
-                else:
-                    backend = cv2.CAP_ANY
-
-                # 카메라 사용 가능 여부 확인 (빠른 테스트)
-                camera_found = False
-                for i in range(3):  # 0~2까지만 빠르게 확인
-                    try:
-                        test_camera = cv2.VideoCapture(i, backend)
-
-                        if test_camera.isOpened():
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                camera_found = True
-                                test_camera.release()
-                                break
-                            test_camera.release()
-                    except Exception:
-                        continue
+            from ..camera import get_camera_registry
+            registry = get_camera_registry()
+            camera_found = bool(registry.capture_devices())
+            # 카메라 연결/분리 시 버튼 상태 자동 갱신 (한 번만 등록, 패널이 닫히면 자동 해제)
+            if not getattr(self, '_camera_hotplug_registered', False):
+                self._camera_hotplug_events = queue.Queue()
+                registry.add_listener(self._on_camera_hotplug)
+                self._camera_hotplug_registered = True
+                self.after(1000, self._poll_camera_hotplug)
+        except Exception as e:
+            print(f"카메라 확인 오류: {e}")
+            camera_found = False
+        self._update_camera_button_state(camera_found)
 
-                # UI 스레드에서 버튼 상태 업데이트
-                self.after(0, lambda found=camera_found: self._update_camera_button_state(found))
-            except ImportError:
-                # OpenCV가 없으면 카메라 사용 불가
-                self.after(0, lambda: self._update_camera_button_state(False))
-            except Exception as e:
-                print(f"카메라 확인 오류: {e}")
-                self.after(0, lambda: self._update_camera_button_state(False))
+    def _on_camera_hotplug(self, devices):
+        """카메라 연결/분리 감지 (감시 스레드에서 호출) → 큐에만 넣고 Tk 스레드에서 반영"""
+        self._camera_hotplug_events.put(any(d.is_capture for d in devices))
 
-        # 백그라운드 스레드에서 실행
-        threading.Thread(target=check_camera, daemon=True).start()
+    def _poll_camera_hotplug(self):
+        """쌓인 연결/분리 이벤트 중 마지막 상태만 반영 (1초 주기, 패널이 닫히면 중단)"""
+        try:
+            if not self.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        found = None
+        try:
+            while True:
+                found = self._camera_hotplug_events.get_nowait()
+        except queue.Empty:
+            pass
+        if found is not None:
+            self._update_camera_button_state(found)
+        self.after(1000, self._poll_camera_hotplug)
     
     def _update_camera_button_state(self, camera_available):
         """카메라 버튼 상태 업데이트 및 모든 패널에 전파"""
@@ -3174,6 +3155,22 @@ class SensorPanel(ttk.Frame):
             else:
                 self._show_capture_error()
 
+            # IP 카메라: 메인스트림(고해상도) 스냅샷도 함께 저장 (서브스트림 화면과 별도, 백그라운드)
+            cam = self.mirror_camera
+            if getattr(self, '_ip_camera_url', None) and hasattr(cam, 'snapshot'):
+                import threading
+
+                def save_snapshot():
+                    frame = cam.snapshot()
+                    if frame is None:
+                        return
+                    import cv2
+                    snap_path = os.path.join(capture_dir, f"ipcam_{timestamp}.jpg")
+                    if cv2.imwrite(snap_path, frame, [cv2.IMWRITE_JPEG_QUALITY, 95]):
+                        print(f"[캡쳐] IP 카메라 스냅샷 저장: {snap_path} ({frame.shape[1]}x{frame.shape[0]})")
+
+                threading.Thread(target=save_snapshot, name="ipcam-snapshot", daemon=True).start()
+
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -3213,51 +3210,14 @@ class SensorPanel(ttk.Frame):
             pass
 
     def _get_available_cameras(self):
-        """사용 가능한 카메라 목록 검색 (Linux 전용)"""
+        """사용 가능한 카메라 목록 (카메라 목록 캐시, 장치를 열지 않음)"""
         try:
-            import os
-        except ImportError:
+            from ..camera import get_camera_registry
+            return [(d.index, d.label) for d in get_camera_registry().capture_devices()]
+        except Exception as e:
+            print(f"[카메라] 목록 조회 오류: {e}")
             return []
 
-        cameras = []
-
-        # Linux: /dev/video* 장치 검색 (V4L2 정보로 필터링)
-        for i in range(10):  # 최대 10개 카메라 검색
-            device_path = f"/dev/video{i}"
-            if not os.path.exists(device_path):
-                continue
-
-            try:
-                # V4L2 장치 정보 확인 (캡처 가능 여부)
-                # index 파일이 있고 0이면 메인 캡처 장치
-                index_path = f"/sys/class/video4linux/video{i}/index"
-                if os.path.exists(index_path):
-                    with open(index_path, 'r') as f:
-                        idx_val = f.read().strip()
-                        if idx_val != '0':
-                            # 메타데이터 장치는 스킵 (index != 0)
-                            continue
-                else:
-                    # index 파일이 없으면 sysfs 디렉토리 존재 여부로 판단
-                    sysfs_path = f"/sys/class/video4linux/video{i}"
-                    if not os.path.exists(sysfs_path):
-                        continue
-
-                # V4L2 장치 이름 읽기
-                name = f"카메라 {i}"
-                name_path = f"/sys/class/video4linux/video{i}/name"
-                if os.path.exists(name_path):
-                    with open(name_path, 'r') as f:
-                        device_name = f.read().strip()
-                        if device_name:
-                            name = f"{device_name} ({i})"
-
-                cameras.append((i, name))
-            except Exception:
-                continue
-
-        return cameras
-
     def _get_current_camera_name(self):
         """현재 설정된 카메라 이름 반환"""
         try:
@@ -3451,18 +3411,13 @@ class SensorPanel(ttk.Frame):
                     print(f"[IP카메라] PPEDetector 리셋 오류: {e}")
             print("[IP카메라] 기존 감지기 초기화됨")
 
-            # IP 카메라 연결 (RTSP 최적화 옵션)
-            # Tapo 카메라 등 RTSP 스트림에 TCP 전송 모드 사용
-            # H.264 디코딩 오류 감소를 위한 환경 변수 설정
-            import os
-            os.environ["OPENCV_FFMPEG_CAPTURE_OPTIONS"] = "rtsp_transport;tcp|analyzeduration;10000000|probesize;10000000"
-
-            cap = cv2.VideoCapture(url, cv2.CAP_FFMPEG)
-
-            # 타임아웃 및 버퍼 설정
-            cap.set(cv2.CAP_PROP_OPEN_TIMEOUT_MSEC, 10000)
-            cap.set(cv2.CAP_PROP_READ_TIMEOUT_MSEC, 10000)
-            cap.set(cv2.CAP_PROP_BUFFERSIZE, 3)  # 버퍼 크기 증가로 프레임 드롭 감소
+            # IP 카메라 연결 (공용 카메라 서비스: 저지연 RTSP 옵션, 전용 디코딩 스레드, 재연결 처리)
+            # 화면/AI는 서브스트림, 메인스트림은 스냅샷(화면 캡쳐) 때만 사용
+            from ..camera import ffmpeg_options, get_camera_service
+            service = get_camera_service()
+            service.set_rtsp_options(ffmpeg_options(self.app.cfg.camera))
+            cap = service.subscribe_rtsp(url, use_substream=bool(self.app.cfg.camera.get("ip_camera_substream", True)),
+                                         name=f"mirror:{self.sid_key}")
 
             if cap.isOpened():
                 ret, frame = cap.read()
@@ -3475,7 +3430,7 @@ class SensorPanel(ttk.Frame):
                     print(f"[IP카메라] 연결 성공: {url} ({w}x{h})")
 
                     # PPE 감지기 초기화 (IP 카메라용)
-                    if PPE_DETECTOR_AVAILABLE and self.ppe_detector is None:
+                    if _load_ppe_module() and self.ppe_detector is None:
                         try:
                             self.ppe_detector = PPEDetector()
                             self.ppe_visualizer = PPEVisualizer(font_size=20)
@@ -3549,7 +3504,7 @@ class SensorPanel(ttk.Frame):
         Args:
             rtsp_url: RTSP URL (rtsp://user:pass@ip:port/path 형식)
         """
-        if not TAPO_PTZ_AVAILABLE:
+        if not _load_tapo_module():
             print("[PTZ] pytapo 라이브러리 없음 - PTZ 비활성화")
             return
 
@@ -4127,7 +4082,11 @@ class SensorPanel(ttk.Frame):
         """실시간 FPS 및 감지 수 업데이트"""
         try:
             if hasattr(self, '_rt_fps_label') and self._rt_fps_label:
-                self._rt_fps_label.configure(text=f"FPS: {fps:.1f} | 감지: {detection_count}개")
+                text = f"FPS: {fps:.1f} | 감지: {detection_count}개"
+                cam = self.mirror_camera
+                if getattr(self, '_ip_camera_url', None) and hasattr(cam, 'decode_fps'):
+                    text += f" | 디코딩: {cam.decode_fps:.1f} | 지연: {cam.display_latency * 1000:.0f}ms"
+                self._rt_fps_label.configure(text=text)
         except:
             pass
 
@@ -9,10 +9,11 @@ from tkinter import ttk, messagebox, simpledialog
 import os
 import json
 import math
+from collections import OrderedDict
 
 # 외부 라이브러리 (선택)
 try:
-    from PIL import Image, ImageTk, ImageDraw, ImageFont
+    from PIL import Image, ImageTk
     PIL_OK = True
 except Exception:
     PIL_OK = False
@@ -21,6 +22,23 @@ except Exception:
 class PanelBlueprintView(tk.Frame):
     """센서 패널용 도면 뷰"""
 
+    SCALE_CACHE_SIZE = 6              # 줌 단계별 축소 도면 캐시 개수
+    MAX_SCALED_PIXELS = 16_000_000    # 이보다 큰 확대 도면은 화면 주변만 잘라서 렌더링
+    ITEM_RADIUS = 40                  # 개별 센서값 아이콘 반경 (줌과 무관)
+    NAME_RADIUS = 35                  # 센서 이름 아이콘 반경
+    MONITOR_SIZE = (70, 45)
+
+    SENSOR_KEYS = ["co2", "h2s", "co", "o2", "lel", "smoke", "temperature", "humidity", "water"]
+    SENSOR_LABELS = ["CO2", "H2S", "CO", "O2", "LEL", "Smoke", "Temp", "Humi", "Water"]
+
+    # 경보 레벨별 아이콘 색상 (1=정상은 센서 고유 색상)
+    ALERT_COLORS = {
+        2: "#F1C40F",  # 관심 - 노랑
+        3: "#E67E22",  # 주의 - 주황
+        4: "#E74C3C",  # 경계 - 빨강
+        5: "#C0392B",  # 심각 - 진홍
+    }
+
     def __init__(self, parent, panel, app):
         super().__init__(parent, bg="#2C3E50")
         self.panel = panel  # SensorPanel 참조
@@ -38,7 +56,16 @@ class PanelBlueprintView(tk.Frame):
         # 현재 도면 정보
         self.current_blueprint = None  # 파일명
         self.blueprint_image = None  # PIL Image
-        self.blueprint_photo = None  # PhotoImage
+        self.blueprint_photo = None  # PhotoImage (현재 도면 계층)
+
+        # 계층 렌더링 캐시
+        self._mip_levels = []  # 도면 축소 단계 [원본, 1/2, 1/4, ...]
+        self._scaled_cache = OrderedDict()  # (폭, 높이) → 축소 도면 PhotoImage (LRU)
+        self._base_item = None  # 도면 캔버스 아이템
+        self._base_region = None  # 도면 아이템이 덮는 영역 (확대 도면 좌표)
+        self._marker_items = {}  # ("item"|"line", i, j) / ("sensor"|"monitor", i) → 캔버스 아이템
+        self._marker_state = {}  # (i, j) → (값, 색상)
+        self._drag_moved = False
 
         # 줌/팬 상태
         self.zoom_level = 1.0
@@ -133,7 +160,7 @@ class PanelBlueprintView(tk.Frame):
                  relief="raised", bd=2, width=5, height=2,
                  activebackground="#7F8C8D", activeforeground="#FFFFFF").pack(side="right", padx=2)
 
-        tk.Button(control_frame, text="초기화", command=self._reset_view,
+        tk.Button(control_frame, text="초기화", command=self._on_reset_view,
                  bg="#95A5A6", fg="#FFFFFF", font=("Pretendard", 11, "bold"),
                  relief="raised", bd=2, width=8, height=2,
                  activebackground="#7F8C8D", activeforeground="#FFFFFF").pack(side="right", padx=2)
@@ -310,9 +337,11 @@ class PanelBlueprintView(tk.Frame):
         try:
             filepath = os.path.join(self.blueprint_dir, self.current_blueprint)
             self.blueprint_image = Image.open(filepath)
+            self.blueprint_image.load()
         except Exception as e:
             messagebox.showerror("오류", f"도면 이미지 로드 실패:\n{str(e)}")
             self.blueprint_image = None
+        self._invalidate_render_cache()
 
     def _load_blueprint_data(self):
         """도면 데이터 로드 (도면 단위로 저장됨)"""
@@ -359,15 +388,20 @@ class PanelBlueprintView(tk.Frame):
         self.pan_x = 0
         self.pan_y = 0
 
+    def _on_reset_view(self):
+        """초기화 버튼"""
+        self._reset_view()
+        self._relayout()
+
     def _zoom_in(self):
         """줌 인"""
         self.zoom_level = min(self.zoom_level * 1.2, 5.0)
-        self._redraw_canvas()
+        self._relayout()
 
     def _zoom_out(self):
         """줌 아웃"""
         self.zoom_level = max(self.zoom_level / 1.2, 0.2)
-        self._redraw_canvas()
+        self._relayout()
 
     def _on_mouse_wheel(self, event):
         """마우스 휠로 줌"""
@@ -378,15 +412,140 @@ class PanelBlueprintView(tk.Frame):
 
     def _on_canvas_resize(self, event):
         """캔버스 크기 변경 시"""
-        self._redraw_canvas()
+        self._relayout()
 
     def refresh_display(self):
-        """디스플레이 새로고침 (실시간 센서 값 업데이트용)"""
-        self._redraw_canvas()
+        """디스플레이 새로고침 (실시간 센서 값 업데이트용) - 값/색상이 바뀐 아이콘만 갱신"""
+        if self._base_item is None:
+            self._redraw_canvas()
+            return
+        self._refresh_sensor_values()
+
+    # ------------------------------------------------------------------
+    # 계층 렌더링
+    #   base   : 줌 단계별로 캐시한 축소 도면 (PhotoImage 1개)
+    #   marker : 센서/모니터 아이콘 (캔버스 아이템, 값/색상/좌표만 제자리 갱신)
+    #   fire   : 화재 경보 배너
+    # 팬은 canvas.move로 처리하고, 드래그는 해당 센서 아이콘 좌표만 옮깁니다.
+    # ------------------------------------------------------------------
+
+    def _invalidate_render_cache(self):
+        """도면 변경 시 렌더링 캐시 초기화"""
+        self._mip_levels = []
+        self._scaled_cache.clear()
+        self._base_region = None
+        self.blueprint_photo = None
+
+    def _image_geometry(self):
+        """확대 도면의 캔버스상 위치와 크기 (left, top, width, height) - 캔버스 중앙 + 팬"""
+        canvas_width = max(self.canvas.winfo_width(), 100)
+        canvas_height = max(self.canvas.winfo_height(), 100)
+        img_width = max(1, int(self.blueprint_image.width * self.zoom_level))
+        img_height = max(1, int(self.blueprint_image.height * self.zoom_level))
+        left = canvas_width // 2 + self.pan_x - img_width // 2
+        top = canvas_height // 2 + self.pan_y - img_height // 2
+        return left, top, img_width, img_height
+
+    @staticmethod
+    def _to_canvas(rel_x, rel_y, geometry):
+        """도면 비율 좌표 → 캔버스 좌표"""
+        left, top, img_width, img_height = geometry
+        return left + rel_x * img_width, top + rel_y * img_height
+
+    @staticmethod
+    def _hex(color):
+        """(r, g, b[, a]) → Tk 색상 문자열"""
+        return "#%02x%02x%02x" % tuple(color[:3])
+
+    def _mip_source(self, width):
+        """목표 폭 이상인 가장 작은 축소 단계 (밉맵: 원본, 1/2, 1/4 ... 필요할 때 생성)"""
+        if not self._mip_levels:
+            image = self.blueprint_image
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            self._mip_levels = [image]
+        levels = self._mip_levels
+        while levels[-1].width // 2 >= width and min(levels[-1].size) >= 2:
+            levels.append(levels[-1].reduce(2))
+        for image in reversed(levels):
+            if image.width >= width:
+                return image
+        return levels[0]
+
+    def _scaled_photo(self, img_width, img_height):
+        """줌 단계별 축소 도면 (LRU 캐시)"""
+        key = (img_width, img_height)
+        photo = self._scaled_cache.get(key)
+        if photo is not None:
+            self._scaled_cache.move_to_end(key)
+            return photo
+        source = self._mip_source(img_width)
+        photo = ImageTk.PhotoImage(source.resize((img_width, img_height), Image.LANCZOS))
+        self._scaled_cache[key] = photo
+        while len(self._scaled_cache) > self.SCALE_CACHE_SIZE:
+            self._scaled_cache.popitem(last=False)
+        return photo
+
+    def _visible_region(self, geometry, margin):
+        """화면에 보이는 확대 도면 영역 (+여백, 확대 도면 좌표) - 보이지 않으면 None"""
+        left, top, img_width, img_height = geometry
+        canvas_width = max(self.canvas.winfo_width(), 100)
+        canvas_height = max(self.canvas.winfo_height(), 100)
+        x0 = max(0, -left - canvas_width * margin)
+        y0 = max(0, -top - canvas_height * margin)
+        x1 = min(img_width, canvas_width - left + canvas_width * margin)
+        y1 = min(img_height, canvas_height - top + canvas_height * margin)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return x0, y0, x1, y1
+
+    def _update_base_layer(self, geometry):
+        """도면 계층 갱신 (캐시된 축소 도면, 너무 크면 화면 주변만 렌더링)"""
+        left, top, img_width, img_height = geometry
+        if img_width * img_height <= self.MAX_SCALED_PIXELS:
+            photo = self._scaled_photo(img_width, img_height)
+            region = (0, 0, img_width, img_height)
+        else:
+            region = self._visible_region(geometry, margin=1)
+            if region is None:
+                photo, region = None, (0, 0, 0, 0)
+            else:
+                x0, y0, x1, y1 = region
+                source = self._mip_source(img_width)
+                sx = source.width / img_width
+                sy = source.height / img_height
+                photo = ImageTk.PhotoImage(source.resize(
+                    (x1 - x0, y1 - y0), Image.LANCZOS, box=(x0 * sx, y0 * sy, x1 * sx, y1 * sy)))
+
+        self.blueprint_photo = photo  # 참조 유지
+        self._base_region = region
+        if self._base_item is None:
+            self._base_item = self.canvas.create_image(0, 0, anchor="nw", tags=("base",))
+        self.canvas.itemconfigure(self._base_item, image=photo if photo is not None else "")
+        self.canvas.coords(self._base_item, left + region[0], top + region[1])
+        self.canvas.tag_lower("base")
+
+    def _ensure_base_coverage(self):
+        """팬 후 화면이 렌더링된 도면 영역을 벗어났으면 다시 렌더링 (큰 확대 도면만 해당)"""
+        if self._base_item is None or self._base_region is None:
+            return
+        geometry = self._image_geometry()
+        if geometry[2] * geometry[3] <= self.MAX_SCALED_PIXELS:
+            return
+        visible = self._visible_region(geometry, margin=0)
+        if visible is None:
+            return
+        x0, y0, x1, y1 = self._base_region
+        vx0, vy0, vx1, vy1 = visible
+        if vx0 < x0 or vy0 < y0 or vx1 > x1 or vy1 > y1:
+            self._update_base_layer(geometry)
 
     def _redraw_canvas(self):
-        """캔버스 재그리기"""
+        """캔버스 전체 다시 그리기 (도면 선택, 센서/모니터 추가·삭제 시)"""
         self.canvas.delete("all")
+        self._base_item = None
+        self._marker_items = {}
+        self._marker_state = {}
 
         if not self.blueprint_image or not PIL_OK:
             self.canvas.create_text(self.canvas.winfo_width() // 2,
@@ -395,203 +554,143 @@ class PanelBlueprintView(tk.Frame):
                                    fill="#FFFFFF", font=("Pretendard", 16, "bold"))
             return
 
-        # 캔버스 크기
-        canvas_width = max(self.canvas.winfo_width(), 100)
-        canvas_height = max(self.canvas.winfo_height(), 100)
-
-        # 이미지 크기 (줌 적용)
-        img_width = int(self.blueprint_image.width * self.zoom_level)
-        img_height = int(self.blueprint_image.height * self.zoom_level)
-
-        # 이미지 리사이즈
-        resized_image = self.blueprint_image.resize((img_width, img_height), Image.LANCZOS)
-
-        # 오버레이를 더 큰 크기로 생성 (도면 밖에도 아이콘 배치 가능)
-        # 오버레이는 이미지 크기의 3배로 생성 (여백 포함)
-        overlay_width = img_width * 3
-        overlay_height = img_height * 3
-        overlay = Image.new('RGBA', (overlay_width, overlay_height), (0, 0, 0, 0))
-
-        # 오버레이 중앙에 도면 이미지 배치할 위치 계산
-        offset_x = img_width
-        offset_y = img_height
-
-        # 이미지 합성 (먼저 도면 이미지를 오버레이 중앙에 배치)
-        if resized_image.mode != 'RGBA':
-            resized_image = resized_image.convert('RGBA')
-
-        # 오버레이에 도면 이미지를 중앙에 붙여넣기
-        overlay.paste(resized_image, (offset_x, offset_y), resized_image if resized_image.mode == 'RGBA' else None)
+        geometry = self._image_geometry()
+        self._update_base_layer(geometry)
 
-        # 이제 오버레이 위에 센서/모니터 그리기 (도면 위에 표시됨)
-        draw = ImageDraw.Draw(overlay)
-
-        # 센서 그리기 (오프셋 적용)
-        for sensor in self.sensors:
-            x = sensor["x"] * img_width + offset_x
-            y = sensor["y"] * img_height + offset_y
-            self._draw_sensor_on_image(draw, x, y, sensor)
-
-        # 모니터 그리기 (오프셋 적용)
-        for monitor in self.monitors:
-            x = monitor["x"] * img_width + offset_x
-            y = monitor["y"] * img_height + offset_y
-            self._draw_monitor_on_image(draw, x, y, monitor)
-
-        # 화재 경보 오버레이 그리기 (센서/모니터 위에 표시)
-        self._draw_fire_alert_overlay(draw, img_width, img_height, offset_x, offset_y)
-
-        # PhotoImage로 변환
-        self.blueprint_photo = ImageTk.PhotoImage(overlay)
-
-        # 캔버스에 이미지 표시 (팬 적용)
-        x_pos = canvas_width // 2 + self.pan_x
-        y_pos = canvas_height // 2 + self.pan_y
-        self.canvas.create_image(x_pos, y_pos, image=self.blueprint_photo, anchor="center")
+        for i, sensor in enumerate(self.sensors):
+            self._create_sensor_items(i, sensor)
+        for i, monitor in enumerate(self.monitors):
+            self._create_monitor_items(i, monitor)
+        self._layout_markers(geometry)
+        self._refresh_sensor_values()
 
-    def _draw_sensor_on_image(self, draw, x, y, sensor):
-        """이미지에 센서 그리기 (개별 센서값 표시만)"""
-        # 고정 크기 (줌과 무관)
-        base_radius = 40  # 개별 센서 원 반경
+        self._draw_fire_layer(geometry)
 
-        # 센서별로 고유한 색상 할당 (sid 기반)
+    def _relayout(self):
+        """줌/창 크기 변경: 도면은 캐시에서 교체하고 아이콘은 좌표만 이동"""
+        if not self.blueprint_image or not PIL_OK or self._base_item is None:
+            self._redraw_canvas()
+            return
+        geometry = self._image_geometry()
+        self._update_base_layer(geometry)
+        self._layout_markers(geometry)
+        self._draw_fire_layer(geometry)
+
+    def _pan(self, dx, dy):
+        """팬: 다시 그리지 않고 캔버스 아이템 이동"""
+        self.pan_x += dx
+        self.pan_y += dy
+        self.canvas.move("all", dx, dy)
+        self._ensure_base_coverage()
+
+    def _create_sensor_items(self, index, sensor):
+        """센서 아이콘 캔버스 아이템 생성 (좌표는 _layout_sensor, 값/색상은 _refresh_sensor_values)"""
         sensor_sid = sensor.get("sid", self.sid)
-        sensor_color = self._get_sensor_color(sensor_sid)
-
-        # 개별 센서값 표기 (원형 아이콘 + 값) - 각각 독립적으로 배치
-        # PIL ImageDraw는 이모지를 지원하지 않으므로 간단한 텍스트 사용
-        sensor_keys = ["co2", "h2s", "co", "o2", "lel", "smoke", "temperature", "humidity", "water"]
-        labels = ["CO2", "H2S", "CO", "O2", "LEL", "Smoke", "Temp", "Humi", "Water"]
+        sensor_color = self._hex(self._get_sensor_color(sensor_sid))
 
         # individual_items가 없으면 초기화 (원형 배치)
         if "individual_items" not in sensor or not sensor["individual_items"]:
             sensor["individual_items"] = []
             default_radius = 150  # 픽셀 단위 (도면 밖으로 나가지 않도록)
-            for i, key in enumerate(sensor_keys):
+            for i, key in enumerate(self.SENSOR_KEYS):
                 angle = (i * 60 - 90) * math.pi / 180
                 # 비율이 아닌 픽셀 오프셋으로 계산
                 offset_x = default_radius * math.cos(angle) / self.blueprint_image.width
                 offset_y = default_radius * math.sin(angle) / self.blueprint_image.height
-                rel_x = sensor["x"] + offset_x
-                rel_y = sensor["y"] + offset_y
-                sensor["individual_items"].append({"key": key, "x": rel_x, "y": rel_y})
-
-        # 폰트 로드 (Linux/Windows 모두 지원)
-        font_name = None
-        font_paths = [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
-            "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/truetype/noto/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/opentype/pretendard/Pretendard-Regular.otf",
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
-            "/usr/share/fonts/truetype/ubuntu/Ubuntu-R.ttf",
-            "C:/Windows/Fonts/malgun.ttf",
-            "C:/Windows/Fonts/NanumGothic.ttf",
-        ]
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    font_name = ImageFont.truetype(font_path, 14)
-                    break
-                except:
-                    continue
-        if font_name is None:
-            font_name = ImageFont.load_default()
+                sensor["individual_items"].append({"key": key,
+                                                   "x": sensor["x"] + offset_x,
+                                                   "y": sensor["y"] + offset_y})
 
-        # 좌표 계산을 위한 변수
-        img_width_zoomed = self.blueprint_image.width * self.zoom_level
-        img_height_zoomed = self.blueprint_image.height * self.zoom_level
-        sensor_rel_x = sensor["x"]
-        sensor_rel_y = sensor["y"]
+        tags = ("marker", f"sensor{index}")
+        items = sensor["individual_items"]
 
-        # 반투명 선 색상
-        line_color = sensor_color[:3] + (100,)  # 반투명 (alpha=100)
+        # 센서 이름으로 잇는 선 (맨 아래)
+        for j, _item in enumerate(items):
+            self._marker_items[("line", index, j)] = self.canvas.create_line(
+                0, 0, 0, 0, fill=sensor_color, width=1, dash=(3, 3), tags=tags)
 
-        # 각 센서 아이템 그리기
-        for i, item in enumerate(sensor["individual_items"]):
+        # 개별 센서값 아이콘 (원 + 라벨 + 값)
+        for j, item in enumerate(items):
             key = item["key"]
-            # item의 비율 좌표를 절대 좌표로 변환
-            item_rel_x = item["x"]
-            item_rel_y = item["y"]
-            item_x = x + (item_rel_x - sensor_rel_x) * img_width_zoomed
-            item_y = y + (item_rel_y - sensor_rel_y) * img_height_zoomed
-
-            label = labels[sensor_keys.index(key)]
-
-            # 센서 값과 임계값 상태 가져오기
-            value, is_ok, alert_level = self._get_sensor_value_with_status(sensor_sid, key)
-
-            # 경보 레벨에 따른 색상 결정
-            if alert_level == 1:  # 정상
-                color = sensor_color
-            elif alert_level == 2:  # 관심
-                color = (241, 196, 15, 255)  # 노랑
-            elif alert_level == 3:  # 주의
-                color = (230, 126, 34, 255)  # 주황
-            elif alert_level == 4:  # 경계
-                color = (231, 76, 60, 255)   # 빨강
-            elif alert_level == 5:  # 심각
-                color = (192, 57, 43, 255)  # 진홍
-            else:
-                color = sensor_color
-
-            # 센서 아이템에서 센서 이름으로 반투명 선 그리기
-            draw.line([(item_x, item_y), (x, y)], fill=line_color, width=1)
-
-            # 원 그리기 (고정 크기)
-            draw.ellipse([item_x - base_radius, item_y - base_radius,
-                        item_x + base_radius, item_y + base_radius],
-                       fill=color, outline=(255, 255, 255, 255), width=2)
-
-            # 텍스트 (라벨 + 값) - Linux/Windows 모두 지원
-            font_label = None
-            font_value = None
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    try:
-                        font_label = ImageFont.truetype(font_path, 16)
-                        font_value = ImageFont.truetype(font_path, 18)
-                        break
-                    except:
-                        continue
-
-            # 라벨 (위) - 폰트가 없으면 기본 폰트 사용 (anchor 미지원)
-            if font_label:
-                draw.text((item_x, item_y - 10), label,
-                         fill=(255, 255, 255, 255), font=font_label, anchor="mm")
-                # 값 (아래)
-                draw.text((item_x, item_y + 10), value,
-                         fill=(255, 255, 255, 255), font=font_value, anchor="mm")
-            else:
-                # 기본 폰트 - anchor 지원 안할 수 있음
-                default_font = ImageFont.load_default()
-                # 텍스트 바운딩박스 계산하여 중앙 정렬
-                try:
-                    label_bbox = draw.textbbox((0, 0), label, font=default_font)
-                    label_w = label_bbox[2] - label_bbox[0]
-                    value_bbox = draw.textbbox((0, 0), value, font=default_font)
-                    value_w = value_bbox[2] - value_bbox[0]
-                except:
-                    label_w = len(label) * 6
-                    value_w = len(value) * 6
-                draw.text((item_x - label_w // 2, item_y - 15), label,
-                         fill=(255, 255, 255, 255), font=default_font)
-                draw.text((item_x - value_w // 2, item_y + 5), value,
-                         fill=(255, 255, 255, 255), font=default_font)
-
-        # 센서 이름 배경 (원형) - 맨 위에 그리기
-        name_bg_radius = 35
-        # 반투명 색상으로 변경 (alpha=220)
-        sensor_color_transparent = sensor_color[:3] + (220,)
-        draw.ellipse([x - name_bg_radius, y - name_bg_radius,
-                     x + name_bg_radius, y + name_bg_radius],
-                   fill=sensor_color_transparent, outline=(255, 255, 255, 255), width=3)
-
-        # display_name이 있으면 사용, 없으면 sid 사용
-        display_name = sensor.get("display_name", sensor_sid)
-        draw.text((x, y), display_name, fill=(255, 255, 255, 255), font=font_name, anchor="mm")
+            label = self.SENSOR_LABELS[self.SENSOR_KEYS.index(key)] if key in self.SENSOR_KEYS else key
+            self._marker_items[("item", index, j)] = (
+                self.canvas.create_oval(0, 0, 0, 0, fill=sensor_color, outline="#FFFFFF", width=2, tags=tags),
+                self.canvas.create_text(0, 0, text=label, fill="#FFFFFF", font=("Pretendard", -16), tags=tags),
+                self.canvas.create_text(0, 0, text="-", fill="#FFFFFF", font=("Pretendard", -18), tags=tags),
+            )
+
+        # 센서 이름 (맨 위) - display_name이 있으면 사용, 없으면 sid 사용
+        self._marker_items[("sensor", index)] = (
+            self.canvas.create_oval(0, 0, 0, 0, fill=sensor_color, outline="#FFFFFF", width=3, tags=tags),
+            self.canvas.create_text(0, 0, text=sensor.get("display_name", sensor_sid), fill="#FFFFFF",
+                                    font=("Pretendard", -14), tags=tags),
+        )
+
+    def _create_monitor_items(self, index, monitor):
+        """모니터 아이콘 캔버스 아이템 생성"""
+        tags = ("marker", f"monitor{index}")
+        self._marker_items[("monitor", index)] = (
+            self.canvas.create_rectangle(0, 0, 0, 0, fill="#F39C12", outline="#FFFFFF", width=2, tags=tags),
+            self.canvas.create_text(0, 0, text=monitor.get("name", "모니터"), fill="#FFFFFF",
+                                    font=("Pretendard", -12), tags=tags),
+        )
+
+    def _layout_markers(self, geometry):
+        """모든 아이콘 좌표 갱신 (크기는 줌과 무관하게 고정)"""
+        for i in range(len(self.sensors)):
+            self._layout_sensor(i, geometry)
+        for i in range(len(self.monitors)):
+            self._layout_monitor(i, geometry)
+
+    def _layout_sensor(self, index, geometry):
+        """센서 1개의 아이콘 좌표 갱신"""
+        sensor = self.sensors[index]
+        x, y = self._to_canvas(sensor["x"], sensor["y"], geometry)
+        r = self.ITEM_RADIUS
+        for j, item in enumerate(sensor.get("individual_items", [])):
+            ids = self._marker_items.get(("item", index, j))
+            if ids is None:
+                continue
+            item_x, item_y = self._to_canvas(item["x"], item["y"], geometry)
+            self.canvas.coords(self._marker_items[("line", index, j)], item_x, item_y, x, y)
+            self.canvas.coords(ids[0], item_x - r, item_y - r, item_x + r, item_y + r)
+            self.canvas.coords(ids[1], item_x, item_y - 10)
+            self.canvas.coords(ids[2], item_x, item_y + 10)
+
+        ids = self._marker_items.get(("sensor", index))
+        if ids is not None:
+            r = self.NAME_RADIUS
+            self.canvas.coords(ids[0], x - r, y - r, x + r, y + r)
+            self.canvas.coords(ids[1], x, y)
+
+    def _layout_monitor(self, index, geometry):
+        """모니터 1개의 아이콘 좌표 갱신"""
+        ids = self._marker_items.get(("monitor", index))
+        if ids is None:
+            return
+        monitor = self.monitors[index]
+        x, y = self._to_canvas(monitor["x"], monitor["y"], geometry)
+        w, h = self.MONITOR_SIZE
+        self.canvas.coords(ids[0], x - w // 2, y - h // 2, x + w // 2, y + h // 2)
+        self.canvas.coords(ids[1], x, y)
+
+    def _refresh_sensor_values(self):
+        """센서값/경보 색상 갱신 (바뀐 아이콘만 itemconfigure)"""
+        for i, sensor in enumerate(self.sensors):
+            sensor_sid = sensor.get("sid", self.sid)
+            sensor_color = self._hex(self._get_sensor_color(sensor_sid))
+            for j, item in enumerate(sensor.get("individual_items", [])):
+                ids = self._marker_items.get(("item", i, j))
+                if ids is None:
+                    continue
+                value, _is_ok, alert_level = self._get_sensor_value_with_status(sensor_sid, item["key"])
+                color = self.ALERT_COLORS.get(alert_level, sensor_color)
+                state = (value, color)
+                if self._marker_state.get((i, j)) == state:
+                    continue
+                self._marker_state[(i, j)] = state
+                self.canvas.itemconfigure(ids[0], fill=color)
+                self.canvas.itemconfigure(ids[2], text=value)
 
     def _get_sensor_color(self, sid):
         """센서별 고유 색상 반환 (sid 기반 해시)"""
@@ -609,36 +708,6 @@ class PanelBlueprintView(tk.Frame):
         ]
         return colors[hash_val % len(colors)]
 
-    def _draw_monitor_on_image(self, draw, x, y, monitor):
-        """이미지에 모니터 그리기 (고정 크기)"""
-        # 사각형 아이콘 (고정 크기)
-        width = 70
-        height = 45
-        draw.rectangle([x - width//2, y - height//2, x + width//2, y + height//2],
-                      fill=(243, 156, 18, 220), outline=(255, 255, 255, 255), width=2)
-
-        # 모니터 이름 - Linux/Windows 모두 지원
-        name = monitor.get("name", "모니터")
-        font = None
-        font_paths = [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/usr/share/fonts/truetype/nanum/NanumBarunGothic.ttf",
-            "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
-            "/usr/share/fonts/opentype/pretendard/Pretendard-Regular.otf",
-            "C:/Windows/Fonts/malgun.ttf",
-            "C:/Windows/Fonts/NanumGothic.ttf",
-        ]
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    font = ImageFont.truetype(font_path, 12)
-                    break
-                except:
-                    continue
-        if font is None:
-            font = ImageFont.load_default()
-        draw.text((x, y), name, fill=(255, 255, 255, 255), font=font, anchor="mm")
-
     def _get_sensor_value(self, sid, key):
         """센서 값 가져오기 (실시간) - 다른 센서의 값도 가져올 수 있음"""
         value_str, _, _ = self._get_sensor_value_with_status(sid, key)
@@ -771,42 +840,23 @@ class PanelBlueprintView(tk.Frame):
         dy = event.y - self.drag_start_y
 
         if self.dragging_item:
-            # 아이템 이동
+            # 아이템 이동 - 마우스 위치를 도면 이미지 내 비율로 변환 (도면 밖에도 배치 가능)
             item_type = self.dragging_item["type"]
             item_index = self.dragging_item["index"]
 
-            # 캔버스 좌표를 이미지 좌표로 변환
-            canvas_width = max(self.canvas.winfo_width(), 100)
-            canvas_height = max(self.canvas.winfo_height(), 100)
-            img_width = int(self.blueprint_image.width * self.zoom_level)
-            img_height = int(self.blueprint_image.height * self.zoom_level)
-
-            # 오버레이 크기 (3배)
-            overlay_width = img_width * 3
-            overlay_height = img_height * 3
-
-            # 오버레이의 좌상단 위치
-            overlay_left = canvas_width // 2 + self.pan_x - overlay_width // 2
-            overlay_top = canvas_height // 2 + self.pan_y - overlay_height // 2
-
-            # 도면 이미지의 좌상단 위치 (오버레이 내에서)
-            img_left = overlay_left + img_width
-            img_top = overlay_top + img_height
-
-            # 마우스 위치를 도면 이미지 내 비율로 변환
-            rel_x = (event.x - img_left) / img_width
-            rel_y = (event.y - img_top) / img_height
-
-            # 범위 제한 제거 - 도면 밖에도 배치 가능
-            # rel_x = max(0, min(1, rel_x))
-            # rel_y = max(0, min(1, rel_y))
+            geometry = self._image_geometry()
+            left, top, img_width, img_height = geometry
+            rel_x = (event.x - left) / img_width
+            rel_y = (event.y - top) / img_height
 
             if item_type == "sensor":
                 self.sensors[item_index]["x"] = rel_x
                 self.sensors[item_index]["y"] = rel_y
+                self._layout_sensor(item_index, geometry)
             elif item_type == "monitor":
                 self.monitors[item_index]["x"] = rel_x
                 self.monitors[item_index]["y"] = rel_y
+                self._layout_monitor(item_index, geometry)
             elif item_type == "individual_item":
                 # 개별 센서 아이템 이동
                 sub_index = self.dragging_item.get("sub_index", 0)
@@ -814,49 +864,34 @@ class PanelBlueprintView(tk.Frame):
                 if "individual_items" in sensor and sub_index < len(sensor["individual_items"]):
                     sensor["individual_items"][sub_index]["x"] = rel_x
                     sensor["individual_items"][sub_index]["y"] = rel_y
+                    self._layout_sensor(item_index, geometry)
 
-            self._redraw_canvas()
-            self._save_blueprint_data()  # 자동 저장
+            self._drag_moved = True
         else:
             # 캔버스 팬
-            self.pan_x += dx
-            self.pan_y += dy
-            self._redraw_canvas()
+            self._pan(dx, dy)
 
         self.drag_start_x = event.x
         self.drag_start_y = event.y
 
     def _on_canvas_release(self, event):
         """캔버스 릴리즈"""
+        if self.dragging_item and self._drag_moved:
+            self._save_blueprint_data()  # 드래그가 끝났을 때 한 번만 저장
         self.drag_start_x = None
         self.drag_start_y = None
         self.dragging_item = None
+        self._drag_moved = False
 
     def _get_item_at_pos(self, canvas_x, canvas_y):
         """클릭 위치의 아이템 반환"""
         if not self.blueprint_image:
             return None
 
-        canvas_width = max(self.canvas.winfo_width(), 100)
-        canvas_height = max(self.canvas.winfo_height(), 100)
-        img_width = int(self.blueprint_image.width * self.zoom_level)
-        img_height = int(self.blueprint_image.height * self.zoom_level)
-
-        # 오버레이 크기 (3배)
-        overlay_width = img_width * 3
-        overlay_height = img_height * 3
-
-        # 오버레이의 좌상단 위치 (캔버스 중앙에 오버레이 중심 배치)
-        overlay_left = canvas_width // 2 + self.pan_x - overlay_width // 2
-        overlay_top = canvas_height // 2 + self.pan_y - overlay_height // 2
-
-        # 도면 이미지의 좌상단 위치 (오버레이 내에서)
-        img_left = overlay_left + img_width  # 오프셋
-        img_top = overlay_top + img_height   # 오프셋
-
         # 마우스 위치를 도면 이미지 내 비율로 변환
-        rel_x = (canvas_x - img_left) / img_width
-        rel_y = (canvas_y - img_top) / img_height
+        left, top, img_width, img_height = self._image_geometry()
+        rel_x = (canvas_x - left) / img_width
+        rel_y = (canvas_y - top) / img_height
 
         # 개별 센서 아이템 체크 (우선순위 높음)
         for i, sensor in enumerate(self.sensors):
@@ -1285,23 +1320,24 @@ class PanelBlueprintView(tk.Frame):
             "sensor_values": sensor_values
         }
 
-        # 도면 뷰가 활성화 상태면 즉시 갱신
-        if self.winfo_viewable():
-            self._redraw_canvas()
+        # 도면 뷰가 활성화 상태면 경보 계층만 갱신
+        if self.winfo_viewable() and self._base_item is not None:
+            self._draw_fire_layer(self._image_geometry())
 
-    def _draw_fire_alert_overlay(self, draw, img_width, img_height, offset_x, offset_y):
-        """화재 경보 오버레이 그리기"""
+    def _draw_fire_layer(self, geometry):
+        """화재 경보 계층 (도면 상단 배너) 다시 그리기"""
+        self.canvas.delete("fire")
         level = self._fire_alert_data.get("level", 1)
 
         # 레벨 3 (주의) 이상일 때만 표시
         if level < 3:
             return
 
-        # 경보 레벨별 색상
+        # 경보 레벨별 색상 (반투명은 점묘로 표현)
         alert_colors = {
-            3: (230, 126, 34, 150),   # 주의 - 주황 (반투명)
-            4: (231, 76, 60, 180),    # 경계 - 빨강 (반투명)
-            5: (142, 68, 173, 200),   # 위험 - 보라 (반투명)
+            3: "#E67E22",   # 주의 - 주황
+            4: "#E74C3C",   # 경계 - 빨강
+            5: "#8E44AD",   # 위험 - 보라
         }
 
         alert_names = {
@@ -1310,43 +1346,21 @@ class PanelBlueprintView(tk.Frame):
             5: "화재 위험",
         }
 
-        color = alert_colors.get(level, (231, 76, 60, 180))
+        color = alert_colors.get(level, "#E74C3C")
         name = alert_names.get(level, "화재 경보")
 
         # 상단에 경보 배너 표시
+        left, top, img_width, _img_height = geometry
         banner_height = 60
-        draw.rectangle(
-            [offset_x, offset_y, offset_x + img_width, offset_y + banner_height],
-            fill=color
-        )
+        self.canvas.create_rectangle(left, top, left + img_width, top + banner_height,
+                                     fill=color, outline="", stipple="gray75", tags=("fire",))
 
         # 경보 텍스트
         probability = self._fire_alert_data.get("probability", 0.0)
         text = f"🔥 {name} - 화재 확률: {probability * 100:.1f}%"
-
-        # 폰트 로드
-        font = None
-        font_paths = [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "C:/Windows/Fonts/malgun.ttf",
-        ]
-        for font_path in font_paths:
-            if os.path.exists(font_path):
-                try:
-                    from PIL import ImageFont
-                    font = ImageFont.truetype(font_path, 24)
-                    break
-                except:
-                    continue
-
-        if font:
-            draw.text(
-                (offset_x + img_width // 2, offset_y + banner_height // 2),
-                text,
-                fill=(255, 255, 255, 255),
-                font=font,
-                anchor="mm"
-            )
+        self.canvas.create_text(left + img_width // 2, top + banner_height // 2, text=text,
+                                fill="#FFFFFF", font=("Pretendard", -24, "bold"), tags=("fire",))
+        self.canvas.tag_raise("fire")
 
     def get_fire_alert_sensors(self) -> list:
         """화재 경보 발생 센서 목록 반환"""
@@ -7,6 +7,7 @@
 
 import tkinter as tk
 from ..utils.helpers import find_asset, now_local, get_base_dir
+from ..utils.weather_service import get_weather_service
 from ..utils.comfort import heat_index_c, discomfort_index
 
 # 외부 라이브러리 (선택)
@@ -38,6 +39,8 @@ class PanelHeader(tk.Frame):
 
         # 날씨 정보
         self._weather_info = None
+        # 공용 날씨 서비스 구독 (시계 갱신 때 새 값만 확인)
+        self._weather_sub = get_weather_service(app.cfg).subscribe(name="header")
 
         # after 콜백 ID 저장 (종료 시 취소용)
         self._tick_clock_after_id = None
@@ -255,6 +258,7 @@ class PanelHeader(tk.Frame):
         try:
             if self.winfo_exists():
                 self.clock_label.configure(text=now_local().strftime("%Y-%m-%d %H:%M:%S"))
+                self._poll_weather()
                 self._tick_clock_after_id = self.after(500, self._tick_clock)
         except Exception:
             pass
@@ -290,6 +294,19 @@ class PanelHeader(tk.Frame):
 
         self.fire_label.configure(text=f"🔥{probability:.0f}% {level}", fg=color)
 
+    def _poll_weather(self):
+        """날씨 서비스에 새 값이 있으면 표시 (네트워크 요청 없음)"""
+        data = self._weather_sub.poll()
+        if not data:
+            return
+
+        def num(value):
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+        self.update_weather_info(num(data.get("temp")), data.get("cond", ""), num(data.get("humidity")))
+
     def update_weather_info(self, temp=None, condition=None, humidity=None):
         """날씨 정보 업데이트"""
         if temp is not None:
@@ -340,14 +357,15 @@ class PanelHeader(tk.Frame):
         frame.pack(fill="both", expand=True, padx=16, pady=8)
 
         from tkinter import ttk
-        cols = ("시간", "ID", "센서", "레벨", "값")
+        cols = ("시간", "ID", "센서", "구분", "레벨", "값", "최고값", "지속")
         tree = ttk.Treeview(frame, columns=cols, show='headings')
         for c in cols:
             tree.heading(c, text=c)
-            tree.column(c, width=120, anchor='center')
+            tree.column(c, width=150 if c == "시간" else 75, anchor='center')
         tree.pack(fill="both", expand=True)
 
         level_map = {1: "정상", 2: "관심", 3: "주의", 4: "경계", 5: "심각"}
+        kind_map = {"enter": "발생", "escalate": "상승", "deescalate": "하강", "clear": "해제"}
         # 센서 키 → 한글명 매핑
         sensor_name_map = {
             'o2': '산소(O₂)', 'co2': '이산화탄소(CO₂)', 'co': '일산화탄소(CO)',
@@ -364,7 +382,16 @@ class PanelHeader(tk.Frame):
             sensor = sensor_name_map.get(sensor_key, sensor_key)  # 한글명 변환
             lvl = level_map.get(a.get('level', 1), '--')
             val = a.get('value', '--')
-            tree.insert('', 'end', values=(ts, sid, sensor, lvl, val))
+            # 경보 전이 필드 (DB): kind, peak, duration
+            kind = kind_map.get(a.get('kind'), '--')
+            peak = a.get('peak')
+            peak = '--' if peak is None else peak
+            duration = a.get('duration')
+            if duration is None or a.get('kind') == 'enter':
+                duration = '--'
+            else:
+                duration = f"{int(duration) // 60}분 {int(duration) % 60}초"
+            tree.insert('', 'end', values=(ts, sid, sensor, kind, lvl, val, peak, duration))
 
         tk.Button(dialog, text="닫기", command=dialog.destroy,
                  font=("Pretendard", 12, "bold"), bg="#3498DB", fg="#FFFFFF",
@@ -632,11 +659,12 @@ class PanelHeader(tk.Frame):
             pass
 
     def destroy(self):
-        """위젯 삭제 시 after 콜백 취소"""
+        """위젯 삭제 시 after 콜백 취소 + 날씨 구독 해제"""
         try:
             if self._tick_clock_after_id:
                 self.after_cancel(self._tick_clock_after_id)
                 self._tick_clock_after_id = None
         except Exception:
             pass
+        self._weather_sub.release()
         super().destroy()
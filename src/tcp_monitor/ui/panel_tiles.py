@@ -7,10 +7,7 @@
 import tkinter as tk
 from tkinter import ttk
 from ..utils.helpers import SENSOR_KEYS, COLOR_TILE_OK, COLOR_ALARM, ideal_fg, fmt_ts
-from ..utils.weather_api import WeatherAPI
-import re
-from urllib.request import Request, urlopen
-import ssl
+from ..utils.weather_service import get_weather_service
 
 
 class PanelTiles(ttk.Frame):
@@ -26,8 +23,9 @@ class PanelTiles(ttk.Frame):
         # 전역 스피커 상태에서 초기값 가져오기 (패널 재생성 시 상태 유지)
         self._voice_alert_enabled = getattr(app, 'global_voice_alert_enabled', True)
         
-        # 기상청 API 초기화
-        self._init_weather_api()
+        # 공용 날씨 서비스 구독 (가져오기는 서비스 스레드에서, 여기서는 최신 값만 읽음)
+        self._weather_sub = get_weather_service(app.cfg).subscribe(name="tiles")
+        self._weather_after_id = None
         
         self._build_grid()
 
@@ -199,38 +197,6 @@ class PanelTiles(ttk.Frame):
             tile["current_status"] = None
             tile["bottom_frame"] = None
 
-    def _init_weather_api(self):
-        """기상청 API 초기화"""
-        try:
-            # config에서 날씨 설정 읽기
-            weather_config = self.app.cfg.get_section('WEATHER', {})
-            
-            api_key = weather_config.get('kma_api_key', 'YOUR_API_KEY_HERE')
-            lat = float(weather_config.get('location_lat', 37.9129))
-            lon = float(weather_config.get('location_lon', 127.7863))
-            auto_detect = weather_config.get('auto_detect_location', 'True').lower() == 'true'
-            
-            # API 키가 설정되지 않은 경우 기본값 사용
-            if api_key == 'YOUR_API_KEY_HERE':
-                print("기상청 API 키가 설정되지 않았습니다. 기본 위치를 사용합니다.")
-                self.weather_api = None
-                return
-            
-            # 자동 위치 감지가 활성화된 경우 IP 기반 위치 감지 시도
-            if auto_detect:
-                temp_api = WeatherAPI(api_key, lat, lon)
-                detected_location = temp_api.get_current_location_from_ip()
-                if detected_location:
-                    lat, lon = detected_location
-                    print(f"IP 기반 위치 감지 성공: 위도 {lat}, 경도 {lon}")
-            
-            self.weather_api = WeatherAPI(api_key, lat, lon)
-            print(f"기상청 API 초기화 완료: 위도 {lat}, 경도 {lon}")
-            
-        except Exception as e:
-            print(f"기상청 API 초기화 실패: {e}")
-            self.weather_api = None
-
     def _init_weather_panel(self, tile):
         # 기존 날씨 패널이 있으면 제거
         if self._weather_panel and "frame" in self._weather_panel:
@@ -257,7 +223,7 @@ class PanelTiles(ttk.Frame):
         loc.pack(pady=(1, 0))
 
         # 갱신 정보
-        refresh = tk.Label(wf, text="갱신주기: 15분", bg="#1976D2", fg="#BBDEFB", font=("Pretendard", 10))
+        refresh = tk.Label(wf, text=f"갱신주기: {int(self._weather_sub.service.interval // 60)}분", bg="#1976D2", fg="#BBDEFB", font=("Pretendard", 10))
         refresh.pack(pady=(2, 0))
         updated = tk.Label(wf, text="최종 갱신: -", bg="#1976D2", fg="#BBDEFB", font=("Pretendard", 10))
         updated.pack(pady=(0, 2))
@@ -291,16 +257,20 @@ class PanelTiles(ttk.Frame):
             # 200ms 후 원래 색상으로 복원
             self.after(200, lambda: self._restore_weather_colors(wf, [icon, temp, cond, loc, refresh, updated, src], original_bg))
             
-            # 즉시 날씨 갱신
-            self._update_weather(tile)
+            # 즉시 날씨 갱신 요청 (서비스 스레드에서 가져옴, 결과는 다음 폴링에서 표시)
+            self._weather_sub.refresh()
         
         # 날씨 패널 전체에 클릭 이벤트 바인딩
         wf.bind("<Button-1>", on_weather_click)
         for widget in [icon, temp, cond, loc, refresh, updated, src]:
             widget.bind("<Button-1>", on_weather_click)
 
-        # panel 생성 직후에도 날씨 갱신 시도 (초기 화면에서 비어 보이는 문제 방지)
-        self.after(100, lambda: self._update_weather(tile))
+        # 캐시된 마지막 날씨를 바로 표시하고 폴링 시작
+        latest = self._weather_sub.latest()
+        if latest:
+            self._show_weather(latest)
+        if self._weather_after_id is None:
+            self._weather_after_id = self.after(1000, self._poll_weather)
 
     def _restore_weather_colors(self, frame, widgets, original_bg):
         """날씨 패널 색상 복원"""
@@ -334,209 +304,57 @@ class PanelTiles(ttk.Frame):
         except Exception as e:
             print(f"음성 경보 토글 오류: {e}")
 
-    def _get_weather_data(self):
-        """기상청 API에서 날씨 데이터 조회"""
-        if not self.weather_api:
-            return None
-            
-        try:
-            # 현재 날씨 조회
-            current_weather = self.weather_api.get_current_weather()
-            if not current_weather:
-                return None
-                
-            # 예보 조회 (선택사항)
-            forecast = self.weather_api.get_weather_forecast()
-            
-            # 데이터 포맷팅
-            weather_data = {
-                "temp": str(int(current_weather.get("temperature", 0))) if current_weather.get("temperature") else "--",
-                "cond": current_weather.get("sky_condition", "정보없음"),
-                "loc": self.weather_api.get_location_name(),
-                "humidity": str(int(current_weather.get("humidity", 0))) if current_weather.get("humidity") else "--",
-                "precipitation": current_weather.get("precipitation", "없음"),
-                "wind_speed": str(current_weather.get("wind_speed", 0)) if current_weather.get("wind_speed") else "--"
-            }
-            
-            return weather_data
-            
-        except Exception as e:
-            print(f"날씨 데이터 조회 실패: {e}")
-            return None
-
-    # ===== MSN 날씨 폴백 =====
-    def _pick_icon(self, condition_text):
-        txt = condition_text or ""
-        if re.search(r"(맑음|화창)", txt):
-            return "☀️"
-        if re.search(r"(구름|흐림)", txt):
-            return "⛅"
-        if re.search(r"(비|소나기)", txt):
-            return "🌧️"
-        if re.search(r"(눈|우박)", txt):
-            return "🌨️"
-        if re.search(r"(안개|미세|연무)", txt):
-            return "🌫️"
-        return "ℹ️"
-
-    def _get_current_location_from_ip(self):
-        """외부 IP를 통해 현재 위치 감지 (도시, 지역 반환)"""
+    def _poll_weather(self):
+        """날씨 서비스의 새 값 확인 (1초마다, 네트워크 요청 없음)"""
+        self._weather_after_id = None
         try:
-            import requests
-            
-            # IP 기반 위치 서비스들
-            services = [
-                "http://ip-api.com/json/?lang=ko",
-                "https://ipapi.co/json/",
-                "http://ipinfo.io/json"
-            ]
-            
-            for service in services:
-                try:
-                    response = requests.get(service, timeout=5)
-                    if response.status_code == 200:
-                        data = response.json()
-                        
-                        # 서비스별 데이터 파싱
-                        if "ip-api.com" in service:
-                            city = data.get("city", "")
-                            region = data.get("regionName", "")
-                            country = data.get("country", "")
-                        elif "ipapi.co" in service:
-                            city = data.get("city", "")
-                            region = data.get("region", "")
-                            country = data.get("country_name", "")
-                        elif "ipinfo.io" in service:
-                            city = data.get("city", "")
-                            region = data.get("region", "")
-                            country = data.get("country", "")
-                        
-                        # 한국인 경우에만 반환
-                        if country and ("Korea" in country or "한국" in country or country == "KR"):
-                            return (city, region)
-                            
-                except Exception as e:
-                    print(f"위치 서비스 {service} 실패: {e}")
-                    continue
-                    
+            if not self.winfo_exists():
+                return
+            data = self._weather_sub.poll()
+            if data:
+                self._show_weather(data)
         except Exception as e:
-            print(f"IP 기반 위치 감지 실패: {e}")
-            
-        return None
+            print(f"날씨 표시 실패: {e}")
+        self._weather_after_id = self.after(1000, self._poll_weather)
 
-    def _fetch_msn_weather_html(self):
-        try:
-            # 자동 위치 감지 시도 (IP 기반)
-            location_info = self._get_current_location_from_ip()
-            
-            if location_info:
-                city, region = location_info
-                print(f"IP 기반 위치 감지: {region}, {city}")
-                # MSN 날씨 URL 생성 (위치 기반)
-                msn_url = f"https://www.msn.com/ko-kr/weather/forecast/in-{city},{region}"
-            else:
-                # 폴백: 강원특별자치도 춘천시 (고정)
-                print("IP 위치 감지 실패, 춘천시 기본값 사용")
-                msn_url = (
-                    "https://www.msn.com/ko-kr/weather/forecast/in-%EA%B0%95%EC%9B%90%ED%8A%B9%EB%B3%84%EC%9E%90%EC%B9%98%EB%8F%84,%EC%B6%98%EC%B2%9C%EC%8B%9C?loc=eyJsIjoi7LaY7LKc7IucIiwiciI6IuqwleybkO2KueuzhOyekOy5mOuPhCIsImMiOiLrjIDtlZzrr7zqta0iLCJpIjoiS1IiLCJnIjoia28ta3IiLCJ4IjoiMTI3Ljc4NjMiLCJ5IjoiMzcuOTEyOSJ9&weadegreetype=C&ocid=ansmsnweather"
-                )
-            
-            ctx = ssl.create_default_context()
-            req = Request(msn_url, headers={"User-Agent": "Mozilla/5.0"})
-            with urlopen(req, timeout=7, context=ctx) as r:
-                return r.read().decode("utf-8", "ignore")
-        except Exception:
-            return None
-
-    def _parse_weather(self, html_text):
-        if not html_text:
-            return None
-        m_temp = re.search(r"([\-]?\d{1,2})°C", html_text)
-        temp_c = m_temp.group(1) if m_temp else "--"
-        m_cond = re.search(r"(맑음|대체로\s*맑음|흐림|대체로\s*흐림|구름|비|소나기|약한\s*비|눈|약한\s*눈|안개)", html_text)
-        cond = m_cond.group(1) if m_cond else "날씨 정보"
-        m_loc = re.search(r"([가-힣A-Za-z\s,]{2,20}\s*,\s*[가-힣A-Za-z\s]{1,20})\s*\n?\s*현재 날씨", html_text)
-        if not m_loc:
-            m_loc = re.search(r"([가-힣]{2,}(?:특별자치도|광역시|도)?\s*,\s*[가-힣]{2,}시)", html_text)
-        loc = m_loc.group(1) if m_loc else "강원특별자치도, 춘천시"
-        return {"temp": temp_c, "cond": cond, "loc": loc}
-
-    def _update_weather(self, tile):
-        """기상청 API를 사용한 날씨 업데이트"""
-        data = self._get_weather_data()
-        
-        if not data:
-            # 폴백: MSN 스크래핑
-            html = self._fetch_msn_weather_html()
-            msn = self._parse_weather(html) if html else None
-            if msn:
-                data = msn
-            
-        if not data:
-            # 실패 시 표시만 갱신하고 재시도 예약
-            if self._weather_panel and "temp" in self._weather_panel:
-                wp = self._weather_panel
-                wp["temp"].configure(text="--°C")
-                wp["cond"].configure(text="날씨 정보를 불러올 수 없음")
-                wp["icon"].configure(text="ℹ️")
-            self.after(300000, lambda: self._update_weather(tile))  # 5분 후 재시도
+    def _show_weather(self, data):
+        """날씨 패널 표시 갱신"""
+        if not (self._weather_panel and "temp" in self._weather_panel):
+            return
+        wp = self._weather_panel
+        if data.get("temp") in (None, "--") and data.get("stale"):
+            # 값을 한 번도 받지 못한 채 실패
+            wp["temp"].configure(text="--°C")
+            wp["cond"].configure(text="날씨 정보를 불러올 수 없음")
+            wp["icon"].configure(text="ℹ️")
             return
 
-        # 성공 시 업데이트
-        if self._weather_panel and "temp" in self._weather_panel:
-            wp = self._weather_panel
-
-            # 온도 표시
-            # data['temp']는 문자열(폴백) 또는 숫자 문자열(기상청)일 수 있음
-            temp_text = data.get('temp')
-            wp["temp"].configure(text=f"{temp_text}°C")
-
-            # 날씨 상태 표시
-            wp["cond"].configure(text=data.get("cond", "정보없음"))
-
-            # 아이콘 설정
-            if self.weather_api:
-                icon = self.weather_api.get_weather_icon(data.get("cond", ""), data.get("precipitation", "없음"))
-            else:
-                icon = self._pick_icon(data.get("cond", ""))
-            wp["icon"].configure(text=icon)
-
-            # 지역명 표시
-            wp["loc"].configure(text=data.get("loc", "강원특별자치도, 춘천시"))
-
-            # 갱신 시간 표시
-            try:
-                wp["updated"].configure(text=f"최종 갱신: {fmt_ts()}")
-            except Exception:
-                pass
+        # 온도 / 날씨 상태 / 아이콘 / 지역명
+        wp["temp"].configure(text=f"{data.get('temp', '--')}°C")
+        wp["cond"].configure(text=data.get("cond", "정보없음"))
+        wp["icon"].configure(text=data.get("icon", "ℹ️"))
+        wp["loc"].configure(text=data.get("loc", "강원특별자치도, 춘천시"))
 
-        # 헤더의 날씨 정보 업데이트
+        # 갱신 시간 표시 (가져오기 실패 중이면 마지막 성공 시각 + 표시)
         try:
-            if hasattr(self.master, 'header'):
-                temp_val = None
-                humidity_val = None
-                temp_str = data.get('temp', '')
-                if temp_str and temp_str != '--':
-                    try:
-                        temp_val = float(temp_str)
-                    except (ValueError, TypeError):
-                        pass
-                hum_str = data.get('humidity', '')
-                if hum_str and hum_str != '--':
-                    try:
-                        humidity_val = float(hum_str)
-                    except (ValueError, TypeError):
-                        pass
-                condition = data.get("cond", "")
-                # 2.0.1 버전에만 있는 메서드이므로 존재 여부 확인
-                if hasattr(self.master.header, 'update_weather_info'):
-                    self.master.header.update_weather_info(temp_val, condition, humidity_val)
-                print(f"[헤더 날씨] 온도={temp_val}, 상태={condition}, 습도={humidity_val}")
-        except Exception as e:
-            print(f"헤더 날씨 업데이트 실패: {e}")
+            updated = data.get("updated")
+            text = f"최종 갱신: {fmt_ts(updated)}" if updated else "최종 갱신: -"
+            if data.get("stale"):
+                text += " (이전 값)"
+            wp["updated"].configure(text=text)
+        except Exception:
+            pass
 
-        # 다음 갱신 예약 (15분마다)
-        self.after(900000, lambda: self._update_weather(tile))
+    def destroy(self):
+        """위젯 삭제 시 날씨 폴링 취소 + 구독 해제"""
+        try:
+            if self._weather_after_id:
+                self.after_cancel(self._weather_after_id)
+                self._weather_after_id = None
+        except Exception:
+            pass
+        self._weather_sub.release()
+        super().destroy()
 
     def _get_sensor_thresholds(self, key):
         """센서별 5단계 경보 기준값 반환"""
@@ -9,6 +9,7 @@ from tkinter import ttk, messagebox
 import threading
 
 from ..utils.helpers import get_system_specs_summary
+from ..sensor.stage_budget import configure_stage_budgets, get_stage_budgets
 
 
 class PerformanceSettingsDialog:
@@ -30,7 +31,7 @@ class PerformanceSettingsDialog:
         self.dialog.update_idletasks()
         screen_w = self.dialog.winfo_screenwidth()
         screen_h = self.dialog.winfo_screenheight()
-        base_w, base_h = 820, 940  # 높이 15% 추가 확장 (820 -> 940)
+        base_w, base_h = 820, 1060  # AI 실행 계획 영역 추가 (940 -> 1060)
         max_h = max(700, screen_h - 100)
         dlg_h = min(base_h, max_h)
         self.dialog.geometry(f"{base_w}x{dlg_h}")
@@ -298,6 +299,33 @@ class PerformanceSettingsDialog:
         tk.Label(tol_help, text="💡 IP 카메라에서 Unknown이 자주 뜨면 값을 높이세요 (권장: 0.75~0.85)",
                 font=("Pretendard", 9), bg="#F5F5F5", fg="#1565C0").pack(anchor="w")
 
+        # === AI 실행 계획 (단계별 시간 예산) ===
+        budget_frame = tk.LabelFrame(main_frame, text="AI 실행 계획 (자동 조절)",
+                                     font=("Pretendard", 13, "bold"),
+                                     bg="#F5F5F5", fg="#2C3E50",
+                                     padx=8, pady=4)
+        budget_frame.pack(fill="x", pady=(0, 6))
+
+        budget_top = tk.Frame(budget_frame, bg="#F5F5F5")
+        budget_top.pack(fill="x")
+        self.budget_enabled_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(budget_top, text="단계별 시간 예산 자동 조절 사용",
+                      font=("Pretendard", 10, "bold"), bg="#F5F5F5",
+                      variable=self.budget_enabled_var).pack(side="left")
+        tk.Label(budget_top, text="(느린 단계는 N프레임마다 / 낮은 해상도로 실행, 저장 즉시 적용)",
+                font=("Pretendard", 9), bg="#F5F5F5", fg="#666666").pack(side="left", padx=4)
+
+        # 현재 계획 (1초마다 갱신)
+        self.budget_summary_label = tk.Label(budget_frame, text="",
+                                             font=("Pretendard", 9, "bold"), bg="#F5F5F5", fg="#1565C0",
+                                             anchor="w", justify="left")
+        self.budget_summary_label.pack(fill="x", pady=(2, 0))
+        self.budget_stages_label = tk.Label(budget_frame, text="",
+                                            font=("Pretendard", 9), bg="#F5F5F5", fg="#555555",
+                                            anchor="w", justify="left")
+        self.budget_stages_label.pack(fill="x")
+        self._refresh_budget_schedule()
+
         # === 경고 메시지 === (11->9)
         warn_frame = tk.Frame(main_frame, bg="#FFF3CD", padx=6, pady=4)
         warn_frame.pack(fill="x", pady=(0, 6))
@@ -351,6 +379,10 @@ class PerformanceSettingsDialog:
             face_tolerance = max(0.5, min(0.9, face_tolerance))
             self.face_tolerance_var.set(face_tolerance)
 
+            # 단계별 시간 예산
+            budget_enabled = str(self.config.env.get("ai_budget_enabled", True)).lower() in ("1", "true", "yes", "on")
+            self.budget_enabled_var.set(budget_enabled)
+
         except Exception as e:
             print(f"성능 설정 로드 오류: {e}")
 
@@ -375,6 +407,10 @@ class PerformanceSettingsDialog:
             # 얼굴 인식 임계값 저장
             self.config.env["face_recognition_tolerance"] = self.face_tolerance_var.get()
 
+            # 단계별 시간 예산 (재시작 없이 바로 적용)
+            self.config.env["ai_budget_enabled"] = self.budget_enabled_var.get()
+            configure_stage_budgets(enabled=self.budget_enabled_var.get())
+
             # 설정 파일 저장
             self.config.save()
 
@@ -436,6 +472,42 @@ class PerformanceSettingsDialog:
         except Exception as e:
             print(f"시스템 사양 UI 업데이트 오류: {e}")
 
+    def _refresh_budget_schedule(self):
+        """AI 실행 계획 표시 갱신 (예산별 단계 측정 시간, 실행 주기, 입력 해상도)"""
+        if self.dialog is None:
+            return
+        try:
+            # 예산은 사용하는 쪽(거울보기 패널, 안전장구 감지기)마다 따로, 프레임을 처리한 예산만 표시
+            plans = [b.snapshot() for b in get_stage_budgets()]
+            plans = [plan for plan in plans if plan['frames']]
+            summaries = []
+            rows = []
+            for plan in plans:
+                target = f"목표 {plan['target_fps']:.0f} FPS / 프레임당 {plan['target_latency_ms']:.0f}ms"
+                fps = f"{plan['fps']:.1f} FPS" if plan['fps'] else "-"
+                frame_ms = f"{plan['frame_ms']:.0f}ms" if plan['frame_ms'] is not None else "-"
+                summary = f"{plan['name']}: {target}  |  현재 {fps}, 프레임당 {frame_ms}"
+                if not plan['enabled']:
+                    summary += "  (자동 조절 꺼짐: 측정만)"
+                summaries.append(summary)
+
+                rows.append(f"[{plan['name']}]")
+                for st in plan['stages']:
+                    if not st['active']:
+                        continue  # 이 예산에서 사용하지 않는 단계
+                    every = "매 프레임" if st['interval'] == 1 else f"{st['interval']}프레임마다"
+                    rows.append(f"  • {st['label']}: {st['ms']:.0f}ms, {every}, 해상도 {st['scale'] * 100:.0f}%")
+            if not summaries:
+                summaries.append("AI 인식 실행 전 (측정값 없음)")
+
+            self.budget_summary_label.configure(text="\n".join(summaries))
+            self.budget_stages_label.configure(text="\n".join(rows))
+            self.dialog.after(1000, self._refresh_budget_schedule)
+        except tk.TclError:
+            pass  # 다이얼로그 닫힘
+        except Exception as e:
+            print(f"AI 실행 계획 표시 오류: {e}")
+
     def _apply_recommended_mode(self):
         """추천 모드 적용"""
         try:
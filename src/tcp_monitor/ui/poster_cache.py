@@ -0,0 +1,350 @@
+"""
+안전 교육 포스터 렌더 캐시
+
+포스터 원본(고해상도)을 페이지를 넘길 때마다 LANCZOS로 줄이고 PhotoImage를 새로 만들던
+방식 대신:
+- 표시 크기(캔버스 크기 x 확대 비율)마다 한 번만 줄이고, 결과를 디스크 캐시에 저장
+  (키: 파일 내용 SHA-1 + 표시 크기 → 재실행 후에도 원본을 다시 디코딩하지 않음)
+- JPEG는 draft()로 필요한 크기 근처까지만 디코딩
+- 완성된 PhotoImage를 LRU로 보관 (Tk 스레드 전용)
+- 이전/다음 페이지는 작업 스레드 1개에서 미리 렌더링 → 페이지 넘김은 LRU 조회만
+
+PhotoImage 생성은 Tk 스레드에서만 합니다 (promote_ready()를 after 루프에서 호출).
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.helpers import get_data_dir
+
+try:
+    from PIL import Image, ImageTk
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+    Image = ImageTk = None
+
+Size = Tuple[int, int]
+
+
+def fit_size(src_size: Size, available: Size, zoom: float = 1.0) -> Size:
+    """
+    원본 크기 → 표시 크기
+
+    사용 가능한 영역에 비율을 유지하며 맞춘 뒤 확대 비율을 적용하고,
+    영역을 벗어나지 않도록 다시 제한합니다.
+    """
+    available_width, available_height = max(1, available[0]), max(1, available[1])
+    original_width, original_height = src_size
+    aspect_ratio = original_width / max(1, original_height)
+
+    if available_width / available_height > aspect_ratio:
+        display_height = available_height
+        display_width = int(display_height * aspect_ratio)
+    else:
+        display_width = available_width
+        display_height = int(display_width / aspect_ratio)
+
+    display_width = int(display_width * zoom)
+    display_height = int(display_height * zoom)
+
+    if display_width > available_width:
+        display_width = available_width
+        display_height = int(display_width / aspect_ratio)
+    if display_height > available_height:
+        display_height = available_height
+        display_width = int(display_height * aspect_ratio)
+    return max(1, display_width), max(1, display_height)
+
+
+def file_digest(path: str) -> str:
+    """파일 내용 SHA-1"""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class PosterRenderCache:
+    """포스터 축소 이미지 캐시 (디스크 + 메모리) 및 이웃 페이지 미리 렌더링"""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_photos: int = 8,
+                 max_rendered: int = 8, max_disk_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: 축소 이미지 저장 디렉토리 (None이면 data/poster_cache)
+            max_photos: 메모리에 보관할 PhotoImage 수
+            max_rendered: 메모리에 보관할 축소 PIL 이미지 수 (PhotoImage 변환 대기)
+            max_disk_bytes: 디스크 캐시 최대 크기 (초과 시 오래 안 쓴 파일부터 삭제)
+        """
+        self.cache_dir = cache_dir or get_data_dir(os.path.join("data", "poster_cache"))
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_photos = max_photos
+        self.max_rendered = max_rendered
+        self.max_disk_bytes = max_disk_bytes
+
+        self._lock = threading.Lock()
+        self._sources: List = []                       # 파일 경로 또는 메모리 PIL 이미지
+        self._sizes: Dict[int, Size] = {}              # 페이지 → 원본 크기
+        self._digests: Dict[tuple, str] = {}           # (경로, mtime, 크기) → SHA-1
+        self._rendered: "OrderedDict[tuple, object]" = OrderedDict()
+        self._futures: Dict[tuple, object] = {}
+        self._wanted: List[tuple] = []                 # 미리 렌더링 요청한 (키, 페이지, 크기)
+        self._photos: "OrderedDict[tuple, object]" = OrderedDict()   # Tk 스레드 전용
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.disk_hits = 0
+        self.renders = 0
+        self.photo_hits = 0
+
+    # ------------------------------------------------------------------ 원본
+
+    def set_sources(self, sources: List) -> List:
+        """
+        포스터 목록 지정 (파일 경로 또는 PIL 이미지)
+
+        헤더만 읽어 원본 크기를 확인하고, 열 수 없는 파일은 빼고 반환합니다.
+        """
+        valid, sizes = [], {}
+        for src in sources:
+            if src is None or not PIL_OK:
+                valid.append(src)
+                continue
+            if isinstance(src, str):
+                try:
+                    with Image.open(src) as img:
+                        size = img.size
+                except Exception as e:
+                    print(f"이미지 로드 실패: {src} - {e}")
+                    continue
+            else:
+                size = src.size
+            sizes[len(valid)] = size
+            valid.append(src)
+        with self._lock:
+            self._sources = valid
+            self._sizes = sizes
+            self._wanted = []
+        return valid
+
+    def source_size(self, index: int) -> Optional[Size]:
+        return self._sizes.get(index)
+
+    def display_size(self, index: int, available: Size, zoom: float) -> Optional[Size]:
+        size = self._sizes.get(index)
+        return fit_size(size, available, zoom) if size else None
+
+    def _source_key(self, src):
+        if isinstance(src, str):
+            try:
+                st = os.stat(src)
+            except OSError:
+                return ("file", src, 0, 0)
+            return ("file", os.path.abspath(src), st.st_mtime_ns, st.st_size)
+        return ("mem", id(src))
+
+    def _digest(self, key: tuple) -> str:
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = file_digest(key[1])
+            self._digests[key] = digest
+        return digest
+
+    # ------------------------------------------------------------------ 렌더링 (임의 스레드)
+
+    def render(self, index: int, box: Size):
+        """페이지 1장을 box 안에 맞게 축소한 PIL 이미지 (메모리 → 디스크 → 원본 순)"""
+        src = self._sources[index]
+        skey = self._source_key(src)
+        key = (skey, box)
+        with self._lock:
+            img = self._rendered.get(key)
+            if img is not None:
+                self._rendered.move_to_end(key)
+                return img
+
+        disk_path = None
+        if skey[0] == "file":
+            try:
+                disk_path = os.path.join(self.cache_dir, f"{self._digest(skey)}_{box[0]}x{box[1]}.png")
+            except OSError as e:
+                print(f"[포스터 캐시] 해시 계산 실패: {src} - {e}")
+        img = self._load_disk(disk_path) if disk_path else None
+
+        if img is None:
+            img = self._downscale(src, box)
+            self.renders += 1
+            if disk_path:
+                self._save_disk(img, disk_path)
+        else:
+            self.disk_hits += 1
+
+        with self._lock:
+            self._rendered[key] = img
+            self._rendered.move_to_end(key)
+            while len(self._rendered) > self.max_rendered:
+                self._rendered.popitem(last=False)
+        return img
+
+    @staticmethod
+    def _downscale(src, box: Size):
+        if isinstance(src, str):
+            img = Image.open(src)
+            if img.format == "JPEG":
+                img.draft("RGB", box)   # DCT 단계에서 1/2~1/8로 줄여 디코딩
+            img.load()
+        else:
+            img = src.copy()
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA" if "transparency" in img.info or img.mode in ("LA", "PA") else "RGB")
+        img.thumbnail(box, Image.LANCZOS)
+        return img
+
+    def _load_disk(self, path: str):
+        if not os.path.exists(path):
+            return None
+        try:
+            with Image.open(path) as f:
+                img = f.copy()
+            os.utime(path)   # 디스크 LRU용 사용 시각 갱신
+            return img
+        except Exception as e:
+            print(f"[포스터 캐시] 캐시 파일 손상, 다시 생성: {path} - {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _save_disk(self, img, path: str):
+        tmp = path + ".tmp"
+        try:
+            img.save(tmp, format="PNG", compress_level=1)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"[포스터 캐시] 캐시 저장 실패: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".png"):
+                    st = os.stat(os.path.join(self.cache_dir, name))
+                    entries.append((st.st_mtime, st.st_size, name))
+        except OSError:
+            return
+        total = sum(e[1] for e in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                total -= size
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------ 미리 렌더링
+
+    def prefetch(self, indices, available: Size, zoom: float):
+        """주어진 페이지들을 작업 스레드에서 미리 렌더링 (이미 있거나 진행 중이면 건너뜀)"""
+        jobs = []
+        for index in indices:
+            if not (0 <= index < len(self._sources)) or index not in self._sizes:
+                continue
+            box = self.display_size(index, available, zoom)
+            key = (self._source_key(self._sources[index]), box)
+            jobs.append((key, index, box))
+        with self._lock:
+            self._wanted = jobs
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="poster-prefetch")
+            for key, index, box in jobs:
+                if key in self._photos or key in self._rendered or key in self._futures:
+                    continue
+                future = self._executor.submit(self.render, index, box)
+                self._futures[key] = future
+                future.add_done_callback(lambda f, k=key: self._futures.pop(k, None))
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._futures)
+
+    # ------------------------------------------------------------------ PhotoImage (Tk 스레드)
+
+    def _remember_photo(self, key, photo):
+        self._photos[key] = photo
+        self._photos.move_to_end(key)
+        while len(self._photos) > self.max_photos:
+            self._photos.popitem(last=False)
+
+    def get_photo(self, index: int, box: Size):
+        """표시할 PhotoImage (LRU → 미리 렌더링 결과 → 바로 렌더링)"""
+        key = (self._source_key(self._sources[index]), box)
+        photo = self._photos.get(key)
+        if photo is not None:
+            self._photos.move_to_end(key)
+            self.photo_hits += 1
+            return photo
+        future = self._futures.get(key)
+        try:
+            img = future.result() if future is not None else self.render(index, box)
+        except Exception:
+            img = self.render(index, box)
+        photo = ImageTk.PhotoImage(img)
+        self._remember_photo(key, photo)
+        return photo
+
+    def promote_ready(self, limit: int = 2) -> bool:
+        """
+        미리 렌더링된 이미지를 PhotoImage로 변환 (Tk after 루프에서 호출)
+
+        Returns:
+            아직 남은 작업이 있으면 True (다시 호출 필요)
+        """
+        with self._lock:
+            ready = [(key, self._rendered[key]) for key, _, _ in self._wanted
+                     if key not in self._photos and key in self._rendered]
+            busy = bool(self._futures)
+        for key, img in ready[:limit]:
+            self._remember_photo(key, ImageTk.PhotoImage(img))
+        return busy or len(ready) > limit
+
+    def cancel(self):
+        """대기 중인 미리 렌더링 취소 (오버레이 닫을 때). PhotoImage LRU는 다시 열 때를 위해 유지"""
+        with self._lock:
+            self._wanted = []
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict:
+        """진단용"""
+        with self._lock:
+            return {"sources": len(self._sources), "photos": len(self._photos),
+                    "rendered": len(self._rendered), "pending": len(self._futures),
+                    "renders": self.renders, "disk_hits": self.disk_hits, "photo_hits": self.photo_hits}
+
+
+_cache: Optional[PosterRenderCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_poster_cache() -> PosterRenderCache:
+    """프로세스 공용 포스터 렌더 캐시"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PosterRenderCache()
+    return _cache
@@ -12,9 +12,8 @@ import datetime
 # OpenCV 카메라 로딩 최적화를 위한 환경 변수 설정 (cv2 import 전에 설정)
 os.environ["OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS"] = "0"
 
-# 플랫폼별 어댑터 사용
-from ..platform import CameraBackend
 from ..utils.helpers import get_base_dir, get_data_dir
+from .poster_cache import get_poster_cache
 
 # 외부 라이브러리 (선택)
 try:
@@ -44,15 +43,14 @@ class SafetyEducationDialog:
         self.overlay = None
         self.camera = None
         self.camera_label = None
-        self.poster_images = []  # PIL Image 객체 리스트
-        self.poster_tk_images = []  # PhotoImage 객체 리스트 (참조 유지용)
+        self.poster_images = []  # 포스터 파일 경로 (더미는 PIL Image) 리스트
+        self._poster_cache = get_poster_cache()  # 축소 이미지/PhotoImage 캐시 (프로세스 공용)
+        self._poster_prefetch_job = None  # 미리 렌더링 결과 변환 after ID
         self.current_page = 0
         self.viewed_pages = set()  # 본 페이지 추적
         self.confirm_btn = None
         self.camera_running = False
 
-        # 플랫폼별 카메라 백엔드 초기화
-        self.camera_backend = CameraBackend()
         self.zoom_factor = 1.2  # 확대 비율 (1.2 = 20% 확대)
         self.safety_detector = None  # 얼굴 인식 감지기
 
@@ -317,14 +315,9 @@ class SafetyEducationDialog:
             self._create_dummy_posters()
             return
 
-        # PIL로 이미지 로드
+        # 헤더만 확인 (디코딩/축소는 표시 크기가 정해진 뒤 포스터 캐시에서)
         if PIL_OK:
-            for img_path in image_files:
-                try:
-                    img = Image.open(img_path)
-                    self.poster_images.append(img)
-                except Exception as e:
-                    print(f"이미지 로드 실패: {img_path} - {e}")
+            self.poster_images = self._poster_cache.set_sources(image_files)
         else:
             print("PIL(Pillow) 라이브러리가 설치되지 않았습니다.")
             self._create_dummy_posters()
@@ -342,6 +335,7 @@ class SafetyEducationDialog:
         else:
             # PIL 없으면 None으로 표시 (텍스트로 대체)
             self.poster_images = [None, None, None]
+        self.poster_images = self._poster_cache.set_sources(self.poster_images)
 
     def _update_poster_display(self):
         """포스터 표시 업데이트"""
@@ -397,39 +391,13 @@ class SafetyEducationDialog:
             available_width = canvas_width - 20  # 좌우 여백 10px씩
             available_height = canvas_height - 20  # 상하 여백 10px씩
 
-            # 원본 이미지 비율 계산
-            original_width, original_height = current_img.size
-            aspect_ratio = original_width / original_height
+            # 표시 크기 (비율 유지, 확대 비율 적용, 화면을 벗어나지 않게)
+            available = (available_width, available_height)
+            display_width, display_height = self._poster_cache.display_size(
+                self.current_page, available, self.zoom_factor)
 
-            # 사용 가능한 공간에 맞춰 최대 크기 계산 (화면에 꽉 차게)
-            if available_width / available_height > aspect_ratio:
-                # 높이 기준으로 맞춤
-                display_height = available_height
-                display_width = int(display_height * aspect_ratio)
-            else:
-                # 너비 기준으로 맞춤
-                display_width = available_width
-                display_height = int(display_width / aspect_ratio)
-
-            # 확대 비율 적용
-            display_width = int(display_width * self.zoom_factor)
-            display_height = int(display_height * self.zoom_factor)
-
-            # 화면 크기를 벗어나지 않도록 최종 제한
-            if display_width > available_width:
-                display_width = available_width
-                display_height = int(display_width / aspect_ratio)
-            if display_height > available_height:
-                display_height = available_height
-                display_width = int(display_height * aspect_ratio)
-
-            # 비율 유지하면서 리사이즈
-            img_copy = current_img.copy()
-            img_copy.thumbnail((display_width, display_height), Image.LANCZOS)
-
-            # PhotoImage로 변환
-            photo = ImageTk.PhotoImage(img_copy)
-            self.poster_tk_images.append(photo)  # 참조 유지
+            # 캐시된 PhotoImage (없으면 이 페이지만 바로 축소)
+            photo = self._poster_cache.get_photo(self.current_page, (display_width, display_height))
 
             # 라벨 크기 조정 및 이미지 설정
             self.poster_label.configure(image=photo, text="", width=display_width, height=display_height)
@@ -438,9 +406,30 @@ class SafetyEducationDialog:
             # 이미지는 항상 캔버스 중앙에 고정
             self.poster_canvas.coords(self.poster_window, canvas_width // 2, canvas_height // 2)
 
+            # 이전/다음 페이지 미리 렌더링 (다음 넘김 방향 먼저)
+            self._poster_cache.prefetch((self.current_page + 1, self.current_page - 1),
+                                        available, self.zoom_factor)
+            self._schedule_poster_prefetch()
+
         # 모든 페이지를 확인했는지 체크
         self._check_all_viewed()
 
+    def _schedule_poster_prefetch(self):
+        """미리 렌더링된 포스터를 PhotoImage로 변환하는 after 루프 시작"""
+        if self._poster_prefetch_job is None and self.overlay:
+            self._poster_prefetch_job = self.overlay.after(30, self._poll_poster_prefetch)
+
+    def _poll_poster_prefetch(self):
+        """미리 렌더링 결과 변환 (Tk 스레드), 남은 작업이 있으면 계속"""
+        self._poster_prefetch_job = None
+        if not self.overlay:
+            return
+        try:
+            if self._poster_cache.promote_ready():
+                self._schedule_poster_prefetch()
+        except Exception as e:
+            print(f"[안전교육] 포스터 미리 렌더링 오류: {e}")
+
     def _prev_page(self):
         """이전 페이지"""
         if self.current_page > 0:
@@ -519,6 +508,27 @@ class SafetyEducationDialog:
                 activebackground="#229954"
             )
 
+    def _subscribe_camera(self):
+        """
+        카메라 구독 (640x480 프리뷰, MJPEG)
+
+        Returns:
+            CameraSubscription 또는 None (사용 가능한 카메라 없음)
+        """
+        from ..camera import get_camera_service
+        preferred = None
+        try:
+            preferred = int(self.config.camera.get("device_index", 0)) if self.config is not None else None
+        except Exception:
+            pass
+        camera = get_camera_service().subscribe_first_available(
+            preferred, width=640, height=480, fps=30, name="safety_education")
+        if not camera.isOpened():
+            return None
+        # MJPEG 코덱 사용 (성능 향상, 장치를 처음 여는 경우에만 의미 있음)
+        camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        return camera
+
     def _start_camera(self):
         """카메라 시작"""
         print("안전교육: 카메라 시작 시도...")
@@ -533,25 +543,9 @@ class SafetyEducationDialog:
             return
 
         try:
-            # 사용 가능한 카메라 찾기
-            print("안전교육: 사용 가능한 카메라 검색 중...")
-            camera_index = None
-            for i in range(5):  # 0~4까지 카메라 인덱스 확인
-                try:
-                    # 플랫폼별 백엔드로 우선 시도
-                    backend = self.camera_backend.get_backend()
-                    test_camera = cv2.VideoCapture(i, backend)
-                    if test_camera.isOpened():
-                        ret, frame = test_camera.read()
-                        if ret and frame is not None:
-                            camera_index = i
-                            test_camera.release()
-                            break
-                        test_camera.release()
-                except:
-                    continue
-            
-            if camera_index is None:
+            # 공용 카메라 서비스에서 구독 (거울보기 등 다른 화면이 연 장치는 재초기화 없이 공유)
+            self.camera = self._subscribe_camera()
+            if self.camera is None:
                 print("안전교육: 사용 가능한 카메라 없음")
                 self.camera_label.configure(
                     text="카메라 사용 불가\n\n카메라가 연결되지 않았거나\n다른 프로그램에서 사용 중입니다.\n\n카메라를 확인하고\n다시 시도해주세요.",
@@ -559,34 +553,7 @@ class SafetyEducationDialog:
                 )
                 return
 
-            print(f"안전교육: 카메라 {camera_index} 발견")
-
-            # 플랫폼별 백엔드로 열기
-            primary_backend = self.camera_backend.get_backend()
-            self.camera = cv2.VideoCapture(camera_index, primary_backend)
-
-            if not self.camera.isOpened():
-                # 1차 실패 시 대체 백엔드로 재시도
-                fallback_backend = self.camera_backend.get_fallback_backend()
-                self.camera = cv2.VideoCapture(camera_index, fallback_backend)
-                if not self.camera.isOpened():
-                    # 최종 재시도: 기본 백엔드
-                    self.camera = cv2.VideoCapture(camera_index)
-                if not self.camera.isOpened():
-                    self.camera_label.configure(
-                        text="카메라 사용 불가\n\n카메라가 연결되지 않았거나\n다른 프로그램에서 사용 중입니다.\n\n카메라를 확인하고\n다시 시도해주세요.",
-                        fg="#FF6B6B", font=("Pretendard", 14, "bold")
-                    )
-                    return
-
-            # 카메라 설정 최적화 (순서 중요)
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-            self.camera.set(cv2.CAP_PROP_FPS, 30)
-            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # 버퍼 크기를 1로 설정하여 최신 프레임 유지
-
-            # MJPEG 코덱 사용 (성능 향상)
-            self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            print(f"안전교육: 카메라 {self.camera.key} 사용")
 
             # PPE 감지기 초기화 (YOLOv10 기반) - 거울보기와 동일하게
             try:
@@ -1725,6 +1692,15 @@ class SafetyEducationDialog:
             self._save_thread.join(timeout=10)
             self._save_thread = None
 
+        # 포스터 미리 렌더링 중지
+        if self._poster_prefetch_job is not None and self.overlay:
+            try:
+                self.overlay.after_cancel(self._poster_prefetch_job)
+            except Exception:
+                pass
+        self._poster_prefetch_job = None
+        self._poster_cache.cancel()
+
         # 카메라 정지
         self.camera_running = False
         if self.camera is not None:
@@ -1860,27 +1836,9 @@ class SafetyEducationDialog:
             # 카메라가 닫혀있으면 다시 열기
             if self.camera is None or not self.camera.isOpened():
                 print("[안전교육] 카메라가 닫혀있음 - 다시 열기 시도")
-                import cv2
-                # 카메라 다시 열기
-                camera_index = 0
-                for i in range(3):
-                    try:
-                        test_camera = cv2.VideoCapture(i)
-                        if test_camera.isOpened():
-                            ret, frame = test_camera.read()
-                            if ret and frame is not None:
-                                camera_index = i
-                                test_camera.release()
-                                break
-                            test_camera.release()
-                    except:
-                        continue
-
-                self.camera = cv2.VideoCapture(camera_index)
-                if self.camera.isOpened():
-                    self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                    self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                    print(f"[안전교육] 카메라 {camera_index} 다시 열기 성공")
+                self.camera = self._subscribe_camera()
+                if self.camera is not None:
+                    print(f"[안전교육] 카메라 {self.camera.key} 다시 열기 성공")
                 else:
                     print("[안전교육] 카메라 다시 열기 실패")
                     return
@@ -205,12 +205,13 @@ class SafetySignatureDialog:
             print(f"서명 화면: PPE 설정 로드 오류 (기본값 사용): {e}")
 
     def _put_korean_text_on_frame(self, frame, text, position, color, font_size=24):
-        """OpenCV 프레임에 한글 텍스트를 PIL로 그리기"""
+        """OpenCV 프레임에 한글 텍스트 그리기 (스프라이트 캐시, 프레임을 직접 수정)"""
         try:
             if not PIL_OK:
                 return frame
 
             from PIL import ImageFont
+            from ..utils.text_sprite import get_text_sprite_cache
 
             # 한글 폰트 로드 (캐시 사용)
             if not self._korean_font_loaded:
@@ -231,28 +232,9 @@ class SafetySignatureDialog:
                 if self._korean_font is None:
                     self._korean_font = ImageFont.load_default()
 
-            # BGR → RGB 변환
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            pil_img = Image.fromarray(frame_rgb)
-            draw = ImageDraw.Draw(pil_img)
-
-            # 배경 박스 그리기 (가독성 향상)
-            x, y = position
-            try:
-                bbox = draw.textbbox((x, y), text, font=self._korean_font)
-                padding = 5
-                draw.rectangle(
-                    [bbox[0] - padding, bbox[1] - padding, bbox[2] + padding, bbox[3] + padding],
-                    fill=(0, 0, 0)
-                )
-            except:
-                pass
-
-            # 텍스트 그리기 (RGB 색상)
-            draw.text(position, text, font=self._korean_font, fill=(color[2], color[1], color[0]))
-
-            # RGB → BGR 변환
-            return cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+            # 검은 배경 박스(여백 5px) + 텍스트를 스프라이트로 캐시하여 라벨 영역만 블렌딩
+            return get_text_sprite_cache().draw(frame, text, position, self._korean_font, color,
+                                                background=(0, 0, 0), padding=5)
         except Exception as e:
             print(f"서명 화면: 한글 텍스트 표시 오류: {e}")
             return frame
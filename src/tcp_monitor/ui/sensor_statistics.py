@@ -9,7 +9,10 @@ from tkinter import ttk, messagebox, filedialog
 import os
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from ..utils.helpers import get_base_dir
+from ..utils.db_pool import call_when_done, get_db_pool
 
 
 class SensorStatisticsDialog:
@@ -48,6 +51,10 @@ class SensorStatisticsDialog:
         # 결과 데이터
         self.result_data = []
 
+        # 마지막으로 읽은 패널 구간 (검색 → 파일 저장 시 다시 조회하지 않음)
+        self._panel_range = None
+        self.search_btn = None
+
     def show(self):
         """대화상자 표시"""
         self.dialog = tk.Toplevel(self.parent)
@@ -166,10 +173,11 @@ class SensorStatisticsDialog:
         search_btn_frame = ttk.Frame(self.dialog)
         search_btn_frame.pack(fill="x", padx=20, pady=10)
 
-        tk.Button(search_btn_frame, text="검색", command=self._search,
+        self.search_btn = tk.Button(search_btn_frame, text="검색", command=self._search,
                  bg="#3498DB", fg="#FFFFFF", font=("Pretendard", 12, "bold"),
                  relief="raised", bd=3, width=15, height=2,
-                 activebackground="#2980B9", activeforeground="#FFFFFF").pack(side="left", padx=5)
+                 activebackground="#2980B9", activeforeground="#FFFFFF")
+        self.search_btn.pack(side="left", padx=5)
 
         tk.Button(search_btn_frame, text="파일로 저장", command=self._save_to_file,
                  bg="#27AE60", fg="#FFFFFF", font=("Pretendard", 12, "bold"),
@@ -284,45 +292,66 @@ class SensorStatisticsDialog:
             sid = panel_key
             peer = ""
 
-        # 검색 실행
+        # 검색 실행 (DB 작업 스레드, 패널 1개당 쿼리 1번 → 센서 항목별 통계는 메모리에서)
         self.result_data = []
         self.result_tree.delete(*self.result_tree.get_children())
+        self._panel_range = None   # 새 검색은 항상 다시 조회 (오늘 데이터 포함 시)
+        self.search_btn.config(state="disabled", text="검색 중...")
+        self.dialog.config(cursor="watch")
+
+        future = get_db_pool(self.app.logs.db_path).submit(
+            self._compute_stats, sid, peer, selected_sensors, start_date, end_date, interval_minutes)
+        call_when_done(self.dialog, future,
+                       lambda results: self._show_results(results, interval_text, start_date, end_date),
+                       self._on_search_error)
+
+    def _compute_stats(self, sid, peer, sensor_keys, start_date, end_date, interval_minutes):
+        """선택한 센서 항목별 통계 [(센서 키, 통계)] (DB 작업 스레드)"""
+        self._load_panel_range(sid, peer, start_date, end_date)
+        return [(key, self._get_sensor_stats(sid, peer, key, start_date, end_date, interval_minutes))
+                for key in sensor_keys]
+
+    def _end_search(self):
+        self.search_btn.config(state="normal", text="검색")
+        self.dialog.config(cursor="")
+
+    def _on_search_error(self, e):
+        self._end_search()
+        messagebox.showerror("오류", f"검색 중 오류가 발생했습니다:\n{e}", parent=self.dialog)
+
+    def _show_results(self, results, interval_text, start_date, end_date):
+        """검색 결과 표시 (Tk 스레드)"""
+        self._end_search()
+        for sensor_key, stats in results:
+            if stats:
+                sensor_name = self.sensor_names.get(sensor_key, sensor_key)
+                row_data = {
+                    "sensor_key": sensor_key,
+                    "sensor_name": sensor_name,
+                    "interval": interval_text,
+                    "min": stats["min"],
+                    "max": stats["max"],
+                    "avg": stats["avg"],
+                    "count": stats["count"],
+                    "start": start_date.strftime("%Y-%m-%d"),
+                    "end": end_date.strftime("%Y-%m-%d")
+                }
+                self.result_data.append(row_data)
+
+                # 트리뷰에 추가
+                self.result_tree.insert("", "end", values=(
+                    sensor_name,
+                    interval_text,
+                    f"{stats['min']:.2f}" if stats['min'] is not None else "-",
+                    f"{stats['max']:.2f}" if stats['max'] is not None else "-",
+                    f"{stats['avg']:.2f}" if stats['avg'] is not None else "-",
+                    stats['count'],
+                    start_date.strftime("%Y-%m-%d"),
+                    end_date.strftime("%Y-%m-%d")
+                ))
 
-        try:
-            for sensor_key in selected_sensors:
-                stats = self._get_sensor_stats(sid, peer, sensor_key, start_date, end_date, interval_minutes)
-                if stats:
-                    sensor_name = self.sensor_names.get(sensor_key, sensor_key)
-                    row_data = {
-                        "sensor_key": sensor_key,
-                        "sensor_name": sensor_name,
-                        "interval": interval_text,
-                        "min": stats["min"],
-                        "max": stats["max"],
-                        "avg": stats["avg"],
-                        "count": stats["count"],
-                        "start": start_date.strftime("%Y-%m-%d"),
-                        "end": end_date.strftime("%Y-%m-%d")
-                    }
-                    self.result_data.append(row_data)
-
-                    # 트리뷰에 추가
-                    self.result_tree.insert("", "end", values=(
-                        sensor_name,
-                        interval_text,
-                        f"{stats['min']:.2f}" if stats['min'] is not None else "-",
-                        f"{stats['max']:.2f}" if stats['max'] is not None else "-",
-                        f"{stats['avg']:.2f}" if stats['avg'] is not None else "-",
-                        stats['count'],
-                        start_date.strftime("%Y-%m-%d"),
-                        end_date.strftime("%Y-%m-%d")
-                    ))
-
-            if not self.result_data:
-                messagebox.showinfo("알림", "해당 기간에 데이터가 없습니다.", parent=self.dialog)
-
-        except Exception as e:
-            messagebox.showerror("오류", f"검색 중 오류가 발생했습니다:\n{e}", parent=self.dialog)
+        if not self.result_data:
+            messagebox.showinfo("알림", "해당 기간에 데이터가 없습니다.", parent=self.dialog)
 
     def _get_sensor_stats(self, sid, peer, sensor_key, start_date, end_date, interval_minutes=1):
         """지정 기간의 센서 통계 조회 (간격별 샘플링)
@@ -332,77 +361,19 @@ class SensorStatisticsDialog:
                 - 1분: 모든 데이터 사용
                 - 10분/60분: 해당 간격별 평균값으로 샘플링하여 통계 계산
         """
-        import sqlite3
-        import time
-
         try:
-            # 로그 매니저에서 DB 경로 가져오기
-            db_path = self.app.logs.db_path
-
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            peer_ip = peer.split(":")[0] if peer else ""
-
-            # 날짜를 타임스탬프로 변환
-            start_ts = time.mktime(start_date.timetuple())
-            end_ts = time.mktime((end_date + timedelta(days=1)).timetuple())
-
-            # 유효한 값 필터링 조건
-            if sensor_key == "temperature":
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} BETWEEN -50 AND 50"
-            elif sensor_key == "water":
-                filter_condition = f"AND {sensor_key} IS NOT NULL"
-            else:
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} >= 0"
-
-            # 간격에 따른 쿼리 (간격별 그룹화)
-            interval_seconds = interval_minutes * 60
+            ts, values = self._load_sensor_values(sid, peer, sensor_key, start_date, end_date)
 
             if interval_minutes > 1:
                 # 간격별로 그룹화하여 평균을 구한 후, 전체 통계 계산
-                # (timestamp / interval) 단위로 그룹화
-                query = f"""
-                    SELECT
-                        MIN(avg_val) as min_val,
-                        MAX(avg_val) as max_val,
-                        AVG(avg_val) as avg_val,
-                        COUNT(*) as count_val
-                    FROM (
-                        SELECT
-                            CAST(timestamp / {interval_seconds} AS INTEGER) as time_bucket,
-                            AVG({sensor_key}) as avg_val
-                        FROM sensor_data
-                        WHERE sid = ? AND peer_ip = ?
-                        AND timestamp >= ? AND timestamp < ?
-                        {filter_condition}
-                        GROUP BY time_bucket
-                    )
-                """
-            else:
-                # 1분 간격: 모든 데이터 사용
-                query = f"""
-                    SELECT
-                        MIN({sensor_key}) as min_val,
-                        MAX({sensor_key}) as max_val,
-                        AVG({sensor_key}) as avg_val,
-                        COUNT({sensor_key}) as count_val
-                    FROM sensor_data
-                    WHERE sid = ? AND peer_ip = ?
-                    AND timestamp >= ? AND timestamp < ?
-                    {filter_condition}
-                """
-
-            cursor.execute(query, (sid, peer_ip, start_ts, end_ts))
-            row = cursor.fetchone()
-            conn.close()
-
-            if row and row[3] > 0:
+                _, values = self._bucket_means(ts, values, interval_minutes * 60)
+
+            if len(values) > 0:
                 return {
-                    "min": row[0],
-                    "max": row[1],
-                    "avg": row[2],
-                    "count": row[3]
+                    "min": float(values.min()),
+                    "max": float(values.max()),
+                    "avg": float(values.mean()),
+                    "count": int(len(values))
                 }
 
         except Exception as e:
@@ -410,6 +381,54 @@ class SensorStatisticsDialog:
 
         return None
 
+    def _load_panel_range(self, sid, peer, start_date, end_date):
+        """패널의 기간 내 전체 센서 열 (timestamp 배열, 값 배열 [HISTORY_COLUMNS x 행]) - 쿼리 1번
+
+        보관 청크 + sensor_data를 합쳐 읽고(logging/archive.py), 같은 조건이면 마지막 결과를 재사용합니다.
+        연결은 호출 스레드의 풀 연결이므로 SQL이 매번 같아 준비된 문장을 재사용합니다.
+        """
+        import time
+        from ..logging.archive import read_range
+
+        # 로그 매니저에서 DB 경로 가져오기
+        db_path = self.app.logs.db_path
+        peer_ip = peer.split(":")[0] if peer else ""
+
+        # 날짜를 타임스탬프로 변환
+        start_ts = time.mktime(start_date.timetuple())
+        end_ts = time.mktime((end_date + timedelta(days=1)).timetuple())
+
+        key = (db_path, sid, peer_ip, start_ts, end_ts)
+        cached = self._panel_range
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        columns = read_range(get_db_pool(db_path).connection(), sid, peer_ip, start_ts, end_ts)
+        self._panel_range = (key, columns)
+        return columns
+
+    def _load_sensor_values(self, sid, peer, sensor_key, start_date, end_date):
+        """기간 내 유효한 측정값 (timestamp 배열, 값 배열)"""
+        from ..logging.history import column
+
+        ts, vals = self._load_panel_range(sid, peer, start_date, end_date)
+        values = column(vals, sensor_key)
+
+        # 유효한 값 필터링 조건 (NULL = NaN, -1 = 센서 없음)
+        valid = ~np.isnan(values)
+        if sensor_key == "temperature":
+            valid &= (values != -1) & (values >= -50) & (values <= 50)
+        elif sensor_key != "water":
+            valid &= (values != -1) & (values >= 0)
+        return ts[valid], values[valid]
+
+    @staticmethod
+    def _bucket_means(ts, values, interval_seconds):
+        """간격별 평균 (구간 시작 timestamp 배열, 평균 배열)"""
+        buckets = np.floor(ts / interval_seconds).astype(np.int64)
+        keys, inverse = np.unique(buckets, return_inverse=True)
+        means = np.bincount(inverse, weights=values) / np.bincount(inverse)
+        return keys * interval_seconds, means
+
     def _save_to_file(self):
         """결과를 파일로 저장"""
         if not self.result_data:
@@ -481,57 +500,14 @@ class SensorStatisticsDialog:
 
     def _get_raw_sensor_data(self, sid, peer, sensor_key, start_date, end_date, interval_minutes=1):
         """원시 센서 데이터 조회 (그래프 및 탭별 저장용)"""
-        import sqlite3
-        import time
-
         try:
-            db_path = self.app.logs.db_path
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            peer_ip = peer.split(":")[0] if peer else ""
-            start_ts = time.mktime(start_date.timetuple())
-            end_ts = time.mktime((end_date + timedelta(days=1)).timetuple())
-
-            # 유효한 값 필터링 조건
-            if sensor_key == "temperature":
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} BETWEEN -50 AND 50"
-            elif sensor_key == "water":
-                filter_condition = f"AND {sensor_key} IS NOT NULL"
-            else:
-                filter_condition = f"AND {sensor_key} IS NOT NULL AND {sensor_key} != -1 AND {sensor_key} >= 0"
-
-            interval_seconds = interval_minutes * 60
+            ts, values = self._load_sensor_values(sid, peer, sensor_key, start_date, end_date)
 
             if interval_minutes > 1:
                 # 간격별 평균
-                query = f"""
-                    SELECT
-                        CAST(timestamp / {interval_seconds} AS INTEGER) * {interval_seconds} as time_bucket,
-                        AVG({sensor_key}) as value
-                    FROM sensor_data
-                    WHERE sid = ? AND peer_ip = ?
-                    AND timestamp >= ? AND timestamp < ?
-                    {filter_condition}
-                    GROUP BY CAST(timestamp / {interval_seconds} AS INTEGER)
-                    ORDER BY time_bucket
-                """
-            else:
-                # 원시 데이터
-                query = f"""
-                    SELECT timestamp, {sensor_key}
-                    FROM sensor_data
-                    WHERE sid = ? AND peer_ip = ?
-                    AND timestamp >= ? AND timestamp < ?
-                    {filter_condition}
-                    ORDER BY timestamp
-                """
-
-            cursor.execute(query, (sid, peer_ip, start_ts, end_ts))
-            rows = cursor.fetchall()
-            conn.close()
-
-            return rows
+                ts, values = self._bucket_means(ts, values, interval_minutes * 60)
+
+            return list(zip(ts.tolist(), values.tolist()))
 
         except Exception as e:
             print(f"원시 데이터 조회 오류: {e}")
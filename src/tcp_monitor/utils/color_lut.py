@@ -0,0 +1,237 @@
+"""
+HSV → 색상 ID 룩업 테이블 (안전장구 색상 분류용)
+
+기존 색상 분류는 ROI마다 평균 HSV를 구한 뒤 if 문으로 판정하거나
+색상마다 cv2.inRange 마스크를 만들어 픽셀 수를 셌습니다.
+- 평균 Hue는 빨강(0 ↔ 179 경계)에서 틀린 값이 나옴 (예: 2와 178의 평균 90 → 청록)
+- 색상 수만큼 전체 ROI를 반복 스캔
+
+HSVColorLUT는 규칙(상자형 HSV 범위 목록)으로부터 3D 룩업 테이블을 한 번만 만들고,
+ROI의 각 픽셀을 테이블 조회 한 번으로 분류한 뒤 bincount로 색상별 픽셀 수를 셉니다.
+한 프레임의 여러 ROI는 ROI 번호를 오프셋으로 더해 bincount 한 번에 처리합니다.
+
+테이블 축은 규칙 경계값으로 구간 압축하므로 (H 180 × S 256 × V 256 전체 대신
+수십 개 구간) 메모리가 작고, 경계 포함 여부는 cv2.inRange와 정확히 동일합니다.
+"""
+
+import threading
+
+import cv2
+import numpy as np
+
+
+class HSVColorLUT:
+    """상자형 HSV 규칙 기반 색상 분류 룩업 테이블"""
+
+    AXIS_SIZE = (180, 256, 256)  # OpenCV HSV: H 0-179, S 0-255, V 0-255
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: [(색상명, (h_lo, s_lo, v_lo), (h_hi, s_hi, v_hi)), ...]
+                경계 포함(inclusive). 같은 색상명을 여러 번 쓰면 합집합 (예: 빨강 0-9, 170-179).
+                규칙 순서는 배타 분류(classify)에서 우선순위로 사용 (앞쪽 우선).
+        """
+        self.names = []
+        for name, _, _ in rules:
+            if name not in self.names:
+                self.names.append(name)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+
+        # 축별 구간 경계 → 값(0-255)을 구간 번호로 바꾸는 1D 테이블
+        axis_maps, axis_reps = [], []
+        for axis, size in enumerate(self.AXIS_SIZE):
+            cuts = {0}
+            for _, lo, hi in rules:
+                for c in (int(lo[axis]), int(hi[axis]) + 1):
+                    if 0 <= c < size:
+                        cuts.add(c)
+            cuts = np.array(sorted(cuts), dtype=np.int32)
+            axis_maps.append((np.searchsorted(cuts, np.arange(256), side='right') - 1).astype(np.int32))
+            axis_reps.append(cuts)
+
+        # 구간 대표값에서 규칙 평가 (소속 색상 집합 + 첫 번째 일치 색상)
+        H, S, V = np.meshgrid(*axis_reps, indexing='ij')
+        grid = H.shape
+        member = np.zeros(grid + (n,), dtype=bool)
+        first = np.full(grid, -1, dtype=np.int32)
+        for name, lo, hi in reversed(rules):
+            m = ((H >= lo[0]) & (H <= hi[0]) & (S >= lo[1]) & (S <= hi[1]) &
+                 (V >= lo[2]) & (V <= hi[2]))
+            member[..., self.index[name]] |= m
+            first[m] = self.index[name]
+
+        # (소속 집합, 첫 색상) 조합마다 ID 부여 → 3D 테이블 값
+        keys = np.concatenate([member.reshape(-1, n).astype(np.int32), first.reshape(-1, 1)], axis=1)
+        combos, inverse = np.unique(keys, axis=0, return_inverse=True)
+        dtype = np.uint8 if len(combos) <= 256 else np.uint16
+        self.lut = inverse.reshape(-1).astype(dtype)
+        self.n_combos = len(combos)
+
+        # 조합 → 색상별 포함 여부 (겹치는 범위 카운트용) / 배타 분류 원-핫
+        self.membership = combos[:, :n].astype(np.float64)
+        self.combo_class = combos[:, n].astype(np.int32)
+        self.exclusive = np.zeros((self.n_combos, n), dtype=np.float64)
+        has_class = self.combo_class >= 0
+        self.exclusive[np.nonzero(has_class)[0], self.combo_class[has_class]] = 1.0
+
+        # 평탄화 인덱스 = h_off[h] + s_off[s] + v_off[v]
+        ns, nv = len(axis_reps[1]), len(axis_reps[2])
+        self._h_off = axis_maps[0] * (ns * nv)
+        self._s_off = axis_maps[1] * nv
+        self._v_off = axis_maps[2]
+
+    @classmethod
+    def from_ranges(cls, color_ranges):
+        """ColorAnalyzer 형식 {'색상': {'lower': .., 'upper': ..} 또는 lower1/upper1/lower2/upper2}에서 생성"""
+        rules = []
+        for name, r in color_ranges.items():
+            if 'lower' in r:
+                rules.append((name, tuple(r['lower']), tuple(r['upper'])))
+            i = 1
+            while f'lower{i}' in r:
+                rules.append((name, tuple(r[f'lower{i}']), tuple(r[f'upper{i}'])))
+                i += 1
+        return cls(rules)
+
+    def combo_ids(self, hsv):
+        """HSV 배열 → 픽셀별 조합 ID (1D)"""
+        hsv = hsv.reshape(-1, 3)
+        return self.lut[self._h_off[hsv[:, 0]] + self._s_off[hsv[:, 1]] + self._v_off[hsv[:, 2]]]
+
+    def classify(self, hsv):
+        """HSV 배열 → 픽셀별 배타 색상 ID (1D, 일치 규칙 없으면 -1)"""
+        return self.combo_class[self.combo_ids(hsv)]
+
+    def class_of(self, h, s, v):
+        """단일 HSV 값의 색상명 (일치 규칙 없으면 None)"""
+        hsv = np.array([[int(h), int(s), int(v)]], dtype=np.int32)
+        hsv = np.clip(hsv, 0, [179, 255, 255])
+        cid = int(self.classify(hsv)[0])
+        return self.names[cid] if cid >= 0 else None
+
+    def histograms(self, hsv_list, exclusive=False):
+        """
+        여러 ROI의 색상별 픽셀 수를 bincount 한 번으로 계산
+
+        Args:
+            hsv_list: HSV uint8 ROI 목록
+            exclusive: True면 픽셀당 하나의 색상(규칙 우선순위), False면 겹치는 범위 모두 카운트
+                       (색상별 cv2.inRange 마스크의 countNonZero와 동일)
+
+        Returns:
+            ndarray: (ROI 수, 색상 수) 픽셀 수
+        """
+        n_rois = len(hsv_list)
+        if n_rois == 0:
+            return np.zeros((0, len(self.names)))
+        ids = [self.combo_ids(hsv).astype(np.int64) + i * self.n_combos for i, hsv in enumerate(hsv_list)]
+        counts = np.bincount(np.concatenate(ids), minlength=n_rois * self.n_combos)
+        counts = counts.reshape(n_rois, self.n_combos)
+        return counts @ (self.exclusive if exclusive else self.membership)
+
+    def class_stats(self, bgr_list, hsv_list):
+        """
+        여러 ROI의 배타 색상별 픽셀 수와 BGR 합계
+
+        Returns:
+            (counts, bgr_sums): (ROI 수, 색상 수), (ROI 수, 색상 수, 3)
+        """
+        n = len(self.names)
+        n_rois = len(bgr_list)
+        keys, bgrs = [], []
+        for i, (bgr, hsv) in enumerate(zip(bgr_list, hsv_list)):
+            cls = self.classify(hsv)
+            valid = cls >= 0
+            keys.append(cls[valid].astype(np.int64) + i * n)
+            bgrs.append(bgr.reshape(-1, 3)[valid])
+        if not keys:
+            return np.zeros((0, n)), np.zeros((0, n, 3))
+        keys = np.concatenate(keys)
+        bgrs = np.concatenate(bgrs).astype(np.float64)
+        size = n_rois * n
+        counts = np.bincount(keys, minlength=size).reshape(n_rois, n)
+        sums = np.stack([np.bincount(keys, weights=bgrs[:, c], minlength=size) for c in range(3)], axis=-1)
+        return counts, sums.reshape(n_rois, n, 3)
+
+
+def center_crop(roi, fraction=0.25):
+    """ROI 가장자리(각 변의 fraction)를 제외한 중앙 영역 (비면 원본)"""
+    h, w = roi.shape[:2]
+    my, mx = int(h * fraction), int(w * fraction)
+    center = roi[my:h - my, mx:w - mx]
+    return center if center.size else roi
+
+
+def to_hsv(roi):
+    """BGR(또는 BGRA) ROI → HSV"""
+    if roi.ndim == 3 and roi.shape[2] == 4:
+        roi = roi[:, :, :3]
+    return cv2.cvtColor(np.ascontiguousarray(roi), cv2.COLOR_BGR2HSV)
+
+
+# ============================================================
+# 안전장구 감지기에서 사용하는 색상 규칙
+# ============================================================
+
+# SafetyEquipmentDetector._classify_color 판정 규칙 (앞쪽 규칙 우선)
+PPE_COLOR_RULES = [
+    ('black', (0, 0, 0), (179, 255, 49)),
+    # 무채색: 밝기가 낮을수록 채도 임계값을 높임 (v 50-99: s<50, 100-149: s<40, 150+: s<30)
+    # v<100 & s<60 도 진회색 (어두운 색의 미세한 색조 오탐 방지)
+    ('dark_gray', (0, 0, 50), (179, 59, 99)),
+    ('dark_gray', (0, 0, 100), (179, 39, 100)),
+    ('gray', (0, 0, 101), (179, 39, 149)),
+    ('gray', (0, 0, 150), (179, 29, 200)),
+    ('white', (0, 0, 201), (179, 29, 255)),
+    # 유채색 (Hue 기반)
+    ('red', (0, 0, 0), (9, 255, 255)),
+    ('red', (170, 0, 0), (179, 255, 255)),
+    ('orange', (10, 0, 0), (21, 255, 255)),
+    ('yellow', (22, 0, 0), (34, 255, 255)),
+    ('lime', (35, 0, 0), (44, 255, 255)),
+    ('green', (45, 0, 0), (74, 255, 255)),
+    ('cyan', (75, 0, 0), (94, 255, 255)),
+    ('blue', (95, 0, 0), (124, 255, 255)),
+    ('purple', (125, 0, 0), (144, 255, 255)),
+    ('pink', (145, 0, 0), (169, 255, 255)),
+]
+
+PPE_COLOR_NAMES_KR = {
+    'black': '검정', 'dark_gray': '진회색', 'gray': '회색', 'white': '흰색',
+    'red': '빨강', 'orange': '주황', 'yellow': '노랑', 'lime': '연두', 'green': '초록',
+    'cyan': '청록', 'blue': '파랑', 'purple': '보라', 'pink': '분홍',
+}
+
+# SafetyEquipmentDetector._get_dominant_color 마스크 (범위가 겹치며, 각 범위의 픽셀 수로 비교)
+DOMINANT_COLOR_RULES = [
+    ('red', (0, 80, 80), (10, 255, 255)),
+    ('red', (170, 80, 80), (179, 255, 255)),
+    ('orange', (10, 80, 80), (22, 255, 255)),
+    ('yellow', (22, 80, 80), (35, 255, 255)),
+    ('lime', (35, 80, 80), (55, 255, 255)),
+    ('green', (55, 80, 80), (85, 255, 255)),
+    ('blue', (85, 80, 80), (130, 255, 255)),
+    ('purple', (130, 80, 80), (150, 255, 255)),
+    ('pink', (150, 50, 80), (170, 255, 255)),
+    ('brown', (10, 80, 50), (22, 255, 150)),
+    ('white', (0, 0, 220), (179, 50, 255)),
+    ('gray', (0, 0, 70), (179, 50, 220)),
+    ('black', (0, 0, 0), (179, 50, 70)),
+]
+
+_lut_cache = {}
+_lut_lock = threading.Lock()
+
+
+def get_color_lut(name):
+    """공유 LUT 반환 ('ppe' 또는 'dominant', 최초 호출 시 1회 생성)"""
+    lut = _lut_cache.get(name)
+    if lut is None:
+        with _lut_lock:
+            lut = _lut_cache.get(name)
+            if lut is None:
+                rules = {'ppe': PPE_COLOR_RULES, 'dominant': DOMINANT_COLOR_RULES}[name]
+                lut = _lut_cache[name] = HSVColorLUT(rules)
+    return lut
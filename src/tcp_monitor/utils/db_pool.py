@@ -0,0 +1,184 @@
+"""
+SQLite 연결 풀 (스레드별 연결 재사용 + 작업 스레드 Future)
+
+대화상자와 얼굴 DB가 조회마다 sqlite3.connect()/close()를 하던 방식 대신:
+- 스레드마다 연결 1개를 열어 두고 재사용 (sqlite3 연결은 스레드 간 공유 불가)
+  → 연결별 문장 캐시(cached_statements)에 준비된 SQL이 남아 같은 SQL 문자열은 다시 파싱하지 않음
+    (값은 항상 ? 파라미터로, SQL 문자열은 모듈 상수로 두어야 재사용됨)
+- 연결 설정: WAL, synchronous=NORMAL, mmap_size, cache_size, temp_store=MEMORY, busy_timeout
+- submit(): DB 작업 스레드에서 실행하고 Future 반환 → Tk 스레드는 call_when_done()으로 결과만 받음
+
+쓰기는 transaction() 안에서 (성공 시 commit, 예외 시 rollback).
+끝난 스레드의 연결은 다음 연결을 열 때 정리합니다.
+"""
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class SQLitePool:
+    """DB 파일 1개에 대한 스레드별 연결 + DB 작업 스레드"""
+
+    def __init__(self, db_path: str, mmap_size: int = 64 * 1024 * 1024, cache_kib: int = 8192,
+                 busy_timeout_ms: int = 5000, cached_statements: int = 256, workers: int = 2):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            mmap_size: 메모리 매핑 크기 (바이트, 읽기는 페이지 캐시에서 바로)
+            cache_kib: 연결별 페이지 캐시 크기 (KiB)
+            busy_timeout_ms: 다른 연결이 쓰는 중일 때 대기 시간
+            cached_statements: 연결별 준비된 SQL 문장 캐시 크기
+            workers: submit() 작업 스레드 수
+        """
+        self.db_path = db_path
+        self.mmap_size = mmap_size
+        self.cache_kib = cache_kib
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self.workers = workers
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wal_checked = False
+
+        self.opened = 0
+
+    # ------------------------------------------------------------------ 연결
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000.0,
+                               check_same_thread=False, cached_statements=self.cached_statements)
+        if not self._wal_checked:
+            # journal_mode는 DB 파일에 저장되므로 처음 한 번만
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error:
+                pass   # 읽기 전용 위치 등
+            self._wal_checked = True
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size={-int(self.cache_kib)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        self.opened += 1
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드 전용 연결 (없으면 열기)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = self._open()
+        self._local.conn = conn
+        current = threading.current_thread()
+        with self._lock:
+            self._prune_dead()
+            self._conns[current.ident] = (current, conn)
+        return conn
+
+    def _prune_dead(self):
+        for ident, (thread, conn) in list(self._conns.items()):
+            if not thread.is_alive():
+                del self._conns[ident]
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+
+    # ------------------------------------------------------------------ 조회/쓰기 (호출 스레드 연결)
+
+    def query(self, sql: str, params=()) -> List[tuple]:
+        return self.connection().execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params=()) -> Optional[tuple]:
+        return self.connection().execute(sql, params).fetchone()
+
+    @contextmanager
+    def transaction(self):
+        """쓰기 트랜잭션 (with 블록 안의 연결 사용, 성공 시 commit, 예외 시 rollback)"""
+        conn = self.connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    # ------------------------------------------------------------------ 작업 스레드
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """fn(*args, **kwargs)를 DB 작업 스레드에서 실행 (fn 안의 connection()/query()는 작업 스레드 연결)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix=f"db-{os.path.basename(self.db_path)}")
+            executor = self._executor
+        return executor.submit(fn, *args, **kwargs)
+
+    def close(self):
+        """작업 스레드 종료 + 모든 연결 닫기"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            conns, self._conns = list(self._conns.values()), {}
+        for _, conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def stats(self) -> Dict:
+        """진단용"""
+        with self._lock:
+            return {"path": self.db_path, "connections": len(self._conns), "opened": self.opened}
+
+
+def call_when_done(widget, future: Future, on_done: Callable, on_error: Optional[Callable] = None,
+                   poll_ms: int = 30):
+    """
+    Future 결과를 Tk 스레드에서 받기 (after로 완료 여부 확인, 이벤트 루프를 막지 않음)
+
+    위젯이 먼저 닫히면 결과를 버립니다.
+    """
+    def poll():
+        if not future.done():
+            try:
+                widget.after(poll_ms, poll)
+            except Exception:
+                pass   # 위젯 파괴됨
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            else:
+                print(f"[DB] 작업 실패: {e}")
+            return
+        on_done(result)
+
+    poll()
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_db_pool(db_path: str) -> SQLitePool:
+    """DB 파일별 공용 연결 풀"""
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = _pools[key] = SQLitePool(db_path)
+    return pool
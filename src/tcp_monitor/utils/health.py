@@ -0,0 +1,228 @@
+"""
+와치독 상태 보고 채널 (매니저 → watchdog.py)
+
+하트비트 파일(30초마다 갱신)만으로는 Tk 이벤트 루프가 멈춰도 하트비트 스레드가 살아 있어
+이상을 알 수 없었습니다. 매니저는 Unix 도메인 소켓(SOCK_DGRAM)으로 1초마다
+상태를 보내고, 와치독은 이 값으로 재시작 여부를 판단합니다.
+
+메시지 형식 (데이터그램 1개에 JSON 하나):
+    {"type": "health", "pid": 1234, "seq": 7, "uptime": 12.3,
+     "loop_lag": 0.02,                                  # Tk 이벤트 루프 지연 (초, 연결 전이면 null)
+     "rates": {"ingest": 4.0},                          # 초당 처리 건수
+     "totals": {"ingest": 1234},
+     "tasks": {"ai": {"busy": 0.3, "done": 812, "threads": 1}}}   # 진행 중 작업 경과 시간(초)
+    {"type": "bye", "pid": 1234, "reason": "normal" | "restart"}  # 종료 직전 (정상 종료/재시작 요청)
+
+- loop_lag: after()로 예약한 콜백이 늦은 정도. 루프가 멈춰 있으면 보고 스레드가
+  "예정 시각으로부터 지난 시간"을 보내므로 멈춘 동안 계속 커집니다.
+- tasks: begin()~end() 사이면 busy가 경과 시간, 대기 중이면 0. 추론이 멈추면 busy가 계속 커집니다.
+- 와치독 소켓이 없으면(와치독 미실행) 전송 오류는 무시합니다.
+
+소켓 경로: 환경 변수 GARAME_HEALTH_SOCKET (와치독이 실행한 매니저), 없으면
+$XDG_RUNTIME_DIR(또는 임시 디렉토리)/garame_watchdog.sock
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+HEALTH_SOCKET_ENV = "GARAME_HEALTH_SOCKET"
+
+
+def default_health_socket_path() -> str:
+    """와치독 상태 보고 소켓 경로 (watchdog.py와 같은 규칙)"""
+    path = os.environ.get(HEALTH_SOCKET_ENV)
+    if path:
+        return path
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, "garame_watchdog.sock")
+
+
+class HealthTask:
+    """작업 진행 상태 (스레드 1개 = 인스턴스 1개)"""
+
+    __slots__ = ("name", "busy_since", "done")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.busy_since: Optional[float] = None
+        self.done = 0
+
+    def begin(self):
+        """작업 1건 시작"""
+        self.busy_since = time.monotonic()
+
+    def end(self):
+        """작업 1건 완료 (대기 상태로)"""
+        if self.busy_since is not None:
+            self.busy_since = None
+            self.done += 1
+
+
+class HealthReporter:
+    """매니저 상태를 와치독에 주기적으로 보고"""
+
+    def __init__(self, socket_path: Optional[str] = None, interval: float = 1.0):
+        self.socket_path = socket_path or default_health_socket_path()
+        self.interval = interval
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._started_at = time.monotonic()
+        self._seq = 0
+        self._bye_sent = False
+
+        # Tk 이벤트 루프 지연
+        self._tk_widget = None
+        self._tk_interval = 0.2
+        self._tk_expected: Optional[float] = None
+        self._tk_window_lag = 0.0
+
+        # 처리 건수 / 작업
+        self._totals: Dict[str, int] = {}
+        self._last_totals: Dict[str, int] = {}
+        self._last_report = time.monotonic()
+        self._tasks: List[HealthTask] = []
+
+        self.sent = 0
+        self.send_errors = 0
+
+    # ------------------------------------------------------------------ 계측 (매니저 쪽 호출)
+
+    def attach_tk(self, widget, interval_ms: int = 200):
+        """Tk 이벤트 루프 지연 측정 시작 (Tk 스레드에서 호출)"""
+        self._tk_widget = widget
+        self._tk_interval = interval_ms / 1000.0
+        self._schedule_tk()
+
+    def _schedule_tk(self):
+        self._tk_expected = time.monotonic() + self._tk_interval
+        try:
+            self._tk_widget.after(int(self._tk_interval * 1000), self._tk_tick)
+        except Exception:
+            self._tk_expected = None   # 위젯 파괴됨
+
+    def _tk_tick(self):
+        lag = max(0.0, time.monotonic() - self._tk_expected)
+        if lag > self._tk_window_lag:
+            self._tk_window_lag = lag
+        if not self._stop.is_set():
+            self._schedule_tk()
+
+    def count(self, name: str, n: int = 1):
+        """처리 건수 증가 (예: 수신 데이터 1건)"""
+        self._totals[name] = self._totals.get(name, 0) + n
+
+    def task(self, name: str) -> HealthTask:
+        """진행 상태를 보고할 작업 등록 (스레드마다 하나)"""
+        task = HealthTask(name)
+        with self._lock:
+            self._tasks.append(task)
+        return task
+
+    def remove_task(self, task: HealthTask):
+        with self._lock:
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+    # ------------------------------------------------------------------ 보고
+
+    def snapshot(self) -> Dict:
+        """보고할 상태 1건 (창 구간 최대 지연은 초기화)"""
+        now = time.monotonic()
+        loop_lag = None
+        if self._tk_expected is not None:
+            loop_lag = max(self._tk_window_lag, now - self._tk_expected)
+            self._tk_window_lag = 0.0
+
+        dt = max(1e-6, now - self._last_report)
+        totals = dict(self._totals)
+        rates = {k: round((v - self._last_totals.get(k, 0)) / dt, 3) for k, v in totals.items()}
+        self._last_totals = totals
+        self._last_report = now
+
+        tasks: Dict[str, Dict] = {}
+        with self._lock:
+            task_list = list(self._tasks)
+        for t in task_list:
+            busy_since = t.busy_since
+            busy = now - busy_since if busy_since is not None else 0.0
+            info = tasks.setdefault(t.name, {"busy": 0.0, "done": 0, "threads": 0})
+            info["busy"] = round(max(info["busy"], busy), 3)
+            info["done"] += t.done
+            info["threads"] += 1
+
+        self._seq += 1
+        return {"type": "health", "pid": os.getpid(), "seq": self._seq,
+                "uptime": round(now - self._started_at, 3),
+                "loop_lag": round(loop_lag, 3) if loop_lag is not None else None,
+                "rates": rates, "totals": totals, "tasks": tasks}
+
+    def _send(self, msg: Dict) -> bool:
+        with self._lock:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                self._sock.setblocking(False)
+            sock = self._sock
+        try:
+            sock.sendto(json.dumps(msg).encode("utf-8"), self.socket_path)
+            self.sent += 1
+            return True
+        except OSError:
+            # 와치독 미실행(소켓 없음) 또는 수신 버퍼 가득 참
+            self.send_errors += 1
+            return False
+
+    def report_now(self) -> bool:
+        return self._send(self.snapshot())
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.report_now()
+            except Exception as e:
+                print(f"[Health] 상태 보고 오류: {e}")
+
+    def start(self):
+        """보고 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.report_now()   # 와치독이 바로 PID를 알 수 있도록 시작 즉시 1회
+        self._thread = threading.Thread(target=self._loop, name="health-reporter", daemon=True)
+        self._thread.start()
+
+    def goodbye(self, reason: str = "normal"):
+        """종료 직전 종료 사유 전송 (첫 호출만 유효: 재시작 요청 후 정상 종료 처리가 덮어쓰지 않도록)"""
+        if self._bye_sent:
+            return
+        self._bye_sent = True
+        self._send({"type": "bye", "pid": os.getpid(), "reason": reason})
+
+    def stop(self):
+        self._stop.set()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+_reporter: Optional[HealthReporter] = None
+_reporter_lock = threading.Lock()
+
+
+def get_health_reporter() -> HealthReporter:
+    """프로세스 공용 상태 보고기"""
+    global _reporter
+    if _reporter is None:
+        with _reporter_lock:
+            if _reporter is None:
+                _reporter = HealthReporter()
+    return _reporter
@@ -451,6 +451,17 @@ PERFORMANCE_MODE_SETTINGS = {
             'half': False,
         },
 
+        # 캐스케이드 PPE (모드 1에서는 사용 안 함)
+        'ppe_cascade': {
+            'enabled': False,
+        },
+
+        # AI 단계별 시간 예산 (sensor/stage_budget.py: 목표를 넘으면 단계 주기/해상도 자동 조절)
+        'budget': {
+            'target_fps': 8.0,               # AI 처리 FPS
+            'target_latency': 0.3,           # 프레임 1장 처리 시간 상한 (초)
+        },
+
         # 예상 성능
         'expected_fps': '15-25 FPS',
         'expected_latency': '0.2-0.4초',
@@ -488,6 +499,29 @@ PERFORMANCE_MODE_SETTINGS = {
             'half': False,
         },
 
+        # 캐스케이드 PPE (고해상도 프레임: 사람 감지 → 사람 crop 배치 PPE 추론)
+        'ppe_cascade': {
+            'enabled': True,
+            'min_frame_dim': 1500,            # 긴 변이 이 이상인 프레임에만 적용
+            'person_model': 'yolo11n.pt',     # 1단계 경량 사람 감지 모델
+            'person_imgsz': 640,
+            'person_conf': 0.25,
+            'crop_imgsz': 320,                # 2단계 crop 추론 크기
+            'crop_pad': 0.15,
+            'max_persons': 6,
+            'min_person_px': 24,              # 이보다 작은 사람 박스 무시 (원본 픽셀 높이)
+            'tiling': False,                  # SAHI 방식 타일 분할 (CPU에서는 비활성)
+            'tile_size': 960,
+            'tile_overlap': 0.2,
+            'merge_iou': 0.5,                 # crop/타일 간 중복 박스 병합 NMS IoU
+        },
+
+        # AI 단계별 시간 예산 (sensor/stage_budget.py: 목표를 넘으면 단계 주기/해상도 자동 조절)
+        'budget': {
+            'target_fps': 6.0,               # AI 처리 FPS
+            'target_latency': 0.4,           # 프레임 1장 처리 시간 상한 (초)
+        },
+
         # 예상 성능
         'expected_fps': '8-15 FPS',
         'expected_latency': '0.3-0.5초',
@@ -525,6 +559,29 @@ PERFORMANCE_MODE_SETTINGS = {
             'half': True,                     # FP16 (GPU 최적화)
         },
 
+        # 캐스케이드 PPE (원거리 소형 인물 보강을 위해 타일 분할 사용)
+        'ppe_cascade': {
+            'enabled': True,
+            'min_frame_dim': 1500,
+            'person_model': 'yolo11n.pt',     # COCO 모델이 로드되어 있으면 재사용
+            'person_imgsz': 640,
+            'person_conf': 0.25,
+            'crop_imgsz': 416,
+            'crop_pad': 0.15,
+            'max_persons': 8,
+            'min_person_px': 24,              # 이보다 작은 사람 박스 무시 (원본 픽셀 높이)
+            'tiling': True,
+            'tile_size': 960,
+            'tile_overlap': 0.2,
+            'merge_iou': 0.5,                 # crop/타일 간 중복 박스 병합 NMS IoU
+        },
+
+        # AI 단계별 시간 예산 (sensor/stage_budget.py: 목표를 넘으면 단계 주기/해상도 자동 조절)
+        'budget': {
+            'target_fps': 8.0,               # AI 처리 FPS
+            'target_latency': 0.4,           # 프레임 1장 처리 시간 상한 (초)
+        },
+
         # 예상 성능
         'expected_fps': '15-30 FPS (GPU)',
         'expected_latency': '0.2-0.4초',
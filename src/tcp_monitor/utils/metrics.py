@@ -0,0 +1,372 @@
+"""
+실행 중 성능 계측 (카운터/게이지/지연 히스토그램)
+
+주요 경로(pump 틱, App.on_data, DB 저장, AI 추론, 거울보기 FPS, TCP 세션)를 계측하여
+- 로컬 HTTP 엔드포인트(Prometheus 텍스트 형식, 127.0.0.1 전용)
+- 앱 내 진단 패널
+로 보여줍니다.
+
+비활성화 상태(기본값)에서는 각 계측 호출이 플래그 확인 한 번으로 끝나며
+time()은 공유 no-op 컨텍스트를 반환하므로 시간 측정 자체를 하지 않습니다.
+
+사용 예:
+    from ..utils.metrics import get_metrics
+    _SAVE = get_metrics().histogram("db_save_seconds", "sensor_data INSERT 시간")
+    with _SAVE.time():
+        ...
+
+설정 ([ENV]): metrics_enabled (기본 false), metrics_port (기본 9464, 0이면 HTTP 미사용)
+"""
+
+import bisect
+import functools
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Sequence, Tuple
+
+# 지연 시간 히스토그램 기본 구간 (초)
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _NullTimer:
+    """비활성화 시 time()이 반환하는 no-op 컨텍스트"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("_hist", "_start")
+
+    def __init__(self, hist):
+        self._hist = hist
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._hist.observe(time.perf_counter() - self._start)
+        return False
+
+
+class _Metric:
+    """메트릭 기본 클래스 (라벨별 자식은 같은 클래스의 인스턴스)"""
+
+    kind = ""
+
+    def __init__(self, registry, name, help_text, labelnames=(), labelvalues=()):
+        self._registry = registry
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.labelvalues = tuple(labelvalues)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """라벨 값으로 자식 메트릭 반환 (예: hist.labels("ppe"))"""
+        values = tuple(str(v) for v in values)
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child(values)
+                    self._children[values] = child
+        return child
+
+    def _new_child(self, values):
+        return type(self)(self._registry, self.name, self.help, self.labelnames, values)
+
+    def _series(self):
+        """(라벨 값, 메트릭) 목록 - 라벨 없는 메트릭은 자기 자신"""
+        if self.labelnames:
+            return list(self._children.items())
+        return [((), self)]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0.0
+
+    def inc(self, amount=1.0):
+        if self._registry.enabled:
+            self.value += amount
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = 0.0
+
+    def set(self, value):
+        if self._registry.enabled:
+            self.value = float(value)
+
+    def inc(self, amount=1.0):
+        if self._registry.enabled:
+            self.value += amount
+
+    def dec(self, amount=1.0):
+        if self._registry.enabled:
+            self.value -= amount
+
+
+class Histogram(_Metric):
+    """지연 시간 히스토그램 (누적 구간 카운트 + 합계 + 최대값)"""
+
+    kind = "histogram"
+
+    def __init__(self, registry, name, help_text, labelnames=(), labelvalues=(),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(registry, name, help_text, labelnames, labelvalues)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def _new_child(self, values):
+        return Histogram(self._registry, self.name, self.help, self.labelnames, values, self.buckets)
+
+    def observe(self, value):
+        if not self._registry.enabled:
+            return
+        # GIL 하에서 리스트 원소 += 는 원자적이지 않지만 계측 용도로는 드문 유실이 허용됨
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def time(self):
+        """with 블록 실행 시간 기록"""
+        if not self._registry.enabled:
+            return _NULL_TIMER
+        return _Timer(self)
+
+    def timed(self, func):
+        """함수 실행 시간 기록 데코레이터 (비활성화 시 플래그 확인 후 바로 호출)"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._registry.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.observe(time.perf_counter() - start)
+        return wrapper
+
+    def quantile(self, q):
+        """구간 카운트로 근사한 분위수 (구간 상한 기준)"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        acc = 0
+        for i, c in enumerate(self.counts):
+            acc += c
+            if acc >= target:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+
+class MetricsRegistry:
+    """메트릭 등록/내보내기"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._http: Optional[ThreadingHTTPServer] = None
+
+    def _get_or_create(self, cls, name, help_text, labelnames, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(self, name, help_text, labelnames, **kwargs)
+                    self._metrics[name] = metric
+        return metric
+
+    def counter(self, name, help_text="", labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text="", labelnames=()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text="", labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    # ------------------------------------------------------------------
+    # 내보내기
+    # ------------------------------------------------------------------
+
+    def snapshot(self):
+        """진단 패널용 요약 [(이름, 라벨 문자열, 종류, 요약 dict)]"""
+        rows = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            for values, series in metric._series():
+                label = ",".join(f"{k}={v}" for k, v in zip(metric.labelnames, values))
+                if metric.kind == "histogram":
+                    summary = {
+                        "count": series.count,
+                        "avg": series.sum / series.count if series.count else 0.0,
+                        "p50": series.quantile(0.5),
+                        "p99": series.quantile(0.99),
+                        "max": series.max,
+                    }
+                else:
+                    summary = {"value": series.value}
+                rows.append((name, label, metric.kind, summary))
+        return rows
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)"""
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            if metric.help:
+                lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for values, series in metric._series():
+                pairs = [f'{k}="{_escape(v)}"' for k, v in zip(metric.labelnames, values)]
+                if metric.kind == "histogram":
+                    acc = 0
+                    for bound, c in zip(list(series.buckets) + [math.inf], series.counts):
+                        acc += c
+                        le = 'le="' + _fmt(bound) + '"'
+                        lines.append(f"{name}_bucket{{{','.join(pairs + [le])}}} {acc}")
+                    lbl = "{" + ",".join(pairs) + "}" if pairs else ""
+                    lines.append(f"{name}_sum{lbl} {_fmt(series.sum)}")
+                    lines.append(f"{name}_count{lbl} {series.count}")
+                else:
+                    lbl = "{" + ",".join(pairs) + "}" if pairs else ""
+                    lines.append(f"{name}{lbl} {_fmt(series.value)}")
+        return "\n".join(lines) + "\n"
+
+    def start_http_server(self, port=9464, host="127.0.0.1"):
+        """/metrics HTTP 엔드포인트 시작 (이미 실행 중이면 무시)"""
+        if self._http is not None or not port:
+            return self._http
+        registry = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._http = ThreadingHTTPServer((host, int(port)), _Handler)
+        self._http.daemon_threads = True
+        threading.Thread(target=self._http.serve_forever, name="metrics-http", daemon=True).start()
+        return self._http
+
+    def stop_http_server(self):
+        if self._http is not None:
+            self._http.shutdown()
+            self._http.server_close()
+            self._http = None
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class TkLoopLagMonitor:
+    """
+    Tk 이벤트 루프 지연 측정
+
+    interval_ms마다 after()로 자신을 예약하고, 실제 호출 시각과 예정 시각의 차이를 기록합니다.
+    메인 스레드를 오래 점유하는 콜백(렌더링, 동기 DB 조회 등)이 있으면 지연이 커집니다.
+    """
+
+    def __init__(self, widget, registry: "MetricsRegistry", interval_ms: int = 100):
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self._lag = registry.histogram("tk_event_loop_lag_seconds", "Tk 이벤트 루프 지연 (예정 대비 after 콜백 지연)")
+        self._last = registry.gauge("tk_event_loop_lag_last_seconds", "마지막 측정 Tk 이벤트 루프 지연")
+        self._expected = None
+        self._running = False
+
+    def start(self):
+        self._running = True
+        self._schedule()
+
+    def stop(self):
+        self._running = False
+
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.interval_ms / 1000.0
+        self.widget.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        if not self._running:
+            return
+        lag = max(0.0, time.perf_counter() - self._expected)
+        self._lag.observe(lag)
+        self._last.set(lag)
+        self._schedule()
+
+
+_registry = MetricsRegistry(enabled=False)
+
+
+def get_metrics() -> MetricsRegistry:
+    """전역 메트릭 레지스트리 (기본 비활성화)"""
+    return _registry
+
+
+def configure_metrics(cfg) -> MetricsRegistry:
+    """설정([ENV] metrics_enabled, metrics_port)에 따라 계측 활성화 및 HTTP 엔드포인트 시작"""
+    env = getattr(cfg, "env", {}) or {}
+    enabled = str(env.get("metrics_enabled", False)).lower() in ("1", "true", "yes", "on")
+    _registry.enabled = enabled
+    if enabled:
+        try:
+            port = int(float(env.get("metrics_port", 9464)))
+        except (TypeError, ValueError):
+            port = 9464
+        try:
+            _registry.start_http_server(port)
+            if port:
+                print(f"[Metrics] http://127.0.0.1:{port}/metrics")
+        except OSError as e:
+            print(f"[Metrics] HTTP 엔드포인트 시작 실패: {e}")
+    return _registry
@@ -0,0 +1,148 @@
+"""
+시작 시간 프로파일러 (--profile-startup)
+
+모듈별 import 시간과 주요 시작 마일스톤(TCP 수신 대기, 첫 화면 표시,
+AI 모델 로드 완료)까지 걸린 시간을 측정하여 콘솔에 보고합니다.
+
+표준 라이브러리만 사용하므로 패키지의 다른 모듈보다 먼저 로드할 수 있습니다.
+"""
+
+import builtins
+import os
+import sys
+import threading
+import time
+
+
+def _process_uptime():
+    """현재 프로세스가 시작된 뒤 경과한 시간(초) - /proc 기반, 실패 시 0"""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            stat = f.read()
+        # comm 필드에 공백이 있을 수 있으므로 마지막 ')' 이후부터 파싱
+        fields = stat[stat.rindex(")") + 2:].split()
+        start_ticks = int(fields[19])  # starttime (22번째 필드)
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK"))
+    except Exception:
+        return 0.0
+
+
+class StartupProfiler:
+    """모듈 import 시간 및 시작 마일스톤 측정기"""
+
+    def __init__(self, top_n=30):
+        self.top_n = top_n
+        # perf_counter 기준점을 프로세스 시작 시각으로 보정
+        self._t0 = time.perf_counter() - _process_uptime()
+        self._orig_import = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # 모듈명 -> [누적 시간, 자체 시간]
+        self.import_times = {}
+        # 마일스톤명 -> 프로세스 시작 이후 경과 시간(초)
+        self.milestones = {}
+        self._reported = False
+
+    def install(self):
+        """builtins.__import__를 감싸 import 시간 측정 시작"""
+        if self._orig_import is not None:
+            return
+        self._orig_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        self.mark("profiler_installed")
+
+    def uninstall(self):
+        """import 측정 중지"""
+        if self._orig_import is not None:
+            builtins.__import__ = self._orig_import
+            self._orig_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """새로 로드되는 모듈만 시간 측정 (이미 로드된 모듈은 즉시 통과)"""
+        orig = self._orig_import
+        if level or name in sys.modules:
+            # 상대 import는 절대 이름을 알 수 없으므로 로드 후 판단
+            if not level:
+                return orig(name, globals, locals, fromlist, level)
+            package = (globals or {}).get("__package__") or ""
+            base = package.rsplit(".", level - 1)[0] if level > 1 else package
+            full_name = f"{base}.{name}" if name else base
+            if full_name in sys.modules:
+                return orig(name, globals, locals, fromlist, level)
+        else:
+            full_name = name
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return orig(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            child = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                entry = self.import_times.setdefault(full_name, [0.0, 0.0])
+                entry[0] += elapsed
+                entry[1] += max(0.0, elapsed - child)
+
+    def mark(self, name):
+        """마일스톤 기록 (최초 1회만 유효)"""
+        with self._lock:
+            if name not in self.milestones:
+                self.milestones[name] = time.perf_counter() - self._t0
+
+    def has(self, name):
+        """마일스톤 도달 여부"""
+        return name in self.milestones
+
+    def report(self, file=None):
+        """측정 결과 출력"""
+        out = file or sys.stdout
+        with self._lock:
+            milestones = sorted(self.milestones.items(), key=lambda kv: kv[1])
+            imports = sorted(self.import_times.items(), key=lambda kv: kv[1][0], reverse=True)
+        total_self = sum(v[1] for _, v in imports)
+
+        lines = ["", "=" * 64, " 시작 프로파일 (--profile-startup)", "=" * 64, "[마일스톤] (프로세스 시작 기준)"]
+        for name, t in milestones:
+            lines.append(f"  {name:<28} {t * 1000:9.1f} ms")
+        lines.append(f"[모듈 import] 총 {len(imports)}개, 자체 시간 합계 {total_self * 1000:.1f} ms")
+        lines.append(f"  {'누적(ms)':>10} {'자체(ms)':>10}  모듈")
+        for name, (cum, own) in imports[:self.top_n]:
+            lines.append(f"  {cum * 1000:10.1f} {own * 1000:10.1f}  {name}")
+        lines.append("=" * 64)
+        print("\n".join(lines), file=out, flush=True)
+        self._reported = True
+
+    @property
+    def reported(self):
+        return self._reported
+
+
+_profiler = None
+
+
+def enable_startup_profiler(top_n=30):
+    """전역 프로파일러 생성 및 import 측정 시작"""
+    global _profiler
+    if _profiler is None:
+        _profiler = StartupProfiler(top_n=top_n)
+        _profiler.install()
+    return _profiler
+
+
+def get_startup_profiler():
+    """전역 프로파일러 반환 (비활성화 시 None)"""
+    return _profiler
+
+
+def mark_startup(name):
+    """마일스톤 기록 (프로파일러 비활성화 시 아무 작업도 하지 않음)"""
+    if _profiler is not None:
+        _profiler.mark(name)
@@ -0,0 +1,165 @@
+"""
+한글 텍스트 스프라이트 캐시 (영상 오버레이용)
+
+기존 방식은 라벨 하나를 그릴 때마다 전체 프레임을 BGR→RGB→PIL→BGR로
+두 번 복사했습니다. 이 모듈은 (폰트, 크기, 텍스트, 색상, 스타일)마다
+RGBA 스프라이트를 한 번만 래스터화하여 LRU로 보관하고,
+라벨 영역(ROI)만 NumPy로 알파 블렌딩합니다.
+→ 오버레이 비용이 프레임 크기가 아닌 라벨 면적에 비례
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    from PIL import Image, ImageDraw
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    Image = ImageDraw = None
+
+
+def has_korean(text):
+    """한글(완성형/자모) 포함 여부"""
+    return any('가' <= c <= '힣' or 'ㄱ' <= c <= 'ㅣ' for c in text)
+
+
+class TextSpriteCache:
+    """텍스트 RGBA 스프라이트 LRU 캐시"""
+
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._sprites = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _font_key(font):
+        return (getattr(font, 'path', None) or id(font), getattr(font, 'size', 0))
+
+    def _rasterize(self, font, text, color, outline, background, padding):
+        """텍스트 → (알파 곱한 BGR × 255 int32, alpha int32 (h, w, 1), 원점 기준 오프셋)
+
+        배경 박스 / 테두리 / 글자를 층별 마스크(L)로 그린 뒤 알파를 곱한 색으로 합성하므로,
+        프레임에 한 번 블렌딩한 결과가 프레임 위에 층을 차례로 그린 결과와 같습니다.
+        """
+        try:
+            left, top, right, bottom = font.getbbox(text)
+        except AttributeError:
+            # 구버전 PIL / 기본 비트맵 폰트
+            w, h = font.getsize(text)
+            left, top, right, bottom = 0, 0, w, h
+
+        margin = padding + (1 if outline else 0)
+        # 배경 박스는 draw.rectangle처럼 오른쪽/아래 끝 픽셀 포함 (bbox + 여백)
+        extra = 1 if background is not None else 0
+        width = max(1, right - left + 2 * margin + extra)
+        height = max(1, bottom - top + 2 * margin + extra)
+
+        # 텍스트 원점: 스프라이트 안에서 bbox 좌상단이 margin 위치에 오도록
+        ox, oy = margin - left, margin - top
+        layers = []  # [(BGR 색상, 마스크 0~255)] 아래층부터
+        if background is not None:
+            layers.append((background, np.full((height, width), 255, dtype=np.uint8)))
+        if outline:
+            # 검은색 테두리 (8방향)
+            mask = Image.new('L', (width, height), 0)
+            draw = ImageDraw.Draw(mask)
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    if dx or dy:
+                        draw.text((ox + dx, oy + dy), text, font=font, fill=255)
+            layers.append(((0, 0, 0), np.asarray(mask)))
+        mask = Image.new('L', (width, height), 0)
+        ImageDraw.Draw(mask).text((ox, oy), text, font=font, fill=255)
+        layers.append((color, np.asarray(mask)))
+
+        # 알파 곱한 색(× 255)과 알파를 아래층부터 합성 (Porter-Duff over)
+        premul = np.zeros((height, width, 3), dtype=np.float64)
+        alpha = np.zeros((height, width, 1), dtype=np.float64)
+        for layer_color, layer_mask in layers:
+            m = layer_mask[:, :, None] / 255.0
+            premul = np.asarray(layer_color[:3], dtype=np.float64) * 255.0 * m + premul * (1.0 - m)
+            alpha = 255.0 * m + alpha * (1.0 - m)
+        return (np.rint(premul).astype(np.int32), np.rint(alpha).astype(np.int32),
+                (left - margin, top - margin))
+
+    def get(self, font, text, color, outline=False, background=None, padding=0):
+        """스프라이트 조회 (없으면 생성)"""
+        key = (self._font_key(font), text, tuple(color), outline,
+               tuple(background) if background is not None else None, padding)
+        with self._lock:
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+                self.hits += 1
+                return sprite
+        sprite = self._rasterize(font, text, color, outline, background, padding)
+        with self._lock:
+            self.misses += 1
+            self._sprites[key] = sprite
+            while len(self._sprites) > self.max_items:
+                self._sprites.popitem(last=False)
+        return sprite
+
+    def draw(self, frame, text, position, font, color, outline=False, background=None, padding=0):
+        """
+        프레임에 텍스트를 직접(in-place) 그리기
+
+        Args:
+            frame: BGR uint8 프레임 (연속 메모리일 필요 없음)
+            text: 표시할 텍스트
+            position: PIL draw.text()와 동일한 원점 (x, y)
+            font: PIL 폰트
+            color: BGR 색상
+            outline: True면 검은색 1px 테두리
+            background: 배경 박스 색상 (BGR, None이면 투명)
+            padding: 배경 박스 여백(px)
+
+        Returns:
+            frame (같은 객체)
+        """
+        premul, alpha, (dx, dy) = self.get(font, text, color, outline, background, padding)
+        fh, fw = frame.shape[:2]
+        sh, sw = premul.shape[:2]
+        x0, y0 = int(position[0]) + dx, int(position[1]) + dy
+
+        # 프레임 경계로 클리핑
+        fx0, fy0 = max(0, x0), max(0, y0)
+        fx1, fy1 = min(fw, x0 + sw), min(fh, y0 + sh)
+        if fx0 >= fx1 or fy0 >= fy1:
+            return frame
+        sx0, sy0 = fx0 - x0, fy0 - y0
+        sx1, sy1 = sx0 + (fx1 - fx0), sy0 + (fy1 - fy0)
+
+        roi = frame[fy0:fy1, fx0:fx1, :3]
+        a = alpha[sy0:sy1, sx0:sx1]
+        src = premul[sy0:sy1, sx0:sx1]
+        # 정수 알파 블렌딩: (src * a + dst * (255 - a)) / 255 (src * a는 스프라이트에 미리 계산)
+        blended = (src + roi.astype(np.int32) * (255 - a) + 127) // 255
+        roi[...] = blended.astype(np.uint8)
+        return frame
+
+    def clear(self):
+        with self._lock:
+            self._sprites.clear()
+
+    def get_stats(self):
+        return {'items': len(self._sprites), 'hits': self.hits, 'misses': self.misses}
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_text_sprite_cache():
+    """전역 공유 스프라이트 캐시 반환"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = TextSpriteCache()
+    return _shared_cache
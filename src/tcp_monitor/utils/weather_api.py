@@ -4,12 +4,18 @@
 외부 IP 기반 위치 감지 및 기상청 API를 통한 날씨 정보 수집
 """
 
-import requests
 import json
+import math
 import time
 from datetime import datetime, timedelta
 import re
 from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+try:
+    import requests
+except ImportError:
+    requests = None  # 공용 날씨 서비스(weather_service.py)는 urllib만 사용
 
 
 class WeatherAPI:
@@ -29,33 +35,34 @@ class WeatherAPI:
         self._cache_timeout = 600  # 10분
         
     def _convert_latlon_to_grid(self, lat: float, lon: float) -> Tuple[int, int]:
-        """위도/경도를 기상청 격자 좌표로 변환"""
-        # 기상청 격자 변환 공식
-        re = 6371.00877  # 지구 반경
-        grid = 5.0
-        slat1 = 30.0
-        slat2 = 60.0
-        olon = 126.0
-        olat = 38.0
-        
-        sn = math.tan(math.pi * (0.25 + slat2 / 360.0))
-        sn = math.log(math.cos(slat1 * math.pi / 180.0) / math.cos(slat2 * math.pi / 180.0)) / math.log(sn)
-        sf = math.tan(math.pi * (0.25 + slat1 / 360.0))
-        sf = math.pow(sf, sn) * math.cos(slat1 * math.pi / 180.0) / sn
-        ro = math.tan(math.pi * (0.25 + olat / 360.0))
+        """위도/경도를 기상청 격자 좌표로 변환 (기상청 LCC 격자, 5km)"""
+        re = 6371.00877 / 5.0  # 지구 반경 / 격자 간격
+        degrad = math.pi / 180.0
+        slat1 = 30.0 * degrad
+        slat2 = 60.0 * degrad
+        olon = 126.0 * degrad
+        olat = 38.0 * degrad
+        xo, yo = 43, 136  # 기준점 격자 좌표
+
+        sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
+        sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+        sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
+        sf = math.pow(sf, sn) * math.cos(slat1) / sn
+        ro = math.tan(math.pi * 0.25 + olat * 0.5)
         ro = re * sf / math.pow(ro, sn)
-        
-        ra = math.tan(math.pi * (0.25 + lat / 360.0))
-        theta = lon - olon
+
+        ra = math.tan(math.pi * 0.25 + lat * degrad * 0.5)
+        ra = re * sf / math.pow(ra, sn)
+        theta = lon * degrad - olon
         if theta > math.pi:
             theta -= 2.0 * math.pi
         if theta < -math.pi:
             theta += 2.0 * math.pi
         theta *= sn
-        
-        x = math.floor(ra * math.sin(theta) + (self.nx / 2.0) + 0.5)
-        y = math.floor(ro - ra * math.cos(theta) + (self.ny / 2.0) + 0.5)
-        
+
+        x = math.floor(ra * math.sin(theta) + xo + 0.5)
+        y = math.floor(ro - ra * math.cos(theta) + yo + 0.5)
+
         return int(x), int(y)
     
     def get_current_location_from_ip(self) -> Optional[Tuple[float, float]]:
@@ -102,6 +109,30 @@ class WeatherAPI:
             
         return None
     
+    def current_weather_url(self, now: Optional[datetime] = None) -> str:
+        """초단기실황 API 요청 URL (공용 날씨 서비스가 직접 요청할 때 사용)"""
+        now = now or datetime.now()
+        params = {
+            "serviceKey": self.api_key,
+            "numOfRows": 100,
+            "pageNo": 1,
+            "dataType": "JSON",
+            "base_date": self._get_base_date(now),
+            "base_time": self._get_base_time(now),
+            "nx": self.nx,
+            "ny": self.ny
+        }
+        return f"{self.base_url}/VilageFcstInfoService_2.0/getUltraSrtNcst?{urlencode(params)}"
+
+    def parse_current_response(self, data: Dict) -> Optional[Dict]:
+        """초단기실황 응답(JSON) → 현재 날씨 (오류 응답이면 None)"""
+        header = data.get("response", {}).get("header", {})
+        if header.get("resultCode") != "00":
+            print(f"기상청 API 오류: {header.get('resultMsg', 'Unknown error')}")
+            return None
+        items = data["response"]["body"]["items"]["item"]
+        return self._parse_current_weather(items)
+
     def get_current_weather(self) -> Optional[Dict]:
         """현재 날씨 정보 조회"""
         cache_key = "current_weather"
@@ -114,38 +145,14 @@ class WeatherAPI:
                 return cached_data
         
         try:
-            # 현재 시간 기준으로 API 호출
-            now = datetime.now()
-            base_date = now.strftime("%Y%m%d")
-            base_time = self._get_base_time(now)
-            
             # 초단기실황 API
-            url = f"{self.base_url}/VilageFcstInfoService_2.0/getUltraSrtNcst"
-            params = {
-                "serviceKey": self.api_key,
-                "numOfRows": 100,
-                "pageNo": 1,
-                "dataType": "JSON",
-                "base_date": base_date,
-                "base_time": base_time,
-                "nx": self.nx,
-                "ny": self.ny
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = requests.get(self.current_weather_url(), timeout=10)
             if response.status_code == 200:
-                data = response.json()
-                
-                if data.get("response", {}).get("header", {}).get("resultCode") == "00":
-                    items = data["response"]["body"]["items"]["item"]
-                    
-                    weather_data = self._parse_current_weather(items)
-                    
+                weather_data = self.parse_current_response(response.json())
+                if weather_data is not None:
                     # 캐시 저장
                     self._cache[cache_key] = (weather_data, current_time)
                     return weather_data
-                else:
-                    print(f"기상청 API 오류: {data.get('response', {}).get('header', {}).get('resultMsg', 'Unknown error')}")
                     
         except Exception as e:
             print(f"현재 날씨 조회 실패: {e}")
@@ -166,7 +173,7 @@ class WeatherAPI:
         try:
             # 현재 시간 기준으로 API 호출
             now = datetime.now()
-            base_date = now.strftime("%Y%m%d")
+            base_date = self._get_base_date(now)
             base_time = self._get_base_time(now)
             
             # 초단기예보 API
@@ -202,6 +209,12 @@ class WeatherAPI:
             
         return None
     
+    def _get_base_date(self, now: datetime) -> str:
+        """기준 날짜 (자정~00:30 사이에는 전날 23시 자료)"""
+        if now.hour == 0 and now.minute < 30:
+            now = now - timedelta(days=1)
+        return now.strftime("%Y%m%d")
+
     def _get_base_time(self, now: datetime) -> str:
         """API 호출을 위한 기준 시간 계산"""
         hour = now.hour
@@ -328,7 +341,3 @@ class WeatherAPI:
         """현재 위치의 지역명 반환"""
         # 강원특별자치도 춘천시 동면 기준
         return "강원특별자치도, 춘천시"
-
-
-# 수학 모듈 import 추가
-import math
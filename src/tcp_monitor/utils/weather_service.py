@@ -0,0 +1,420 @@
+"""
+프로세스 공용 날씨 서비스
+
+백그라운드 스레드 1개가 날씨를 주기적으로 가져오고, 패널 타일/헤더는 구독(WeatherSubscription)으로
+최신 값만 읽습니다. Tk 스레드에서는 네트워크 요청을 하지 않습니다.
+
+- 가져오기 순서: 기상청 초단기실황(API 키가 있을 때) → MSN 날씨 페이지 (폴백)
+- 디스크 캐시(data/weather_cache.json): 재시작 직후 마지막 날씨를 바로 표시하고,
+  캐시가 갱신 주기보다 새것이면 그때까지 요청하지 않음
+- 조건부 요청: 같은 URL이면 ETag / Last-Modified를 보내고 304 응답 시 캐시된 결과 사용
+- 실패 시 지수 백오프 (retry_min초부터 2배씩, 최대 retry_max초, ±20% 무작위)
+- 위치(IP 기반)는 하루 한 번만 조회하여 캐시
+
+사용 예:
+    from ..utils.weather_service import get_weather_service
+    sub = get_weather_service(app.cfg).subscribe(name="tiles")
+    data = sub.poll()      # 새 값이 있을 때만 dict, 없으면 None (Tk after 루프에서 호출)
+    sub.refresh()          # 즉시 갱신 요청 (비동기)
+    sub.release()
+"""
+
+import json
+import os
+import random
+import re
+import ssl
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+
+from .helpers import get_data_dir
+from .metrics import get_metrics
+from .weather_api import WeatherAPI
+
+_FETCHES = get_metrics().counter("weather_fetch_total", "날씨 요청 횟수", ("source", "result"))
+
+DEFAULT_LOCATION = "강원특별자치도, 춘천시"
+DEFAULT_MSN_URL = (
+    "https://www.msn.com/ko-kr/weather/forecast/in-%EA%B0%95%EC%9B%90%ED%8A%B9%EB%B3%84%EC%9E%90%EC%B9%98%EB%8F%84,%EC%B6%98%EC%B2%9C%EC%8B%9C?loc=eyJsIjoi7LaY7LKc7IucIiwiciI6IuqwleybkO2KueuzhOyekOy5mOuPhCIsImMiOiLrjIDtlZzrr7zqta0iLCJpIjoiS1IiLCJnIjoia28ta3IiLCJ4IjoiMTI3Ljc4NjMiLCJ5IjoiMzcuOTEyOSJ9&weadegreetype=C&ocid=ansmsnweather"
+)
+LOCATION_SERVICES = ("http://ip-api.com/json/?lang=ko", "https://ipapi.co/json/", "http://ipinfo.io/json")
+LOCATION_TTL = 86400
+
+
+def condition_icon(condition: str, precipitation: str = "") -> str:
+    """날씨 상태 문구 → 아이콘"""
+    if precipitation and precipitation not in ("없음", "정보없음"):
+        if "소나기" in precipitation:
+            return "⛈️"
+        if "비" in precipitation:
+            return "🌧️"
+        if "눈" in precipitation:
+            return "🌨️"
+    txt = condition or ""
+    if re.search(r"(맑음|화창)", txt):
+        return "☀️"
+    if re.search(r"(구름|흐림)", txt):
+        return "⛅"
+    if re.search(r"(비|소나기)", txt):
+        return "🌧️"
+    if re.search(r"(눈|우박)", txt):
+        return "🌨️"
+    if re.search(r"(안개|미세|연무)", txt):
+        return "🌫️"
+    return "ℹ️"
+
+
+def parse_msn_html(html_text: str) -> Optional[Dict]:
+    """MSN 날씨 페이지 → {"temp", "cond", "loc"} (온도를 찾지 못하면 None)"""
+    if not html_text:
+        return None
+    m_temp = re.search(r"([\-]?\d{1,2})°C", html_text)
+    if not m_temp:
+        return None
+    m_cond = re.search(r"(맑음|대체로\s*맑음|흐림|대체로\s*흐림|구름|비|소나기|약한\s*비|눈|약한\s*눈|안개)", html_text)
+    m_loc = re.search(r"([가-힣A-Za-z\s,]{2,20}\s*,\s*[가-힣A-Za-z\s]{1,20})\s*\n?\s*현재 날씨", html_text)
+    if not m_loc:
+        m_loc = re.search(r"([가-힣]{2,}(?:특별자치도|광역시|도)?\s*,\s*[가-힣]{2,}시)", html_text)
+    return {"temp": m_temp.group(1), "cond": m_cond.group(1) if m_cond else "날씨 정보",
+            "loc": m_loc.group(1).strip() if m_loc else DEFAULT_LOCATION}
+
+
+def _kma_display(current: Dict, location: str) -> Dict:
+    """기상청 현재 날씨 → 화면 표시용 dict"""
+    def fmt(value, cast=int):
+        return str(cast(value)) if value is not None else "--"
+    return {
+        "temp": fmt(current.get("temperature")),
+        "cond": current.get("sky_condition") or "정보없음",
+        "loc": location,
+        "humidity": fmt(current.get("humidity")),
+        "precipitation": current.get("precipitation") or "없음",
+        "wind_speed": fmt(current.get("wind_speed"), float),
+    }
+
+
+class WeatherSubscription:
+    """날씨 구독 (poll()로 새 값만 받기)"""
+
+    def __init__(self, service: "WeatherService", name: str):
+        self.service = service
+        self.name = name
+        self._seen = 0
+        self.released = False
+
+    def latest(self) -> Optional[Dict]:
+        """현재 값 (없으면 None)"""
+        return self.service.latest()[1]
+
+    def poll(self) -> Optional[Dict]:
+        """마지막 poll 이후 바뀐 값이 있으면 dict, 없으면 None (블로킹 없음)"""
+        version, data = self.service.latest()
+        if version == self._seen:
+            return None
+        self._seen = version
+        return data
+
+    def wait(self, timeout: float = None) -> Optional[Dict]:
+        """새 값이 올 때까지 대기 (테스트/비 UI용)"""
+        self.service.wait_version(self._seen, timeout)
+        return self.poll()
+
+    def refresh(self):
+        """즉시 갱신 요청 (비동기)"""
+        self.service.refresh_now()
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.service._unsubscribe(self)
+
+
+class WeatherService:
+    """날씨 가져오기 스레드 1개 + 디스크 캐시 + 구독"""
+
+    def __init__(self, settings: Optional[Dict] = None, cache_path: Optional[str] = None,
+                 interval: float = None, retry_min: float = 30.0, retry_max: float = 1800.0,
+                 timeout: float = 7.0):
+        """
+        Args:
+            settings: config.conf [WEATHER] 섹션 (kma_api_key, location_lat/lon, auto_detect_location,
+                      refresh_interval, msn_url, kma_base_url)
+            cache_path: 디스크 캐시 파일 (기본: data/weather_cache.json)
+            interval: 갱신 주기 (초, 기본: refresh_interval 또는 900)
+            retry_min / retry_max: 실패 시 재시도 간격 범위 (초)
+            timeout: HTTP 요청 제한 시간 (초)
+        """
+        settings = {k.lower(): v for k, v in (settings or {}).items()}
+        self.api_key = str(settings.get("kma_api_key", "") or "").strip()
+        if self.api_key == "YOUR_API_KEY_HERE":
+            self.api_key = ""
+        self.lat = float(settings.get("location_lat", 37.9129))
+        self.lon = float(settings.get("location_lon", 127.7863))
+        self.auto_detect = str(settings.get("auto_detect_location", "True")).lower() == "true"
+        self.msn_url = str(settings.get("msn_url", "") or "").strip()
+        self.kma_base_url = str(settings.get("kma_base_url", "") or "").strip()
+        self.location_services: List[str] = list(settings.get("location_services") or LOCATION_SERVICES)
+        self.interval = float(interval if interval is not None else settings.get("refresh_interval", 900))
+        self.retry_min = retry_min
+        self.retry_max = retry_max
+        self.timeout = timeout
+        self.cache_path = cache_path or os.path.join(get_data_dir("data"), "weather_cache.json")
+
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._subs: List[WeatherSubscription] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+        self._api: Optional[WeatherAPI] = None
+        self.failures = 0
+        self.fetches = 0
+        self.next_fetch_at = 0.0
+
+        self._cache = self._load_cache()
+        # 디스크 캐시 값: 갱신 주기보다 오래됐으면 stale (새 값을 받기 전까지 "이전 값" 표시)
+        data = self._cache.get("data")
+        self._data: Optional[Dict] = None
+        if data:
+            self._data = dict(data, stale=time.time() - data.get("updated", 0) >= self.interval)
+        self._version = 1 if data else 0
+
+    # ----- 구독 -----
+    def subscribe(self, name: str = "") -> WeatherSubscription:
+        """구독 추가 (첫 구독 시 가져오기 스레드 시작)"""
+        sub = WeatherSubscription(self, name)
+        with self._lock:
+            self._subs.append(sub)
+            self._stop = False
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="weather-service", daemon=True)
+                self._thread.start()
+        return sub
+
+    def _unsubscribe(self, sub: WeatherSubscription):
+        with self._lock:
+            if sub in self._subs:
+                self._subs.remove(sub)
+            if not self._subs:
+                self._stop = True
+        if self._stop:
+            self._wake.set()
+
+    def latest(self):
+        """(버전, 값) - 값이 바뀔 때마다 버전 증가"""
+        with self._lock:
+            return self._version, self._data
+
+    def wait_version(self, seen: int, timeout: float = None) -> int:
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != seen, timeout)
+            return self._version
+
+    def refresh_now(self):
+        """다음 가져오기를 즉시 실행"""
+        self._wake.set()
+
+    def shutdown(self, timeout: float = 2.0):
+        with self._lock:
+            self._stop = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout)
+
+    # ----- 가져오기 스레드 -----
+    def _run(self):
+        updated = (self._data or {}).get("updated", 0)
+        age = time.time() - updated
+        delay = max(0.0, self.interval - age) if 0 <= age < self.interval else 0.0
+        while True:
+            self.next_fetch_at = time.time() + delay
+            self._wake.wait(delay)
+            self._wake.clear()
+            with self._lock:
+                if self._stop:
+                    return
+            delay = self.interval if self.fetch_once() else self.backoff_delay()
+
+    def backoff_delay(self) -> float:
+        """연속 실패 횟수에 따른 재시도 간격"""
+        base = min(self.retry_max, self.retry_min * (2 ** max(0, self.failures - 1)))
+        return base * random.uniform(0.8, 1.2)
+
+    def fetch_once(self) -> bool:
+        """날씨 1회 가져오기 (성공 시 True). 실패하면 마지막 값을 stale로 유지"""
+        self.fetches += 1
+        data = None
+        errors = []
+        for source, fetch in (("kma", self._fetch_kma), ("msn", self._fetch_msn)):
+            try:
+                data = fetch()
+            except Exception as e:
+                errors.append(f"{source}: {e}")
+                _FETCHES.labels(source, "error").inc()
+                continue
+            if data:
+                data["source"] = source
+                break
+        now = time.time()
+        with self._changed:
+            if data:
+                self.failures = 0
+                data["icon"] = condition_icon(data.get("cond", ""), data.get("precipitation", ""))
+                data["updated"] = now
+                data["stale"] = False
+                self._data = data
+                self._cache["data"] = data
+            else:
+                self.failures += 1
+                if errors:
+                    print(f"[날씨] 가져오기 실패 ({self.failures}회): {'; '.join(errors)}")
+                if self._data is not None:
+                    self._data = dict(self._data, stale=True)
+            self._version += 1
+            self._changed.notify_all()
+        self._save_cache()
+        return bool(data)
+
+    def _http_get(self, source: str, url: str, parse: Callable[[bytes], Optional[Dict]]) -> Optional[Dict]:
+        """조건부 GET (같은 URL이면 ETag/Last-Modified 전송, 304면 캐시된 결과)"""
+        http = self._cache.setdefault("http", {})
+        entry = http.get(source) or {}
+        headers = {"User-Agent": "Mozilla/5.0"}
+        if entry.get("url") == url and entry.get("data"):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        req = Request(url, headers=headers)
+        ctx = ssl.create_default_context() if url.startswith("https") else None
+        try:
+            with urlopen(req, timeout=self.timeout, context=ctx) as r:
+                body = r.read()
+                etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        except HTTPError as e:
+            if e.code == 304 and entry.get("data"):
+                _FETCHES.labels(source, "not_modified").inc()
+                return dict(entry["data"])
+            raise
+        data = parse(body)
+        _FETCHES.labels(source, "ok" if data else "empty").inc()
+        if data:
+            http[source] = {"url": url, "etag": etag, "last_modified": last_modified, "data": data}
+        return dict(data) if data else None
+
+    def _get_json(self, url: str) -> Dict:
+        req = Request(url, headers={"User-Agent": "Mozilla/5.0"})
+        ctx = ssl.create_default_context() if url.startswith("https") else None
+        with urlopen(req, timeout=self.timeout, context=ctx) as r:
+            return json.loads(r.read().decode("utf-8", "ignore"))
+
+    def _location(self) -> Optional[Dict]:
+        """IP 기반 위치 {"lat", "lon", "city", "region"} (하루 한 번 조회, 실패 시 캐시/None)"""
+        if not self.auto_detect:
+            return None
+        cached = self._cache.get("location")
+        if cached and time.time() - cached.get("at", 0) < LOCATION_TTL:
+            return cached
+        for service in self.location_services:
+            try:
+                data = self._get_json(service)
+            except Exception as e:
+                print(f"[날씨] 위치 서비스 {service} 실패: {e}")
+                continue
+            if "loc" in data and "lat" not in data:
+                lat, _, lon = str(data.get("loc", "")).partition(",")
+            else:
+                lat, lon = data.get("lat", data.get("latitude")), data.get("lon", data.get("longitude"))
+            country = str(data.get("country") or data.get("country_name") or "")
+            try:
+                location = {"lat": float(lat), "lon": float(lon), "at": time.time(),
+                            "city": data.get("city", ""),
+                            "region": data.get("regionName") or data.get("region", ""),
+                            "korea": "Korea" in country or "한국" in country or country == "KR"}
+            except (TypeError, ValueError):
+                continue
+            self._cache["location"] = location
+            return location
+        return cached
+
+    def _fetch_kma(self) -> Optional[Dict]:
+        if not self.api_key:
+            return None
+        if self._api is None:
+            location = self._location()
+            lat, lon = (location["lat"], location["lon"]) if location else (self.lat, self.lon)
+            self._api = WeatherAPI(self.api_key, lat, lon)
+            if self.kma_base_url:
+                self._api.base_url = self.kma_base_url
+        api = self._api
+
+        def parse(body):
+            current = api.parse_current_response(json.loads(body.decode("utf-8", "ignore")))
+            return _kma_display(current, api.get_location_name()) if current else None
+        return self._http_get("kma", api.current_weather_url(), parse)
+
+    def _fetch_msn(self) -> Optional[Dict]:
+        url = self.msn_url
+        if not url:
+            location = self._location()
+            if location and location.get("korea") and location.get("city"):
+                url = (f"https://www.msn.com/ko-kr/weather/forecast/"
+                       f"in-{quote(location['city'])},{quote(location.get('region', ''))}")
+            else:
+                url = DEFAULT_MSN_URL
+        return self._http_get("msn", url, lambda body: parse_msn_html(body.decode("utf-8", "ignore")))
+
+    # ----- 디스크 캐시 -----
+    def _load_cache(self) -> Dict:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[날씨] 캐시 읽기 실패: {e}")
+            return {}
+
+    def _save_cache(self):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 종료되어도 이전 캐시 유지)"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_path)
+        except Exception as e:
+            print(f"[날씨] 캐시 저장 실패: {e}")
+
+    def stats(self) -> Dict:
+        """진단용"""
+        with self._lock:
+            return {"subscribers": len(self._subs), "fetches": self.fetches, "failures": self.failures,
+                    "version": self._version, "source": (self._data or {}).get("source"),
+                    "stale": (self._data or {}).get("stale"), "next_fetch_in": max(0.0, self.next_fetch_at - time.time())}
+
+
+_service: Optional[WeatherService] = None
+_service_lock = threading.Lock()
+
+
+def get_weather_service(cfg=None) -> WeatherService:
+    """프로세스 공용 날씨 서비스 (처음 호출 시 cfg의 [WEATHER] 섹션으로 생성)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                settings = {}
+                if cfg is not None and hasattr(cfg, "get_section"):
+                    try:
+                        settings = cfg.get_section("WEATHER", {})
+                    except Exception as e:
+                        print(f"[날씨] 설정 읽기 실패: {e}")
+                _service = WeatherService(settings)
+    return _service
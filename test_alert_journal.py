@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+경보 상태 전이 기록 테스트
+
+임시 디렉토리의 LogManager에 경보 레벨을 측정값마다 기록하면서
+- 레벨이 바뀔 때만 enter/escalate/deescalate/clear 행이 저장되는지
+- 경과 시간(duration), 최고값(peak)이 맞는지
+- 행이 일괄 저장되는지 (flush 전에는 DB에 없음, 시간이 지나면 자동 저장)
+- 오늘 레벨별 건수 / 삭제 후 다음 경보가 enter부터 다시 기록되는지
+- 이전 버전이 오늘 alert_events에 남긴 행이 목록/건수에 포함되고 삭제도 되는지
+- 경고 로그(warning_YYYYMMDD.log)가 초과 시작/정상 복귀 때만 기록되는지
+를 확인합니다.
+
+사용법:
+    python test_alert_journal.py [--samples N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.logging import LogManager
+
+PEER = "10.0.0.1:5000"
+
+
+class _Std:
+    std = {"co2_normal_max": 1000}
+
+
+def db_rows(logs):
+    return logs._get_db_connection().execute(
+        "SELECT kind, level, prev_level, value, peak, duration FROM alert_transitions ORDER BY id").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경보 상태 전이 기록 테스트")
+    parser.add_argument("--samples", type=int, default=1000)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="alert_journal_")
+    logs = LogManager(base, "127.0.0.1", 0, config=_Std())
+    logs._alert_journal.flush_interval = 0.3
+    ok = True
+
+    # 정상 → 주의(3) 지속 → 경계(4) → 주의(3) → 정상 (측정값마다 기록)
+    t0 = 1_700_000_000.0
+    plan = [(1, 800)] * 10 + [(3, 1600)] * args.samples + [(4, 2600), (4, 2900), (4, 2700)] \
+        + [(3, 1800)] * 5 + [(1, 900)] * 10
+    kinds = []
+    for i, (level, value) in enumerate(plan):
+        kind = logs.record_alert_level("S1", PEER, "co2", level, value, t0 + i)
+        if kind:
+            kinds.append(kind)
+    print("transitions:", kinds)
+    ok &= kinds == ["enter", "escalate", "deescalate", "clear"]
+
+    pending = len(db_rows(logs))
+    time.sleep(0.5)
+    rows = db_rows(logs)
+    print(f"batched: before timer {pending} rows, after {len(rows)} rows")
+    ok &= pending == 0 and len(rows) == 4
+
+    clear = rows[-1]
+    enter_i = 10
+    print("clear row:", clear)
+    ok &= clear[1] == 1 and clear[2] == 3 and clear[4] == 2900
+    ok &= abs(clear[5] - (len(plan) - 10 - enter_i)) < 1e-6
+    ok &= rows[1][:3] == ("escalate", 4, 3) and rows[2][:3] == ("deescalate", 3, 4)
+
+    # 오늘 목록 / 건수 (오늘 날짜로 한 번 더)
+    logs.record_alert_level("S1", PEER, "h2s", 5, 30)
+    logs.record_alert_level("S1", PEER, "h2s", 1, 0)
+    alerts = logs.get_today_alerts_for("S1", PEER)
+    counts = logs.get_today_alert_counts("S1", PEER)
+    print("today:", [(a["key"], a["kind"], a["level"]) for a in alerts], counts)
+    ok &= [a["kind"] for a in alerts] == ["clear", "enter"] and counts == {3: 0, 4: 0, 5: 1}
+
+    # 삭제 후 진행 중 경보는 enter부터 다시
+    logs.record_alert_level("S1", PEER, "co", 3, 40)
+    logs.delete_today_alerts_for("S1", PEER)
+    again = logs.record_alert_level("S1", PEER, "co", 4, 60)
+    print("after delete:", again, logs.get_today_alerts_for("S1", PEER)[0]["kind"])
+    ok &= again == "enter" and logs.get_today_alert_counts("S1", PEER)[4] == 1
+
+    # 이전 버전 alert_events 행 (업그레이드 당일)
+    conn = logs._get_db_connection()
+    today = time.strftime("%Y%m%d")
+    now = time.time()
+    conn.executemany(
+        "INSERT INTO alert_events (timestamp, date, sid, peer_ip, sensor_key, level, value) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(now - 60, today, "S1", "10.0.0.1", "o2", 5, 16.5), (now - 30, today, "S1", "10.0.0.1", "co2", 2, 1200),
+         (now - 20, today, "S2", "10.0.0.1", "o2", 4, 17.5)])
+    conn.commit()
+    merged = logs.get_today_alerts_for("S1", PEER)
+    legacy_counts = logs.get_today_alert_counts("S1", PEER)
+    print("with legacy rows:", [(a["key"], a["kind"], a["level"]) for a in merged], legacy_counts)
+    ok &= [(a["key"], a["kind"]) for a in merged] == [("co", "enter"), ("co2", None), ("o2", None)]
+    ok &= legacy_counts == {3: 0, 4: 1, 5: 1}
+    logs.delete_today_alerts_for("S1", PEER)
+    ok &= logs.get_today_alerts_for("S1", PEER) == [] and len(logs.get_today_alerts_for("S2", PEER)) == 1
+
+    # 경고 로그: 초과 시작 1줄 + 정상 복귀 1줄
+    for v in [900] * 5 + [1500 + i for i in range(args.samples)] + [950] * 5:
+        logs._check_and_log_warnings("S1", PEER, {"co2": v})
+    logs._warning_fp.flush()
+    lines = []
+    for path in glob.glob(os.path.join(logs.warning_dir, "warning_*.log")):
+        with open(path, encoding="utf-8") as f:
+            lines += f.readlines()
+    print("warning log lines:", len(lines))
+    for line in lines:
+        print("  ", line.rstrip())
+    ok &= len(lines) == 2 and "초과 시작" in lines[0] and "정상 복귀" in lines[1]
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
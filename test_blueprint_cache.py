@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+도면 뷰 계층 렌더링 캐시 테스트 (ui/panel_blueprint_view.py)
+
+화면(DISPLAY) 없이 확인할 수 있는 계산 부분을 검사합니다.
+- 밉맵: 필요할 때만 1/2씩 생성, 목표 폭 이상인 가장 작은 단계 선택
+- 도면 위치(캔버스 중앙 + 팬) / 비율 좌표 → 캔버스 좌표
+- 큰 확대 도면: 화면 주변 영역만 렌더링, 팬으로 렌더링 영역을 벗어날 때만 다시 렌더링
+- 줌 단계별 축소 도면 LRU 캐시 (Tk를 띄울 수 있을 때만, 아니면 건너뜀)
+
+사용법:
+    python test_blueprint_cache.py
+"""
+
+import os
+import sys
+
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.ui.panel_blueprint_view import PanelBlueprintView
+
+
+class CanvasSize:
+    """캔버스 크기만 알려주는 최소 캔버스 (화면 없이 계산 확인용)"""
+
+    def __init__(self, width, height):
+        self.width, self.height = width, height
+
+    def winfo_width(self):
+        return self.width
+
+    def winfo_height(self):
+        return self.height
+
+
+def make_view(image, canvas_size=(800, 600)):
+    """Tk 위젯 생성 없이 계산에 필요한 상태만 갖춘 뷰"""
+    view = PanelBlueprintView.__new__(PanelBlueprintView)
+    view.canvas = CanvasSize(*canvas_size)
+    view.blueprint_image = image
+    view.blueprint_photo = None
+    view._mip_levels = []
+    view._scaled_cache = {}
+    view._base_item = None
+    view._base_region = None
+    view.zoom_level = 1.0
+    view.pan_x = view.pan_y = 0
+    return view
+
+
+def main():
+    ok = True
+    image = Image.new("RGB", (4000, 3000), (200, 220, 240))
+
+    # [1] 밉맵: 지연 생성 + 목표 폭 이상인 가장 작은 단계
+    view = make_view(image)
+    full = view._mip_source(3000)
+    levels_after_full = len(view._mip_levels)
+    small = view._mip_source(900)
+    widths = [lv.width for lv in view._mip_levels]
+    print(f"[1] mip levels {widths}, for 3000 px -> {full.width}, for 900 px -> {small.width} "
+          f"(levels after first call: {levels_after_full})")
+    ok &= levels_after_full == 1 and widths == [4000, 2000, 1000] and small.width == 1000 and full.width == 4000
+
+    # [2] 도면 위치 / 좌표 변환
+    view.zoom_level, view.pan_x, view.pan_y = 0.5, 30, -20
+    geometry = view._image_geometry()
+    point = PanelBlueprintView._to_canvas(0.5, 0.5, geometry)
+    print(f"[2] geometry {geometry}, center -> {point}, hex {PanelBlueprintView._hex((255, 128, 0, 40))}")
+    ok &= geometry == (-570, -470, 2000, 1500) and point == (430, 280)
+    ok &= PanelBlueprintView._hex((255, 128, 0, 40)) == "#ff8000"
+
+    # [3] 큰 확대 도면: 화면 주변만 렌더링, 벗어날 때만 다시 렌더링
+    view.zoom_level, view.pan_x, view.pan_y = 4.0, 0, 0
+    geometry = view._image_geometry()
+    region = view._visible_region(geometry, margin=1)
+    renders = []
+
+    def render(g):
+        renders.append(g)
+        view._base_region = view._visible_region(g, margin=1)
+
+    view._update_base_layer = render
+    view._base_item = 1
+    view._base_region = region
+    view.pan_x += 300  # 여백(화면 1배) 안 → 다시 렌더링 안 함
+    view._ensure_base_coverage()
+    inside = len(renders)
+    view.pan_x += 1000  # 여백 밖 → 다시 렌더링
+    view._ensure_base_coverage()
+    x0, y0, x1, y1 = region
+    print(f"[3] zoomed {geometry[2]}x{geometry[3]}: render region {x1 - x0:.0f}x{y1 - y0:.0f}, "
+          f"re-render after small pan: {inside}, after large pan: {len(renders) - inside}")
+    ok &= (geometry[2] * geometry[3] > PanelBlueprintView.MAX_SCALED_PIXELS
+           and (x1 - x0, y1 - y0) == (2400, 1800) and inside == 0 and len(renders) == 1)
+    view.zoom_level = 0.2  # 작은 도면은 전체를 캐시하므로 팬으로 다시 렌더링하지 않음
+    view.pan_x += 5000
+    view._ensure_base_coverage()
+    ok &= len(renders) == 1
+
+    # [4] 줌 단계별 LRU 캐시 (Tk 필요)
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:
+        print(f"[4] skipped (Tk unavailable: {str(e).splitlines()[0]})")
+    else:
+        from collections import OrderedDict
+        view = make_view(image)
+        view._scaled_cache = OrderedDict()
+        first = view._scaled_photo(400, 300)
+        again = view._scaled_photo(400, 300)
+        for w in range(500, 500 + 100 * PanelBlueprintView.SCALE_CACHE_SIZE, 100):
+            view._scaled_photo(w, w * 3 // 4)
+        print(f"[4] cache hit: {first is again}, size {len(view._scaled_cache)}, "
+              f"oldest evicted: {(400, 300) not in view._scaled_cache}")
+        ok &= (first is again and len(view._scaled_cache) == PanelBlueprintView.SCALE_CACHE_SIZE
+               and (400, 300) not in view._scaled_cache)
+        root.destroy()
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+카메라 장치 목록 테스트 (camera/registry.py)
+
+임시 디렉토리를 /dev, /sys/class/video4linux 대신 사용합니다 (실제 카메라 불필요).
+- scan_devices: videoN 노드만, 숫자 순서, sysfs 이름/메타데이터 노드(index != 0), 라벨 형식
+- CameraRegistry 캐시: 다시 나열하지 않음, refresh()로 갱신, get()/capture_devices()
+- 핫플러그 비교: 목록이 바뀔 때만 알림, 예외가 난 리스너가 다른 리스너를 막지 않음,
+  remove_listener, 바운드 메서드는 객체가 사라지면 자동 해제
+- 감시 스레드: inotify(가능하면)와 폴링 모두 장치 추가/삭제를 감지
+- 카메라 설정 다이얼로그: 감시 스레드에서는 큐에만 넣고 after()는 Tk 스레드 폴링에서만 호출
+
+사용법:
+    python test_camera_registry.py
+"""
+
+import gc
+import os
+import queue
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.camera import registry as reg
+
+
+def add_node(dev_dir, sys_dir, index, name="", sysfs_index="0"):
+    open(os.path.join(dev_dir, f"video{index}"), "w").close()
+    node = os.path.join(sys_dir, f"video{index}")
+    os.makedirs(node, exist_ok=True)
+    if name:
+        with open(os.path.join(node, "name"), "w") as f:
+            f.write(name + "\n")
+    with open(os.path.join(node, "index"), "w") as f:
+        f.write(sysfs_index + "\n")
+
+
+class Listener:
+    def __init__(self):
+        self.calls = []
+        self.event = threading.Event()
+
+    def on_change(self, devices):
+        self.calls.append([d.index for d in devices if d.is_capture])
+        self.event.set()
+
+
+class FakeDialog:
+    """Tk Toplevel 대신 after 호출 스레드 기록"""
+
+    def __init__(self):
+        self.alive = True
+        self.after_threads = []
+        self.scheduled = []
+
+    def winfo_exists(self):
+        return self.alive
+
+    def after(self, ms, func):
+        self.after_threads.append(threading.get_ident())
+        self.scheduled.append(func)
+
+
+def wait_for(pred, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if pred():
+            return True
+        time.sleep(0.05)
+    return pred()
+
+
+def main():
+    ok = True
+    tmp = tempfile.mkdtemp(prefix="camreg_")
+    dev_dir, sys_dir = os.path.join(tmp, "dev"), os.path.join(tmp, "sys")
+    os.makedirs(dev_dir)
+    os.makedirs(sys_dir)
+    saved = (reg.DEV_DIR, reg.SYSFS_V4L, reg._DevWatcher.POLL_INTERVAL)
+    reg.DEV_DIR, reg.SYSFS_V4L = dev_dir, sys_dir
+    try:
+        # [1] scan_devices
+        add_node(dev_dir, sys_dir, 0, "USB Cam")
+        add_node(dev_dir, sys_dir, 1, "USB Cam", sysfs_index="1")
+        add_node(dev_dir, sys_dir, 10, "Capture Card")
+        add_node(dev_dir, sys_dir, 2)
+        open(os.path.join(dev_dir, "video-meta"), "w").close()
+        open(os.path.join(dev_dir, "null"), "w").close()
+        devices = reg.scan_devices()
+        summary = [(d.index, d.is_capture, d.label) for d in devices]
+        print(f"[1] scanned: {summary}")
+        ok &= summary == [(0, True, "USB Cam (0)"), (1, False, "USB Cam (1)"), (2, True, "카메라 2"),
+                          (10, True, "Capture Card (10)")]
+        ok &= devices[0].path == os.path.join(dev_dir, "video0") and devices[0].formats == []
+
+        # [2] 캐시 / refresh / get
+        registry = reg.CameraRegistry(watch=False)
+        first = [d.index for d in registry.capture_devices()]
+        scanned_at = registry.scanned_at
+        add_node(dev_dir, sys_dir, 3, "New Cam")
+        cached = [d.index for d in registry.capture_devices()]
+        refreshed = [d.index for d in registry.refresh()]
+        print(f"[2] cached {cached} (first {first}), after refresh {refreshed}, "
+              f"get(3) {registry.get(3).label if registry.get(3) else None}, get(7) {registry.get(7)}")
+        ok &= (first == cached == [0, 2, 10] and refreshed == [0, 1, 2, 3, 10]
+               and registry.scanned_at >= scanned_at and registry.get(3).name == "New Cam"
+               and registry.get(7) is None)
+
+        # [3] 핫플러그 비교 (감시 스레드의 _on_dev_change 직접 호출)
+        a, b = Listener(), Listener()
+
+        def broken(devices):
+            raise RuntimeError("listener failure")
+
+        registry.add_listener(broken)
+        registry.add_listener(a.on_change)
+        registry.add_listener(b.on_change)
+        registry._on_dev_change()                       # 변경 없음 → 알림 없음
+        unchanged = (len(a.calls), len(b.calls))
+        os.remove(os.path.join(dev_dir, "video3"))
+        registry._on_dev_change()                       # 분리
+        registry.remove_listener(a.on_change)
+        add_node(dev_dir, sys_dir, 4, "Cam 4")
+        registry._on_dev_change()                       # 연결 (a는 해제됨)
+        print(f"[3] no-change calls {unchanged}, a {a.calls}, b {b.calls}")
+        ok &= unchanged == (0, 0) and a.calls == [[0, 2, 10]] and b.calls == [[0, 2, 10], [0, 2, 4, 10]]
+
+        del b
+        gc.collect()
+        os.remove(os.path.join(dev_dir, "video4"))
+        registry._on_dev_change()
+        live = len(registry._listeners)
+        print(f"[3b] listeners after owner collected: {live} (plain function kept)")
+        ok &= live == 1
+
+        # [4] 감시 스레드 (inotify 또는 폴링)
+        reg._DevWatcher.POLL_INTERVAL = 0.2
+        inotify = reg._DevWatcher._inotify_fd()
+        if inotify is not None:
+            os.close(inotify)
+        for mode in ("inotify", "poll"):
+            if mode == "inotify" and inotify is None:
+                print("[4] inotify: skipped (not available)")
+                continue
+            if mode == "poll":
+                original_fd = reg._DevWatcher._inotify_fd
+                reg._DevWatcher._inotify_fd = staticmethod(lambda: None)
+            watched = reg.CameraRegistry(watch=True)
+            listener = Listener()
+            watched.add_listener(listener.on_change)
+            time.sleep(0.3)
+            add_node(dev_dir, sys_dir, 5, "Hotplug")
+            added = listener.event.wait(5.0)
+            listener.event.clear()
+            os.remove(os.path.join(dev_dir, "video5"))
+            removed = listener.event.wait(5.0)
+            watched.stop()
+            if mode == "poll":
+                reg._DevWatcher._inotify_fd = original_fd
+            print(f"[4] {mode}: added seen {added}, removed seen {removed}, calls {listener.calls}")
+            ok &= added and removed and listener.calls[0] == [0, 2, 5, 10] and listener.calls[-1] == [0, 2, 10]
+
+        event = struct.pack("iIII", 1, reg._IN_CREATE, 0, 16) + b"video7".ljust(16, b"\0")
+        other = struct.pack("iIII", 1, reg._IN_CREATE, 0, 16) + b"ttyUSB0".ljust(16, b"\0")
+        parsed = (reg._DevWatcher._has_video_event(other + event), reg._DevWatcher._has_video_event(other))
+        print(f"[4b] inotify event parsing: {parsed}")
+        ok &= parsed == (True, False)
+
+        # [5] 카메라 설정 다이얼로그: 감시 스레드 → 큐 → Tk 스레드 폴링
+        from src.tcp_monitor.ui.camera_settings import CameraSettingsDialog
+        dialog = CameraSettingsDialog.__new__(CameraSettingsDialog)
+        dialog.dialog = FakeDialog()
+        dialog._hotplug_events = queue.Queue()
+        refreshes = []
+        dialog._refresh_usb_cameras = lambda: refreshes.append(threading.get_ident())
+        workers = [threading.Thread(target=dialog._on_camera_hotplug, args=([],)) for _ in range(3)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        from_thread = len(dialog.dialog.after_threads)
+        dialog._poll_camera_hotplug()
+        dialog._poll_camera_hotplug()
+        main_id = threading.get_ident()
+        dialog.dialog.alive = False
+        dialog._hotplug_registered = False
+        before_close = len(dialog.dialog.scheduled)
+        dialog._poll_camera_hotplug()
+        print(f"[5] after() from watcher threads: {from_thread}, refreshes {len(refreshes)} "
+              f"(on Tk thread: {set(refreshes) == {main_id}}), rescheduled {before_close}, "
+              f"stops when closed: {len(dialog.dialog.scheduled) == before_close}")
+        ok &= (from_thread == 0 and len(refreshes) == 1 and set(refreshes) == {main_id}
+               and set(dialog.dialog.after_threads) == {main_id} and before_close == 2
+               and len(dialog.dialog.scheduled) == before_close)
+    finally:
+        reg.DEV_DIR, reg.SYSFS_V4L, reg._DevWatcher.POLL_INTERVAL = saved
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+공용 카메라 서비스 테스트
+
+실제 카메라 대신 합성 영상 파일(또는 --source로 지정한 장치/URL)을 소스로 사용하여
+- 같은 소스를 두 구독자가 공유 (장치는 한 번만 열림)
+- 구독자별 출력 해상도 / FPS 제한
+- read(timeout=0): 대기 없이 반환 (UI 스레드용, 새 프레임이 없으면 False)
+- 구독 해제 후 linger 동안 유지 → 재구독 시 재초기화 없음
+- linger 경과 후 닫힘
+을 확인합니다.
+
+사용법:
+    python test_camera_service.py [--source 0|rtsp://...] [--linger 0.5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.camera import CameraService
+
+
+def make_video(path, frames=600, size=(640, 360)):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i % 255, np.uint8))
+    writer.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공용 카메라 서비스 테스트")
+    parser.add_argument("--source", type=str, default=None, help="카메라 인덱스 또는 URL (기본: 합성 영상)")
+    parser.add_argument("--linger", type=float, default=0.5)
+    args = parser.parse_args()
+
+    source = args.source
+    if source is None:
+        source = os.path.join(tempfile.mkdtemp(prefix="camera_test_"), "synthetic.avi")
+        make_video(source)
+    elif source.isdigit():
+        source = int(source)
+
+    service = CameraService(linger=args.linger)
+    ok = True
+
+    # 1) 두 구독자가 같은 소스 공유
+    start = time.perf_counter()
+    a = service.subscribe(source, width=320, height=320, name="preview")
+    open_ms = (time.perf_counter() - start) * 1000
+    b = service.subscribe(source, fps=5, name="ai")
+    stats = service.stats()
+    print(f"open: {open_ms:.0f} ms, sources: {stats}")
+    ok &= a.isOpened() and b.isOpened() and len(stats) == 1 and stats[0]["refcount"] == 2
+
+    # 2) 출력 해상도 (비율 유지 축소)
+    ret, frame = a.read()
+    print("preview frame:", frame.shape if ret else None)
+    ok &= ret and frame.shape[1] <= 320 and frame.shape[0] <= 320
+
+    # 3) FPS 제한 (5fps 구독자는 1초에 약 5장)
+    count = 0
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < 1.0:
+        ret, _ = b.read()
+        count += ret
+    print("ai subscriber frames in 1s:", count)
+    ok &= 3 <= count <= 7
+
+    # 3b) 비대기 읽기: FPS 간격 전/새 프레임 없음(합성 영상 끝 → 재연결 대기 포함) → 바로 (False, None)
+    count = 0
+    slowest = 0.0
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < 1.0:
+        t1 = time.perf_counter()
+        ret, _ = b.read(timeout=0)
+        slowest = max(slowest, time.perf_counter() - t1)
+        count += ret
+        time.sleep(0.002)
+    print(f"non-blocking reads: {count} frames in 1s, slowest call {slowest * 1000:.1f} ms")
+    ok &= count <= 7 and slowest < 0.05
+
+    # 4) 해제 후 linger 안에 재구독 → 즉시 공유
+    a.release()
+    b.release()
+    start = time.perf_counter()
+    c = service.subscribe(source, name="reopen")
+    reopen_ms = (time.perf_counter() - start) * 1000
+    print(f"re-subscribe within linger: {reopen_ms:.1f} ms")
+    ok &= c.isOpened() and reopen_ms < 50
+    c.release()
+
+    # 5) linger 경과 후 닫힘
+    time.sleep(args.linger + 1.0)
+    print("after linger:", service.stats())
+    ok &= service.stats() == []
+
+    service.shutdown()
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
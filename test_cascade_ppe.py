@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+캐스케이드 PPE 파이프라인 좌표 테스트 (sensor/cascade_ppe.py)
+
+모델 대신 고정 박스를 돌려주는 스텁을 사용합니다 (ultralytics/가중치/captures 불필요).
+- _tiles(): 오른쪽/아래 끝을 포함해 프레임 전체를 덮는지, tile_size보다 작은 프레임 포함
+- crop_regions() / head_regions(): 프레임 경계로 클리핑
+- run_on_crops(): crop 좌표 박스를 crop 오프셋만큼 원본 좌표로 복원
+- _nms(): 겹치는 crop에서 나온 같은 클래스 중복 박스 병합 (다른 클래스는 유지)
+- from_settings(): min_person_px / merge_iou 포함 설정 반영
+
+사용법:
+    python test_cascade_ppe.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.sensor.cascade_ppe import CascadePPEPipeline
+
+
+class _Arr:
+    """torch 텐서 대용 (.cpu().numpy())"""
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float32)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values.copy()
+
+
+class _Boxes:
+    def __init__(self, dets):
+        self.xyxy = _Arr(np.reshape([b for _, _, b in dets], (-1, 4)))
+        self.cls = _Arr([c for c, _, _ in dets])
+        self.conf = _Arr([s for _, s, _ in dets])
+
+    def __len__(self):
+        return len(self.cls.values)
+
+
+class _Result:
+    def __init__(self, dets):
+        self.boxes = _Boxes(dets)
+
+
+class StubModel:
+    """호출마다 이미지별 고정 박스 [(cls, conf, (x1, y1, x2, y2)), ...] 반환 (crop 좌표)"""
+
+    def __init__(self, per_image):
+        self.per_image = per_image
+        self.calls = []
+
+    def __call__(self, images, **kwargs):
+        images = images if isinstance(images, list) else [images]
+        self.calls.append(([im.shape for im in images], kwargs))
+        return [_Result(self.per_image[i] if i < len(self.per_image) else []) for i in range(len(images))]
+
+
+def covered(tiles, h, w):
+    mask = np.zeros((h, w), dtype=bool)
+    for x0, y0, x1, y1 in tiles:
+        mask[y0:y1, x0:x1] = True
+    inside = all(0 <= x0 < x1 <= w and 0 <= y0 < y1 <= h for x0, y0, x1, y1 in tiles)
+    return bool(mask.all()) and inside
+
+
+def main():
+    ok = True
+    cascade = CascadePPEPipeline(StubModel([]), tile_size=960, tile_overlap=0.2)
+
+    # [1] _tiles: 전체 덮기 (오른쪽/아래 끝, 작은 프레임)
+    cases = {}
+    for h, w in ((1296, 2304), (1080, 1920), (2000, 961), (480, 640), (960, 960), (700, 1000)):
+        tiles = cascade._tiles(h, w)
+        cases[(h, w)] = (len(tiles), covered(tiles, h, w))
+    small = cascade._tiles(480, 640)
+    print(f"[1] tiles (count, covers frame): {cases}, 640x480 → {small}")
+    ok &= all(c for _, c in cases.values()) and small == [(0, 0, 640, 480)]
+    ok &= any(x1 == 2304 for _, _, x1, _ in cascade._tiles(1296, 2304))
+    ok &= any(y1 == 1296 for _, _, _, y1 in cascade._tiles(1296, 2304))
+
+    # [2] crop_regions / head_regions 클리핑
+    shape = (720, 1280, 3)
+    persons = [(-20.0, -30.0, 200.0, 500.0, 0.9),       # 왼쪽 위 밖으로
+               (1150.0, 300.0, 1300.0, 760.0, 0.8),      # 오른쪽 아래 밖으로
+               (500.0, 200.0, 600.0, 500.0, 0.7)]        # 내부
+    crops = cascade.crop_regions(shape, persons)
+    heads = cascade.head_regions(shape, persons)
+    inside = all(0 <= x0 < x1 <= 1280 and 0 <= y0 < y1 <= 720 for x0, y0, x1, y1 in crops + heads)
+    print(f"[2] crop regions {crops}, head regions {heads}, all inside frame: {inside}")
+    ok &= (inside and crops[0][:2] == (0, 0) and crops[1][2:] == (1280, 720)
+           and crops[2] == (485, 155, 615, 545) and all(isinstance(v, int) for r in crops + heads for v in r))
+
+    # [3] run_on_crops: crop 오프셋 복원 + 겹치는 crop 중복 병합
+    frame = np.zeros(shape, dtype=np.uint8)
+    regions = [(100, 100, 300, 400), (120, 100, 320, 400), (800, 50, 1000, 450)]
+    # 원본 (150, 150, 250, 350) 헬멧이 crop 1, 2에 모두 보임 + crop 3에 장갑
+    model = StubModel([
+        [(0, 0.9, (50, 50, 150, 250)), (3, 0.6, (50, 50, 150, 250))],
+        [(0, 0.8, (30, 50, 130, 250))],
+        [(1, 0.7, (10, 20, 60, 80))],
+    ])
+    dets = cascade.run_on_crops(model, frame, regions, conf=0.25)
+    got = sorted((c, round(s, 2), tuple(int(v) for v in b)) for c, s, b in dets)
+    shapes, kwargs = model.calls[0]
+    print(f"[3] mapped boxes {got}, crop shapes {shapes}, imgsz {kwargs.get('imgsz')}")
+    ok &= got == [(0, 0.9, (150, 150, 250, 350)), (1, 0.7, (810, 70, 860, 130)), (3, 0.6, (150, 150, 250, 350))]
+    ok &= shapes == [(300, 200, 3), (300, 200, 3), (400, 200, 3)] and kwargs.get('imgsz') == cascade.crop_imgsz
+    ok &= cascade.run_on_crops(None, frame, regions, conf=0.25) == [] and cascade.run_on_crops(model, frame, [], 0.25) == []
+
+    # [4] _nms: 같은 클래스 중복 병합, IoU가 낮으면 유지
+    near = [(0, 0.9, np.array([0, 0, 100, 100.0])), (0, 0.5, np.array([5, 5, 105, 105.0])),
+            (0, 0.4, np.array([300, 300, 400, 400.0])), (2, 0.3, np.array([0, 0, 100, 100.0]))]
+    kept = sorted((c, s) for c, s, _ in cascade._nms(near))
+    print(f"[4] nms kept {kept}")
+    ok &= kept == [(0, 0.4), (0, 0.9), (2, 0.3)] and cascade._nms(near[:1]) == near[:1]
+
+    # [5] from_settings: min_person_px / merge_iou
+    cfg = {'person_imgsz': 512, 'max_persons': 3, 'min_person_px': 40, 'merge_iou': 0.3, 'tiling': True}
+    built = CascadePPEPipeline.from_settings(None, cfg)
+    defaults = CascadePPEPipeline.from_settings(None, None)
+    print(f"[5] from_settings: min_person_px {built.min_person_px}, merge_iou {built.merge_iou}, "
+          f"defaults {defaults.min_person_px}/{defaults.merge_iou}")
+    ok &= (built.min_person_px == 40 and built.merge_iou == 0.3 and built.person_imgsz == 512
+           and built.max_persons == 3 and built.tiling and defaults.min_person_px == 24 and defaults.merge_iou == 0.5)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
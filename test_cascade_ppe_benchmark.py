@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+캐스케이드 PPE 감지 벤치마크 스크립트
+
+captures/ 폴더(또는 인자로 지정한 이미지)의 프레임으로
+전체 프레임 PPE 추론(imgsz 1280)과 캐스케이드 추론(사람 감지 → 사람 crop 배치 추론)의
+소요 시간과 감지 결과를 비교합니다.
+
+사용법:
+    python test_cascade_ppe_benchmark.py [이미지 또는 폴더 ...] [--mode 2|3] [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import cv2
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.utils.helpers import get_performance_settings
+from src.tcp_monitor.sensor.cascade_ppe import CascadePPEPipeline
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+
+def collect_images(paths):
+    images = []
+    for p in paths:
+        if os.path.isdir(p):
+            for ext in IMAGE_EXTS:
+                images.extend(glob.glob(os.path.join(p, f"*{ext}")))
+        elif os.path.isfile(p):
+            images.append(p)
+    return sorted(images)
+
+
+def count_by_class(dets, names):
+    counts = {}
+    for cls, conf, _ in dets:
+        if conf >= 0.3:
+            name = names.get(cls, f"cls_{cls}")
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def full_frame_boxes(model, frame, imgsz):
+    h, w = frame.shape[:2]
+    scale = imgsz / max(h, w)
+    resized = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_LINEAR) if scale < 1.0 else frame
+    inv = 1.0 / scale if scale < 1.0 else 1.0
+    dets = []
+    for r in model(resized, verbose=False, conf=0.01, iou=0.45, imgsz=imgsz):
+        for box in r.boxes:
+            dets.append((int(box.cls[0]), float(box.conf[0]), box.xyxy[0].cpu().numpy() * inv))
+    return dets
+
+
+def timed(fn, repeat):
+    fn()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = fn()
+    return out, (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐스케이드 PPE 감지 벤치마크")
+    parser.add_argument("paths", nargs="*", default=["captures"])
+    parser.add_argument("--mode", type=int, default=2, help="성능 모드 (2 또는 3)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    images = collect_images(args.paths)
+    if not images:
+        print(f"이미지 없음: {args.paths}")
+        return
+
+    from ultralytics import YOLO
+
+    settings = get_performance_settings(args.mode)
+    ppe_cfg = settings['yolo_ppe']
+    cascade_cfg = settings.get('ppe_cascade', {})
+
+    ppe_path = None
+    for name in (ppe_cfg.get('model'), ppe_cfg.get('model_fallback'), 'ppe_helmet_vest.pt', 'ppe_full.pt'):
+        if name and os.path.exists(os.path.join("models", name)):
+            ppe_path = os.path.join("models", name)
+            break
+    if ppe_path is None:
+        print("PPE 모델 없음 (models/ 폴더 확인)")
+        return
+
+    print(f"PPE 모델: {ppe_path}")
+    print(f"사람 감지 모델: {cascade_cfg.get('person_model', 'yolo11n.pt')}")
+    ppe_model = YOLO(ppe_path)
+    person_model = YOLO(cascade_cfg.get('person_model', 'yolo11n.pt'))
+    cascade = CascadePPEPipeline.from_settings(person_model, cascade_cfg)
+    names = ppe_model.names
+
+    print("\n" + "=" * 72)
+    print(f"{'이미지':<36} {'전체(ms)':>9} {'캐스케이드(ms)':>14} {'사람':>5}")
+    print("=" * 72)
+
+    total_full = total_cascade = 0.0
+    for path in images:
+        frame = cv2.imread(path)
+        if frame is None:
+            continue
+        if frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+
+        full_dets, full_ms = timed(lambda: full_frame_boxes(ppe_model, frame, 1280), args.repeat)
+        out, cascade_ms = timed(lambda: cascade.detect(frame, ppe_model), args.repeat)
+        total_full += full_ms
+        total_cascade += cascade_ms
+
+        h, w = frame.shape[:2]
+        label = f"{os.path.basename(path)[:26]} ({w}x{h})"
+        print(f"{label:<36} {full_ms:9.1f} {cascade_ms:14.1f} {len(out['persons']):5d}")
+        print(f"    전체 프레임: {count_by_class(full_dets, names)}")
+        print(f"    캐스케이드:  {count_by_class(out['ppe_boxes'], names)}")
+
+    n = len(images)
+    print("=" * 72)
+    print(f"평균: 전체 {total_full / n:.1f} ms, 캐스케이드 {total_cascade / n:.1f} ms ({n}장, {args.repeat}회 반복)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+HSV 색상 룩업 테이블 테스트 (utils/color_lut.py)
+
+- histograms(): 색상별 cv2.inRange 마스크 픽셀 수와 정확히 일치 (경계값 포함)
+- classify(): 규칙 순서대로 평가한 첫 번째 일치 색상과 일치
+- 빨강 0 ↔ 179 경계: 평균 Hue 대신 픽셀 다수결로 빨강 판정
+- class_stats(): 배타 색상별 픽셀 수 / BGR 합계, 여러 ROI 한 번에
+- from_ranges(): lower/upper, lower1/upper1/lower2/upper2 형식
+- center_crop / get_color_lut 공유 인스턴스
+
+사용법:
+    python test_color_lut.py [--pixels 20000]
+"""
+
+import argparse
+import os
+import sys
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.utils.color_lut import (
+    DOMINANT_COLOR_RULES, PPE_COLOR_NAMES_KR, PPE_COLOR_RULES, HSVColorLUT, center_crop, get_color_lut,
+)
+
+
+def random_hsv(rng, n):
+    """무작위 HSV (경계값 근처 포함을 위해 규칙 경계값 일부 섞음)"""
+    hsv = np.stack([rng.integers(0, 180, n), rng.integers(0, 256, n), rng.integers(0, 256, n)], axis=1)
+    edges = sorted({c for _, lo, hi in PPE_COLOR_RULES + DOMINANT_COLOR_RULES for c in lo + hi})
+    k = n // 4
+    for axis, top in enumerate((179, 255, 255)):
+        picks = [e for e in edges if e <= top] + [min(e + 1, top) for e in edges if e <= top]
+        hsv[:k, axis] = rng.choice(picks, k)
+    return hsv.astype(np.uint8).reshape(1, -1, 3)
+
+
+def first_match(rules, h, s, v):
+    for name, lo, hi in rules:
+        if lo[0] <= h <= hi[0] and lo[1] <= s <= hi[1] and lo[2] <= v <= hi[2]:
+            return name
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pixels", type=int, default=20000)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    ok = True
+
+    # [1] 겹치는 범위 카운트 = 색상별 inRange 마스크 합
+    lut = get_color_lut('dominant')
+    hsv = random_hsv(rng, args.pixels)
+    counts = lut.histograms([hsv])[0]
+    expected = np.zeros(len(lut.names))
+    for name, lo, hi in DOMINANT_COLOR_RULES:
+        mask = np.zeros(hsv.shape[:2], dtype=np.uint8)
+        for n2, lo2, hi2 in DOMINANT_COLOR_RULES:
+            if n2 == name:
+                mask |= cv2.inRange(hsv, np.array(lo2), np.array(hi2))
+        expected[lut.index[name]] = cv2.countNonZero(mask)
+    print(f"[1] histograms vs inRange: max diff {np.abs(counts - expected).max():.0f}")
+    ok &= np.array_equal(counts, expected)
+
+    # [2] 배타 분류 = 규칙 순서대로 첫 일치
+    ppe = get_color_lut('ppe')
+    hsv = random_hsv(rng, args.pixels)
+    got = ppe.classify(hsv)
+    ref = [first_match(PPE_COLOR_RULES, *map(int, px)) for px in hsv.reshape(-1, 3)]
+    ref = np.array([ppe.index[n] if n else -1 for n in ref])
+    print(f"[2] classify vs rule order: {int((got != ref).sum())} mismatches / {len(ref)}")
+    ok &= np.array_equal(got, ref) and all(n in PPE_COLOR_NAMES_KR for n in ppe.names)
+
+    # [3] 빨강 경계: Hue 2 / 177 반반 → 평균은 청록, 다수결은 빨강
+    roi = np.zeros((10, 10, 3), dtype=np.uint8)
+    roi[:, :5] = (2, 200, 200)
+    roi[:, 5:] = (177, 200, 200)
+    hist = ppe.histograms([roi], exclusive=True)[0]
+    winner = ppe.names[int(np.argmax(hist))]
+    mean_hue = ppe.class_of(roi[..., 0].mean(), 200, 200)
+    print(f"[3] red wrap: majority {winner}, mean hue -> {mean_hue}")
+    ok &= winner == 'red' and mean_hue != 'red'
+
+    # [4] class_stats: ROI 2개, 배타 픽셀 수 / BGR 합계
+    yellow = np.full((4, 4, 3), (0, 220, 240), dtype=np.uint8)
+    blue = np.full((2, 3, 3), (230, 60, 10), dtype=np.uint8)
+    bgrs = [yellow, blue]
+    hsvs = [cv2.cvtColor(b, cv2.COLOR_BGR2HSV) for b in bgrs]
+    cnt, sums = ppe.class_stats(bgrs, hsvs)
+    y, b = ppe.index['yellow'], ppe.index['blue']
+    mean_yellow = sums[0, y] / cnt[0, y]
+    print(f"[4] class_stats: yellow {cnt[0, y]:.0f} px, blue {cnt[1, b]:.0f} px, yellow mean BGR {mean_yellow}")
+    ok &= cnt[0, y] == 16 and cnt[1, b] == 6 and cnt.sum() == 22 and np.array_equal(mean_yellow, [0, 220, 240])
+
+    # [5] from_ranges + center_crop + 공유 인스턴스
+    custom = HSVColorLUT.from_ranges({
+        'red': {'lower1': [0, 100, 100], 'upper1': [10, 255, 255],
+                'lower2': [170, 100, 100], 'upper2': [179, 255, 255]},
+        'blue': {'lower': [100, 100, 100], 'upper': [130, 255, 255]},
+    })
+    classes = [custom.class_of(h, 200, 200) for h in (5, 175, 115, 50)]
+    crop = center_crop(np.zeros((8, 12, 3)))
+    tiny = center_crop(np.zeros((1, 1, 3)))
+    print(f"[5] from_ranges: {classes}, center crop {crop.shape[:2]}, tiny {tiny.shape[:2]}, "
+          f"shared: {get_color_lut('ppe') is ppe}")
+    ok &= (classes == ['red', 'red', 'blue', None] and crop.shape[:2] == (4, 6) and tiny.shape[:2] == (1, 1)
+           and get_color_lut('ppe') is ppe)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
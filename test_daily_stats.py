@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+오늘 통계(메모리 집계) 테스트
+
+임시 디렉토리의 LogManager에 측정값을 저장한 뒤
+- get_today_stats 결과가 SQL 집계(MIN/MAX/AVG/COUNT)와 같은지 (무효값 -1, 범위 밖 온도 제외)
+- 새 LogManager가 시작 시 SQLite에서 같은 값으로 초기화되는지
+- 백필(save_batch)의 오늘 값은 포함, 과거 날짜 값은 제외되는지
+- 날짜가 바뀌면 통계가 비워지는지
+- 조회 시간 (SQL 집계 대비)
+를 확인합니다.
+
+사용법:
+    python test_daily_stats.py [--rows N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.logging import DailyStatsStore, LogManager, TTLCache
+from src.tcp_monitor.utils.helpers import SENSOR_KEYS
+
+
+def sql_stats(logs, sid, peer_ip, key):
+    date = time.strftime("%Y%m%d")
+    if key == "temperature":
+        cond = f"{key} IS NOT NULL AND {key} != -1 AND {key} BETWEEN -50 AND 50"
+    else:
+        cond = f"{key} IS NOT NULL AND {key} != -1 AND {key} >= 0"
+    row = logs._get_db_connection().execute(
+        f"SELECT MIN({key}), MAX({key}), AVG({key}), COUNT({key}) FROM sensor_data "
+        f"WHERE date = ? AND sid = ? AND peer_ip = ? AND {cond}", (date, sid, peer_ip)).fetchone()
+    return None if not row[3] else {"min": row[0], "max": row[1], "avg": row[2], "count": row[3]}
+
+
+def same(a, b):
+    if a is None or b is None:
+        return a is b
+    return (a["count"] == b["count"] and abs(a["min"] - b["min"]) < 1e-9
+            and abs(a["max"] - b["max"]) < 1e-9 and abs(a["avg"] - b["avg"]) < 1e-6)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오늘 통계(메모리 집계) 테스트")
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="daily_stats_")
+    logs = LogManager(base, "127.0.0.1", 0)
+    rnd = random.Random(1)
+    peers = {"S1": "10.0.0.1:5000", "S2": "10.0.0.2:5000"}
+
+    for i in range(args.rows):
+        sid = "S1" if i % 3 else "S2"
+        data = {k: round(rnd.uniform(0, 100), 2) for k in SENSOR_KEYS}
+        data["temperature"] = rnd.choice([rnd.uniform(-10, 40), -1, 80])  # 무효값 포함
+        data["lel"] = -1
+        if i % 7 == 0:
+            data.pop("co2")
+        logs._save_to_database(sid, peers[sid], data)
+
+    # 백필: 오늘 값 2건 + 과거 날짜 값 1건
+    now = time.time()
+    logs.save_batch("S1", peers["S1"], [(1, now - 60, {"co2": 5000.0}),
+                                         (2, now - 30, {"co2": 0.5}),
+                                         (3, now - 86400 * 2, {"co2": 9999.0})])
+
+    ok = True
+    mismatches = []
+    for sid, peer in peers.items():
+        for key in SENSOR_KEYS:
+            mem = logs.get_today_stats(sid, peer, key)
+            sql = sql_stats(logs, sid, peer.split(":")[0], key)
+            if not same(mem, sql):
+                mismatches.append((sid, key, mem, sql))
+    print("memory == SQL:", not mismatches, mismatches[:2])
+    ok &= not mismatches
+    s1 = logs.get_today_stats("S1", peers["S1"], "co2")
+    ok &= s1["max"] == 5000.0 and s1["min"] <= 0.5
+    ok &= logs.get_today_stats("S1", peers["S1"], "lel") is None
+
+    # 재시작: SQLite에서 초기화
+    logs2 = LogManager(base, "127.0.0.1", 0)
+    seeded = all(same(logs2.get_today_stats(sid, peer, key), logs.get_today_stats(sid, peer, key))
+                 for sid, peer in peers.items() for key in SENSOR_KEYS)
+    print("seeded from SQLite:", seeded)
+    ok &= seeded
+
+    # 조회 시간
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        logs.get_today_stats("S1", peers["S1"], "co2")
+    mem_us = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for _ in range(100):
+        sql_stats(logs, "S1", "10.0.0.1", "co2")
+    sql_us = (time.perf_counter() - t0) * 10000
+    print(f"lookup: memory {mem_us:.1f} us, SQL {sql_us:.1f} us")
+
+    # 날짜 변경
+    day = ["20250101"]
+    store = DailyStatsStore(today=lambda: day[0])
+    store.add("20250101", "S1", "10.0.0.1", {"co2": 400})
+    before = store.get("S1", "10.0.0.1", "co2")
+    day[0] = "20250102"
+    after = store.get("S1", "10.0.0.1", "co2")
+    store.add("20250101", "S1", "10.0.0.1", {"co2": 500})   # 늦게 도착한 어제 값
+    store.add("20250102", "S1", "10.0.0.1", {"co2": 600})
+    print("rollover:", before, after, store.get("S1", "10.0.0.1", "co2"))
+    ok &= before["count"] == 1 and after is None and store.get("S1", "10.0.0.1", "co2")["min"] == 600
+
+    # LRU 캐시 크기 제한 / 만료
+    cache = TTLCache(maxsize=3, ttl=0.2)
+    for i in range(5):
+        cache.put(i, [i])
+    cache.get(2)
+    cache.put(5, [5])
+    print("lru keys:", list(cache._items))
+    ok &= len(cache) == 3 and cache.get(0) is None and cache.get(2) == [2]
+    time.sleep(0.25)
+    ok &= cache.get(2) is None
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
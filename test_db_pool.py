@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+SQLite 연결 풀 테스트 (utils/db_pool.py)
+
+- 같은 스레드는 연결 1개를 재사용하고, 스레드마다 별도 연결을 여는지
+- 연결 설정 (WAL, mmap_size, cache_size) 이 적용되는지
+- submit()이 DB 작업 스레드에서 실행되어 Future로 결과/예외를 돌려주는지
+- call_when_done()이 완료 후 결과를 넘기는지 (after 흉내 위젯)
+- transaction()이 예외 시 롤백하는지, 끝난 스레드의 연결이 정리되는지
+- FaceDatabase 추가/조회/수정/삭제와 get_active_encodings()가 풀 위에서 그대로 동작하는지
+- 조회 1000번: 매번 connect/close vs 풀 연결
+
+사용법:
+    python test_db_pool.py
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.sensor.face_database import FaceDatabase
+from src.tcp_monitor.utils.db_pool import SQLitePool, call_when_done, get_db_pool
+
+
+class _Widget:
+    """Tk after() 흉내 (타이머 스레드에서 호출)"""
+
+    def after(self, ms, fn):
+        t = threading.Timer(ms / 1000.0, fn)
+        t.daemon = True
+        t.start()
+
+
+def main():
+    tmp = tempfile.mkdtemp(prefix="db_pool_")
+    db_path = os.path.join(tmp, "pool.db")
+    ok = True
+
+    # [1] 스레드별 연결 재사용 + 연결 설정
+    pool = SQLitePool(db_path, mmap_size=32 * 1024 * 1024, cache_kib=4096)
+    conn = pool.connection()
+    same = pool.connection() is conn
+    journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    mmap = conn.execute("PRAGMA mmap_size").fetchone()[0]
+    cache = conn.execute("PRAGMA cache_size").fetchone()[0]
+    other = []
+    t = threading.Thread(target=lambda: other.append(pool.connection()))
+    t.start()
+    t.join()
+    print(f"[1] reuse: {same}, other thread: {other[0] is not conn}, journal: {journal}, "
+          f"mmap: {mmap}, cache: {cache}, opened: {pool.opened}")
+    ok &= same and other[0] is not conn and journal == "wal" and mmap == 32 * 1024 * 1024 and cache == -4096
+
+    # [2] 트랜잭션 롤백 + 끝난 스레드 연결 정리
+    with pool.transaction() as c:
+        c.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT)")
+        c.executemany("INSERT INTO t (v) VALUES (?)", [(str(i),) for i in range(10)])
+    try:
+        with pool.transaction() as c:
+            c.execute("INSERT INTO t (v) VALUES ('x')")
+            raise ValueError("중단")
+    except ValueError:
+        pass
+    rows = pool.query_one("SELECT COUNT(*) FROM t")[0]
+    t = threading.Thread(target=pool.connection)
+    t.start()
+    t.join()
+    pool.connection()
+    with pool._lock:
+        pool._prune_dead()
+    print(f"[2] rows after rollback: {rows}, connections: {pool.stats()['connections']}")
+    ok &= rows == 10 and pool.stats()["connections"] == 1
+
+    # [3] submit → Future (작업 스레드 연결), 예외 전달
+    main_ident = threading.get_ident()
+    futures = [pool.submit(lambda i=i: (threading.get_ident(), pool.query_one("SELECT v FROM t WHERE k = ?", (i + 1,))[0]))
+               for i in range(10)]
+    results = [f.result(timeout=5) for f in futures]
+    off_main = all(ident != main_ident for ident, _ in results)
+    values = [v for _, v in results] == [str(i) for i in range(10)]
+    failed = pool.submit(pool.query, "SELECT * FROM missing")
+    error = failed.exception(timeout=5)
+    print(f"[3] off main thread: {off_main}, values: {values}, error: {type(error).__name__}, "
+          f"connections: {pool.stats()['connections']}")
+    ok &= off_main and values and isinstance(error, sqlite3.OperationalError)
+
+    # [4] call_when_done
+    done, failed_done = threading.Event(), threading.Event()
+    got, errors = [], []
+    slow = pool.submit(lambda: (time.sleep(0.1), pool.query_one("SELECT COUNT(*) FROM t")[0])[1])
+    call_when_done(_Widget(), slow, lambda r: (got.append(r), done.set()))
+    call_when_done(_Widget(), failed, got.append, lambda e: (errors.append(e), failed_done.set()))
+    done.wait(2)
+    failed_done.wait(2)
+    print(f"[4] call_when_done result: {got}, error callback: {len(errors)}")
+    ok &= got == [10] and len(errors) == 1
+    pool.close()
+
+    # [5] FaceDatabase (공용 풀)
+    face_db = FaceDatabase(os.path.join(tmp, "faces.db"))
+    rng = np.random.default_rng(0)
+    encodings = rng.normal(size=(3, 512)).astype(np.float32)
+    ids = [face_db.add_face(f"사람{i}", encodings[i], employee_id=f"E{i}") for i in range(3)]
+    face_db.add_face("사람0", encodings[0] * 1.01)    # 같은 이름 → 인코딩 추가
+    face_db.update_face(ids[1], department="안전팀")
+    face_db.delete_face(ids[2])
+    active = face_db.get_active_encodings()
+    match = face_db.recognize_face_insightface(encodings[0])
+    info = face_db.get_face_info_by_id(ids[1])
+    print(f"[5] faces: {face_db.get_face_count()}, encodings: {len(active)}, "
+          f"match: {match[1] if match else None}, department: {info['department']}, "
+          f"shared pool: {face_db._pool is get_db_pool(face_db.db_path)}")
+    ok &= (face_db.get_face_count() == 2 and len(active) == 3 and match is not None and match[1] == "사람0"
+           and info["department"] == "안전팀" and np.allclose(active[0][1], encodings[0])
+           and face_db._pool is get_db_pool(face_db.db_path))
+
+    # [6] 조회 시간
+    bench = SQLitePool(db_path)
+    n = 1000
+    t0 = time.perf_counter()
+    for i in range(n):
+        c = sqlite3.connect(db_path)
+        c.execute("SELECT v FROM t WHERE k = ?", (i % 10 + 1,)).fetchone()
+        c.close()
+    adhoc_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    for i in range(n):
+        bench.query_one("SELECT v FROM t WHERE k = ?", (i % 10 + 1,))
+    pooled_ms = (time.perf_counter() - t0) * 1000
+    bench.close()
+    print(f"[6] {n} lookups: connect per query {adhoc_ms:.0f} ms → pooled {pooled_ms:.0f} ms")
+    ok &= pooled_ms < adhoc_ms
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
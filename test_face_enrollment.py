@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+얼굴 일괄 등록 엔진 테스트 (sensor/face_enrollment.py)
+
+InsightFace 대신 사진 내용에서 임베딩을 만드는 추출기(사진 8x8 축소 → 고정 투영)를 넣어
+엔진의 나머지 단계를 실제로 확인합니다.
+- CSV 읽기 (상대 경로, EUC-KR)
+- 프로세스 풀 디코딩: 큰 JPEG 축소 디코딩 → 긴 변 max_side 이하, RGB 순서
+- 중단 → 체크포인트 저장, 다시 실행하면 추출한 사진은 건너뛰고 이어서 처리
+- 중복 검사: 다른 이름의 같은 얼굴(CSV 안 / 기존 등록) 제외, 이미 등록된 같은 얼굴 제외
+- 트랜잭션 1번 등록 + 인식 색인에 새 행만 덧붙임 (DB 다시 읽지 않음), 완료 후 체크포인트 삭제
+- 얼굴 2000개 등록: add_face 반복 vs add_faces
+- 색인 다시 읽기와 덧붙임이 겹칠 때: 중복 행 없음, 빠진 행은 다음 조회 때 다시 읽음
+
+사용법:
+    python test_face_enrollment.py [--people 60]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.sensor.face_database import FaceDatabase
+from src.tcp_monitor.sensor.face_enrollment import (BulkEnrollment, _decode_image, find_duplicates,
+                                                    load_enrollment_csv)
+
+
+class ContentExtractor:
+    """사진 내용 → 임베딩 (같은 무늬 = 같은 얼굴), 검은 사진은 얼굴 없음"""
+
+    def __init__(self, cancel=None, cancel_after=None):
+        self.projection = np.random.default_rng(7).normal(size=(8 * 8 * 3, 512)).astype(np.float32)
+        self.calls = 0
+        self.images = 0
+        self.cancel = cancel
+        self.cancel_after = cancel_after
+
+    def __call__(self, images):
+        self.calls += 1
+        self.images += len(images)
+        if self.cancel is not None and self.calls >= self.cancel_after:
+            self.cancel.set()
+        out = []
+        for img in images:
+            small = cv2.resize(img, (8, 8), interpolation=cv2.INTER_AREA).astype(np.float32)
+            if small.max() < 5:
+                out.append([])
+                continue
+            out.append([((0, 8, 8, 0), (small.ravel() - 128.0) @ self.projection)])
+        return out
+
+
+def write_photo(path, seed, noise_seed, jitter=0.0):
+    """사람별 무늬 (8x8 색 격자, jitter = 같은 사람 다른 사진) + 약간의 잡음, 1600x1200 JPEG"""
+    grid = np.random.default_rng(seed).integers(0, 256, (8, 8, 3)).astype(np.float32)
+    grid += np.random.default_rng(noise_seed).normal(0, jitter, grid.shape)
+    img = cv2.resize(grid, (1600, 1200), interpolation=cv2.INTER_NEAREST)
+    img += np.random.default_rng(noise_seed).normal(0, 4, img.shape)
+    cv2.imwrite(path, np.clip(img, 0, 255).astype(np.uint8), [cv2.IMWRITE_JPEG_QUALITY, 90])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--people", type=int, default=60)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="face_enroll_")
+    photos = os.path.join(tmp, "photos")
+    os.makedirs(photos)
+    ok = True
+
+    # 사진: 사람마다 1장, 0번은 2장(같은 이름), 마지막 사람은 1번과 같은 얼굴(다른 이름),
+    # 검은 사진 1장, 없는 파일 1건
+    lines = ["이름,사원번호,부서,사진경로"]
+    for k in range(args.people):
+        seed = 1 if k == args.people - 1 else k
+        write_photo(os.path.join(photos, f"p{k}.jpg"), 1000 + seed, k)
+        lines.append(f"사람{k},E{k:04d},생산팀,photos/p{k}.jpg")
+    write_photo(os.path.join(photos, "p0_b.jpg"), 1000, 999, jitter=40)
+    lines.append("사람0,E0000,생산팀,photos/p0_b.jpg")
+    cv2.imwrite(os.path.join(photos, "black.jpg"), np.zeros((400, 300, 3), np.uint8))
+    lines.append("검은사진,,,photos/black.jpg")
+    lines.append("없는사람,,,photos/missing.jpg")
+    csv_path = os.path.join(tmp, "faces.csv")
+    with open(csv_path, "w", encoding="euc-kr") as f:
+        f.write("\n".join(lines) + "\n")
+
+    # [1] CSV / 디코딩
+    records = load_enrollment_csv(csv_path)
+    _, img, _ = _decode_image((0, records[0]['photo_path'], 640))
+    bgr = cv2.imread(records[0]['photo_path'])
+    print(f"[1] records: {len(records)}, relative → {os.path.isabs(records[0]['photo_path'])}, "
+          f"decoded {bgr.shape[1]}x{bgr.shape[0]} → {img.shape[1]}x{img.shape[0]}")
+    ok &= (len(records) == args.people + 3 and os.path.isabs(records[0]['photo_path'])
+           and max(img.shape[:2]) <= 640 and abs(img[..., ::-1].mean() - cv2.resize(bgr, img.shape[1::-1]).mean()) < 2)
+
+    # 기존 등록: 2번 사람(같은 이름) + 3번 사람 얼굴을 다른 이름으로
+    face_db = FaceDatabase(os.path.join(tmp, "faces.db"))
+    probe = ContentExtractor()
+    existing = probe([_decode_image((0, records[k]['photo_path'], 640))[1] for k in (2, 3)])
+    face_db.add_face("사람2", existing[0][0][1], employee_id="E0002")
+    face_db.add_face("기존직원", existing[1][0][1])
+    before = face_db.get_recognition_index(0)
+    loaded_at = face_db._index.loaded_at
+
+    # [2] 중단 → 체크포인트
+    cancel = threading.Event()
+    job = BulkEnrollment(face_db, records, extractor=ContentExtractor(cancel, cancel_after=1),
+                         workers=2, chunk_size=16, checkpoint_dir=tmp)
+    first = job.run(cancel)
+    print(f"[2] cancelled: {first['cancelled']}, extracted: {job.extracted}, "
+          f"checkpoint: {os.path.exists(job.checkpoint_path)}, faces in DB: {face_db.get_face_count()}")
+    ok &= first['cancelled'] and job.extracted == 16 and os.path.exists(job.checkpoint_path) and face_db.get_face_count() == 2
+
+    # [3] 이어서 처리
+    extractor = ContentExtractor()
+    progress = []
+    job = BulkEnrollment(face_db, records, extractor=extractor, workers=2, chunk_size=16, checkpoint_dir=tmp,
+                         on_progress=lambda msg, done, total: progress.append(msg))
+    resumed_from = job.extracted
+    t0 = time.perf_counter()
+    result = job.run()
+    elapsed = time.perf_counter() - t0
+    failed = {records[i]['name']: reason for i, reason in result['failed'].items()}
+    print(f"[3] resumed from {resumed_from}, decoded/extracted now: {extractor.images}, registered: "
+          f"{result['registered']} people / {result['faces']} faces in {elapsed:.2f}s")
+    for name, reason in sorted(failed.items()):
+        print(f"    {name}: {reason}")
+    last = f"사람{args.people - 1}"
+    ok &= (resumed_from == 16 and extractor.images == len(records) - 16 - 1   # 없는 파일은 추출기로 가지 않음
+           and set(failed) == {"사람1", last, "사람2", "사람3", "검은사진", "없는사람"}
+           and "중복 의심" in failed["사람1"] and "중복 의심" in failed[last]
+           and failed["사람2"] == "이미 등록됨" and "기존직원" in failed["사람3"]
+           and failed["검은사진"] == "얼굴 미검출" and failed["없는사람"] == "파일 없음"
+           and "사람0" not in failed and result['registered'] == args.people - 4 and result['faces'] == args.people - 3)
+
+    # [4] 색인 덧붙임 / 체크포인트 삭제
+    after = face_db.get_recognition_index()
+    extended = face_db._index.loaded_at == loaded_at
+    in_db = len(face_db.get_active_encodings())
+    print(f"[4] index rows {len(before['info'])} → {len(after['info'])} (DB {in_db}), appended without reload: "
+          f"{extended}, checkpoint removed: {not os.path.exists(job.checkpoint_path)}, "
+          f"faces: {face_db.get_face_count()}")
+    reloaded = face_db.get_recognition_index(0)
+    ok &= (len(after['info']) == in_db == len(before['info']) + result['faces'] and extended
+           and np.allclose(after['embeddings'], reloaded['embeddings'], atol=1e-6)
+           and [i['name'] for i in after['info']] == [i['name'] for i in reloaded['info']]
+           and not os.path.exists(job.checkpoint_path))
+
+    # [5] find_duplicates 블록 경계
+    rng = np.random.default_rng(3)
+    emb = rng.normal(size=(50, 64)).astype(np.float32)
+    emb[40] = emb[5] * 2
+    names = [f"n{i}" for i in range(50)]
+    small = find_duplicates(emb, names, block=7)
+    full = find_duplicates(emb, names)
+    print(f"[5] block result same: {small == full}, flagged: {[i for i, r in enumerate(full) if r]}")
+    ok &= small == full and [i for i, r in enumerate(full) if r] == [5, 40]
+
+    # [6] 얼굴 2000개: add_face 반복 vs add_faces
+    entries = [{'name': f"직원{i}", 'encoding': rng.normal(size=512).astype(np.float32), 'employee_id': f"W{i}",
+                'department': None, 'photo_path': None} for i in range(2000)]
+    slow_db = FaceDatabase(os.path.join(tmp, "slow.db"))
+    t0 = time.perf_counter()
+    for e in entries:
+        slow_db.add_face(e['name'], e['encoding'], e['employee_id'])
+    one_by_one = time.perf_counter() - t0
+    bulk_db = FaceDatabase(os.path.join(tmp, "bulk.db"))
+    t0 = time.perf_counter()
+    bulk_db.add_faces(entries)
+    bulk = time.perf_counter() - t0
+    print(f"[6] 2000 faces: add_face {one_by_one * 1000:.0f} ms → add_faces {bulk * 1000:.0f} ms")
+    ok &= bulk_db.get_face_count() == slow_db.get_face_count() == 2000 and bulk < one_by_one
+
+    # [7] 다시 읽기 ↔ 덧붙임 경합 (다른 스레드의 조회/등록을 그 시점에 직접 끼워 넣음)
+    race_db = FaceDatabase(os.path.join(tmp, "race.db"))
+    race_db.add_faces(entries[:10])
+    race_db.get_recognition_index(0)
+    index = race_db._index
+    original_extend, original_read = index.extend, race_db.get_active_encodings
+
+    def extend_after_reload(rows, generation=None):
+        race_db.get_recognition_index(0)   # 커밋 후 덧붙이기 전에 다시 읽기 → 새 행이 이미 들어 있음
+        original_extend(rows, generation)
+
+    index.extend = extend_after_reload
+    race_db.add_faces(entries[10:20])
+    index.extend = original_extend
+    no_dup = [i['face_id'] for i in index.snapshot()['info']]
+    refreshed = [i['face_id'] for i in race_db.get_recognition_index()['info']]
+
+    def write_during_read():
+        rows = original_read()
+        race_db.add_faces(entries[20:30])  # 읽은 뒤 반영 전에 등록 → 읽은 결과에 없음
+        return rows
+
+    race_db.get_active_encodings = write_during_read
+    stale = len(race_db.get_recognition_index(0)['info'])
+    race_db.get_active_encodings = original_read
+    recovered = [i['face_id'] for i in race_db.get_recognition_index()['info']]
+    print(f"[7] reload during add_faces: {len(no_dup)} rows (unique {len(set(no_dup))}), next lookup {len(refreshed)}; "
+          f"add_faces during reload: {stale} rows → next lookup {len(recovered)} (unique {len(set(recovered))})")
+    ok &= (len(no_dup) == len(set(no_dup)) == 20 and sorted(refreshed) == sorted(no_dup)
+           and stale == 20 and len(recovered) == len(set(recovered)) == 30)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+벡터화 화재 융합 엔진 골든 테스트
+
+무작위 센서 값(값 없음 포함)으로 스칼라 경로(FuzzyMembershipFunctions + ImprovedDempsterShafer)와
+VectorizedFireFusion의 결과가 비트 단위로 같은지 확인하고, 노드 수별 처리 시간을 비교합니다.
+
+사용법:
+    python test_fire_fusion_vectorized.py [--nodes N] [--ticks T] [--seed S]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.fire import (
+    EVIDENCE_KEYS,
+    FuzzyMembershipFunctions,
+    ImprovedDempsterShafer,
+    MultiSensorFireDetector,
+    SENSOR_WEIGHTS,
+    SensorReading,
+    VectorizedFireFusion,
+)
+
+# 센서별 무작위 값 범위 (정상 ~ 위험 구간을 모두 지나도록)
+VALUE_RANGES = {
+    'smoke': (-1.0, 90.0),
+    'co': (0.0, 250.0),
+    'temperature': (15.0, 75.0),
+    'temp_rate': (-2.0, 15.0),
+    'o2': (14.0, 21.5),
+    'co2': (400.0, 12000.0),
+    'ch4': (0.0, 60.0),
+    'h2s': (0.0, 120.0),
+    'humidity': (5.0, 70.0),
+}
+
+
+def random_values(rng, n_nodes, missing=0.25):
+    values = np.full((n_nodes, len(EVIDENCE_KEYS)), np.nan)
+    for i in range(n_nodes):
+        for e, name in enumerate(EVIDENCE_KEYS):
+            if rng.random() < missing:
+                continue
+            lo, hi = VALUE_RANGES[name]
+            # 구간 경계값 자체도 가끔 사용 (<= 비교 확인)
+            if rng.random() < 0.05:
+                values[i, e] = rng.choice([lo, hi, 10.0, 25.0, 50.0, 19.5, 40.0, 1000.0])
+            else:
+                values[i, e] = rng.uniform(lo, hi)
+    return values
+
+
+def scalar_fuse(fuzzy, combiners, node_ids, values, mode):
+    """스칼라 경로 (FireDetector.detect의 2~4단계와 동일)"""
+    out = []
+    for node_id, row in zip(node_ids, values):
+        ds = combiners[node_id]
+        mfs, weights = [], []
+        for e, name in enumerate(EVIDENCE_KEYS):
+            if np.isnan(row[e]):
+                continue
+            mfs.append(fuzzy.get_membership_function(name)(float(row[e])))
+            weights.append(SENSOR_WEIGHTS.get(name, 0.05))
+        if not mfs:
+            out.append(None)
+            continue
+        if mode == 'temporal':
+            combined = ds.combine_with_temporal(mfs, weights)
+        else:
+            combined = ds.adaptive_combine(mfs, weights)
+        out.append((combined.fire, combined.normal, combined.uncertain,
+                    ds.get_pignistic_probability(combined)))
+    return out
+
+
+def check_golden(n_nodes, ticks, seed, mode):
+    rng = random.Random(seed)
+    fuzzy = FuzzyMembershipFunctions()
+    node_ids = [f"sensor{i:03d}" for i in range(n_nodes)]
+    combiners = {nid: ImprovedDempsterShafer() for nid in node_ids}
+    engine = VectorizedFireFusion()
+
+    mismatches = 0
+    for _ in range(ticks):
+        values = random_values(rng, n_nodes)
+        expected = scalar_fuse(fuzzy, combiners, node_ids, values, mode)
+        batch = engine.fuse(node_ids, values, mode=mode)
+        for i, exp in enumerate(expected):
+            if exp is None:
+                ok = not batch.has_data[i]
+            else:
+                got = (*batch.combined[i], batch.fire_probability[i])
+                ok = bool(batch.has_data[i]) and all(float(a) == b for a, b in zip(got, exp))
+                if mode == 'adaptive':
+                    ok = ok and float(batch.conflict[i]) == combiners[node_ids[i]].last_conflict
+            if not ok:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"  불일치 {node_ids[i]}: 스칼라={exp} 벡터={batch.combined[i]}")
+    print(f"[{mode}] 노드 {n_nodes} x {ticks}틱: 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def check_murphy(n_nodes, seed):
+    """Murphy 평균 조합 비교 (가중 할인 후에는 충돌이 0.5를 넘는 경우가 드물어 직접 확인)"""
+    rng = random.Random(seed)
+    fuzzy = FuzzyMembershipFunctions()
+    engine = VectorizedFireFusion()
+    values = random_values(rng, n_nodes)
+    masses, present = engine.memberships(values)
+    f, n, u, conflict = engine.murphy_combination(masses, present, np.zeros(n_nodes))
+
+    mismatches = 0
+    for i in range(n_nodes):
+        ds = ImprovedDempsterShafer()
+        mfs = [fuzzy.get_membership_function(name)(float(values[i, e]))
+               for e, name in enumerate(EVIDENCE_KEYS) if not np.isnan(values[i, e])]
+        exp = ds.murphy_combination(mfs)
+        if (float(f[i]), float(n[i]), float(u[i]), float(conflict[i])) != \
+                (exp.fire, exp.normal, exp.uncertain, ds.last_conflict):
+            mismatches += 1
+    print(f"[murphy] 노드 {n_nodes}: 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def check_detector(n_nodes, ticks, seed):
+    """MultiSensorFireDetector 스칼라/벡터화 결과 비교 (온도 상승률, 조합 규칙, 오경보 필터 포함)"""
+    rng = random.Random(seed)
+    scalar = MultiSensorFireDetector()
+    vector = MultiSensorFireDetector(vectorized=True)
+    base = datetime(2025, 1, 1)
+
+    mismatches = 0
+    for t in range(ticks):
+        values = random_values(rng, n_nodes, missing=0.1)
+        readings = []
+        for i in range(n_nodes):
+            kwargs = {name: (None if np.isnan(values[i, e]) else float(values[i, e]))
+                      for e, name in enumerate(EVIDENCE_KEYS) if name != 'temp_rate'}
+            readings.append(SensorReading(sensor_id=f"sensor{i:03d}",
+                                          timestamp=base + timedelta(seconds=t), **kwargs))
+        expected, expected_level = scalar.detect_all(readings)
+        got, got_level = vector.detect_all(readings)
+        if expected_level != got_level:
+            mismatches += 1
+        for a, b in zip(expected, got):
+            if (a.fire_probability, a.alert_level, a.belief_fire, a.belief_normal, a.uncertainty,
+                    a.sensor_contributions, a.triggered_rules) != \
+                    (b.fire_probability, b.alert_level, b.belief_fire, b.belief_normal, b.uncertainty,
+                     b.sensor_contributions, b.triggered_rules):
+                mismatches += 1
+    print(f"[detector] 노드 {n_nodes} x {ticks}틱: 불일치 {mismatches}건")
+    return mismatches == 0
+
+
+def benchmark(seed):
+    rng = random.Random(seed)
+    fuzzy = FuzzyMembershipFunctions()
+    print("\n노드 수   스칼라(us/틱)   벡터화(us/틱)")
+    for n_nodes in (1, 8, 32, 128):
+        node_ids = [f"sensor{i:03d}" for i in range(n_nodes)]
+        combiners = {nid: ImprovedDempsterShafer() for nid in node_ids}
+        engine = VectorizedFireFusion()
+        values = random_values(rng, n_nodes)
+        repeat = 200
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            scalar_fuse(fuzzy, combiners, node_ids, values, 'temporal')
+        scalar_us = (time.perf_counter() - start) / repeat * 1e6
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            engine.fuse(node_ids, values)
+        vector_us = (time.perf_counter() - start) / repeat * 1e6
+        print(f"{n_nodes:6d} {scalar_us:15.1f} {vector_us:15.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벡터화 화재 융합 골든 테스트")
+    parser.add_argument("--nodes", type=int, default=40)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--no-bench", action="store_true", help="성능 비교 생략")
+    args = parser.parse_args()
+
+    ok = check_golden(args.nodes, args.ticks, args.seed, 'temporal')
+    ok &= check_golden(args.nodes, args.ticks, args.seed + 1, 'adaptive')
+    ok &= check_murphy(args.nodes * 5, args.seed + 3)
+    ok &= check_detector(min(args.nodes, 20), min(args.ticks, 60), args.seed + 2)
+    if not args.no_bench:
+        benchmark(args.seed)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
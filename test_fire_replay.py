@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+화재 감지 이력 재생/백테스트 테스트 (fire/replay.py)
+
+가상 텍스트 데이터 로그(LogManager.on_data 형식)를 만들어 재생합니다.
+- 센서 2개 × 8일 (5분 간격): 정상 센서 1개 + 화재 구간이 있는 센서 1개
+- 측정 시각 주입: 센서별 행 수 / 첫·마지막 시각이 로그와 일치
+- 화재 구간 감지 + 감지 소요 시간, 정상 센서 오경보 없음
+- 임계값을 크게 높이면 ("새 임계값이었다면?") 경보 단계가 낮아짐
+- AI 적응형 학습이 기록 시간축으로 진행 (7일 이후 임계값 반영, 상태 파일 저장 안 함)
+- 프로세스 풀(workers=2)과 순차 처리 결과 동일
+- 경보 구간 병합 (clear_seconds 이내 재발은 같은 구간), 헤드리스 AlertManager (TTS 미사용)
+
+사용법:
+    python test_fire_replay.py [--days 8]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.config.manager import ConfigManager
+from src.tcp_monitor.fire.models import STANDARD_THRESHOLDS
+from src.tcp_monitor.fire.replay import (
+    Incident, ReplayOptions, _EpisodeTracker, format_report, load_text_logs, run_replay,
+)
+from src.tcp_monitor.sensor.alerts import AlertManager
+
+STEP = 300  # 5분 간격
+NORMAL = {'co2': 600, 'h2s': 0, 'co': 2, 'o2': 20.9, 'temperature': 23.0, 'humidity': 50.0,
+          'lel': 0, 'smoke': 0, 'water': 0}
+
+
+def write_logs(folder, days, fire_start, fire_end):
+    """센서 2개(1: 정상, 2: 화재 구간 포함)의 데이터 로그를 날짜별 파일로 작성"""
+    start = datetime(2025, 3, 1).timestamp()
+    files = {}
+    try:
+        for i in range(days * 86400 // STEP):
+            ts = start + i * STEP
+            day = datetime.fromtimestamp(ts).strftime("%Y%m%d")
+            f = files.get(day)
+            if f is None:
+                f = files[day] = open(os.path.join(folder, f"data_{day}.log"), "w", encoding="utf-8")
+            stamp = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+            for sid, peer in (("1", "192.168.0.11:5000"), ("2", "192.168.0.12:5000")):
+                data = dict(NORMAL, temperature=23.0 + (i % 12) * 0.1)
+                if sid == "2" and fire_start <= ts < fire_end:
+                    k = (ts - fire_start) / STEP + 1
+                    data.update(smoke=min(90, 20 * k), co=min(300, 40 * k), temperature=30 + 8 * k,
+                                o2=20.9 - 0.3 * k, humidity=40 - 3 * k)
+                f.write(f"{stamp} | 0.0.0.0:9000 | {peer} | {sid} | {json.dumps(data)}\n")
+    finally:
+        for f in files.values():
+            f.close()
+    return start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=8)
+    args = parser.parse_args()
+    ok = True
+
+    folder = tempfile.mkdtemp(prefix="fire_replay_test_")
+    cwd = os.getcwd()
+    try:
+        first = datetime(2025, 3, 1).timestamp()
+        fire_start = first + 5 * 86400 + 3600
+        fire_end = fire_start + 6 * STEP
+        write_logs(folder, args.days, fire_start, fire_end)
+        incidents = [Incident(sid="2", start=fire_start, end=fire_end)]
+        rows_per_sensor = args.days * 86400 // STEP
+        os.chdir(folder)  # 학습 상태 파일이 생기면 여기서 확인
+
+        # [1] 순차 재생
+        options = ReplayOptions(adaptive=True, adapt_interval_hours=24)
+        report = run_replay(log_paths=[folder], options=options, incidents=incidents, workers=1)
+        by_sid = {s.sid: s for s in report.sensors}
+        s1, s2 = by_sid["1"], by_sid["2"]
+        print(f"[1] rows {report.total_rows:,} ({report.throughput:,.0f} rows/s), "
+              f"sensor 2 span {datetime.fromtimestamp(s2.first_ts)} ~ {datetime.fromtimestamp(s2.last_ts)}, "
+              f"peer {s2.peer_ip}")
+        ok &= (s1.rows == s2.rows == rows_per_sensor and s2.first_ts == first
+               and s2.last_ts == first + (rows_per_sensor - 1) * STEP and s2.peer_ip == "192.168.0.12")
+
+        # [2] 화재 구간 감지 / 오경보
+        fire = report.evaluate('fire')
+        print(f"[2] fire: detected {fire['detected']}, missed {fire['missed']}, "
+              f"false alarms {fire['false_alarms']}, time-to-detect {fire['time_to_detect']}")
+        ok &= (fire['detected'] == 1 and fire['false_alarms'] == 0 and fire['time_to_detect'][0] <= 2 * STEP
+               and not s1.fire_episodes and s1.fire_levels[1] + s1.fire_levels[2] == s1.rows)
+
+        # [3] AI 적응형 학습: 기록 시간축 (7일 이후 임계값 반영), 상태 파일 없음
+        print(f"[3] threshold updates: sensor 1 {s1.threshold_updates}, sensor 2 {s2.threshold_updates}, "
+              f"learning state written: {os.path.exists(os.path.join(folder, 'data'))}")
+        ok &= s1.threshold_updates >= 1 and not os.path.exists(os.path.join(folder, "data"))
+
+        # [4] 새 임계값 what-if: 연기/CO/온도 임계값을 크게 올리면 최고 단계가 낮아짐
+        strict = {k: v * 10 for k, v in STANDARD_THRESHOLDS.items() if k.startswith(('smoke', 'co_', 'temperature'))}
+        what_if = run_replay(log_paths=[folder], incidents=incidents, workers=1,
+                             options=ReplayOptions(fire_thresholds=strict, adaptive=False))
+        high = lambda r: sum(n for lv, n in r.level_counts('fire').items() if lv >= 4)
+        print(f"[4] level>=4 rows: standard {high(report)}, strict {high(what_if)}")
+        ok &= high(what_if) < high(report)
+
+        # [5] 프로세스 풀 = 순차 처리
+        pooled = run_replay(log_paths=[folder], options=options, incidents=incidents, workers=2)
+        same = {s.sid: (s.fire_levels, s.alert_levels, s.fire_episodes, s.threshold_updates)
+                for s in pooled.sensors} == {s.sid: (s.fire_levels, s.alert_levels, s.fire_episodes,
+                                                     s.threshold_updates) for s in report.sensors}
+        print(f"[5] workers=2 matches sequential: {same}")
+        ok &= same
+
+        # [6] 경보 구간 병합 + 기간 필터 + 보고서 + 헤드리스 AlertManager
+        episodes = []
+        tracker = _EpisodeTracker(alarm_level=3, clear_seconds=60, out=episodes)
+        for ts, lv, value in ((0, 3, 1.0), (30, 4, 2.0), (200, 2, 0.0), (300, 3, 1.5)):
+            tracker.update(ts, lv, value, "c")
+        grouped = load_text_logs([folder], start=fire_start, end=fire_end)
+        text = format_report(report)
+        headless = AlertManager(ConfigManager(os.devnull), enable_tts=False)
+        print(f"[6] episodes {[(e[0], e[1], e[2]) for e in episodes]}, "
+              f"filtered rows {[len(v) for v in grouped.values()]}, report lines {len(text.splitlines())}, "
+              f"headless tts: {headless._tts_enabled}")
+        ok &= (episodes == [[0, 30, 4, 2.0, "c"], [300, 300, 3, 1.5, "c"]]
+               and sorted(len(v) for v in grouped.values()) == [6, 6] and "재생 센서 2개" in text and not headless._tts_enabled)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
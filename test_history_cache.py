@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+센서 이력 캐시 테스트
+
+임시 디렉토리의 LogManager에 측정값을 저장하면서
+- get_sensor_columns 결과가 SQL 조회와 같은지 (처음 조회 / 새 행 저장 후 증분 조회)
+- 더 긴 구간 요청 시 앞부분만 추가로 읽는지
+- 캐시된 구간 안쪽 시각의 백필(save_batch) 후 무효화되어 새 값이 보이는지
+- 기존 API(get_sensor_data_for_hours, get_sensor_history_hours)가 SQL 조회와 같은 결과인지
+- 메모리 예산 초과 시 오래 안 쓴 센서부터 제거되는지
+- 갱신 시간 (SQL 전체 조회 대비)
+를 확인합니다.
+
+사용법:
+    python test_history_cache.py [--rows N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.logging import HistoryCache, LogManager
+from src.tcp_monitor.logging.history import HISTORY_COLUMNS
+
+PEER = "10.0.0.1:5000"
+
+
+def sql_columns(logs, sid, hours, since=None):
+    since = time.time() - hours * 3600 if since is None else since
+    rows = logs._get_db_connection().execute(
+        "SELECT timestamp, " + ", ".join(HISTORY_COLUMNS) + " FROM sensor_data "
+        "WHERE sid = ? AND peer_ip = ? AND timestamp >= ? ORDER BY timestamp ASC",
+        (sid, PEER.split(":")[0], since)).fetchall()
+    return rows
+
+
+def same_columns(logs, sid, hours, cols):
+    """캐시 결과 == SQL (구간 시작 경계는 조회 시각 차이만큼 어긋날 수 있어 첫 행부터 비교)"""
+    rows = sql_columns(logs, sid, hours, since=cols["timestamp"][0]) if len(cols["timestamp"]) else []
+    if abs(len(rows) - len(sql_columns(logs, sid, hours))) > 1:
+        return False
+    if len(cols["timestamp"]) != len(rows):
+        return False
+    if not rows:
+        return True
+    expected = np.array(rows, dtype=np.float64)
+    got = np.column_stack([cols["timestamp"]] + [cols[k] for k in HISTORY_COLUMNS])
+    return np.allclose(got, expected, equal_nan=True)
+
+
+def insert_old(logs, sid, n, span, rnd):
+    """과거 시각 행을 직접 INSERT (캐시 우회, 초기 데이터 준비용)"""
+    now = time.time()
+    conn = logs._get_db_connection()
+    rows = []
+    for i in range(n):
+        ts = now - span + span * i / n
+        data = {k: round(rnd.uniform(0, 100), 2) for k in HISTORY_COLUMNS}
+        if i % 11 == 0:
+            data["co2"] = None
+        if i % 13 == 0:
+            data["temperature"] = -1
+        rows.append(logs._sensor_row(ts, time.strftime("%Y%m%d", time.localtime(ts)), sid, PEER.split(":")[0], data))
+    conn.executemany(logs._INSERT_SENSOR_DATA, rows)
+    conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 이력 캐시 테스트")
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    base = tempfile.mkdtemp(prefix="history_cache_")
+    logs = LogManager(base, "127.0.0.1", 0)
+    rnd = random.Random(1)
+    insert_old(logs, "S1", args.rows, 6 * 3600, rnd)
+    ok = True
+
+    # 처음 조회 → 전체 읽기
+    cols = logs.get_sensor_columns("S1", PEER, 1)
+    first = same_columns(logs, "S1", 1, cols)
+    print("first query == SQL:", first, len(cols["timestamp"]), logs._history.stats())
+    ok &= first and logs._history.misses == 1
+
+    # 새 행 저장 후 증분 조회
+    for i in range(5):
+        logs._save_to_database("S1", PEER, {"co2": 400 + i, "temperature": 20.5})
+    cols = logs.get_sensor_columns("S1", PEER, 1)
+    inc = same_columns(logs, "S1", 1, cols)
+    print("incremental == SQL:", inc, "last co2:", cols["co2"][-1], logs._history.stats())
+    ok &= inc and logs._history.hits == 1 and cols["co2"][-1] == 404
+    ok &= not cols["co2"].flags.writeable
+
+    # 더 긴 구간 → 앞부분만 추가로 읽기
+    cols = logs.get_sensor_columns("S1", PEER, 3)
+    longer = same_columns(logs, "S1", 3, cols)
+    print("longer span == SQL:", longer, len(cols["timestamp"]))
+    ok &= longer
+    cols = logs.get_sensor_columns("S1", PEER, 1)
+    ok &= same_columns(logs, "S1", 1, cols)
+
+    # 백필 (캐시 구간 안쪽 시각) → 무효화
+    now = time.time()
+    logs.save_batch("S1", PEER, [(1, now - 600, {"co2": 12345.0})])
+    cols = logs.get_sensor_columns("S1", PEER, 1)
+    backfill = same_columns(logs, "S1", 1, cols) and 12345.0 in cols["co2"]
+    print("backfill visible:", backfill)
+    ok &= backfill
+
+    # 기존 API
+    logs._data_cache.clear()
+    for key in ("co2", "temperature"):
+        legacy = logs.get_sensor_data_for_hours("S1", PEER, key, 1)
+        if key == "temperature":
+            cond = f"{key} IS NOT NULL AND {key} != -1 AND {key} BETWEEN -50 AND 50"
+        else:
+            cond = f"{key} IS NOT NULL AND {key} != -1 AND {key} >= 0"
+        expected = logs._get_db_connection().execute(
+            f"SELECT timestamp, {key} FROM sensor_data WHERE sid = ? AND peer_ip = ? AND timestamp >= ? "
+            f"AND {cond} ORDER BY timestamp ASC", ("S1", "10.0.0.1", now - 3600 + 5)).fetchall()
+        match = legacy[-len(expected):] == expected and len(legacy) - len(expected) <= 5
+        print(f"get_sensor_data_for_hours({key}) == SQL:", match, len(legacy))
+        ok &= match
+    history = logs.get_sensor_history_hours("S1", PEER, 1)
+    rows = sql_columns(logs, "S1", 1)
+    match = (len(history) == len(rows) and history[-1]["co2"] == rows[-1][1]
+             and all((h["co2"] is None) == (r[1] is None) for h, r in zip(history, rows)))
+    print("get_sensor_history_hours shape:", match, sorted(history[0]))
+    ok &= match
+
+    # 갱신 시간: 캐시 증분 vs SQL 전체
+    t0 = time.perf_counter()
+    for _ in range(50):
+        logs._save_to_database("S1", PEER, {"co2": 500})
+        logs.get_sensor_columns("S1", PEER, 6)
+    cached_ms = (time.perf_counter() - t0) * 1000 / 50
+    t0 = time.perf_counter()
+    for _ in range(50):
+        np.array(sql_columns(logs, "S1", 6), dtype=np.float64)
+    sql_ms = (time.perf_counter() - t0) * 1000 / 50
+    print(f"refresh ({args.rows} rows): cache {cached_ms:.2f} ms, SQL {sql_ms:.2f} ms")
+    ok &= cached_ms < sql_ms
+
+    # 메모리 예산: 센서 3개 중 가장 오래 안 쓴 것 제거
+    insert_old(logs, "S2", 2000, 3600, rnd)
+    insert_old(logs, "S3", 2000, 3600, rnd)
+    conn = logs._get_db_connection()
+    cache = HistoryCache(budget_bytes=2 * 2000 * 10 * 8 + 1000)
+    for sid in ("S1", "S2", "S3"):
+        cache.query(conn, sid, "10.0.0.1", time.time() - 3600)
+    keys = list(cache._entries)
+    print("budget eviction:", keys, cache.nbytes, "<=", cache.budget_bytes)
+    ok &= ("S1", "10.0.0.1") not in cache._entries and cache.nbytes <= cache.budget_bytes
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+헤드리스 수집 코어 경로 테스트 (core/ingest.py → core/channel.py → core/remote.py)
+
+- TCP 센서 연결 → IngestCore 판정 → Unix 소켓 구독자에게 data / fire / alert 이벤트 발행
+- snapshot: 패널 키(sid@ip)별 누적 데이터/경보 키
+- RemoteLogManager: 코어 LogManager 조회 결과를 원래 형식으로 복원
+  (통계 tuple, 이력 datetime, 열 ndarray, 경보 건수 int 키)
+- 알 수 없는 요청은 CoreRequestError, 코어 종료 후에는 RemoteLogManager가 기본값 반환
+
+사용법:
+    python test_ingest_core.py
+"""
+
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.config import ConfigManager
+from src.tcp_monitor.core.channel import CoreClient, CoreRequestError
+from src.tcp_monitor.core.ingest import IngestCore, panel_key
+from src.tcp_monitor.core.remote import RemoteLogManager
+
+SID = "core-1"
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+class Events:
+    """구독 이벤트 수집"""
+
+    def __init__(self):
+        self.items = []
+        self.cond = threading.Condition()
+
+    def __call__(self, kind, payload):
+        with self.cond:
+            self.items.append((kind, payload))
+            self.cond.notify_all()
+
+    def wait(self, pred, timeout=5.0):
+        deadline = time.time() + timeout
+        with self.cond:
+            while not pred(self.items):
+                left = deadline - time.time()
+                if left <= 0:
+                    return False
+                self.cond.wait(left)
+            return True
+
+    def kinds(self):
+        with self.cond:
+            return [kind for kind, _ in self.items]
+
+
+def send_readings(port, readings):
+    """v1 sensor_update 전송 (서버는 연결별 첫 샘플을 저장하지 않음)"""
+    sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+    for data in readings:
+        msg = {"type": "sensor_update", "id": SID, "version": "TEST-1.0", "data": data}
+        sock.sendall((json.dumps(msg) + "\n").encode("utf-8"))
+        time.sleep(0.05)
+    return sock
+
+
+def main():
+    ok = True
+    tmp = tempfile.mkdtemp(prefix="ingest_core_")
+    try:
+        port = free_port()
+        cfg_path = os.path.join(tmp, "config.conf")
+        with open(cfg_path, "w", encoding="utf-8") as f:
+            f.write(f"[LISTEN]\nhost = 127.0.0.1\nport = {port}\n\n[UI]\ntab_id_policy = by_ip\n")
+        cfg = ConfigManager(cfg_path)
+        sock_path = os.path.join(tmp, "core.sock")
+
+        core = IngestCore(cfg, tmp, socket_path=sock_path)
+        core.start()
+        core.server.listening.wait(5)
+
+        events = Events()
+        client = CoreClient(sock_path, events, reconnect=False)
+        client.start()
+        connected = client.wait_connected(5)
+        hello = client.call("hello")
+        remote = RemoteLogManager(client, hello["db_path"])
+        print(f"[1] connected: {connected}, subscribers: {core.channel.subscriber_count()}, "
+              f"listen: {hello['listen']}, db: {os.path.basename(remote.db_path)}")
+        ok &= connected and core.channel.subscriber_count() == 1 and hello["listen"] == ["127.0.0.1", port]
+
+        # [2] 수신 → 이벤트 (정상 3건 후 CO₂ 경고 수준)
+        normal = {"co2": 450, "o2": 20.9, "temperature": 22.0, "humidity": 45.0}
+        sensor = send_readings(port, [normal, normal, normal, dict(normal, co2=16000)])
+        got_alert = events.wait(lambda items: any(k == "alert" for k, _ in items))
+        events.wait(lambda items: sum(k == "data" for k, _ in items) >= 4)
+        kinds = events.kinds()
+        alert = next(p for k, p in events.items if k == "alert") if got_alert else {}
+        fire_first = "fire" not in kinds or kinds.index("fire") < kinds.index("data")
+        print(f"[2] events: data {kinds.count('data')}, fire {kinds.count('fire')}, alert {kinds.count('alert')} "
+              f"(key {alert.get('key')}, level {alert.get('level')}), fire before data: {fire_first}")
+        ok &= kinds.count("data") >= 4 and got_alert and alert.get("key") == "co2" and alert.get("level", 0) >= 3
+        ok &= fire_first
+
+        # [3] snapshot (패널 키별 상태)
+        snap = client.call("snapshot")
+        key = panel_key(cfg, SID, "127.0.0.1:1")
+        state = snap[0] if snap else {}
+        print(f"[3] snapshot: {len(snap)} sensor(s), panel key {key}, data co2={state.get('data', {}).get('co2')}, "
+              f"alarm keys {state.get('alarm_keys')}, version {state.get('version')}")
+        ok &= (len(snap) == 1 and key == f"{SID}@127.0.0.1" and state["data"]["co2"] == 16000
+               and state["alarm_keys"] == ["co2"] and state["version"] == "TEST-1.0")
+
+        # [4] RemoteLogManager 조회 (첫 샘플 제외 3건 저장)
+        peer = state.get("peer", "")
+        core.logs.flush_alerts()
+        stats = remote.get_today_stats(SID, peer, "co2")
+        rows = remote.get_sensor_data_for_hours(SID, peer, "co2", 1)
+        history = remote.get_sensor_history_hours(SID, peer, 1)
+        cols = remote.get_sensor_columns(SID, peer, 1, ["co2"])
+        counts = remote.get_today_alert_counts(SID, peer)
+        print(f"[4] stats {stats}, rows {len(rows)} ({type(rows[0]).__name__ if rows else '-'}), "
+              f"history ts {type(history[0]['timestamp']).__name__ if history else '-'}, "
+              f"columns {sorted(cols) if cols else None}, alert counts {counts}")
+        ok &= len(rows) == 3 and all(isinstance(r, tuple) for r in rows)
+        ok &= len(history) == 3 and all(isinstance(r["timestamp"], datetime) for r in history)
+        ok &= (cols is not None and isinstance(cols["co2"], np.ndarray) and cols["co2"].dtype == np.float64
+               and cols["co2"].tolist() == [450.0, 450.0, 16000.0])
+        ok &= set(counts) == {3, 4, 5} and sum(counts.values()) >= 1
+
+        # [5] 실행 로그 기록 / 알 수 없는 요청
+        remote.write_run("ingest core test")
+        with open(core.logs._run_fp.name, encoding="utf-8") as f:
+            logged = "[ui] ingest core test" in f.read()
+        try:
+            client.call("no_such_method", timeout=2.0)
+            rejected = False
+        except CoreRequestError:
+            rejected = True
+        print(f"[5] write_run reached core log: {logged}, unknown method rejected: {rejected}")
+        ok &= logged and rejected
+
+        # [6] 코어 종료 → 클라이언트 연결 해제, RemoteLogManager 기본값
+        sensor.close()
+        core.stop()
+        deadline = time.time() + 5
+        while client.wait_connected(0) and time.time() < deadline:
+            time.sleep(0.05)
+        down = not client.wait_connected(0)
+        fallback = (remote.get_today_alerts_for(SID, peer), remote.get_today_alert_counts(SID, peer),
+                    remote.get_sensor_data_for_hours(SID, peer, "co2", 1))
+        print(f"[6] disconnected: {down}, defaults after stop: {fallback}")
+        ok &= down and fallback == ([], {3: 0, 4: 0, 5: 0}, [])
+        client.stop()
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
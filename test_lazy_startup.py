@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+지연 로드 / 시작 프로파일 테스트 (패키지 __init__ 지연 import + utils/startup_profiler.py)
+
+- 패키지(최상위, ui, sensor) import만으로 cv2/torch/matplotlib/tkinter와
+  SensorPanel/안전장구 감지 모듈이 로드되지 않는지 (새 프로세스에서 확인)
+- 지연 대상 이름은 첫 접근 시 로드되고 dir()에 나타나는지
+- StartupProfiler: 새로 로드되는 모듈만 시간 측정, 마일스톤 1회 기록, 보고서 출력, 제거 시 원래 import 복원
+- TcpServer.listening: listen 완료 시 set, 중지 시 clear
+
+사용법:
+    python test_lazy_startup.py
+"""
+
+import builtins
+import io
+import os
+import queue
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO)
+
+from src.tcp_monitor.utils.startup_profiler import StartupProfiler
+
+PROBE = '''
+import sys
+sys.path.insert(0, {repo!r})
+import src.tcp_monitor as pkg
+import src.tcp_monitor.ui as ui
+import src.tcp_monitor.sensor as sensor
+heavy = ("cv2", "torch", "ultralytics", "insightface", "matplotlib", "tkinter",
+         "src.tcp_monitor.ui.panel", "src.tcp_monitor.sensor.safety_detector")
+print("loaded:" + ",".join(m for m in heavy if m in sys.modules))
+print("dir:" + str("SensorPanel" in dir(ui) and "App" in dir(pkg)))
+server = pkg.TcpServer
+print("lazy:" + str(server.__module__ == "src.tcp_monitor.network.server" and "TcpServer" in vars(pkg)))
+'''
+
+
+def main():
+    ok = True
+
+    # [1] 패키지 import 시 무거운 모듈 미로드
+    out = subprocess.run([sys.executable, "-c", PROBE.format(repo=REPO)], capture_output=True, text=True,
+                         timeout=60).stdout
+    fields = dict(line.split(":", 1) for line in out.splitlines() if ":" in line)
+    print(f"[1] heavy modules after package import: [{fields.get('loaded', '?')}], "
+          f"dir lists lazy names: {fields.get('dir')}, resolved on access: {fields.get('lazy')}")
+    ok &= fields.get("loaded") == "" and fields.get("dir") == "True" and fields.get("lazy") == "True"
+
+    # [2] StartupProfiler
+    for name in [m for m in sys.modules if m.startswith("xml.dom")]:
+        del sys.modules[name]
+    original = builtins.__import__
+    profiler = StartupProfiler(top_n=5)
+    profiler.install()
+    import xml.dom.minidom  # noqa: F401  (측정 대상)
+    __import__("os.path")  # 이미 로드됨 → 측정 안 함
+    profiler.mark("first_frame")
+    first = profiler.milestones["first_frame"]
+    profiler.mark("first_frame")
+    profiler.uninstall()
+    report = io.StringIO()
+    profiler.report(file=report)
+    print(f"[2] measured xml.dom.minidom: {'xml.dom.minidom' in profiler.import_times}, os.path: "
+          f"{'os.path' in profiler.import_times}, milestone kept: {profiler.milestones['first_frame'] == first}, "
+          f"import restored: {builtins.__import__ is original}")
+    ok &= ("xml.dom.minidom" in profiler.import_times and "os.path" not in profiler.import_times
+           and profiler.milestones["first_frame"] == first and builtins.__import__ is original
+           and "first_frame" in report.getvalue() and profiler.reported)
+
+    # [3] TcpServer.listening
+    from src.tcp_monitor.network.server import TcpServer
+    server = TcpServer("127.0.0.1", 0, queue.Queue())
+    server.start()
+    up = server.listening.wait(5)
+    server.stop()
+    print(f"[3] listening set: {up}, cleared after stop: {not server.listening.is_set()}")
+    ok &= up and not server.listening.is_set()
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+실행 중 성능 계측 테스트 (utils/metrics.py)
+
+- 비활성화: 계측 호출이 값을 바꾸지 않고 time()은 공유 no-op 컨텍스트
+- 히스토그램 구간: 상한과 같은 값은 그 구간(le)에 포함, 누적 카운트, +Inf, 합계/개수/최대값, 분위수
+- Prometheus 텍스트 노출 형식: HELP/TYPE, 라벨 이스케이프, _bucket/_sum/_count, 라벨 없는 메트릭
+- 같은 이름은 같은 메트릭, labels()는 라벨 값별 자식
+- HTTP 엔드포인트: /metrics 200 + Content-Type, 그 외 경로 404
+- configure_metrics: [ENV] metrics_enabled / metrics_port
+
+사용법:
+    python test_metrics.py
+"""
+
+import math
+import os
+import socket
+import sys
+import time
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.utils import metrics as metrics_mod
+from src.tcp_monitor.utils.metrics import MetricsRegistry, configure_metrics
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+class Cfg:
+    def __init__(self, env):
+        self.env = env
+
+
+def main():
+    ok = True
+
+    # [1] 비활성화: 값 변화 없음, no-op 타이머
+    off = MetricsRegistry(enabled=False)
+    c, g, h = off.counter("c_total"), off.gauge("g"), off.histogram("h_seconds")
+    c.inc()
+    g.set(5)
+    h.observe(0.1)
+    with h.time():
+        pass
+    wrapped = h.timed(lambda x: x + 1)
+    print(f"[1] disabled: counter {c.value}, gauge {g.value}, hist count {h.count}, "
+          f"null timer shared: {h.time() is off.histogram('h_seconds').time()}, timed passthrough {wrapped(1)}")
+    ok &= c.value == 0 and g.value == 0 and h.count == 0 and h.time() is metrics_mod._NULL_TIMER and wrapped(1) == 2
+
+    # [2] 히스토그램 구간
+    reg = MetricsRegistry(enabled=True)
+    hist = reg.histogram("lat_seconds", "지연", buckets=(0.5, 0.1, 1.0))
+    for v in (0.05, 0.1, 0.3, 0.5, 0.7, 1.0, 3.0):
+        hist.observe(v)
+    print(f"[2] buckets {hist.buckets}, counts {hist.counts}, sum {hist.sum:.2f}, count {hist.count}, "
+          f"max {hist.max}, p50 {hist.quantile(0.5)}, p99 {hist.quantile(0.99)}")
+    ok &= hist.buckets == (0.1, 0.5, 1.0) and hist.counts == [2, 2, 2, 1]
+    ok &= math.isclose(hist.sum, 5.65) and hist.count == 7 and hist.max == 3.0
+    ok &= hist.quantile(0.5) == 0.5 and hist.quantile(0.99) == 3.0 and reg.histogram("x").quantile(0.5) == 0.0
+
+    with hist.time():
+        time.sleep(0.01)
+    timed = hist.timed(lambda: time.sleep(0.01))
+    timed()
+    ok &= hist.count == 9 and hist.counts[0] == 4
+
+    # [3] 같은 이름 / labels()
+    stage = reg.histogram("stage_seconds", "단계 시간", labelnames=("stage",), buckets=(0.01,))
+    same = reg.histogram("stage_seconds") is stage
+    stage.labels("ppe").observe(0.005)
+    stage.labels("ppe").observe(0.02)
+    stage.labels('a"b\\c\nd').observe(0.001)
+    child_same = stage.labels("ppe") is stage.labels("ppe")
+    reg.counter("rx_total", "수신 건수").inc(3)
+    reg.gauge("queue_depth").set(2)
+    print(f"[3] same metric by name: {same}, child reused: {child_same}, "
+          f"series: {sorted(v for v, _ in stage._series())}")
+    ok &= same and child_same and stage.labels("ppe").count == 2
+
+    # [4] Prometheus 텍스트 형식
+    text = reg.render_prometheus()
+    lines = text.splitlines()
+    expected = [
+        "# HELP lat_seconds 지연",
+        "# TYPE lat_seconds histogram",
+        'lat_seconds_bucket{le="0.1"} 4',
+        'lat_seconds_bucket{le="0.5"} 6',
+        'lat_seconds_bucket{le="1.0"} 8',
+        'lat_seconds_bucket{le="+Inf"} 9',
+        "lat_seconds_count 9",
+        "# TYPE queue_depth gauge",
+        "queue_depth 2.0",
+        "# HELP rx_total 수신 건수",
+        "# TYPE rx_total counter",
+        "rx_total 3.0",
+        'stage_seconds_bucket{stage="ppe",le="0.01"} 1',
+        'stage_seconds_bucket{stage="ppe",le="+Inf"} 2',
+        'stage_seconds_sum{stage="ppe"} 0.025',
+        'stage_seconds_count{stage="ppe"} 2',
+        'stage_seconds_bucket{stage="a\\"b\\\\c\\nd",le="0.01"} 1',
+    ]
+    missing = [e for e in expected if e not in lines]
+    names = [ln.split()[2] for ln in lines if ln.startswith("# TYPE")]
+    no_help = not any(ln.startswith("# HELP queue_depth") for ln in lines)
+    sum_line = next(ln for ln in lines if ln.startswith("lat_seconds_sum "))
+    print(f"[4] exposition: {len(lines)} lines, missing {missing}, sorted names {names}, "
+          f"no empty HELP: {no_help}, {sum_line}")
+    ok &= (not missing and names == sorted(names) and no_help and text.endswith("\n")
+           and math.isclose(float(sum_line.split()[1]), hist.sum))
+
+    # [5] 진단 패널 요약
+    rows = {(name, label): summary for name, label, kind, summary in reg.snapshot()}
+    ppe = rows[("stage_seconds", "stage=ppe")]
+    print(f"[5] snapshot: {len(rows)} series, stage=ppe {ppe}")
+    ok &= ppe["count"] == 2 and math.isclose(ppe["avg"], 0.0125) and ppe["max"] == 0.02
+    ok &= rows[("rx_total", "")] == {"value": 3.0}
+
+    # [6] HTTP 엔드포인트
+    port = free_port()
+    reg.start_http_server(port)
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+        body = resp.read().decode("utf-8")
+        ctype = resp.headers.get("Content-Type")
+    try:
+        urllib.request.urlopen(f"http://127.0.0.1:{port}/other", timeout=5)
+        status = 200
+    except urllib.error.HTTPError as e:
+        status = e.code
+    reg.stop_http_server()
+    print(f"[6] http: body matches render: {body == reg.render_prometheus()}, content-type {ctype}, "
+          f"other path {status}")
+    ok &= body == reg.render_prometheus() and ctype.startswith("text/plain; version=0.0.4") and status == 404
+
+    # [7] configure_metrics (전역 레지스트리, 끝나면 원래 상태로)
+    registry = metrics_mod.get_metrics()
+    was_enabled = registry.enabled
+    configure_metrics(Cfg({"metrics_enabled": "true", "metrics_port": "0"}))
+    on = registry.enabled and registry._http is None
+    configure_metrics(Cfg({"metrics_enabled": "false"}))
+    off_again = not registry.enabled
+    registry.enabled = was_enabled
+    print(f"[7] configure_metrics: enabled without HTTP (port 0): {on}, disabled: {off_again}")
+    ok &= on and off_again
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
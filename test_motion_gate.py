@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+움직임 게이트 테스트 (sensor/motion_gate.py)
+
+합성 프레임과 now= 주입 시각(0.125초 간격)으로 판정을 확인합니다.
+- 정적 화면: 유지 구간(hold_seconds) 후 keep-alive 실행만 남고,
+  주기가 min_keepalive → max_keepalive까지 2배씩 늘어나는지
+- 작은 물체 이동: 바로 실행, keep-alive 주기 min_keepalive로 초기화
+- 밝기 급변(조명 on/off): 배경 재설정 후 즉시 실행
+- enabled=False / None 프레임: 항상 실행
+
+사용법:
+    python test_motion_gate.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.sensor.motion_gate import MotionGate
+
+STEP = 0.125  # 8 FPS (2진 소수로 정확한 시각)
+H, W = 240, 320
+
+
+def scene(brightness=0):
+    """가로 그라데이션 정적 화면 (BGR)"""
+    row = np.linspace(40, 200, W).astype(np.int16) + brightness
+    gray = np.clip(np.tile(row, (H, 1)), 0, 255).astype(np.uint8)
+    return np.dstack([gray, gray, gray])
+
+
+def with_block(frame, x, y, size=40):
+    out = frame.copy()
+    out[y:y + size, x:x + size] = 255
+    return out
+
+
+def run_for(gate, frame_fn, start, seconds):
+    """start부터 seconds 동안 프레임 공급 → 실행한 시각 목록, 다음 시각"""
+    runs = []
+    t = start
+    end = start + seconds
+    while t < end:
+        if gate.should_run(frame_fn(t), now=t):
+            runs.append(t)
+        t += STEP
+    return runs, t
+
+
+def main():
+    ok = True
+    static = scene()
+
+    # [1] 정적 화면: 유지 구간 후 keep-alive 실행만, 주기 2배씩 증가 (최대 max_keepalive)
+    gate = MotionGate(hold_seconds=2.0, min_keepalive=0.5, max_keepalive=5.0)
+    runs, t = run_for(gate, lambda _: static, 0.0, 25.0)
+    held = [r for r in runs if r < gate.hold_seconds]
+    keepalive_runs = [r for r in runs if r >= gate.hold_seconds]
+    gaps = [b - a for a, b in zip([held[-1]] + keepalive_runs, keepalive_runs)]
+    stats = gate.get_stats()
+    print(f"[1] static: {len(held)} runs in hold, keep-alive gaps {gaps}, interval {gate.keepalive_interval}, "
+          f"skipped {stats['frames_skipped']}/{stats['frames_total']}, motion {stats['motion_score']:.3f}")
+    ok &= (len(held) == int(gate.hold_seconds / STEP)
+           and gaps[:4] == [0.5, 1.0, 2.0, 4.0] and len(gaps) > 5 and set(gaps[4:]) == {5.0}
+           and gate.keepalive_interval == 5.0
+           and stats['frames_skipped'] == stats['frames_total'] - len(runs) and stats['motion_score'] == 0.0)
+
+    # [2] 작은 물체 이동 → 즉시 실행, keep-alive 초기화, 유지 구간 동안 매 프레임 실행
+    moved = [gate.should_run(with_block(static, 100 + 8 * i, 100), now=t + i * STEP) for i in range(4)]
+    score = gate.motion_score
+    interval = gate.keepalive_interval
+    t += 4 * STEP
+    after, t = run_for(gate, lambda _: static, t, 1.0)
+    print(f"[2] moving block: runs {moved}, motion {score:.3f}, keep-alive reset to {interval}, "
+          f"runs in next 1 s (hold): {len(after)}/8")
+    ok &= all(moved) and score >= gate.motion_threshold and interval == gate.min_keepalive and len(after) == 8
+
+    # 다시 정적 상태로 안정화
+    run_for(gate, lambda _: static, t, 20.0)
+    t += 20.0
+    settled = gate.should_run(static, now=t)
+
+    # [3] 밝기 급변 → 배경 재설정 + 즉시 실행, 다음 프레임은 새 배경 기준 변화 없음
+    bright = scene(brightness=60)
+    jump = gate.should_run(bright, now=t + STEP)
+    jump_score = gate.motion_score
+    next_run = gate.should_run(bright, now=t + 2 * STEP)
+    print(f"[3] brightness jump: settled skip {not settled}, run {jump}, motion {jump_score}, "
+          f"background mean {gate._background.mean():.1f}, next frame motion {gate.motion_score}, "
+          f"keep-alive {gate.keepalive_interval}")
+    ok &= (not settled and jump and jump_score == 1.0 and next_run and gate.motion_score == 0.0
+           and gate.keepalive_interval == gate.min_keepalive and gate._background.mean() > 150)
+
+    # [4] enabled=False / None 프레임 → 항상 실행
+    off = MotionGate(enabled=False)
+    off_runs, _ = run_for(off, lambda _: static, 0.0, 20.0)
+    none_runs = [gate.should_run(None, now=t + 10 + i) for i in range(5)]
+    print(f"[4] disabled: {len(off_runs)}/160 runs, skipped {off.frames_skipped}; None frame runs {none_runs}")
+    ok &= len(off_runs) == 160 and off.frames_skipped == 0 and all(none_runs)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+안전 교육 포스터 렌더 캐시 테스트 (Tk 없이 확인 가능한 부분)
+
+- fit_size가 기존 표시 크기 계산과 같은지
+- 첫 렌더링은 원본 축소, 같은 크기의 두 번째 요청은 메모리 캐시
+- 새 캐시 인스턴스(재실행)에서는 디스크 캐시에서 읽음 (원본 디코딩 없음)
+- 파일 내용이 바뀌면 키가 바뀌어 다시 축소
+- 확대 비율이 바뀌면 다른 크기로 따로 캐시
+- 이전/다음 페이지 미리 렌더링이 작업 스레드에서 끝나는지
+- 디스크 캐시 크기 제한
+- 시간 (원본 축소 vs 디스크 캐시 vs 메모리 캐시)
+
+사용법:
+    python test_poster_cache.py [--size 3000x4000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.ui.poster_cache import PosterRenderCache, fit_size
+
+
+def legacy_size(src_size, available, zoom):
+    """기존 _update_poster_display의 표시 크기 계산 + thumbnail 결과"""
+    available_width, available_height = available
+    original_width, original_height = src_size
+    aspect_ratio = original_width / original_height
+    if available_width / available_height > aspect_ratio:
+        display_height = available_height
+        display_width = int(display_height * aspect_ratio)
+    else:
+        display_width = available_width
+        display_height = int(display_width / aspect_ratio)
+    display_width = int(display_width * zoom)
+    display_height = int(display_height * zoom)
+    if display_width > available_width:
+        display_width = available_width
+        display_height = int(display_width / aspect_ratio)
+    if display_height > available_height:
+        display_height = available_height
+        display_width = int(display_height * aspect_ratio)
+    return display_width, display_height
+
+
+def make_posters(directory, n, size, rnd):
+    paths = []
+    for i in range(n):
+        arr = rnd.integers(0, 255, (size[1] // 8, size[0] // 8, 3), dtype=np.uint8)
+        img = Image.fromarray(arr).resize(size, Image.BILINEAR)
+        path = os.path.join(directory, f"poster_{i:02d}" + (".jpg" if i % 2 == 0 else ".png"))
+        img.save(path, quality=92) if path.endswith(".jpg") else img.save(path)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포스터 렌더 캐시 테스트")
+    parser.add_argument("--size", default="3000x4000", help="포스터 원본 크기 (WxH)")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.split("x"))
+
+    tmp = tempfile.mkdtemp(prefix="poster_cache_")
+    poster_dir = os.path.join(tmp, "posters")
+    cache_dir = os.path.join(tmp, "cache")
+    os.makedirs(poster_dir)
+    rnd = np.random.default_rng(1)
+    paths = make_posters(poster_dir, 4, size, rnd)
+    with open(os.path.join(poster_dir, "broken.png"), "wb") as f:
+        f.write(b"not an image")
+    ok = True
+
+    # [1] 표시 크기 계산
+    same = all(fit_size(s, a, z) == legacy_size(s, a, z)
+               for s in [(800, 1000), (3000, 4000), (1920, 1080), (500, 500)]
+               for a in [(780, 580), (1500, 900), (600, 1200)]
+               for z in [0.7, 1.0, 1.2, 1.3])
+    print("[1] fit_size == 기존 계산:", same)
+    ok &= same
+
+    # [2] 깨진 파일 제외, 첫 렌더링 / 메모리 캐시
+    cache = PosterRenderCache(cache_dir=cache_dir)
+    sources = cache.set_sources(paths + [os.path.join(poster_dir, "broken.png")])
+    available = (1180, 880)
+    box = cache.display_size(0, available, 1.2)
+    t0 = time.perf_counter()
+    img = cache.render(0, box)
+    cold_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    again = cache.render(0, box)
+    mem_ms = (time.perf_counter() - t0) * 1000
+    expected = Image.open(paths[0])
+    expected.thumbnail(box, Image.LANCZOS)
+    print("[2] sources:", len(sources), "box:", box, "size:", img.size, "expected:", expected.size, cache.stats())
+    ok &= (len(sources) == 4 and again is img and cache.renders == 1
+           and abs(img.size[0] - expected.size[0]) <= 1 and abs(img.size[1] - expected.size[1]) <= 1)
+
+    # [3] 재실행: 디스크 캐시
+    cache2 = PosterRenderCache(cache_dir=cache_dir)
+    cache2.set_sources(paths)
+    t0 = time.perf_counter()
+    img2 = cache2.render(0, box)
+    disk_ms = (time.perf_counter() - t0) * 1000
+    same_pixels = np.array_equal(np.asarray(img2), np.asarray(img))
+    print("[3] disk hit:", cache2.disk_hits, "renders:", cache2.renders, "same pixels:", same_pixels)
+    ok &= cache2.disk_hits == 1 and cache2.renders == 0 and same_pixels
+
+    # [4] 파일 내용 변경 → 다시 축소
+    Image.new("RGB", size, (10, 20, 30)).save(paths[1])
+    cache2.set_sources(paths)
+    box1 = cache2.display_size(1, available, 1.2)
+    img3 = cache2.render(1, box1)
+    print("[4] changed file → renders:", cache2.renders, "pixel:", img3.getpixel((5, 5)))
+    ok &= cache2.renders == 1 and img3.getpixel((5, 5)) == (10, 20, 30)
+
+    # [5] 확대 비율 변경 → 다른 크기로 따로 캐시
+    small = cache2.display_size(0, available, 0.7)
+    img4 = cache2.render(0, small)
+    files = sorted(f for f in os.listdir(cache_dir) if f.endswith(".png"))
+    print("[5] zoom 0.7 box:", small, "size:", img4.size, "cache files:", len(files))
+    ok &= small != box and img4.size[0] <= small[0] and img4.size[1] <= small[1] and len(files) == 3
+
+    # [6] 이전/다음 페이지 미리 렌더링
+    cache3 = PosterRenderCache(cache_dir=os.path.join(tmp, "cache3"))
+    cache3.set_sources(paths)
+    cache3.prefetch((2, 0, 99), available, 1.2)
+    deadline = time.time() + 30
+    while cache3.pending() and time.time() < deadline:
+        time.sleep(0.01)
+    boxes = [cache3.display_size(i, available, 1.2) for i in (0, 2)]
+    ready = all(((cache3._source_key(paths[i]), b) in cache3._rendered) for i, b in zip((0, 2), boxes))
+    print("[6] prefetched:", ready, cache3.stats())
+    ok &= ready and cache3.renders == 2 and cache3.pending() == 0
+    cache3.cancel()
+
+    # [7] 디스크 캐시 크기 제한
+    limited = PosterRenderCache(cache_dir=os.path.join(tmp, "cache4"), max_disk_bytes=1)
+    limited.set_sources(paths)
+    limited.render(0, box)
+    limited.render(2, box)
+    left = [f for f in os.listdir(limited.cache_dir) if f.endswith(".png")]
+    print("[7] disk cache files over budget:", left)
+    ok &= len(left) == 0
+
+    print(f"[8] render {size[0]}x{size[1]} → {box}: 원본 {cold_ms:.1f} ms, 디스크 {disk_ms:.1f} ms, 메모리 {mem_ms:.3f} ms")
+    ok &= disk_ms < cold_ms and mem_ms < 1
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+센서 이력 보관(열 압축 청크) 테스트
+
+임시 디렉토리의 LogManager에 지난 며칠치 1초 간격 측정값을 저장한 뒤
+- 청크 인코딩/디코딩이 원본과 같은지 (timestamp float64 그대로, 소수 자릿수 값, 임의 실수, NULL 섞임,
+  전부 NULL, 일부 열만 풀기), 이전 형식(GSC1, 마이크로초 timestamp) 청크도 읽는지
+- 압축기는 [ENV] history_archive_enabled=True일 때만 시작하고 close()로 멈추는지
+- 압축 후 지난 날짜 행이 sensor_data에서 빠지고 오늘 행은 그대로인지
+- 압축 전후 read_range / 이력 캐시(get_sensor_columns) / 통계 대화상자 조회 / 화재 재생 결과가 같은지
+- 압축된 날짜로 백필된 행이 바로 조회되고, 다음 압축 때 기존 청크와 합쳐지는지
+- 지난 날짜 텍스트 로그가 .log.gz로 바뀌고 화재 재생이 그대로 읽는지
+- 저장 크기 (sensor_data 행 + 색인 대비 청크) 와 여러 날 구간 조회 시간
+을 확인합니다.
+
+사용법:
+    python test_sensor_archive.py [--days 3] [--sensors 2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.fire.replay import iter_db_rows, iter_text_log_rows, list_db_sensors
+from src.tcp_monitor.logging import LogManager
+from src.tcp_monitor.logging import archive
+from src.tcp_monitor.logging.archive import decode_chunk, encode_chunk, read_range
+from src.tcp_monitor.logging.history import HISTORY_COLUMNS
+from src.tcp_monitor.ui.sensor_statistics import SensorStatisticsDialog
+
+
+def make_day(rng, start, n):
+    """1초 간격(수신 지연 흔들림 포함) 측정값: 센서별 소수 자릿수가 다른 느린 변화"""
+    ts = start + np.arange(n) + rng.uniform(0, 0.02, n)
+    vals = np.vstack([
+        np.round(450 + np.cumsum(rng.normal(0, 0.4, n))),              # co2 (정수)
+        np.round(np.abs(rng.normal(0, 0.05, n)), 1),                   # h2s
+        np.round(np.abs(rng.normal(1, 0.2, n)), 1),                    # co
+        np.round(20.9 + rng.normal(0, 0.03, n), 2),                    # o2
+        np.round(22 + np.cumsum(rng.normal(0, 0.005, n)), 1),          # temperature
+        np.round(np.clip(50 + np.cumsum(rng.normal(0, 0.01, n)), 0, 100), 1),  # humidity
+        np.zeros(n),                                                   # lel
+        np.full(n, np.nan),                                            # smoke (센서 없음)
+        np.where(rng.random(n) < 0.001, 1.0, 0.0),                     # water
+    ])
+    vals[4, ::500] = -1            # 온도 센서 없음 표시
+    vals[0, 7::97] = np.nan        # 가끔 값 누락
+    return ts, vals
+
+
+def insert_rows(logs, sid, peer_ip, ts, vals):
+    conn = logs._get_db_connection()
+    rows = []
+    for i, t in enumerate(ts.tolist()):
+        data = {k: (None if v != v else v) for k, v in zip(HISTORY_COLUMNS, vals[:, i].tolist())}
+        rows.append(logs._sensor_row(t, time.strftime("%Y%m%d", time.localtime(t)), sid, peer_ip, data))
+    conn.executemany(logs._INSERT_SENSOR_DATA, rows)
+    conn.commit()
+
+
+def table_bytes(conn, names):
+    return sum(r[0] or 0 for r in conn.execute(
+        f"SELECT SUM(pgsize) FROM dbstat WHERE name IN ({','.join('?' * len(names))})", names))
+
+
+def same_range(a, b):
+    return np.array_equal(a[0], b[0]) and np.array_equal(a[1], b[1], equal_nan=True)
+
+
+def encode_chunk_v1(ts, vals):
+    """이전 형식 청크 (timestamp 마이크로초 정수)"""
+    us = np.round(ts * 1e6).astype(np.int64)
+    segments = [archive._pack_planes(archive._zigzag(np.diff(np.diff(us, prepend=0), prepend=0)))]
+    segments += [archive._encode_column(np.ascontiguousarray(row)) for row in vals]
+    header = archive._HEADER.pack(archive._MAGIC_V1, len(ts), len(segments) - 1)
+    return header + b"".join(len(s).to_bytes(4, "little") for s in segments) + b"".join(segments)
+
+
+class _Cfg:
+    env = {"history_archive_enabled": True}
+
+
+class _App:
+    def __init__(self, logs):
+        self.logs = logs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 이력 보관 테스트")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--sensors", type=int, default=2)
+    args = parser.parse_args()
+    rng = np.random.default_rng(7)
+    ok = True
+
+    # [1] 청크 인코딩
+    ts, vals = make_day(rng, 1.7e9, 5000)
+    mixed = np.vstack([vals, rng.normal(0, 1, (1, 5000))])   # 임의 실수 → XOR-float
+    blob = encode_chunk(ts, mixed)
+    back_ts, back_vals = decode_chunk(blob)
+    sub_ts, sub_vals = decode_chunk(blob, [9, 0])
+    exact = (np.array_equal(back_ts, ts) and np.array_equal(back_vals, mixed, equal_nan=True)
+             and np.array_equal(sub_ts, ts) and np.array_equal(sub_vals, mixed[[9, 0]], equal_nan=True))
+    v1_ts, v1_vals = decode_chunk(encode_chunk_v1(ts, mixed))
+    legacy = (np.array_equal(v1_ts, np.round(ts * 1e6) / 1e6) and np.abs(v1_ts - ts).max() < 1e-6
+              and np.array_equal(v1_vals, mixed, equal_nan=True))
+    print(f"[1] round trip (exact timestamps): {exact}, {mixed.nbytes + ts.nbytes} → {len(blob)} bytes, "
+          f"legacy GSC1 chunk: {legacy}")
+    ok &= exact and legacy
+
+    # [2] LogManager + 지난 며칠 데이터
+    base = tempfile.mkdtemp(prefix="sensor_archive_")
+    default_logs = LogManager(tempfile.mkdtemp(prefix="sensor_archive_off_"), "127.0.0.1", 9000)
+    opt_in = default_logs._archiver is None
+    default_logs.close()
+    logs = LogManager(base, "127.0.0.1", 9000, config=_Cfg())
+    thread = logs._archiver._thread
+    logs._archiver.stop()
+    print(f"[2] archiver off by default: {opt_in}, started when enabled: {thread is not None}, "
+          f"stopped: {not thread.is_alive()}")
+    ok &= opt_in and thread is not None and not thread.is_alive()
+    today0 = datetime.combine(datetime.now().date(), datetime.min.time())
+    sensors = [(f"S{i:02d}", f"10.0.0.{i + 1}") for i in range(args.sensors)]
+    for sid, peer_ip in sensors:
+        for d in range(args.days, 0, -1):
+            start = (today0 - timedelta(days=d)).timestamp()
+            insert_rows(logs, sid, peer_ip, *make_day(rng, start, 86400))
+        insert_rows(logs, sid, peer_ip, *make_day(rng, today0.timestamp(), 600))
+    conn = logs._get_db_connection()
+    conn.execute("VACUUM")
+    live_bytes = table_bytes(conn, ["sensor_data", "idx_sensor_query", "idx_date_sid", "idx_sensor_ts"])
+    past_rows = conn.execute("SELECT COUNT(*) FROM sensor_data WHERE date < ?",
+                             (today0.strftime("%Y%m%d"),)).fetchone()[0]
+    total_rows = conn.execute("SELECT COUNT(*) FROM sensor_data").fetchone()[0]
+
+    sid, peer_ip = sensors[0]
+    peer = f"{peer_ip}:5000"
+    range_start = (today0 - timedelta(days=args.days)).timestamp()
+    dialog = SensorStatisticsDialog.__new__(SensorStatisticsDialog)
+    dialog.app = _App(logs)
+    dialog._panel_range = None
+    first_day, last_day = (today0 - timedelta(days=args.days)).date(), today0.date()
+
+    before = read_range(conn, sid, peer_ip, range_start)
+    t0 = time.perf_counter()
+    stats_before = {k: dialog._get_sensor_stats(sid, peer, k, first_day, last_day, m)
+                    for k in ("co2", "temperature", "o2") for m in (1, 10)}
+    scan_before = time.perf_counter() - t0
+    raw_before = dialog._get_raw_sensor_data(sid, peer, "temperature", first_day, last_day, 60)
+    cols_before = logs.get_sensor_columns(sid, peer, args.days * 24 + 2)
+    replay_before = list_db_sensors(logs.db_path)
+    replay_rows_before = sum(1 for _ in iter_db_rows(logs.db_path, sid, peer_ip))
+
+    # 지난 날짜 텍스트 로그
+    old_tag = (today0 - timedelta(days=1)).strftime("%Y%m%d")
+    with open(os.path.join(logs.data_dir, f"data_{old_tag}.log"), "w", encoding="utf-8") as f:
+        f.write(f"{(today0 - timedelta(hours=3)).strftime('%Y-%m-%d %H:%M:%S')} | 127.0.0.1:9000 | {peer} | "
+                f'{sid} | {{"co2":455,"o2":20.9}}\n')
+
+    # [3] 압축
+    t0 = time.perf_counter()
+    result = logs._archiver.compact_once()
+    compact_s = time.perf_counter() - t0
+    conn.execute("VACUUM")
+    archive_bytes = table_bytes(conn, ["sensor_archive", "idx_archive_day", "idx_archive_range"])
+    left = conn.execute("SELECT COUNT(*) FROM sensor_data").fetchone()[0]
+    chunks = conn.execute("SELECT COUNT(*), SUM(rows) FROM sensor_archive").fetchone()
+    print(f"[3] compacted {result['chunks']} chunks / {result['rows']} rows in {compact_s:.1f}s, "
+          f"live rows left: {left} (expected {total_rows - past_rows})")
+    ok &= (chunks[0] == args.days * args.sensors and chunks[1] == past_rows
+           and left == total_rows - past_rows and result["text_logs"] == 1)
+
+    # [4] 압축 전후 조회 결과
+    after = read_range(conn, sid, peer_ip, range_start)
+    dialog._panel_range = None   # 압축 후 다시 조회
+    t0 = time.perf_counter()
+    stats_after = {k: dialog._get_sensor_stats(sid, peer, k, first_day, last_day, m)
+                   for k in ("co2", "temperature", "o2") for m in (1, 10)}
+    scan_after = time.perf_counter() - t0
+    raw_after = dialog._get_raw_sensor_data(sid, peer, "temperature", first_day, last_day, 60)
+    cols_after = logs.get_sensor_columns(sid, peer, args.days * 24 + 2)
+    replay_after = list_db_sensors(logs.db_path)
+    replay_rows_after = sum(1 for _ in iter_db_rows(logs.db_path, sid, peer_ip))
+    same_stats = all(
+        stats_before[k]["count"] == stats_after[k]["count"]
+        and all(abs(stats_before[k][f] - stats_after[k][f]) < 1e-9 for f in ("min", "max", "avg"))
+        for k in stats_before)
+    # 조회 시각 차이로 구간 시작이 움직이므로 뒤쪽 공통 구간을 비교
+    n = min(len(cols_before["timestamp"]), len(cols_after["timestamp"]))
+    same_cols = (n > 0 and np.array_equal(cols_before["timestamp"][-n:], cols_after["timestamp"][-n:])
+                 and all(np.array_equal(cols_before[k][-n:], cols_after[k][-n:], equal_nan=True)
+                         for k in HISTORY_COLUMNS))
+    print(f"[4] read_range: {same_range(before, after)}, stats: {same_stats}, raw 60min: {raw_before == raw_after}, "
+          f"history cache: {same_cols}, replay: {replay_before == replay_after} ({replay_rows_after} rows)")
+    ok &= (same_range(before, after) and same_stats and raw_before == raw_after and same_cols
+           and replay_before == replay_after and replay_rows_before == replay_rows_after)
+
+    # [5] 압축된 날짜로 백필 → 바로 조회, 다음 압축 때 청크와 합침
+    backfill_ts = (today0 - timedelta(days=1, hours=-5)).timestamp() + 0.5
+    logs.save_batch(sid, peer, [(1, backfill_ts, {"co2": 999.0, "o2": 20.5})])
+    merged = read_range(conn, sid, peer_ip, range_start)
+    visible = len(merged[0]) == len(after[0]) + 1 and bool(np.all(np.diff(merged[0]) >= 0))
+    logs._archiver.compact_once()
+    again = read_range(conn, sid, peer_ip, range_start)
+    day_rows = conn.execute("SELECT rows FROM sensor_archive WHERE sid = ? AND peer_ip = ? AND date = ?",
+                            (sid, peer_ip, old_tag)).fetchone()[0]
+    print(f"[5] backfill visible before compaction: {visible}, merged into chunk: {same_range(merged, again)}, "
+          f"chunk rows: {day_rows}")
+    ok &= visible and same_range(merged, again) and day_rows == 86401
+
+    # [6] 텍스트 로그 gzip
+    names = sorted(os.listdir(logs.data_dir))
+    text_rows = list(iter_text_log_rows([logs.data_dir]))
+    gz_ok = f"data_{old_tag}.log.gz" in names and f"data_{old_tag}.log" not in names
+    print(f"[6] text logs: {names}, replay reads gz: {any(r[3].get('co2') == 455 for r in text_rows)}")
+    ok &= gz_ok and any(r[3].get("co2") == 455 for r in text_rows)
+
+    # [7] 크기 / 조회 시간
+    live_per_row = live_bytes / total_rows
+    ratio = (live_per_row * past_rows) / archive_bytes
+    print(f"[7] sensor_data {live_bytes / 1e6:.1f} MB ({live_per_row:.0f} B/row) → "
+          f"chunks {archive_bytes / 1e6:.2f} MB for {past_rows} rows: {ratio:.1f}x smaller")
+    print(f"    {args.days}-day stats scan (6 queries): rows {scan_before * 1000:.0f} ms → chunks {scan_after * 1000:.0f} ms")
+    ok &= ratio >= 10 and scan_after < scan_before
+
+    # [8] close(): 압축기 중지 + 연결 닫기 (다시 시작하지 않음)
+    archiver = logs._archiver
+    archiver.start()
+    logs.close()
+    print(f"[8] close: archiver thread stopped: {not archiver._thread.is_alive()}, detached: {logs._archiver is None}, "
+          f"db closed: {logs._db_conn is None}")
+    ok &= not archiver._thread.is_alive() and logs._archiver is None and logs._db_conn is None
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+sensor_batch 백필 수신 테스트
+
+임시 디렉토리에 LogManager + TcpServer를 띄우고 sensor_batch를 보낸 뒤
+- 시퀀스 범위 확인(acked/rejected)
+- 같은 배치 재전송 시 중복 저장 없음
+- 재부팅 후 seq가 0부터 다시 시작: 새 boot_id 또는 (boot_id 없는 구버전) 다른 측정 시각이면 저장
+- MAX_BATCH_READINGS 초과 배치는 BATCH_TOO_LARGE 오류, 아무것도 저장하지 않음
+- 보관 기간이 지난 중복 방지 기록 정리, 이전 형식 sensor_batch_seq 테이블 이전
+- UI 큐에는 연결 상태 갱신만 들어가는지
+- 처리량 (측정값/초)
+를 확인합니다.
+
+사용법:
+    python test_sensor_batch.py [--readings N] [--batch-size B]
+"""
+
+import argparse
+import json
+import os
+import queue
+import socket
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.logging.manager import LogManager
+from src.tcp_monitor.network.server import TcpServer
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+class Client:
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+        self.buf = b""
+
+    def send(self, msg):
+        self.sock.sendall((json.dumps(msg) + "\n").encode("utf-8"))
+
+    def recv(self, msg_type, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            while b"\n" in self.buf:
+                line, self.buf = self.buf.split(b"\n", 1)
+                msg = json.loads(line)
+                if msg.get("type") == msg_type:
+                    return msg
+            self.buf += self.sock.recv(65536)
+        raise TimeoutError(msg_type)
+
+
+def make_batch(sid, seqs, base_ts, boot_id=None):
+    readings = [{"seq": seq, "ts": base_ts + seq, "data": {"co2": 400 + seq % 50, "temperature": 21.5}}
+                for seq in seqs]
+    batch = {"type": "sensor_batch", "id": sid, "protocol_version": "2.0",
+             "msg_id": f"batch-{seqs[0]}", "readings": readings}
+    if boot_id is not None:
+        batch["boot_id"] = boot_id
+    return batch
+
+
+def count_rows(log, sid):
+    conn = sqlite3.connect(log.db_path)
+    n = conn.execute("SELECT COUNT(*) FROM sensor_data WHERE sid = ?", (sid,)).fetchone()[0]
+    conn.close()
+    return n
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sensor_batch 백필 수신 테스트")
+    parser.add_argument("--readings", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="batch_test_")
+    port = free_port()
+    log = LogManager(tmp, "127.0.0.1", port)
+    q = queue.Queue()
+    server = TcpServer("127.0.0.1", port, q, logger=log)
+    server.start()
+    server.listening.wait(5.0)
+
+    ok = True
+    client = Client(port)
+    client.send({"type": "hello", "id": "pi-1", "protocol_version": "2.0", "msg_id": "h"})
+    client.recv("hello_ack")
+
+    base_ts = time.time() - args.readings - 60
+
+    # 1) 정상 배치 + 형식 오류 1건
+    batch = make_batch("pi-1", list(range(0, 10)), base_ts)
+    batch["readings"].append({"seq": 10, "ts": "bad", "data": {}})
+    client.send(batch)
+    ack = client.recv("sensor_batch_ack")
+    print("ack:", ack["acked"], "rejected:", ack["rejected"], "stored:", ack["stored"])
+    ok &= ack["acked"] == [[0, 9]] and ack["rejected"] == [[10, 10]] and ack["stored"] == 10
+
+    # 2) 재전송 (일부 겹침) → 겹친 부분은 duplicates
+    client.send(make_batch("pi-1", list(range(5, 15)), base_ts))
+    ack = client.recv("sensor_batch_ack")
+    print("retransmit ack:", ack["acked"], "stored:", ack["stored"], "duplicates:", ack["duplicates"])
+    ok &= ack["acked"] == [[5, 14]] and ack["stored"] == 5 and ack["duplicates"] == 5
+
+    # 3) 처리량
+    start = time.perf_counter()
+    seq = 100
+    total = 0
+    while total < args.readings:
+        n = min(args.batch_size, args.readings - total)
+        client.send(make_batch("pi-1", list(range(seq, seq + n)), base_ts))
+        client.recv("sensor_batch_ack", timeout=30.0)
+        seq += n
+        total += n
+    elapsed = time.perf_counter() - start
+    print(f"throughput: {total} readings in {elapsed:.2f}s ({total / elapsed:.0f} readings/s)")
+
+    conn = sqlite3.connect(log.db_path)
+    rows = conn.execute("SELECT COUNT(*), COUNT(DISTINCT timestamp) FROM sensor_data WHERE sid = 'pi-1'").fetchone()
+    conn.close()
+    print("rows in sensor_data:", rows)
+    ok &= rows[0] == rows[1] == 15 + args.readings
+
+    # 4) 재부팅: seq 0부터 다시 시작
+    before = count_rows(log, "pi-1")
+    client.send(make_batch("pi-1", list(range(0, 10)), base_ts + 100000, boot_id="boot-2"))
+    ack = client.recv("sensor_batch_ack")
+    client.send(make_batch("pi-1", list(range(0, 10)), base_ts + 100000, boot_id="boot-2"))
+    again = client.recv("sensor_batch_ack")
+    print("reboot (new boot_id) ack:", ack["acked"], "stored:", ack["stored"], "boot:", ack["boot_id"],
+          "| retransmit duplicates:", again["duplicates"])
+    ok &= ack["stored"] == 10 and ack["boot_id"] == "boot-2" and again["stored"] == 0 and again["duplicates"] == 10
+
+    # 구버전 센서 (boot_id 없음): 같은 seq라도 측정 시각이 다르면 새 측정값
+    client.send(make_batch("pi-1", list(range(0, 10)), base_ts + 200000))
+    ack = client.recv("sensor_batch_ack")
+    print("reboot (no boot_id, new timestamps) stored:", ack["stored"], "duplicates:", ack["duplicates"])
+    ok &= ack["stored"] == 10 and ack["duplicates"] == 0 and count_rows(log, "pi-1") == before + 20
+
+    # 5) 너무 큰 배치 → 오류, 저장 없음
+    limit = server.protocol.MAX_BATCH_READINGS
+    before = count_rows(log, "pi-1")
+    client.send(make_batch("pi-1", list(range(500000, 500000 + limit + 1)), base_ts, boot_id="boot-3"))
+    error = client.recv("error")
+    print("oversized batch:", error.get("error_code"), "-", error.get("error_message"))
+    ok &= error.get("error_code") == "BATCH_TOO_LARGE" and count_rows(log, "pi-1") == before
+
+    # 6) 보관 기간이 지난 중복 방지 기록 정리
+    with log._db_lock:
+        conn = log._get_db_connection()
+        conn.execute("UPDATE sensor_batch_seq SET received = received - ? WHERE boot_id = 'boot-2'",
+                     (log.BATCH_SEQ_RETENTION + 60,))
+        conn.commit()
+        log._prune_batch_seq(conn, time.time())
+        left = conn.execute("SELECT COUNT(*) FROM sensor_batch_seq WHERE boot_id = 'boot-2'").fetchone()[0]
+        total = conn.execute("SELECT COUNT(*) FROM sensor_batch_seq").fetchone()[0]
+    print(f"prune: boot-2 records left {left}, total {total}")
+    ok &= left == 0 and total > 0
+
+    # UI 큐에는 빈 데이터(연결 상태 갱신)만
+    items = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    ok &= all(kind == "__data__" and not payload["data"] for kind, payload in items)
+
+    server.stop()
+
+    # 7) 이전 형식 테이블 ((sid, seq) 키) → boot_id 빈 문자열로 이전
+    old_dir = tempfile.mkdtemp(prefix="batch_test_old_")
+    os.makedirs(os.path.join(old_dir, "logs"))
+    conn = sqlite3.connect(os.path.join(old_dir, "logs", "sensor_data.db"))
+    conn.execute("CREATE TABLE sensor_batch_seq (sid TEXT NOT NULL, seq INTEGER NOT NULL, "
+                 "timestamp REAL NOT NULL, PRIMARY KEY (sid, seq)) WITHOUT ROWID")
+    conn.executemany("INSERT INTO sensor_batch_seq VALUES ('pi-9', ?, ?)", [(i, base_ts + i) for i in range(5)])
+    conn.commit()
+    conn.close()
+    old_log = LogManager(old_dir, "127.0.0.1", port)
+    stored, duplicates = old_log.save_batch(
+        "pi-9", "127.0.0.1:1", [(i, base_ts + i, {"co2": 400.0}) for i in range(7)])
+    print(f"migrated table: stored {stored}, duplicates {duplicates}")
+    ok &= stored == [5, 6] and duplicates == [0, 1, 2, 3, 4]
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+AI 단계별 시간 예산 컨트롤러 테스트 (sensor/stage_budget.py)
+
+모델 대신 단계별 가상 추론 시간(해상도 배율² 비례)을 기록하여 계획을 확인합니다.
+- 저사양 PC 모드 3 (PPE 150ms, 보조 80ms, 얼굴 60ms, COCO 200ms, Legacy 10ms):
+  프레임당 평균 비용이 1/target_fps 이하, 프레임 1장 비용이 목표 지연 이하로 유지되는지
+- 우선순위: 사물(COCO)이 PPE/얼굴보다 먼저 주기가 늘어나는지, 모든 단계가 계속 실행되는지
+- 주기를 최대로 늘려도 모자라면 입력 해상도를 낮추는지
+- 부하가 줄면 주기 1 / 해상도 100%로 되돌아오는지
+- 사용하지 않게 된 단계는 계획에서 빠지는지
+- measure() 중첩: 바깥 단계 시간에서 안쪽 단계 시간 제외
+- accept_frame(): 목표 FPS 간격으로만 프레임 공급
+- input_size(): 배율/최소값/32 배수 (안전화 단계는 연결된 PPE 단계 배율)
+- 사용하는 쪽마다 예산: 측정 시간(StageCosts)만 공유, 주기/프레임/프레임 공급/이전 결과는 따로
+- 'ppe_v10'(거울보기 YOLOv10) 실행이 'ppe'(통합 감지) 주기를 막지 않는지
+- active_stage_budget(): begin_frame ~ end_frame 사이 같은 스레드에서만 그 예산
+
+사용법:
+    python test_stage_budget.py [--frames 400]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.sensor.stage_budget import (StageBudget, StageCosts, active_stage_budget,
+                                                  configure_stage_budgets, get_stage_budgets)
+
+
+WEAK_PC = {'ppe': 0.150, 'boots': 0.080, 'face': 0.060, 'coco': 0.200, 'legacy': 0.010}
+SIM_STAGES = tuple(WEAK_PC)
+
+
+def new_budget(**kwargs):
+    """테스트끼리 측정값이 섞이지 않도록 StageCosts를 따로 사용"""
+    return StageBudget(costs=StageCosts(), **kwargs)
+
+
+def simulate(budget, costs, frames, stages=SIM_STAGES):
+    """가상 프레임 실행 → 프레임별 비용 목록 (초)"""
+    per_frame = []
+    for _ in range(frames):
+        budget.begin_frame()
+        spent = 0.0
+        for s in stages:
+            if budget.due(s):
+                t = costs[s] * budget.scale(s) ** 2
+                budget.record(s, t)
+                spent += t
+        budget.end_frame()
+        per_frame.append(spent)
+    return per_frame
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=400)
+    args = parser.parse_args()
+    ok = True
+
+    # [1] 예산 없음: 매 프레임 전체 실행
+    off = new_budget(target_fps=6.0, target_latency=0.4, enabled=False)
+    cost_off = simulate(off, WEAK_PC, 50)
+    avg_off = sum(cost_off) / len(cost_off)
+    print(f"[1] budget off: {avg_off * 1000:.0f} ms/frame (target {1000 / 6.0:.0f} ms)")
+    ok &= abs(avg_off - sum(WEAK_PC.values())) < 1e-9
+
+    # [2] 저사양 PC 모드 3
+    budget = new_budget(target_fps=6.0, target_latency=0.4)
+    runs_before = {}
+    cost = simulate(budget, WEAK_PC, args.frames)
+    tail = cost[-100:]
+    plan = {st['stage']: st for st in budget.snapshot()['stages']}
+    for s in SIM_STAGES:
+        runs_before[s] = plan[s]['runs']
+    recent = simulate(budget, WEAK_PC, 60)
+    plan2 = {st['stage']: st for st in budget.snapshot()['stages']}
+    all_run = all(plan2[s]['runs'] > runs_before[s] for s in SIM_STAGES)
+    avg = sum(tail) / len(tail)
+    print(f"[2] budget on: {avg * 1000:.0f} ms/frame avg, max {max(tail) * 1000:.0f} ms/frame, "
+          f"all stages still run: {all_run}")
+    for s in SIM_STAGES:
+        print(f"    {s:7s} {plan[s]['ms']:6.1f} ms  every {plan[s]['interval']}  scale {plan[s]['scale']:.2f}")
+    ok &= (avg <= budget.frame_budget * 1.05 and max(tail + recent) <= budget.target_latency + 1e-9
+           and all_run and plan['coco']['interval'] >= plan['ppe']['interval']
+           and plan['coco']['interval'] >= plan['face']['interval'])
+
+    # [2b] 더 느린 PC (3배): 주기를 최대로 늘려도 모자라면 해상도 축소
+    slow = new_budget(target_fps=6.0, target_latency=0.4)
+    tail = simulate(slow, {s: c * 3 for s, c in WEAK_PC.items()}, args.frames)[-100:]
+    plan = {st['stage']: st for st in slow.snapshot()['stages']}
+    avg = sum(tail) / len(tail)
+    print(f"[2b] 3x slower: {avg * 1000:.0f} ms/frame avg, scales {[plan[s]['scale'] for s in SIM_STAGES]}")
+    ok &= avg <= slow.frame_budget * 1.05 and plan['coco']['scale'] < 1.0 and plan['ppe']['scale'] < 1.0
+
+    # [3] 부하 감소 (예: GPU 여유) → 주기/해상도 복귀
+    light = {s: c / 10 for s, c in WEAK_PC.items()}
+    simulate(budget, light, args.frames)
+    plan = {st['stage']: st for st in budget.snapshot()['stages']}
+    restored = all(plan[s]['interval'] == 1 and plan[s]['scale'] == 1.0 for s in SIM_STAGES)
+    print(f"[3] light load: intervals {[plan[s]['interval'] for s in SIM_STAGES]}, "
+          f"scales {[plan[s]['scale'] for s in SIM_STAGES]}")
+    ok &= restored
+
+    # [4] COCO 사용 중지 → 계획에서 제외
+    simulate(budget, WEAK_PC, args.frames, stages=('ppe', 'boots', 'face', 'legacy'))
+    plan = {st['stage']: st for st in budget.snapshot()['stages']}
+    rest = [s for s in SIM_STAGES if s != 'coco']
+    print(f"[4] coco active: {plan['coco']['active']}, others: {[plan[s]['interval'] for s in rest]}")
+    ok &= not plan['coco']['active'] and all(plan[s]['active'] for s in rest)
+
+    # [5] measure() 중첩
+    nested = new_budget()
+    nested.begin_frame()
+    with nested.measure('ppe'):
+        time.sleep(0.03)
+        with nested.measure('boots'):
+            time.sleep(0.02)
+    nested.end_frame()
+    plan = {st['stage']: st for st in nested.snapshot()['stages']}
+    print(f"[5] nested: ppe {plan['ppe']['ms']:.0f} ms, boots {plan['boots']['ms']:.0f} ms, "
+          f"frame {nested.snapshot()['frame_ms']:.0f} ms")
+    ok &= 25 <= plan['ppe']['ms'] < 45 and 15 <= plan['boots']['ms'] < 35
+
+    # [6] accept_frame: 20 FPS 목표로 0.5초 동안 공급
+    feeder = new_budget(target_fps=20.0)
+    accepted = 0
+    t0 = time.perf_counter()
+    while time.perf_counter() - t0 < 0.5:
+        accepted += feeder.accept_frame()
+        time.sleep(0.002)
+    print(f"[6] accepted {accepted} frames in 0.5 s at 20 FPS target")
+    ok &= 9 <= accepted <= 11
+
+    # [7] input_size
+    sizes = new_budget()
+    sizes._level['ppe'] = 2
+    sizes._level['face'] = 1
+    sizes._level['ppe_v10'] = 1
+    result = (sizes.input_size('ppe', 640), sizes.input_size('boots', 1280),
+              sizes.input_size('face', 480), sizes.input_size('coco', 640),
+              sizes.input_size('ppe_v10', 640), sizes.input_size('boots_v10', 640))
+    print(f"[7] input sizes: {result}")
+    ok &= result == (320, 640, 352, 640, 480, 480)
+
+    # [8] 사용하는 쪽마다 예산 (거울보기 패널 / 서명 화면 감지기), 측정 시간만 공유
+    shared = StageCosts()
+    panel = StageBudget(target_fps=6.0, target_latency=0.4, costs=shared, name="panel")
+    signature = StageBudget(target_fps=6.0, target_latency=0.4, costs=shared, name="signature")
+    simulate(panel, {'ppe_v10': 0.150, 'boots_v10': 0.080, 'face': 0.060, 'coco': 0.200}, 100,
+             stages=('ppe_v10', 'boots_v10', 'face', 'coco'))
+    panel.results['boots_v10'] = ['boots']
+    untouched = all(v == 0 for v in signature._since.values())  # 패널 실행이 서명 화면 주기에 영향 없음
+    signature.begin_frame()
+    signature_first = signature.due('face')  # 패널이 방금 face를 실행했어도 서명 화면 첫 프레임은 실행
+    signature.end_frame()
+    accepted = (panel.accept_frame(), signature.accept_frame())
+    print(f"[8] frames panel {panel.frames} / signature {signature.frames}, signature since unchanged: "
+          f"{untouched}, shared face {shared.expected('face') * 1000:.0f} ms, "
+          f"signature face due: {signature_first}, accept both: {accepted}, "
+          f"signature results: {signature.results}")
+    ok &= (panel.frames == 100 and signature.frames == 1 and untouched
+           and abs(shared.expected('face') - 0.060) < 1e-9 and signature_first and accepted == (True, True)
+           and signature.results == {} and panel.interval('coco') > 1 and signature.interval('coco') == 1)
+
+    # [8b] 같은 예산에서 'ppe_v10' 실행이 'ppe' 주기를 막지 않음 (패널 프레임 안 detect_all 대체 경로)
+    mixed = new_budget(target_fps=6.0, target_latency=0.4)
+    simulate(mixed, {'ppe_v10': 0.150, 'ppe': 0.150, 'face': 0.060}, 60, stages=('ppe_v10', 'ppe', 'face'))
+    plan = {st['stage']: st for st in mixed.snapshot()['stages']}
+    print(f"[8b] runs in 60 frames: ppe_v10 {plan['ppe_v10']['runs']}, ppe {plan['ppe']['runs']}, "
+          f"intervals ppe_v10 {plan['ppe_v10']['interval']} / ppe {plan['ppe']['interval']}")
+    ok &= (plan['ppe']['runs'] >= 60 // mixed.max_intervals['ppe']
+           and plan['ppe_v10']['runs'] >= 60 // mixed.max_intervals['ppe_v10'])
+
+    # [9] active_stage_budget / 일괄 설정
+    seen = {}
+    outside = active_stage_budget()
+    with panel.frame():
+        seen['inside'] = active_stage_budget()
+        worker = threading.Thread(target=lambda: seen.update(other=active_stage_budget()))
+        worker.start()
+        worker.join()
+        with active_stage_budget().frame():  # 감지기 detect_all: 호출 측 프레임에 포함
+            seen['nested'] = active_stage_budget()
+        seen['after_nested'] = active_stage_budget()
+    after = active_stage_budget()
+    live = {'panel', 'signature'} <= {b.name for b in get_stage_budgets()}
+    configure_stage_budgets(enabled=False)
+    disabled = not panel.enabled and not signature.enabled and not StageBudget(costs=shared).enabled
+    configure_stage_budgets(enabled=True)
+    print(f"[9] active outside {outside}, inside is panel {seen['inside'] is panel}, other thread {seen['other']}, "
+          f"after {after}, live budgets include panel/signature: {live}, "
+          f"disable all: {disabled}")
+    ok &= (outside is None and seen['inside'] is panel and seen['other'] is None and seen['nested'] is panel
+           and seen['after_nested'] is panel and after is None and live and disabled
+           and panel.enabled and signature.enabled)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+TCP 세션 송신 경로 테스트 (network/server.py)
+
+- 일반 TCP: 송신 스레드가 한 청크의 응답(하트비트 ack 20개)을 병합 전송
+- TLS: 송신 스레드 없이 수신 스레드가 응답 전송 (SSLSocket 동시 recv/send 방지)
+  - 응답 병합은 동일하게 동작
+  - 다른 스레드의 push_config도 TLS_POLL_INTERVAL 안에 전송
+  - 느린 클라이언트 종료(_disconnect) 시 수신 스레드가 세션을 정리
+  (openssl 명령이 없으면 자체 서명 인증서를 만들 수 없으므로 건너뜀)
+
+사용법:
+    python test_tcp_send_queue.py
+"""
+
+import json
+import os
+import queue
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.network.server import TcpServer
+
+HEARTBEATS = 20
+
+
+def free_port():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+class Client:
+    def __init__(self, port, tls=False):
+        sock = socket.create_connection(("127.0.0.1", port), timeout=5.0)
+        if tls:
+            ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+            sock = ctx.wrap_socket(sock)
+        self.sock = sock
+        self.buf = b""
+
+    def send_lines(self, msgs):
+        self.sock.sendall(b"".join((json.dumps(m) + "\n").encode("utf-8") for m in msgs))
+
+    def recv(self, msg_type, count=1, timeout=5.0):
+        got = []
+        deadline = time.time() + timeout
+        while len(got) < count and time.time() < deadline:
+            while b"\n" in self.buf and len(got) < count:
+                line, self.buf = self.buf.split(b"\n", 1)
+                msg = json.loads(line)
+                if msg.get("type") == msg_type:
+                    got.append(msg)
+            if len(got) < count:
+                try:
+                    self.buf += self.sock.recv(65536)
+                except socket.timeout:
+                    pass
+        return got
+
+    def close(self):
+        self.sock.close()
+
+
+def make_cert(folder):
+    """자체 서명 인증서 (openssl 없으면 None)"""
+    if not shutil.which("openssl"):
+        return None
+    cert, key = os.path.join(folder, "cert.pem"), os.path.join(folder, "key.pem")
+    r = subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                        "-subj", "/CN=127.0.0.1", "-keyout", key, "-out", cert],
+                       capture_output=True)
+    return (cert, key) if r.returncode == 0 else None
+
+
+def session_of(server, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with server._sessions_lock:
+            sessions = list(server.sessions.values())
+        if sessions and sessions[0].sensor_id:
+            return sessions[0]
+        time.sleep(0.01)
+    return None
+
+
+def exercise(server, tls):
+    """hello → 하트비트 20개 (한 청크) → (결과, 세션)"""
+    threads_before = threading.active_count()
+    client = Client(server.port, tls=tls)
+    client.send_lines([{"type": "hello", "id": "pi-1", "protocol_version": "2.0", "msg_id": "h"}])
+    hello = client.recv("hello_ack")
+    session = session_of(server)
+    handler_threads = threading.active_count() - threads_before
+    batches_before = session.sent_batches
+    client.send_lines([{"type": "heartbeat", "id": "pi-1", "msg_id": f"hb{i}"} for i in range(HEARTBEATS)])
+    acks = client.recv("heartbeat_ack", count=HEARTBEATS)
+    time.sleep(0.1)  # 송신 후 카운터 갱신 대기
+    return client, session, bool(hello), len(acks), session.sent_batches - batches_before, handler_threads
+
+
+def main():
+    ok = True
+    folder = tempfile.mkdtemp(prefix="tcp_send_test_")
+    try:
+        # [1] 일반 TCP: 송신 스레드 + 응답 병합
+        server = TcpServer("127.0.0.1", free_port(), queue.Queue())
+        server.start()
+        server.listening.wait(5.0)
+        client, session, hello, acks, batches, threads = exercise(server, tls=False)
+        print(f"[1] plain: hello {hello}, acks {acks}/{HEARTBEATS} in {batches} send(s), "
+              f"threads per connection {threads}")
+        ok &= hello and acks == HEARTBEATS and 1 <= batches <= 2 and threads == 2
+        client.close()
+        server.stop()
+
+        # [2] TLS: 수신 스레드에서 송신
+        cert = make_cert(folder)
+        if cert is None:
+            print("[2] skipped (openssl unavailable)")
+        else:
+            server = TcpServer("127.0.0.1", free_port(), queue.Queue(), tls_enabled=True,
+                               tls_cert=cert[0], tls_key=cert[1])
+            server.start()
+            server.listening.wait(5.0)
+            client, session, hello, acks, batches, threads = exercise(server, tls=True)
+            print(f"[2] tls: hello {hello}, acks {acks}/{HEARTBEATS} in {batches} send(s), "
+                  f"threads per connection {threads}")
+            ok &= hello and acks == HEARTBEATS and 1 <= batches <= 2 and threads == 1
+
+            # 다른 스레드의 push_config → 클라이언트가 조용해도 poll 간격 안에 도착
+            t0 = time.perf_counter()
+            queued = server.push_config()
+            pushed = client.recv("config_push", timeout=3.0)
+            delay = time.perf_counter() - t0
+            print(f"[3] tls push_config: queued {queued}, received {len(pushed)} after {delay:.2f}s "
+                  f"(poll {server.TLS_POLL_INTERVAL}s)")
+            ok &= queued == 1 and len(pushed) == 1 and delay <= server.TLS_POLL_INTERVAL + 1.0
+
+            # 강제 종료: 다른 스레드에서 _disconnect → 수신 스레드가 정리
+            server._disconnect(session)
+            deadline = time.time() + server.TLS_POLL_INTERVAL + 2.0
+            while time.time() < deadline and server.sessions:
+                time.sleep(0.05)
+            print(f"[4] tls disconnect: sessions left {len(server.sessions)}")
+            ok &= not server.sessions
+            client.close()
+            server.stop()
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
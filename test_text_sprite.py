@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+한글 텍스트 스프라이트 캐시 테스트 (utils/text_sprite.py)
+
+- 캐시: 같은 (폰트, 텍스트, 색상, 스타일)은 히트, max_items를 넘으면 가장 오래 안 쓴 항목 제거
+- draw(): 라벨 영역 밖 픽셀은 그대로, 같은 배열 객체를 돌려주고 제자리 수정 (비연속 뷰 포함)
+- 프레임 밖으로 일부/전부 나간 라벨(음수 x/y, 너비/높이 초과): 예외 없이 잘라서 그리기
+- 기존 전체 프레임 PIL 경로(BGR→RGB→PIL→BGR)와 결과 비교 (한글 문자열)
+  일반 / 배경 박스: ±1, 테두리: ±2 (기존 경로는 8방향 테두리를 한 번씩 8비트로 반올림)
+
+한글 폰트(Nanum/Noto CJK/맑은 고딕 등)가 없으면 PIL 기본 폰트로 비교합니다.
+
+사용법:
+    python test_text_sprite.py
+"""
+
+import os
+import sys
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.utils.text_sprite import TextSpriteCache
+
+FONT_CANDIDATES = [
+    "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
+    "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+    "/System/Library/Fonts/AppleSDGothicNeo.ttc",
+    "C:/Windows/Fonts/malgun.ttf",
+]
+TEXT = "안전모 착용 OK"
+COLOR = (0, 200, 255)
+
+
+def load_font(size=24):
+    for path in FONT_CANDIDATES:
+        if os.path.exists(path):
+            return ImageFont.truetype(path, size), os.path.basename(path)
+    return ImageFont.load_default(size=size), "PIL default"
+
+
+def old_pil_path(frame, text, position, font, color, outline=False, background=False, padding=5):
+    """sprite 캐시 이전 구현 (전체 프레임 변환)"""
+    pil = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    draw = ImageDraw.Draw(pil)
+    x, y = position
+    if background:
+        bbox = draw.textbbox((x, y), text, font=font)
+        draw.rectangle([bbox[0] - padding, bbox[1] - padding, bbox[2] + padding, bbox[3] + padding], fill=(0, 0, 0))
+    if outline:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx or dy:
+                    draw.text((x + dx, y + dy), text, font=font, fill=(0, 0, 0))
+    draw.text(position, text, font=font, fill=(color[2], color[1], color[0]))
+    return cv2.cvtColor(np.array(pil), cv2.COLOR_RGB2BGR)
+
+
+def label_rect(cache, font, text, position, **style):
+    """스프라이트가 덮는 프레임 좌표 (x0, y0, x1, y1), 클리핑 전"""
+    premul, _, (dx, dy) = cache.get(font, text, COLOR, **style)
+    x0, y0 = position[0] + dx, position[1] + dy
+    return x0, y0, x0 + premul.shape[1], y0 + premul.shape[0]
+
+
+def main():
+    ok = True
+    font, font_name = load_font()
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 256, (180, 360, 3), dtype=np.uint8)
+
+    # [1] 캐시 히트 / LRU 제거
+    cache = TextSpriteCache(max_items=3)
+    first = cache.get(font, TEXT, COLOR)
+    again = cache.get(font, TEXT, COLOR)
+    cache.get(font, TEXT, COLOR, outline=True)
+    cache.get(font, TEXT, (255, 0, 0))
+    cache.get(font, TEXT, COLOR)                             # 가장 최근 사용으로 갱신
+    cache.get(font, "헬멧", COLOR, background=(0, 0, 0), padding=5)  # → outline 항목 제거
+    stats = cache.get_stats()
+    kept_recent = cache.get(font, TEXT, COLOR) is first
+    misses_before = cache.misses
+    cache.get(font, TEXT, COLOR, outline=True)
+    evicted = cache.misses == misses_before + 1
+    print(f"[1] font {font_name}: same key hit {again is first}, stats {stats}, "
+          f"recently used kept {kept_recent}, LRU evicted {evicted}, items {len(cache._sprites)}")
+    ok &= (again is first and stats == {'items': 3, 'hits': 2, 'misses': 4} and kept_recent and evicted
+           and len(cache._sprites) == 3)
+
+    # [2] draw(): 라벨 영역만 변경, 같은 객체 반환
+    frame = base.copy()
+    pos = (40, 60)
+    out = cache.draw(frame, TEXT, pos, font, COLOR, outline=True)
+    x0, y0, x1, y1 = label_rect(cache, font, TEXT, pos, outline=True)
+    outside = frame.copy()
+    outside[y0:y1, x0:x1] = base[y0:y1, x0:x1]
+    changed = np.count_nonzero((frame[y0:y1, x0:x1] != base[y0:y1, x0:x1]).any(axis=2))
+    parent = base.copy()
+    view = parent[10:170, 20:340]                            # 비연속 뷰에도 제자리 그리기
+    view_out = cache.draw(view, TEXT, pos, font, COLOR)
+    print(f"[2] same object {out is frame}, rect {(x0, y0, x1, y1)}, changed inside {changed}, "
+          f"outside untouched {np.array_equal(outside, base)}, view drawn into parent "
+          f"{view_out is view and not np.array_equal(parent, base)}")
+    ok &= (out is frame and changed > 0 and np.array_equal(outside, base)
+           and view_out is view and not np.array_equal(parent, base))
+
+    # [3] 프레임 밖 클리핑: 큰 캔버스에 그린 결과의 해당 부분과 일치
+    h, w = base.shape[:2]
+    pad = 200
+    clipped_ok = True
+    results = []
+    for pos in ((-60, -20), (w - 40, h - 10), (w + 10, 20), (30, -300), (-500, -500), (w - 5, -15)):
+        for style in ({}, {'outline': True}, {'background': (0, 0, 0), 'padding': 5}):
+            frame = base.copy()
+            try:
+                cache.draw(frame, TEXT, pos, font, COLOR, **style)
+            except Exception as e:
+                clipped_ok = False
+                results.append((pos, f"error {e}"))
+                continue
+            canvas = np.zeros((h + 2 * pad, w + 2 * pad, 3), dtype=np.uint8)
+            canvas[pad:pad + h, pad:pad + w] = base
+            cache.draw(canvas, TEXT, (pos[0] + pad, pos[1] + pad), font, COLOR, **style)
+            same = np.array_equal(frame, canvas[pad:pad + h, pad:pad + w])
+            clipped_ok &= same
+            if not style:
+                results.append((pos, "changed" if not np.array_equal(frame, base) else "unchanged"))
+    print(f"[3] off-frame labels: {results}, matches unclipped canvas: {clipped_ok}")
+    ok &= clipped_ok and [r for _, r in results] == ["changed", "changed", "unchanged", "unchanged",
+                                                     "unchanged", "changed"]
+
+    # [4] 기존 전체 프레임 PIL 경로와 비교 (한글)
+    pos = (40, 60)
+    diffs = {}
+    for name, style, old_kw, tol in (("plain", {}, {}, 1),
+                                     ("outline", {'outline': True}, {'outline': True}, 2),
+                                     ("background", {'background': (0, 0, 0), 'padding': 5}, {'background': True}, 1)):
+        expected = old_pil_path(base, TEXT, pos, font, COLOR, **old_kw)
+        got = TextSpriteCache().draw(base.copy(), TEXT, pos, font, COLOR, **style)
+        diff = int(np.abs(expected.astype(np.int16) - got.astype(np.int16)).max())
+        touched = int(np.count_nonzero((expected != base).any(axis=2)))
+        diffs[name] = (diff, touched)
+        ok &= diff <= tol and touched > 0
+    print(f"[4] max |old - sprite| (pixels drawn): {diffs}")
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
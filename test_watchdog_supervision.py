@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+와치독 감시 테스트 (pidfd 종료 감지 + 상태 보고 소켓 + 재시작 정책)
+
+임시 디렉토리에 가짜 매니저(main.py)를 만들어 실제 GARAMeManagerWatchdog 감시 루프로 확인합니다.
+가짜 매니저는 utils/health.py의 HealthReporter로 상태를 보고하며, modes.txt의 첫 줄로 동작을 정합니다.
+- 외부에서 실행한 매니저를 첫 상태 보고로 찾아 감시 (프로세스 목록 검색 없이)
+- SIGKILL로 죽인 매니저를 1초 안에 감지하고 재시작 (자식으로 소유)
+- Tk 이벤트 루프가 멈춘 매니저(하트비트는 계속 전송)를 지연 보고로 감지하여 종료 후 재시작
+- 정상 종료(bye normal) 시 재시작하지 않음 → restart.signal 파일로 재시작
+- 재시작 요청(bye restart) 시 바로 재시작
+- 재시작 대기 시간 지수 증가, HealthPolicy 판단 (AI 정지, 수신 정지)
+
+사용법:
+    python test_watchdog_supervision.py
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+REPO = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO)
+
+FAKE_MAIN = '''
+import os, sys, threading, time
+sys.path.insert(0, {repo!r})
+from src.tcp_monitor.utils.health import get_health_reporter
+
+here = os.path.dirname(os.path.abspath(__file__))
+path = os.path.join(here, "modes.txt")
+try:
+    lines = open(path).read().split()
+except OSError:
+    lines = []
+mode = lines[0] if lines else "ok"
+open(path, "w").write("\\n".join(lines[1:]))
+
+
+class Widget:
+    hung = False
+
+    def after(self, ms, fn):
+        if not self.hung:
+            t = threading.Timer(ms / 1000.0, fn)
+            t.daemon = True
+            t.start()
+
+
+health = get_health_reporter()
+health.interval = 0.2
+health.start()
+widget = Widget()
+health.attach_tk(widget, 100)
+if mode == "hang":
+    time.sleep(0.5)
+    widget.hung = True          # 이벤트 루프 정지 (보고 스레드는 계속 동작)
+elif mode in ("normal", "restart"):
+    time.sleep(0.5)
+    health.goodbye(mode)
+    sys.exit(0)
+while True:
+    time.sleep(1)
+'''
+
+CONFIG = """[WATCHDOG]
+max_restart_count = 5
+restart_delay = 0
+restart_delay_max = 0
+health_timeout = 3
+loop_lag_limit = 1
+startup_grace = 0
+stable_uptime = 600
+"""
+
+
+def wait_for(cond, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
+
+
+def push_modes(tmp, *modes):
+    with open(os.path.join(tmp, "modes.txt"), "w") as f:
+        f.write("\n".join(modes))
+
+
+def main():
+    tmp = tempfile.mkdtemp(prefix="watchdog_")
+    with open(os.path.join(tmp, "main.py"), "w", encoding="utf-8") as f:
+        f.write(FAKE_MAIN.format(repo=REPO))
+    with open(os.path.join(tmp, "config.conf"), "w", encoding="utf-8") as f:
+        f.write(CONFIG)
+    os.environ["GARAME_HEALTH_SOCKET"] = os.path.join(tmp, "health.sock")
+
+    import watchdog as wd_module
+    wd = wd_module.GARAMeManagerWatchdog(program_dir=tmp)
+    wd.find_manager_pid = lambda: None  # 테스트 환경의 다른 main.py 프로세스를 잡지 않도록
+    thread = threading.Thread(target=wd.start_watchdog, daemon=True)
+    thread.start()
+    ok = True
+    time.sleep(0.3)
+
+    # [1] 외부 실행 매니저 → 첫 상태 보고로 감시 시작
+    push_modes(tmp, "ok")
+    external = subprocess.Popen([sys.executable, os.path.join(tmp, "main.py")], cwd=tmp)
+    adopted = wait_for(lambda: wd._pid == external.pid, 5)
+    print("[1] adopted external manager:", adopted, "pidfd:", wd._pidfd is not None)
+    ok &= adopted
+
+    # [2] SIGKILL → 1초 안에 감지 + 재시작 (이후는 와치독 자식)
+    push_modes(tmp, "ok")
+    t0 = time.monotonic()
+    external.kill()
+    external.wait()
+    restarted = wait_for(lambda: wd._pid not in (None, external.pid), 3)
+    detect_s = time.monotonic() - t0
+    print(f"[2] crash → restart in {detect_s:.2f}s, owned child: {wd._proc is not None}, restarts: {wd.restart_count}")
+    ok &= restarted and detect_s < 1.0 and wd._proc is not None and wd.restart_count == 1
+
+    # [3] 이벤트 루프 정지 → 지연 보고로 감지, 종료 후 재시작
+    push_modes(tmp, "hang", "ok")
+    hung_parent = wd._pid
+    os.kill(hung_parent, signal.SIGKILL)
+    wait_for(lambda: wd._pid not in (None, hung_parent), 3)
+    hung = wd._pid
+    t0 = time.monotonic()
+    recovered = wait_for(lambda: wd._pid not in (None, hung), 10)
+    print(f"[3] hung loop detected and restarted in {time.monotonic() - t0:.2f}s:", recovered,
+          "hung process gone:", not os.path.exists(f"/proc/{hung}"))
+    ok &= recovered and wd.restart_count == 3
+
+    # [4] 정상 종료 → 재시작 안 함, restart.signal → 재시작
+    push_modes(tmp, "normal")
+    current = wd._pid
+    os.kill(current, signal.SIGKILL)            # 다음 실행이 normal 모드
+    wait_for(lambda: wd._pid not in (None, current), 3)
+    stopped = wait_for(lambda: wd._pid is None and wd._normal_exit_detected, 5)
+    time.sleep(1.0)
+    print("[4] normal exit → no restart:", stopped and wd._pid is None)
+    ok &= stopped and wd._pid is None
+    push_modes(tmp, "ok")
+    with open(os.path.join(tmp, "restart.signal"), "w") as f:
+        f.write(f"restart_{int(time.time())}")
+    resumed = wait_for(lambda: wd._pid is not None, 3)
+    print("    restart.signal → started:", resumed, "restarts reset:", wd.restart_count == 0)
+    ok &= resumed and wd.restart_count == 0
+
+    # [5] 재시작 요청(bye restart) → 바로 재시작
+    push_modes(tmp, "restart", "ok")
+    current = wd._pid
+    os.kill(current, signal.SIGKILL)
+    wait_for(lambda: wd._pid not in (None, current), 3)
+    requested = wd._pid
+    again = wait_for(lambda: wd._pid not in (None, requested), 5)
+    print("[5] restart request → restarted:", again, "restarts:", wd.restart_count)
+    ok &= again and wd.restart_count == 0
+
+    # [6] 재시작 대기 시간 / HealthPolicy
+    wd.restart_delay, wd.restart_delay_max = 5, 60
+    delays = []
+    for n in range(1, 7):
+        wd.restart_count = n
+        delays.append(wd.restart_backoff())
+    policy = wd_module.HealthPolicy(report_timeout=5, loop_lag_limit=10, ai_stall_timeout=30,
+                                    ingest_stall_timeout=20, startup_grace=0)
+    now = time.monotonic()
+    policy.reset(now - 100)
+    policy.observe({"loop_lag": 0.1, "rates": {"ingest": 2.0}, "tasks": {"ai": {"busy": 0.2}}}, now - 50)
+    healthy = policy.check(now - 49)
+    policy.observe({"loop_lag": 0.1, "rates": {"ingest": 0.0}, "tasks": {"ai": {"busy": 45}}}, now)
+    ai_stall = policy.check(now)
+    policy.observe({"loop_lag": 0.1, "rates": {"ingest": 0.0}, "tasks": {"ai": {"busy": 0}}}, now)
+    ingest_stall = policy.check(now)
+    silent = policy.check(now + 6)
+    print("[6] backoff:", delays, "| healthy:", healthy, "| ai:", ai_stall, "| ingest:", ingest_stall, "| silent:", silent)
+    ok &= (delays == [5, 10, 20, 40, 60, 60] and healthy is None and ai_stall and "AI" in ai_stall
+           and ingest_stall and "수신" in ingest_stall and silent and "보고" in silent)
+
+    wd.running = False
+    thread.join(timeout=3)
+    if wd._pid is not None:
+        wd._terminate_manager(timeout=2)
+    for pid in [p for p in os.listdir("/proc") if p.isdigit()]:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                if tmp.encode() in f.read():
+                    os.kill(int(pid), signal.SIGKILL)
+        except OSError:
+            pass
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+공용 날씨 서비스 테스트 (로컬 HTTP 서버를 기상청/MSN 대신 사용)
+
+- 구독자가 여러 개여도 가져오기는 1번
+- 기상청 응답 파싱, 실패 시 MSN 폴백
+- 디스크 캐시: 재시작 직후 마지막 값을 바로 표시하고, 갱신 주기 전에는 요청하지 않음
+- 조건부 요청: ETag 전송 → 304 응답 시 캐시된 결과 사용
+- 실패 시 지수 백오프, 마지막 값은 stale로 유지
+- 서버가 응답하지 않아도 poll()은 바로 반환
+
+사용법:
+    python test_weather_service.py
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.tcp_monitor.utils.weather_service import WeatherService
+
+MSN_HTML = "<html><body>춘천시 현재 날씨 <span>12°C</span> 대체로 맑음</body></html>"
+KMA_JSON = {"response": {"header": {"resultCode": "00", "resultMsg": "NORMAL_SERVICE"},
+                         "body": {"items": {"item": [
+                             {"category": "T1H", "obsrValue": "21.4"},
+                             {"category": "REH", "obsrValue": "55"},
+                             {"category": "PTY", "obsrValue": "1"},
+                             {"category": "WSD", "obsrValue": "2.5"}]}}}}
+
+
+class Stub:
+    mode = "ok"          # ok / fail / slow
+    hits = {}
+    conditional = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트 시간 초과
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        Stub.hits[path] = Stub.hits.get(path, 0) + 1
+        if Stub.mode == "slow":
+            time.sleep(1.5)
+        if Stub.mode == "fail" or (path.startswith("/kma") and Stub.mode == "kma_down"):
+            self.send_response(500)
+            self.end_headers()
+            return
+        if path == "/msn":
+            if self.headers.get("If-None-Match") == '"v1"':
+                Stub.conditional += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = MSN_HTML.encode("utf-8")
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+        elif path.startswith("/kma"):
+            body = json.dumps(KMA_JSON).encode("utf-8")
+            self.send_response(200)
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    tmp = tempfile.mkdtemp(prefix="weather_")
+    settings = {"kma_api_key": "test", "kma_base_url": base + "/kma", "msn_url": base + "/msn",
+                "auto_detect_location": "false"}
+    ok = True
+
+    # [1] 구독 5개 → 가져오기 1번
+    cache = os.path.join(tmp, "kma.json")
+    svc = WeatherService(settings, cache_path=cache, interval=60, timeout=1.0)
+    subs = [svc.subscribe(name=f"panel{i}") for i in range(5)]
+    data = subs[0].wait(timeout=5)
+    others = [s.poll() for s in subs[1:]]
+    print("[1] kma:", data, "fetches:", svc.fetches, "hits:", Stub.hits)
+    ok &= (data is not None and data["source"] == "kma" and data["temp"] == "21" and data["icon"] == "🌧️"
+           and svc.fetches == 1 and all(o == data for o in others))
+
+    # [2] 재시작: 캐시 값 즉시 표시, 주기 전에는 요청 없음
+    for s in subs:
+        s.release()
+    svc.shutdown()
+    hits = dict(Stub.hits)
+    svc2 = WeatherService(settings, cache_path=cache, interval=60, timeout=1.0)
+    sub = svc2.subscribe(name="restart")
+    first = sub.poll()
+    time.sleep(0.5)
+    print("[2] cached:", first and (first["temp"], first["stale"]), "new requests:", Stub.hits != hits,
+          "next fetch in %.0fs" % svc2.stats()["next_fetch_in"])
+    ok &= first is not None and first["temp"] == "21" and not first["stale"] and Stub.hits == hits
+    sub.release()
+    svc2.shutdown()
+
+    # [3] 기상청 실패 → MSN 폴백, 두 번째 요청은 ETag → 304
+    Stub.mode = "kma_down"
+    svc3 = WeatherService(settings, cache_path=os.path.join(tmp, "msn.json"), timeout=1.0)
+    ok1 = svc3.fetch_once()
+    d1 = svc3.latest()[1]
+    ok2 = svc3.fetch_once()
+    d2 = svc3.latest()[1]
+    print("[3] msn:", d1, "304 responses:", Stub.conditional)
+    ok &= ok1 and ok2 and d1["source"] == "msn" and d1["temp"] == "12" and d2["temp"] == "12" and Stub.conditional == 1
+
+    # [4] 전체 실패 → 백오프, 마지막 값 stale 유지
+    Stub.mode = "fail"
+    delays = []
+    for _ in range(8):
+        svc3.fetch_once()
+        delays.append(svc3.backoff_delay())
+    d3 = svc3.latest()[1]
+    print("[4] backoff:", [round(d) for d in delays], "stale:", d3["stale"], d3["temp"])
+    ok &= (svc3.failures == 8 and d3["stale"] and d3["temp"] == "12"
+           and 24 <= delays[0] <= 36 and delays[3] > delays[2] > delays[1] and max(delays) <= 1800 * 1.2)
+
+    # [5] 서버 지연 중에도 poll()은 바로 반환
+    Stub.mode = "slow"
+    svc4 = WeatherService(settings, cache_path=os.path.join(tmp, "slow.json"), timeout=1.0)
+    sub = svc4.subscribe(name="slow")
+    time.sleep(0.1)
+    t0 = time.perf_counter()
+    for _ in range(100):
+        sub.poll()
+    poll_ms = (time.perf_counter() - t0) * 1000
+    print(f"[5] 100 polls during slow fetch: {poll_ms:.2f} ms")
+    ok &= poll_ms < 50
+    sub.release()
+    svc4.shutdown(timeout=3)
+    server.shutdown()
+
+    print("\n결과:", "통과" if ok else "실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,30 @@
 GARAMe MANAGER Watchdog
 프로그램을 감시하고 비정상 종료 시 자동 재시작하는 와치독 프로그램
 Ubuntu Linux 전용 (Windows 지원 안 함)
+
+감시 방식:
+- 매니저 프로세스를 pidfd(os.pidfd_open)로 감시하여 종료 즉시 감지 (전체 프로세스 목록 검색 없음)
+  와치독이 실행한 매니저는 자식 프로세스로 소유하고 종료 코드를 회수(waitpid)합니다.
+- 매니저가 Unix 소켓(SOCK_DGRAM)으로 1초마다 보내는 상태 보고
+  (Tk 이벤트 루프 지연, 수신 처리율, AI 추론 스레드 진행)로 멈춤을 판단
+  메시지 형식은 src/tcp_monitor/utils/health.py 참고
+- 재시작 정책 ([WATCHDOG] restart_policy): on-failure(기본) / always / never
+  연속 실패 시 재시작 대기 시간을 두 배씩 늘리고(최대 restart_delay_max),
+  stable_uptime초 이상 정상 실행되면 실패 횟수를 초기화합니다.
 """
 
 import os
 import sys
+import json
 import platform
 import time
+import select
+import selectors
+import socket
 import subprocess
 import logging
 import signal
+import tempfile
 import threading
 import configparser
 from datetime import datetime
@@ -23,6 +38,125 @@ if platform.system() != "Linux":
     print(f"현재 시스템: {platform.system()}")
     sys.exit(1)
 
+HEALTH_SOCKET_ENV = "GARAME_HEALTH_SOCKET"
+
+
+def default_health_socket_path():
+    """상태 보고 소켓 경로 (매니저의 utils/health.py와 같은 규칙)"""
+    path = os.environ.get(HEALTH_SOCKET_ENV)
+    if path:
+        return path
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, "garame_watchdog.sock")
+
+
+class HealthChannel:
+    """매니저 상태 보고 수신 소켓 (Unix 도메인, SOCK_DGRAM)"""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            os.unlink(path)  # 이전 실행에서 남은 소켓 파일
+        except FileNotFoundError:
+            pass
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(path)
+        self.sock.setblocking(False)
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def receive(self):
+        """대기 중인 메시지 모두 읽기"""
+        messages = []
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            try:
+                msg = json.loads(data.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                continue
+            if isinstance(msg, dict):
+                messages.append(msg)
+        return messages
+
+    def close(self):
+        try:
+            self.sock.close()
+        finally:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class HealthPolicy:
+    """상태 보고 → 재시작이 필요한 이상 판단"""
+
+    def __init__(self, report_timeout=90, loop_lag_limit=30, ai_stall_timeout=300,
+                 ingest_stall_timeout=0, startup_grace=60):
+        """
+        Args:
+            report_timeout: 상태 보고가 이 시간(초) 이상 없으면 멈춤 (프로세스 전체 정지)
+            loop_lag_limit: Tk 이벤트 루프 지연이 이 시간(초)을 넘으면 멈춤
+            ai_stall_timeout: AI 추론 1건이 이 시간(초)을 넘게 끝나지 않으면 멈춤
+            ingest_stall_timeout: 수신 처리가 있다가 이 시간(초) 동안 0이면 멈춤 (0이면 사용 안 함)
+            startup_grace: 시작 후 이 시간(초) 동안은 판단하지 않음 (모델 로드 등)
+        """
+        self.report_timeout = report_timeout
+        self.loop_lag_limit = loop_lag_limit
+        self.ai_stall_timeout = ai_stall_timeout
+        self.ingest_stall_timeout = ingest_stall_timeout
+        self.startup_grace = startup_grace
+        self.reset(time.monotonic())
+
+    def reset(self, now):
+        """새 매니저 프로세스 감시 시작"""
+        self.started_at = now
+        self.last_report_at = None
+        self.report = None
+        self.last_ingest_at = None
+
+    @property
+    def reporting(self):
+        """상태 보고를 보내는 매니저인지 (구버전은 하트비트 파일만 사용)"""
+        return self.last_report_at is not None
+
+    def observe(self, report, now):
+        self.last_report_at = now
+        self.report = report
+        rates = report.get("rates") or {}
+        try:
+            if float(rates.get("ingest", 0) or 0) > 0:
+                self.last_ingest_at = now
+        except (TypeError, ValueError):
+            pass
+
+    def check(self, now):
+        """이상 사유 문자열 (정상이면 None)"""
+        if now - self.started_at < self.startup_grace or self.report is None:
+            return None
+        silent = now - self.last_report_at
+        if silent > self.report_timeout:
+            return f"상태 보고 없음 ({silent:.0f}초)"
+        lag = self.report.get("loop_lag")
+        if isinstance(lag, (int, float)) and self.loop_lag_limit > 0 and lag > self.loop_lag_limit:
+            return f"이벤트 루프 응답 없음 (지연 {lag:.1f}초)"
+        ai = (self.report.get("tasks") or {}).get("ai") or {}
+        busy = ai.get("busy", 0) or 0
+        if self.ai_stall_timeout > 0 and busy > self.ai_stall_timeout:
+            return f"AI 추론 스레드 진행 없음 ({busy:.0f}초)"
+        if self.ingest_stall_timeout > 0 and self.last_ingest_at is not None:
+            idle = now - self.last_ingest_at
+            if idle > self.ingest_stall_timeout:
+                return f"수신 데이터 처리 없음 ({idle:.0f}초)"
+        return None
+
+
 class GARAMeManagerWatchdog:
     def __init__(self, program_dir=None):
         self.program_dir = Path(program_dir) if program_dir else Path(__file__).parent
@@ -45,6 +179,20 @@ class GARAMeManagerWatchdog:
         # 하트비트 스레드 참조
         self._heartbeat_thread = None
         self._heartbeat_running = True
+
+        # 감시 중인 매니저 프로세스
+        self._proc = None          # 와치독이 실행한 경우 Popen (종료 코드 회수)
+        self._pid = None
+        self._pidfd = None         # 종료 시 읽기 가능해지는 프로세스 fd (미지원 커널이면 None → 폴링)
+        self._exit_reason = None   # 매니저가 보낸 종료 사유 ("normal" / "restart")
+        self._proc_started_at = 0.0
+        self._start_at = None      # 예약된 재시작 시각 (monotonic)
+        self._ever_adopted = False
+        self._selector = selectors.DefaultSelector()
+        self.health = None
+        self.health_path = default_health_socket_path()
+        self.health_policy = HealthPolicy(self.health_timeout, self.loop_lag_limit, self.ai_stall_timeout,
+                                          self.ingest_stall_timeout, self.startup_grace)
         
         # 로깅 설정
         self.setup_logging()
@@ -69,6 +217,17 @@ class GARAMeManagerWatchdog:
             self.restart_delay = 5
             self.health_timeout = 90
             self.health_check_interval = 30
+
+        # 감시/재시작 정책 (섹션이나 키가 없으면 기본값)
+        self.restart_policy = self.config.get('WATCHDOG', 'restart_policy', fallback='on-failure').strip().lower()
+        if self.restart_policy not in ('on-failure', 'always', 'never'):
+            self.restart_policy = 'on-failure'
+        self.restart_delay_max = self.config.getint('WATCHDOG', 'restart_delay_max', fallback=60)
+        self.stable_uptime = self.config.getint('WATCHDOG', 'stable_uptime', fallback=300)
+        self.loop_lag_limit = self.config.getfloat('WATCHDOG', 'loop_lag_limit', fallback=30.0)
+        self.ai_stall_timeout = self.config.getfloat('WATCHDOG', 'ai_stall_timeout', fallback=300.0)
+        self.ingest_stall_timeout = self.config.getfloat('WATCHDOG', 'ingest_stall_timeout', fallback=0.0)
+        self.startup_grace = self.config.getfloat('WATCHDOG', 'startup_grace', fallback=60.0)
             
     def save_config(self):
         """설정 파일 저장"""
@@ -147,12 +306,16 @@ class GARAMeManagerWatchdog:
             self.log("오류: main.py 파일을 찾을 수 없습니다.")
             return None
         try:
+            # 상태 보고 소켓 경로 전달 (매니저의 utils/health.py가 사용)
+            env = dict(os.environ)
+            env[HEALTH_SOCKET_ENV] = self.health_path
             # Linux에서는 Python 스크립트만 실행
             proc = subprocess.Popen(
                 [sys.executable, program_path, "--config", "config.conf"],
                 cwd=str(self.program_dir),
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
+                env=env,
                 start_new_session=True  # 새 세션에서 실행하여 부모 프로세스 종료와 독립
             )
             self.log(f"프로그램을 백그라운드로 시작했습니다: {program_path} (PID: {proc.pid})")
@@ -270,8 +433,12 @@ class GARAMeManagerWatchdog:
         
         return False
             
-    def is_manager_running(self):
-        """매니저 프로그램 실행 상태 확인 (Linux 전용)"""
+    def find_manager_pid(self):
+        """
+        실행 중인 매니저 PID 검색 (전체 프로세스 목록 검색, Linux 전용)
+
+        상태 보고를 보내지 않는 구버전 매니저를 와치독 시작 직후 찾을 때만 사용합니다.
+        """
         try:
             import psutil
             for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
@@ -279,17 +446,318 @@ class GARAMeManagerWatchdog:
                     cmdline = proc.info.get('cmdline') or proc.cmdline()
                     if cmdline and any('main.py' in str(c) for c in cmdline):
                         # main.py가 실행 중인지 확인
-                        return True
+                        return proc.info['pid']
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
-            return False
+            return None
         except ImportError:
             # psutil이 없으면 ps 명령어 사용 (Linux)
             try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
-                return 'main.py' in result.stdout
-            except:
+                result = subprocess.run(['ps', '-eo', 'pid=,args='], capture_output=True, text=True)
+                for line in result.stdout.splitlines():
+                    pid, _, args = line.strip().partition(' ')
+                    if 'main.py' in args and int(pid) != os.getpid():
+                        return int(pid)
+            except Exception:
+                pass
+            return None
+
+    def is_manager_running(self):
+        """매니저 프로그램 실행 상태 확인 (감시 중이면 pidfd/자식 상태, 아니면 검색)"""
+        if self._pid is not None:
+            return self._pid_alive()
+        return self.find_manager_pid() is not None
+
+    # ---- 프로세스 감시 (pidfd + 상태 보고) ----
+
+    def _open_health_channel(self):
+        """상태 보고 수신 소켓 열기 (실패하면 프로세스 감시만 수행)"""
+        try:
+            self.health = HealthChannel(self.health_path)
+            self._selector.register(self.health, selectors.EVENT_READ, "health")
+            self.log(f"상태 보고 소켓: {self.health_path}")
+        except OSError as e:
+            self.health = None
+            self.log(f"상태 보고 소켓 열기 실패 ({e}). 프로세스 종료 감시만 수행합니다.")
+
+    def _close_health_channel(self):
+        if self.health is not None:
+            try:
+                self._selector.unregister(self.health)
+            except (KeyError, ValueError):
+                pass
+            self.health.close()
+            self.health = None
+
+    def _adopt(self, pid, proc=None):
+        """매니저 프로세스 감시 시작 (proc: 와치독이 실행한 자식 프로세스)"""
+        self._release()
+        self._pid = pid
+        self._proc = proc
+        self._exit_reason = None
+        self._proc_started_at = time.monotonic()
+        self._ever_adopted = True
+        self._normal_exit_detected = False
+        self.health_policy.reset(self._proc_started_at)
+        try:
+            self._pidfd = os.pidfd_open(pid)
+            self._selector.register(self._pidfd, selectors.EVENT_READ, "exit")
+        except (AttributeError, OSError):
+            self._pidfd = None   # pidfd 미지원 (Linux 5.3 미만): 0.5초마다 상태 확인
+        if not self._pid_alive():
+            return
+        how = "pidfd" if self._pidfd is not None else "폴링"
+        owner = "자식 프로세스" if proc is not None else "외부 실행"
+        self.log(f"매니저 감시 시작: PID {pid} ({owner}, {how})")
+
+        # 매니저 프로그램이 실행되면 와치독 창을 뒤로 보내기 (항상 화면에 표시)
+        if self.gui_reference is not None:
+            try:
+                self.gui_reference.root.after(0, lambda: self.gui_reference.root.lower())
+            except Exception as e:
+                self.log(f"와치독 창 뒤로 보내기 실패: {e}")
+
+    def _release(self):
+        if self._pidfd is not None:
+            try:
+                self._selector.unregister(self._pidfd)
+            except (KeyError, ValueError):
+                pass
+            os.close(self._pidfd)
+            self._pidfd = None
+        self._pid = None
+        self._proc = None
+
+    def _pid_alive(self):
+        if self._pid is None:
+            return False
+        if self._proc is not None:
+            return self._proc.poll() is None
+        try:
+            os.kill(self._pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
+    def _wait_events(self, timeout):
+        """
+        상태 보고/매니저 종료를 최대 timeout초 대기
+
+        Returns:
+            감시 중인 매니저가 종료했으면 True
+        """
+        exited = False
+        try:
+            events = self._selector.select(timeout)
+        except InterruptedError:
+            events = []
+        for key, _ in events:
+            if key.data == "health":
+                self._drain_health()
+            elif key.data == "exit":
+                exited = True
+        if self._pid is not None and self._pidfd is None and not exited:
+            exited = not self._pid_alive()
+        return exited
+
+    def _drain_health(self):
+        if self.health is None:
+            return
+        now = time.monotonic()
+        for msg in self.health.receive():
+            pid = msg.get("pid")
+            if not isinstance(pid, int):
+                continue
+            if self._pid is None and msg.get("type") == "health" and self._start_at is None:
+                # 감시 중이 아닐 때 보고가 오면 (수동 실행, run.sh 실행) 그 프로세스를 감시
+                self._adopt(pid)
+                if self._pid is None:
+                    continue
+            if pid != self._pid:
+                continue
+            if msg.get("type") == "health":
+                self.health_policy.observe(msg, now)
+            elif msg.get("type") == "bye":
+                self._exit_reason = msg.get("reason") or "normal"
+
+    def _wait_exit(self, timeout):
+        """매니저 종료를 최대 timeout초 대기 (종료했으면 True)"""
+        if self._proc is not None:
+            try:
+                self._proc.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
                 return False
+        if self._pidfd is not None:
+            ready, _, _ = select.select([self._pidfd], [], [], timeout)
+            return bool(ready)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if not self._pid_alive():
+                return True
+            time.sleep(0.1)
+        return not self._pid_alive()
+
+    def _signal_manager(self, sig):
+        try:
+            if self._proc is not None:
+                os.killpg(self._pid, sig)   # start_new_session=True → 프로세스 그룹 = PID
+            else:
+                os.kill(self._pid, sig)
+        except ProcessLookupError:
+            pass
+        except PermissionError as e:
+            self.log(f"매니저 신호 전송 실패 (PID {self._pid}): {e}")
+
+    def _terminate_manager(self, timeout=10):
+        """멈춘 매니저 종료 (SIGTERM → timeout초 후 SIGKILL)"""
+        self.log(f"매니저 종료 시도 (PID: {self._pid})")
+        self._signal_manager(signal.SIGTERM)
+        if not self._wait_exit(timeout):
+            self.log(f"매니저가 {timeout}초 안에 종료되지 않아 강제 종료합니다.")
+            self._signal_manager(signal.SIGKILL)
+            self._wait_exit(5)
+
+    def _discard_signal(self, name):
+        try:
+            (self.program_dir / name).unlink()
+        except OSError:
+            pass
+
+    def _legacy_heartbeat_reason(self, now):
+        """상태 보고를 보내지 않는 매니저: 하트비트 파일로 판단"""
+        if now - self._proc_started_at < self.startup_grace:
+            return None
+        try:
+            if self.manager_hb.exists():
+                age = time.time() - self.manager_hb.stat().st_mtime
+                if age > self.health_timeout:
+                    return f"하트비트 파일 갱신 없음 ({age:.0f}초, 타임아웃 {self.health_timeout}s)"
+        except OSError:
+            pass
+        return None
+
+    def restart_backoff(self):
+        """연속 실패 횟수에 따른 재시작 대기 시간 (restart_delay × 2^(n-1), 최대 restart_delay_max)"""
+        failures = max(1, self.restart_count)
+        return min(self.restart_delay_max, self.restart_delay * (2 ** (failures - 1)))
+
+    def _schedule_start(self, delay):
+        self._start_at = time.monotonic() + max(0, delay)
+
+    def _on_failure(self, what):
+        """비정상 종료/멈춤 후 재시작 예약"""
+        if self.restart_policy == 'never':
+            self.log(f"{what} - 재시작 정책(never)에 따라 재시작하지 않습니다. 재시작 신호나 수동 실행을 기다립니다.")
+            return
+        self.restart_count += 1
+        if self.restart_count > self.max_restart_count:
+            self.log(f"{what} - 최대 재시작 횟수({self.max_restart_count})에 도달했습니다. "
+                     "재시작 신호나 수동 실행을 기다립니다.")
+            return
+        delay = self.restart_backoff()
+        self.log(f"{what} - 재시작 시도 ({self.restart_count}/{self.max_restart_count}), {delay}초 후")
+        self._schedule_start(delay)
+
+    def _on_manager_exit(self):
+        """감시 중인 매니저 종료 처리"""
+        code = None
+        if self._proc is not None:
+            try:
+                code = self._proc.wait(timeout=1)   # waitpid로 종료 코드 회수
+            except subprocess.TimeoutExpired:
+                pass
+        self._drain_health()  # 종료 직전에 보낸 종료 사유(bye)
+        reason = self._exit_reason
+        uptime = time.monotonic() - self._proc_started_at
+        reporting = self.health_policy.reporting
+        self._release()
+
+        if reason is None and code in (0, None) and not reporting:
+            # 종료 사유를 보내지 않는 구버전 매니저: 신호 파일로 확인
+            if self.check_normal_exit_signal():
+                reason = "normal"
+        if reason == "normal" and self.check_restart_signal():
+            reason = "restart"   # 재시작 메뉴는 정상 종료 신호 파일도 함께 만듦
+        if reason is not None:
+            self._discard_signal("normal_exit.signal")
+        if reason == "restart":
+            self._discard_signal("restart.signal")
+
+        if reason == "restart":
+            self.log("매니저가 재시작을 요청하고 종료했습니다. 프로그램을 재시작합니다.")
+            self.restart_count = 0
+            self._schedule_start(self.restart_delay)
+        elif reason == "normal":
+            self.log("정상 종료로 감지되었습니다.")
+            if self.restart_policy == 'always':
+                self.log("재시작 정책(always)에 따라 재시작합니다.")
+                self._schedule_start(self.restart_delay)
+            else:
+                self.log("재시작 없이 재시작 신호를 기다립니다.")
+                self._normal_exit_detected = True
+        else:
+            if code is not None and code < 0:
+                detail = f"신호 {-code}"
+            else:
+                detail = f"종료 코드 {code}" if code is not None else "종료 코드 알 수 없음"
+            self._on_failure(f"비정상 종료로 감지되었습니다 ({detail}, 실행 {uptime:.1f}초)")
+
+    def _spawn_manager(self):
+        self._start_at = None
+        proc = self.start_program_nonblocking()
+        if proc is None:
+            self._on_failure("프로그램 시작 실패")
+            return
+        self._adopt(proc.pid, proc)
+
+    def _supervise_tick(self):
+        """매니저 실행 중: 종료/상태 보고 대기 후 이상 여부 판단"""
+        if self._wait_events(0.5):
+            self._on_manager_exit()
+            return
+        now = time.monotonic()
+        if self.health_policy.reporting:
+            reason = self.health_policy.check(now)
+        else:
+            reason = self._legacy_heartbeat_reason(now)
+        if reason:
+            self.log(f"헬스체크 실패: {reason}")
+            self._terminate_manager()
+            self._release()
+            self._on_failure("매니저 응답 없음")
+            return
+        if self.restart_count and now - self._proc_started_at > self.stable_uptime:
+            self.log(f"{self.stable_uptime}초 이상 정상 실행되어 재시작 횟수를 초기화합니다.")
+            self.restart_count = 0
+
+    def _idle_tick(self):
+        """매니저 없음: 예약된 재시작, 재시작 신호, 상태 보고(수동 실행) 대기"""
+        timeout = 0.5
+        if self._start_at is not None:
+            timeout = min(timeout, max(0.0, self._start_at - time.monotonic()))
+        self._wait_events(timeout)
+        if self._pid is not None:
+            return  # 상태 보고로 실행 중인 매니저를 찾음
+        if self._start_at is not None:
+            if time.monotonic() >= self._start_at and self.running:
+                self._spawn_manager()
+            return
+        if self.check_restart_signal():
+            self.log("재시작 신호가 감지되었습니다. 프로그램을 재시작합니다.")
+            self.restart_count = 0
+            self._schedule_start(self.restart_delay)
+            return
+        if not self._ever_adopted:
+            # 시작 직후: 상태 보고를 보내지 않는 구버전 매니저 검색 (2초 간격)
+            now = time.monotonic()
+            if now - getattr(self, "_last_scan", 0.0) >= 2.0:
+                self._last_scan = now
+                pid = self.find_manager_pid()
+                if pid is not None:
+                    self._adopt(pid)
             
     def start_watchdog(self):
         """와치독 시작"""
@@ -306,41 +774,15 @@ class GARAMeManagerWatchdog:
 
         # 하트비트 시작
         self._start_heartbeat()
-        
-        # 매니저 프로그램이 없으면 대기
-        # run.sh에서 watchdog를 먼저 실행하고 main.py를 나중에 실행하므로
-        # 잠시 대기 후 프로그램이 시작되는지 확인
-        if not self.is_manager_running():
-            self.log("매니저 프로그램 실행을 기다리는 중... (최대 30초)")
-            # run.sh에서 실행될 때까지 최대 30초 대기
-            waited = 0
-            while self.running and not self.is_manager_running() and waited < 30:
-                time.sleep(1)
-                waited += 1
-            if waited >= 30 and not self.is_manager_running():
-                self.log("매니저 프로그램이 30초 내에 시작되지 않았습니다. 계속 감시합니다...")
-        
-        # 프로그램이 실행될 때까지 대기
-        while self.running and not self.is_manager_running():
-            time.sleep(1)
-        
-        if not self.running:
-            return
-            
-        self.log("매니저 프로그램이 실행되었습니다. 감시를 시작합니다.")
-        
-        # 매니저 프로그램이 다시 실행되면 정상 종료 플래그 리셋
-        self._normal_exit_detected = False
-        
-        # 매니저 프로그램이 실행되면 와치독 창을 뒤로 보내기 (항상 화면에 표시)
-        if self.gui_reference is not None:
-            try:
-                # 와치독 창을 뒤로 보내기 (매니저가 최우선 포커스를 받도록)
-                self.gui_reference.root.after(0, lambda: self.gui_reference.root.lower())
-                self.log("매니저 프로그램이 실행되어 와치독 창을 뒤로 보냈습니다.")
-            except Exception as e:
-                self.log(f"와치독 창 뒤로 보내기 실패: {e}")
-        
+
+        # 상태 보고 소켓 (매니저가 시작하면 바로 보고가 와서 PID를 알게 됨)
+        self._open_health_channel()
+
+        # run.sh에서 watchdog를 먼저 실행하고 main.py를 나중에 실행하므로 매니저 시작을 기다림
+        self.log("매니저 프로그램 실행을 기다리는 중...")
+        waited_from = time.monotonic()
+        waiting_logged = False
+
         while self.running:
             # 와치독 종료 신호 확인 (최우선)
             if self.check_watchdog_exit_signal():
@@ -348,122 +790,16 @@ class GARAMeManagerWatchdog:
                 self.running = False
                 break
 
-            # 정상 종료가 감지되었고 재시작 신호가 없으면 계속 대기
-            if self._normal_exit_detected:
-                # 재시작 신호 확인
-                if self.check_restart_signal():
-                    self.log("재시작 신호가 감지되었습니다. 정상 종료 플래그를 리셋하고 재시작합니다.")
-                    self._normal_exit_detected = False
-                    self.restart_count = 0
-                    for i in range(self.restart_delay):
-                        if not self.running:
-                            break
-                        time.sleep(1)
-                    if self.running:
-                        self.start_program_nonblocking()
-                        time.sleep(1)
-                else:
-                    # 재시작 신호가 없으면 계속 대기
-                    time.sleep(1)
-                    continue
-
-            # 매니저 프로그램 실행 상태 확인
-            if not self.is_manager_running():
-                # 정상 종료 플래그가 설정된 상태면 로그를 찍지 않고 대기
-                if self._normal_exit_detected:
-                    time.sleep(2)  # 정상 종료 후 안정화 대기
-                    continue
-
-                self.log("매니저 프로그램이 종료되었습니다.")
-
-                # 정상 종료 신호 확인 (먼저 확인 - 재시작 신호보다 우선)
-                # 파일이 완전히 쓰여질 시간을 주기 위해 지연 후 확인
-                time.sleep(2.0)  # 1초 -> 2초로 증가
-                if self.check_normal_exit_signal():
-                    self.log("정상 종료로 감지되었습니다. 재시작 없이 대기합니다.")
-                    self._normal_exit_detected = True  # 정상 종료 플래그 설정
-                    # 프로세스 완전 종료 대기 (중복 감지 방지)
-                    time.sleep(3)
-                    # 정상 종료 시에는 자동 재시작하지 않음. 재시작 신호를 기다린다.
-                    continue  # 다음 루프로
-
-                # 재시작 신호 확인
-                if self.check_restart_signal():
-                    self.log("재시작 신호가 감지되었습니다. 프로그램을 재시작합니다.")
-                    self.restart_count = 0  # 재시작 신호는 재시작 카운트 리셋
-                    self._normal_exit_detected = False  # 플래그 리셋
-                    for i in range(self.restart_delay):
-                        if not self.running:
-                            break
-                        time.sleep(1)
-                    if self.running:
-                        self.start_program_nonblocking()
-                        # 재시작 후 프로그램이 뜰 때까지 잠시 대기
-                        time.sleep(3)  # 1초 -> 3초로 증가
-                else:
-                    # 비정상 종료로 판단
-                    self.restart_count += 1
-                    self.log(f"비정상 종료로 감지되었습니다. 재시작 시도 ({self.restart_count}/{self.max_restart_count}).")
-                    if self.restart_count <= self.max_restart_count:
-                        for i in range(self.restart_delay):
-                            if not self.running:
-                                break
-                            time.sleep(1)
-                        if self.running:
-                            self.start_program_nonblocking()
-                            # 재시작 후 프로그램이 뜰 때까지 잠시 대기
-                            time.sleep(3)  # 1초 -> 3초로 증가
-                    else:
-                        self.log("최대 재시작 횟수에 도달했습니다. 프로그램 수동 실행을 대기합니다.")
-                        # 사용자가 수동으로 실행할 때까지 대기
-                        while self.running and not self.is_manager_running():
-                            time.sleep(1)
+            if self._pid is not None:
+                self._supervise_tick()
             else:
-                # 매니저 프로그램이 실행 중이면 정상 종료 플래그 리셋 및 대기
-                if self._normal_exit_detected:
-                    self.log("매니저 프로그램이 다시 실행되었습니다. 정상 종료 플래그를 리셋합니다.")
-                    self._normal_exit_detected = False
-                    self.restart_count = 0  # 재시작 카운트도 리셋
-                time.sleep(1)
-                # 헬스체크: 매니저 하트비트 파일이 일정 시간 갱신되지 않으면 비정상으로 판단
-                try:
-                    if self.manager_hb.exists():
-                        mtime = self.manager_hb.stat().st_mtime
-                        if (time.time() - mtime) > self.health_timeout:
-                            if self.restart_count >= self.max_restart_count:
-                                self.log(f"헬스체크 실패: 최대 재시작 횟수({self.max_restart_count})에 도달하여 재시작을 중단합니다.")
-                            else:
-                                self.restart_count += 1
-                                self.log(f"헬스체크 실패로 재시작 시도 {self.restart_count}/{self.max_restart_count} (타임아웃 {self.health_timeout}s).")
-                                # 재시작 전 지연
-                                for i in range(self.restart_delay):
-                                    if not self.running:
-                                        break
-                                    time.sleep(1)
-                                # 가능한 경우 실행 중 프로세스를 종료 (Linux 전용)
-                                try:
-                                    import psutil
-                                    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                                        try:
-                                            cmdline = proc.info.get('cmdline') or proc.cmdline()
-                                            if cmdline and any('main.py' in str(c) for c in cmdline):
-                                                self.log(f"헬스체크 실패: 프로세스 종료 시도 (PID: {proc.info['pid']})")
-                                                proc.terminate()
-                                                try:
-                                                    proc.wait(timeout=5)
-                                                except psutil.TimeoutExpired:
-                                                    proc.kill()  # 강제 종료
-                                                break
-                                        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                                            continue
-                                except Exception as e:
-                                    self.log(f"프로세스 종료 시도 중 오류: {e}")
-                                # 재시작
-                                if self.running:
-                                    self.start_program_nonblocking()
-                                    time.sleep(1)
-                except Exception:
-                    pass
+                self._idle_tick()
+                if not self._ever_adopted and not waiting_logged and time.monotonic() - waited_from > 30:
+                    self.log("매니저 프로그램이 30초 내에 시작되지 않았습니다. 계속 감시합니다...")
+                    waiting_logged = True
+
+        self._close_health_channel()
+        self._release()
 
         # PID 파일 삭제
         try: